@@ -0,0 +1,294 @@
+"""Columnar Candle Container.
+
+NumPy-backed OHLCV frame shared by the visible chart analyzer, the entry
+signal engine and the indicator optimizers. Replaces passing candles as
+``list[dict]`` through hot loops:
+
+- Columns are contiguous float64 arrays (timestamps int64 where possible)
+- Slicing returns zero-copy views
+- Timestamp lookups use binary search instead of per-call dict maps
+- Parameter-independent derived columns (wick ratios, ATR, ...) are
+  memoized per frame via ``cached()``
+
+For backwards compatibility a frame behaves like a read-only candle list:
+``len(frame)``, ``frame[i]`` (dict), iteration and truthiness work as before.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def _column(candles: Sequence[dict[str, Any]], key: str, default: Any = 0.0) -> np.ndarray:
+    """Extract one float column from candle dicts (invalid values -> 0.0)."""
+    try:
+        return np.fromiter((c.get(key, default) for c in candles), dtype=np.float64, count=len(candles))
+    except (TypeError, ValueError):
+        values = np.empty(len(candles), dtype=np.float64)
+        for i, c in enumerate(candles):
+            try:
+                values[i] = float(c.get(key, default))
+            except Exception:
+                values[i] = 0.0
+        return values
+
+
+def _timestamps(values: Sequence[Any]) -> np.ndarray:
+    """Timestamp column as int64 (unix seconds) if possible, else object."""
+    arr = np.asarray(values)
+    if arr.dtype.kind in "iu":
+        return arr.astype(np.int64, copy=False)
+    if arr.dtype.kind == "f" and np.all(np.isfinite(arr)) and np.all(arr == np.floor(arr)):
+        return arr.astype(np.int64)
+    if arr.dtype.kind in "fO":
+        return arr
+    return np.asarray(values, dtype=object)
+
+
+class CandleFrame:
+    """Read-only columnar OHLCV candles.
+
+    Attributes:
+        timestamp: Unix timestamps (int64, or object for non-numeric keys).
+        open, high, low, close, volume: float64 price/volume columns.
+    """
+
+    __slots__ = ("timestamp", "open", "high", "low", "close", "volume", "_cache")
+
+    def __init__(
+        self,
+        timestamp: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+    ) -> None:
+        self.timestamp = timestamp
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self._cache: dict[Any, Any] = {}
+
+    # --- Construction ---
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[dict[str, Any]]) -> CandleFrame:
+        """Build a frame from candle dicts (``timestamp``/``time`` + OHLCV).
+
+        Missing ``open`` falls back to ``close`` like the wick calculation did.
+        """
+        if not candles:
+            return cls.empty()
+        ts_key = "timestamp" if "timestamp" in candles[0] else "time"
+        close = _column(candles, "close")
+        if all("open" in c for c in candles):
+            open_ = _column(candles, "open")
+        else:
+            open_ = np.array(
+                [c.get("open", c.get("close", 0.0)) or 0.0 for c in candles], dtype=np.float64
+            )
+        return cls(
+            timestamp=_timestamps([c.get(ts_key) for c in candles]),
+            open=open_,
+            high=_column(candles, "high"),
+            low=_column(candles, "low"),
+            close=close,
+            volume=_column(candles, "volume"),
+        )
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, local_offset: int = 0) -> CandleFrame:
+        """Build a frame from a chart DataFrame without per-row iteration.
+
+        Timestamps come from a ``time`` column if present, otherwise from a
+        DatetimeIndex (unix seconds + ``local_offset``) or a numeric index.
+
+        Args:
+            df: OHLCV DataFrame.
+            local_offset: Seconds added to DatetimeIndex timestamps (chart TZ).
+        """
+        n = len(df)
+        if n == 0:
+            return cls.empty()
+
+        if "time" in df.columns:
+            timestamp = df["time"].to_numpy().astype(np.int64)
+        elif isinstance(df.index, pd.DatetimeIndex):
+            index = df.index
+            if index.tz is not None:
+                index = index.tz_convert("UTC").tz_localize(None)
+            seconds = index.to_numpy().astype("datetime64[s]").astype(np.int64)
+            timestamp = seconds + local_offset
+        elif pd.api.types.is_numeric_dtype(df.index):
+            timestamp = df.index.to_numpy().astype(np.int64)
+        else:
+            timestamp = np.zeros(n, dtype=np.int64)
+
+        def col(name: str) -> np.ndarray:
+            if name not in df.columns:
+                return np.zeros(n, dtype=np.float64)
+            return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=np.float64)
+
+        return cls(timestamp, col("open"), col("high"), col("low"), col("close"), col("volume"))
+
+    @classmethod
+    def empty(cls) -> CandleFrame:
+        f = np.empty(0, dtype=np.float64)
+        return cls(np.empty(0, dtype=np.int64), f, f, f, f, f)
+
+    @classmethod
+    def coerce(cls, candles: CandleFrame | pd.DataFrame | Sequence[dict[str, Any]] | None) -> CandleFrame:
+        """Return ``candles`` as CandleFrame (no copy if it already is one)."""
+        if isinstance(candles, CandleFrame):
+            return candles
+        if candles is None:
+            return cls.empty()
+        if isinstance(candles, pd.DataFrame):
+            return cls.from_dataframe(candles)
+        return cls.from_candles(candles)
+
+    # --- Sequence protocol (list[dict] compatibility) ---
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def __bool__(self) -> bool:
+        return len(self.close) > 0
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            return CandleFrame(
+                self.timestamp[key],
+                self.open[key],
+                self.high[key],
+                self.low[key],
+                self.close[key],
+                self.volume[key],
+            )
+        return self.row(key)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self.to_candles())
+
+    def __repr__(self) -> str:
+        if not self:
+            return "CandleFrame(empty)"
+        return f"CandleFrame({len(self)} bars, {self.timestamp[0]} - {self.timestamp[-1]})"
+
+    def row(self, i: int) -> dict[str, Any]:
+        """Single candle as dict with plain Python values."""
+        ts = self.timestamp[i]
+        return {
+            "timestamp": ts.item() if isinstance(ts, np.generic) else ts,
+            "open": float(self.open[i]),
+            "high": float(self.high[i]),
+            "low": float(self.low[i]),
+            "close": float(self.close[i]),
+            "volume": float(self.volume[i]),
+        }
+
+    def to_candles(self) -> list[dict[str, Any]]:
+        """Convert back to ``list[dict]`` (for legacy consumers and caches)."""
+        cols = self.lists()
+        ts = cols["timestamp"]
+        o, h, l, c, v = (cols[name] for name in PRICE_COLUMNS)
+        return [
+            {"timestamp": ts[i], "open": o[i], "high": h[i], "low": l[i], "close": c[i], "volume": v[i]}
+            for i in range(len(ts))
+        ]
+
+    # --- Accessors ---
+
+    def lists(self) -> dict[str, list]:
+        """Columns as Python lists (memoized, for scalar-heavy loops)."""
+        return self.cached("lists", lambda: {
+            "timestamp": self.timestamp.tolist(),
+            **{name: getattr(self, name).tolist() for name in PRICE_COLUMNS},
+        })
+
+    def cached(self, key: Any, factory: Callable[[], Any]) -> Any:
+        """Memoize a derived value on this frame.
+
+        Only for values that depend on the frame's data alone (slices get a
+        fresh cache, since indicators depend on the preceding history).
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = factory()
+            return value
+
+    @property
+    def duration_seconds(self) -> float:
+        """Time span between first and last candle."""
+        if len(self) < 2:
+            return 0.0
+        return float(self.timestamp[-1] - self.timestamp[0])
+
+    def index_of(self, timestamp: Any) -> int | None:
+        """Index of the candle with exactly this timestamp (None if absent)."""
+        idx = self.indices_of([timestamp])[0]
+        return int(idx) if idx >= 0 else None
+
+    def indices_of(self, timestamps: Sequence[Any]) -> np.ndarray:
+        """Indices of candles with these timestamps (-1 where absent).
+
+        Uses binary search on sorted numeric timestamps, a memoized dict
+        otherwise.
+        """
+        if not self or len(timestamps) == 0:
+            return np.full(len(timestamps), -1, dtype=np.int64)
+
+        if self.timestamp.dtype.kind in "iuf" and self.cached("sorted", self._is_sorted):
+            try:
+                wanted = np.asarray(timestamps, dtype=self.timestamp.dtype)
+            except (TypeError, ValueError):
+                wanted = None
+            if wanted is not None:
+                idx = np.searchsorted(self.timestamp, wanted)
+                idx = np.minimum(idx, len(self) - 1)
+                return np.where(self.timestamp[idx] == wanted, idx, -1)
+
+        lookup = self.cached("ts_index", lambda: {ts: i for i, ts in enumerate(self.lists()["timestamp"])})
+        return np.array([lookup.get(ts, -1) for ts in timestamps], dtype=np.int64)
+
+    def _is_sorted(self) -> bool:
+        return bool(np.all(self.timestamp[1:] >= self.timestamp[:-1]))
+
+    def slice_time(self, from_ts: Any, to_ts: Any) -> CandleFrame:
+        """Zero-copy view of candles with from_ts <= timestamp <= to_ts."""
+        start = int(np.searchsorted(self.timestamp, from_ts, side="left"))
+        end = int(np.searchsorted(self.timestamp, to_ts, side="right"))
+        return self[start:end]
+
+
+def forward_windows(values: np.ndarray, indices: np.ndarray, horizon: int) -> np.ndarray:
+    """Matrix of the ``horizon`` values following each index.
+
+    Row k holds ``values[indices[k] + 1 : indices[k] + horizon + 1]``, padded
+    with NaN past the end (NaN compares False, so scans stop at the data end).
+
+    Returns:
+        Array of shape (len(indices), horizon)
+    """
+    padded = np.concatenate([np.asarray(values, dtype=np.float64), np.full(horizon, np.nan)])
+    windows = np.lib.stride_tricks.sliding_window_view(padded[1:], horizon)
+    return windows[indices]
+
+
+def first_true(mask: np.ndarray) -> np.ndarray:
+    """Column of the first True per row (``mask.shape[1]`` if none)."""
+    if mask.shape[1] == 0:
+        return np.zeros(mask.shape[0], dtype=np.int64)
+    return np.where(mask.any(axis=1), mask.argmax(axis=1), mask.shape[1])
@@ -24,6 +24,7 @@ from .entry_signal_engine import (
     EntrySide,
     OptimParams,
     RegimeType,
+    RollingFeatures,
     calculate_features,
     debug_summary,
     detect_regime,
@@ -40,6 +41,7 @@ __all__ = [
     "EntryEvent",
     # Feature calculation
     "calculate_features",
+    "RollingFeatures",
     # Regime detection
     "detect_regime",
     "detect_regime_v2",
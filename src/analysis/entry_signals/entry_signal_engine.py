@@ -6,6 +6,7 @@ This module provides a complete replacement for the simplistic SMA-based entry d
 - entry_signal_engine_core.py: Types, feature calculation, entry generation
 - entry_signal_engine_indicators.py: Technical indicator calculations
 - entry_signal_engine_regime.py: Regime detection logic
+- entry_signal_engine_rolling.py: Rolling feature state for live updates
 - generators/: Regime-specific entry generators
 
 Backward compatibility is maintained via re-exports in this module.
@@ -24,6 +25,7 @@ from .entry_signal_engine_core import (
     generate_entries,
 )
 from .entry_signal_engine_regime import detect_regime, detect_regime_v2
+from .entry_signal_engine_rolling import RollingFeatures
 
 __all__ = [
     # Types
@@ -33,6 +35,7 @@ __all__ = [
     "OptimParams",
     # Feature calculation
     "calculate_features",
+    "RollingFeatures",
     # Regime detection
     "detect_regime",
     "detect_regime_v2",
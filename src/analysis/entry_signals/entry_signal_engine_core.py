@@ -19,14 +19,17 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+import numpy as np
+
+from src.analysis.candle_frame import CandleFrame
+
 from .entry_signal_engine_indicators import (
-    _adx_full,
+    _adx_full_with_state,
     _atr,
     _bollinger,
     _ema,
     _pivots,
-    _rsi,
-    _safe_float,
+    _rsi_with_state,
     _sma,
     _wick_ratios,
 )
@@ -155,14 +158,20 @@ class OptimParams:
 # --- Feature Calculation ---
 
 
-def calculate_features(candles: list[dict[str, Any]], params: OptimParams) -> dict[str, list[float]]:
+def calculate_features(
+    candles: CandleFrame | list[dict[str, Any]], params: OptimParams
+) -> dict[str, list[float]]:
     """Calculate technical features from candles.
 
     Uses ATR-normalized distances instead of percentage-based thresholds.
     This fixes the scale issue for 1m/5m timeframes.
 
+    Pass a CandleFrame when calculating repeatedly over the same candles
+    (optimizer trials): the column extraction and wick ratios are then done
+    once per frame instead of once per call.
+
     Args:
-        candles: List of OHLCV candles.
+        candles: CandleFrame or list of OHLCV candles.
         params: Indicator parameters.
 
     Returns:
@@ -171,33 +180,65 @@ def calculate_features(candles: list[dict[str, Any]], params: OptimParams) -> di
     if not candles:
         return {}
 
-    closes = [_safe_float(c.get("close")) for c in candles]
-    highs = [_safe_float(c.get("high")) for c in candles]
-    lows = [_safe_float(c.get("low")) for c in candles]
-    vols = [_safe_float(c.get("volume", 0.0)) for c in candles]
-
-    ema_fast = _ema(closes, max(2, params.ema_fast))
-    ema_slow = _ema(closes, max(2, params.ema_slow))
-    atr = _atr(highs, lows, closes, max(2, params.atr_period))
-    rsi = _rsi(closes, max(2, params.rsi_period))
-    bb_mid, bb_up, bb_lo, bb_width, bbp = _bollinger(closes, max(2, params.bb_period), params.bb_std)
-    adx, di_plus, di_minus = _adx_full(highs, lows, closes, max(2, params.adx_period))
-    vol_sma = _sma(vols, max(2, params.bb_period))
-    up_wick, lo_wick = _wick_ratios(candles)
-    piv_h, piv_l = _pivots(highs, lows, lookback=max(2, int(params.bb_period / 2)))
+    return _calculate_features_with_state(CandleFrame.coerce(candles), params)[0]
 
-    # ATR-normalized distance to slow EMA (fixes your scale issue)
-    dist_ema_atr = []
-    atr_pct = []
-    for i in range(len(closes)):
-        a = max(1e-12, atr[i])
-        dist_ema_atr.append((closes[i] - ema_slow[i]) / a)
-        if closes[i] != 0:
-            atr_pct.append(atr[i] / closes[i])
-        else:
-            atr_pct.append(0.0)
 
+def _feature_periods(params: OptimParams) -> dict[str, int]:
+    """Indicator periods used by calculate_features (clamped to >= 2)."""
     return {
+        "ema_fast": max(2, params.ema_fast),
+        "ema_slow": max(2, params.ema_slow),
+        "atr": max(2, params.atr_period),
+        "rsi": max(2, params.rsi_period),
+        "bb": max(2, params.bb_period),
+        "adx": max(2, params.adx_period),
+        "pivot_lookback": max(2, int(params.bb_period / 2)),
+    }
+
+
+def _calculate_features_with_state(
+    frame: CandleFrame, params: OptimParams
+) -> tuple[dict[str, list[float]], dict[str, Any]]:
+    """calculate_features() plus the recursive smoother states.
+
+    The state holds what is not recoverable from the feature lists
+    (RSI Wilder averages, ADX smoothed sums) so RollingFeatures can
+    continue the recursion bar by bar.
+
+    Args:
+        frame: Candle data.
+        params: Indicator parameters.
+
+    Returns:
+        Tuple of (features, state).
+    """
+    periods = _feature_periods(params)
+    cols = frame.lists()
+    # Copies: callers may extend feature lists, the frame's columns are shared
+    closes = list(cols["close"])
+    highs = list(cols["high"])
+    lows = list(cols["low"])
+    vols = list(cols["volume"])
+
+    ema_fast = _ema(closes, periods["ema_fast"])
+    ema_slow = _ema(closes, periods["ema_slow"])
+    atr = _atr(highs, lows, closes, periods["atr"])
+    rsi, rsi_state = _rsi_with_state(closes, periods["rsi"])
+    bb_mid, bb_up, bb_lo, bb_width, bbp = _bollinger(frame.close, periods["bb"], params.bb_std)
+    (adx, di_plus, di_minus), adx_state = _adx_full_with_state(
+        frame.high, frame.low, frame.close, periods["adx"]
+    )
+    vol_sma = _sma(frame.volume, periods["bb"])
+    up_wick, lo_wick = frame.cached("wick_ratios", lambda: _wick_ratios(frame))
+    piv_h, piv_l = _pivots(frame.high, frame.low, lookback=periods["pivot_lookback"])
+
+    # ATR-normalized distance to slow EMA (fixes your scale issue)
+    atr_arr = np.asarray(atr)
+    dist_ema_atr = (frame.close - np.asarray(ema_slow)) / np.maximum(1e-12, atr_arr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        atr_pct = np.where(frame.close != 0, atr_arr / frame.close, 0.0)
+
+    features = {
         "closes": closes,
         "highs": highs,
         "lows": lows,
@@ -205,7 +246,7 @@ def calculate_features(candles: list[dict[str, Any]], params: OptimParams) -> di
         "ema_fast": ema_fast,
         "ema_slow": ema_slow,
         "atr": atr,
-        "atr_pct": atr_pct,
+        "atr_pct": atr_pct.tolist(),
         "rsi": rsi,
         "bb_mid": bb_mid,
         "bb_up": bb_up,
@@ -220,8 +261,9 @@ def calculate_features(candles: list[dict[str, Any]], params: OptimParams) -> di
         "lo_wick": lo_wick,
         "pivot_high": [1.0 if x else 0.0 for x in piv_h],
         "pivot_low": [1.0 if x else 0.0 for x in piv_l],
-        "dist_ema_atr": dist_ema_atr,
+        "dist_ema_atr": dist_ema_atr.tolist(),
     }
+    return features, {"rsi": rsi_state, "adx": adx_state}
 
 
 # --- Entry Registry Initialization ---
@@ -253,7 +295,7 @@ def _init_entry_registry():
 
 
 def generate_entries(
-    candles: list[dict[str, Any]],
+    candles: CandleFrame | list[dict[str, Any]],
     features: dict[str, list[float]],
     regime: RegimeType,
     params: OptimParams,
@@ -267,7 +309,7 @@ def generate_entries(
     - HIGH_VOL: Only extreme signals
 
     Args:
-        candles: OHLCV candles.
+        candles: CandleFrame or OHLCV candles.
         features: Calculated features.
         regime: Detected regime.
         params: Entry thresholds.
@@ -9,12 +9,24 @@ This module contains all technical analysis indicator calculations:
 
 Extracted from entry_signal_engine.py for better modularity.
 All functions are stateless and can be used independently.
+
+Window-based indicators (SMA, Bollinger, pivots, wicks) are vectorized with
+NumPy; recursive smoothers (EMA, RSI, ATR, ADX) stay scalar loops. Inputs
+may be lists or arrays, outputs are lists (consumed by per-bar generators).
+
+The recursive smoothers also have ``*_step`` variants that advance the
+final state of the batch functions by one bar (used by RollingFeatures).
 """
 
 from __future__ import annotations
 
-import math
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+if TYPE_CHECKING:
+    from src.analysis.candle_frame import CandleFrame
 
 
 # --- Helper Functions ---
@@ -53,7 +65,7 @@ def _clamp(x: float, lo: float, hi: float) -> float:
 # --- Moving Averages ---
 
 
-def _sma(values: list[float], period: int) -> list[float]:
+def _sma(values: list[float] | np.ndarray, period: int) -> list[float]:
     """Simple moving average.
 
     Args:
@@ -61,24 +73,21 @@ def _sma(values: list[float], period: int) -> list[float]:
         period: Lookback period.
 
     Returns:
-        SMA values (same length as input).
+        SMA values (same length as input, raw values during warmup).
     """
     if period <= 1:
-        return values[:]
-    out: list[float] = []
-    s = 0.0
-    for i, v in enumerate(values):
-        s += v
-        if i >= period:
-            s -= values[i - period]
-        if i >= period - 1:
-            out.append(s / period)
-        else:
-            out.append(v)
-    return out
-
-
-def _ema(values: list[float], period: int) -> list[float]:
+        return list(values)
+    arr = np.asarray(values, dtype=np.float64)
+    out = arr.copy()
+    if len(arr) >= period:
+        csum = np.cumsum(arr)
+        window_sums = csum[period - 1 :].copy()
+        window_sums[1:] -= csum[:-period]
+        out[period - 1 :] = window_sums / period
+    return out.tolist()
+
+
+def _ema(values: list[float] | np.ndarray, period: int) -> list[float]:
     """Exponential moving average.
 
     Args:
@@ -89,7 +98,9 @@ def _ema(values: list[float], period: int) -> list[float]:
         EMA values (same length as input).
     """
     if period <= 1:
-        return values[:]
+        return list(values)
+    if isinstance(values, np.ndarray):
+        values = values.tolist()
     out: list[float] = []
     alpha = 2.0 / (period + 1.0)
     ema = values[0] if values else 0.0
@@ -99,10 +110,18 @@ def _ema(values: list[float], period: int) -> list[float]:
     return out
 
 
+def _ema_step(prev: float, value: float, period: int) -> float:
+    """Advance EMA by one bar (same recursion as ``_ema``)."""
+    if period <= 1:
+        return value
+    alpha = 2.0 / (period + 1.0)
+    return alpha * value + (1.0 - alpha) * prev
+
+
 # --- Momentum Indicators ---
 
 
-def _rsi(closes: list[float], period: int) -> list[float]:
+def _rsi(closes: list[float] | np.ndarray, period: int) -> list[float]:
     """Relative Strength Index.
 
     Args:
@@ -112,40 +131,75 @@ def _rsi(closes: list[float], period: int) -> list[float]:
     Returns:
         RSI values (0-100).
     """
+    return _rsi_with_state(closes, period)[0]
+
+
+def _rsi_with_state(
+    closes: list[float] | np.ndarray, period: int
+) -> tuple[list[float], tuple[float, float]]:
+    """RSI plus the final Wilder averages (avg_gain, avg_loss).
+
+    Args:
+        closes: Close prices.
+        period: Lookback period (typically 14).
+
+    Returns:
+        Tuple of (RSI values, (avg_gain, avg_loss)).
+    """
     if period <= 1 or len(closes) < 2:
-        return [50.0] * len(closes)
+        return [50.0] * len(closes), (0.0, 0.0)
     rsis: list[float] = [50.0] * len(closes)
-    gain = 0.0
-    loss = 0.0
-
-    # Init
-    for i in range(1, min(period + 1, len(closes))):
-        ch = closes[i] - closes[i - 1]
-        if ch >= 0:
-            gain += ch
-        else:
-            loss -= ch
-    avg_gain = gain / period
-    avg_loss = loss / period
+    changes = np.diff(np.asarray(closes, dtype=np.float64))
+    gains = np.where(changes > 0, changes, 0.0).tolist()
+    losses = np.where(changes < 0, -changes, 0.0).tolist()
+
+    # Init (changes[i - 1] is the change into bar i)
+    init = min(period + 1, len(closes)) - 1
+    avg_gain = sum(gains[:init]) / period
+    avg_loss = sum(losses[:init]) / period
 
     for i in range(period, len(closes)):
-        ch = closes[i] - closes[i - 1]
-        g = ch if ch > 0 else 0.0
-        l = -ch if ch < 0 else 0.0
-        avg_gain = (avg_gain * (period - 1) + g) / period
-        avg_loss = (avg_loss * (period - 1) + l) / period
+        avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
         if avg_loss <= 1e-12:
             rsis[i] = 100.0
         else:
             rs = avg_gain / avg_loss
             rsis[i] = 100.0 - (100.0 / (1.0 + rs))
-    return rsis
+    return rsis, (avg_gain, avg_loss)
+
+
+def _rsi_step(
+    state: tuple[float, float], change: float, period: int
+) -> tuple[float, tuple[float, float]]:
+    """Advance RSI by one bar.
+
+    Args:
+        state: (avg_gain, avg_loss) after the previous bar.
+        change: Close-to-close change into the new bar.
+        period: Lookback period.
+
+    Returns:
+        Tuple of (RSI value, new state).
+    """
+    gain = change if change > 0 else 0.0
+    loss = -change if change < 0 else 0.0
+    avg_gain = (state[0] * (period - 1) + gain) / period
+    avg_loss = (state[1] * (period - 1) + loss) / period
+    if avg_loss <= 1e-12:
+        return 100.0, (avg_gain, avg_loss)
+    return 100.0 - (100.0 / (1.0 + avg_gain / avg_loss)), (avg_gain, avg_loss)
 
 
 # --- Volatility Indicators ---
 
 
-def _atr(highs: list[float], lows: list[float], closes: list[float], period: int) -> list[float]:
+def _atr(
+    highs: list[float] | np.ndarray,
+    lows: list[float] | np.ndarray,
+    closes: list[float] | np.ndarray,
+    period: int,
+) -> list[float]:
     """Average True Range.
 
     Args:
@@ -160,19 +214,16 @@ def _atr(highs: list[float], lows: list[float], closes: list[float], period: int
     n = len(closes)
     if n == 0:
         return []
-    trs: list[float] = [0.0] * n
-    prev_close = closes[0]
-    for i in range(n):
-        tr1 = highs[i] - lows[i]
-        tr2 = abs(highs[i] - prev_close)
-        tr3 = abs(lows[i] - prev_close)
-        trs[i] = max(tr1, tr2, tr3)
-        prev_close = closes[i]
+    h = np.asarray(highs, dtype=np.float64)
+    l = np.asarray(lows, dtype=np.float64)
+    c = np.asarray(closes, dtype=np.float64)
+    prev_close = np.concatenate(([c[0]], c[:-1]))
+    trs = np.maximum.reduce([h - l, np.abs(h - prev_close), np.abs(l - prev_close)]).tolist()
 
     # Wilder smoothing
-    out: list[float] = [trs[0]] * n
     if period <= 1:
         return trs
+    out: list[float] = [trs[0]] * n
     atr_val = sum(trs[: min(period, n)]) / max(1, min(period, n))
     for i in range(n):
         if i < period:
@@ -183,11 +234,26 @@ def _atr(highs: list[float], lows: list[float], closes: list[float], period: int
     return out
 
 
+def _true_range(high: float, low: float, prev_close: float) -> float:
+    """True range of a single bar."""
+    return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+
+def _atr_step(prev: float, high: float, low: float, prev_close: float, period: int) -> float:
+    """Advance Wilder ATR by one bar (valid once past the warmup)."""
+    tr = _true_range(high, low, prev_close)
+    if period <= 1:
+        return tr
+    return (prev * (period - 1) + tr) / period
+
+
 def _bollinger(
-    closes: list[float], period: int, std_mult: float
+    closes: list[float] | np.ndarray, period: int, std_mult: float
 ) -> tuple[list[float], list[float], list[float], list[float], list[float]]:
     """Bollinger Bands.
 
+    Windows are truncated during warmup (first period-1 bars).
+
     Args:
         closes: Close prices.
         period: Lookback period (typically 20).
@@ -196,29 +262,39 @@ def _bollinger(
     Returns:
         Tuple of (mid, upper, lower, width (relative), bb_percent).
     """
-    n = len(closes)
-    mid = _sma(closes, period)
-    upper: list[float] = [0.0] * n
-    lower: list[float] = [0.0] * n
-    width: list[float] = [0.0] * n
-    bbp: list[float] = [0.5] * n  # BB%
-    for i in range(n):
-        start = max(0, i - period + 1)
-        window = closes[start : i + 1]
-        m = sum(window) / max(1, len(window))
-        var = sum((x - m) ** 2 for x in window) / max(1, len(window))
-        sd = math.sqrt(var)
-        up = m + std_mult * sd
-        lo = m - std_mult * sd
-        upper[i] = up
-        lower[i] = lo
-        mid[i] = m
-        if m != 0:
-            width[i] = (up - lo) / m  # relative width
-        rng = up - lo
-        if rng > 1e-12:
-            bbp[i] = _clamp((closes[i] - lo) / rng, 0.0, 1.0)
-    return mid, upper, lower, width, bbp
+    arr = np.asarray(closes, dtype=np.float64)
+    n = len(arr)
+    if n == 0:
+        return [], [], [], [], []
+    period = max(1, period)
+    mid = np.empty(n)
+    sd = np.empty(n)
+
+    # Warmup: growing windows
+    for i in range(min(period - 1, n)):
+        window = arr[: i + 1]
+        mid[i] = window.mean()
+        sd[i] = window.std()
+    # Full windows
+    if n >= period:
+        windows = sliding_window_view(arr, period)
+        mid[period - 1 :] = windows.mean(axis=1)
+        sd[period - 1 :] = windows.std(axis=1)
+
+    return _bollinger_bands(arr, mid, sd, std_mult)
+
+
+def _bollinger_bands(
+    closes: np.ndarray, mid: np.ndarray, sd: np.ndarray, std_mult: float
+) -> tuple[list[float], list[float], list[float], list[float], list[float]]:
+    """Bands, relative width and BB% from rolling mean/std (see ``_bollinger``)."""
+    upper = mid + std_mult * sd
+    lower = mid - std_mult * sd
+    with np.errstate(divide="ignore", invalid="ignore"):
+        width = np.where(mid != 0, (upper - lower) / mid, 0.0)
+        rng = upper - lower
+        bbp = np.where(rng > 1e-12, np.clip((closes - lower) / rng, 0.0, 1.0), 0.5)
+    return mid.tolist(), upper.tolist(), lower.tolist(), width.tolist(), bbp.tolist()
 
 
 # --- Directional Indicators ---
@@ -241,7 +317,10 @@ def _adx(highs: list[float], lows: list[float], closes: list[float], period: int
 
 
 def _adx_full(
-    highs: list[float], lows: list[float], closes: list[float], period: int
+    highs: list[float] | np.ndarray,
+    lows: list[float] | np.ndarray,
+    closes: list[float] | np.ndarray,
+    period: int,
 ) -> tuple[list[float], list[float], list[float]]:
     """Average Directional Index with DI+ and DI-.
 
@@ -254,61 +333,72 @@ def _adx_full(
     Returns:
         Tuple of (ADX, DI+, DI-) arrays.
     """
+    return _adx_full_with_state(highs, lows, closes, period)[0]
+
+
+def _adx_full_with_state(
+    highs: list[float] | np.ndarray,
+    lows: list[float] | np.ndarray,
+    closes: list[float] | np.ndarray,
+    period: int,
+) -> tuple[tuple[list[float], list[float], list[float]], tuple[float, float, float]]:
+    """ADX/DI+/DI- plus the final Wilder-smoothed (TR, +DM, -DM) sums.
+
+    Args:
+        highs: High prices.
+        lows: Low prices.
+        closes: Close prices.
+        period: Lookback period (typically 14).
+
+    Returns:
+        Tuple of ((ADX, DI+, DI-), (tr_s, plus_dm_s, minus_dm_s)).
+    """
     n = len(closes)
-    if n < 2:
-        return [0.0] * n, [0.0] * n, [0.0] * n
-    if period <= 1:
-        return [0.0] * n, [0.0] * n, [0.0] * n
+    if n < 2 or period <= 1:
+        return ([0.0] * n, [0.0] * n, [0.0] * n), (0.0, 0.0, 0.0)
 
-    plus_dm = [0.0] * n
-    minus_dm = [0.0] * n
-    tr = [0.0] * n
+    h = np.asarray(highs, dtype=np.float64)
+    l = np.asarray(lows, dtype=np.float64)
+    c = np.asarray(closes, dtype=np.float64)
 
-    for i in range(1, n):
-        up_move = highs[i] - highs[i - 1]
-        down_move = lows[i - 1] - lows[i]
-        plus_dm[i] = up_move if (up_move > down_move and up_move > 0) else 0.0
-        minus_dm[i] = down_move if (down_move > up_move and down_move > 0) else 0.0
+    up_move = np.diff(h, prepend=h[0])
+    down_move = np.concatenate(([0.0], l[:-1] - l[1:]))
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    plus_dm[0] = minus_dm[0] = 0.0
 
-        tr1 = highs[i] - lows[i]
-        tr2 = abs(highs[i] - closes[i - 1])
-        tr3 = abs(lows[i] - closes[i - 1])
-        tr[i] = max(tr1, tr2, tr3)
+    prev_close = np.concatenate(([c[0]], c[:-1]))
+    tr = np.maximum.reduce([h - l, np.abs(h - prev_close), np.abs(l - prev_close)])
+    tr[0] = 0.0
 
     # Wilder smoothing
-    def wilder_smooth(arr: list[float]) -> list[float]:
+    def wilder_smooth(arr: np.ndarray) -> np.ndarray:
+        values = arr.tolist()
         out = [0.0] * n
-        s = sum(arr[1 : min(n, period + 1)])
-        out[period] = s
-        for i in range(period + 1, n):
-            out[i] = out[i - 1] - (out[i - 1] / period) + arr[i]
+        s = sum(values[1 : min(n, period + 1)])
+        if period < n:
+            out[period] = s
+            for i in range(period + 1, n):
+                out[i] = out[i - 1] - (out[i - 1] / period) + values[i]
         # Fill early with first available
         for i in range(0, min(period, n)):
             out[i] = out[period] if period < n else s
-        return out
+        return np.asarray(out)
 
     tr_s = wilder_smooth(tr)
     p_s = wilder_smooth(plus_dm)
     m_s = wilder_smooth(minus_dm)
 
-    adx_vals = [0.0] * n
-    di_plus = [0.0] * n
-    di_minus = [0.0] * n
-    dx = [0.0] * n
-
-    for i in range(n):
-        if tr_s[i] <= 1e-12:
-            continue
-        pdi = 100.0 * (p_s[i] / tr_s[i])
-        mdi = 100.0 * (m_s[i] / tr_s[i])
-        di_plus[i] = pdi
-        di_minus[i] = mdi
-        denom = pdi + mdi
-        if denom <= 1e-12:
-            continue
-        dx[i] = 100.0 * abs(pdi - mdi) / denom
+    valid = tr_s > 1e-12
+    safe_tr = np.where(valid, tr_s, 1.0)
+    di_plus = np.where(valid, 100.0 * (p_s / safe_tr), 0.0)
+    di_minus = np.where(valid, 100.0 * (m_s / safe_tr), 0.0)
+    denom = di_plus + di_minus
+    has_dx = valid & (denom > 1e-12)
+    dx = np.where(has_dx, 100.0 * np.abs(di_plus - di_minus) / np.where(has_dx, denom, 1.0), 0.0).tolist()
 
     # ADX is Wilder SMA of DX
+    adx_vals = [0.0] * n
     if n > period * 2:
         init = sum(dx[period : period * 2]) / period
         adx_vals[period * 2 - 1] = init
@@ -320,39 +410,83 @@ def _adx_full(
         # Fallback: simple smoothing
         adx_vals = _sma(dx, max(2, period))
 
-    return adx_vals, di_plus, di_minus
+    state = (float(tr_s[-1]), float(p_s[-1]), float(m_s[-1]))
+    return (adx_vals, di_plus.tolist(), di_minus.tolist()), state
+
+
+def _adx_step(
+    state: tuple[float, float, float],
+    prev_adx: float,
+    high: float,
+    low: float,
+    prev_high: float,
+    prev_low: float,
+    prev_close: float,
+    period: int,
+) -> tuple[float, float, float, tuple[float, float, float]]:
+    """Advance ADX/DI+/DI- by one bar (valid once past 2*period bars).
+
+    Args:
+        state: (tr_s, plus_dm_s, minus_dm_s) after the previous bar.
+        prev_adx: ADX of the previous bar.
+        high, low: New bar.
+        prev_high, prev_low, prev_close: Previous bar.
+        period: Lookback period.
+
+    Returns:
+        Tuple of (ADX, DI+, DI-, new state).
+    """
+    up_move = high - prev_high
+    down_move = prev_low - low
+    plus_dm = up_move if (up_move > down_move and up_move > 0) else 0.0
+    minus_dm = down_move if (down_move > up_move and down_move > 0) else 0.0
+    tr = _true_range(high, low, prev_close)
+
+    tr_s = state[0] - state[0] / period + tr
+    p_s = state[1] - state[1] / period + plus_dm
+    m_s = state[2] - state[2] / period + minus_dm
+
+    di_plus = di_minus = dx = 0.0
+    if tr_s > 1e-12:
+        di_plus = 100.0 * (p_s / tr_s)
+        di_minus = 100.0 * (m_s / tr_s)
+        denom = di_plus + di_minus
+        if denom > 1e-12:
+            dx = 100.0 * abs(di_plus - di_minus) / denom
+    adx = (prev_adx * (period - 1) + dx) / period
+    return adx, di_plus, di_minus, (tr_s, p_s, m_s)
 
 
 # --- Pattern Detection ---
 
 
-def _wick_ratios(candles: list[dict[str, Any]]) -> tuple[list[float], list[float]]:
+def _wick_ratios(candles: CandleFrame | list[dict[str, Any]]) -> tuple[list[float], list[float]]:
     """Calculate upper and lower wick ratios.
 
     Args:
-        candles: List of OHLC candles.
+        candles: CandleFrame or list of OHLC candles.
 
     Returns:
         Tuple of (upper_wick_ratios, lower_wick_ratios).
     """
-    up = []
-    lo = []
-    for c in candles:
-        o = _safe_float(c.get("open", c.get("close", 0.0)))
-        h = _safe_float(c.get("high", 0.0))
-        l = _safe_float(c.get("low", 0.0))
-        cl = _safe_float(c.get("close", 0.0))
-        rng = max(1e-12, h - l)
-        upper_wick = max(0.0, h - max(o, cl))
-        lower_wick = max(0.0, min(o, cl) - l)
-        up.append(upper_wick / rng)
-        lo.append(lower_wick / rng)
-    return up, lo
-
-
-def _pivots(highs: list[float], lows: list[float], lookback: int) -> tuple[list[bool], list[bool]]:
+    from src.analysis.candle_frame import CandleFrame
+
+    frame = CandleFrame.coerce(candles)
+    o, h, l, cl = frame.open, frame.high, frame.low, frame.close
+    rng = np.maximum(1e-12, h - l)
+    upper_wick = np.maximum(0.0, h - np.maximum(o, cl))
+    lower_wick = np.maximum(0.0, np.minimum(o, cl) - l)
+    return (upper_wick / rng).tolist(), (lower_wick / rng).tolist()
+
+
+def _pivots(
+    highs: list[float] | np.ndarray, lows: list[float] | np.ndarray, lookback: int
+) -> tuple[list[bool], list[bool]]:
     """Detect pivot highs and lows.
 
+    A bar is a pivot if it is the extreme of the +/- lookback window
+    (truncated at the edges, at least 3 bars).
+
     Args:
         highs: High prices.
         lows: Low prices.
@@ -362,17 +496,16 @@ def _pivots(highs: list[float], lows: list[float], lookback: int) -> tuple[list[
         Tuple of (pivot_highs, pivot_lows) boolean arrays.
     """
     n = len(highs)
-    ph = [False] * n
-    pl = [False] * n
-    if lookback <= 1:
-        return ph, pl
-    for i in range(n):
-        s = max(0, i - lookback)
-        e = min(n, i + lookback + 1)
-        hh = max(highs[s:e])
-        ll = min(lows[s:e])
-        if highs[i] >= hh and (e - s) >= 3:
-            ph[i] = True
-        if lows[i] <= ll and (e - s) >= 3:
-            pl[i] = True
-    return ph, pl
+    if lookback <= 1 or n == 0:
+        return [False] * n, [False] * n
+    h = np.asarray(highs, dtype=np.float64)
+    l = np.asarray(lows, dtype=np.float64)
+
+    size = 2 * lookback + 1
+    hh = sliding_window_view(np.pad(h, lookback, constant_values=-np.inf), size).max(axis=1)
+    ll = sliding_window_view(np.pad(l, lookback, constant_values=np.inf), size).min(axis=1)
+
+    idx = np.arange(n)
+    span = np.minimum(n, idx + lookback + 1) - np.maximum(0, idx - lookback)
+    enough = span >= 3
+    return ((h >= hh) & enough).tolist(), ((l <= ll) & enough).tolist()
@@ -0,0 +1,252 @@
+"""Rolling Feature State for the Entry Signal Engine.
+
+Keeps calculate_features() output for a candle window and advances it by
+new bars instead of recomputing the whole window:
+
+- Recursive smoothers (EMA, Wilder ATR/RSI/ADX) continue from their state
+- Window indicators (Bollinger, volume SMA) are computed over the
+  trailing window only
+- Pivots of the last ``lookback`` bars are re-evaluated (centered window)
+
+Values match a full calculate_features() over the same bars up to float
+rounding. When head bars are dropped (``max_bars``) the remaining values
+are kept as they are, i.e. recursive indicators stay seeded from the
+original start of the window.
+
+Used by the live visible-chart analysis (BackgroundRunner incremental
+updates) to refresh each bar in milliseconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.analysis.candle_frame import PRICE_COLUMNS, CandleFrame
+
+from .entry_signal_engine_core import (
+    OptimParams,
+    _calculate_features_with_state,
+    _feature_periods,
+)
+from .entry_signal_engine_indicators import (
+    _adx_step,
+    _atr_step,
+    _bollinger_bands,
+    _ema_step,
+    _pivots,
+    _rsi_step,
+    _sma,
+    _wick_ratios,
+)
+
+logger = logging.getLogger(__name__)
+
+# Keys advanced bar by bar in _advance_recursive (order of the tuple below)
+_RECURSIVE_KEYS = (
+    "closes", "highs", "lows", "volume", "ema_fast", "ema_slow", "atr", "atr_pct",
+    "rsi", "adx", "di_plus", "di_minus", "dist_ema_atr",
+)
+
+
+class RollingFeatures:
+    """calculate_features() state that advances with new bars.
+
+    Usage:
+        rolling = RollingFeatures.build(candles, params)
+        rolling.append(new_candles)
+        regime = detect_regime(rolling.features, params)
+        entries = generate_entries(rolling.frame, rolling.features, regime, params)
+
+    Attributes:
+        params: Indicator parameters the features are computed with.
+        max_bars: Maximum window length (oldest bars are dropped).
+        bar_count: Total bars ever added (monotonic, survives head drops).
+    """
+
+    def __init__(self, params: OptimParams, max_bars: int = 5000) -> None:
+        """Initialize an empty state (use ``build`` to fill it).
+
+        Args:
+            params: Indicator parameters.
+            max_bars: Maximum window length.
+        """
+        self.params = params
+        self.periods = _feature_periods(params)
+        self.max_bars = max(max_bars, self.min_bars)
+        self.bar_count = 0
+        self._frame = CandleFrame.empty()
+        self._features: dict[str, list[float]] = {}
+        self._state: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(
+        cls,
+        candles: CandleFrame | Sequence[dict[str, Any]],
+        params: OptimParams,
+        max_bars: int = 5000,
+    ) -> RollingFeatures:
+        """Create a state by a full feature calculation over ``candles``.
+
+        Args:
+            candles: Candle window (only the last ``max_bars`` are kept).
+            params: Indicator parameters.
+            max_bars: Maximum window length.
+        """
+        rolling = cls(params, max_bars)
+        rolling._rebuild(CandleFrame.coerce(candles)[-rolling.max_bars :])
+        return rolling
+
+    # --- Accessors ---
+
+    @property
+    def min_bars(self) -> int:
+        """Bars needed before every indicator is past its warmup."""
+        p = self.periods
+        return max(2 * p["adx"] + 2, p["rsi"] + 2, p["atr"] + 1, p["bb"] + 1, 2 * p["pivot_lookback"] + 1)
+
+    @property
+    def frame(self) -> CandleFrame:
+        """Candle window the features are aligned with."""
+        return self._frame
+
+    @property
+    def features(self) -> dict[str, list[float]]:
+        """Feature lists (same keys as calculate_features)."""
+        return self._features
+
+    @property
+    def last_timestamp(self) -> Any:
+        """Timestamp of the newest bar (None if empty)."""
+        return self._frame.timestamp[-1].item() if self._frame else None
+
+    def __len__(self) -> int:
+        return len(self._frame)
+
+    # --- Updates ---
+
+    def append(self, candles: CandleFrame | Sequence[dict[str, Any]]) -> int:
+        """Advance the state by the bars newer than ``last_timestamp``.
+
+        Falls back to a full recalculation while the window is shorter
+        than ``min_bars``.
+
+        Args:
+            candles: New candles (older or duplicate bars are ignored).
+
+        Returns:
+            Number of bars appended.
+        """
+        new = CandleFrame.coerce(candles)
+        with self._lock:
+            if self._frame and new:
+                new = new[int(np.searchsorted(new.timestamp, self._frame.timestamp[-1], side="right")) :]
+            if not new:
+                return 0
+
+            if len(self._frame) < self.min_bars:
+                self._rebuild(_concat(self._frame, new)[-self.max_bars :])
+                return len(new)
+
+            n_old = len(self._frame)
+            self._frame = _concat(self._frame, new)
+            self._advance_recursive(n_old)
+            self._advance_windows(n_old)
+            self.bar_count += len(new)
+            self._drop_head(len(self._frame) - self.max_bars)
+            return len(new)
+
+    def _rebuild(self, frame: CandleFrame) -> None:
+        """Full feature calculation over ``frame``."""
+        added = len(frame) - len(self._frame)
+        self._frame = frame
+        if frame:
+            self._features, self._state = _calculate_features_with_state(frame, self.params)
+        else:
+            self._features, self._state = {}, {}
+        self.bar_count += max(0, added)
+
+    def _advance_recursive(self, start: int) -> None:
+        """Continue the recursive indicators for bars ``start:``."""
+        f = self._features
+        p = self.periods
+        lists = [f[key] for key in _RECURSIVE_KEYS]
+        closes, highs, lows, vols, ema_fast, ema_slow, atr, atr_pct, rsi, adx, di_p, di_m, dist = lists
+        rsi_state = self._state["rsi"]
+        adx_state = self._state["adx"]
+
+        cols = {name: getattr(self._frame, name)[start:].tolist() for name in PRICE_COLUMNS}
+        for h, l, c, v in zip(cols["high"], cols["low"], cols["close"], cols["volume"]):
+            prev_h, prev_l, prev_c = highs[-1], lows[-1], closes[-1]
+            a = _atr_step(atr[-1], h, l, prev_c, p["atr"])
+            r, rsi_state = _rsi_step(rsi_state, c - prev_c, p["rsi"])
+            x, dp, dm, adx_state = _adx_step(adx_state, adx[-1], h, l, prev_h, prev_l, prev_c, p["adx"])
+            e_slow = _ema_step(ema_slow[-1], c, p["ema_slow"])
+
+            closes.append(c)
+            highs.append(h)
+            lows.append(l)
+            vols.append(v)
+            ema_fast.append(_ema_step(ema_fast[-1], c, p["ema_fast"]))
+            ema_slow.append(e_slow)
+            atr.append(a)
+            atr_pct.append(a / c if c != 0 else 0.0)
+            rsi.append(r)
+            adx.append(x)
+            di_p.append(dp)
+            di_m.append(dm)
+            dist.append((c - e_slow) / max(1e-12, a))
+
+        self._state["rsi"] = rsi_state
+        self._state["adx"] = adx_state
+
+    def _advance_windows(self, start: int) -> None:
+        """Window-based indicators for bars ``start:`` (pivots from start - lookback)."""
+        f = self._features
+        frame = self._frame
+        k = len(frame) - start
+        bb = self.periods["bb"]
+
+        windows = sliding_window_view(frame.close[-(bb + k - 1) :], bb)
+        for key, values in zip(
+            ("bb_mid", "bb_up", "bb_lo", "bb_width", "bb_percent"),
+            _bollinger_bands(frame.close[-k:], windows.mean(axis=1), windows.std(axis=1), self.params.bb_std),
+        ):
+            f[key].extend(values)
+        f["vol_sma"].extend(_sma(frame.volume[-(bb + k - 1) :], bb)[-k:])
+
+        up_wick, lo_wick = _wick_ratios(frame[start:])
+        f["up_wick"].extend(up_wick)
+        f["lo_wick"].extend(lo_wick)
+
+        # Centered pivots: the last `lookback` bars change as new bars arrive
+        lookback = self.periods["pivot_lookback"]
+        redo = max(0, start - lookback)
+        seg = max(0, redo - lookback)
+        piv_h, piv_l = _pivots(frame.high[seg:], frame.low[seg:], lookback=lookback)
+        for key, flags in (("pivot_high", piv_h), ("pivot_low", piv_l)):
+            del f[key][redo:]
+            f[key].extend(1.0 if x else 0.0 for x in flags[redo - seg :])
+
+    def _drop_head(self, count: int) -> None:
+        """Drop the oldest ``count`` bars."""
+        if count <= 0:
+            return
+        self._frame = self._frame[count:]
+        for values in self._features.values():
+            del values[:count]
+
+
+def _concat(a: CandleFrame, b: CandleFrame) -> CandleFrame:
+    """New frame with the bars of ``a`` followed by ``b``."""
+    if not a:
+        return b
+    return CandleFrame(
+        np.concatenate([a.timestamp, b.timestamp]),
+        *(np.concatenate([getattr(a, name), getattr(b, name)]) for name in PRICE_COLUMNS),
+    )
@@ -6,10 +6,13 @@ Provides the interface for rule-type-specific entry generation.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..entry_signal_engine import EntryEvent, OptimParams, RegimeType
 
+if TYPE_CHECKING:
+    from src.analysis.candle_frame import CandleFrame
+
 
 class BaseEntryGenerator(ABC):
     """Abstract base class for entry signal generators.
@@ -44,14 +47,14 @@ class BaseEntryGenerator(ABC):
     @abstractmethod
     def generate(
         self,
-        candles: list[dict[str, Any]],
+        candles: CandleFrame | list[dict[str, Any]],
         features: dict[str, list[float]],
         params: OptimParams,
     ) -> list[EntryEvent]:
         """Generate entry signals for this regime type.
 
         Args:
-            candles: OHLCV candles.
+            candles: CandleFrame or OHLCV candles.
             features: Calculated technical features.
             params: Entry parameters.
 
@@ -60,6 +63,19 @@ class BaseEntryGenerator(ABC):
         """
         pass
 
+    def _timestamps(self, candles: CandleFrame | list[dict[str, Any]]) -> list[Any]:
+        """Candle timestamps as list (columnar for CandleFrames).
+
+        Args:
+            candles: CandleFrame or OHLCV candles.
+
+        Returns:
+            Timestamp per candle.
+        """
+        if hasattr(candles, "lists"):
+            return candles.lists()["timestamp"]
+        return [c.get("timestamp") for c in candles]
+
     def _safe_float(self, x: Any, default: float = 0.0) -> float:
         """Safely convert to float.
 
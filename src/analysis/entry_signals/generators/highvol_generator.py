@@ -38,6 +38,8 @@ class HighVolGenerator(BaseEntryGenerator):
         if not candles or not features:
             return []
 
+        timestamps = self._timestamps(candles)
+
         closes = features["closes"]
         rsi = features["rsi"]
         bbp = features["bb_percent"]
@@ -61,7 +63,7 @@ class HighVolGenerator(BaseEntryGenerator):
                 if score >= params.min_confidence:
                     raw.append(
                         EntryEvent(
-                            timestamp=candles[i].get("timestamp"),
+                            timestamp=timestamps[i],
                             side=EntrySide.LONG,
                             confidence=float(self._clamp(score, 0.0, 1.0)),
                             price=closes[i],
@@ -78,7 +80,7 @@ class HighVolGenerator(BaseEntryGenerator):
                 if score >= params.min_confidence:
                     raw.append(
                         EntryEvent(
-                            timestamp=candles[i].get("timestamp"),
+                            timestamp=timestamps[i],
                             side=EntrySide.SHORT,
                             confidence=float(self._clamp(score, 0.0, 1.0)),
                             price=closes[i],
@@ -38,6 +38,8 @@ class RangeGenerator(BaseEntryGenerator):
         if not candles or not features:
             return []
 
+        timestamps = self._timestamps(candles)
+
         closes = features["closes"]
         rsi = features["rsi"]
         bbp = features["bb_percent"]
@@ -74,7 +76,7 @@ class RangeGenerator(BaseEntryGenerator):
                 if score >= params.min_confidence:
                     raw.append(
                         EntryEvent(
-                            timestamp=candles[i].get("timestamp"),
+                            timestamp=timestamps[i],
                             side=EntrySide.LONG,
                             confidence=float(self._clamp(score, 0.0, 1.0)),
                             price=closes[i],
@@ -96,7 +98,7 @@ class RangeGenerator(BaseEntryGenerator):
                 if score >= params.min_confidence:
                     raw.append(
                         EntryEvent(
-                            timestamp=candles[i].get("timestamp"),
+                            timestamp=timestamps[i],
                             side=EntrySide.SHORT,
                             confidence=float(self._clamp(score, 0.0, 1.0)),
                             price=closes[i],
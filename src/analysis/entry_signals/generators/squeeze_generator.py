@@ -38,6 +38,8 @@ class SqueezeGenerator(BaseEntryGenerator):
         if not candles or not features:
             return []
 
+        timestamps = self._timestamps(candles)
+
         closes = features["closes"]
         atr = features["atr"]
         bb_up = features["bb_up"]
@@ -73,7 +75,7 @@ class SqueezeGenerator(BaseEntryGenerator):
                 if score >= params.min_confidence:
                     raw.append(
                         EntryEvent(
-                            timestamp=candles[i].get("timestamp"),
+                            timestamp=timestamps[i],
                             side=EntrySide.LONG,
                             confidence=float(self._clamp(score, 0.0, 1.0)),
                             price=closes[i],
@@ -90,7 +92,7 @@ class SqueezeGenerator(BaseEntryGenerator):
                 if score >= params.min_confidence:
                     raw.append(
                         EntryEvent(
-                            timestamp=candles[i].get("timestamp"),
+                            timestamp=timestamps[i],
                             side=EntrySide.SHORT,
                             confidence=float(self._clamp(score, 0.0, 1.0)),
                             price=closes[i],
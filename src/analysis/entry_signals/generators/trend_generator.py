@@ -39,6 +39,8 @@ class TrendUpGenerator(BaseEntryGenerator):
         if not candles or not features:
             return []
 
+        timestamps = self._timestamps(candles)
+
         closes = features["closes"]
         atr = features["atr"]
         rsi = features["rsi"]
@@ -84,7 +86,7 @@ class TrendUpGenerator(BaseEntryGenerator):
                 if score >= params.min_confidence:
                     raw.append(
                         EntryEvent(
-                            timestamp=candles[i].get("timestamp"),
+                            timestamp=timestamps[i],
                             side=EntrySide.LONG,
                             confidence=float(self._clamp(score, 0.0, 1.0)),
                             price=closes[i],
@@ -130,6 +132,8 @@ class TrendDownGenerator(BaseEntryGenerator):
         if not candles or not features:
             return []
 
+        timestamps = self._timestamps(candles)
+
         closes = features["closes"]
         atr = features["atr"]
         rsi = features["rsi"]
@@ -175,7 +179,7 @@ class TrendDownGenerator(BaseEntryGenerator):
                 if score >= params.min_confidence:
                     raw.append(
                         EntryEvent(
-                            timestamp=candles[i].get("timestamp"),
+                            timestamp=timestamps[i],
                             side=EntrySide.SHORT,
                             confidence=float(self._clamp(score, 0.0, 1.0)),
                             price=closes[i],
@@ -10,6 +10,9 @@ import random
 import time
 from typing import Any
 
+import numpy as np
+
+from src.analysis.candle_frame import CandleFrame, first_true, forward_windows
 from src.analysis.entry_signals.entry_signal_engine import (
     OptimParams,
     calculate_features,
@@ -36,10 +39,11 @@ class FastOptimizer:
 
     def optimize(
         self,
-        candles: list[dict[str, Any]],
+        candles: CandleFrame | list[dict[str, Any]],
         base_params: OptimParams,
         budget_ms: int = 1200,
         seed: int | None = None,
+        warm_start: OptimParams | None = None,
     ) -> OptimParams:
         """Run fast optimization.
 
@@ -48,6 +52,9 @@ class FastOptimizer:
             base_params: Starting parameters.
             budget_ms: Time budget in ms.
             seed: Random seed.
+            warm_start: Previous best parameters. Scored first on the
+                current candles and kept unless a sample beats them, so
+                short re-optimizations (live updates) never regress.
 
         Returns:
             Optimized parameters.
@@ -55,22 +62,22 @@ class FastOptimizer:
         if seed is not None:
             random.seed(seed)
 
+        # Columnar once per run; trials only recompute param-dependent features
+        candles = CandleFrame.coerce(candles)
+
         t_end = time.time() + (budget_ms / 1000.0)
         best_params = base_params
         best_score = -1e9
+        if warm_start is not None:
+            best_params = warm_start
+            best_score = self._score_params(candles, warm_start)
 
         trials = 0
         while time.time() < t_end:
             trials += 1
             # Sample new params
             p = self.space.sample_params(base_params)
-
-            # Calculate and evaluate
-            # Note: Features depend on params (e.g. periods), so we must recalc
-            feats = calculate_features(candles, p)
-            reg = detect_regime(feats, p)
-            ents = generate_entries(candles, feats, reg, p)
-            score = self._evaluate_entries(candles, feats, ents, p)
+            score = self._score_params(candles, p)
 
             if score > best_score:
                 best_score = score
@@ -83,9 +90,17 @@ class FastOptimizer:
         )
         return best_params
 
+    def _score_params(self, candles: CandleFrame, params: OptimParams) -> float:
+        """Score one parameter set on the candles."""
+        # Note: Features depend on params (e.g. periods), so we must recalc
+        feats = calculate_features(candles, params)
+        reg = detect_regime(feats, params)
+        ents = generate_entries(candles, feats, reg, params)
+        return self._evaluate_entries(candles, feats, ents, params)
+
     def _evaluate_entries(
         self,
-        candles: list[dict[str, Any]],
+        candles: CandleFrame | list[dict[str, Any]],
         features: dict[str, list[float]],
         entries: list[EntryEvent],
         params: OptimParams,
@@ -95,56 +110,52 @@ class FastOptimizer:
         Copy of the evaluation logic from entry_signal_engine to keep it self-contained
         or we could import it if exposed. For now, reproducing it here to decouple
         optimization logic from the engine.
+
+        TP/SL resolution is vectorized over all entries: for each entry the
+        first bar within the horizon hitting the stop or the target decides
+        (stop wins ties within the same bar).
         """
         if not entries:
             return -9999.0  # Hard penalty
 
-        highs = features.get("highs", [])
-        lows = features.get("lows", [])
-        closes = features.get("closes", [])
-        atr = features.get("atr", [])
+        frame = CandleFrame.coerce(candles)
+        highs = np.asarray(features.get("highs", []), dtype=np.float64)
+        lows = np.asarray(features.get("lows", []), dtype=np.float64)
+        closes = np.asarray(features.get("closes", []), dtype=np.float64)
+        atr = np.asarray(features.get("atr", []), dtype=np.float64)
 
-        # Timestamp map
-        ts_to_idx: dict[Any, int] = {}
-        for i, c in enumerate(candles):
-            ts_to_idx[c.get("timestamp")] = i
+        idx = frame.indices_of([e.timestamp for e in entries])
+        is_long = np.array([e.side == EntrySide.LONG for e in entries])
+        valid = (idx >= 0) & (idx < len(closes))
+        idx, is_long = idx[valid], is_long[valid]
 
+        horizon = params.eval_horizon_bars
         wins = 0
         resolved = 0
-
-        for e in entries:
-            idx = ts_to_idx.get(e.timestamp)
-            if idx is None or idx >= len(closes):
-                continue
-            
-            a = max(1e-12, atr[idx])
+        if len(idx) and horizon > 0:
+            a = np.maximum(1e-12, atr[idx])
             tp = params.eval_tp_atr * a
             sl = params.eval_sl_atr * a
             entry_price = closes[idx]
 
-            end = min(len(closes) - 1, idx + params.eval_horizon_bars)
-            hit = None
-            
-            for j in range(idx + 1, end + 1):
-                if e.side == EntrySide.LONG:
-                    if j < len(lows) and lows[j] <= entry_price - sl:
-                        hit = False
-                        break
-                    if j < len(highs) and highs[j] >= entry_price + tp:
-                        hit = True
-                        break
-                else:
-                    if j < len(highs) and highs[j] >= entry_price + sl:
-                        hit = False
-                        break
-                    if j < len(lows) and lows[j] <= entry_price - tp:
-                        hit = True
-                        break
-
-            if hit is not None:
-                resolved += 1
-                if hit:
-                    wins += 1
+            win_high = forward_windows(highs, idx, horizon)
+            win_low = forward_windows(lows, idx, horizon)
+            # Long: stop below / target above entry; short mirrored
+            stop_hit = np.where(
+                is_long[:, None],
+                win_low <= (entry_price - sl)[:, None],
+                win_high >= (entry_price + sl)[:, None],
+            )
+            target_hit = np.where(
+                is_long[:, None],
+                win_high >= (entry_price + tp)[:, None],
+                win_low <= (entry_price - tp)[:, None],
+            )
+            first_stop = first_true(stop_hit)
+            first_target = first_true(target_hit)
+            hit_any = (first_stop < horizon) | (first_target < horizon)
+            resolved = int(hit_any.sum())
+            wins = int((hit_any & (first_target < first_stop)).sum())
 
         if resolved < max(3, int(params.min_trades_gate * 0.6)):
             return -5000.0
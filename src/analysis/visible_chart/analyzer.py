@@ -9,16 +9,22 @@ Phase 2: FastOptimizer integration for parameter optimization.
 Phase 2.6: Caching & Wiederverwendung.
 Issue #27: Comprehensive debug logging.
 Issue #28: JSON-based parameter loading (replaces hardcoded OptimParams).
+Live: Incremental re-analysis on rolling feature state (analyze_incremental).
 """
 
 from __future__ import annotations
 
+import bisect
 import logging
 import time
 from pathlib import Path
 from typing import Any
 
-from .cache import AnalyzerCache, get_analyzer_cache
+import numpy as np
+
+from src.analysis.candle_frame import CandleFrame
+
+from .cache import AnalyzerCache, WarmStart, get_analyzer_cache
 from .candle_loader import CandleLoader
 from .types import (
     AnalysisResult,
@@ -180,17 +186,19 @@ class VisibleChartAnalyzer:
         visible_range: VisibleRange,
         symbol: str,
         timeframe: str,
-        candles: list[dict],
+        candles: CandleFrame | list[dict],
     ) -> AnalysisResult:
         """Analyze with pre-loaded candle data.
 
         Use this when candles are already available (e.g., from chart widget).
+        Candles are converted to a CandleFrame once; features, entry scoring
+        and the optimizer all work on its columns.
 
         Args:
             visible_range: The visible time range.
             symbol: Trading symbol.
             timeframe: Chart timeframe.
-            candles: Pre-loaded candle data.
+            candles: Pre-loaded candle data (CandleFrame or list of dicts).
 
         Returns:
             AnalysisResult with entries and indicator set info.
@@ -209,14 +217,7 @@ class VisibleChartAnalyzer:
                          self._use_optimizer, self._use_cache)
 
         # Check for re-optimize trigger (symbol or regime change)
-        symbol_changed = self._last_symbol is not None and self._last_symbol != symbol
-        if symbol_changed:
-            logger.info("Symbol changed: %s -> %s, invalidating cache", self._last_symbol, symbol)
-            debug_logger.info("SYMBOL CHANGE DETECTED: %s -> %s (cache invalidated)",
-                            self._last_symbol, symbol)
-            if self._use_cache:
-                self._cache.invalidate_symbol(self._last_symbol)
-        self._last_symbol = symbol
+        self._track_symbol(symbol)
 
         logger.info(
             "Starting analysis for %s [%d - %d] (%d min) with %d candles",
@@ -236,11 +237,13 @@ class VisibleChartAnalyzer:
                 analysis_time_ms=(time.perf_counter() - start_time) * 1000,
             )
 
+        frame = CandleFrame.coerce(candles)
+
         # Step 2: Calculate features (with cache)
         debug_logger.info("STEP 2: Calculating features...")
         feature_start = time.perf_counter()
         features = self._get_or_calculate_features(
-            candles, symbol, timeframe, visible_range
+            frame, symbol, timeframe, visible_range
         )
         feature_time = (time.perf_counter() - feature_start) * 1000
         debug_logger.info("Features calculated in %.1fms (cached: %s)",
@@ -256,11 +259,7 @@ class VisibleChartAnalyzer:
         debug_logger.info("Regime detected: %s (took %.1fms)", regime.value, regime_time)
 
         # Check for regime change trigger
-        regime_changed = self._last_regime is not None and self._last_regime != regime
-        if regime_changed:
-            logger.info("Regime changed: %s -> %s", self._last_regime.value, regime.value)
-            debug_logger.warning("REGIME CHANGE: %s -> %s", self._last_regime.value, regime.value)
-        self._last_regime = regime
+        self._track_regime(regime)
 
         # Step 4 & 5: Generate entries (with or without optimization)
         debug_logger.info("STEP 4: Generating entry signals...")
@@ -269,7 +268,7 @@ class VisibleChartAnalyzer:
             debug_logger.info("Using FastOptimizer for parameter tuning...")
             # Check optimizer cache first
             result = self._get_or_run_optimizer(
-                candles, regime, features, symbol, timeframe, visible_range
+                frame, regime, features, symbol, timeframe, visible_range
             )
             active_set = result.get("active_set")
             alternatives = result.get("alternatives", [])
@@ -281,7 +280,7 @@ class VisibleChartAnalyzer:
                     "Optimizer produced no entries; falling back to rules-based scoring."
                 )
                 active_set = active_set or self._create_default_set(regime)
-                entries = self._score_entries(candles, features, regime)
+                entries = self._score_entries(frame, features, regime)
                 debug_logger.info("Fallback scored %d raw entries", len(entries))
                 entries = self._postprocess_entries(entries)
                 debug_logger.info("Fallback postprocessing: %d entries", len(entries))
@@ -290,7 +289,7 @@ class VisibleChartAnalyzer:
             # Phase 1: Default rules-based
             active_set = self._create_default_set(regime)
             debug_logger.debug("Default indicator set created: %s", active_set)
-            entries = self._score_entries(candles, features, regime)
+            entries = self._score_entries(frame, features, regime)
             debug_logger.info("Scored %d raw entries", len(entries))
             entries = self._postprocess_entries(entries)
             debug_logger.info("After postprocessing: %d entries", len(entries))
@@ -340,13 +339,203 @@ class VisibleChartAnalyzer:
             regime=regime,
             visible_range=visible_range,
             analysis_time_ms=analysis_time,
-            candle_count=len(candles),
-            candles=candles,
+            candle_count=len(frame),
+            candles=candles if isinstance(candles, list) else frame.to_candles(),
+        )
+
+    def analyze_incremental(
+        self,
+        visible_range: VisibleRange,
+        symbol: str,
+        timeframe: str,
+        candles: CandleFrame | list[dict],
+        reoptimize_every_bars: int = 30,
+        optimizer_budget_ms: int = 300,
+        max_bars: int = 5000,
+    ) -> AnalysisResult:
+        """Advance the live analysis by the bars new since the last call.
+
+        Instead of a full analyze_with_candles() over the window:
+        1. The rolling feature state (cached per symbol/timeframe/params,
+           stable across window slides) advances by the new bars only
+        2. The regime is re-checked on the newest bar
+        3. With optimizer: the last best params of the regime are reused;
+           a short warm-started re-optimization runs on a missing warm
+           start or every ``reoptimize_every_bars`` bars
+        4. Entries are regenerated over the visible slice of the rolling
+           window (features keep their full-history warmup)
+
+        The rolling state is rebuilt from ``candles`` when it does not
+        continue them (first call, gap, reload).
+
+        Args:
+            visible_range: The visible time range.
+            symbol: Trading symbol.
+            timeframe: Chart timeframe.
+            candles: Candle history up to the newest bar (sorted by time).
+            reoptimize_every_bars: Bars between live re-optimizations.
+            optimizer_budget_ms: Time budget of a live re-optimization.
+            max_bars: Maximum rolling window length.
+
+        Returns:
+            AnalysisResult for the visible range (without candles).
+        """
+        start_time = time.perf_counter()
+        self._track_symbol(symbol)
+
+        if not candles:
+            return AnalysisResult(
+                visible_range=visible_range,
+                analysis_time_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
+        params = self._get_optim_params()
+        rolling = self._sync_rolling_features(symbol, timeframe, params, candles, max_bars)
+        frame, features = _visible_window(rolling, visible_range)
+        features = self._add_compat_features(features) if len(frame) >= 20 else {}
+
+        regime = self._detect_regime(features)
+        self._track_regime(regime)
+
+        entries: list[EntryEvent] = []
+        if regime == RegimeType.NO_TRADE:
+            active_set = self._create_default_set(regime)
+        elif self._use_optimizer:
+            from src.analysis.entry_signals.entry_signal_engine import generate_entries
+
+            warm = self._get_live_warm_start(
+                frame, rolling.bar_count, regime, symbol, timeframe,
+                reoptimize_every_bars, optimizer_budget_ms,
+            )
+            opt_rolling = self._sync_rolling_features(symbol, timeframe, warm.params, candles, max_bars)
+            opt_frame, opt_features = _visible_window(opt_rolling, visible_range)
+            engine_entries = generate_entries(opt_frame, opt_features, regime, warm.params)
+            entries = self._to_analyzer_entries(engine_entries, regime)
+            active_set = self._create_optimized_set(regime, warm.params)
+        else:
+            active_set = self._create_default_set(regime)
+
+        if not entries and regime != RegimeType.NO_TRADE:
+            entries = self._postprocess_entries(self._score_entries(frame, features, regime))
+
+        analysis_time = (time.perf_counter() - start_time) * 1000
+        logger.debug(
+            "Incremental analysis: %d entries, regime=%s, window=%d bars, took %.1fms",
+            len(entries),
+            regime.value,
+            len(rolling),
+            analysis_time,
+        )
+
+        return AnalysisResult(
+            entries=entries,
+            active_set=active_set,
+            alternative_sets=[],
+            regime=regime,
+            visible_range=visible_range,
+            analysis_time_ms=analysis_time,
+            candle_count=len(rolling),
+        )
+
+    def _track_symbol(self, symbol: str) -> None:
+        """Invalidate the cache of the previous symbol on symbol change."""
+        symbol_changed = self._last_symbol is not None and self._last_symbol != symbol
+        if symbol_changed:
+            logger.info("Symbol changed: %s -> %s, invalidating cache", self._last_symbol, symbol)
+            debug_logger.info("SYMBOL CHANGE DETECTED: %s -> %s (cache invalidated)",
+                            self._last_symbol, symbol)
+            if self._use_cache:
+                self._cache.invalidate_symbol(self._last_symbol)
+        self._last_symbol = symbol
+
+    def _track_regime(self, regime: RegimeType) -> None:
+        """Log regime changes between analyses."""
+        regime_changed = self._last_regime is not None and self._last_regime != regime
+        if regime_changed:
+            logger.info("Regime changed: %s -> %s", self._last_regime.value, regime.value)
+            debug_logger.warning("REGIME CHANGE: %s -> %s", self._last_regime.value, regime.value)
+        self._last_regime = regime
+
+    def _sync_rolling_features(
+        self,
+        symbol: str,
+        timeframe: str,
+        params: Any,
+        candles: CandleFrame | list[dict],
+        max_bars: int,
+    ) -> Any:
+        """Get the rolling feature state for params, advanced to ``candles``.
+
+        Rolling states live in the analyzer cache regardless of
+        ``use_cache`` (they are state, not cached results).
+
+        Returns:
+            RollingFeatures aligned with the newest bars of ``candles``.
+        """
+        from src.analysis.entry_signals.entry_signal_engine import RollingFeatures
+
+        rolling = self._cache.get_rolling_features(symbol, timeframe, params)
+        pos = _timestamp_position(candles, rolling.last_timestamp) if rolling else None
+        if pos is None:
+            rolling = RollingFeatures.build(candles, params, max_bars=max_bars)
+            self._cache.set_rolling_features(symbol, timeframe, rolling)
+        elif pos + 1 < len(candles):
+            rolling.append(candles[pos + 1 :])
+        return rolling
+
+    def _get_live_warm_start(
+        self,
+        candles: CandleFrame,
+        bar_count: int,
+        regime: RegimeType,
+        symbol: str,
+        timeframe: str,
+        reoptimize_every_bars: int,
+        budget_ms: int,
+    ) -> WarmStart:
+        """Last best params of the regime, re-optimized when stale.
+
+        Args:
+            candles: Candles to optimize on (visible window).
+            bar_count: Current RollingFeatures.bar_count.
+            regime: Current regime.
+            symbol: Trading symbol.
+            timeframe: Chart timeframe.
+            reoptimize_every_bars: Bars after which the params are stale.
+            budget_ms: Optimizer budget.
+
+        Returns:
+            WarmStart with the params to generate entries with.
+        """
+        from src.analysis.indicator_optimization.optimizer import FastOptimizer
+
+        warm = self._cache.get_warm_start(symbol, timeframe, regime)
+        if warm is not None and warm.bar_count == 0:
+            # Fresh result of a full analysis: count from now
+            warm.bar_count = bar_count
+        if warm is not None and bar_count - warm.bar_count < reoptimize_every_bars:
+            return warm
+
+        optimized = FastOptimizer().optimize(
+            candles,
+            base_params=self._get_optim_params(),
+            budget_ms=budget_ms,
+            seed=42,
+            warm_start=warm.params if warm else None,
+        )
+        debug_logger.info(
+            "Live re-optimization (%s, warm start=%s, budget=%dms)",
+            regime.value,
+            warm is not None,
+            budget_ms,
         )
+        warm = WarmStart(optimized, bar_count)
+        self._cache.set_warm_start(symbol, timeframe, regime, warm)
+        return warm
 
     def _get_or_calculate_features(
         self,
-        candles: list[dict],
+        candles: CandleFrame,
         symbol: str,
         timeframe: str,
         visible_range: VisibleRange,
@@ -406,7 +595,7 @@ class VisibleChartAnalyzer:
 
     def _get_or_run_optimizer(
         self,
-        candles: list[dict],
+        candles: CandleFrame,
         regime: RegimeType,
         features: dict[str, list[float]],
         symbol: str,
@@ -433,16 +622,20 @@ class VisibleChartAnalyzer:
             if cached is not None:
                 return cached
 
-        result = self._run_optimizer(candles, regime, features)
+        warm = self._cache.get_warm_start(symbol, timeframe, regime) if self._use_cache else None
+        result = self._run_optimizer(
+            candles, regime, features, warm_start=warm.params if warm else None
+        )
 
         if self._use_cache:
             self._cache.set_optimizer_result(
                 symbol, timeframe, visible_range, regime, result
             )
+            self._cache.set_warm_start(symbol, timeframe, regime, WarmStart(result["params"]))
 
         return result
 
-    def _calculate_features(self, candles: list[dict]) -> dict[str, list[float]]:
+    def _calculate_features(self, candles: CandleFrame | list[dict]) -> dict[str, list[float]]:
         """Calculate technical features from candles.
 
         Uses ATR-normalized features from entry_signal_engine for better
@@ -463,25 +656,29 @@ class VisibleChartAnalyzer:
 
         # Use params from JSON config or defaults
         params = self._get_optim_params()
-        features = calculate_features(candles, params)
+        return self._add_compat_features(calculate_features(candles, params))
+
+    @staticmethod
+    def _add_compat_features(features: dict[str, list[float]]) -> dict[str, list[float]]:
+        """Add backward-compatible keys (sma_20, price_vs_sma, volatility).
 
-        # Add backward-compatible keys for any existing code
+        Args:
+            features: Engine features (modified in place).
+
+        Returns:
+            The same dict.
+        """
         if "closes" in features:
             closes = features["closes"]
             features["sma_20"] = features.get("ema_slow", closes)
 
             # Convert ATR-normalized distance back to percentage for compatibility
             if "dist_ema_atr" in features and "atr" in features:
-                dist = features["dist_ema_atr"]
-                atr = features["atr"]
-                ema_slow = features.get("ema_slow", closes)
-                price_vs_sma = []
-                for i in range(len(closes)):
-                    if ema_slow[i] != 0:
-                        price_vs_sma.append((closes[i] - ema_slow[i]) / ema_slow[i])
-                    else:
-                        price_vs_sma.append(0.0)
-                features["price_vs_sma"] = price_vs_sma
+                close_arr = np.asarray(closes)
+                ema_slow = np.asarray(features.get("ema_slow", closes))
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    price_vs_sma = np.where(ema_slow != 0, (close_arr - ema_slow) / ema_slow, 0.0)
+                features["price_vs_sma"] = price_vs_sma.tolist()
 
             # Use ATR% as volatility
             features["volatility"] = features.get("atr_pct", [0.0] * len(closes))
@@ -590,7 +787,7 @@ class VisibleChartAnalyzer:
 
     def _score_entries(
         self,
-        candles: list[dict],
+        candles: CandleFrame,
         features: dict[str, list[float]],
         regime: RegimeType,
     ) -> list[EntryEvent]:
@@ -617,21 +814,7 @@ class VisibleChartAnalyzer:
         # Enum values are now directly compatible (lowercase)
         params = self._get_optim_params()
         engine_entries = generate_entries(candles, features, regime, params)
-
-        # Convert engine entries to analyzer entries
-        # (They're now compatible, but we still convert for type safety)
-        entries = []
-        for e in engine_entries:
-            entries.append(
-                EntryEvent(
-                    timestamp=e.timestamp,
-                    side=e.side,  # Directly compatible
-                    confidence=e.confidence,
-                    price=e.price,
-                    reason_tags=e.reason_tags,
-                    regime=regime,
-                )
-            )
+        entries = self._to_analyzer_entries(engine_entries, regime)
 
         debug_logger.info(
             "Generated %d entries using entry_signal_engine (regime=%s)",
@@ -641,6 +824,24 @@ class VisibleChartAnalyzer:
 
         return entries
 
+    @staticmethod
+    def _to_analyzer_entries(engine_entries: list[Any], regime: RegimeType) -> list[EntryEvent]:
+        """Convert engine entries to analyzer entries.
+
+        (They're now compatible, but we still convert for type safety)
+        """
+        return [
+            EntryEvent(
+                timestamp=e.timestamp,
+                side=e.side,  # Directly compatible
+                confidence=e.confidence,
+                price=e.price,
+                reason_tags=e.reason_tags,
+                regime=regime,
+            )
+            for e in engine_entries
+        ]
+
     def _postprocess_entries(self, entries: list[EntryEvent]) -> list[EntryEvent]:
         """Apply postprocessing rules to entries.
 
@@ -678,9 +879,10 @@ class VisibleChartAnalyzer:
 
     def _run_optimizer(
         self,
-        candles: list[dict],
+        candles: CandleFrame,
         regime: RegimeType,
         features: dict[str, list[float]],
+        warm_start: Any = None,
     ) -> dict[str, Any]:
         """Run FastOptimizer to find optimal indicator set.
 
@@ -690,42 +892,32 @@ class VisibleChartAnalyzer:
             candles: Candle data.
             regime: Detected regime.
             features: Pre-calculated features.
+            warm_start: Previous best OptimParams to start from (optional).
 
         Returns:
-            Dict with active_set, alternatives, and entries.
+            Dict with active_set, alternatives, entries and params.
         """
         from src.analysis.entry_signals.entry_signal_engine import (
             generate_entries,
         )
         from src.analysis.indicator_optimization.optimizer import FastOptimizer
 
+        candles = CandleFrame.coerce(candles)
+
         # Use params from JSON config as base for optimization
         base_params = self._get_optim_params()
         optimizer = FastOptimizer()
         optimized_params = optimizer.optimize(
-            candles, base_params=base_params, budget_ms=1200, seed=42
+            candles, base_params=base_params, budget_ms=1200, seed=42, warm_start=warm_start
         )
 
         # Generate entries with optimized parameters
         # Recalculate features with new params
         from src.analysis.entry_signals.entry_signal_engine import calculate_features
-        
+
         opt_features = calculate_features(candles, optimized_params)
         engine_entries = generate_entries(candles, opt_features, regime, optimized_params)
-
-        # Convert engine entries to analyzer entries
-        entries = []
-        for e in engine_entries:
-            entries.append(
-                EntryEvent(
-                    timestamp=e.timestamp,
-                    side=e.side,
-                    confidence=e.confidence,
-                    price=e.price,
-                    reason_tags=e.reason_tags,
-                    regime=regime,
-                )
-            )
+        entries = self._to_analyzer_entries(engine_entries, regime)
 
         # Create indicator set from optimized params
         active_set = self._create_optimized_set(regime, optimized_params)
@@ -740,6 +932,7 @@ class VisibleChartAnalyzer:
             "active_set": active_set,
             "alternatives": [],
             "entries": entries,
+            "params": optimized_params,
         }
 
     def _create_optimized_set(self, regime: RegimeType, params: Any) -> IndicatorSet:
@@ -769,3 +962,25 @@ class VisibleChartAnalyzer:
             families=["Trend", "Momentum", "Volatility", "Volume"],
             description=f"ATR-optimized parameters for {regime.value}",
         )
+
+
+def _visible_window(
+    rolling: Any, visible_range: VisibleRange
+) -> tuple[CandleFrame, dict[str, list[float]]]:
+    """Candles and features of a rolling state from the visible range start on."""
+    start = int(np.searchsorted(rolling.frame.timestamp, visible_range.from_ts, side="left"))
+    if start == 0:
+        return rolling.frame, dict(rolling.features)
+    return rolling.frame[start:], {key: values[start:] for key, values in rolling.features.items()}
+
+
+def _timestamp_position(candles: CandleFrame | list[dict], timestamp: Any) -> int | None:
+    """Index of the candle with ``timestamp`` in time-sorted candles (None if absent)."""
+    if timestamp is None or not candles:
+        return None
+    if isinstance(candles, CandleFrame):
+        return candles.index_of(timestamp)
+    pos = bisect.bisect_left(candles, timestamp, key=lambda c: c["timestamp"])
+    if pos < len(candles) and candles[pos]["timestamp"] == timestamp:
+        return pos
+    return None
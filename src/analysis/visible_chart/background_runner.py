@@ -2,7 +2,7 @@
 
 Provides non-blocking background analysis with:
 - Scheduled full recomputes
-- Incremental updates on new candles
+- Incremental updates on new candles (rolling features, warm-started optimizer)
 - Thread-safe signal emission for UI updates
 
 Phase 3: Hintergrundlauf Live
@@ -75,6 +75,11 @@ class RunnerConfig:
         auto_start: Start runner on init.
         performance_log_interval: Log performance every N analyses.
         json_config_path: Path to JSON config for regime parameters.
+        incremental: Advance rolling feature state on new candles instead of
+            re-analyzing the whole window.
+        reoptimize_every_bars: Bars between live re-optimizations (incremental).
+        incremental_optimizer_budget_ms: Budget of a live re-optimization.
+        max_candles: Maximum candles kept for incremental updates.
     """
 
     reanalyze_interval_sec: float = 60.0  # Reanalyze every minute
@@ -84,6 +89,10 @@ class RunnerConfig:
     auto_start: bool = False
     performance_log_interval: int = 10
     json_config_path: str | None = None  # Issue #28: JSON config path
+    incremental: bool = True
+    reoptimize_every_bars: int = 30
+    incremental_optimizer_budget_ms: int = 300
+    max_candles: int = 5000
 
 
 @dataclass
@@ -469,6 +478,8 @@ class BackgroundRunner:
 
         Appends new candles to cache and re-analyzes.
         Checks if cached data is sufficient for visible range.
+        With ``config.incremental`` only the new bars are processed
+        (see VisibleChartAnalyzer.analyze_incremental).
 
         Args:
             task: Incremental update task.
@@ -493,8 +504,8 @@ class BackgroundRunner:
             if new_unique:
                 self._candle_cache.extend(new_unique)
                 # Keep cache size reasonable (e.g. max 5000 candles)
-                if len(self._candle_cache) > 5000:
-                     self._candle_cache = self._candle_cache[-5000:]
+                if len(self._candle_cache) > self.config.max_candles:
+                     self._candle_cache = self._candle_cache[-self.config.max_candles:]
 
         # 2. Check if cache covers visible range
         # We need enough warmup data before visible range
@@ -519,7 +530,19 @@ class BackgroundRunner:
              logger.debug("Cache miss for incremental update (end). Falling back to full analysis.")
              return self._run_full_analysis(task)
 
-        # 3. Run analysis with cached candles
+        # 3a. Advance rolling feature state by the new bars only
+        if self.config.incremental:
+            return self._analyzer.analyze_incremental(
+                visible_range=task.visible_range,
+                symbol=task.symbol,
+                timeframe=task.timeframe,
+                candles=self._candle_cache,
+                reoptimize_every_bars=self.config.reoptimize_every_bars,
+                optimizer_budget_ms=self.config.incremental_optimizer_budget_ms,
+                max_bars=self.config.max_candles,
+            )
+
+        # 3b. Run analysis with cached candles
         # Filter cache to relevant range to avoid processing too much? 
         # Actually analyze_with_candles handles the whole list usually.
         # But we can slice it to be efficient.
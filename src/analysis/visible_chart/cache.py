@@ -4,21 +4,28 @@ Provides intelligent caching for:
 - Feature calculations (expensive)
 - Regime detection (stable within short periods)
 - Optimization results (reusable if range overlaps)
+- Rolling feature states and optimizer warm starts for live updates
+  (keyed without the range, so they survive window slides)
 
 Phase 2.6: Caching & Wiederverwendung
 """
 
 from __future__ import annotations
 
+import dataclasses
 import hashlib
 import logging
 import time
 from dataclasses import dataclass, field
 from threading import Lock
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .types import RegimeType, VisibleRange
 
+if TYPE_CHECKING:
+    from src.analysis.entry_signals.entry_signal_engine import OptimParams
+    from src.analysis.entry_signals.entry_signal_engine_rolling import RollingFeatures
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +58,19 @@ class CacheEntry:
         self.hits += 1
 
 
+@dataclass
+class WarmStart:
+    """Best optimizer parameters of a symbol/timeframe/regime.
+
+    Attributes:
+        params: Optimized OptimParams.
+        bar_count: RollingFeatures.bar_count when optimized (0 = unknown).
+    """
+
+    params: OptimParams
+    bar_count: int = 0
+
+
 @dataclass
 class CacheStats:
     """Cache performance statistics.
@@ -62,6 +82,7 @@ class CacheStats:
         feature_hits: Feature-specific hits.
         regime_hits: Regime-specific hits.
         optimizer_hits: Optimizer-specific hits.
+        rolling_hits: Rolling feature state / warm start hits.
     """
 
     hits: int = 0
@@ -70,6 +91,7 @@ class CacheStats:
     feature_hits: int = 0
     regime_hits: int = 0
     optimizer_hits: int = 0
+    rolling_hits: int = 0
 
     @property
     def hit_rate(self) -> float:
@@ -90,12 +112,15 @@ class AnalyzerCache:
     - features: {symbol}_{timeframe}_{range_hash}
     - regime: {symbol}_{timeframe}_{range_hash}
     - optimizer: {symbol}_{timeframe}_{range_hash}_{regime}
+    - rolling: {symbol}_{timeframe}_{params_hash} (stable across slides)
+    - warm start: {symbol}_{timeframe}_{regime} (stable across slides)
     """
 
     # Default TTLs in seconds
     DEFAULT_FEATURE_TTL = 300.0  # 5 minutes
     DEFAULT_REGIME_TTL = 120.0  # 2 minutes
     DEFAULT_OPTIMIZER_TTL = 60.0  # 1 minute (results can vary)
+    DEFAULT_ROLLING_TTL = 900.0  # 15 minutes since last use
 
     # Maximum cache size
     MAX_ENTRIES = 100
@@ -105,6 +130,7 @@ class AnalyzerCache:
         feature_ttl: float = DEFAULT_FEATURE_TTL,
         regime_ttl: float = DEFAULT_REGIME_TTL,
         optimizer_ttl: float = DEFAULT_OPTIMIZER_TTL,
+        rolling_ttl: float = DEFAULT_ROLLING_TTL,
     ) -> None:
         """Initialize the cache.
 
@@ -112,14 +138,17 @@ class AnalyzerCache:
             feature_ttl: TTL for feature cache entries.
             regime_ttl: TTL for regime cache entries.
             optimizer_ttl: TTL for optimizer cache entries.
+            rolling_ttl: TTL for rolling states and warm starts (since last use).
         """
         self._feature_cache: dict[str, CacheEntry] = {}
         self._regime_cache: dict[str, CacheEntry] = {}
         self._optimizer_cache: dict[str, CacheEntry] = {}
+        self._rolling_cache: dict[str, CacheEntry] = {}
 
         self._feature_ttl = feature_ttl
         self._regime_ttl = regime_ttl
         self._optimizer_ttl = optimizer_ttl
+        self._rolling_ttl = rolling_ttl
 
         self._lock = Lock()
         self._stats = CacheStats()
@@ -150,6 +179,12 @@ class AnalyzerCache:
         hash_input = f"{from_bucket}_{to_bucket}_{bucket_size}"
         return hashlib.md5(hash_input.encode()).hexdigest()[:12]
 
+    @staticmethod
+    def _compute_params_hash(params: OptimParams) -> str:
+        """Compute a hash for an OptimParams instance."""
+        hash_input = repr(dataclasses.astuple(params))
+        return hashlib.md5(hash_input.encode()).hexdigest()[:12]
+
     def _make_feature_key(
         self, symbol: str, timeframe: str, visible_range: VisibleRange
     ) -> str:
@@ -175,6 +210,14 @@ class AnalyzerCache:
         range_hash = self._compute_range_hash(visible_range)
         return f"opt_{symbol}_{timeframe}_{range_hash}_{regime.value}"
 
+    def _make_rolling_key(self, symbol: str, timeframe: str, params: OptimParams) -> str:
+        """Create cache key for a rolling feature state."""
+        return f"roll_{symbol}_{timeframe}_{self._compute_params_hash(params)}"
+
+    def _make_warm_start_key(self, symbol: str, timeframe: str, regime: RegimeType) -> str:
+        """Create cache key for an optimizer warm start."""
+        return f"warm_{symbol}_{timeframe}_{regime.value}"
+
     def _evict_expired(self, cache: dict[str, CacheEntry]) -> int:
         """Remove expired entries from a cache.
 
@@ -399,6 +442,90 @@ class AnalyzerCache:
             self._enforce_size_limit(self._optimizer_cache)
             logger.debug("Optimizer cache SET: %s", key)
 
+    # ─────────────────────────────────────────────────────────────────
+    # Rolling State Cache (live incremental updates)
+    # ─────────────────────────────────────────────────────────────────
+
+    def _get_rolling_entry(self, key: str) -> Any:
+        """Get a rolling-cache value and refresh its TTL."""
+        with self._lock:
+            self._evict_expired(self._rolling_cache)
+
+            entry = self._rolling_cache.get(key)
+            if entry and not entry.is_expired():
+                entry.increment_hits()
+                entry.created_at = time.time()
+                self._stats.hits += 1
+                self._stats.rolling_hits += 1
+                logger.debug("Rolling cache HIT: %s", key)
+                return entry.value
+
+            self._stats.misses += 1
+            logger.debug("Rolling cache MISS: %s", key)
+            return None
+
+    def _set_rolling_entry(self, key: str, value: Any) -> None:
+        """Store a rolling-cache value."""
+        with self._lock:
+            self._rolling_cache[key] = CacheEntry(value=value, ttl_seconds=self._rolling_ttl)
+            self._enforce_size_limit(self._rolling_cache)
+            logger.debug("Rolling cache SET: %s", key)
+
+    def get_rolling_features(
+        self, symbol: str, timeframe: str, params: OptimParams
+    ) -> RollingFeatures | None:
+        """Get the rolling feature state for symbol/timeframe/params.
+
+        Args:
+            symbol: Trading symbol.
+            timeframe: Chart timeframe.
+            params: Indicator parameters of the state.
+
+        Returns:
+            RollingFeatures or None if not cached.
+        """
+        return self._get_rolling_entry(self._make_rolling_key(symbol, timeframe, params))
+
+    def set_rolling_features(
+        self, symbol: str, timeframe: str, rolling: RollingFeatures
+    ) -> None:
+        """Cache a rolling feature state (keyed by its params).
+
+        Args:
+            symbol: Trading symbol.
+            timeframe: Chart timeframe.
+            rolling: The state to cache.
+        """
+        self._set_rolling_entry(self._make_rolling_key(symbol, timeframe, rolling.params), rolling)
+
+    def get_warm_start(
+        self, symbol: str, timeframe: str, regime: RegimeType
+    ) -> WarmStart | None:
+        """Get the last optimizer result for symbol/timeframe/regime.
+
+        Args:
+            symbol: Trading symbol.
+            timeframe: Chart timeframe.
+            regime: Market regime.
+
+        Returns:
+            WarmStart or None if not cached.
+        """
+        return self._get_rolling_entry(self._make_warm_start_key(symbol, timeframe, regime))
+
+    def set_warm_start(
+        self, symbol: str, timeframe: str, regime: RegimeType, warm_start: WarmStart
+    ) -> None:
+        """Cache an optimizer result as warm start.
+
+        Args:
+            symbol: Trading symbol.
+            timeframe: Chart timeframe.
+            regime: Market regime.
+            warm_start: Optimized params and when they were optimized.
+        """
+        self._set_rolling_entry(self._make_warm_start_key(symbol, timeframe, regime), warm_start)
+
     # ─────────────────────────────────────────────────────────────────
     # Cache Management
     # ─────────────────────────────────────────────────────────────────
@@ -409,6 +536,7 @@ class AnalyzerCache:
             self._feature_cache.clear()
             self._regime_cache.clear()
             self._optimizer_cache.clear()
+            self._rolling_cache.clear()
             logger.info("All caches invalidated")
 
     def invalidate_symbol(self, symbol: str) -> int:
@@ -426,6 +554,7 @@ class AnalyzerCache:
                 self._feature_cache,
                 self._regime_cache,
                 self._optimizer_cache,
+                self._rolling_cache,
             ]:
                 keys_to_remove = [k for k in cache if f"_{symbol}_" in k]
                 for key in keys_to_remove:
@@ -448,6 +577,7 @@ class AnalyzerCache:
                 feature_hits=self._stats.feature_hits,
                 regime_hits=self._stats.regime_hits,
                 optimizer_hits=self._stats.optimizer_hits,
+                rolling_hits=self._stats.rolling_hits,
             )
 
     def get_size(self) -> dict[str, int]:
@@ -461,6 +591,7 @@ class AnalyzerCache:
                 "features": len(self._feature_cache),
                 "regime": len(self._regime_cache),
                 "optimizer": len(self._optimizer_cache),
+                "rolling": len(self._rolling_cache),
             }
 
 
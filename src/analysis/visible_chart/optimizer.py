@@ -14,6 +14,11 @@ import time
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.analysis.candle_frame import CandleFrame
+
 from .indicator_families import (
     IndicatorConfig,
     OptimizableSet,
@@ -88,14 +93,14 @@ class FastOptimizer:
 
     def optimize(
         self,
-        candles: list[dict],
+        candles: CandleFrame | list[dict],
         regime: RegimeType,
         features: dict[str, list[float]] | None = None,
     ) -> OptimizationResult:
         """Run optimization to find best indicator set.
 
         Args:
-            candles: OHLCV candle data for the visible range.
+            candles: OHLCV candle data for the visible range (CandleFrame or list).
             regime: Detected market regime.
             features: Pre-calculated features (optional).
 
@@ -117,9 +122,14 @@ class FastOptimizer:
         # Create simulator
         simulator = TradeSimulator(SimulationConfig())
 
+        # Columnar candles and basic features once per run (not per iteration)
+        candles = CandleFrame.coerce(candles)
+        if features is None:
+            features = self._calculate_basic_features(candles)
+
         # Calculate hours for signal rate
         if candles:
-            hours = (candles[-1]["timestamp"] - candles[0]["timestamp"]) / 3600
+            hours = candles.duration_seconds / 3600
         else:
             hours = 1.0
 
@@ -295,7 +305,7 @@ class FastOptimizer:
 
     def _generate_entries(
         self,
-        candles: list[dict],
+        candles: CandleFrame | list[dict],
         opt_set: OptimizableSet,
         regime: RegimeType,
         features: dict[str, list[float]] | None,
@@ -303,7 +313,8 @@ class FastOptimizer:
         """Generate entry signals using indicator set.
 
         This is a simplified signal generator that uses the
-        indicator parameters to filter entries.
+        indicator parameters to filter entries. Scores are computed for
+        all candles at once; EntryEvents are only built for hits.
 
         Args:
             candles: Candle data.
@@ -314,18 +325,16 @@ class FastOptimizer:
         Returns:
             List of entry events.
         """
-        if not candles or len(candles) < 20:
+        frame = CandleFrame.coerce(candles)
+        n = len(frame)
+        if n < 20:
             return []
 
-        entries = []
-        closes = [c["close"] for c in candles]
-
         # Calculate basic features if not provided
         if features is None:
-            features = self._calculate_basic_features(candles)
+            features = self._calculate_basic_features(frame)
 
-        price_vs_sma = features.get("price_vs_sma", [])
-        volatility = features.get("volatility", [])
+        trend = self._feature_array(features, "price_vs_sma", n)
 
         # Get indicator parameters
         indicator_params = {cfg.name: params for cfg, params in opt_set.indicators}
@@ -344,127 +353,128 @@ class FastOptimizer:
 
         min_confidence = opt_set.postprocess_config.get("min_confidence", 0.5)
 
-        # Simple rule-based entry generation
-        for i, candle in enumerate(candles):
-            if i < 20:  # Skip warmup
-                continue
-
-            score = 0.0
-            side = None
-            reasons = []
-
-            trend = price_vs_sma[i] if i < len(price_vs_sma) else 0
-            vol = volatility[i] if i < len(volatility) else 0
-
-            # Regime-specific logic
-            if regime in (RegimeType.TREND_UP,):
-                # Long on pullback in uptrend
-                if trend > 0 and trend < trend_threshold * 2:
-                    score = 0.5 + abs(trend) * 20
-                    side = EntrySide.LONG
-                    reasons.append("trend_pullback")
-
-            elif regime == RegimeType.TREND_DOWN:
-                # Short on pullback in downtrend
-                if trend < 0 and trend > -trend_threshold * 2:
-                    score = 0.5 + abs(trend) * 20
-                    side = EntrySide.SHORT
-                    reasons.append("trend_pullback")
-
-            elif regime == RegimeType.RANGE:
-                # Mean reversion at extremes
-                threshold = trend_threshold * 1.5
-                if trend < -threshold:
-                    score = 0.5 + abs(trend) * 25
-                    side = EntrySide.LONG
-                    reasons.append("oversold")
-                elif trend > threshold:
-                    score = 0.5 + abs(trend) * 25
-                    side = EntrySide.SHORT
-                    reasons.append("overbought")
-
-            elif regime == RegimeType.SQUEEZE:
-                # SUPER AGGRESSIVE DEBUG for SQUEEZE
-                if i == 20:
-                    try:
-                        from .debug_logger import debug_logger
-                        debug_logger.warning("=" * 60)
-                        debug_logger.warning("SQUEEZE ITERATION DEBUG (i=20)")
-                        debug_logger.warning("  trend: %.6f", trend)
-                        debug_logger.warning("  vol: %.6f", vol)
-                        debug_logger.warning("  closes[i]: %.2f", closes[i] if i < len(closes) else 0)
-                        debug_logger.warning("=" * 60)
-                    except Exception as e:
-                        pass
-
-                # SQUEEZE: SEHR LOCKERE Bedingungen für Testing!
-                # Calculate local range
-                recent_prices = closes[max(0, i-20):i+1]
-
-                if len(recent_prices) >= 5:  # Nur 5 Kerzen benötigt
-                    local_high = max(recent_prices)
-                    local_low = min(recent_prices)
-                    current_price = closes[i]
-
-                    if local_high > local_low:
-                        # Position in range (0 = low, 1 = high)
-                        position = (current_price - local_low) / (local_high - local_low)
-
-                        # DEBUG: Log für erste 3 Checks
-                        if i < 23:
-                            try:
-                                from .debug_logger import debug_logger
-                                debug_logger.info("  i=%d: position=%.3f, trend=%.6f, price=%.2f",
-                                                i, position, trend, current_price)
-                            except Exception:
-                                pass
-
-                        # EXTREM LOCKERE Bedingungen:
-                        # 1. JEDE Position < 0.4 → LONG
-                        if position < 0.4:
-                            score = 0.51 + (0.4 - position) * 0.5  # 0.51-0.71
-                            side = EntrySide.LONG
-                            reasons.append("squeeze_range_low")
-                        # 2. JEDE Position > 0.6 → SHORT
-                        elif position > 0.6:
-                            score = 0.51 + (position - 0.6) * 0.5  # 0.51-0.71
-                            side = EntrySide.SHORT
-                            reasons.append("squeeze_range_high")
-                        # 3. Mitte mit MINIMALEM Trend
-                        elif 0.35 < position < 0.65:
-                            if trend > 0.0001:  # SEHR minimal
-                                score = 0.51 + abs(trend) * 50
-                                side = EntrySide.LONG
-                                reasons.append("squeeze_trend_long")
-                            elif trend < -0.0001:
-                                score = 0.51 + abs(trend) * 50
-                                side = EntrySide.SHORT
-                                reasons.append("squeeze_trend_short")
-
-            # Apply indicator weights to score
-            for name, weight in opt_set.scoring_weights.items():
-                score *= (1 + (weight - 0.5) * 0.2)
-
-            # Add entry if threshold met
-            if side and score >= min_confidence:
-                entries.append(
-                    EntryEvent(
-                        timestamp=candle["timestamp"],
-                        side=side,
-                        confidence=min(score, 1.0),
-                        price=candle["close"],
-                        reason_tags=reasons,
-                        regime=regime,
-                    )
+        # Simple rule-based entry generation (side: 1 = long, -1 = short)
+        score = np.zeros(n)
+        side = np.zeros(n, dtype=np.int8)
+        reason = np.full(n, "", dtype=object)
+
+        def assign(mask: np.ndarray, values: np.ndarray, direction: int, tag: str) -> None:
+            mask = mask & (side == 0)
+            mask[:20] = False  # Skip warmup
+            score[mask] = values[mask]
+            side[mask] = direction
+            reason[mask] = tag
+
+        abs_trend = np.abs(trend)
+
+        # Regime-specific logic
+        if regime in (RegimeType.TREND_UP,):
+            # Long on pullback in uptrend
+            assign((trend > 0) & (trend < trend_threshold * 2), 0.5 + abs_trend * 20,
+                   1, "trend_pullback")
+
+        elif regime == RegimeType.TREND_DOWN:
+            # Short on pullback in downtrend
+            assign((trend < 0) & (trend > -trend_threshold * 2), 0.5 + abs_trend * 20,
+                   -1, "trend_pullback")
+
+        elif regime == RegimeType.RANGE:
+            # Mean reversion at extremes
+            threshold = trend_threshold * 1.5
+            assign(trend < -threshold, 0.5 + abs_trend * 25, 1, "oversold")
+            assign(trend > threshold, 0.5 + abs_trend * 25, -1, "overbought")
+
+        elif regime == RegimeType.SQUEEZE:
+            # SQUEEZE: SEHR LOCKERE Bedingungen für Testing!
+            # Position in local range of the last 21 closes (0 = low, 1 = high)
+            local_high, local_low = frame.cached("close_range_21", lambda: self._close_range(frame, 21))
+            in_range = local_high > local_low
+            with np.errstate(divide="ignore", invalid="ignore"):
+                position = np.where(
+                    in_range, (frame.close - local_low) / np.where(in_range, local_high - local_low, 1.0), 0.5
                 )
+            self._log_squeeze_debug(trend, features, frame, position)
+
+            # EXTREM LOCKERE Bedingungen:
+            # 1. JEDE Position < 0.4 → LONG
+            assign(in_range & (position < 0.4), 0.51 + (0.4 - position) * 0.5, 1, "squeeze_range_low")
+            # 2. JEDE Position > 0.6 → SHORT
+            assign(in_range & (position > 0.6), 0.51 + (position - 0.6) * 0.5, -1, "squeeze_range_high")
+            # 3. Mitte mit MINIMALEM Trend
+            middle = in_range & (position > 0.35) & (position < 0.65)
+            assign(middle & (trend > 0.0001), 0.51 + abs_trend * 50, 1, "squeeze_trend_long")
+            assign(middle & (trend < -0.0001), 0.51 + abs_trend * 50, -1, "squeeze_trend_short")
+
+        # Apply indicator weights to score
+        for name, weight in opt_set.scoring_weights.items():
+            score *= (1 + (weight - 0.5) * 0.2)
+
+        # Add entry if threshold met
+        hits = np.flatnonzero((side != 0) & (score >= min_confidence))
+        confidence = np.minimum(score, 1.0)
+        cols = frame.lists()
+        timestamps = cols["timestamp"]
+        closes = cols["close"]
+
+        # Apply postprocessing on indices; only survivors become EntryEvents
+        keep = self._postprocess_indices(hits.tolist(), timestamps, confidence, opt_set.postprocess_config)
+
+        return [
+            EntryEvent(
+                timestamp=timestamps[i],
+                side=EntrySide.LONG if side[i] > 0 else EntrySide.SHORT,
+                confidence=float(confidence[i]),
+                price=closes[i],
+                reason_tags=[reason[i]],
+                regime=regime,
+            )
+            for i in keep
+        ]
 
-        # Apply postprocessing
-        entries = self._postprocess_entries(entries, opt_set.postprocess_config)
+    @staticmethod
+    def _feature_array(features: dict[str, Any], key: str, n: int) -> np.ndarray:
+        """Feature as float array of length n (missing values -> 0)."""
+        values = np.zeros(n)
+        data = np.asarray(features.get(key, [])[:n], dtype=np.float64)
+        values[: len(data)] = data
+        return values
+
+    @staticmethod
+    def _close_range(frame: CandleFrame, window: int) -> tuple[np.ndarray, np.ndarray]:
+        """Rolling max/min of closes over the last ``window`` bars (truncated at start)."""
+        close = frame.close
+        padded_high = np.concatenate([np.full(window - 1, -np.inf), close])
+        padded_low = np.concatenate([np.full(window - 1, np.inf), close])
+        return (
+            sliding_window_view(padded_high, window).max(axis=1),
+            sliding_window_view(padded_low, window).min(axis=1),
+        )
 
-        return entries
+    def _log_squeeze_debug(
+        self,
+        trend: np.ndarray,
+        features: dict[str, Any],
+        frame: CandleFrame,
+        position: np.ndarray,
+    ) -> None:
+        """SUPER AGGRESSIVE DEBUG for SQUEEZE (first bars after warmup)."""
+        try:
+            from .debug_logger import debug_logger
+        except Exception:
+            return
+        vol = self._feature_array(features, "volatility", len(frame))
+        debug_logger.warning("=" * 60)
+        debug_logger.warning("SQUEEZE ITERATION DEBUG (i=20)")
+        debug_logger.warning("  trend: %.6f", trend[20])
+        debug_logger.warning("  vol: %.6f", vol[20])
+        debug_logger.warning("  closes[i]: %.2f", frame.close[20])
+        debug_logger.warning("=" * 60)
+        for i in range(20, min(23, len(frame))):
+            debug_logger.info("  i=%d: position=%.3f, trend=%.6f, price=%.2f",
+                              i, position[i], trend[i], frame.close[i])
 
     def _calculate_basic_features(
-        self, candles: list[dict]
+        self, candles: CandleFrame | list[dict]
     ) -> dict[str, list[float]]:
         """Calculate basic features for signal generation.
 
@@ -474,38 +484,65 @@ class FastOptimizer:
         Returns:
             Dict of feature arrays.
         """
-        if len(candles) < 20:
+        frame = CandleFrame.coerce(candles)
+        if len(frame) < 20:
             return {}
 
-        closes = [c["close"] for c in candles]
+        closes = frame.close
 
         # SMA-20
-        sma_20 = []
-        for i in range(len(closes)):
-            if i < 19:
-                sma_20.append(closes[i])
-            else:
-                sma_20.append(sum(closes[i - 19 : i + 1]) / 20)
+        sma_20 = closes.copy()
+        sma_20[19:] = sliding_window_view(closes, 20).sum(axis=1) / 20
 
-        # Price vs SMA
-        price_vs_sma = [
-            (closes[i] - sma_20[i]) / sma_20[i] if sma_20[i] != 0 else 0
-            for i in range(len(closes))
-        ]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Price vs SMA
+            price_vs_sma = np.where(sma_20 != 0, (closes - sma_20) / sma_20, 0.0)
 
-        # Volatility (TR/Close)
-        volatility = []
-        for c in candles:
-            tr = c["high"] - c["low"]
-            volatility.append(tr / c["close"] if c["close"] != 0 else 0)
+            # Volatility (TR/Close)
+            volatility = np.where(closes != 0, (frame.high - frame.low) / closes, 0.0)
 
         return {
-            "sma_20": sma_20,
-            "price_vs_sma": price_vs_sma,
-            "volatility": volatility,
-            "closes": closes,
+            "sma_20": sma_20.tolist(),
+            "price_vs_sma": price_vs_sma.tolist(),
+            "volatility": volatility.tolist(),
+            "closes": closes.tolist(),
         }
 
+    @staticmethod
+    def _postprocess_indices(
+        hits: list[int], timestamps: list[Any], confidence: np.ndarray, config: dict
+    ) -> list[int]:
+        """Index-based variant of ``_postprocess_entries`` (same rules).
+
+        Args:
+            hits: Candle indices of raw entries.
+            timestamps: Candle timestamps.
+            confidence: Entry confidence per candle.
+            config: Postprocess configuration.
+
+        Returns:
+            Candle indices of the kept entries, in timestamp order.
+        """
+        if not hits:
+            return hits
+
+        hits = sorted(hits, key=timestamps.__getitem__)
+
+        cooldown_sec = config.get("cooldown_minutes", 5) * 60
+        filtered = []
+        last_ts = 0
+        for i in hits:
+            if timestamps[i] - last_ts >= cooldown_sec:
+                filtered.append(i)
+                last_ts = timestamps[i]
+
+        max_per_hour = config.get("max_signals_per_hour", 6)
+        if len(filtered) > max_per_hour:
+            filtered = sorted(filtered, key=lambda i: -confidence[i])[:max_per_hour]
+            filtered = sorted(filtered, key=timestamps.__getitem__)
+
+        return filtered
+
     def _postprocess_entries(
         self, entries: list[EntryEvent], config: dict
     ) -> list[EntryEvent]:
@@ -12,6 +12,10 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
+from src.analysis.candle_frame import CandleFrame
+
 from .types import EntrySide, EntryEvent
 
 logger = logging.getLogger(__name__)
@@ -172,14 +176,15 @@ class TradeSimulator:
     def simulate(
         self,
         entries: list[EntryEvent],
-        candles: list[dict],
+        candles: CandleFrame | list[dict],
         features: dict[str, list[float]] | None = None,
     ) -> SimulationResult:
         """Simulate trades for given entries.
 
         Args:
             entries: Entry signals to simulate.
-            candles: OHLCV candle data.
+            candles: OHLCV candle data (pass a CandleFrame when simulating
+                repeatedly; timestamp index and ATR are cached on it).
             features: Pre-calculated features (for ATR, etc.).
 
         Returns:
@@ -188,28 +193,27 @@ class TradeSimulator:
         if not entries or not candles:
             return SimulationResult()
 
-        # Build timestamp -> index mapping
-        ts_to_idx = {c["timestamp"]: i for i, c in enumerate(candles)}
+        frame = CandleFrame.coerce(candles)
 
         # Calculate ATR if needed
-        atr_values = self._calculate_atr(candles) if self.config.stop_mode == "atr" else []
+        atr_values = self._calculate_atr(frame) if self.config.stop_mode == "atr" else []
 
         trades: list[TradeResult] = []
+        entry_indices = frame.indices_of([e.timestamp for e in entries]).tolist()
 
-        for entry in entries:
+        for entry, entry_idx in zip(entries, entry_indices):
             # Find candle index for entry
-            entry_idx = ts_to_idx.get(entry.timestamp)
-            if entry_idx is None:
+            if entry_idx < 0:
                 continue
 
             # Skip if not enough data after entry
-            if entry_idx >= len(candles) - 1:
+            if entry_idx >= len(frame) - 1:
                 continue
 
             trade = self._simulate_single_trade(
                 entry=entry,
                 entry_idx=entry_idx,
-                candles=candles,
+                candles=frame,
                 atr_values=atr_values,
             )
             if trade:
@@ -221,7 +225,7 @@ class TradeSimulator:
         self,
         entry: EntryEvent,
         entry_idx: int,
-        candles: list[dict],
+        candles: CandleFrame,
         atr_values: list[float],
     ) -> TradeResult | None:
         """Simulate a single trade.
@@ -235,12 +239,15 @@ class TradeSimulator:
         Returns:
             TradeResult or None if simulation failed.
         """
+        cols = candles.lists()
+        opens, highs, lows, closes = cols["open"], cols["high"], cols["low"], cols["close"]
+
         # Determine entry price
-        if self.config.entry_mode == "next_open" and entry_idx + 1 < len(candles):
-            entry_price = candles[entry_idx + 1]["open"]
+        if self.config.entry_mode == "next_open" and entry_idx + 1 < len(closes):
+            entry_price = opens[entry_idx + 1]
             start_idx = entry_idx + 1
         else:
-            entry_price = candles[entry_idx]["close"]
+            entry_price = closes[entry_idx]
             start_idx = entry_idx
 
         # Apply slippage
@@ -279,50 +286,50 @@ class TradeSimulator:
         exit_reason = "end_of_data"
         bars_held = 0
 
-        for i in range(start_idx + 1, min(len(candles), start_idx + self.config.max_bars + 1)):
-            bar = candles[i]
+        for i in range(start_idx + 1, min(len(closes), start_idx + self.config.max_bars + 1)):
+            high, low = highs[i], lows[i]
             bars_held += 1
 
             # Check stop hit
             if entry.side == EntrySide.LONG:
-                if bar["low"] <= trailing_stop:
+                if low <= trailing_stop:
                     exit_price = trailing_stop
                     exit_reason = "stop"
                     break
                 # Check target
-                if target_price and bar["high"] >= target_price:
+                if target_price and high >= target_price:
                     exit_price = target_price
                     exit_reason = "target"
                     break
                 # Update trailing
                 if self.config.trailing_enabled:
-                    current_r = (bar["high"] - entry_price) / stop_distance
+                    current_r = (high - entry_price) / stop_distance
                     if current_r >= self.config.trailing_activation_r:
                         trailing_active = True
                     if trailing_active:
-                        new_stop = bar["high"] - stop_distance * self.config.trailing_step_pct
+                        new_stop = high - stop_distance * self.config.trailing_step_pct
                         trailing_stop = max(trailing_stop, new_stop)
             else:
                 # SHORT
-                if bar["high"] >= trailing_stop:
+                if high >= trailing_stop:
                     exit_price = trailing_stop
                     exit_reason = "stop"
                     break
-                if target_price and bar["low"] <= target_price:
+                if target_price and low <= target_price:
                     exit_price = target_price
                     exit_reason = "target"
                     break
                 if self.config.trailing_enabled:
-                    current_r = (entry_price - bar["low"]) / stop_distance
+                    current_r = (entry_price - low) / stop_distance
                     if current_r >= self.config.trailing_activation_r:
                         trailing_active = True
                     if trailing_active:
-                        new_stop = bar["low"] + stop_distance * self.config.trailing_step_pct
+                        new_stop = low + stop_distance * self.config.trailing_step_pct
                         trailing_stop = min(trailing_stop, new_stop)
 
             # Max bars reached
             if bars_held >= self.config.max_bars:
-                exit_price = bar["close"]
+                exit_price = closes[i]
                 exit_reason = "time"
                 break
 
@@ -350,7 +357,7 @@ class TradeSimulator:
             bars_held=bars_held,
         )
 
-    def _calculate_atr(self, candles: list[dict], period: int = 14) -> list[float]:
+    def _calculate_atr(self, candles: CandleFrame | list[dict], period: int = 14) -> list[float]:
         """Calculate Average True Range.
 
         Args:
@@ -360,28 +367,20 @@ class TradeSimulator:
         Returns:
             List of ATR values.
         """
-        if len(candles) < period:
-            return [0.0] * len(candles)
-
-        tr_values = []
-        for i, c in enumerate(candles):
-            high = c["high"]
-            low = c["low"]
-            prev_close = candles[i - 1]["close"] if i > 0 else c["close"]
-
-            tr = max(
-                high - low,
-                abs(high - prev_close),
-                abs(low - prev_close),
-            )
-            tr_values.append(tr)
+        frame = CandleFrame.coerce(candles)
+        return frame.cached(("sma_atr", period), lambda: self._sma_atr(frame, period))
 
-        # Simple moving average for ATR
-        atr = []
-        for i in range(len(candles)):
-            if i < period - 1:
-                atr.append(tr_values[i])
-            else:
-                atr.append(sum(tr_values[i - period + 1 : i + 1]) / period)
+    @staticmethod
+    def _sma_atr(frame: CandleFrame, period: int) -> list[float]:
+        n = len(frame)
+        if n < period:
+            return [0.0] * n
 
-        return atr
+        high, low, close = frame.high, frame.low, frame.close
+        prev_close = np.concatenate([close[:1], close[:-1]])
+        tr_values = np.maximum.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+
+        # Simple moving average for ATR
+        atr = tr_values.copy()
+        atr[period - 1 :] = np.lib.stride_tricks.sliding_window_view(tr_values, period).sum(axis=1) / period
+        return atr.tolist()
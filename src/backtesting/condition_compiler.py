@@ -0,0 +1,156 @@
+"""
+Condition Compiler.
+
+Lowers the JSON condition trees of a TradingBotConfig (regime conditions,
+routing rules, strategy entry/exit groups) into boolean numpy arrays over
+the aligned backtest frame. The simulation loop then only does position
+bookkeeping on precomputed arrays instead of interpreting conditions row
+by row.
+
+Semantics match BacktestEngine._evaluate_conditions/_check_condition, with
+one difference: a comparison against a missing operand (NaN or unknown
+column) is False on both sides, where the row-wise evaluator raised a
+TypeError for a missing right-hand operand.
+"""
+
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .schema_types import (
+    Condition,
+    ConditionGroup,
+    ConditionLeftRight,
+    IndicatorDef,
+    RegimeDef,
+    RoutingRule,
+)
+
+Operand = Union[float, np.ndarray, None]
+
+
+class ConditionCompiler:
+    """Compiles condition groups of one config against one aligned frame."""
+
+    def __init__(self, df: pd.DataFrame, indicators: List[IndicatorDef]):
+        """Initialize compiler.
+
+        Args:
+            df: Aligned frame (1m base + prefixed HTF columns)
+            indicators: Indicator definitions of the config
+        """
+        self.df = df
+        self.length = len(df)
+
+        # First definition wins, like the row-wise next(...) lookup
+        self._timeframes: Dict[str, Optional[str]] = {}
+        for ind in indicators:
+            self._timeframes.setdefault(ind.id, ind.timeframe)
+
+        self._columns: Dict[str, Optional[np.ndarray]] = {}
+
+    def column_name(self, indicator_id: str, field: Optional[str]) -> str:
+        """Column of an indicator field in the aligned frame."""
+        col_name = f"{indicator_id}_{field}"
+        timeframe = self._timeframes.get(indicator_id)
+        if timeframe and timeframe != "1m":
+            # HTF indicators are prefixed in the combined frame
+            col_name = f"{timeframe}_{col_name}"
+        return col_name
+
+    def column(self, name: str) -> Optional[np.ndarray]:
+        """Float values of a column (NaN = missing), None if absent."""
+        if name not in self._columns:
+            self._columns[name] = (
+                self.df[name].to_numpy(dtype=float) if name in self.df.columns else None
+            )
+        return self._columns[name]
+
+    def operand(self, op: ConditionLeftRight) -> Operand:
+        """Resolve an operand to a constant, a column array or None."""
+        if op.value is not None:
+            return op.value
+        if op.indicator_id:
+            return self.column(self.column_name(op.indicator_id, op.field))
+        return None
+
+    def condition_mask(self, cond: Condition) -> np.ndarray:
+        """Boolean array for a single condition."""
+        left = self.operand(cond.left)
+        if left is None:
+            return self._full(False)
+
+        if cond.op == "between":
+            low, high = cond.right.min, cond.right.max
+            if low is None or high is None:
+                return self._full(False)
+            return self._mask((low <= left) & (left <= high))
+
+        right = self.operand(cond.right)
+        if right is None:
+            return self._full(False)
+
+        if cond.op == "gt":
+            return self._mask(left > right)
+        if cond.op == "lt":
+            return self._mask(left < right)
+        if cond.op == "eq":
+            return self._mask(left == right)
+        return self._full(False)
+
+    def group_mask(self, group: Optional[ConditionGroup]) -> np.ndarray:
+        """Boolean array for a condition group (``all`` AND ``any``)."""
+        if not group:
+            return self._full(False)
+
+        mask = self._full(True)
+        if group.all:
+            for cond in group.all:
+                mask &= self.condition_mask(cond)
+        if group.any:
+            mask &= np.logical_or.reduce([self.condition_mask(c) for c in group.any])
+        return mask
+
+    def regime_masks(self, regimes: List[RegimeDef]) -> np.ndarray:
+        """Active flags per regime, shape (len(regimes), len(df))."""
+        if not regimes:
+            return np.zeros((0, self.length), dtype=bool)
+        return np.vstack([self.group_mask(reg.conditions) for reg in regimes])
+
+    def routing_index(
+        self,
+        routing: List[RoutingRule],
+        id_masks: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """Index of the first matching routing rule per bar (-1 = none).
+
+        Args:
+            routing: Routing rules in priority order
+            id_masks: Active flags per regime ID
+        """
+        absent = self._full(False)
+        index = np.full(self.length, -1, dtype=np.int64)
+        unmatched = self._full(True)
+
+        for rule_idx, rule in enumerate(routing):
+            match = self._full(True)
+            if rule.match.all_of:
+                for req in rule.match.all_of:
+                    match &= id_masks.get(req, absent)
+            if rule.match.any_of:
+                match &= np.logical_or.reduce([id_masks.get(r, absent) for r in rule.match.any_of])
+            if rule.match.none_of:
+                match &= ~np.logical_or.reduce([id_masks.get(r, absent) for r in rule.match.none_of])
+
+            index[match & unmatched] = rule_idx
+            unmatched &= ~match
+
+        return index
+
+    def _full(self, value: bool) -> np.ndarray:
+        return np.full(self.length, value, dtype=bool)
+
+    def _mask(self, result) -> np.ndarray:
+        """Broadcast a comparison result (scalar or array) to a bar mask."""
+        return np.broadcast_to(np.asarray(result, dtype=bool), (self.length,)).copy()
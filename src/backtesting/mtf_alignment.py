@@ -0,0 +1,263 @@
+"""
+Multi-Timeframe Alignment.
+
+Leak-free higher-timeframe alignment shared by the JSON backtest
+(SimulationPhase) and the replay BacktestRunner (MTFResampler):
+
+- Higher-TF bars are resampled once over the whole dataset
+  (np.unique + ufunc.reduceat instead of a groupby per bar)
+- Each base bar maps to the index of the last CLOSED higher-TF bar via
+  searchsorted (bar_end <= time)
+- Resampled bars and row mappings are cached per (symbol, timeframe,
+  range), so repeated backtests (optimization, walk-forward, batch) reuse
+  them
+
+No-leak rule (same as MTFResampler.is_bar_complete): a higher-TF bar is
+available at time ``t`` if ``bar_end <= t``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Timeframe durations in minutes
+TIMEFRAME_MINUTES = {
+    "1m": 1,
+    "3m": 3,
+    "5m": 5,
+    "15m": 15,
+    "30m": 30,
+    "1h": 60,
+    "2h": 120,
+    "4h": 240,
+    "6h": 360,
+    "8h": 480,
+    "12h": 720,
+    "1D": 1440,
+    "1d": 1440,
+    "1W": 10080,
+    "1w": 10080,
+}
+
+# Columns of resample_bars() (same order as MTFResampler.resample_history)
+RESAMPLED_COLUMNS = (
+    "bar_start", "timestamp", "open", "high", "low", "close", "volume",
+    "bar_end", "bar_count", "is_complete",
+)
+
+
+def timeframe_ms(timeframe: str) -> int:
+    """Duration of a timeframe in milliseconds (unknown = 1 minute)."""
+    return TIMEFRAME_MINUTES.get(timeframe, 1) * 60 * 1000
+
+
+def timestamps_to_ms(values: Any) -> np.ndarray:
+    """Convert timestamps (column or index) to int64 milliseconds.
+
+    Supports datetime64 (tz-aware as UTC) and numeric values (already ms).
+    """
+    if isinstance(values, (pd.Series, pd.Index)) and pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return pd.DatetimeIndex(values).as_unit("ms").asi8
+    arr = np.asarray(values)
+    if arr.dtype.kind == "M":
+        return arr.astype("datetime64[ms]").astype(np.int64)
+    return arr.astype(np.int64)
+
+
+def resample_bars(
+    timestamps_ms: np.ndarray,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    timeframe: str,
+) -> pd.DataFrame:
+    """Resample sorted 1m data to a higher timeframe (all bars).
+
+    Includes the last, possibly incomplete bar; availability is checked
+    against ``bar_end`` when aligning.
+
+    Args:
+        timestamps_ms: Ascending timestamps (ms)
+        open_, high, low, close, volume: OHLCV columns
+        timeframe: Target timeframe
+
+    Returns:
+        DataFrame with RESAMPLED_COLUMNS (is_complete = True)
+    """
+    ts = np.asarray(timestamps_ms, dtype=np.int64)
+    if len(ts) == 0:
+        return pd.DataFrame(columns=list(RESAMPLED_COLUMNS))
+
+    period_ms = timeframe_ms(timeframe)
+    starts, first = np.unique((ts // period_ms) * period_ms, return_index=True)
+    counts = np.diff(np.append(first, len(ts)))
+    last = first + counts - 1
+
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    return pd.DataFrame({
+        "bar_start": starts,
+        "timestamp": ts[first],
+        "open": np.asarray(open_, dtype=np.float64)[first],
+        "high": np.maximum.reduceat(high, first),
+        "low": np.minimum.reduceat(low, first),
+        "close": np.asarray(close, dtype=np.float64)[last],
+        "volume": np.add.reduceat(np.asarray(volume, dtype=np.float64), first),
+        "bar_end": starts + period_ms,
+        "bar_count": counts,
+        "is_complete": np.ones(len(starts), dtype=bool),
+    })
+
+
+def resample_frame(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """resample_bars() for a DataFrame with timestamp + OHLCV columns."""
+    ts = timestamps_to_ms(df["timestamp"])
+    order = None
+    if len(ts) > 1 and np.any(ts[1:] < ts[:-1]):
+        order = np.argsort(ts, kind="stable")
+        ts = ts[order]
+
+    def col(name: str) -> np.ndarray:
+        values = df[name].to_numpy(dtype=np.float64)
+        return values[order] if order is not None else values
+
+    return resample_bars(
+        ts, col("open"), col("high"), col("low"), col("close"), col("volume"), timeframe
+    )
+
+
+def closed_bar_indices(bar_end: np.ndarray, as_of: np.ndarray | int) -> np.ndarray:
+    """Index of the last closed bar (bar_end <= as_of) per point in time.
+
+    Args:
+        bar_end: Ascending end timestamps of the higher-TF bars
+        as_of: Time(s) at which the data is used
+
+    Returns:
+        int64 indices, -1 where no bar is closed yet
+    """
+    return np.searchsorted(bar_end, as_of, side="right").astype(np.int64) - 1
+
+
+def take_aligned(frame: pd.DataFrame, indices: np.ndarray, index: pd.Index) -> pd.DataFrame:
+    """Rows ``indices`` of ``frame`` on ``index`` (-1 = NaN).
+
+    Vectorized replacement for ``reindex(..., method='ffill')``.
+    """
+    aligned = frame.iloc[np.maximum(indices, 0)] if len(frame) else frame.reindex(range(len(indices)))
+    aligned.index = index
+    missing = indices < 0
+    if missing.any():
+        aligned = aligned.mask(np.broadcast_to(missing[:, np.newaxis], aligned.shape))
+    return aligned
+
+
+class MTFAlignmentCache:
+    """LRU cache for resampled bars and row mappings.
+
+    Keys contain symbol, timeframe(s) and the range (first/last timestamp
+    + length) of the base data. Values are shared, callers must not
+    modify them.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Cached value for ``key``, else ``factory()`` (and store it)."""
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+
+        value = factory()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_alignment_cache: MTFAlignmentCache | None = None
+
+
+def get_alignment_cache() -> MTFAlignmentCache:
+    """Process-wide MTFAlignmentCache."""
+    global _alignment_cache
+    if _alignment_cache is None:
+        _alignment_cache = MTFAlignmentCache()
+    return _alignment_cache
+
+
+def range_key(timestamps_ms: np.ndarray) -> tuple[int, int, int]:
+    """Range key (first, last timestamp, count) for the cache."""
+    if len(timestamps_ms) == 0:
+        return (0, 0, 0)
+    return (int(timestamps_ms[0]), int(timestamps_ms[-1]), len(timestamps_ms))
+
+
+def align_to_base(
+    base_index: pd.Index,
+    base_timeframe: str,
+    htf_frames: dict[str, pd.DataFrame],
+    symbol: str | None = None,
+    cache: MTFAlignmentCache | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Align higher-TF frames (index = bar start) to the base without lookahead.
+
+    A base row is evaluated at the close of its bar and therefore sees all
+    higher-TF bars with ``bar_end <= base start + base duration``.
+
+    Args:
+        base_index: Index of the base data (bar start, datetime or ms)
+        base_timeframe: Timeframe of the base data
+        htf_frames: Timeframe -> DataFrame (index = bar start)
+        symbol: Symbol for the cache (no caching without symbol)
+        cache: Cache instance (default: get_alignment_cache())
+
+    Returns:
+        Timeframe -> DataFrame with ``base_index`` as index
+    """
+    cache = cache or get_alignment_cache()
+    base_ms = timestamps_to_ms(base_index)
+    as_of = base_ms + timeframe_ms(base_timeframe)
+
+    aligned = {}
+    for tf, frame in htf_frames.items():
+        htf_ms = timestamps_to_ms(frame.index)
+
+        def compute(htf_ms=htf_ms, tf=tf) -> np.ndarray:
+            return closed_bar_indices(htf_ms + timeframe_ms(tf), as_of)
+
+        if symbol is None:
+            indices = compute()
+        else:
+            key = ("align", symbol, base_timeframe, tf, range_key(base_ms), range_key(htf_ms))
+            indices = cache.get_or_compute(key, compute)
+        aligned[tf] = take_aligned(frame, indices, base_index)
+    return aligned
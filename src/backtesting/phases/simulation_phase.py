@@ -6,14 +6,22 @@ Handles:
 - Strategy evaluation
 - Trade entry/exit logic
 - Position management
+
+By default regimes, routing and entry/exit conditions are compiled into
+per-bar boolean arrays once per run (see condition_compiler.py) and the
+loop only does position bookkeeping. The row-by-row interpreter is kept
+for compile_conditions=False.
 """
 
 import time
 from collections import defaultdict
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any
+import numpy as np
 import pandas as pd
 import logging
 
+from ..condition_compiler import ConditionCompiler
+from ..mtf_alignment import align_to_base
 from ..schema_types import TradingBotConfig, RegimeDef, StrategyDef
 from ..types import Trade
 
@@ -23,15 +31,27 @@ logger = logging.getLogger(__name__)
 class SimulationPhase:
     """Simulation phase for backtest execution."""
 
-    def __init__(self, regime_evaluator, strategy_evaluator):
+    # Columns read by the RegimeEngine fallback
+    FALLBACK_COLUMNS = (
+        'close', 'high', 'low', 'open', 'volume',
+        'rsi14_value', '1m_rsi14_value',
+        'macd12_26_value', '1m_macd12_26_value',
+        'macd12_26_signal', '1m_macd12_26_signal',
+        'adx14_value', '1m_adx14_value',
+        'atr14_value', '1m_atr14_value',
+    )
+
+    def __init__(self, regime_evaluator, strategy_evaluator, compile_conditions: bool = True):
         """Initialize simulation phase.
 
         Args:
-            regime_evaluator: Function to evaluate regimes
-            strategy_evaluator: Strategy evaluation logic
+            regime_evaluator: Function to evaluate regimes (row-by-row mode)
+            strategy_evaluator: Strategy evaluation logic (row-by-row mode)
+            compile_conditions: Precompute all conditions as boolean arrays
         """
         self.regime_evaluator = regime_evaluator
         self.strategy_evaluator = strategy_evaluator
+        self.compile_conditions = compile_conditions
 
     def execute(
         self,
@@ -60,9 +80,37 @@ class SimulationPhase:
         """
         phase_start = time.time()
 
-        # Pre-align data to 1m index (forward fill HTF data)
-        combined_df = self._align_timeframe_data(datasets)
+        # Pre-align data to 1m index (last closed HTF bar per row)
+        combined_df = self._align_timeframe_data(datasets, symbol)
+
+        simulate = self._simulate_compiled if self.compile_conditions else self._simulate_rows
+        trades, equity, regime_history = simulate(
+            combined_df, config, symbol, initial_capital, perf_counters
+        )
+
+        perf_counters['total_candles_processed'] = len(combined_df)
+
+        return {
+            'trades': trades,
+            'final_equity': equity,
+            'regime_history': regime_history,
+            'combined_df': combined_df,
+            'phase_timing': time.time() - phase_start
+        }
 
+    def _simulate_rows(
+        self,
+        combined_df: pd.DataFrame,
+        config: TradingBotConfig,
+        symbol: str,
+        initial_capital: float,
+        perf_counters: Dict[str, int]
+    ) -> tuple:
+        """Interpret all conditions row by row.
+
+        Returns:
+            Tuple of (trades, final_equity, regime_history)
+        """
         # Initialize simulation state
         trades: List[Trade] = []
         active_trade: Trade = None
@@ -109,48 +157,205 @@ class SimulationPhase:
                 active_trade, equity, trades, perf_counters
             )
 
-        perf_counters['total_candles_processed'] = len(combined_df)
+        return trades, equity, regime_history
 
-        return {
-            'trades': trades,
-            'final_equity': equity,
-            'regime_history': regime_history,
-            'combined_df': combined_df,
-            'phase_timing': time.time() - phase_start
+    def _simulate_compiled(
+        self,
+        combined_df: pd.DataFrame,
+        config: TradingBotConfig,
+        symbol: str,
+        initial_capital: float,
+        perf_counters: Dict[str, int]
+    ) -> tuple:
+        """Compile all conditions to arrays, then run position bookkeeping.
+
+        Produces the same trades and regime history as _simulate_rows.
+
+        Returns:
+            Tuple of (trades, final_equity, regime_history)
+        """
+        compiler = ConditionCompiler(combined_df, config.indicators)
+        n_bars = len(combined_df)
+        timestamps = combined_df.index
+
+        # 1. Regimes: JSON regime masks, RegimeEngine fallback where none is active
+        regime_masks = compiler.regime_masks(config.regimes)
+        json_active = regime_masks.any(axis=0)
+        fallback = self._compile_fallback_regimes(
+            combined_df, np.flatnonzero(~json_active), symbol
+        )
+
+        id_masks: Dict[str, np.ndarray] = {}
+        for reg, mask in zip(config.regimes, regime_masks):
+            id_masks[reg.id] = id_masks.get(reg.id, np.zeros(n_bars, dtype=bool)) | mask
+        for i, (_, regime_ids) in fallback.items():
+            for regime_id in regime_ids:
+                id_masks.setdefault(regime_id, np.zeros(n_bars, dtype=bool))[i] = True
+
+        regime_history = self._compile_regime_history(
+            config.regimes, regime_masks, fallback, timestamps
+        )
+        perf_counters['regime_evaluations'] += n_bars
+
+        # 2. Routing: first matching rule per bar -> strategy set
+        rule_index = compiler.routing_index(config.routing, id_masks)
+        rule_sets = [
+            next((s for s in config.strategy_sets if s.id == rule.strategy_set_id), None)
+            for rule in config.routing
+        ]
+        perf_counters['strategy_routings'] += n_bars
+
+        # 3. Strategy entry/exit masks (first definition per ID, like the row-wise lookup)
+        strategies: Dict[str, StrategyDef] = {}
+        for strategy_def in config.strategies:
+            strategies.setdefault(strategy_def.id, strategy_def)
+        entry_masks = {sid: compiler.group_mask(s.entry).tolist() for sid, s in strategies.items()}
+        exit_masks = {
+            sid: compiler.group_mask(s.exit).tolist() if s.exit else None
+            for sid, s in strategies.items()
         }
 
+        set_plans = []
+        for strategy_set in rule_sets:
+            plan = []
+            for strat_ref in (strategy_set.strategies if strategy_set else []):
+                strategy_def = strategies.get(strat_ref.strategy_id)
+                if not strategy_def:
+                    continue
+                current_risk = strategy_def.risk
+                if strat_ref.strategy_overrides and strat_ref.strategy_overrides.risk:
+                    current_risk = strat_ref.strategy_overrides.risk
+                plan.append((strategy_def, current_risk))
+            set_plans.append(plan)
+
+        # 4. Position bookkeeping on bars that route to a strategy set
+        closes = combined_df['close'].to_numpy()
+        highs = combined_df['high'].to_numpy()
+        lows = combined_df['low'].to_numpy()
+
+        trades: List[Trade] = []
+        active_trade: Trade = None
+        equity = initial_capital
+
+        routed = rule_index >= 0
+        routed[routed] = [rule_sets[r] is not None for r in rule_index[routed]]
+
+        for i in np.flatnonzero(routed).tolist():
+            bar = {'close': closes[i], 'high': highs[i], 'low': lows[i]}
+            timestamp = timestamps[i]
+
+            for strategy_def, current_risk in set_plans[rule_index[i]]:
+                if active_trade is None:
+                    active_trade = self._check_entry(
+                        strategy_def, bar, timestamp, equity, current_risk,
+                        perf_counters, entry_masks[strategy_def.id][i]
+                    )
+                elif active_trade:
+                    exit_mask = exit_masks[strategy_def.id]
+                    active_trade, equity = self._check_exit(
+                        strategy_def, bar, timestamp, active_trade, equity,
+                        current_risk, trades, perf_counters,
+                        lambda: exit_mask[i]
+                    )
+
+        return trades, equity, regime_history
+
+    def _compile_fallback_regimes(
+        self,
+        combined_df: pd.DataFrame,
+        rows: np.ndarray,
+        symbol: str
+    ) -> Dict[int, tuple]:
+        """RegimeEngine fallback for bars without an active JSON regime.
+
+        Returns:
+            Dict of bar index -> (active_regimes, regime_ids) for bars with a result
+        """
+        if len(rows) == 0 or len(combined_df.columns) < 5:
+            return {}
+
+        from src.core.tradingbot.regime_engine import RegimeEngine
+        regime_engine = RegimeEngine()
+
+        columns = [c for c in self.FALLBACK_COLUMNS if c in combined_df.columns]
+        records = combined_df[columns].iloc[rows].to_dict('records')
+        timestamps = combined_df.index[rows]
+
+        fallback = {}
+        for i, row, timestamp in zip(rows.tolist(), records, timestamps):
+            active_regimes, regime_ids = self._fallback_regimes(
+                row, symbol, timestamp, regime_engine
+            )
+            if regime_ids:
+                fallback[i] = (active_regimes, regime_ids)
+        return fallback
+
+    def _compile_regime_history(
+        self,
+        regimes: List[RegimeDef],
+        regime_masks: np.ndarray,
+        fallback: Dict[int, tuple],
+        timestamps
+    ) -> List[Dict[str, Any]]:
+        """Regime change log, evaluated only at bars where the active set may change."""
+        n_bars = len(timestamps)
+        fallback_code = np.zeros(n_bars, dtype=np.int64)
+        codes: Dict[tuple, int] = {}
+        for i, (_, regime_ids) in fallback.items():
+            fallback_code[i] = codes.setdefault(tuple(regime_ids), len(codes) + 1)
+
+        state = np.vstack([regime_masks, fallback_code[np.newaxis, :]])
+        candidates = np.empty(n_bars, dtype=bool)
+        if n_bars:
+            candidates[0] = True
+            candidates[1:] = (state[:, 1:] != state[:, :-1]).any(axis=0)
+
+        regime_history: List[Dict[str, Any]] = []
+        prev_regime_ids: List[str] = []
+        for i in np.flatnonzero(candidates).tolist():
+            if i in fallback:
+                active_regimes, regime_ids = fallback[i]
+            else:
+                active_regimes = [reg for reg, mask in zip(regimes, regime_masks) if mask[i]]
+                regime_ids = [r.id for r in active_regimes]
+
+            if regime_ids != prev_regime_ids:
+                regime_history.append({
+                    'timestamp': timestamps[i],
+                    'regime_ids': regime_ids.copy(),
+                    'regimes': [{'id': r.id, 'name': r.name} for r in active_regimes]
+                })
+                prev_regime_ids = regime_ids.copy()
+
+        return regime_history
+
     def _align_timeframe_data(
-        self, datasets: Dict[str, pd.DataFrame]
+        self, datasets: Dict[str, pd.DataFrame], symbol: str = None
     ) -> pd.DataFrame:
-        """Align all timeframes to 1m index using forward fill.
+        """Align all timeframes to the 1m index without lookahead.
+
+        Each base row gets the values of the last HTF bar that is closed at
+        the row's close (see mtf_alignment.py). The
+        row -> HTF bar mapping is cached per (symbol, timeframe, range).
 
         Args:
-            datasets: Dict of timeframe -> DataFrame
+            datasets: Dict of timeframe -> DataFrame (index = bar start)
+            symbol: Trading symbol (cache key, no caching if None)
 
         Returns:
             Combined DataFrame with all indicators
         """
         # Start with 1m base
-        df_1m = datasets.get("1m")
-        if df_1m is None:
-            # Use first available dataset as base
-            df_1m = list(datasets.values())[0]
-
-        combined_df = df_1m.copy()
-
-        # Merge HTF data
-        for tf, df_tf in datasets.items():
-            if tf == "1m":
-                continue
-
-            # Prefix columns
-            df_tf_renamed = df_tf.add_prefix(f"{tf}_")
+        base_tf = "1m" if "1m" in datasets else next(iter(datasets))
+        df_1m = datasets[base_tf]
 
-            # Reindex to 1m (ffill)
-            aligned = df_tf_renamed.reindex(combined_df.index, method='ffill')
-            combined_df = pd.concat([combined_df, aligned], axis=1)
+        # Prefix columns of all HTF data (incl. a non-1m base)
+        htf_frames = {
+            tf: df_tf.add_prefix(f"{tf}_") for tf, df_tf in datasets.items() if tf != "1m"
+        }
+        aligned = align_to_base(df_1m.index, base_tf, htf_frames, symbol=symbol)
 
-        return combined_df
+        return pd.concat([df_1m.copy(), *aligned.values()], axis=1)
 
     def _evaluate_regimes_with_fallback(
         self,
@@ -182,58 +387,76 @@ class SimulationPhase:
 
         # Fallback to RegimeEngine if no JSON regimes active
         if not regime_ids and len(row) >= 5:
-            try:
-                from src.core.tradingbot.models import FeatureVector
-
-                # Convert timestamp
-                from datetime import datetime
-                if hasattr(timestamp, 'to_pydatetime'):
-                    dt_timestamp = timestamp.to_pydatetime()
-                elif isinstance(timestamp, datetime):
-                    dt_timestamp = timestamp
-                else:
-                    dt_timestamp = datetime.now()
-
-                # Build FeatureVector
-                feature_vector = FeatureVector(
-                    timestamp=dt_timestamp,
-                    symbol=symbol,
-                    close=float(row.get('close', 0)),
-                    high=float(row.get('high', 0)),
-                    low=float(row.get('low', 0)),
-                    open=float(row.get('open', 0)),
-                    volume=float(row.get('volume', 0)),
-                    rsi=float(row.get('rsi14_value', row.get('1m_rsi14_value', 50))),
-                    macd_line=float(row.get('macd12_26_value', row.get('1m_macd12_26_value', 0))),
-                    macd_signal=float(row.get('macd12_26_signal', row.get('1m_macd12_26_signal', 0))),
-                    adx=float(row.get('adx14_value', row.get('1m_adx14_value', 25))),
-                    atr=float(row.get('atr14_value', row.get('1m_atr14_value', 0)))
-                )
+            active_regimes, regime_ids = self._fallback_regimes(
+                row, symbol, timestamp, regime_engine
+            )
+
+        return active_regimes, regime_ids
 
-                # Classify regime
-                regime_state = regime_engine.classify(feature_vector)
-
-                # Create synthetic regime IDs
-                regime_ids = [
-                    f"regime_{regime_state.regime.name.lower()}",
-                    f"volatility_{regime_state.volatility.name.lower()}"
-                ]
-
-                # Create regime objects
-                active_regimes = [
-                    type('Regime', (), {
-                        'id': f"regime_{regime_state.regime.name.lower()}",
-                        'name': regime_state.regime.name
-                    })(),
-                    type('Regime', (), {
-                        'id': f"volatility_{regime_state.volatility.name.lower()}",
-                        'name': f"Volatility: {regime_state.volatility.name}"
-                    })()
-                ]
-            except Exception as e:
-                logger.debug(f"Fallback regime detection failed at {timestamp}: {e}")
-                regime_ids = []
-                active_regimes = []
+    def _fallback_regimes(self, row, symbol: str, timestamp, regime_engine) -> tuple:
+        """Classify a bar with the RegimeEngine (no JSON regime active).
+
+        Args:
+            row: Bar values (Series or dict with FALLBACK_COLUMNS)
+            symbol: Trading symbol
+            timestamp: Bar timestamp
+            regime_engine: RegimeEngine instance
+
+        Returns:
+            Tuple of (active_regimes, regime_ids), empty on failure
+        """
+        try:
+            from src.core.tradingbot.models import FeatureVector
+
+            # Convert timestamp
+            from datetime import datetime
+            if hasattr(timestamp, 'to_pydatetime'):
+                dt_timestamp = timestamp.to_pydatetime()
+            elif isinstance(timestamp, datetime):
+                dt_timestamp = timestamp
+            else:
+                dt_timestamp = datetime.now()
+
+            # Build FeatureVector
+            feature_vector = FeatureVector(
+                timestamp=dt_timestamp,
+                symbol=symbol,
+                close=float(row.get('close', 0)),
+                high=float(row.get('high', 0)),
+                low=float(row.get('low', 0)),
+                open=float(row.get('open', 0)),
+                volume=float(row.get('volume', 0)),
+                rsi=float(row.get('rsi14_value', row.get('1m_rsi14_value', 50))),
+                macd_line=float(row.get('macd12_26_value', row.get('1m_macd12_26_value', 0))),
+                macd_signal=float(row.get('macd12_26_signal', row.get('1m_macd12_26_signal', 0))),
+                adx=float(row.get('adx14_value', row.get('1m_adx14_value', 25))),
+                atr=float(row.get('atr14_value', row.get('1m_atr14_value', 0)))
+            )
+
+            # Classify regime
+            regime_state = regime_engine.classify(feature_vector)
+
+            # Create synthetic regime IDs
+            regime_ids = [
+                f"regime_{regime_state.regime.name.lower()}",
+                f"volatility_{regime_state.volatility.name.lower()}"
+            ]
+
+            # Create regime objects
+            active_regimes = [
+                type('Regime', (), {
+                    'id': f"regime_{regime_state.regime.name.lower()}",
+                    'name': regime_state.regime.name
+                })(),
+                type('Regime', (), {
+                    'id': f"volatility_{regime_state.volatility.name.lower()}",
+                    'name': f"Volatility: {regime_state.volatility.name}"
+                })()
+            ]
+        except Exception as e:
+            logger.debug(f"Fallback regime detection failed at {timestamp}: {e}")
+            regime_ids = []
+            active_regimes = []
 
         return active_regimes, regime_ids
 
@@ -335,16 +558,16 @@ class SimulationPhase:
             # Entry Logic
             if active_trade is None:
                 active_trade = self._check_entry(
-                    strategy_def, config, row, timestamp,
-                    equity, current_risk, perf_counters
+                    strategy_def, row, timestamp, equity, current_risk, perf_counters,
+                    self.strategy_evaluator(strategy_def.entry, row, config.indicators)
                 )
 
             # Exit Logic
             elif active_trade:
                 active_trade, equity = self._check_exit(
-                    strategy_def, config, row, timestamp,
-                    active_trade, equity, current_risk,
-                    trades, perf_counters
+                    strategy_def, row, timestamp, active_trade, equity,
+                    current_risk, trades, perf_counters,
+                    lambda: self.strategy_evaluator(strategy_def.exit, row, config.indicators)
                 )
 
         return active_trade, equity
@@ -352,21 +575,24 @@ class SimulationPhase:
     def _check_entry(
         self,
         strategy_def: StrategyDef,
-        config: TradingBotConfig,
-        row: pd.Series,
+        row,
         timestamp,
         equity: float,
         current_risk,
-        perf_counters: Dict[str, int]
+        perf_counters: Dict[str, int],
+        entry_signal: bool
     ) -> Trade:
         """Check entry conditions.
 
+        Args:
+            entry_signal: Result of the strategy's entry conditions on this bar
+
         Returns:
             Trade object if entered, None otherwise
         """
         perf_counters['entry_evaluations'] += 1
 
-        if not self.strategy_evaluator(strategy_def.entry, row, config.indicators):
+        if not entry_signal:
             return None
 
         # Enter trade
@@ -385,17 +611,21 @@ class SimulationPhase:
     def _check_exit(
         self,
         strategy_def: StrategyDef,
-        config: TradingBotConfig,
-        row: pd.Series,
+        row,
         timestamp,
         active_trade: Trade,
         equity: float,
         current_risk,
         trades: List[Trade],
-        perf_counters: Dict[str, int]
+        perf_counters: Dict[str, int],
+        exit_signal: Callable[[], bool]
     ) -> tuple:
         """Check exit conditions (SL/TP/Signal).
 
+        Args:
+            exit_signal: Evaluates the strategy's exit conditions on this bar
+                (only called when neither SL nor TP was hit)
+
         Returns:
             Tuple of (active_trade, equity)
         """
@@ -423,7 +653,7 @@ class SimulationPhase:
         # Check Strategy Exit Signal
         signal_exit = False
         if not sl_hit and not tp_hit and strategy_def.exit:
-            if self.strategy_evaluator(strategy_def.exit, row, config.indicators):
+            if exit_signal():
                 active_trade.exit_price = price
                 active_trade.exit_reason = "Signal"
                 signal_exit = True
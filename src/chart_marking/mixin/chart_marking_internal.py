@@ -7,19 +7,22 @@ Module 5/6 of chart_marking_mixin.py split.
 Contains:
 - State management (get/restore/clear)
 - JavaScript communication callbacks
-- Update methods for chart sync
+- Update methods for chart sync (batched diffs, see chart_marking_sync)
 - Properties for counts
 """
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from PyQt6.QtCore import Q_ARG, QMetaObject, QThread, Qt, pyqtSlot
 
 from .chart_marking_base import ChartMarkingBase
+from .chart_marking_sync import MarkingFrameScheduler
+
+if TYPE_CHECKING:
+    from .chart_marking_mixin import ChartMarkingMixin
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +30,13 @@ logger = logging.getLogger(__name__)
 class ChartMarkingInternal(ChartMarkingBase):
     """Helper für ChartMarkingMixin internal state & JS communication."""
 
+    def __init__(self, parent: "ChartMarkingMixin"):
+        super().__init__(parent)
+        # Batched diff sync to the chart (one JS call per frame)
+        self.marking_sync = MarkingFrameScheduler(
+            collect=self._collect_chart_items, send=self._execute_js
+        )
+
     # =========================================================================
     # State Management
     # =========================================================================
@@ -78,69 +88,32 @@ class ChartMarkingInternal(ChartMarkingBase):
         self._update_chart_lines()
 
     def _update_chart_markers(self) -> None:
-        """Update all markers on the chart."""
-        # Combine entry and structure markers
-        markers = (
-            self.parent._entry_markers.get_chart_markers() +
-            self.parent._structure_markers.get_chart_markers()
-        )
-        markers.sort(key=lambda m: m["time"])
-
-        js_code = f"window.chartAPI.addTradeMarkers({json.dumps(markers)});"
-        self._execute_js(js_code)
+        """Schedule a marker diff for the next batched chart sync."""
+        self.marking_sync.mark_dirty("markers")
 
     def _update_chart_zones(self) -> None:
-        """Update all zones on the chart."""
-        # First clear existing zones
-        logger.info("ChartMarkingMixin: clearing zones on chart")
-        self._execute_js("window.chartAPI.clearZones();")
-
-        # Add each zone
-        for zone_data in self.parent._zones.get_chart_zones():
-            logger.info(
-                "ChartMarkingMixin: addZone id=%s range=%s-%s prices=%.2f-%.2f",
-                zone_data["id"],
-                zone_data["startTime"],
-                zone_data["endTime"],
-                zone_data["bottomPrice"],
-                zone_data["topPrice"],
-            )
-            js_code = (
-                f"window.chartAPI.addZone("
-                f"'{zone_data['id']}', "
-                f"{zone_data['startTime']}, "
-                f"{zone_data['endTime']}, "
-                f"{zone_data['topPrice']}, "
-                f"{zone_data['bottomPrice']}, "
-                f"'{zone_data['fillColor']}', "
-                f"{zone_data.get('opacity', 0.3)}, "
-                f"'{zone_data['label']}'"
-                f");"
-            )
-            self._execute_js(js_code)
+        """Schedule a zone diff for the next batched chart sync."""
+        self.marking_sync.mark_dirty("zones")
 
     def _update_chart_lines(self) -> None:
-        """Update all horizontal lines on the chart."""
-        # Remove all horizontal lines using the dedicated clearLines API
-        self._execute_js("window.chartAPI?.clearLines();")
-        logger.debug("Cleared all horizontal lines from chart")
-
-        # Add each line
-        # Issue #46: Fixed parameter order to match JavaScript signature
-        # JavaScript: addHorizontalLine(price, color, label, lineStyle, customId)
-        for line_data in self.parent._sl_lines.get_chart_lines():
-            # Escape label to prevent JavaScript injection
-            safe_label = line_data['title'].replace("'", "\\'").replace('"', '\\"')
-            js_code = (
-                f"window.chartAPI.addHorizontalLine("
-                f"{line_data['price']}, "
-                f"'{line_data['color']}', "
-                f"'{safe_label}', "  # Label is 3rd parameter (was 6th!)
-                f"{line_data['lineStyle']}, "  # lineStyle is 4th parameter (was 3rd)
-                f"'{line_data['id']}'"  # customId is 5th parameter (use line ID)
-                f");"
+        """Schedule a line diff for the next batched chart sync."""
+        self.marking_sync.mark_dirty("lines")
+
+    def resync_markings(self) -> None:
+        """Send all markings again (chart page was reloaded)."""
+        self.marking_sync.resync()
+
+    def _collect_chart_items(self, kind: str) -> list[dict[str, Any]]:
+        """Current chart payloads of one marking kind."""
+        if kind == "markers":
+            # Combine entry and structure markers
+            return (
+                self.parent._entry_markers.get_chart_markers() +
+                self.parent._structure_markers.get_chart_markers()
             )
-            self._execute_js(js_code)
+        if kind == "zones":
+            return self.parent._zones.get_chart_zones()
+        return self.parent._sl_lines.get_chart_lines()
 
     @pyqtSlot(str)
     def _execute_js(self, js_code: str) -> None:
@@ -240,6 +240,10 @@ class ChartMarkingMixin:
         """Called when stop-loss lines change."""
         self._internal.on_lines_changed()
 
+    def resync_markings(self) -> None:
+        """Send all markings to the chart again (e.g. after a page reload)."""
+        self._internal.resync_markings()
+
     # =========================================================================
     # Properties for Direct Access (delegiert an ChartMarkingInternal)
     # =========================================================================
@@ -0,0 +1,201 @@
+"""Chart Marking Sync - Versioned shadow state and batched JS updates.
+
+Markers, zones and lines used to be re-sent completely on every change
+(zones even with one runJavaScript call per zone). With hundreds of
+backtest markers and level zones that floods the Qt-JS bridge.
+
+Contains:
+- MarkingShadowState: What the chart currently shows per kind (id -> payload);
+  computes add/update/remove diffs against the managers' state
+- MarkingFrameScheduler: Collects dirty kinds and flushes them once per
+  animation frame as a single ``chartAPI.applyMarkingBatch()`` call
+
+Batch format (JSON):
+    {
+        "version": 7,
+        "reset": false,
+        "markers": {"upsert": [...], "remove": ["id", ...]},
+        "zones": {"upsert": [...], "remove": [...]},
+        "lines": {"upsert": [...], "remove": [...]}
+    }
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from PyQt6.QtCore import QCoreApplication, QMetaObject, QThread, QTimer, Qt
+
+logger = logging.getLogger(__name__)
+
+MARKING_KINDS = ("markers", "zones", "lines")
+
+# One flush per display frame (~60 Hz)
+FRAME_INTERVAL_MS = 16
+
+
+@dataclass
+class MarkingDiff:
+    """Changes of one marking kind since the last sync."""
+
+    upsert: list[dict[str, Any]] = field(default_factory=list)
+    remove: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.upsert or self.remove)
+
+    def to_dict(self) -> dict[str, list]:
+        return {"upsert": self.upsert, "remove": self.remove}
+
+
+def _item_id(item: dict[str, Any]) -> str:
+    item_id = item.get("id")
+    if item_id:
+        return str(item_id)
+    # Items without ID are identified by their content
+    return json.dumps(item, sort_keys=True, default=str)
+
+
+class MarkingShadowState:
+    """Versioned copy of the markings last sent to the chart."""
+
+    def __init__(self) -> None:
+        self._shadow: dict[str, dict[str, dict[str, Any]]] = {kind: {} for kind in MARKING_KINDS}
+        self.version = 0
+        self._reset_pending = False
+
+    def count(self, kind: str) -> int:
+        return len(self._shadow[kind])
+
+    def diff(self, kind: str, items: Iterable[dict[str, Any]]) -> MarkingDiff:
+        """Diff between the shadow of ``kind`` and the desired ``items``."""
+        shadow = self._shadow[kind]
+        desired = {_item_id(item): item for item in items}
+        return MarkingDiff(
+            upsert=[item for item_id, item in desired.items() if shadow.get(item_id) != item],
+            remove=[item_id for item_id in shadow if item_id not in desired],
+        )
+
+    def build_batch(self, desired: dict[str, list[dict[str, Any]]]) -> dict[str, Any] | None:
+        """Diff the given kinds, update the shadow and return the batch.
+
+        Args:
+            desired: Current chart payloads per kind (only dirty kinds)
+
+        Returns:
+            Batch for ``chartAPI.applyMarkingBatch`` or None if nothing changed
+        """
+        batch: dict[str, Any] = {}
+        for kind, items in desired.items():
+            items = [dict(item) for item in items]
+            diff = self.diff(kind, items)
+            if diff:
+                batch[kind] = diff.to_dict()
+                self._shadow[kind] = {_item_id(item): item for item in items}
+        if not batch:
+            return None
+
+        self.version += 1
+        batch["version"] = self.version
+        batch["reset"] = self._reset_pending
+        self._reset_pending = False
+        return batch
+
+    def invalidate(self) -> None:
+        """Forget what the chart shows (e.g. page reload): next batch is a full sync."""
+        for shadow in self._shadow.values():
+            shadow.clear()
+        self._reset_pending = True
+
+
+class MarkingFrameScheduler:
+    """Coalesces marking changes into one batched JS call per frame.
+
+    Without a running Qt application (tests, headless use) changes are
+    flushed synchronously.
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[str], list[dict[str, Any]]],
+        send: Callable[[str], None],
+        interval_ms: int = FRAME_INTERVAL_MS,
+    ) -> None:
+        """
+        Args:
+            collect: Returns the current chart payloads of a kind
+            send: Executes JavaScript in the chart
+            interval_ms: Frame interval
+        """
+        self._collect = collect
+        self._send = send
+        self.interval_ms = interval_ms
+        self.shadow = MarkingShadowState()
+        self._dirty: set[str] = set()
+        self._timer: QTimer | None = None
+
+        # Stats
+        self.batches_sent = 0
+        self.changes_requested = 0
+
+    def mark_dirty(self, kind: str) -> None:
+        """Schedule a sync of ``kind`` for the next frame."""
+        self._dirty.add(kind)
+        self.changes_requested += 1
+        self._schedule()
+
+    def resync(self) -> None:
+        """Resend everything (chart page was reloaded)."""
+        self.shadow.invalidate()
+        for kind in MARKING_KINDS:
+            self._dirty.add(kind)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if QCoreApplication.instance() is None:
+            self.flush()
+            return
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(self.interval_ms)
+            self._timer.timeout.connect(self.flush)
+            # Fire on the GUI thread even if the first change came from a worker
+            self._timer.moveToThread(QCoreApplication.instance().thread())
+        if self._timer.isActive():
+            return
+        if QThread.currentThread() != self._timer.thread():
+            QMetaObject.invokeMethod(self._timer, "start", Qt.ConnectionType.QueuedConnection)
+        else:
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Send all pending changes as one batch."""
+        if not self._dirty:
+            return
+        kinds = [kind for kind in MARKING_KINDS if kind in self._dirty]
+        self._dirty.clear()
+        batch = self.shadow.build_batch({kind: self._collect(kind) for kind in kinds})
+        if batch is None:
+            return
+
+        self.batches_sent += 1
+        logger.debug(
+            "Marking batch v%d: %s",
+            batch["version"],
+            ", ".join(
+                f"{kind} +{len(batch[kind]['upsert'])}/-{len(batch[kind]['remove'])}"
+                for kind in MARKING_KINDS if kind in batch
+            ),
+        )
+        self._send(f"window.chartAPI?.applyMarkingBatch({json.dumps(batch, default=str)});")
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "version": self.shadow.version,
+            "batches_sent": self.batches_sent,
+            "changes_requested": self.changes_requested,
+        }
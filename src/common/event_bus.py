@@ -2,6 +2,11 @@
 
 This module provides a centralized event system using the blinker library
 for decoupled communication between different components of the trading app.
+
+Market data events can also be consumed per symbol: handlers subscribed with
+``symbol=...`` sit on an (event type, symbol) topic and are only invoked for
+events whose ``data["symbol"]`` matches, so per-tick dispatch cost no longer
+grows with the number of open charts across all streamed symbols.
 """
 
 import logging
@@ -161,12 +166,20 @@ class EventBus:
         from collections import deque  # Issue #41: Use deque for O(1) append/pop
         self._signals = Namespace()
         self._signal_cache = {}
+        # Routing table for symbol topics: (event type, symbol) -> signal
+        self._topic_signals: dict[tuple[EventType, str], Any] = {}
         # Issue #41: Use deque with maxlen for O(1) operations instead of list.pop(0) which is O(n)
         self._event_history = deque(maxlen=10000)
         self._max_history_size = 10000
 
-    def get_signal(self, event_type: EventType):
-        """Get or create a signal for the given event type."""
+    def get_signal(self, event_type: EventType, symbol: str | None = None):
+        """Get or create a signal for the given event type or symbol topic."""
+        if symbol is not None:
+            key = (event_type, symbol)
+            if key not in self._topic_signals:
+                self._topic_signals[key] = self._signals.signal(f"{event_type.value}:{symbol}")
+            return self._topic_signals[key]
+
         if event_type not in self._signal_cache:
             self._signal_cache[event_type] = self._signals.signal(event_type.value)
         return self._signal_cache[event_type]
@@ -178,32 +191,14 @@ class EventBus:
             event: The event to emit
         """
         try:
-            signal = self.get_signal(event.type)
-
-            # Deliver to each receiver individually so one bad handler
-            # doesn't break the entire event pipeline.
-            for receiver in list(signal.receivers_for(event)):
-                try:
-                    result = receiver(event)
-
-                    # Support async receivers (coroutine functions)
-                    if inspect.iscoroutine(result):
-                        try:
-                            asyncio.get_running_loop().create_task(result)
-                        except RuntimeError:
-                            # No running loop – log and drop the coroutine
-                            logger.warning(
-                                "Async event handler scheduled without a running loop: %s",
-                                receiver,
-                            )
-
-                except Exception as handler_err:
-                    logger.error(
-                        "Error delivering %s to %s: %s",
-                        event.type,
-                        receiver,
-                        handler_err,
-                    )
+            self._deliver(self.get_signal(event.type), event)
+
+            # Symbol topic: hashed lookup, no signal is created on emit
+            symbol = event.data.get("symbol") if event.data else None
+            if symbol is not None:
+                topic = self._topic_signals.get((event.type, symbol))
+                if topic is not None:
+                    self._deliver(topic, event)
 
             # Store in history (deque handles size limit automatically with O(1) operations)
             self._event_history.append(event)
@@ -220,11 +215,41 @@ class EventBus:
         except Exception as e:
             logger.error(f"Error emitting event {event.type}: {e}")
 
+    def _deliver(self, signal, event: Event) -> None:
+        """Deliver an event to all receivers of a signal.
+
+        Each receiver is called individually so one bad handler
+        doesn't break the entire event pipeline.
+        """
+        for receiver in list(signal.receivers_for(event)):
+            try:
+                result = receiver(event)
+
+                # Support async receivers (coroutine functions)
+                if inspect.iscoroutine(result):
+                    try:
+                        asyncio.get_running_loop().create_task(result)
+                    except RuntimeError:
+                        # No running loop – log and drop the coroutine
+                        logger.warning(
+                            "Async event handler scheduled without a running loop: %s",
+                            receiver,
+                        )
+
+            except Exception as handler_err:
+                logger.error(
+                    "Error delivering %s to %s: %s",
+                    event.type,
+                    receiver,
+                    handler_err,
+                )
+
     def subscribe(
         self,
         event_type: EventType,
         handler: Callable[[Event], None],
-        filter: Callable[[Event], bool] | None = None
+        filter: Callable[[Event], bool] | None = None,
+        symbol: str | None = None
     ) -> None:
         """Subscribe to an event type with optional filtering.
 
@@ -235,6 +260,9 @@ class EventBus:
                    called when filter(event) returns True. This is more
                    efficient than filtering in the handler itself as it
                    prevents the handler call entirely.
+            symbol: Optional symbol topic. If provided, handler is only
+                   called for events with data["symbol"] == symbol, without
+                   being invoked for any other symbol.
 
         Example:
             # Subscribe only to events for a specific symbol
@@ -243,8 +271,11 @@ class EventBus:
                 self._handle_tick,
                 filter=lambda e: e.data.get("symbol") == "AAPL"
             )
+
+            # Same, routed by symbol topic (no per-event filter call)
+            event_bus.subscribe(EventType.MARKET_TICK, self._handle_tick, symbol="AAPL")
         """
-        signal = self.get_signal(event_type)
+        signal = self.get_signal(event_type, symbol)
         
         if filter is not None:
             # Wrap handler with filter
@@ -255,7 +286,7 @@ class EventBus:
             # Store reference to original handler for unsubscribe
             if not hasattr(self, '_filtered_handlers'):
                 self._filtered_handlers = {}
-            self._filtered_handlers[(event_type, handler)] = filtered_handler
+            self._filtered_handlers[(event_type, symbol, handler)] = filtered_handler
             
             signal.connect(filtered_handler)
         else:
@@ -264,17 +295,49 @@ class EventBus:
         logger.debug(f"Handler registered for {event_type.value}")
 
 
-    def unsubscribe(self, event_type: EventType, handler: Callable[[Event], None]) -> None:
+    def unsubscribe(
+        self,
+        event_type: EventType,
+        handler: Callable[[Event], None],
+        symbol: str | None = None
+    ) -> None:
         """Unsubscribe from an event type.
 
         Args:
             event_type: The type of event to unsubscribe from
             handler: The callback function to remove
+            symbol: Symbol topic the handler was subscribed to (if any)
         """
-        signal = self.get_signal(event_type)
-        signal.disconnect(handler)
+        signal = self.get_signal(event_type, symbol)
+        filtered = getattr(self, '_filtered_handlers', {}).pop((event_type, symbol, handler), None)
+        signal.disconnect(filtered or handler)
+
+        if symbol is not None and not signal.receivers:
+            self._topic_signals.pop((event_type, symbol), None)
         logger.debug(f"Handler unregistered for {event_type.value}")
 
+    def move_symbol_subscription(
+        self,
+        event_type: EventType,
+        handler: Callable[[Event], None],
+        old_symbol: str | None,
+        new_symbol: str | None
+    ) -> None:
+        """Move a handler from one symbol topic to another (e.g. on symbol change).
+
+        Args:
+            event_type: The subscribed event type
+            handler: The subscribed callback
+            old_symbol: Current topic symbol (None = not subscribed)
+            new_symbol: New topic symbol (None = only unsubscribe)
+        """
+        if old_symbol == new_symbol:
+            return
+        if old_symbol is not None:
+            self.unsubscribe(event_type, handler, symbol=old_symbol)
+        if new_symbol is not None:
+            self.subscribe(event_type, handler, symbol=new_symbol)
+
     def get_history(self, event_type: EventType | None = None,
                     limit: int = 100) -> list[Event]:
         """Get event history, optionally filtered by type.
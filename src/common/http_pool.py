@@ -0,0 +1,262 @@
+"""Shared HTTP Session Pool for OrderPilot-AI.
+
+Broker adapters and market data providers used to open a new
+``aiohttp.ClientSession`` per request (or per adapter), paying a fresh
+DNS lookup and TCP/TLS handshake every time. This module keeps one
+keep-alive session per client name and event loop.
+
+Features:
+    - Keep-alive connection reuse with per-host concurrency limits
+    - Sessions closed with their event loop (asyncio.run() in worker threads)
+    - DNS caching
+    - Per-endpoint latency metrics (count, errors, mean/p50/p95)
+    - Connection metrics (new connections vs. reused ones)
+
+HTTP/2 is not available: aiohttp only speaks HTTP/1.1, so requests to the
+same host are multiplexed over the per-host keep-alive connections instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HTTPPoolConfig:
+    """Connection settings shared by all pooled sessions."""
+
+    limit: int = 100  # Total connections per session
+    limit_per_host: int = 10  # Concurrent connections per host
+    keepalive_timeout: float = 60.0  # Seconds an idle connection is kept
+    dns_cache_ttl: int = 300  # Seconds
+    latency_window: int = 500  # Samples kept per endpoint
+
+
+class EndpointStats:
+    """Latency samples of one endpoint (method + host + path)."""
+
+    def __init__(self, window: int) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.errors = 0
+
+    def record(self, latency_ms: float, ok: bool = True) -> None:
+        self.count += 1
+        if not ok:
+            self.errors += 1
+        self.samples.append(latency_ms)
+
+    def snapshot(self) -> dict[str, float]:
+        if not self.samples:
+            return {"count": self.count, "errors": self.errors, "mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0}
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": sum(ordered) / len(ordered),
+            "p50_ms": ordered[len(ordered) // 2],
+            "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        }
+
+
+class HTTPSessionPool:
+    """Keep-alive aiohttp sessions shared per client name and event loop.
+
+    Sessions are owned by the pool: callers must not close them. Session
+    options (timeout, default headers, ...) are taken from the first call
+    for a name; per-request options can still be passed to each request.
+
+    The pool is shared by all threads. Each loop gets a guard task that
+    closes the loop's sessions when the loop cancels its pending tasks on
+    shutdown (``asyncio.run()`` does), so short-lived loops don't leak
+    connectors. Long-lived loops are closed with ``close()``.
+    """
+
+    def __init__(self, config: HTTPPoolConfig | None = None) -> None:
+        self.config = config or HTTPPoolConfig()
+        self._lock = threading.Lock()  # Guards _sessions/_loop_guards (used from several threads)
+        self._sessions: dict[tuple[str, int], tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+        self._loop_guards: dict[int, tuple[asyncio.AbstractEventLoop, asyncio.Task]] = {}
+        self._endpoints: dict[str, EndpointStats] = {}
+        self.connections_created: dict[str, int] = defaultdict(int)
+        self.connections_reused = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+
+    # ==================== Sessions ====================
+
+    def session(self, name: str, **session_kwargs: Any) -> aiohttp.ClientSession:
+        """Get the shared session for ``name`` on the running event loop.
+
+        Args:
+            name: Client name (e.g. "bitunix", "finnhub")
+            **session_kwargs: ClientSession options used when the session is created
+
+        Returns:
+            Open ClientSession (do not close it)
+        """
+        loop = asyncio.get_running_loop()
+        key = (name, id(loop))
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is not None and entry[0] is loop and not entry[1].closed:
+                return entry[1]
+
+            self._prune_closed_loops()
+            connector = aiohttp.TCPConnector(
+                limit=self.config.limit,
+                limit_per_host=self.config.limit_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                ttl_dns_cache=self.config.dns_cache_ttl,
+                use_dns_cache=True,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[self._trace_config()],
+                **session_kwargs,
+            )
+            self._sessions[key] = (loop, session)
+            self._guard_loop(loop)
+        logger.debug(f"HTTP pool: created session '{name}'")
+        return session
+
+    @asynccontextmanager
+    async def borrow(self, name: str, **session_kwargs: Any) -> AsyncIterator[aiohttp.ClientSession]:
+        """Drop-in for ``async with aiohttp.ClientSession() as session`` that keeps the session open."""
+        yield self.session(name, **session_kwargs)
+
+    def _prune_closed_loops(self) -> None:
+        """Drop entries of closed sessions/loops (caller holds the lock)."""
+        for key, (loop, session) in list(self._sessions.items()):
+            if loop.is_closed() or session.closed:
+                del self._sessions[key]
+                if not session.closed:
+                    # Its loop ended without cancelling the guard (no asyncio.run()):
+                    # the transports can't be closed gracefully anymore
+                    session.detach()
+        for loop_id, (loop, _) in list(self._loop_guards.items()):
+            if loop.is_closed():
+                del self._loop_guards[loop_id]
+
+    def _guard_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the shutdown guard of ``loop`` (caller holds the lock)."""
+        entry = self._loop_guards.get(id(loop))
+        if entry is None or entry[0] is not loop or entry[1].done():
+            task = loop.create_task(self._close_on_loop_shutdown(loop), name="http-pool-guard")
+            self._loop_guards[id(loop)] = (loop, task)
+
+    async def _close_on_loop_shutdown(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Wait until the loop cancels its pending tasks, then close its sessions."""
+        try:
+            await loop.create_future()
+        except asyncio.CancelledError:
+            await self._close_loop_sessions(loop)
+            raise
+
+    async def _close_loop_sessions(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            sessions = [
+                self._sessions.pop(key)[1]
+                for key, (session_loop, _) in list(self._sessions.items())
+                if session_loop is loop
+            ]
+        for session in sessions:
+            await session.close()
+
+    async def close(self) -> None:
+        """Close all sessions of the running event loop."""
+        loop = asyncio.get_running_loop()
+        await self._close_loop_sessions(loop)
+        with self._lock:
+            entry = self._loop_guards.pop(id(loop), None)
+            self._prune_closed_loops()
+        if entry is not None and entry[0] is loop and entry[1] is not asyncio.current_task():
+            entry[1].cancel()
+            try:
+                await entry[1]
+            except asyncio.CancelledError:
+                pass
+
+    # ==================== Metrics ====================
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.started = time.perf_counter()
+            ctx.host = params.url.host
+
+        async def on_request_end(session, ctx, params):
+            self._record(params.method, params.url, ctx.started, ok=params.response.status < 500)
+
+        async def on_request_exception(session, ctx, params):
+            self._record(params.method, params.url, ctx.started, ok=False)
+
+        async def on_connection_create_end(session, ctx, params):
+            self.connections_created[getattr(ctx, "host", "")] += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.connections_reused += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx, params):
+            self.dns_cache_misses += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace
+
+    def _record(self, method: str, url, started: float, ok: bool) -> None:
+        key = f"{method} {url.host}{url.path}"
+        stats = self._endpoints.get(key)
+        if stats is None:
+            stats = self._endpoints[key] = EndpointStats(self.config.latency_window)
+        stats.record((time.perf_counter() - started) * 1000, ok)
+
+    def endpoint_stats(self) -> dict[str, dict[str, float]]:
+        """Latency metrics per endpoint ("GET host/path")."""
+        return {key: stats.snapshot() for key, stats in self._endpoints.items()}
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            sessions = len(self._sessions)
+        return {
+            "sessions": sessions,
+            "connections_created": sum(self.connections_created.values()),
+            "connections_reused": self.connections_reused,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+            "endpoints": self.endpoint_stats(),
+        }
+
+
+_http_pool: HTTPSessionPool | None = None
+_http_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HTTPSessionPool:
+    """Get the process-wide HTTP session pool."""
+    global _http_pool
+    if _http_pool is None:
+        with _http_pool_lock:
+            if _http_pool is None:
+                _http_pool = HTTPSessionPool()
+    return _http_pool
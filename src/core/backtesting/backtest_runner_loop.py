@@ -57,6 +57,11 @@ class BacktestRunnerLoop:
 
             logger.info(f"✅ {bar_count} Bars geladen")
 
+            # MTF Bars einmal über den gesamten Datensatz resamplen
+            self.parent.mtf_resampler.prepare(
+                self.parent.replay_provider.data, symbol=self.parent.config.symbol
+            )
+
             # 3. Haupt-Loop
             self._emit_progress(20, f"Verarbeite {bar_count} Bars...")
 
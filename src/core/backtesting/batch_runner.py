@@ -347,6 +347,42 @@ class BatchRunner:
         """Stoppt den laufenden Batch."""
         self._should_stop = True
 
+    async def run_combinations(
+        self,
+        combinations: list[tuple[int, dict[str, Any]]],
+        on_result: Callable[[int, BatchRunResult], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> list[BatchRunResult]:
+        """Führt eine Teilmenge von Kombinationen aus (z.B. in einem Job-Worker).
+
+        Args:
+            combinations: (Run-Index, Parameter) Paare
+            on_result: Callback nach jedem Run
+            should_stop: Abbruch-Prüfung vor jedem Run
+
+        Returns:
+            Ergebnisse in Reihenfolge der Ausführung (ohne Ranking)
+        """
+        await self._prepare_replay_provider()
+
+        results = []
+        for index, params in combinations:
+            if self._should_stop or (should_stop and should_stop()):
+                break
+            try:
+                result = await self._run_single(params, index)
+            except Exception as e:
+                logger.exception(f"Run {index+1} failed")
+                result = BatchRunResult(
+                    run_id=f"{self.batch_id}_run_{index:04d}",
+                    parameters=params,
+                    error=str(e),
+                )
+            results.append(result)
+            if on_result:
+                on_result(index, result)
+        return results
+
     async def _run_single(self, params: dict[str, Any], index: int) -> BatchRunResult:
         """Führt einen einzelnen Run durch."""
         run_id = f"{self.batch_id}_run_{index:04d}"
@@ -420,13 +456,19 @@ class BatchRunner:
 
             self._shared_replay_provider = ReplayMarketDataProvider(history_window=200)
 
+        base_config = self.config.base_config
+
         # Wenn initial_data vorhanden, nutze diese direkt
         if self.initial_data is not None and not self.initial_data.empty:
             logger.info("Using provided initial_data for batch test (skipping DB fetch)")
-            self._shared_replay_provider.load_from_dataframe(self.initial_data)
+            self._shared_replay_provider.load_from_dataframe(
+                self.initial_data,
+                symbol=base_config.symbol,
+                start_date=base_config.start_date,
+                end_date=base_config.end_date,
+            )
             return
 
-        base_config = self.config.base_config
         await self._shared_replay_provider.load_data(
             symbol=base_config.symbol,
             start_date=base_config.start_date,
@@ -435,6 +477,10 @@ class BatchRunner:
 
     def _rank_results(self) -> None:
         """Rankt Ergebnisse nach Zielmetrik."""
+        self.rank(self._results)
+
+    def rank(self, results: list[BatchRunResult]) -> None:
+        """Sortiert Ergebnisse in-place nach Zielmetrik (bestes zuerst)."""
         target = self.config.target_metric
         minimize = self.config.minimize
 
@@ -448,7 +494,7 @@ class BatchRunner:
 
             return float(value)
 
-        self._results.sort(key=get_metric_value, reverse=not minimize)
+        results.sort(key=get_metric_value, reverse=not minimize)
 
     def _params_to_string(self, params: dict[str, Any]) -> str:
         """Konvertiert Parameter zu kurzem String."""
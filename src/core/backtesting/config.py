@@ -132,6 +132,8 @@ class WalkForwardConfig:
         step_size_days: Schrittweite zwischen Folds
         min_folds: Minimale Anzahl Folds
         reoptimize_each_fold: Neu-Optimieren pro Fold
+        n_jobs: Parallele Fold-Prozesse (-1 = alle CPUs, 1 = sequentiell)
+        preload_data: Gesamtzeitraum einmal laden und pro Fold slicen
     """
     base_config: BacktestConfig
     batch_config: BatchConfig
@@ -140,6 +142,8 @@ class WalkForwardConfig:
     step_size_days: int = 30     # Rolling um 1 Monat
     min_folds: int = 4
     reoptimize_each_fold: bool = True
+    n_jobs: int = 1  # Default: sequentiell (Signal-Callbacks sind oft nicht picklebar)
+    preload_data: bool = True
 
 
 @dataclass
@@ -10,6 +10,8 @@ Features:
 - Nur "closed candles" für höhere TF
 - Deterministische Berechnung
 - Cache für Performance
+- prepare(): einmaliges Resampling des gesamten Datensatzes, update()
+  schneidet dann nur noch per searchsorted zu (siehe src/backtesting/mtf_alignment.py)
 """
 
 from __future__ import annotations
@@ -22,6 +24,15 @@ from typing import Iterator
 import pandas as pd
 import numpy as np
 
+from src.backtesting.mtf_alignment import (
+    TIMEFRAME_MINUTES,
+    closed_bar_indices,
+    get_alignment_cache,
+    range_key,
+    resample_frame,
+    timestamps_to_ms,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,26 +82,6 @@ def _safe_timestamp_to_int(value) -> int:
         return 0
 
 
-# Timeframe-Definitionen in Minuten
-TIMEFRAME_MINUTES = {
-    "1m": 1,
-    "3m": 3,
-    "5m": 5,
-    "15m": 15,
-    "30m": 30,
-    "1h": 60,
-    "2h": 120,
-    "4h": 240,
-    "6h": 360,
-    "8h": 480,
-    "12h": 720,
-    "1D": 1440,
-    "1d": 1440,
-    "1W": 10080,
-    "1w": 10080,
-}
-
-
 @dataclass
 class ResampledBar:
     """Eine resampelte Bar.
@@ -140,6 +131,9 @@ class MTFResampler:
     Example:
         resampler = MTFResampler(["5m", "15m", "1h"])
 
+        # Optional: gesamten Datensatz einmal resamplen (Backtest)
+        resampler.prepare(data_1m, symbol="BTCUSDT")
+
         # Bei jeder neuen 1m Candle:
         mtf_data = resampler.update(current_1m_candle, history_1m)
 
@@ -169,6 +163,11 @@ class MTFResampler:
         # Letzte bekannte vollständige Bar-Timestamps pro TF
         self._last_complete_ts: dict[str, int] = {tf: 0 for tf in timeframes}
 
+        # Vorberechnete Bars des gesamten Datensatzes (prepare())
+        self._prepared: dict[str, pd.DataFrame] = {}
+        self._prepared_bar_end: dict[str, np.ndarray] = {}
+        self._prepared_range: tuple[int, int] | None = None
+
         logger.info(f"MTFResampler initialized: {timeframes}")
 
     def _validate_timeframes(self, timeframes: list[str]) -> None:
@@ -254,47 +253,74 @@ class MTFResampler:
         if history_1m.empty:
             return pd.DataFrame()
 
-        minutes = self.get_timeframe_minutes(timeframe)
-        period_ms = minutes * 60 * 1000
-
-        # Kopie erstellen und Bar-Start berechnen
-        df = history_1m.copy()
-
-        # Konvertiere timestamp zu int (ms) falls es DatetimeArray ist
-        if pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
-            # Konvertiere datetime zu Unix timestamp in ms
-            df["timestamp"] = df["timestamp"].astype('int64') // 10**6
-        elif not pd.api.types.is_numeric_dtype(df["timestamp"]):
+        df = history_1m
+        if not pd.api.types.is_numeric_dtype(df["timestamp"]) and not pd.api.types.is_datetime64_any_dtype(
+            df["timestamp"]
+        ):
             # Versuche Konvertierung über _safe_timestamp_to_int
-            df["timestamp"] = df["timestamp"].apply(_safe_timestamp_to_int)
-
-        df["bar_start"] = (df["timestamp"] // period_ms) * period_ms
-
-        # Gruppiere und aggregiere
-        resampled = df.groupby("bar_start").agg({
-            "timestamp": "first",
-            "open": "first",
-            "high": "max",
-            "low": "min",
-            "close": "last",
-            "volume": "sum",
-        }).reset_index()
+            df = df.assign(timestamp=df["timestamp"].apply(_safe_timestamp_to_int))
 
-        # Berechne bar_end und bar_count
-        resampled["bar_end"] = resampled["bar_start"] + period_ms
-        resampled["bar_count"] = df.groupby("bar_start").size().values
+        resampled = resample_frame(df, timeframe)
 
         # KRITISCH: Nur vollständige Bars zurückgeben!
         # Eine Bar ist vollständig wenn current_timestamp >= bar_end
-        resampled["is_complete"] = resampled["bar_end"] <= current_timestamp
+        last = closed_bar_indices(resampled["bar_end"].to_numpy(), current_timestamp)
+        return resampled.iloc[: int(last) + 1].reset_index(drop=True)
 
-        # Filtere auf vollständige Bars
-        complete_bars = resampled[resampled["is_complete"]].copy()
+    def prepare(self, data_1m: pd.DataFrame, symbol: str | None = None) -> None:
+        """Resampled den gesamten 1m Datensatz einmal für alle Timeframes.
 
-        # Sortiere nach Timestamp
-        complete_bars = complete_bars.sort_values("bar_start").reset_index(drop=True)
+        Danach liefert update() für Zeitpunkte innerhalb des Datensatzes
+        die abgeschlossenen Bars per searchsorted statt per Resampling der
+        History. Die Bars sind unabhängig vom History-Fenster vollständig
+        (auch die erste Bar im Fenster).
 
-        return complete_bars
+        Args:
+            data_1m: DataFrame mit timestamp + OHLCV (gesamter Replay-Datensatz)
+            symbol: Symbol für den prozessweiten Cache (ohne Symbol kein Caching)
+        """
+        self._prepared.clear()
+        self._prepared_bar_end.clear()
+        self._prepared_range = None
+        self.clear_cache()
+        if data_1m is None or data_1m.empty:
+            return
+
+        ts = timestamps_to_ms(data_1m["timestamp"])
+        cache = get_alignment_cache()
+        for tf in self.timeframes:
+            if symbol is None:
+                bars = resample_frame(data_1m, tf)
+            else:
+                key = ("bars", symbol, tf, range_key(ts))
+                bars = cache.get_or_compute(key, lambda tf=tf: resample_frame(data_1m, tf))
+            self._prepared[tf] = bars
+            self._prepared_bar_end[tf] = bars["bar_end"].to_numpy()
+
+        self._prepared_range = (int(ts.min()), int(ts.max()))
+        logger.info(f"MTFResampler prepared: {len(ts)} bars, {self.get_prepared_statistics()}")
+
+    def get_prepared_statistics(self) -> dict[str, int]:
+        """Anzahl vorberechneter Bars pro TF (leer ohne prepare())."""
+        return {tf: len(df) for tf, df in self._prepared.items()}
+
+    def _update_prepared(self, current_candle_ts: int) -> dict[str, pd.DataFrame]:
+        """update() aus den vorberechneten Bars (nur Index-Suche + Slice)."""
+        result = {}
+        for tf in self.timeframes:
+            bars = self._prepared[tf]
+            last = int(closed_bar_indices(self._prepared_bar_end[tf], current_candle_ts))
+            if last < 0:
+                result[tf] = self._cache[tf]
+                continue
+
+            bar_start = int(bars["bar_start"].iat[last])
+            if bar_start != self._last_complete_ts[tf] or self._cache[tf].empty:
+                first = max(0, last + 1 - self.history_bars_per_tf)
+                self._cache[tf] = bars.iloc[first : last + 1].reset_index(drop=True)
+                self._last_complete_ts[tf] = bar_start
+            result[tf] = self._cache[tf]
+        return result
 
     def update(
         self,
@@ -319,6 +345,10 @@ class MTFResampler:
             return {tf: df.copy() for tf, df in self._cache.items()}
         
         self._last_candle_ts = current_candle_ts
+
+        if self._prepared_range and self._prepared_range[0] <= current_candle_ts <= self._prepared_range[1]:
+            return self._update_prepared(current_candle_ts)
+
         result = {}
 
         for tf in self.timeframes:
@@ -421,6 +451,7 @@ class MTFResampler:
         for tf in self.timeframes:
             self._cache[tf] = pd.DataFrame()
             self._last_complete_ts[tf] = 0
+        self._last_candle_ts = -1
 
     def get_cache_statistics(self) -> dict[str, int]:
         """Gibt Cache-Statistiken zurück."""
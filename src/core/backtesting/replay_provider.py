@@ -281,7 +281,7 @@ class ReplayMarketDataProvider:
         Args:
             history_window: Lookback-Fenster für History
         """
-        self.db_manager = get_db_manager()
+        self._db_manager = None
         self.history_window = history_window
         self._data: pd.DataFrame | None = None
         self._iterator: CandleIterator | None = None
@@ -289,6 +289,17 @@ class ReplayMarketDataProvider:
         self._start_date: datetime | None = None
         self._end_date: datetime | None = None
 
+    @property
+    def db_manager(self):
+        """DB-Manager, erst beim ersten DB-Zugriff aufgelöst.
+
+        Provider, die nur über ``load_from_dataframe`` befüllt werden (z.B. in
+        Walk-Forward Worker-Prozessen), benötigen keine initialisierte DB.
+        """
+        if self._db_manager is None:
+            self._db_manager = get_db_manager()
+        return self._db_manager
+
     async def load_data(
         self,
         symbol: str,
@@ -422,15 +433,33 @@ class ReplayMarketDataProvider:
         if removed > 0:
             logger.warning(f"Cleaned {removed} invalid bars")
 
-    def load_from_dataframe(self, df: pd.DataFrame) -> int:
+    def load_from_dataframe(
+        self,
+        df: pd.DataFrame,
+        symbol: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> int:
         """Lädt Daten direkt aus einem DataFrame.
 
         Args:
             df: DataFrame mit OHLCV Daten
+            symbol: Optional - Symbol, für das die Daten gelten
+            start_date: Optional - Startdatum des Datenfensters
+            end_date: Optional - Enddatum des Datenfensters
+
+        Wenn Symbol und Zeitraum angegeben sind, bedient ein späteres
+        ``load_data`` mit identischer Anfrage die Daten aus dem Cache statt
+        aus der Datenbank.
 
         Returns:
             Anzahl Bars
         """
+        if symbol is not None:
+            self._symbol = symbol
+            self._start_date = start_date
+            self._end_date = end_date
+
         self._data = df.copy()
         self._validate_and_clean()
 
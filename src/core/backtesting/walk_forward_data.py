@@ -0,0 +1,88 @@
+"""Walk-Forward Runner - Shared Fold Data.
+
+Lädt den kompletten Walk-Forward Zeitraum einmalig aus der Datenbank und
+liefert pro Fold Train-/Test-Slices daraus, statt jeden Fold (und jeden
+BatchRunner) erneut die DB abfragen zu lassen.
+
+Contains:
+- WalkForwardDataCache: Einmal laden, per Fold slicen
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .replay_provider import ReplayMarketDataProvider, _safe_timestamp_to_int
+
+logger = logging.getLogger(__name__)
+
+
+def _db_bound(value: datetime) -> datetime:
+    """Normalisiert eine Fold-Grenze wie ``_load_from_db`` (ms -> lokale naive Zeit)."""
+    return datetime.fromtimestamp(int(value.timestamp() * 1000) / 1000)
+
+
+class WalkForwardDataCache:
+    """Hält die OHLCV-Daten des gesamten Walk-Forward Zeitraums.
+
+    Die Slices entsprechen exakt dem, was ``ReplayMarketDataProvider.load_data``
+    für das jeweilige Fenster aus der DB laden würde (beide Grenzen inklusive).
+    """
+
+    def __init__(self, symbol: str):
+        """
+        Args:
+            symbol: Trading-Symbol (wie in BacktestConfig)
+        """
+        self.symbol = symbol
+        self._data: pd.DataFrame | None = None
+        self._keys: np.ndarray | None = None
+
+    async def load(self, start_date: datetime, end_date: datetime) -> int:
+        """Lädt den Gesamtzeitraum einmalig.
+
+        Returns:
+            Anzahl geladener Bars
+        """
+        provider = ReplayMarketDataProvider()
+        count = await provider.load_data(self.symbol, start_date, end_date)
+        self.set_data(provider.data)
+        logger.info(f"Walk-Forward data cached: {count} bars ({start_date} - {end_date})")
+        return count
+
+    def set_data(self, data: pd.DataFrame) -> None:
+        """Setzt bereits geladene Daten (sortiert nach ``timestamp``)."""
+        self._data = data.reset_index(drop=True)
+        timestamps = self._data["timestamp"]
+        if pd.api.types.is_datetime64_any_dtype(timestamps):
+            self._keys = timestamps.to_numpy(dtype="datetime64[ns]")
+        else:
+            self._keys = np.fromiter(
+                (_safe_timestamp_to_int(ts) for ts in timestamps),
+                dtype=np.int64,
+                count=len(timestamps),
+            )
+
+    def slice(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Gibt die Bars in ``[start_date, end_date]`` zurück."""
+        if self._data is None or self._keys is None:
+            raise RuntimeError("WalkForwardDataCache not loaded")
+
+        start, end = _db_bound(start_date), _db_bound(end_date)
+        if self._keys.dtype.kind == "M":
+            lo_key, hi_key = np.datetime64(start, "ns"), np.datetime64(end, "ns")
+        else:
+            lo_key, hi_key = _safe_timestamp_to_int(start), _safe_timestamp_to_int(end)
+
+        lo = int(np.searchsorted(self._keys, lo_key, side="left"))
+        hi = int(np.searchsorted(self._keys, hi_key, side="right"))
+        return self._data.iloc[lo:hi]
+
+    @property
+    def bar_count(self) -> int:
+        """Anzahl gecachter Bars."""
+        return 0 if self._data is None else len(self._data)
@@ -6,16 +6,29 @@ Module 3/6 of walk_forward_runner.py split.
 
 Contains:
 - Main run orchestration
+- Sequential and process-pool fold scheduling
 - Stop control
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import multiprocessing
+import os
+import pickle
+import signal
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+from .walk_forward_data import WalkForwardDataCache
+from .walk_forward_fold_runner import oos_phase_job, train_phase_job
+
 logger = logging.getLogger(__name__)
 
+STOP_POLL_S = 0.5  # Sekunden zwischen Stop-Prüfungen während Jobs laufen
+
 
 class WalkForwardExecutor:
     """Helper für WalkForwardRunner main execution."""
@@ -41,6 +54,7 @@ class WalkForwardExecutor:
         self.parent._is_running = True
         self.parent._should_stop = False
         self.parent._folds.clear()
+        self.parent._data_cache = None
 
         start_time = datetime.now()
 
@@ -55,46 +69,22 @@ class WalkForwardExecutor:
 
             logger.info(f"Starting Walk-Forward with {total_folds} folds")
 
-            # 2. Folds ausführen
-            successful = 0
+            # 2. Gesamtzeitraum einmal laden, Folds bekommen Slices daraus
+            if self.parent.config.preload_data:
+                self.parent._progress.emit_progress(2, "Lade Daten...")
+                await self._preload_data(fold_periods)
 
-            for i, (train_start, train_end, test_start, test_end) in enumerate(fold_periods):
-                if self.parent._should_stop:
-                    logger.info("Walk-Forward stopped by user")
-                    break
-
-                progress = int((i / total_folds) * 90) + 5
-                self.parent._progress.emit_progress(
-                    progress,
-                    f"Fold {i+1}/{total_folds}: Train {train_start.date()} - {train_end.date()}"
-                )
-
-                try:
-                    fold_result = await self.parent._fold_runner.run_fold(
-                        fold_index=i,
-                        train_start=train_start,
-                        train_end=train_end,
-                        test_start=test_start,
-                        test_end=test_end,
-                    )
-                    self.parent._folds.append(fold_result)
+            # 3. Folds ausführen
+            workers = self._resolve_workers(total_folds)
+            if workers > 1:
+                await self._run_parallel(fold_periods, workers)
+            else:
+                await self._run_sequential(fold_periods)
 
-                    if fold_result.is_successful:
-                        successful += 1
+            self.parent._folds.sort(key=lambda fold: fold.fold_index)
+            successful = sum(1 for fold in self.parent._folds if fold.is_successful)
 
-                except Exception as e:
-                    from .walk_forward_runner import FoldResult
-                    logger.exception(f"Fold {i+1} failed")
-                    self.parent._folds.append(FoldResult(
-                        fold_index=i,
-                        train_start=train_start,
-                        train_end=train_end,
-                        test_start=test_start,
-                        test_end=test_end,
-                        error=str(e),
-                    ))
-
-            # 3. Aggregation
+            # 4. Aggregation
             self.parent._progress.emit_progress(95, "Berechne aggregierte Metriken...")
             aggregated = self.parent._metrics.calculate_aggregated_metrics()
             stability = self.parent._metrics.calculate_stability_metrics()
@@ -120,8 +110,225 @@ class WalkForwardExecutor:
             return summary
 
         finally:
+            self.parent._data_cache = None
             self.parent._is_running = False
 
     def stop(self) -> None:
         """Stoppt die laufende Analyse."""
         self.parent._should_stop = True
+
+    async def _preload_data(self, fold_periods) -> None:
+        """Lädt den Zeitraum aller Folds einmalig aus der DB."""
+        start = min(period[0] for period in fold_periods)
+        end = max(period[3] for period in fold_periods)
+
+        cache = WalkForwardDataCache(self.parent.config.base_config.symbol)
+        await cache.load(start, end)
+        self.parent._data_cache = cache
+
+    def _resolve_workers(self, total_folds: int) -> int:
+        """Anzahl Worker-Prozesse (1 = sequentiell im Event-Loop)."""
+        n_jobs = self.parent.config.n_jobs
+        if n_jobs == 1 or total_folds < 2:
+            return 1
+        if self.parent._data_cache is None:
+            logger.warning("Parallel walk-forward requires preload_data - running sequentially")
+            return 1
+        try:
+            pickle.dumps(self.parent.signal_callback)
+        except Exception:
+            logger.warning("Signal callback is not picklable - running walk-forward folds sequentially")
+            return 1
+
+        cpus = os.cpu_count() or 1
+        workers = cpus if n_jobs < 0 else n_jobs
+        return max(1, min(workers, total_folds))
+
+    def _fold_failed(self, index: int, period, error: Exception):
+        """FoldResult für einen fehlgeschlagenen Fold."""
+        from .walk_forward_runner import FoldResult
+
+        train_start, train_end, test_start, test_end = period
+        return FoldResult(
+            fold_index=index,
+            train_start=train_start,
+            train_end=train_end,
+            test_start=test_start,
+            test_end=test_end,
+            error=str(error),
+        )
+
+    async def _run_sequential(self, fold_periods) -> None:
+        """Führt die Folds nacheinander im aktuellen Event-Loop aus."""
+        total_folds = len(fold_periods)
+
+        for i, period in enumerate(fold_periods):
+            train_start, train_end, test_start, test_end = period
+            if self.parent._should_stop:
+                logger.info("Walk-Forward stopped by user")
+                break
+
+            progress = int((i / total_folds) * 90) + 5
+            self.parent._progress.emit_progress(
+                progress,
+                f"Fold {i+1}/{total_folds}: Train {train_start.date()} - {train_end.date()}"
+            )
+
+            try:
+                fold_result = await self.parent._fold_runner.run_fold(
+                    fold_index=i,
+                    train_start=train_start,
+                    train_end=train_end,
+                    test_start=test_start,
+                    test_end=test_end,
+                )
+                self.parent._folds.append(fold_result)
+
+            except Exception as e:
+                logger.exception(f"Fold {i+1} failed")
+                self.parent._folds.append(self._fold_failed(i, period, e))
+
+    async def _run_parallel(self, fold_periods, workers: int) -> None:
+        """Führt die Folds in einem Prozess-Pool aus.
+
+        Train- und Test-Phase sind getrennte Jobs: sobald das Training eines
+        Folds fertig ist, wird sein OOS-Test bevorzugt vor weiteren
+        Trainings-Jobs eingeplant, sodass Test von Fold N und Training von
+        Fold N+1 überlappen. Es sind nie mehr als ``workers`` Jobs in-flight.
+        """
+        from .walk_forward_runner import FoldResult
+
+        fold_runner = self.parent._fold_runner
+        signal_callback = self.parent.signal_callback
+        reoptimize = self.parent.config.reoptimize_each_fold
+        total_folds = len(fold_periods)
+        loop = asyncio.get_running_loop()
+
+        pending_trains: deque[int] = deque(range(total_folds) if reoptimize else ())
+        ready_tests: deque[tuple[int, dict, object, int]] = deque(
+            () if reoptimize else ((i, fold_runner.default_params(), None, 0) for i in range(total_folds))
+        )
+        running: dict[asyncio.Future, tuple[str, int, tuple]] = {}
+        completed = 0
+
+        logger.info(f"Running {total_folds} walk-forward folds on {workers} worker processes")
+        self.parent._progress.emit_progress(5, f"Starte {total_folds} Folds auf {workers} Prozessen...")
+
+        context = multiprocessing.get_context()
+        worker_pids = context.SimpleQueue()
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_register_worker,
+            initargs=(worker_pids,),
+        )
+        try:
+            while pending_trains or ready_tests or running:
+                if self.parent._should_stop:
+                    logger.info("Walk-Forward stopped by user")
+                    break
+
+                # Freie Slots füllen - OOS-Tests zuerst
+                while len(running) < workers and (ready_tests or pending_trains):
+                    if ready_tests:
+                        i, params, train_metrics, runs = ready_tests.popleft()
+                        _, _, test_start, test_end = fold_periods[i]
+                        future = loop.run_in_executor(
+                            pool,
+                            oos_phase_job,
+                            fold_runner.build_test_config(test_start, test_end, params),
+                            signal_callback,
+                            fold_runner.fold_data(test_start, test_end),
+                        )
+                        running[future] = ("test", i, (params, train_metrics, runs))
+                    else:
+                        i = pending_trains.popleft()
+                        train_start, train_end, _, _ = fold_periods[i]
+                        future = loop.run_in_executor(
+                            pool,
+                            train_phase_job,
+                            fold_runner.build_train_config(train_start, train_end),
+                            signal_callback,
+                            fold_runner.fold_data(train_start, train_end),
+                        )
+                        running[future] = ("train", i, ())
+
+                done, _ = await asyncio.wait(
+                    running, timeout=STOP_POLL_S, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for future in done:
+                    phase, i, context = running.pop(future)
+                    period = fold_periods[i]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Fold {i+1} failed in {phase} phase: {e}")
+                        self.parent._folds.append(self._fold_failed(i, period, e))
+                        completed += 1
+                        continue
+
+                    if phase == "train":
+                        params, train_metrics, runs = result
+                        if train_metrics is None:
+                            logger.warning(f"Fold {i}: No successful optimization run")
+                        ready_tests.append((i, params, train_metrics, runs))
+                        continue
+
+                    params, train_metrics, runs = context
+                    train_start, train_end, test_start, test_end = period
+                    self.parent._folds.append(FoldResult(
+                        fold_index=i,
+                        train_start=train_start,
+                        train_end=train_end,
+                        test_start=test_start,
+                        test_end=test_end,
+                        best_params=params,
+                        train_metrics=train_metrics,
+                        test_metrics=result.metrics,
+                        test_result=result,
+                        optimization_runs=runs,
+                    ))
+                    completed += 1
+
+                if done:
+                    progress = int((completed / total_folds) * 90) + 5
+                    self.parent._progress.emit_progress(
+                        progress, f"{completed}/{total_folds} Folds abgeschlossen"
+                    )
+        finally:
+            for future in running:
+                future.cancel()
+            if running:
+                # Laufende Train/OOS-Jobs (ggf. komplette Optimierungen) abbrechen
+                _terminate_workers(pool, worker_pids)
+            else:
+                pool.shutdown(wait=True)
+
+
+def _register_worker(worker_pids) -> None:
+    """Pool-Initializer: meldet die PID des Worker-Prozesses an den Executor."""
+    worker_pids.put(os.getpid())
+
+
+def _terminate_workers(pool: ProcessPoolExecutor, worker_pids) -> None:
+    """Beendet die Worker-Prozesse des Pools und wartet auf ihr Ende.
+
+    Nötig, weil ``shutdown(cancel_futures=True)`` nur wartende Jobs
+    storniert: bereits laufende Folds (ggf. komplette Optimierungen) würden
+    im Hintergrund zu Ende gerechnet und ``shutdown(wait=True)`` bis dahin
+    blockieren. Die PIDs stammen aus dem Pool-Initializer, nicht aus den
+    Interna des Executors.
+    """
+    pids = set()
+    while not worker_pids.empty():
+        pids.add(worker_pids.get())
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass  # Worker bereits beendet
+    # Der Executor erkennt die beendeten Worker (BrokenProcessPool) und räumt
+    # die restlichen Prozesse ab; wait=True wartet, bis alle beendet sind.
+    pool.shutdown(wait=True, cancel_futures=True)
+    logger.info(f"Terminated {len(pids)} walk-forward worker processes")
@@ -6,19 +6,122 @@ Module 4/6 of walk_forward_runner.py split.
 
 Contains:
 - Individual fold execution (train phase + test phase)
+- Picklable phase entry points for the process-pool executor
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable
+from dataclasses import replace
 from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from .batch_runner import BatchRunner
 from .backtest_runner import BacktestRunner
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from src.core.models.backtest_models import BacktestMetrics, BacktestResult
+
+    from .config import BacktestConfig, BatchConfig
+
 logger = logging.getLogger(__name__)
 
 
+def _require_data(data: pd.DataFrame | None, config: BacktestConfig) -> None:
+    """Gleiche Fehlermeldung wie der DB-Pfad, wenn ein Fold-Slice leer ist."""
+    if data is not None and data.empty:
+        raise ValueError(f"No data found for {config.symbol} in date range")
+
+
+async def run_train_phase(
+    batch_config: BatchConfig,
+    signal_callback: Callable | None = None,
+    data: pd.DataFrame | None = None,
+) -> tuple[dict[str, Any], BacktestMetrics | None, int]:
+    """Optimiert die Parameter im Trainings-Fenster.
+
+    Args:
+        batch_config: Batch-Config mit dem Trainings-Zeitraum als base_config
+        signal_callback: Signal-Callback für die Backtests
+        data: Optional vorgeladener Slice des Trainings-Fensters
+
+    Returns:
+        (best_params, train_metrics, optimization_runs)
+    """
+    _require_data(data, batch_config.base_config)
+
+    batch_runner = BatchRunner(
+        config=batch_config,
+        signal_callback=signal_callback,
+        initial_data=data,
+    )
+    batch_summary = await batch_runner.run()
+
+    if batch_summary.best_run and batch_summary.best_run.metrics:
+        return (
+            batch_summary.best_run.parameters,
+            batch_summary.best_run.metrics,
+            batch_summary.total_runs,
+        )
+    return {}, None, batch_summary.total_runs
+
+
+async def run_test_phase(
+    test_config: BacktestConfig,
+    signal_callback: Callable | None = None,
+    data: pd.DataFrame | None = None,
+) -> BacktestResult:
+    """Führt den Out-of-Sample Backtest im Test-Fenster aus.
+
+    Args:
+        test_config: Backtest-Config für das Test-Fenster
+        signal_callback: Signal-Callback für den Backtest
+        data: Optional vorgeladener Slice des Test-Fensters
+    """
+    _require_data(data, test_config)
+
+    replay_provider = None
+    if data is not None:
+        from .replay_provider import ReplayMarketDataProvider
+
+        replay_provider = ReplayMarketDataProvider(history_window=200)
+        replay_provider.load_from_dataframe(
+            data,
+            symbol=test_config.symbol,
+            start_date=test_config.start_date,
+            end_date=test_config.end_date,
+        )
+
+    test_runner = BacktestRunner(
+        config=test_config,
+        replay_provider=replay_provider,
+        signal_callback=signal_callback,
+    )
+    return await test_runner.run()
+
+
+def train_phase_job(
+    batch_config: BatchConfig,
+    signal_callback: Callable | None,
+    data: pd.DataFrame | None,
+) -> tuple[dict[str, Any], BacktestMetrics | None, int]:
+    """Prozess-Pool Einstiegspunkt für ``run_train_phase``."""
+    return asyncio.run(run_train_phase(batch_config, signal_callback, data))
+
+
+def oos_phase_job(
+    test_config: BacktestConfig,
+    signal_callback: Callable | None,
+    data: pd.DataFrame | None,
+) -> BacktestResult:
+    """Prozess-Pool Einstiegspunkt für ``run_test_phase``."""
+    return asyncio.run(run_test_phase(test_config, signal_callback, data))
+
+
 class WalkForwardFoldRunner:
     """Helper für WalkForwardRunner individual fold execution."""
 
@@ -29,6 +132,48 @@ class WalkForwardFoldRunner:
         """
         self.parent = parent
 
+    def build_train_config(self, train_start: datetime, train_end: datetime) -> BatchConfig:
+        """Batch-Config für die Optimierung im Trainings-Fenster."""
+        train_config = replace(
+            self.parent.config.base_config,
+            start_date=train_start,
+            end_date=train_end,
+        )
+        return replace(
+            self.parent.config.batch_config,
+            base_config=train_config,
+        )
+
+    def build_test_config(
+        self,
+        test_start: datetime,
+        test_end: datetime,
+        best_params: dict[str, Any],
+    ) -> BacktestConfig:
+        """Backtest-Config für das Test-Fenster mit den besten Parametern."""
+        test_config = replace(
+            self.parent.config.base_config,
+            start_date=test_start,
+            end_date=test_end,
+            parameter_overrides=best_params,
+        )
+
+        # Parameter anwenden
+        for key, value in best_params.items():
+            if hasattr(test_config, key):
+                test_config = replace(test_config, **{key: value})
+
+        return test_config
+
+    def default_params(self) -> dict[str, Any]:
+        """Parameter ohne Re-Optimierung: Overrides aus der Base-Config."""
+        return self.parent.config.base_config.parameter_overrides.copy()
+
+    def fold_data(self, start: datetime, end: datetime) -> pd.DataFrame | None:
+        """Slice aus dem vorgeladenen Gesamtzeitraum (None = aus DB laden)."""
+        cache = self.parent._data_cache
+        return cache.slice(start, end) if cache is not None else None
+
     async def run_fold(
         self,
         fold_index: int,
@@ -38,71 +183,34 @@ class WalkForwardFoldRunner:
         test_end: datetime,
     ):
         """Führt einen einzelnen Fold durch."""
-        from dataclasses import replace
         from .walk_forward_runner import FoldResult
 
         logger.info(f"Running fold {fold_index}: train={train_start.date()}-{train_end.date()}, test={test_start.date()}-{test_end.date()}")
 
-        best_params = {}
         train_metrics = None
         optimization_runs = 0
 
         # 1. Training Phase (Optimierung)
         if self.parent.config.reoptimize_each_fold:
-            # Erstelle Training-Config
-            train_config = replace(
-                self.parent.config.base_config,
-                start_date=train_start,
-                end_date=train_end,
+            best_params, train_metrics, optimization_runs = await run_train_phase(
+                self.build_train_config(train_start, train_end),
+                self.parent.signal_callback,
+                self.fold_data(train_start, train_end),
             )
-
-            # Batch-Config für Training
-            batch_config = replace(
-                self.parent.config.batch_config,
-                base_config=train_config,
-            )
-
-            # Optimierung durchführen
-            batch_runner = BatchRunner(
-                config=batch_config,
-                signal_callback=self.parent.signal_callback,
-            )
-
-            batch_summary = await batch_runner.run()
-            optimization_runs = batch_summary.total_runs
-
-            if batch_summary.best_run and batch_summary.best_run.metrics:
-                best_params = batch_summary.best_run.parameters
-                train_metrics = batch_summary.best_run.metrics
-            else:
+            if train_metrics is None:
                 # Kein erfolgreicher Run - verwende Default
-                best_params = {}
                 logger.warning(f"Fold {fold_index}: No successful optimization run")
-
         else:
             # Keine Re-Optimierung - verwende Parameter-Overrides aus Base-Config
-            best_params = self.parent.config.base_config.parameter_overrides.copy()
+            best_params = self.default_params()
 
         # 2. Test Phase (Out-of-Sample)
-        test_config = replace(
-            self.parent.config.base_config,
-            start_date=test_start,
-            end_date=test_end,
-            parameter_overrides=best_params,
+        test_result = await run_test_phase(
+            self.build_test_config(test_start, test_end, best_params),
+            self.parent.signal_callback,
+            self.fold_data(test_start, test_end),
         )
 
-        # Parameter anwenden
-        for key, value in best_params.items():
-            if hasattr(test_config, key):
-                test_config = replace(test_config, **{key: value})
-
-        test_runner = BacktestRunner(
-            config=test_config,
-            signal_callback=self.parent.signal_callback,
-        )
-
-        test_result = await test_runner.run()
-
         return FoldResult(
             fold_index=fold_index,
             train_start=train_start,
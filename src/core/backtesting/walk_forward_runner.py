@@ -29,6 +29,7 @@ from src.core.models.backtest_models import BacktestMetrics, BacktestResult
 from .config import BacktestConfig, BatchConfig, SearchMethod, WalkForwardConfig
 
 # Import helpers
+from .walk_forward_data import WalkForwardDataCache
 from .walk_forward_executor import WalkForwardExecutor
 from .walk_forward_export import WalkForwardExport
 from .walk_forward_fold_calculator import WalkForwardFoldCalculator
@@ -188,6 +189,7 @@ class WalkForwardRunner:
         self._is_running = False
         self._should_stop = False
         self._progress_callback: Callable[[int, str], None] | None = None
+        self._data_cache: WalkForwardDataCache | None = None
 
         # WF ID
         self.wf_id = f"wf_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -1,6 +1,7 @@
 """Broker Package for OrderPilot-AI Trading Application."""
 
 from .base import (
+    AccountSnapshot,
     AIAnalysisRequest,
     AIAnalysisResult,
     Balance,
@@ -33,6 +34,7 @@ __all__ = [
     'OrderResponse',
     'Position',
     'Balance',
+    'AccountSnapshot',
     'FeeModel',
     # AI hooks
     'AIAnalysisRequest',
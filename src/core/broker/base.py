@@ -17,6 +17,7 @@ from src.database.models import OrderType
 
 # Import types from broker_types
 from .broker_types import (
+    AccountSnapshot,
     AIAnalysisRequest,
     AIAnalysisResult,
     Balance,
@@ -43,6 +44,7 @@ __all__ = [
     "OrderResponse",
     "Position",
     "Balance",
+    "AccountSnapshot",
     "FeeModel",
     "AIAnalysisRequest",
     "AIAnalysisResult",
@@ -12,13 +12,18 @@ Authentication:
 import asyncio
 import json
 import logging
+import time
+from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
 import aiohttp
 
+from src.common.http_pool import get_http_pool
 from src.core.auth.bitunix_signer import BitunixSigner
 from src.core.broker.base import BrokerAdapter
 from src.core.broker.broker_types import (
+    AccountSnapshot,
     Balance,
     BrokerConnectionError,
     BrokerError,
@@ -137,7 +142,7 @@ class BitunixAdapter(BrokerAdapter):
     async def _establish_connection(self) -> None:
         """Establish connection to Bitunix API.
 
-        Creates aiohttp session and validates credentials.
+        Uses the shared keep-alive session of the HTTP pool and validates credentials.
         """
         # Avoid hammering the API if credentials are wrong: one attempt at a time.
         if getattr(self, "_auth_failed", False):
@@ -159,9 +164,9 @@ class BitunixAdapter(BrokerAdapter):
         logger.info(f"Connecting to Bitunix API at {self.base_url} (API key: {self.api_key[:8]}...)")
 
         try:
-            # Create aiohttp session
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30)
+            # Shared keep-alive session (owned by the pool, never closed here)
+            self._session = get_http_pool().session(
+                "bitunix", timeout=aiohttp.ClientTimeout(total=30)
             )
 
             # Validate connection by fetching account info
@@ -177,15 +182,11 @@ class BitunixAdapter(BrokerAdapter):
 
         except BrokerConnectionError:
             # Don't wrap BrokerConnectionError again, just re-raise
-            if self._session:
-                await self._session.close()
-                self._session = None
+            self._session = None
             self._auth_failed = True
             raise
         except aiohttp.ClientError as e:
-            if self._session:
-                await self._session.close()
-                self._session = None
+            self._session = None
             self._auth_failed = True
             raise BrokerConnectionError(
                 code="BITUNIX_NETWORK_ERROR",
@@ -193,9 +194,7 @@ class BitunixAdapter(BrokerAdapter):
                 details={"error": str(e), "base_url": self.base_url}
             )
         except Exception as e:
-            if self._session:
-                await self._session.close()
-                self._session = None
+            self._session = None
             self._auth_failed = True
             raise BrokerConnectionError(
                 code="BITUNIX_CONNECT_FAILED",
@@ -205,9 +204,8 @@ class BitunixAdapter(BrokerAdapter):
 
     async def _cleanup_resources(self) -> None:
         """Clean up resources on disconnect."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        # The session belongs to the HTTP pool and stays open for reuse
+        self._session = None
 
     # ==================== Order Management ====================
 
@@ -243,7 +241,7 @@ class BitunixAdapter(BrokerAdapter):
         }
 
         # Add price for limit orders
-        if order.order_type == DBOrderType.LIMIT:
+        if DBOrderType(order.order_type) == DBOrderType.LIMIT:
             if not order.limit_price:
                 raise BrokerError(
                     code="BITUNIX_INVALID_ORDER",
@@ -265,7 +263,7 @@ class BitunixAdapter(BrokerAdapter):
             ) as response:
                 if response.status == 200:
                     data = await response.json()
-                    return self._parse_order_response(data, order)
+                    return self._parse_order_response(data, order, estimated_fee)
                 else:
                     error_text = await response.text()
                     raise BrokerError(
@@ -353,14 +351,19 @@ class BitunixAdapter(BrokerAdapter):
                     data = await response.json()
                     # Parse order details from response
                     order_data = data.get('data', {})
+                    now = datetime.utcnow()
                     return OrderResponse(
                         broker_order_id=order_data.get('orderId'),
+                        internal_order_id=order_data.get('clientId') or order_data.get('orderId'),
                         status=self._parse_order_status(order_data.get('status')),
                         symbol=order_data.get('symbol'),
                         side=self._parse_order_side(order_data.get('side')),
+                        order_type=DBOrderType(str(order_data.get('type', 'market')).lower()),
                         quantity=Decimal(str(order_data.get('quantity', 0))),
                         filled_quantity=Decimal(str(order_data.get('filledQuantity', 0))),
-                        average_price=Decimal(str(order_data.get('avgPrice', 0))),
+                        average_fill_price=Decimal(str(order_data.get('avgPrice', 0))),
+                        created_at=now,
+                        updated_at=now,
                         message="Order status retrieved"
                     )
                 else:
@@ -405,6 +408,62 @@ class BitunixAdapter(BrokerAdapter):
             logger.error(f"Failed to get positions: {e}")
             return []
 
+    async def get_open_orders(self, symbol: str | None = None) -> list[dict[str, Any]]:
+        """Get pending (unfilled) orders.
+
+        Args:
+            symbol: Restrict to one trading symbol (optional)
+
+        Returns:
+            Raw order dicts as returned by Bitunix
+        """
+        if not self._session:
+            return []
+
+        params = {"symbol": symbol} if symbol else {}
+        query_params = self._sort_params(params) if params else ""
+        headers = self._build_headers(query_params=query_params, body="")
+
+        try:
+            async with self._session.get(
+                f"{self.base_url}/api/v1/futures/trade/get_pending_orders",
+                params=params,
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return (data or {}).get('data', {}).get('orderList', []) or []
+                return []
+
+        except Exception as e:
+            logger.error(f"Failed to get open orders: {e}")
+            return []
+
+    async def refresh_account(self, margin_coin: str = "USDT") -> AccountSnapshot:
+        """Fetch balance, positions and open orders concurrently.
+
+        The three requests run in parallel over the pooled keep-alive
+        connections, so a refresh costs roughly one round trip instead of three.
+
+        Args:
+            margin_coin: Margin currency for the balance query
+
+        Returns:
+            Account snapshot
+        """
+        started = time.perf_counter()
+        balance, positions, open_orders = await asyncio.gather(
+            self.get_balance(margin_coin),
+            self.get_positions(),
+            self.get_open_orders(),
+        )
+        return AccountSnapshot(
+            balance=balance,
+            positions=positions,
+            open_orders=open_orders,
+            latency_ms=(time.perf_counter() - started) * 1000,
+        )
+
     async def modify_position_tp_sl_order(
         self,
         symbol: str,
@@ -507,6 +566,8 @@ class BitunixAdapter(BrokerAdapter):
 
     def _map_order_side(self, side: OrderSide) -> str:
         """Map OrderSide enum to Bitunix side string."""
+        # OrderRequest stores enum values (use_enum_values), normalize first
+        side = OrderSide(side)
         mapping = {
             OrderSide.BUY: "buy",
             OrderSide.SELL: "sell",
@@ -515,6 +576,7 @@ class BitunixAdapter(BrokerAdapter):
 
     def _map_order_type(self, order_type: DBOrderType) -> str:
         """Map OrderType enum to Bitunix order type string."""
+        order_type = DBOrderType(order_type)
         mapping = {
             DBOrderType.MARKET: "market",
             DBOrderType.LIMIT: "limit",
@@ -532,35 +594,48 @@ class BitunixAdapter(BrokerAdapter):
     def _parse_order_status(self, status_str: str) -> OrderStatus:
         """Parse Bitunix status string to OrderStatus enum."""
         mapping = {
-            "pending": OrderStatus.PENDING_SUBMIT,
+            "pending": OrderStatus.PENDING,
             "submitted": OrderStatus.SUBMITTED,
             "partial_filled": OrderStatus.PARTIALLY_FILLED,
             "filled": OrderStatus.FILLED,
             "cancelled": OrderStatus.CANCELLED,
             "rejected": OrderStatus.REJECTED,
         }
-        return mapping.get(status_str.lower(), OrderStatus.PENDING_SUBMIT)
+        return mapping.get(status_str.lower(), OrderStatus.PENDING)
 
-    def _parse_order_response(self, data: dict, original_order: OrderRequest) -> OrderResponse:
+    def _parse_order_response(
+        self,
+        data: dict,
+        original_order: OrderRequest,
+        estimated_fee: Decimal = Decimal("0")
+    ) -> OrderResponse:
         """Parse Bitunix order response to OrderResponse.
 
         Args:
             data: API response data
             original_order: Original order request
+            estimated_fee: Estimated fee for the order
 
         Returns:
             Parsed order response
         """
         order_data = data.get('data', {})
+        order_id = order_data.get('orderId')
+        now = datetime.utcnow()
 
         return OrderResponse(
-            broker_order_id=order_data.get('orderId'),
+            broker_order_id=order_id,
+            internal_order_id=original_order.internal_order_id or order_id,
             status=OrderStatus.SUBMITTED,  # Newly placed order
             symbol=original_order.symbol,
             side=original_order.side,
+            order_type=original_order.order_type,
             quantity=original_order.quantity,
             filled_quantity=Decimal("0"),
-            average_price=Decimal("0"),
+            created_at=now,
+            submitted_at=now,
+            updated_at=now,
+            estimated_fee=estimated_fee,
             message="Order placed successfully"
         )
 
@@ -182,6 +182,17 @@ class Balance(BaseModel):
     as_of: datetime = Field(default_factory=datetime.utcnow)
 
 
+class AccountSnapshot(BaseModel):
+    """Balance, positions and open orders fetched in one refresh."""
+    balance: Balance | None = None
+    positions: list[Position] = Field(default_factory=list)
+    open_orders: list[dict[str, Any]] = Field(default_factory=list)
+
+    # Wall time of the whole (concurrent) refresh
+    latency_ms: float = 0.0
+    as_of: datetime = Field(default_factory=datetime.utcnow)
+
+
 class FeeModel(BaseModel):
     """Fee calculation model."""
     broker: str
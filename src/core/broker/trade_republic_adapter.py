@@ -16,6 +16,7 @@ from uuid import uuid4
 import aiohttp
 import websockets
 
+from src.common.http_pool import get_http_pool
 from src.common.logging_setup import log_order_action
 from src.database.models import OrderSide, OrderStatus
 
@@ -107,7 +108,7 @@ class TradeRepublicAdapter(BrokerAdapter):
         # Rate limiting
         await self._rate_limit()
 
-        async with aiohttp.ClientSession() as session:
+        async with get_http_pool().borrow("trade_republic") as session:
             # Step 1: Request PIN verification
             auth_data = {
                 "phoneNumber": self.phone_number,
@@ -260,7 +261,7 @@ class TradeRepublicAdapter(BrokerAdapter):
         if order.stop_price:
             order_payload["stopPrice"] = float(order.stop_price)
 
-        async with aiohttp.ClientSession() as session:
+        async with get_http_pool().borrow("trade_republic") as session:
             headers = {
                 "Authorization": f"Bearer {self.session_token}",
                 "Content-Type": "application/json"
@@ -314,7 +315,7 @@ class TradeRepublicAdapter(BrokerAdapter):
         """Cancel an order."""
         await self._rate_limit()
 
-        async with aiohttp.ClientSession() as session:
+        async with get_http_pool().borrow("trade_republic") as session:
             headers = {
                 "Authorization": f"Bearer {self.session_token}",
                 "Content-Type": "application/json"
@@ -335,7 +336,7 @@ class TradeRepublicAdapter(BrokerAdapter):
         """Get current order status."""
         await self._rate_limit()
 
-        async with aiohttp.ClientSession() as session:
+        async with get_http_pool().borrow("trade_republic") as session:
             headers = {
                 "Authorization": f"Bearer {self.session_token}",
                 "Content-Type": "application/json"
@@ -361,7 +362,7 @@ class TradeRepublicAdapter(BrokerAdapter):
 
         positions = []
 
-        async with aiohttp.ClientSession() as session:
+        async with get_http_pool().borrow("trade_republic") as session:
             headers = {
                 "Authorization": f"Bearer {self.session_token}",
                 "Content-Type": "application/json"
@@ -386,7 +387,7 @@ class TradeRepublicAdapter(BrokerAdapter):
         """Get account balance."""
         await self._rate_limit()
 
-        async with aiohttp.ClientSession() as session:
+        async with get_http_pool().borrow("trade_republic") as session:
             headers = {
                 "Authorization": f"Bearer {self.session_token}",
                 "Content-Type": "application/json"
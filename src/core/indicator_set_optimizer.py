@@ -63,7 +63,14 @@ class OptimizationResult:
 
 
 class SignalBacktest:
-    """Simulates trades from signals with realistic slippage and fees."""
+    """Simulates trades from signals with realistic slippage and fees.
+
+    All backtests operate on NumPy arrays: entry bars are taken from the
+    signal's index array, exit prices from forward-shifted close arrays, and
+    metrics are computed directly on the resulting P&L array.
+    """
+
+    EXIT_LOOK_AHEAD = 5
 
     def __init__(
         self,
@@ -78,9 +85,11 @@ class SignalBacktest:
             slippage_pct: Slippage percentage
             fee_pct: Trading fee percentage
         """
-        self.df = df.copy()
+        self.df = df  # read-only, no copy needed
+        self.close = df["close"].to_numpy(dtype=np.float64)
         self.slippage_pct = slippage_pct / 100
         self.fee_pct = fee_pct / 100
+        self._window_extrema: tuple[np.ndarray, np.ndarray] | None = None
 
     def backtest_entry_long(self, signal: pd.Series, hold_bars: int = 10) -> SignalMetrics:
         """Backtest entry long signals.
@@ -92,78 +101,41 @@ class SignalBacktest:
         Returns:
             Signal metrics
         """
-        trades = []
-        i = 0
-
-        while i < len(self.df) - hold_bars:
-            if signal.iloc[i]:
-                # Entry
-                entry_price = self.df["close"].iloc[i] * (1 + self.slippage_pct)
-                entry_cost = entry_price * self.fee_pct
-
-                # Exit after hold_bars
-                exit_idx = min(i + hold_bars, len(self.df) - 1)
-                exit_price = self.df["close"].iloc[exit_idx] * (1 - self.slippage_pct)
-                exit_cost = exit_price * self.fee_pct
-
-                # Calculate P&L
-                pnl_pct = (exit_price - entry_price) / entry_price - (
-                    entry_cost + exit_cost
-                ) / entry_price
-
-                trades.append(
-                    {
-                        "entry_idx": i,
-                        "exit_idx": exit_idx,
-                        "entry_price": entry_price,
-                        "exit_price": exit_price,
-                        "pnl_pct": pnl_pct,
-                    }
-                )
+        entry_idx = self._select_entries(signal, hold_bars)
+        if len(entry_idx) == 0:
+            return self._calculate_metrics(np.empty(0), signal.sum())
 
-                # Skip to next available entry
-                i = exit_idx + 1
-            else:
-                i += 1
+        # Entry / exit after hold_bars
+        entry_price = self.close[entry_idx] * (1 + self.slippage_pct)
+        entry_cost = entry_price * self.fee_pct
+        exit_price = self.close[entry_idx + hold_bars] * (1 - self.slippage_pct)
+        exit_cost = exit_price * self.fee_pct
 
-        return self._calculate_metrics(trades, signal.sum())
+        # Calculate P&L
+        pnl_pct = (exit_price - entry_price) / entry_price - (
+            entry_cost + exit_cost
+        ) / entry_price
+
+        return self._calculate_metrics(pnl_pct, signal.sum())
 
     def backtest_entry_short(self, signal: pd.Series, hold_bars: int = 10) -> SignalMetrics:
         """Backtest entry short signals."""
-        trades = []
-        i = 0
-
-        while i < len(self.df) - hold_bars:
-            if signal.iloc[i]:
-                # Entry (short)
-                entry_price = self.df["close"].iloc[i] * (1 - self.slippage_pct)
-                entry_cost = entry_price * self.fee_pct
-
-                # Exit after hold_bars
-                exit_idx = min(i + hold_bars, len(self.df) - 1)
-                exit_price = self.df["close"].iloc[exit_idx] * (1 + self.slippage_pct)
-                exit_cost = exit_price * self.fee_pct
-
-                # Calculate P&L (inverted for short)
-                pnl_pct = (entry_price - exit_price) / entry_price - (
-                    entry_cost + exit_cost
-                ) / entry_price
-
-                trades.append(
-                    {
-                        "entry_idx": i,
-                        "exit_idx": exit_idx,
-                        "entry_price": entry_price,
-                        "exit_price": exit_price,
-                        "pnl_pct": pnl_pct,
-                    }
-                )
+        entry_idx = self._select_entries(signal, hold_bars)
+        if len(entry_idx) == 0:
+            return self._calculate_metrics(np.empty(0), signal.sum())
 
-                i = exit_idx + 1
-            else:
-                i += 1
+        # Entry (short) / exit after hold_bars
+        entry_price = self.close[entry_idx] * (1 - self.slippage_pct)
+        entry_cost = entry_price * self.fee_pct
+        exit_price = self.close[entry_idx + hold_bars] * (1 + self.slippage_pct)
+        exit_cost = exit_price * self.fee_pct
+
+        # Calculate P&L (inverted for short)
+        pnl_pct = (entry_price - exit_price) / entry_price - (
+            entry_cost + exit_cost
+        ) / entry_price
 
-        return self._calculate_metrics(trades, signal.sum())
+        return self._calculate_metrics(pnl_pct, signal.sum())
 
     def backtest_exit_timing(self, signal: pd.Series, direction: str = "long") -> SignalMetrics:
         """Evaluate exit signal timing quality.
@@ -174,79 +146,112 @@ class SignalBacktest:
             return self._empty_metrics()
 
         # Find local extrema in the next N bars after signal
-        look_ahead = 5
-        trades = []
-
-        for i in range(len(signal) - look_ahead):
-            if signal.iloc[i]:
-                future_prices = self.df["close"].iloc[i : i + look_ahead]
-
-                if direction == "long":
-                    # For long exit, we want to exit near peaks
-                    best_exit = future_prices.max()
-                    worst_exit = future_prices.min()
-                else:
-                    # For short exit, we want to exit near troughs
-                    best_exit = future_prices.min()
-                    worst_exit = future_prices.max()
-
-                current_price = self.df["close"].iloc[i]
-
-                # Score = how close we are to best exit
-                if best_exit != worst_exit:
-                    timing_score = abs(current_price - best_exit) / abs(best_exit - worst_exit)
-                    # Lower is better, so invert: 1.0 - score
-                    pnl_pct = (1.0 - timing_score) * 0.02  # Scale to ~2% range
-                else:
-                    pnl_pct = 0.0
-
-                trades.append(
-                    {
-                        "entry_idx": i,
-                        "exit_idx": i,
-                        "entry_price": current_price,
-                        "exit_price": current_price,
-                        "pnl_pct": pnl_pct,
-                    }
-                )
+        look_ahead = self.EXIT_LOOK_AHEAD
+        n_eval = min(len(signal) - look_ahead, len(self.close) - look_ahead + 1)
+        if n_eval <= 0:
+            return self._calculate_metrics(np.empty(0), signal.sum())
+
+        idx = np.flatnonzero(self._signal_array(signal)[:n_eval])
+        window_max, window_min = self._get_window_extrema()
+
+        if direction == "long":
+            # For long exit, we want to exit near peaks
+            best_exit = window_max[idx]
+            worst_exit = window_min[idx]
+        else:
+            # For short exit, we want to exit near troughs
+            best_exit = window_min[idx]
+            worst_exit = window_max[idx]
+
+        current_price = self.close[idx]
+
+        # Score = how close we are to best exit (lower is better, so invert)
+        spread = np.abs(best_exit - worst_exit)
+        moved = best_exit != worst_exit
+        pnl_pct = np.zeros(len(idx))
+        timing_score = np.abs(current_price[moved] - best_exit[moved]) / spread[moved]
+        pnl_pct[moved] = (1.0 - timing_score) * 0.02  # Scale to ~2% range
 
-        return self._calculate_metrics(trades, signal.sum())
+        return self._calculate_metrics(pnl_pct, signal.sum())
 
-    def _calculate_metrics(self, trades: list[dict], total_signals: int) -> SignalMetrics:
-        """Calculate comprehensive metrics from trade list."""
-        if not trades:
+    def _signal_array(self, signal: pd.Series) -> np.ndarray:
+        """Signal as positional bool array (truthiness like ``bool(value)``)."""
+        return np.asarray(signal.to_numpy(), dtype=bool)
+
+    def _select_entries(self, signal: pd.Series, hold_bars: int) -> np.ndarray:
+        """Select non-overlapping entry bars for fixed-length holds.
+
+        An entry at bar ``i`` occupies the position until ``i + hold_bars``;
+        the next entry may start at ``i + hold_bars + 1``. Instead of walking
+        every bar, a "next signal at or after bar j" array is built with a
+        reverse cumulative minimum and the chain of entries is followed by
+        jumping directly to the next free signal, so the cost is proportional
+        to the number of trades.
+
+        Returns:
+            Array of entry bar positions
+        """
+        n_bars = len(self.close) - hold_bars  # entries must leave room for the exit
+        if n_bars <= 0:
+            return np.empty(0, dtype=np.int64)
+
+        sig = self._signal_array(signal)[:n_bars]
+        candidates = np.flatnonzero(sig)
+        if len(candidates) == 0:
+            return candidates
+
+        # next_signal[j] = first signal bar >= j (n_bars if none)
+        next_signal = np.full(n_bars + 1, n_bars, dtype=np.int64)
+        next_signal[candidates] = candidates
+        next_signal = np.minimum.accumulate(next_signal[::-1])[::-1]
+
+        gap = hold_bars + 1
+        entries = []
+        i = int(next_signal[0])
+        while i < n_bars:
+            entries.append(i)
+            i = int(next_signal[min(i + gap, n_bars)])
+        return np.asarray(entries, dtype=np.int64)
+
+    def _get_window_extrema(self) -> tuple[np.ndarray, np.ndarray]:
+        """Rolling max/min of close over the exit look-ahead window (cached)."""
+        if self._window_extrema is None:
+            windows = np.lib.stride_tricks.sliding_window_view(self.close, self.EXIT_LOOK_AHEAD)
+            self._window_extrema = (windows.max(axis=1), windows.min(axis=1))
+        return self._window_extrema
+
+    def _calculate_metrics(self, pnls: np.ndarray, total_signals: int) -> SignalMetrics:
+        """Calculate comprehensive metrics from the per-trade P&L array."""
+        n_trades = len(pnls)
+        if n_trades == 0:
             return self._empty_metrics()
 
-        # Extract P&L
-        pnls = [t["pnl_pct"] for t in trades]
-        wins = [p for p in pnls if p > 0]
-        losses = [p for p in pnls if p < 0]
+        wins = pnls[pnls > 0]
+        losses = pnls[pnls < 0]
 
         # Basic stats
-        n_trades = len(trades)
         n_wins = len(wins)
         n_losses = len(losses)
-        win_rate = n_wins / n_trades if n_trades > 0 else 0.0
+        win_rate = n_wins / n_trades
 
         # Win/Loss averages
-        avg_win = np.mean(wins) if wins else 0.0
-        avg_loss = abs(np.mean(losses)) if losses else 0.0
+        avg_win = wins.mean() if n_wins else 0.0
+        avg_loss = abs(losses.mean()) if n_losses else 0.0
 
         # Profit factor
-        total_wins = sum(wins) if wins else 0.0
-        total_losses = abs(sum(losses)) if losses else 0.0
+        total_wins = wins.sum() if n_wins else 0.0
+        total_losses = abs(losses.sum()) if n_losses else 0.0
         profit_factor = total_wins / total_losses if total_losses > 0 else float("inf")
 
         # Drawdown
         cumulative = np.cumsum(pnls)
         running_max = np.maximum.accumulate(cumulative)
-        drawdown = running_max - cumulative
-        max_drawdown = np.max(drawdown) if len(drawdown) > 0 else 0.0
+        max_drawdown = np.max(running_max - cumulative)
 
         # Sharpe ratio (annualized, assuming 5m bars)
-        returns = np.array(pnls)
-        if len(returns) > 1 and np.std(returns) > 0:
-            sharpe = (np.mean(returns) / np.std(returns)) * np.sqrt(252 * 24 * 12)  # 5m bars
+        std = pnls.std()
+        if n_trades > 1 and std > 0:
+            sharpe = (pnls.mean() / std) * np.sqrt(252 * 24 * 12)  # 5m bars
         else:
             sharpe = 0.0
 
@@ -254,7 +259,7 @@ class SignalBacktest:
         expectancy = (win_rate * avg_win) - ((1 - win_rate) * avg_loss)
 
         # Total return
-        total_return = sum(pnls)
+        total_return = cumulative[-1]
 
         return SignalMetrics(
             signals=total_signals,
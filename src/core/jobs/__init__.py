@@ -0,0 +1,19 @@
+"""Job Service.
+
+Out-of-process execution of long-running optimizations (regime, indicator
+and simulator optimization, batch backtests). The GUI submits jobs through the JobClient and receives
+streamed progress events; the work runs in a separate server process with
+its own process pool.
+"""
+
+from .job_client import JobClient, get_job_client
+from .protocol import JobEvent, JobEventType, JobKind, JobRequest
+
+__all__ = [
+    "JobClient",
+    "get_job_client",
+    "JobEvent",
+    "JobEventType",
+    "JobKind",
+    "JobRequest",
+]
@@ -0,0 +1,76 @@
+"""Batch Backtest Job.
+
+Runs the parameter combinations of a BatchRunner (grid/random search)
+spread over the job server's process pool.
+
+Payload:
+    config: BatchConfig (n_jobs = worker processes, -1 = all pool workers)
+    initial_data: Optional preloaded OHLCV DataFrame (avoids DB access per worker)
+    signal_callback: Optional picklable signal callback
+
+Result:
+    List of BatchRunResult.to_dict(), ranked by the target metric
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def backtest_worker(
+    payload: dict[str, Any],
+    combinations: list[tuple[int, dict[str, Any]]],
+    progress,
+    cancel_event,
+) -> list:
+    """Run a chunk of combinations in one worker process."""
+    from src.core.backtesting.batch_runner import BatchRunner
+
+    runner = BatchRunner(
+        payload["config"],
+        signal_callback=payload.get("signal_callback"),
+        initial_data=payload.get("initial_data"),
+    )
+
+    def on_result(index, result):
+        progress.put({
+            "run": index,
+            "parameters": result.parameters,
+            "metrics": result.metrics.model_dump() if result.metrics else None,
+            "error": result.error,
+        })
+
+    return asyncio.run(runner.run_combinations(
+        combinations, on_result=on_result, should_stop=cancel_event.is_set
+    ))
+
+
+def run_job(job) -> list[dict[str, Any]]:
+    """Job handler (runs in the job server process)."""
+    from src.core.backtesting.batch_runner import BatchRunner
+
+    payload = job.payload
+    config = payload["config"]
+    runner = BatchRunner(config)
+
+    combinations = runner.generate_parameter_combinations()[:config.max_iterations]
+    n_workers = config.n_jobs if config.n_jobs and config.n_jobs > 0 else job.max_workers
+    n_workers = max(1, min(n_workers, job.max_workers, len(combinations)))
+
+    job.report(total=len(combinations), workers=n_workers)
+
+    # Round-robin chunks keep early and late combinations spread over workers
+    indexed = list(enumerate(combinations))
+    chunks = [indexed[i::n_workers] for i in range(n_workers)]
+    results = [
+        result
+        for chunk_results in job.run_workers(backtest_worker, [(payload, chunk) for chunk in chunks])
+        for result in chunk_results
+    ]
+
+    runner.rank(results)
+    return [result.to_dict() for result in results]
@@ -0,0 +1,215 @@
+"""Indicator Optimization Job.
+
+Regime-based indicator parameter optimization (IndicatorOptimizationThread)
+on the job server's process pool. Regimes are detected once, the
+(indicator, params) combinations are split over the workers. Every tested
+combination is stored as trial of an Optuna study in a SQLite checkpoint,
+so a cancelled or interrupted run skips the tested combinations when the
+same job is submitted again (resume=True).
+
+Payload:
+    data: OHLCV DataFrame
+    selected_indicators: Indicator types (e.g. ["RSI", "MACD"])
+    param_ranges: {indicator: {param: {"min": x, "max": y, "step": z}}}
+    json_config_path: JSON regime config for the regime labels
+    test_type: "entry" or "exit"
+    trade_side: "long" or "short"
+    n_workers: Worker processes (None = all pool workers)
+    resume: Skip combinations tested by an identical job
+    storage_path: Optional SQLite checkpoint path
+
+Progress:
+    {"regime_history": [...]} after regime detection,
+    {"completed": k, "total": n, ...} before the workers start,
+    {"combination": "RSI {...}"} per tested combination
+
+Result:
+    List of score dicts (indicator, params, regime, score, ...), best first
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+import pandas as pd
+
+from . import study_storage
+from .study_storage import DEFAULT_STORAGE_DIR, data_fingerprint, storage_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORAGE_PATH = DEFAULT_STORAGE_DIR / "indicator_jobs.db"
+
+# Regime slices with fewer bars are not scored (as in IndicatorOptimizationThread)
+MIN_REGIME_BARS = 10
+
+
+def study_name_for(payload: dict[str, Any]) -> str:
+    """Stable study name of a job (same data, regimes and ranges -> same study)."""
+    fingerprint = {
+        **data_fingerprint(payload["data"]),
+        "selected_indicators": payload["selected_indicators"],
+        "param_ranges": payload["param_ranges"],
+        "json_config_path": payload["json_config_path"],
+        "test_type": payload["test_type"],
+        "trade_side": payload["trade_side"],
+    }
+    return study_storage.study_name("indicator_job", payload, fingerprint)
+
+
+def combination_key(indicator_type: str, params: dict[str, Any]) -> str:
+    """Trial key of an (indicator, params) combination."""
+    return f"{indicator_type} {json.dumps(params, sort_keys=True)}"
+
+
+def _settings(payload: dict[str, Any]) -> SimpleNamespace:
+    """Settings read by OptimizationPhaseHandler / OptimizationResultsProcessor.
+
+    Both helpers take the IndicatorOptimizationThread for config access;
+    outside the GUI the job payload provides the same attributes.
+    """
+    from src.strategies.signal_generators import SignalGeneratorRegistry
+
+    return SimpleNamespace(
+        selected_indicators=payload["selected_indicators"],
+        param_ranges=payload["param_ranges"],
+        json_config_path=payload["json_config_path"],
+        test_type=payload["test_type"],
+        trade_side=payload["trade_side"],
+        _signal_registry=SignalGeneratorRegistry(),
+    )
+
+
+def _json_safe(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Score dicts as JSON types (numpy scalars -> Python) for trial user attrs."""
+    return json.loads(json.dumps(rows, default=lambda value: value.item()))
+
+
+def score_combination(
+    phases,
+    scorer,
+    data: pd.DataFrame,
+    regime_labels: pd.Series,
+    indicator_type: str,
+    params: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Score one (indicator, params) combination in every regime.
+
+    Returns:
+        Score dicts of the regimes with enough bars and signals
+    """
+    indicator_df = phases.calculate_indicator(data, indicator_type, params)
+    rows = []
+    for regime in sorted(set(regime_labels)):
+        # Filter data for this regime (align indices after dropna)
+        aligned_mask = regime_labels.loc[indicator_df.index] == regime
+        regime_df = indicator_df[aligned_mask]
+        if len(regime_df) < MIN_REGIME_BARS:
+            continue
+        score_data = scorer.score_indicator(regime_df, indicator_type, params, regime)
+        if score_data:
+            rows.append(score_data)
+    return rows
+
+
+def optimize_worker(
+    payload: dict[str, Any],
+    regime_labels: pd.Series,
+    combinations: list[tuple[str, dict[str, Any]]],
+    study_name: str,
+    storage: str,
+    progress,
+    cancel_event,
+) -> int:
+    """Test a chunk of combinations, each stored as trial of the shared study.
+
+    Returns:
+        Number of combinations this worker tested
+    """
+    import optuna
+    from src.ui.threads.indicator_optimization_phases import OptimizationPhaseHandler
+    from src.ui.threads.indicator_optimization_results import OptimizationResultsProcessor
+
+    settings = _settings(payload)
+    phases = OptimizationPhaseHandler(settings)
+    scorer = OptimizationResultsProcessor(settings)
+    study = optuna.load_study(study_name=study_name, storage=storage)
+
+    tested = 0
+    for indicator_type, params in combinations:
+        if cancel_event.is_set():
+            break
+        rows = _json_safe(score_combination(
+            phases, scorer, payload["data"], regime_labels, indicator_type, params
+        ))
+        key = combination_key(indicator_type, params)
+        study.add_trial(optuna.trial.create_trial(
+            value=max((row["score"] for row in rows), default=0.0),
+            user_attrs={"combination": key, "results": rows},
+        ))
+        tested += 1
+        progress.put({"combination": key})
+    return tested
+
+
+def run_job(job) -> list[dict[str, Any]]:
+    """Job handler (runs in the job server process)."""
+    import optuna
+    from optuna.trial import TrialState
+    from src.ui.threads.indicator_optimization_phases import OptimizationPhaseHandler
+
+    payload = job.payload
+    data = payload["data"]
+    phases = OptimizationPhaseHandler(_settings(payload))
+
+    regime_labels = phases.detect_regimes(data)
+    job.report(regime_history=phases.build_regime_history(data, regime_labels))
+
+    combinations = [
+        (indicator_type, params)
+        for indicator_type, params_list in phases.generate_parameter_combinations().items()
+        for params in params_list
+    ]
+
+    study_name = study_name_for(payload)
+    storage = storage_url(payload, DEFAULT_STORAGE_PATH)
+    study = optuna.create_study(
+        study_name=study_name, storage=storage, load_if_exists=True, direction="maximize"
+    )
+    tested = {
+        trial.user_attrs["combination"]
+        for trial in study.get_trials(deepcopy=False, states=(TrialState.COMPLETE,))
+    }
+    remaining = [c for c in combinations if combination_key(*c) not in tested]
+    n_workers = max(0, min(payload.get("n_workers") or job.max_workers, job.max_workers, len(remaining)))
+
+    logger.info(
+        f"Indicator job {job.job_id}: study={study_name}, "
+        f"{len(combinations) - len(remaining)}/{len(combinations)} combinations checkpointed, "
+        f"workers={n_workers}"
+    )
+    job.report(
+        study_name=study_name,
+        workers=n_workers,
+        completed=len(combinations) - len(remaining),
+        total=len(combinations),
+    )
+
+    if n_workers and not job.cancelled:
+        # Round-robin chunks spread the indicators (different costs) over workers
+        chunks = [remaining[i::n_workers] for i in range(n_workers)]
+        job.run_workers(
+            optimize_worker,
+            [(payload, regime_labels, chunk, study_name, storage) for chunk in chunks],
+        )
+
+    rows = [
+        row
+        for trial in study.get_trials(deepcopy=False, states=(TrialState.COMPLETE,))
+        for row in trial.user_attrs["results"]
+    ]
+    rows.sort(key=lambda row: row["score"], reverse=True)
+    return rows
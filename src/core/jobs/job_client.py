@@ -0,0 +1,206 @@
+"""Job Client.
+
+GUI-side handle of the job server. Starts the server process on first use,
+submits jobs over a pipe and dispatches streamed JobEvents to per-job
+listeners on a reader thread (listeners must be thread-safe, e.g. emit
+Qt signals or put into a queue). If the server process dies, pending
+jobs finish with a FAILED event ("job server terminated").
+
+Usage:
+    client = get_job_client()
+    job_id = client.submit(JobKind.REGIME_OPTIMIZATION, payload, events.put)
+    for event in client.iter_events(job_id, events):
+        ...
+    client.cancel(job_id)
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing as mp
+import queue
+import threading
+from typing import Any, Callable, Iterator
+
+from .job_server import serve
+from .protocol import Command, JobEvent, JobEventType, JobKind, JobRequest
+
+logger = logging.getLogger(__name__)
+
+JobListener = Callable[[JobEvent], None]
+
+
+class JobClient:
+    """Client of a job server subprocess."""
+
+    def __init__(self, max_workers: int | None = None, shutdown_timeout: float = 30.0):
+        """Initialize client (server is started lazily).
+
+        Args:
+            max_workers: Server process pool size (None = all CPUs)
+            shutdown_timeout: Seconds to wait for running trials on shutdown
+        """
+        self.max_workers = max_workers
+        self.shutdown_timeout = shutdown_timeout
+        self._conn = None
+        self._process = None
+        self._reader: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._listeners: dict[str, JobListener] = {}
+
+    @property
+    def is_running(self) -> bool:
+        # The connection is closed by the reader as soon as the server is gone
+        return self._process is not None and self._process.is_alive() and not self._conn.closed
+
+    def start(self) -> None:
+        """Start the server process (no-op if already running)."""
+        with self._lock:
+            if self.is_running:
+                return
+            if self._process is not None and self._process.is_alive():
+                self._process.terminate()  # Lost its connection
+            ctx = mp.get_context("spawn")
+            self._conn, server_conn = ctx.Pipe(duplex=True)
+            # Not daemonic: the server owns a process pool
+            self._process = ctx.Process(
+                target=serve, args=(server_conn, self.max_workers), name="orderpilot-job-server"
+            )
+            self._process.start()
+            server_conn.close()
+
+            # Listeners of this server instance: failed by its reader if it dies
+            self._listeners = {}
+            self._reader = threading.Thread(
+                target=self._read_events, args=(self._conn, self._listeners),
+                name="job-client-reader", daemon=True,
+            )
+            self._reader.start()
+            logger.info(f"Job server started (pid={self._process.pid})")
+
+    def submit(
+        self,
+        kind: JobKind | str,
+        payload: dict[str, Any],
+        listener: JobListener | None = None,
+    ) -> str:
+        """Submit a job.
+
+        Args:
+            kind: Job kind or "module:function" handler path
+            payload: Handler arguments (picklable)
+            listener: Called with every JobEvent of the job (reader thread)
+
+        Returns:
+            Job ID
+        """
+        self.start()
+        kind = kind.value if isinstance(kind, JobKind) else kind
+        request = JobRequest(kind=kind, payload=payload)
+        listeners = self._listeners
+        if listener is not None:
+            listeners[request.job_id] = listener
+        try:
+            self._send(Command.SUBMIT, request)
+        except (BrokenPipeError, OSError):
+            listeners.pop(request.job_id, None)
+            raise
+        return request.job_id
+
+    def iter_events(
+        self, job_id: str, events: "queue.Queue[JobEvent]", poll_s: float = 1.0
+    ) -> Iterator[JobEvent]:
+        """Yield the events of a job (put into ``events`` by its listener).
+
+        Ends after the terminal event. If the server is gone without one,
+        a FAILED event ("job server terminated") is yielded.
+
+        Args:
+            job_id: Job ID
+            events: Queue the job's listener puts its events into
+            poll_s: Seconds between server liveness checks while waiting
+        """
+        while True:
+            try:
+                event = events.get(timeout=poll_s)
+            except queue.Empty:
+                if self.is_running:
+                    continue
+                event = JobEvent(
+                    job_id, JobEventType.FAILED, {"error": "job server terminated", "traceback": ""}
+                )
+            yield event
+            if event.type.is_terminal:
+                return
+
+    def cancel(self, job_id: str) -> None:
+        """Cancel a job; it finishes with a CANCELLED event and partial result."""
+        if self.is_running:
+            self._send(Command.CANCEL, job_id)
+
+    def shutdown(self) -> None:
+        """Stop the server (running jobs are cancelled, studies stay checkpointed)."""
+        with self._lock:
+            if self._process is None:
+                return
+            try:
+                self._conn.send((Command.SHUTDOWN, None))
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join(self.shutdown_timeout)
+            if self._process.is_alive():
+                logger.warning("Job server did not stop in time, terminating")
+                self._process.terminate()
+                self._process.join()
+            self._conn.close()
+            self._process = None
+
+    def _send(self, command: Command, argument: Any) -> None:
+        with self._lock:
+            self._conn.send((command, argument))
+
+    def _read_events(self, conn, listeners: dict[str, JobListener]) -> None:
+        while True:
+            try:
+                event: JobEvent = conn.recv()
+            except (EOFError, OSError):
+                break
+
+            listener = (
+                listeners.pop(event.job_id, None)
+                if event.type.is_terminal
+                else listeners.get(event.job_id)
+            )
+            self._notify(listener, event)
+
+        # Server gone (crash, kill, shutdown): nothing more will arrive
+        conn.close()
+        if listeners:
+            logger.error(f"Job server terminated with {len(listeners)} pending job(s)")
+        for job_id in list(listeners):
+            event = JobEvent(
+                job_id, JobEventType.FAILED, {"error": "job server terminated", "traceback": ""}
+            )
+            self._notify(listeners.pop(job_id, None), event)
+
+    @staticmethod
+    def _notify(listener: JobListener | None, event: JobEvent) -> None:
+        if listener is None:
+            return
+        try:
+            listener(event)
+        except Exception as e:
+            logger.error(f"Job listener for {event.job_id} failed: {e}", exc_info=True)
+
+
+_job_client: JobClient | None = None
+
+
+def get_job_client() -> JobClient:
+    """Get the application-wide job client (server shuts down at exit)."""
+    global _job_client
+    if _job_client is None:
+        _job_client = JobClient()
+        atexit.register(_job_client.shutdown)
+    return _job_client
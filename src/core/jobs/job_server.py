@@ -0,0 +1,205 @@
+"""Job Server.
+
+Runs in its own process (started by JobClient) and executes optimization
+and batch-backtest jobs outside the GUI process:
+
+- One coordinator thread per job (cheap, mostly waiting)
+- CPU work on a shared process pool, so one study can use all cores
+- Progress of pool workers is funneled through a manager queue and
+  streamed to the client as JobEvents
+- Cancellation via a manager event checked by the workers between
+  trials/runs; handlers return their partial result
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import multiprocessing as mp
+import os
+import queue
+import threading
+import traceback
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from typing import Any, Callable
+
+from .protocol import Command, JobEvent, JobEventType, JobKind, JobRequest
+
+logger = logging.getLogger(__name__)
+
+# Handler import paths per built-in job kind
+JOB_HANDLERS: dict[str, str] = {
+    JobKind.REGIME_OPTIMIZATION.value: "src.core.jobs.regime_optimization_job:run_job",
+    JobKind.INDICATOR_OPTIMIZATION.value: "src.core.jobs.indicator_optimization_job:run_job",
+    JobKind.SIMULATOR_OPTIMIZATION.value: "src.core.jobs.simulator_optimization_job:run_job",
+    JobKind.BATCH_BACKTEST.value: "src.core.jobs.batch_backtest_job:run_job",
+}
+
+
+def resolve_handler(kind: str) -> Callable[["JobContext"], Any]:
+    """Resolve a job kind (or "module:function" path) to its handler."""
+    path = JOB_HANDLERS.get(kind, kind)
+    if ":" not in path:
+        raise ValueError(f"Unknown job kind: {kind}")
+    module_name, func_name = path.split(":", 1)
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def resolve_workers(n_workers: int | None) -> int:
+    """Number of pool workers (None/-1 = all CPUs)."""
+    cpus = os.cpu_count() or 1
+    if n_workers is None or n_workers < 1:
+        return cpus
+    return min(n_workers, cpus)
+
+
+class JobContext:
+    """Handle passed to job handlers (runs in the server process).
+
+    Attributes:
+        job_id: Job ID
+        payload: Request payload
+        cancel_event: Set when the client cancels the job (picklable proxy)
+    """
+
+    def __init__(self, server: "JobServer", request: JobRequest):
+        self.job_id = request.job_id
+        self.payload = request.payload
+        self._server = server
+        self.cancel_event = server.manager.Event()
+        self._progress = server.manager.Queue()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    @property
+    def max_workers(self) -> int:
+        return self._server.max_workers
+
+    def report(self, **data) -> None:
+        """Stream a progress event to the client."""
+        self._server.send(JobEvent(self.job_id, JobEventType.PROGRESS, data))
+
+    def run_workers(self, fn: Callable, args_list: list[tuple]) -> list[Any]:
+        """Run fn(*args, progress_queue, cancel_event) on the process pool.
+
+        Dicts put on progress_queue by the workers are streamed to the
+        client while waiting.
+
+        Returns:
+            Worker return values in order of args_list
+        """
+        futures = [
+            self._server.pool.submit(fn, *args, self._progress, self.cancel_event)
+            for args in args_list
+        ]
+        pending = set(futures)
+        while pending:
+            self._drain_progress(timeout=0.2)
+            done, pending = wait(pending, timeout=0, return_when=FIRST_EXCEPTION)
+            failed = [f for f in done if f.exception() is not None]
+            if failed:
+                self.cancel_event.set()
+                wait(pending)
+                raise failed[0].exception()
+        self._drain_progress(timeout=0)
+        return [f.result() for f in futures]
+
+    def _drain_progress(self, timeout: float) -> None:
+        try:
+            item = self._progress.get(timeout=timeout) if timeout else self._progress.get_nowait()
+            while True:
+                self.report(**item)
+                item = self._progress.get_nowait()
+        except queue.Empty:
+            pass
+
+
+class JobServer:
+    """Command loop of the job server process."""
+
+    def __init__(self, conn, max_workers: int | None = None):
+        """Initialize server.
+
+        Args:
+            conn: Server end of the client pipe
+            max_workers: Process pool size (None = all CPUs)
+        """
+        self._conn = conn
+        self._send_lock = threading.Lock()
+        self.max_workers = resolve_workers(max_workers)
+
+        ctx = mp.get_context("spawn")
+        self.manager = ctx.Manager()
+        self.pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=ctx)
+        self._jobs: dict[str, JobContext] = {}
+        self._threads: list[threading.Thread] = []
+
+    def send(self, event: JobEvent) -> None:
+        with self._send_lock:
+            try:
+                self._conn.send(event)
+            except (BrokenPipeError, OSError):
+                logger.debug("Job client gone, dropping %s event", event.type.value)
+
+    def serve_forever(self) -> None:
+        """Process client commands until shutdown or client disconnect."""
+        logger.info(f"Job server started with {self.max_workers} workers")
+        while True:
+            try:
+                command, argument = self._conn.recv()
+            except (EOFError, OSError):
+                break
+
+            if command == Command.SUBMIT:
+                self._start_job(argument)
+            elif command == Command.CANCEL:
+                job = self._jobs.get(argument)
+                if job is not None:
+                    job.cancel_event.set()
+            elif command == Command.SHUTDOWN:
+                break
+
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Cancel running jobs (workers stop after their current trial) and exit."""
+        for job in list(self._jobs.values()):
+            job.cancel_event.set()
+        for thread in self._threads:
+            thread.join()
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        self.manager.shutdown()
+        logger.info("Job server stopped")
+
+    def _start_job(self, request: JobRequest) -> None:
+        job = JobContext(self, request)
+        self._jobs[request.job_id] = job
+        thread = threading.Thread(
+            target=self._run_job, args=(request, job), name=f"job-{request.job_id[:8]}", daemon=True
+        )
+        self._threads = [t for t in self._threads if t.is_alive()]
+        self._threads.append(thread)
+        thread.start()
+
+    def _run_job(self, request: JobRequest, job: JobContext) -> None:
+        self.send(JobEvent(job.job_id, JobEventType.STARTED, {"kind": request.kind}))
+        try:
+            result = resolve_handler(request.kind)(job)
+            event_type = JobEventType.CANCELLED if job.cancelled else JobEventType.COMPLETED
+            self.send(JobEvent(job.job_id, event_type, {"result": result}))
+        except Exception as e:
+            logger.error(f"Job {job.job_id} ({request.kind}) failed: {e}", exc_info=True)
+            self.send(JobEvent(
+                job.job_id, JobEventType.FAILED,
+                {"error": str(e), "traceback": traceback.format_exc()},
+            ))
+        finally:
+            self._jobs.pop(job.job_id, None)
+
+
+def serve(conn, max_workers: int | None = None) -> None:
+    """Entry point of the job server process."""
+    logging.basicConfig(level=logging.INFO)
+    JobServer(conn, max_workers).serve_forever()
@@ -0,0 +1,81 @@
+"""Job Service Protocol.
+
+Messages exchanged between the GUI process (JobClient) and the job server
+subprocess over a multiprocessing pipe. All messages are pickled.
+
+Client -> server: (command, argument) tuples
+    ("submit", JobRequest)
+    ("cancel", job_id)
+    ("shutdown", None)
+
+Server -> client: JobEvent
+"""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+
+class JobKind(str, Enum):
+    """Built-in job types."""
+
+    REGIME_OPTIMIZATION = "regime_optimization"
+    INDICATOR_OPTIMIZATION = "indicator_optimization"
+    SIMULATOR_OPTIMIZATION = "simulator_optimization"
+    BATCH_BACKTEST = "batch_backtest"
+
+
+class JobEventType(str, Enum):
+    """Job lifecycle events streamed back to the client."""
+
+    STARTED = "started"
+    PROGRESS = "progress"  # One per trial / backtest run
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"  # Partial result included
+    FAILED = "failed"
+
+    @property
+    def is_terminal(self) -> bool:
+        return self in (JobEventType.COMPLETED, JobEventType.CANCELLED, JobEventType.FAILED)
+
+
+class Command(str, Enum):
+    """Client commands."""
+
+    SUBMIT = "submit"
+    CANCEL = "cancel"
+    SHUTDOWN = "shutdown"
+
+
+@dataclass
+class JobRequest:
+    """A job submitted to the server.
+
+    Attributes:
+        kind: JobKind value, or "package.module:function" of a custom handler
+        payload: Handler-specific arguments (must be picklable)
+        job_id: Unique job ID
+    """
+
+    kind: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+
+@dataclass
+class JobEvent:
+    """Event of a running job.
+
+    Attributes:
+        job_id: Job the event belongs to
+        type: Event type
+        data: Event data (progress: trial/run info, completed/cancelled:
+            {"result": ...}, failed: {"error": ..., "traceback": ...})
+    """
+
+    job_id: str
+    type: JobEventType
+    data: dict[str, Any] = field(default_factory=dict)
@@ -0,0 +1,160 @@
+"""Regime Optimization Job.
+
+Optuna TPE regime optimization (RegimeOptimizer) distributed over the job
+server's process pool. All workers share one study in a SQLite checkpoint,
+so a cancelled or interrupted study resumes where it stopped when the same
+job is submitted again (resume=True).
+
+Payload:
+    data: OHLCV DataFrame
+    param_ranges: AllParamRanges.model_dump()
+    max_trials: Total trial budget of the study
+    json_config: Optional v2.0 JSON config (per-regime thresholds)
+    n_workers: Worker processes (None = all pool workers)
+    resume: Continue the checkpointed study of an identical job
+    storage_path: Optional SQLite checkpoint path
+
+Result:
+    List of {score, params, metrics, timestamp} dicts, best first
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from . import study_storage
+from .study_storage import DEFAULT_STORAGE_DIR, data_fingerprint, storage_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORAGE_PATH = DEFAULT_STORAGE_DIR / "regime_jobs.db"
+
+
+def study_name_for(payload: dict[str, Any]) -> str:
+    """Stable study name of a job (same data, ranges and config -> same study)."""
+    fingerprint = {
+        **data_fingerprint(payload["data"]),
+        "param_ranges": payload["param_ranges"],
+        "json_config": payload.get("json_config"),
+    }
+    return study_storage.study_name("regime_job", payload, fingerprint)
+
+
+def _build_optimizer(
+    payload: dict[str, Any], storage: str, seed: int = 42, exact_rescore_top_n: int = 10
+):
+    from src.core.regime_optimizer import AllParamRanges, OptimizationConfig, RegimeOptimizer
+
+    config = OptimizationConfig(
+        max_trials=payload["max_trials"],
+        n_jobs=1,
+        storage=storage,
+        seed=seed,
+        exact_rescore_top_n=exact_rescore_top_n,
+    )
+    return RegimeOptimizer(
+        data=payload["data"],
+        param_ranges=AllParamRanges.model_validate(payload["param_ranges"]),
+        config=config,
+        json_config=payload.get("json_config"),
+    )
+
+
+def optimize_worker(
+    payload: dict[str, Any],
+    study_name: str,
+    storage: str,
+    worker_index: int,
+    progress,
+    cancel_event,
+) -> int:
+    """Run trials of the shared study until the trial budget is reached.
+
+    Returns:
+        Number of trials this worker finished
+    """
+    from optuna.study import MaxTrialsCallback
+    from optuna.trial import TrialState
+
+    # Different seed per worker, otherwise all workers sample identical trials.
+    # Exact re-scoring of the top trials runs once in run_job (load_results).
+    optimizer = _build_optimizer(payload, storage, seed=42 + worker_index, exact_rescore_top_n=0)
+    finished = 0
+
+    def on_trial_complete(study, trial):
+        nonlocal finished
+        finished += 1
+        done = study.get_trials(deepcopy=False, states=(TrialState.COMPLETE, TrialState.PRUNED))
+        best = max((t.value for t in done if t.value is not None), default=0.0)
+        progress.put({
+            "trial": trial.number,
+            "value": trial.value,
+            "completed": len(done),
+            "total": payload["max_trials"],
+            "best_score": best,
+        })
+        if cancel_event.is_set():
+            study.stop()
+
+    optimizer.optimize(
+        study_name=study_name,
+        callbacks=[
+            MaxTrialsCallback(payload["max_trials"], states=(TrialState.COMPLETE, TrialState.PRUNED)),
+            on_trial_complete,
+        ],
+    )
+    return finished
+
+
+def _finished_trials(study_name: str, storage: str) -> int:
+    """Completed/pruned trials of a checkpointed study (0 if it doesn't exist)."""
+    import optuna
+    from optuna.trial import TrialState
+
+    try:
+        study = optuna.load_study(study_name=study_name, storage=storage)
+    except KeyError:
+        return 0
+    return len(study.get_trials(deepcopy=False, states=(TrialState.COMPLETE, TrialState.PRUNED)))
+
+
+def run_job(job) -> list[dict[str, Any]]:
+    """Job handler (runs in the job server process)."""
+    payload = job.payload
+    study_name = study_name_for(payload)
+    storage = storage_url(payload, DEFAULT_STORAGE_PATH)
+
+    finished = _finished_trials(study_name, storage)
+    remaining = payload["max_trials"] - finished
+    n_workers = max(0, min(payload.get("n_workers") or job.max_workers, job.max_workers, remaining))
+
+    logger.info(
+        f"Regime job {job.job_id}: study={study_name}, {finished} trials checkpointed, "
+        f"workers={n_workers}"
+    )
+    job.report(study_name=study_name, workers=n_workers, completed=finished, total=payload["max_trials"])
+
+    if n_workers and not job.cancelled:
+        job.run_workers(
+            optimize_worker,
+            [(payload, study_name, storage, i) for i in range(n_workers)],
+        )
+
+    try:
+        results = _build_optimizer(payload, storage).load_results(study_name)
+    except KeyError:
+        return []  # Cancelled before the first trial
+    rows = []
+    for result in results:
+        params = result.params.model_dump()
+        # Merge JSON params (e.g. "DIRECTION_CHANDELIER.lookback") for dynamic columns
+        if result.json_params:
+            params.update(result.json_params)
+        rows.append({
+            "score": result.score,
+            "params": params,
+            "metrics": result.metrics.model_dump(),
+            "timestamp": result.timestamp.isoformat(),
+        })
+    return rows
@@ -0,0 +1,164 @@
+"""Simulator Optimization Job.
+
+Strategy simulator optimization (strategy simulator dialog) in the job
+server process. Each run is one OptimizationConfig (strategy + entry side):
+
+- bayesian: the pool workers share one Optuna study per run in a SQLite
+  checkpoint, so a cancelled or interrupted run resumes where it stopped
+  when the same job is submitted again (resume=True)
+- grid: GridSearchOptimizer on its own trial pool (not resumable)
+
+Payload:
+    data: OHLCV DataFrame
+    symbol: Trading symbol
+    mode: "bayesian" or "grid"
+    configs: OptimizationConfig per run
+    max_combinations: Grid search combination limit
+    n_workers: Worker processes per Bayesian run (None = all pool workers)
+    resume: Continue the checkpointed studies of an identical job
+    storage_path: Optional SQLite checkpoint path
+
+Progress:
+    {"run": i, "total_runs": n, "strategy": ..., "side": ...} when a run starts,
+    {"trial": k, "total": n, "best_score": x} per trial,
+    {"run_result": OptimizationRun} when a run is finished
+
+Result:
+    List of OptimizationRun (one per finished run)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import asdict, replace
+from typing import Any
+
+from . import study_storage
+from .study_storage import DEFAULT_STORAGE_DIR, data_fingerprint, storage_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORAGE_PATH = DEFAULT_STORAGE_DIR / "simulator_jobs.db"
+
+# Config fields that don't change the search (budget, parallelism, checkpoint)
+_RUN_FIELDS = ("n_trials", "n_jobs", "timeout_seconds", "storage", "study_name", "seed")
+
+
+def study_name_for(payload: dict[str, Any], config) -> str:
+    """Stable study name of a run (same data, symbol and config -> same study)."""
+    settings = {k: v for k, v in asdict(config).items() if k not in _RUN_FIELDS}
+    fingerprint = {
+        **data_fingerprint(payload["data"]),
+        "symbol": payload["symbol"],
+        "config": settings,
+    }
+    return study_storage.study_name("simulator_job", payload, fingerprint)
+
+
+def optimize_worker(
+    data,
+    symbol: str,
+    config,
+    worker_index: int,
+    progress,
+    cancel_event,
+) -> None:
+    """Run trials of the shared study until its trial budget is reached."""
+    from src.core.simulator import BayesianOptimizer
+
+    # Different seed per worker, otherwise all workers sample identical trials
+    optimizer = BayesianOptimizer(data, symbol, replace(config, n_jobs=1, seed=42 + worker_index))
+
+    def on_trial(current, total, best):
+        progress.put({"trial": current, "total": total, "best_score": best})
+        if cancel_event.is_set():
+            optimizer.cancel()
+
+    optimizer.optimize(progress_callback=on_trial)
+
+
+def _finished_trials(config) -> int:
+    """Finished trials of a checkpointed study (0 if it doesn't exist)."""
+    import optuna
+
+    try:
+        study = optuna.load_study(study_name=config.study_name, storage=config.storage)
+    except KeyError:
+        return 0
+    return sum(1 for t in study.get_trials(deepcopy=False) if t.state.is_finished())
+
+
+def _run_bayesian(job, config) -> Any:
+    """Run one config on the pool workers (None if cancelled before the first trial)."""
+    from src.core.simulator import BayesianOptimizer
+
+    payload = job.payload
+    start_time = time.time()
+    config = replace(
+        config,
+        storage=storage_url(payload, DEFAULT_STORAGE_PATH),
+        study_name=study_name_for(payload, config),
+    )
+    finished = _finished_trials(config)
+    remaining = config.n_trials - finished
+    n_workers = max(0, min(payload.get("n_workers") or job.max_workers, job.max_workers, remaining))
+    logger.info(
+        f"Simulator job {job.job_id}: study={config.study_name}, "
+        f"{finished} trials checkpointed, workers={n_workers}"
+    )
+
+    if n_workers and not job.cancelled:
+        job.run_workers(
+            optimize_worker,
+            [(payload["data"], payload["symbol"], config, i) for i in range(n_workers)],
+        )
+
+    try:
+        return BayesianOptimizer(payload["data"], payload["symbol"], config).load_results(
+            elapsed_seconds=time.time() - start_time
+        )
+    except KeyError:
+        return None
+
+
+def _run_grid(job, config) -> Any:
+    """Run one config with grid search on the optimizer's own trial pool."""
+    from src.core.simulator import GridSearchOptimizer
+
+    payload = job.payload
+    optimizer = GridSearchOptimizer(payload["data"], payload["symbol"], config)
+
+    def on_trial(current, total, best):
+        job.report(trial=current, total=total, best_score=best)
+        if job.cancelled:
+            optimizer.cancel()
+
+    return optimizer.optimize(
+        progress_callback=on_trial, max_combinations=payload["max_combinations"]
+    )
+
+
+def run_job(job) -> list:
+    """Job handler (runs in the job server process)."""
+    payload = job.payload
+    configs = payload["configs"]
+    runs = []
+    for index, config in enumerate(configs, start=1):
+        if job.cancelled:
+            break
+        job.report(
+            run=index,
+            total_runs=len(configs),
+            strategy=config.strategy_name.value,
+            side=config.entry_side,
+        )
+        if payload["mode"] == "bayesian":
+            run = _run_bayesian(job, config)
+        else:
+            run = _run_grid(job, config)
+        if run is None:
+            break
+        runs.append(run)
+        job.report(run_result=run)
+    return runs
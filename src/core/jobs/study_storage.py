@@ -0,0 +1,46 @@
+"""Study Checkpoints of Optimization Jobs.
+
+Optimization jobs keep their trials in an Optuna study in a SQLite file.
+The study name is derived from the job input, so an identical job
+submitted again (resume=True) continues the checkpointed study.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+DEFAULT_STORAGE_DIR = Path.home() / ".orderpilot" / "optuna"
+
+# Seconds a worker waits for the SQLite write lock of the shared study
+SQLITE_TIMEOUT = 60
+
+
+def storage_url(payload: dict[str, Any], default_path: Path) -> str:
+    """SQLite storage URL of a job (payload "storage_path" or default_path)."""
+    path = Path(payload.get("storage_path") or default_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return f"sqlite:///{path}?timeout={SQLITE_TIMEOUT}"
+
+
+def data_fingerprint(data: pd.DataFrame) -> dict[str, Any]:
+    """Cheap identity of an OHLCV DataFrame for study names."""
+    return {
+        "bars": len(data),
+        "first": str(data.index[0]),
+        "last": str(data.index[-1]),
+        "close_sum": round(float(data["close"].sum()), 6),
+    }
+
+
+def study_name(prefix: str, payload: dict[str, Any], fingerprint: dict[str, Any]) -> str:
+    """Stable study name (same fingerprint -> same study), unique if resume=False."""
+    if not payload.get("resume", True):
+        return f"{prefix}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')}"
+    digest = hashlib.sha1(json.dumps(fingerprint, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{prefix}_{digest[:16]}"
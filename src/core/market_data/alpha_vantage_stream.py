@@ -9,10 +9,10 @@ import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
 
-import aiohttp
 import pandas as pd
 
 from src.common.event_bus import Event, EventType, event_bus
+from src.common.http_pool import get_http_pool
 from src.core.market_data.stream_client import MarketTick, StreamClient, StreamStatus
 
 logger = logging.getLogger(__name__)
@@ -79,7 +79,7 @@ class AlphaVantageStreamClient(StreamClient):
                 "apikey": self.api_key
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with get_http_pool().borrow("alpha_vantage") as session:
                 async with session.get(self.base_url, params=test_params) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -232,7 +232,7 @@ class AlphaVantageStreamClient(StreamClient):
         try:
             request_time = datetime.utcnow()
 
-            async with aiohttp.ClientSession() as session:
+            async with get_http_pool().borrow("alpha_vantage") as session:
                 async with session.get(self.base_url, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -329,7 +329,7 @@ class AlphaVantageStreamClient(StreamClient):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with get_http_pool().borrow("alpha_vantage") as session:
                 async with session.get(self.base_url, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -368,7 +368,7 @@ class AlphaVantageStreamClient(StreamClient):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with get_http_pool().borrow("alpha_vantage") as session:
                 async with session.get(self.base_url, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
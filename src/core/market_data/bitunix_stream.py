@@ -145,7 +145,10 @@ class BitunixStreamClient(StreamClient):
             "current_lag_ms": round(self.metrics.current_lag_ms, 2),
             "reconnect_count": self.metrics.reconnect_count,
             "subscribed_symbols": list(self.metrics.subscribed_symbols),
-            "buffer_size": len(self.buffer)
+            "buffer_size": len(self.buffer),
+            "json_backend": self._messages.decoder.backend,
+            "parse_stats": self._messages.decoder.get_stats(),
+            "max_frame_batch": self._connection.max_batch_size,
         }
 
 
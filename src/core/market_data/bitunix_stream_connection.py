@@ -8,6 +8,7 @@ Contains:
 - connect: Establish WebSocket connection
 - disconnect: Close connection
 - _run_supervisor: Main connection/heartbeat loop
+- _process_frames / _read_frames: Batched frame processing
 - _preflight_handshake: Early connection test
 - _map_invalid_status: Error mapping
 - _is_ws_open: WebSocket state check
@@ -30,6 +31,9 @@ from src.core.market_data.stream_client import StreamStatus
 
 logger = logging.getLogger(__name__)
 
+FRAME_QUEUE_SIZE = 10000  # Reader blocks when full (TCP backpressure instead of dropping)
+MAX_FRAME_BATCH = 500
+
 
 class BitunixStreamConnection:
     """Helper für BitunixStreamClient connection lifecycle."""
@@ -40,6 +44,8 @@ class BitunixStreamConnection:
             parent: BitunixStreamClient Instanz
         """
         self.parent = parent
+        self.batches_processed = 0
+        self.max_batch_size = 0
 
     async def connect(self) -> bool:
         """Establish WebSocket connection via supervisor task."""
@@ -106,13 +112,9 @@ class BitunixStreamConnection:
                 self.parent.metrics.status = StreamStatus.CONNECTING
                 logger.info(f"📡 Bitunix Stream: Connecting to {self.parent.ws_url}")
 
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-
                 async with websockets.connect(
                     self.parent.ws_url,
-                    ssl=ssl_context,
+                    ssl=self._ssl_context(),
                     ping_interval=None,  # Manual heartbeat
                     ping_timeout=10
                 ) as ws:
@@ -130,28 +132,14 @@ class BitunixStreamConnection:
                     else:
                         logger.debug("📡 Bitunix Stream: No symbols to subscribe yet")
 
-                    # Message and Heartbeat loop
-                    last_ping = 0
-                    message_count = 0
-                    while self.parent.connected and self._is_ws_open(websocket):
-                        # 1. Check Heartbeat (3s interval)
-                        now = time.time()
-                        if now - last_ping >= 3:
-                            ping_msg = {"op": "ping", "ping": int(now)}
-                            await websocket.send(json.dumps(ping_msg))
-                            logger.debug(f"💓 Bitunix Stream: Heartbeat sent")
-                            last_ping = now
-
-                        # 2. Process Messages with timeout to allow heartbeat check
-                        try:
-                            # Use wait_for to keep loop responsive
-                            message = await asyncio.wait_for(websocket.recv(), timeout=1.0)
-                            message_count += 1
-                            if message_count <= 5:
-                                logger.debug(f"📨 Bitunix Stream: Received message #{message_count}")
-                            await self.parent._messages.on_message(message)
-                        except asyncio.TimeoutError:
-                            continue  # Just loop back for heartbeat/status check
+                    # Frames are read by a separate task so everything that arrived
+                    # since the last iteration is handled as one batch
+                    frames: asyncio.Queue = asyncio.Queue(maxsize=FRAME_QUEUE_SIZE)
+                    reader = asyncio.create_task(self._read_frames(websocket, frames))
+                    try:
+                        await self._process_frames(websocket, frames)
+                    finally:
+                        reader.cancel()
 
             except InvalidStatus as e:
                 blocked = self._map_invalid_status(e)
@@ -207,16 +195,67 @@ class BitunixStreamConnection:
         self.parent.metrics.status = StreamStatus.DISCONNECTED
         logger.info("📡 Bitunix Stream: Supervisor stopped")
 
+    async def _process_frames(self, websocket, frames: asyncio.Queue) -> None:
+        """Message and heartbeat loop for one connection.
+
+        Raises:
+            ConnectionClosed: Handed over from the reader task
+        """
+        last_ping = 0
+        # A closed socket ends the loop through the reader's ConnectionClosed,
+        # so reconnects always go through the supervisor's backoff
+        while self.parent.connected:
+            # 1. Check Heartbeat (3s interval)
+            now = time.time()
+            if now - last_ping >= 3:
+                ping_msg = {"op": "ping", "ping": int(now)}
+                await websocket.send(json.dumps(ping_msg))
+                logger.debug(f"💓 Bitunix Stream: Heartbeat sent")
+                last_ping = now
+
+            # 2. Wait for frames with timeout to allow heartbeat check
+            try:
+                async with asyncio.timeout(1.0):
+                    frame = await frames.get()
+            except TimeoutError:
+                continue  # Just loop back for heartbeat/status check
+
+            # 3. Drain everything already received (no await in between)
+            batch = []
+            closed = None
+            while True:
+                if isinstance(frame, BaseException):
+                    closed = frame
+                    break
+                batch.append(frame)
+                if len(batch) >= MAX_FRAME_BATCH or frames.empty():
+                    break
+                frame = frames.get_nowait()
+
+            if batch:
+                self.batches_processed += 1
+                self.max_batch_size = max(self.max_batch_size, len(batch))
+                await self.parent._messages.on_messages(batch)
+            if closed is not None:
+                raise closed
+
+    @staticmethod
+    async def _read_frames(websocket, frames: asyncio.Queue) -> None:
+        """Move received frames into the queue; the closing exception is queued last."""
+        try:
+            while True:
+                await frames.put(await websocket.recv())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await frames.put(e)
+
     async def _preflight_handshake(self) -> None:
         """Perform a single WS handshake to detect blocking (e.g., 403/Cloudflare)."""
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-
         try:
             async with websockets.connect(
                 self.parent.ws_url,
-                ssl=ssl_context,
+                ssl=self._ssl_context(),
                 ping_interval=None,
                 ping_timeout=10,
                 close_timeout=5,
@@ -228,6 +267,15 @@ class BitunixStreamConnection:
             self.parent.last_error = blocked
             raise blocked
 
+    def _ssl_context(self) -> ssl.SSLContext | None:
+        """SSL context for wss:// URLs; None for plain ws:// (e.g. the local mock exchange)."""
+        if not self.parent.ws_url.startswith("wss://"):
+            return None
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        return ssl_context
+
     def _map_invalid_status(self, exc: InvalidStatus) -> MarketDataAccessBlocked:
         """Convert websockets InvalidStatus to a rich exception for UI handling."""
         status = getattr(exc, "status_code", None)
@@ -0,0 +1,236 @@
+"""Bitunix Stream - Frame Decoding.
+
+Decodes WebSocket frames straight into typed per-channel frames so the
+handlers don't have to walk nested dicts and convert strings themselves.
+
+Backends (fastest available is used):
+- msgspec: typed Structs, channel payload decoded without intermediate dicts
+- orjson: fast dict decoding
+- json: standard library fallback
+
+Contains:
+- KlineFrame / TickerFrame: Decoded channel payloads
+- kline_frame_from_dict / ticker_frame_from_dict: dict -> frame conversion
+- BitunixFrameDecoder: Decoder with parse time statistics per message type
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class KlineFrame:
+    """Kline update (``market_kline_*`` / ``mark_kline_*`` channels)."""
+
+    symbol: str
+    ts_ms: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+@dataclass(slots=True)
+class TickerFrame:
+    """Ticker update. ``last_price`` stays a string for exact Decimal conversion."""
+
+    symbol: str
+    last_price: str
+    base_volume: float
+
+
+def kline_frame_from_dict(data: dict) -> KlineFrame | None:
+    """Build a KlineFrame from a decoded message; None if symbol or timestamp is missing."""
+    symbol = data.get("symbol")
+    ts_ms = data.get("ts")
+    if not symbol or not ts_ms:
+        return None
+    kline = data.get("data") or {}
+    return KlineFrame(
+        symbol=symbol,
+        ts_ms=int(ts_ms),
+        open=float(kline.get("o", 0)),
+        high=float(kline.get("h", 0)),
+        low=float(kline.get("l", 0)),
+        close=float(kline.get("c", 0)),
+        volume=float(kline.get("b", 0)),
+    )
+
+
+def ticker_frame_from_dict(data: dict) -> TickerFrame | None:
+    """Build a TickerFrame from a decoded message; None if the symbol is missing."""
+    ticker = data.get("data") or {}
+    symbol = ticker.get("symbol")
+    if not symbol:
+        return None
+    return TickerFrame(
+        symbol=symbol,
+        last_price=str(ticker.get("lastPrice", 0)),
+        base_volume=float(ticker.get("baseVol", 0)),
+    )
+
+
+def channel_kind(channel: str) -> str:
+    """Message type of a channel name (same routing as the message dispatcher)."""
+    if "kline" in channel:
+        return "kline"
+    if "ticker" in channel:
+        return "ticker"
+    if "depth" in channel:
+        return "depth"
+    if "trade" in channel:
+        return "trade"
+    return "unknown"
+
+
+if MSGSPEC_AVAILABLE:
+
+    class _Header(msgspec.Struct):
+        """Envelope; the channel payload is kept raw and decoded by type."""
+
+        op: str | None = None
+        ch: str = ""
+        symbol: str | None = None
+        ts: int | None = None
+        data: msgspec.Raw = msgspec.Raw()
+
+    class _KlineData(msgspec.Struct):
+        o: float = 0.0
+        h: float = 0.0
+        l: float = 0.0  # noqa: E741 - Bitunix field name
+        c: float = 0.0
+        b: float = 0.0
+
+    class _TickerData(msgspec.Struct):
+        symbol: str | None = None
+        lastPrice: str | float = "0"
+        baseVol: float = 0.0
+
+
+class BitunixFrameDecoder:
+    """Decode Bitunix WebSocket frames into (message type, payload).
+
+    Payloads are KlineFrame / TickerFrame for the hot channels and plain
+    dicts for control (``op``) and other channel messages. Frames the typed
+    path can't handle fall back to dict decoding, so odd messages still
+    reach the handlers' validation and logging.
+    """
+
+    def __init__(self, backend: str | None = None):
+        """
+        Args:
+            backend: "msgspec", "orjson" or "json" (default: fastest available)
+        """
+        if backend is None:
+            backend = "msgspec" if MSGSPEC_AVAILABLE else "orjson" if ORJSON_AVAILABLE else "json"
+        if (backend == "msgspec" and not MSGSPEC_AVAILABLE) or (backend == "orjson" and not ORJSON_AVAILABLE):
+            raise ValueError(f"JSON backend '{backend}' is not installed")
+        self.backend = backend
+
+        # Generic dict decoding (control frames, fallback)
+        if backend == "json":
+            self._loads = json.loads
+        elif ORJSON_AVAILABLE:
+            self._loads = orjson.loads
+        else:
+            self._loads = msgspec.json.decode
+
+        if backend == "msgspec":
+            self._header_decoder = msgspec.json.Decoder(_Header, strict=False)
+            self._kline_decoder = msgspec.json.Decoder(_KlineData, strict=False)
+            self._ticker_decoder = msgspec.json.Decoder(_TickerData, strict=False)
+            self._decode = self._decode_typed
+        else:
+            self._decode = self._decode_dict
+
+        # message type -> [count, total ns]
+        self._parse_stats: dict[str, list[int]] = {}
+
+    def decode(self, message: str | bytes) -> tuple[str, Any]:
+        """Decode one frame.
+
+        Args:
+            message: Raw WebSocket frame
+
+        Returns:
+            (message type, payload) with type one of kline, ticker, depth,
+            trade, control, unknown
+
+        Raises:
+            ValueError: If the frame is not valid JSON
+        """
+        started = time.perf_counter_ns()
+        kind, payload = self._decode(message)
+        stats = self._parse_stats.get(kind)
+        if stats is None:
+            stats = self._parse_stats[kind] = [0, 0]
+        stats[0] += 1
+        stats[1] += time.perf_counter_ns() - started
+        return kind, payload
+
+    def _decode_dict(self, message: str | bytes) -> tuple[str, Any]:
+        data = self._loads(message)
+        if not isinstance(data, dict):
+            return "unknown", data
+        if data.get("op"):
+            return "control", data
+
+        kind = channel_kind(data.get("ch", ""))
+        if kind == "kline":
+            return kind, kline_frame_from_dict(data) or data
+        if kind == "ticker":
+            return kind, ticker_frame_from_dict(data) or data
+        return kind, data
+
+    def _decode_typed(self, message: str | bytes) -> tuple[str, Any]:
+        try:
+            header = self._header_decoder.decode(message)
+        except msgspec.ValidationError:
+            return self._decode_dict(message)  # Unexpected envelope (e.g. non-object frame)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+        if header.op:
+            return "control", self._loads(message)
+
+        kind = channel_kind(header.ch)
+        try:
+            if kind == "kline" and header.symbol and header.ts:
+                kline = self._kline_decoder.decode(header.data)
+                return kind, KlineFrame(header.symbol, header.ts, kline.o, kline.h, kline.l, kline.c, kline.b)
+            if kind == "ticker":
+                ticker = self._ticker_decoder.decode(header.data)
+                if ticker.symbol:
+                    return kind, TickerFrame(ticker.symbol, str(ticker.lastPrice), ticker.baseVol)
+        except (msgspec.ValidationError, msgspec.DecodeError):
+            pass
+        return self._decode_dict(message)
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        """Parse time per message type."""
+        return {
+            kind: {"count": count, "mean_us": round(total_ns / count / 1000, 3)}
+            for kind, (count, total_ns) in self._parse_stats.items()
+        }
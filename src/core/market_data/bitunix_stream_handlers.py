@@ -20,6 +20,13 @@ from decimal import Decimal
 from src.common.event_bus import Event, EventType, event_bus
 from src.core.market_data.stream_client import MarketTick
 
+from .bitunix_stream_decoder import (
+    KlineFrame,
+    TickerFrame,
+    kline_frame_from_dict,
+    ticker_frame_from_dict,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,7 +41,7 @@ class BitunixStreamHandlers:
         self.parent = parent
         self._kline_count = 0
 
-    async def handle_ticker(self, data: dict) -> None:
+    async def handle_ticker(self, data: dict | TickerFrame) -> None:
         """Handle ticker updates.
 
         Example data:
@@ -53,19 +60,18 @@ class BitunixStreamHandlers:
         }
 
         Args:
-            data: Ticker data
+            data: Ticker message or frame decoded by BitunixFrameDecoder
         """
-        ticker = data.get('data', {})
-        symbol = ticker.get('symbol')
-
-        if not symbol:
+        frame = data if isinstance(data, TickerFrame) else ticker_frame_from_dict(data)
+        if frame is None:
             return
+        symbol = frame.symbol
 
         # Create MarketTick
         tick = MarketTick(
             symbol=symbol,
-            last=Decimal(str(ticker.get('lastPrice', 0))),
-            volume=int(float(ticker.get('baseVol', 0))),
+            last=Decimal(frame.last_price),
+            volume=int(frame.base_volume),
             timestamp=datetime.utcnow(),
             source=self.parent.name
         )
@@ -89,7 +95,7 @@ class BitunixStreamHandlers:
             )
         )
 
-    async def handle_kline(self, data: dict) -> None:
+    async def handle_kline(self, data: dict | KlineFrame) -> None:
         """Handle kline (candlestick) updates.
 
         Example data:
@@ -108,7 +114,7 @@ class BitunixStreamHandlers:
         }
 
         Args:
-            data: Kline data
+            data: Kline message or frame decoded by BitunixFrameDecoder
         """
         # Bitunix WS docs format:
         # {
@@ -117,20 +123,18 @@ class BitunixStreamHandlers:
         #   "ts": 1732178884994,
         #   "data": {"o":"...","h":"...","l":"...","c":"...","b":"...","q":"..."}
         # }
-        symbol = data.get("symbol")
-        ts_ms = data.get("ts")
-        kline = data.get("data") or {}
-
-        if not symbol or not ts_ms:
+        frame = data if isinstance(data, KlineFrame) else kline_frame_from_dict(data)
+        if frame is None:
             logger.warning(f"⚠ Bitunix: Kline missing symbol or timestamp: {data}")
             return
 
-        ts = datetime.fromtimestamp(int(ts_ms) / 1000, tz=timezone.utc)
-        open_ = float(kline.get("o", 0))
-        high = float(kline.get("h", 0))
-        low = float(kline.get("l", 0))
-        close = float(kline.get("c", 0))
-        volume = float(kline.get("b", 0))
+        symbol = frame.symbol
+        ts = datetime.fromtimestamp(frame.ts_ms / 1000, tz=timezone.utc)
+        open_ = frame.open
+        high = frame.high
+        low = frame.low
+        close = frame.close
+        volume = frame.volume
 
         # Log first kline to confirm data flow
         self._kline_count += 1
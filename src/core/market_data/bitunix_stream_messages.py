@@ -6,14 +6,16 @@ Module 2/5 of bitunix_stream.py split.
 
 Contains:
 - on_message: Main message dispatcher
+- on_messages: Dispatch a batch of frames received together
 """
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime
 
+from .bitunix_stream_decoder import BitunixFrameDecoder
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +28,7 @@ class BitunixStreamMessages:
             parent: BitunixStreamClient Instanz
         """
         self.parent = parent
+        self.decoder = BitunixFrameDecoder()
 
     async def on_message(self, message: str) -> None:
         """Parse and handle incoming WebSocket messages.
@@ -33,63 +36,77 @@ class BitunixStreamMessages:
         Args:
             message: JSON message string
         """
-        try:
-            data = json.loads(message)
+        await self.on_messages([message])
+
+    async def on_messages(self, messages: list[str]) -> None:
+        """Parse and handle frames received within one loop iteration.
 
-            # Update metrics
+        Args:
+            messages: JSON message strings in arrival order
+        """
+        self.parent.metrics.last_message_at = datetime.utcnow()
+        for message in messages:
             self.parent.metrics.messages_received += 1
-            self.parent.metrics.last_message_at = datetime.utcnow()
-
-            # Handle different message types
-            op = data.get('op')
-
-            # Log first few messages to help debug (including pings)
-            if self.parent.metrics.messages_received <= 5:
-                logger.debug(f"📨 Bitunix message #{self.parent.metrics.messages_received}: {data}")
-
-            if op == 'ping':
-                # Heartbeat response (keep-alive)
-                logger.debug("💓 Heartbeat ping/pong received")
-                return
-
-            if op in {"subscribe", "unsubscribe"}:
-                logger.info(f"Bitunix WS ack: {data}")
-                return
-
-            if op == "connect":
-                logger.info("✅ Bitunix Stream: Server confirmed connection")
-                return
-
-            if op == "error":
-                error_code = data.get('code', 'unknown')
-                error_msg = data.get('message', data.get('msg', 'Unknown error'))
-                error_data = data.get('data', {})
-                logger.error(f"❌ Bitunix Stream: Server error received!")
-                logger.error(f"   Error Code: {error_code}")
-                logger.error(f"   Error Message: {error_msg}")
-                if error_data:
-                    logger.error(f"   Error Data: {error_data}")
-                logger.error(f"   Full Response: {data}")
-                return
-
-            # Channel messages
-            channel = data.get('ch', '')
-
-            if 'kline' in channel or 'market_kline' in channel:
-                await self.parent._handlers.handle_kline(data)
-            elif 'ticker' in channel:
-                await self.parent._handlers.handle_ticker(data)
-            elif 'depth' in channel:
-                await self.parent._handlers.handle_depth(data)
-            elif 'trade' in channel:
-                await self.parent._handlers.handle_trade(data)
-            else:
-                # Unknown/heartbeat noise -> debug only
-                logger.debug(f"⚠ Bitunix: Unknown message type (op={op}, ch={channel}): {data}")
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse message: {e}")
-            self.parent.metrics.messages_dropped += 1
-        except Exception as e:
-            logger.error(f"Message processing error: {e}", exc_info=True)
-            self.parent.metrics.messages_dropped += 1
+            try:
+                kind, payload = self.decoder.decode(message)
+            except ValueError as e:
+                logger.error(f"Failed to parse message: {e}")
+                self.parent.metrics.messages_dropped += 1
+                continue
+
+            try:
+                await self._dispatch(kind, payload)
+            except Exception as e:
+                logger.error(f"Message processing error: {e}", exc_info=True)
+                self.parent.metrics.messages_dropped += 1
+
+    async def _dispatch(self, kind: str, payload) -> None:
+        """Route a decoded frame to its channel handler."""
+        # Log first few messages to help debug (including pings)
+        if self.parent.metrics.messages_received <= 5:
+            logger.debug(f"📨 Bitunix message #{self.parent.metrics.messages_received}: {payload}")
+
+        if kind == "kline":
+            await self.parent._handlers.handle_kline(payload)
+        elif kind == "ticker":
+            await self.parent._handlers.handle_ticker(payload)
+        elif kind == "control":
+            self._handle_control(payload)
+        elif kind == "depth":
+            await self.parent._handlers.handle_depth(payload)
+        elif kind == "trade":
+            await self.parent._handlers.handle_trade(payload)
+        else:
+            # Unknown/heartbeat noise -> debug only
+            logger.debug(f"⚠ Bitunix: Unknown message type: {payload}")
+
+    def _handle_control(self, data: dict) -> None:
+        """Handle op messages (heartbeat, acks, errors)."""
+        op = data.get('op')
+
+        if op == 'ping':
+            # Heartbeat response (keep-alive)
+            logger.debug("💓 Heartbeat ping/pong received")
+            return
+
+        if op in {"subscribe", "unsubscribe"}:
+            logger.info(f"Bitunix WS ack: {data}")
+            return
+
+        if op == "connect":
+            logger.info("✅ Bitunix Stream: Server confirmed connection")
+            return
+
+        if op == "error":
+            error_code = data.get('code', 'unknown')
+            error_msg = data.get('message', data.get('msg', 'Unknown error'))
+            error_data = data.get('data', {})
+            logger.error(f"❌ Bitunix Stream: Server error received!")
+            logger.error(f"   Error Code: {error_code}")
+            logger.error(f"   Error Message: {error_msg}")
+            if error_data:
+                logger.error(f"   Error Data: {error_data}")
+            logger.error(f"   Full Response: {data}")
+            return
+
+        logger.debug(f"⚠ Bitunix: Unknown op message (op={op}): {data}")
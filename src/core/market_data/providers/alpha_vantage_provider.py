@@ -7,9 +7,9 @@ import logging
 from datetime import datetime
 from decimal import Decimal
 
-import aiohttp
 import pandas as pd
 
+from src.common.http_pool import get_http_pool
 from src.core.market_data.types import HistoricalBar, Timeframe
 
 from .base import HistoricalDataProvider
@@ -63,7 +63,7 @@ class AlphaVantageProvider(HistoricalDataProvider):
             params["interval"] = self._timeframe_to_av(timeframe)
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with get_http_pool().borrow("alpha_vantage") as session:
                 async with session.get(self.base_url, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -141,7 +141,7 @@ class AlphaVantageProvider(HistoricalDataProvider):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with get_http_pool().borrow("alpha_vantage") as session:
                 async with session.get(self.base_url, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -214,7 +214,7 @@ class AlphaVantageProvider(HistoricalDataProvider):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with get_http_pool().borrow("alpha_vantage") as session:
                 async with session.get(self.base_url, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -14,6 +14,7 @@ from decimal import Decimal
 
 import aiohttp
 
+from src.common.http_pool import get_http_pool
 from src.core.market_data.providers.base import HistoricalDataProvider
 from src.core.market_data.types import HistoricalBar, Timeframe
 
@@ -237,7 +238,7 @@ class BitunixProvider(HistoricalDataProvider):
         estimated_batches = max(1, estimated_total_bars // bars_per_batch)
 
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=60)) as session:
+            async with get_http_pool().borrow("bitunix_market", timeout=aiohttp.ClientTimeout(total=60)) as session:
                 batches = 0
                 # Paginate BACKWARDS: from end_date towards start_date
                 while current_end_ms > start_ms and batches < max_batches:
@@ -7,8 +7,7 @@ import logging
 from datetime import datetime
 from decimal import Decimal
 
-import aiohttp
-
+from src.common.http_pool import get_http_pool
 from src.core.market_data.types import HistoricalBar, Timeframe
 
 from .base import HistoricalDataProvider
@@ -49,7 +48,7 @@ class FinnhubProvider(HistoricalDataProvider):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with get_http_pool().borrow("finnhub") as session:
                 async with session.get(endpoint, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -8,8 +8,7 @@ import logging
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
-import aiohttp
-
+from src.common.http_pool import get_http_pool
 from src.core.market_data.types import HistoricalBar, Timeframe
 
 from .base import HistoricalDataProvider
@@ -103,7 +102,7 @@ class YahooFinanceProvider(HistoricalDataProvider):
         params: dict[str, str | int],
         symbol: str,
     ) -> dict | None:
-        async with aiohttp.ClientSession(headers=self.headers) as session:
+        async with get_http_pool().borrow("yahoo", headers=self.headers) as session:
             backoff = 1.5
             last_error_status = None
 
@@ -0,0 +1,20 @@
+"""Local Mock Exchange for load-testing the order and stream paths.
+
+Bitunix-compatible REST and WebSocket server with synthetic or replayed
+market data, a simulated order book, latency/error/disconnect injection
+and load test scenarios.
+"""
+
+from .exchange_config import MockExchangeConfig
+from .exchange_server import MockExchangeServer
+from .market_feed import FeedUpdate, MarketFeed
+from .order_book import Fill, SimulatedOrderBook
+
+__all__ = [
+    "MockExchangeConfig",
+    "MockExchangeServer",
+    "FeedUpdate",
+    "MarketFeed",
+    "Fill",
+    "SimulatedOrderBook",
+]
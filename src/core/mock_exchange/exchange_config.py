@@ -0,0 +1,42 @@
+"""Mock Exchange - Configuration.
+
+Contains:
+- MockExchangeConfig: Feed rate, order book shape and fault injection
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class MockExchangeConfig:
+    """Settings of the local exchange stand-in."""
+
+    # Market feed
+    symbols: list[str] = field(default_factory=lambda: ["BTCUSDT"])
+    start_price: float = 50000.0
+    volatility: float = 0.0005  # Std-dev of the per-step random walk (relative)
+    message_rate: float = 1000.0  # Price updates per second and symbol
+
+    # Order book (synthetic levels around the last price)
+    book_depth: int = 20  # Levels per side
+    tick_size: float = 0.5
+    level_size: float = 2.0  # Quantity per level
+
+    # Account
+    initial_balance: float = 10000.0
+    leverage: int = 10
+
+    # REST behaviour
+    latency_ms: float = 0.0  # Added to every REST response
+    latency_jitter_ms: float = 0.0  # Uniform jitter on top of latency_ms
+    error_rate: float = 0.0  # Share of REST requests answered with HTTP 503
+    verify_signatures: bool = True
+    api_key: str = "mock-key"
+    api_secret: str = "mock-secret"
+
+    # WebSocket behaviour
+    disconnect_every_s: float | None = None  # Drop all streams periodically
+
+    seed: int | None = None
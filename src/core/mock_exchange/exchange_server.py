@@ -0,0 +1,455 @@
+"""Mock Exchange - REST and WebSocket Server.
+
+Local stand-in for the Bitunix Futures API so the real adapter, request
+signing and stream client can be driven under load without touching the
+exchange.
+
+Contains:
+- MockExchangeServer: aiohttp app serving the Bitunix REST endpoints used by
+  BitunixAdapter and the public WebSocket used by BitunixStreamClient
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from typing import Any
+
+from aiohttp import WSCloseCode, WSMsgType, web
+
+from src.core.auth.bitunix_signer import BitunixSigner
+
+from .exchange_config import MockExchangeConfig
+from .market_feed import FeedUpdate, MarketFeed
+from .order_book import Fill, SimulatedOrderBook
+
+logger = logging.getLogger(__name__)
+
+API = "/api/v1/futures"
+WS_PATH = "/public/Main"
+TAKER_FEE = 0.0006
+
+
+def _ok(data: Any) -> web.Response:
+    return web.json_response({"code": 0, "data": data, "msg": "Success"})
+
+
+def _fail(code: int, msg: str, status: int = 200) -> web.Response:
+    return web.json_response({"code": code, "data": None, "msg": msg}, status=status)
+
+
+class MockExchangeServer:
+    """Bitunix-compatible exchange simulator.
+
+    REST: account, positions, open orders, order detail, place/cancel order
+    and TP/SL modification, with optional latency, error injection and
+    signature verification. Orders are matched against a synthetic
+    ``SimulatedOrderBook`` per symbol that follows the feed price.
+
+    WebSocket: ping/pong, subscribe/unsubscribe and kline/ticker/trade/depth
+    pushes at ``config.message_rate`` updates per second and symbol, with
+    optional periodic disconnects.
+
+    Usage:
+        server = MockExchangeServer(MockExchangeConfig(message_rate=2000))
+        await server.start()
+        adapter.base_url = server.base_url
+        stream.ws_url = server.ws_url
+        ...
+        await server.stop()
+    """
+
+    def __init__(self, config: MockExchangeConfig | None = None, feed: MarketFeed | None = None):
+        self.config = config or MockExchangeConfig()
+        self.feed = feed or MarketFeed(
+            self.config.symbols, self.config.start_price, self.config.volatility, self.config.seed
+        )
+        self._random = random.Random(self.config.seed)
+        self._signer = BitunixSigner(self.config.api_key, self.config.api_secret)
+
+        self.books = {
+            symbol: SimulatedOrderBook(
+                self.feed.price(symbol), self.config.book_depth, self.config.tick_size, self.config.level_size
+            )
+            for symbol in self.feed.symbols
+        }
+        self.balance = self.config.initial_balance
+        self.orders: dict[str, dict[str, Any]] = {}
+        self.positions: dict[str, dict[str, Any]] = {}
+
+        self._sockets: dict[web.WebSocketResponse, dict[str, set[str]]] = {}  # ws -> symbol -> channels
+        self._runner: web.AppRunner | None = None
+        self._tasks: list[asyncio.Task] = []
+        self.base_url = ""
+        self.ws_url = ""
+
+        self.stats: dict[str, int] = {
+            "rest_requests": 0,
+            "rest_errors_injected": 0,
+            "signature_errors": 0,
+            "orders_placed": 0,
+            "fills": 0,
+            "ws_connections": 0,
+            "ws_subscribed_sessions": 0,
+            "ws_messages_sent": 0,
+            "ws_disconnects_injected": 0,
+            "feed_updates": 0,
+            "feed_updates_skipped": 0,
+        }
+
+    # ==================== Lifecycle ====================
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Start serving and producing market data."""
+        app = web.Application(middlewares=[self._rest_middleware])
+        app.router.add_get(WS_PATH, self._handle_ws)
+        app.router.add_get(f"{API}/account", self._handle_account)
+        app.router.add_get(f"{API}/position/get_pending_positions", self._handle_positions)
+        app.router.add_get(f"{API}/trade/get_pending_orders", self._handle_pending_orders)
+        app.router.add_get(f"{API}/trade/get_order_detail", self._handle_order_detail)
+        app.router.add_post(f"{API}/trade/place_order", self._handle_place_order)
+        app.router.add_post(f"{API}/trade/cancel_orders", self._handle_cancel_order)
+        app.router.add_post(f"{API}/trade/modify_position", self._handle_modify_position)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{port}"
+        self.ws_url = f"ws://{host}:{port}{WS_PATH}"
+
+        self._tasks.append(asyncio.create_task(self._run_feed()))
+        if self.config.disconnect_every_s:
+            self._tasks.append(asyncio.create_task(self._run_disconnects()))
+        logger.info(f"Mock exchange listening on {self.base_url} ({len(self.feed.symbols)} symbols)")
+
+    async def stop(self) -> None:
+        """Stop the feed and close all connections."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        await self.drop_connections(count=False)
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            **self.stats,
+            "ws_active": len(self._sockets),
+            "open_orders": sum(len(book.resting_orders()) for book in self.books.values()),
+            "positions": len(self.positions),
+        }
+
+    # ==================== REST ====================
+
+    @web.middleware
+    async def _rest_middleware(self, request: web.Request, handler):
+        if request.path == WS_PATH:
+            return await handler(request)
+
+        self.stats["rest_requests"] += 1
+        delay_ms = self.config.latency_ms + self._random.uniform(0.0, self.config.latency_jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            self.stats["rest_errors_injected"] += 1
+            return _fail(503, "Service temporarily unavailable", status=503)
+
+        if self.config.verify_signatures and not await self._signature_valid(request):
+            self.stats["signature_errors"] += 1
+            return _fail(10003, "Signature error", status=401)
+
+        return await handler(request)
+
+    async def _signature_valid(self, request: web.Request) -> bool:
+        headers = request.headers
+        if headers.get("api-key") != self.config.api_key:
+            return False
+        # Same canonical form as BitunixAdapter._sort_params
+        query = "".join(f"{k}{v}" for k, v in sorted(request.query.items()))
+        body = await request.text() if request.method == "POST" else ""
+        expected = self._signer.generate_signature(
+            headers.get("nonce", ""), headers.get("timestamp", ""), query, body
+        )
+        return headers.get("sign") == expected
+
+    async def _handle_account(self, request: web.Request) -> web.Response:
+        unrealized = sum(self._unrealized_pnl(symbol) for symbol in self.positions)
+        margin = sum(
+            abs(pos["quantity"]) * self.feed.price(symbol) / self.config.leverage
+            for symbol, pos in self.positions.items()
+        )
+        return _ok({
+            "marginCoin": request.query.get("marginCoin", "USDT"),
+            "available": str(self.balance - margin),
+            "frozen": "0",
+            "margin": str(margin),
+            "transfer": str(self.balance - margin),
+            "positionMode": "ONE_WAY",
+            "crossUnrealizedPNL": str(unrealized),
+            "isolationUnrealizedPNL": "0",
+            "bonus": "0",
+        })
+
+    async def _handle_positions(self, request: web.Request) -> web.Response:
+        positions = []
+        for symbol, pos in self.positions.items():
+            mark = self.feed.price(symbol)
+            pnl = self._unrealized_pnl(symbol)
+            cost = abs(pos["quantity"]) * pos["avg_price"]
+            positions.append({
+                "symbol": symbol,
+                "quantity": str(pos["quantity"]),
+                "avgPrice": str(pos["avg_price"]),
+                "markPrice": str(mark),
+                "positionValue": str(abs(pos["quantity"]) * mark),
+                "unrealizedPnl": str(pnl),
+                "pnlPercentage": pnl / cost * 100 if cost else 0.0,
+                "leverage": self.config.leverage,
+                "takeProfit": pos.get("take_profit"),
+                "stopLoss": pos.get("stop_loss"),
+            })
+        return _ok(positions)
+
+    async def _handle_pending_orders(self, request: web.Request) -> web.Response:
+        symbol = request.query.get("symbol")
+        orders = [
+            order for order in self.orders.values()
+            if order["type"] == "limit" and order["status"] in ("submitted", "partial_filled")
+            and (symbol is None or order["symbol"] == symbol)
+        ]
+        return _ok({"orderList": orders, "total": len(orders)})
+
+    async def _handle_order_detail(self, request: web.Request) -> web.Response:
+        order = self.orders.get(request.query.get("orderId", ""))
+        if order is None:
+            return _fail(10007, "Order not found", status=404)
+        return _ok(order)
+
+    async def _handle_place_order(self, request: web.Request) -> web.Response:
+        params = json.loads(await request.text())
+        symbol = params.get("symbol")
+        side = str(params.get("side", "")).lower()
+        order_type = str(params.get("type", "market")).lower()
+        try:
+            quantity = float(params["quantity"])
+            limit_price = float(params["price"]) if order_type == "limit" else None
+        except (KeyError, TypeError, ValueError):
+            return _fail(10001, "Invalid quantity or price", status=400)
+        if symbol not in self.books or side not in ("buy", "sell") or quantity <= 0:
+            return _fail(10001, f"Invalid order: {params}", status=400)
+
+        order_id = uuid.uuid4().hex
+        order = {
+            "orderId": order_id,
+            "symbol": symbol,
+            "side": side,
+            "type": order_type,
+            "quantity": quantity,
+            "price": limit_price,
+            "status": "submitted",
+            "filledQuantity": 0.0,
+            "avgPrice": 0.0,
+            "ctime": int(time.time() * 1000),
+        }
+        self.orders[order_id] = order
+        self.stats["orders_placed"] += 1
+
+        fill = self.books[symbol].execute(order_id, side, quantity, limit_price)
+        if fill:
+            self._apply_fill(fill)
+        if order_type == "market" and order["status"] != "filled":
+            # Unfilled rest of a market order larger than the book is cancelled
+            order["status"] = "partial_filled" if order["filledQuantity"] else "cancelled"
+        return _ok({"orderId": order_id, "clientId": params.get("clientId")})
+
+    async def _handle_cancel_order(self, request: web.Request) -> web.Response:
+        params = json.loads(await request.text())
+        order = self.orders.get(params.get("orderId", ""))
+        if order is None or not self.books[order["symbol"]].cancel(order["orderId"]):
+            return _fail(10007, "Order not found or not cancellable")
+        order["status"] = "cancelled"
+        return _ok({"successList": [{"orderId": order["orderId"]}], "failureList": []})
+
+    async def _handle_modify_position(self, request: web.Request) -> web.Response:
+        params = json.loads(await request.text())
+        position = self.positions.get(params.get("symbol", ""))
+        if position is None:
+            return _fail(10008, "Position not found")
+        if "takeProfit" in params:
+            position["take_profit"] = params["takeProfit"]
+        if "stopLoss" in params:
+            position["stop_loss"] = params["stopLoss"]
+        return _ok(None)
+
+    # ==================== Accounting ====================
+
+    def _apply_fill(self, fill: Fill) -> None:
+        order = self.orders[fill.order_id]
+        filled_before = order["filledQuantity"]
+        order["filledQuantity"] = filled_before + fill.quantity
+        order["avgPrice"] = (
+            filled_before * order["avgPrice"] + fill.quantity * fill.average_price
+        ) / order["filledQuantity"]
+        order["status"] = "filled" if order["filledQuantity"] >= order["quantity"] - 1e-12 else "partial_filled"
+        self.stats["fills"] += 1
+
+        symbol = order["symbol"]
+        signed = fill.quantity if order["side"] == "buy" else -fill.quantity
+        position = self.positions.setdefault(symbol, {"quantity": 0.0, "avg_price": 0.0})
+        quantity = position["quantity"]
+        self.balance -= fill.quantity * fill.average_price * TAKER_FEE
+
+        if quantity == 0 or (quantity > 0) == (signed > 0):
+            total = abs(quantity) + fill.quantity
+            position["avg_price"] = (abs(quantity) * position["avg_price"] + fill.quantity * fill.average_price) / total
+        else:
+            closing = min(abs(quantity), fill.quantity)
+            direction = 1.0 if quantity > 0 else -1.0
+            self.balance += closing * (fill.average_price - position["avg_price"]) * direction
+            if fill.quantity > closing:
+                position["avg_price"] = fill.average_price  # Position flipped
+
+        position["quantity"] = quantity + signed
+        if abs(position["quantity"]) < 1e-12:
+            del self.positions[symbol]
+
+    def _unrealized_pnl(self, symbol: str) -> float:
+        position = self.positions[symbol]
+        return position["quantity"] * (self.feed.price(symbol) - position["avg_price"])
+
+    # ==================== WebSocket ====================
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._sockets[ws] = {}
+        self.stats["ws_connections"] += 1
+        subscribed = False
+
+        try:
+            await ws.send_str(json.dumps({"op": "connect", "data": {"result": True}}))
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    payload = json.loads(msg.data)
+                except json.JSONDecodeError:
+                    await ws.send_str(json.dumps({"op": "error", "code": 10001, "msg": "Invalid JSON"}))
+                    continue
+
+                op = payload.get("op")
+                if op == "ping":
+                    await ws.send_str(json.dumps({"op": "ping", "ping": payload.get("ping"), "pong": int(time.time())}))
+                elif op in ("subscribe", "unsubscribe"):
+                    channels = self._sockets.get(ws, {})
+                    for arg in payload.get("args", []):
+                        symbol_channels = channels.setdefault(arg.get("symbol", ""), set())
+                        if op == "subscribe":
+                            symbol_channels.add(arg.get("ch", ""))
+                        else:
+                            symbol_channels.discard(arg.get("ch", ""))
+                    if op == "subscribe" and not subscribed:
+                        subscribed = True
+                        self.stats["ws_subscribed_sessions"] += 1
+                    await ws.send_str(json.dumps({"op": op, "args": payload.get("args", []), "success": True}))
+        finally:
+            self._sockets.pop(ws, None)
+        return ws
+
+    async def drop_connections(self, count: bool = True) -> int:
+        """Close all WebSocket connections (simulated exchange-side disconnect)."""
+        sockets = list(self._sockets)
+        for ws in sockets:
+            self._sockets.pop(ws, None)
+            await ws.close(code=WSCloseCode.GOING_AWAY, message=b"Server restart")
+        if count and sockets:
+            self.stats["ws_disconnects_injected"] += 1
+        return len(sockets)
+
+    async def _run_disconnects(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.disconnect_every_s)
+            dropped = await self.drop_connections()
+            logger.info(f"Mock exchange: dropped {dropped} stream connections")
+
+    # ==================== Market Feed ====================
+
+    async def _run_feed(self) -> None:
+        """Produce updates at ``message_rate`` per symbol, batched per wake-up."""
+        rate = self.config.message_rate
+        max_batch = max(1, int(rate * 0.05))  # Don't flush more than 50 ms of backlog at once
+        started = time.perf_counter()
+        steps = 0
+
+        while True:
+            due = int((time.perf_counter() - started) * rate) - steps
+            if due <= 0:
+                await asyncio.sleep(max(0.001, 1.0 / rate))
+                continue
+
+            batch = min(due, max_batch)
+            for _ in range(batch):
+                now_ms = int(time.time() * 1000)
+                for symbol in self.feed.symbols:
+                    update = self.feed.step(symbol, now_ms)
+                    for fill in self.books[symbol].move(update.close):
+                        self._apply_fill(fill)
+                    await self._publish(update)
+            self.stats["feed_updates"] += batch * len(self.feed.symbols)
+            steps += batch
+            if due - batch > rate:
+                # More than a second behind: skip the backlog instead of bursting it later
+                self.stats["feed_updates_skipped"] += (due - batch) * len(self.feed.symbols)
+                steps += due - batch
+            await asyncio.sleep(0)
+
+    async def _publish(self, update: FeedUpdate) -> None:
+        messages: dict[str, str] = {}
+        for ws, channels in list(self._sockets.items()):
+            for channel in channels.get(update.symbol, ()):
+                message = messages.get(channel)
+                if message is None:
+                    message = messages[channel] = json.dumps(self._channel_message(channel, update))
+                try:
+                    await ws.send_str(message)
+                    self.stats["ws_messages_sent"] += 1
+                except ConnectionError:
+                    self._sockets.pop(ws, None)
+                    break
+
+    def _channel_message(self, channel: str, update: FeedUpdate) -> dict[str, Any]:
+        base = {"ch": channel, "symbol": update.symbol, "ts": update.ts_ms}
+        if "kline" in channel:
+            base["data"] = {
+                "o": str(update.open), "h": str(update.high), "l": str(update.low), "c": str(update.close),
+                "b": str(update.volume), "q": str(update.volume * update.close),
+            }
+        elif channel == "ticker":
+            base["data"] = {
+                "symbol": update.symbol, "lastPrice": str(update.close), "markPrice": str(update.close),
+                "open": str(update.open), "high": str(update.high), "low": str(update.low),
+                "baseVol": str(update.volume), "quoteVol": str(update.volume * update.close),
+            }
+        elif channel == "trade":
+            base["data"] = [{
+                "t": update.ts_ms, "p": str(update.close), "v": str(update.trade_volume),
+                "s": "buy" if update.close >= update.open else "sell",
+            }]
+        elif "depth" in channel:
+            depth = self.books[update.symbol].snapshot()
+            base["data"] = {
+                "b": [[str(p), str(s)] for p, s in depth["bids"][:5]],
+                "a": [[str(p), str(s)] for p, s in depth["asks"][:5]],
+            }
+        else:
+            base["data"] = {}
+        return base
@@ -0,0 +1,280 @@
+"""Mock Exchange - Load Test Scenarios.
+
+Drives the real BitunixStreamClient and BitunixAdapter against a local
+MockExchangeServer and reports end-to-end throughput and latency.
+
+Contains:
+- LoadTestReport: Result of one scenario
+- run_stream_load: WebSocket feed -> message handlers -> event bus
+- run_order_load: Signed REST order flow with retries on injected errors
+
+Usage:
+    python -m src.core.mock_exchange.load_test stream --rate 5000 --duration 10 --disconnect-every 4
+    python -m src.core.mock_exchange.load_test orders --orders 2000 --concurrency 50 --error-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from src.common.event_bus import Event, EventType, event_bus
+from src.common.http_pool import EndpointStats, get_http_pool
+from src.core.broker.bitunix_adapter import BitunixAdapter
+from src.core.broker.broker_types import BrokerError, OrderRequest
+from src.core.market_data.bitunix_stream import BitunixStreamClient
+from src.database.models import OrderSide, OrderType
+
+from .exchange_config import MockExchangeConfig
+from .exchange_server import MockExchangeServer
+
+logger = logging.getLogger(__name__)
+
+LATENCY_WINDOW = 100_000
+
+
+@dataclass
+class LoadTestReport:
+    """Throughput and latency of one load test scenario."""
+
+    scenario: str
+    duration_s: float
+    operations: int  # Tick events delivered / orders acknowledged
+    throughput_per_s: float
+    latency: dict[str, float]  # count, errors, mean_ms, p50_ms, p95_ms
+    errors: int = 0
+    details: dict[str, Any] = field(default_factory=dict)
+
+    def format(self) -> str:
+        lines = [
+            f"Scenario:   {self.scenario}",
+            f"Duration:   {self.duration_s:.2f}s",
+            f"Operations: {self.operations} ({self.throughput_per_s:.0f}/s)",
+            f"Latency:    mean {self.latency['mean_ms']:.2f}ms, "
+            f"p50 {self.latency['p50_ms']:.2f}ms, p95 {self.latency['p95_ms']:.2f}ms",
+            f"Errors:     {self.errors}",
+        ]
+        lines.extend(f"  {key}: {value}" for key, value in self.details.items())
+        return "\n".join(lines)
+
+
+async def run_stream_load(
+    config: MockExchangeConfig | None = None,
+    duration_s: float = 5.0,
+    clients: int = 1,
+) -> LoadTestReport:
+    """Stream market data through BitunixStreamClient.
+
+    Operations are tick events delivered on the event bus (kline and
+    ticker messages). Latency is measured from the exchange timestamp of
+    each kline message to its delivery (decode + handler + emit).
+
+    Args:
+        config: Exchange settings (rate, symbols, disconnects, ...)
+        duration_s: Streaming time
+        clients: Number of concurrent stream clients
+
+    Returns:
+        Report; ``details["reconnects"]`` counts supervisor reconnects
+    """
+    config = config or MockExchangeConfig()
+    server = MockExchangeServer(config)
+    await server.start()
+
+    latency = EndpointStats(LATENCY_WINDOW)
+    delivered = 0
+    stream_clients: list[BitunixStreamClient] = []
+
+    def on_tick(event: Event) -> None:
+        nonlocal delivered
+        if event.source != "Bitunix Stream":
+            return
+        delivered += 1
+        if "open" in event.data:  # Kline: carries the exchange timestamp
+            latency.record((time.time() - event.data["timestamp"].timestamp()) * 1000)
+
+    event_bus.subscribe(EventType.MARKET_DATA_TICK, on_tick)
+    try:
+        for _ in range(clients):
+            client = BitunixStreamClient()
+            client.ws_url = server.ws_url
+            await client.subscribe(config.symbols)  # Sent by the supervisor after connecting
+            await client.connect()
+            stream_clients.append(client)
+
+        delivered = 0  # Count from the start of the measured window
+        started = time.perf_counter()
+        await asyncio.sleep(duration_s)
+        elapsed = time.perf_counter() - started
+    finally:
+        for client in stream_clients:
+            supervisor = client._stream_task
+            await client.disconnect()
+            if supervisor:
+                await asyncio.wait({supervisor}, timeout=2.0)
+        event_bus.unsubscribe(EventType.MARKET_DATA_TICK, on_tick)
+        await server.stop()
+
+    stats = server.get_stats()
+    return LoadTestReport(
+        scenario=f"stream ({clients} client(s), {config.message_rate:.0f} updates/s x {len(config.symbols)} symbols)",
+        duration_s=elapsed,
+        operations=delivered,
+        throughput_per_s=delivered / elapsed if elapsed else 0.0,
+        latency=latency.snapshot(),
+        errors=sum(client.metrics.messages_dropped for client in stream_clients),
+        details={
+            "messages_sent": stats["ws_messages_sent"],
+            "feed_updates_skipped": stats["feed_updates_skipped"],
+            "disconnects_injected": stats["ws_disconnects_injected"],
+            "reconnects": max(0, stats["ws_subscribed_sessions"] - clients),
+            "max_frame_batch": max(client._connection.max_batch_size for client in stream_clients),
+            "parse_us": stream_clients[0]._messages.decoder.get_stats() if stream_clients else {},
+        },
+    )
+
+
+async def run_order_load(
+    config: MockExchangeConfig | None = None,
+    orders: int = 500,
+    concurrency: int = 20,
+    max_retries: int = 3,
+    limit_every: int = 10,
+) -> LoadTestReport:
+    """Place signed orders through BitunixAdapter.
+
+    Failed placements (e.g. injected HTTP 503s) are retried with exponential
+    backoff, scaled down from the execution engine's policy so a run stays
+    short. Every ``limit_every``-th order is a passive limit order that
+    rests in the book; the run ends with a concurrent account refresh.
+
+    Args:
+        config: Exchange settings (latency, error rate, ...)
+        orders: Orders to place
+        concurrency: Orders in flight at once
+        max_retries: Retries per order before it counts as failed
+        limit_every: Interval of resting limit orders (0 = market only)
+
+    Returns:
+        Report with placement latency per successful attempt
+    """
+    config = config or MockExchangeConfig()
+    server = MockExchangeServer(config)
+    await server.start()
+
+    adapter = BitunixAdapter(config.api_key, config.api_secret)
+    adapter.base_url = server.base_url
+    latency = EndpointStats(LATENCY_WINDOW)
+    semaphore = asyncio.Semaphore(concurrency)
+    retries = 0
+    failed = 0
+
+    async def place(index: int) -> None:
+        nonlocal retries, failed
+        symbol = config.symbols[index % len(config.symbols)]
+        side = OrderSide.BUY if index % 2 == 0 else OrderSide.SELL
+        if limit_every and index % limit_every == 0:
+            # Far below the market: rests until cancelled
+            price = Decimal(str(round(server.feed.price(symbol) * 0.5, 1)))
+            order = OrderRequest(symbol=symbol, side=OrderSide.BUY, order_type=OrderType.LIMIT,
+                                 quantity=Decimal("0.01"), limit_price=price)
+        else:
+            order = OrderRequest(symbol=symbol, side=side, order_type=OrderType.MARKET, quantity=Decimal("0.01"))
+
+        async with semaphore:
+            for attempt in range(max_retries + 1):
+                started = time.perf_counter()
+                try:
+                    await adapter.place_order(order)
+                    latency.record((time.perf_counter() - started) * 1000)
+                    return
+                except BrokerError:
+                    latency.record((time.perf_counter() - started) * 1000, ok=False)
+                    if attempt == max_retries:
+                        failed += 1
+                        return
+                    retries += 1
+                    await asyncio.sleep(0.01 * 2 ** attempt)
+
+    error_rate, config.error_rate = config.error_rate, 0.0
+    try:
+        await adapter.connect()  # Credential check must not hit an injected error
+        config.error_rate = error_rate
+
+        started = time.perf_counter()
+        await asyncio.gather(*(place(i) for i in range(orders)))
+        elapsed = time.perf_counter() - started
+
+        config.error_rate = 0.0
+        snapshot = await adapter.refresh_account()
+    finally:
+        config.error_rate = error_rate
+        await adapter.disconnect()
+        await server.stop()
+
+    stats = server.get_stats()
+    return LoadTestReport(
+        scenario=f"orders ({orders} orders, concurrency {concurrency})",
+        duration_s=elapsed,
+        operations=orders - failed,
+        throughput_per_s=(orders - failed) / elapsed if elapsed else 0.0,
+        latency=latency.snapshot(),
+        errors=failed,
+        details={
+            "retries": retries,
+            "errors_injected": stats["rest_errors_injected"],
+            "signature_errors": stats["signature_errors"],
+            "fills": stats["fills"],
+            "open_orders": len(snapshot.open_orders),
+            "positions": len(snapshot.positions),
+            "account_refresh_ms": round(snapshot.latency_ms, 2),
+        },
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test the Bitunix order and stream paths against a local mock exchange")
+    parser.add_argument("--symbols", default="BTCUSDT", help="Comma-separated symbols")
+    parser.add_argument("--seed", type=int, default=None)
+    sub = parser.add_subparsers(dest="scenario", required=True)
+
+    stream = sub.add_parser("stream", help="WebSocket market data throughput")
+    stream.add_argument("--rate", type=float, default=1000.0, help="Updates per second and symbol")
+    stream.add_argument("--duration", type=float, default=5.0)
+    stream.add_argument("--clients", type=int, default=1)
+    stream.add_argument("--disconnect-every", type=float, default=None, help="Drop streams every N seconds")
+
+    orders = sub.add_parser("orders", help="REST order placement throughput")
+    orders.add_argument("--orders", type=int, default=500)
+    orders.add_argument("--concurrency", type=int, default=20)
+    orders.add_argument("--latency-ms", type=float, default=0.0)
+    orders.add_argument("--jitter-ms", type=float, default=0.0)
+    orders.add_argument("--error-rate", type=float, default=0.0)
+
+    args = parser.parse_args(argv)
+    config = MockExchangeConfig(symbols=args.symbols.split(","), seed=args.seed)
+
+    async def run() -> LoadTestReport:
+        try:
+            if args.scenario == "stream":
+                config.message_rate = args.rate
+                config.disconnect_every_s = args.disconnect_every
+                return await run_stream_load(config, args.duration, args.clients)
+            config.latency_ms = args.latency_ms
+            config.latency_jitter_ms = args.jitter_ms
+            config.error_rate = args.error_rate
+            return await run_order_load(config, args.orders, args.concurrency)
+        finally:
+            await get_http_pool().close()
+
+    logging.basicConfig(level=logging.WARNING)
+    print(asyncio.run(run()).format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Mock Exchange - Market Feed.
+
+Contains:
+- FeedUpdate: One price update of a symbol
+- MarketFeed: Synthetic random-walk or replayed kline source
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass
+class FeedUpdate:
+    """Forming 1-minute candle of a symbol after one price update."""
+
+    symbol: str
+    ts_ms: int  # Time the update was produced (not the candle start)
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float  # Candle volume so far
+    trade_volume: float  # Volume of this update
+
+
+class MarketFeed:
+    """Source of price updates for the mock exchange.
+
+    Synthetic mode runs a seeded random walk per symbol and aggregates it
+    into wall-clock minute candles. Replay mode cycles through recorded
+    OHLCV frames, one row per update.
+    """
+
+    def __init__(
+        self,
+        symbols: list[str],
+        start_price: float = 50000.0,
+        volatility: float = 0.0005,
+        seed: int | None = None,
+    ):
+        self.symbols = list(symbols)
+        self.volatility = volatility
+        self._random = random.Random(seed)
+        self._prices = {symbol: start_price for symbol in self.symbols}
+        self._candles: dict[str, FeedUpdate] = {}
+        self._replay: dict[str, tuple[list[tuple[float, ...]], int]] = {}
+
+    @classmethod
+    def from_frames(cls, frames: dict[str, pd.DataFrame]) -> MarketFeed:
+        """Replay recorded klines.
+
+        Args:
+            frames: Symbol -> DataFrame with open/high/low/close/volume columns
+
+        Returns:
+            Feed cycling through the rows of each frame
+        """
+        feed = cls(list(frames))
+        for symbol, df in frames.items():
+            rows = [tuple(map(float, row)) for row in df[["open", "high", "low", "close", "volume"]].to_numpy()]
+            if not rows:
+                raise ValueError(f"Empty replay frame for {symbol}")
+            feed._replay[symbol] = (rows, 0)
+            feed._prices[symbol] = rows[0][3]
+        return feed
+
+    def price(self, symbol: str) -> float:
+        """Last price of ``symbol``."""
+        return self._prices[symbol]
+
+    def step(self, symbol: str, now_ms: int | None = None) -> FeedUpdate:
+        """Produce the next update of ``symbol``."""
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        if symbol in self._replay:
+            return self._step_replay(symbol, now_ms)
+
+        price = self._prices[symbol] * (1.0 + self._random.gauss(0.0, self.volatility))
+        self._prices[symbol] = price
+        trade_volume = round(self._random.uniform(0.001, 0.5), 3)
+
+        candle = self._candles.get(symbol)
+        if candle is None or candle.ts_ms // 60_000 != now_ms // 60_000:
+            candle = FeedUpdate(symbol, now_ms, price, price, price, price, 0.0, 0.0)
+            self._candles[symbol] = candle
+        candle.ts_ms = now_ms
+        candle.high = max(candle.high, price)
+        candle.low = min(candle.low, price)
+        candle.close = price
+        candle.volume += trade_volume
+        candle.trade_volume = trade_volume
+        return FeedUpdate(**vars(candle))
+
+    def _step_replay(self, symbol: str, now_ms: int) -> FeedUpdate:
+        rows, index = self._replay[symbol]
+        open_, high, low, close, volume = rows[index]
+        self._replay[symbol] = (rows, (index + 1) % len(rows))
+        self._prices[symbol] = close
+        return FeedUpdate(symbol, now_ms, open_, high, low, close, volume, volume)
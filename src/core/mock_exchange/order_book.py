@@ -0,0 +1,131 @@
+"""Mock Exchange - Simulated Order Book.
+
+Contains:
+- Fill: Result of matching an order
+- SimulatedOrderBook: Synthetic depth around the last price with resting limit orders
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Fill:
+    """Executed part of an order."""
+
+    order_id: str
+    quantity: float
+    average_price: float
+
+
+class SimulatedOrderBook:
+    """Synthetic order book for one symbol.
+
+    Levels are laid out every ``tick_size`` on both sides of the last price,
+    each holding ``level_size``. Market orders walk the levels (slippage and
+    partial fills for orders larger than the book); liquidity taken from a
+    level is restored when the price moves. Limit orders that are not
+    marketable rest until the price crosses them.
+    """
+
+    def __init__(self, price: float, depth: int = 20, tick_size: float = 0.5, level_size: float = 2.0):
+        self.depth = depth
+        self.tick_size = tick_size
+        self.level_size = level_size
+        self.price = price
+        self._taken: dict[tuple[str, int], float] = {}  # (side, level) -> quantity consumed
+        self._resting: dict[str, dict] = {}  # order_id -> {"side", "price", "quantity"}
+
+    # ==================== Prices ====================
+
+    def level_price(self, side: str, level: int) -> float:
+        """Price of ``level`` (0 = best) on the ask ("sell") or bid ("buy") side."""
+        offset = self.tick_size * (level + 1)
+        return self.price + offset if side == "sell" else self.price - offset
+
+    def best_bid(self) -> float:
+        return self.level_price("buy", 0)
+
+    def best_ask(self) -> float:
+        return self.level_price("sell", 0)
+
+    def snapshot(self) -> dict[str, list[list[float]]]:
+        """Depth as ``{"bids": [[price, size], ...], "asks": [...]}``."""
+        return {
+            "bids": [[self.level_price("buy", i), self._available("buy", i)] for i in range(self.depth)],
+            "asks": [[self.level_price("sell", i), self._available("sell", i)] for i in range(self.depth)],
+        }
+
+    def _available(self, side: str, level: int) -> float:
+        return self.level_size - self._taken.get((side, level), 0.0)
+
+    # ==================== Matching ====================
+
+    def execute(self, order_id: str, side: str, quantity: float, limit_price: float | None = None) -> Fill | None:
+        """Match an incoming order against the book.
+
+        Args:
+            order_id: Exchange order ID
+            side: "buy" or "sell"
+            quantity: Order quantity
+            limit_price: Limit price (None for market orders)
+
+        Returns:
+            Fill for the executed part, or None if nothing executed. The
+            unfilled rest of a limit order rests in the book.
+        """
+        book_side = "sell" if side == "buy" else "buy"  # Buys take asks, sells take bids
+        remaining = quantity
+        notional = 0.0
+
+        for level in range(self.depth):
+            if remaining <= 0:
+                break
+            price = self.level_price(book_side, level)
+            if limit_price is not None and (price > limit_price if side == "buy" else price < limit_price):
+                break
+            take = min(remaining, self._available(book_side, level))
+            if take <= 0:
+                continue
+            self._taken[(book_side, level)] = self._taken.get((book_side, level), 0.0) + take
+            notional += take * price
+            remaining -= take
+
+        if limit_price is not None and remaining > 0:
+            self._resting[order_id] = {"side": side, "price": limit_price, "quantity": remaining}
+
+        filled = quantity - remaining
+        if filled <= 0:
+            return None
+        return Fill(order_id, filled, notional / filled)
+
+    def cancel(self, order_id: str) -> bool:
+        """Remove a resting order."""
+        return self._resting.pop(order_id, None) is not None
+
+    def resting_orders(self) -> dict[str, dict]:
+        return dict(self._resting)
+
+    def move(self, price: float) -> list[Fill]:
+        """Move the book to a new last price.
+
+        Consumed liquidity is restored and resting orders crossed by the
+        new best bid/ask are filled at their limit price.
+
+        Returns:
+            Fills of resting orders
+        """
+        self.price = price
+        self._taken.clear()
+
+        fills = []
+        for order_id, order in list(self._resting.items()):
+            crossed = (
+                order["price"] >= self.best_ask() if order["side"] == "buy"
+                else order["price"] <= self.best_bid()
+            )
+            if crossed:
+                del self._resting[order_id]
+                fills.append(Fill(order_id, order["quantity"], order["price"]))
+        return fills
@@ -31,6 +31,7 @@ import optuna
 import pandas as pd
 from optuna.pruners import HyperbandPruner
 from optuna.samplers import TPESampler
+from optuna.trial import TrialState
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from sklearn.metrics import f1_score
 
@@ -51,7 +52,12 @@ except ImportError:
 from src.core.indicators.momentum import MomentumIndicators
 from src.core.indicators.trend import TrendIndicators
 from src.core.indicators.volatility import VolatilityIndicators
-from src.core.scoring import calculate_regime_score, RegimeScoreConfig, RegimeScoreResult
+from src.core.scoring import (
+    RegimeScoreConfig,
+    RegimeScoreResult,
+    build_default_features,
+    calculate_regime_score,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -212,6 +218,10 @@ class OptimizationConfig(BaseModel):
     n_jobs: int = -1
     storage: str | None = None
     seed: int = 42
+    # Approximate RegimeScore per trial (see src.core.scoring fast mode)
+    fast_scoring: bool = True
+    # Best fast-scored trials re-scored in exact mode before ranking
+    exact_rescore_top_n: int = Field(default=10, ge=0)
 
     model_config = ConfigDict(frozen=True)
 
@@ -393,6 +403,8 @@ class RegimeOptimizer:
     _indicator_name_to_type: dict[str, str] = field(default_factory=dict, init=False, repr=False)
     # Trial-suggested parameter values for JSON mode (filled by _suggest_json_params)
     _trial_params: dict[str, float | int] = field(default_factory=dict, init=False, repr=False)
+    # Default scoring features (identical for every trial, built once)
+    _score_features: pd.DataFrame | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         """Validate data and setup storage."""
@@ -1702,6 +1714,85 @@ class RegimeOptimizer:
 
         return periods
 
+    def _score_regimes(
+        self,
+        params: RegimeParams,
+        regimes_series: pd.Series,
+        fast_mode: bool,
+        log: bool = False,
+    ) -> RegimeScoreResult:
+        """Calculate the 5-component RegimeScore of a classification.
+
+        Args:
+            params: Regime parameters (indicator periods set the feature lookback)
+            regimes_series: Regime label per bar
+            fast_mode: Approximate score (optimizer trials) or exact score
+            log: Log the scoring setup (first trial)
+
+        Returns:
+            RegimeScore result
+        """
+        # Calculate new 5-component RegimeScore
+        # Adaptive warmup/lookback: Scale with data size
+        data_len = len(self.data)
+
+        # Warmup: Max 10% of data, capped at 200
+        warmup_bars = min(200, max(50, data_len // 10))
+
+        # Feature lookback: Max of indicator periods, but capped to leave enough data
+        period_candidates = [
+            params.adx_period,
+            params.rsi_period,
+            params.atr_period,
+            params.sma_fast_period,
+            params.sma_slow_period,
+            params.bb_period,
+        ]
+        max_indicator_period = max([p for p in period_candidates if p is not None] or [params.adx_period])
+        # Cap lookback to leave at least 60% of data for scoring
+        max_feature_lookback = min(max_indicator_period, data_len // 4)
+
+        # Log first trial for debugging
+        if log:
+            logger.info(
+                f"Trial 0 config: data_len={data_len}, warmup={warmup_bars}, "
+                f"lookback={max_feature_lookback}, max_indicator={max_indicator_period}"
+            )
+
+        # Create score config - use JSON weights if available
+        if self.json_config is not None:
+            # Load weights from JSON evaluation_params.score_weights
+            score_config = RegimeScoreConfig.from_json_config(self.json_config)
+            if log:
+                logger.info(
+                    f"Using score weights from JSON: "
+                    f"sep={score_config.w_separability:.2f}, coh={score_config.w_coherence:.2f}, "
+                    f"fid={score_config.w_fidelity:.2f}, bnd={score_config.w_boundary:.2f}, "
+                    f"cov={score_config.w_coverage:.2f}"
+                )
+        else:
+            score_config = RegimeScoreConfig()
+
+        # Override data-specific parameters
+        score_config.warmup_bars = warmup_bars
+        score_config.max_feature_lookback = max_feature_lookback
+
+        # Relax gates for small datasets and high-frequency data (scalping)
+        score_config.min_segments = max(3, data_len // 200)  # Reduced: 3 segments per 200 bars
+        score_config.min_avg_duration = 2  # Reduced from 3 - allow shorter regimes for scalping
+        score_config.max_switch_rate_per_1000 = 500  # Increased from 80 - scalping has high switch rates
+        score_config.min_unique_labels = 2  # Must have at least 2 regimes
+        score_config.min_bars_for_scoring = max(30, data_len // 10)  # Scale with data size
+        score_config.fast_mode = fast_mode
+        if self._score_features is None:
+            self._score_features = build_default_features(self.data)
+        return calculate_regime_score(
+            data=self.data,
+            regimes=regimes_series,
+            features=self._score_features,
+            config=score_config,
+        )
+
     def _objective(self, trial: optuna.Trial) -> float:
         """Optimization objective function using 5-component RegimeScore.
 
@@ -1742,61 +1833,8 @@ class RegimeOptimizer:
             # Convert regimes to Series for scoring
             regimes_series = pd.Series(regimes, index=self.data.index)
 
-            # Calculate new 5-component RegimeScore
-            # Adaptive warmup/lookback: Scale with data size
-            data_len = len(self.data)
-
-            # Warmup: Max 10% of data, capped at 200
-            warmup_bars = min(200, max(50, data_len // 10))
-
-            # Feature lookback: Max of indicator periods, but capped to leave enough data
-            period_candidates = [
-                params.adx_period,
-                params.rsi_period,
-                params.atr_period,
-                params.sma_fast_period,
-                params.sma_slow_period,
-                params.bb_period,
-            ]
-            max_indicator_period = max([p for p in period_candidates if p is not None] or [params.adx_period])
-            # Cap lookback to leave at least 60% of data for scoring
-            max_feature_lookback = min(max_indicator_period, data_len // 4)
-
-            # Log first trial for debugging
-            if trial.number == 0:
-                logger.info(
-                    f"Trial 0 config: data_len={data_len}, warmup={warmup_bars}, "
-                    f"lookback={max_feature_lookback}, max_indicator={max_indicator_period}"
-                )
-
-            # Create score config - use JSON weights if available
-            if self.json_config is not None:
-                # Load weights from JSON evaluation_params.score_weights
-                score_config = RegimeScoreConfig.from_json_config(self.json_config)
-                if trial.number == 0:
-                    logger.info(
-                        f"Using score weights from JSON: "
-                        f"sep={score_config.w_separability:.2f}, coh={score_config.w_coherence:.2f}, "
-                        f"fid={score_config.w_fidelity:.2f}, bnd={score_config.w_boundary:.2f}, "
-                        f"cov={score_config.w_coverage:.2f}"
-                    )
-            else:
-                score_config = RegimeScoreConfig()
-
-            # Override data-specific parameters
-            score_config.warmup_bars = warmup_bars
-            score_config.max_feature_lookback = max_feature_lookback
-
-            # Relax gates for small datasets and high-frequency data (scalping)
-            score_config.min_segments = max(3, data_len // 200)  # Reduced: 3 segments per 200 bars
-            score_config.min_avg_duration = 2  # Reduced from 3 - allow shorter regimes for scalping
-            score_config.max_switch_rate_per_1000 = 500  # Increased from 80 - scalping has high switch rates
-            score_config.min_unique_labels = 2  # Must have at least 2 regimes
-            score_config.min_bars_for_scoring = max(30, data_len // 10)  # Scale with data size
-            score_result = calculate_regime_score(
-                data=self.data,
-                regimes=regimes_series,
-                config=score_config,
+            score_result = self._score_regimes(
+                params, regimes_series, fast_mode=self.config.fast_scoring, log=trial.number == 0
             )
 
             # If gates failed, log details and return 0
@@ -1885,27 +1923,151 @@ class RegimeOptimizer:
         logger.info(f"Optimization completed in {duration:.2f}s")
 
         # Extract results
+        self._rescore_top_trials()
         results = self._extract_results()
 
         # Store best regime periods
         if results:
-            best_params = results[0].params
-            if self.json_config is not None:
-                # JSON mode: Reload best trial's JSON params
-                if self._study and self._study.best_trial:
-                    self._load_trial_params(self._study.best_trial)
-                indicators = self._calculate_json_indicators(best_params)
-                regimes = self._classify_regimes_json(best_params, indicators)
-            else:
-                # Legacy mode
-                indicators = self._calculate_indicators(best_params)
-                regimes = self._classify_regimes(best_params, indicators)
+            best_trial = self._ranked_trials()[0]
+            regimes = self._classify_trial(best_trial, results[0].params)
             self._best_regime_periods = self._extract_regime_periods(regimes)
 
         logger.info(f"Best score: {results[0].score:.2f}" if results else "No results")
 
         return results
 
+    def load_results(self, study_name: str) -> list[OptimizationResult]:
+        """Load results of an existing study from storage (e.g. a checkpointed
+        or externally optimized study).
+
+        Args:
+            study_name: Name of the study in config.storage
+
+        Returns:
+            List of optimization results sorted by score
+
+        Raises:
+            KeyError: If the study does not exist
+        """
+        self._study = optuna.load_study(study_name=study_name, storage=self.config.storage)
+        self._rescore_top_trials()
+        return self._extract_results()
+
+    def _classify_trial(self, trial: optuna.trial.FrozenTrial, params: RegimeParams) -> pd.Series:
+        """Recalculate the regime classification of a finished trial.
+
+        Args:
+            trial: Finished Optuna trial (JSON mode params are reloaded from it)
+            params: Regime parameters of the trial
+
+        Returns:
+            Regime label per bar
+        """
+        if self.json_config is not None:
+            # JSON mode: Reload trial's JSON params
+            self._load_trial_params(trial)
+            indicators = self._calculate_json_indicators(params)
+            return self._classify_regimes_json(params, indicators)
+        # Legacy mode
+        indicators = self._calculate_indicators(params)
+        return self._classify_regimes(params, indicators)
+
+    def _rescore_top_trials(self) -> None:
+        """Re-score the best fast-scored trials in exact mode.
+
+        Fast mode only approximates separability and boundary strength, so
+        trial values are not exact. The ``exact_rescore_top_n`` best trials
+        are scored again with ``fast_mode=False``; score and components are
+        stored in the study user attr ``exact_scores`` (keyed by trial
+        number), which _ranked_trials and _extract_results use for ranking
+        and reporting.
+        """
+        if self._study is None or not self.config.fast_scoring or self.config.exact_rescore_top_n == 0:
+            return
+
+        completed = self._study.get_trials(deepcopy=False, states=(TrialState.COMPLETE,))
+        top_trials = sorted(completed, key=lambda t: t.value, reverse=True)[: self.config.exact_rescore_top_n]
+        exact_scores = dict(self._study.user_attrs.get("exact_scores", {}))
+        missing = [t for t in top_trials if str(t.number) not in exact_scores]
+        if not missing:
+            return
+
+        for trial in missing:
+            params = self._params_from_trial(trial)
+            regimes_series = pd.Series(self._classify_trial(trial, params), index=self.data.index)
+            score_result = self._score_regimes(params, regimes_series, fast_mode=False)
+            exact_scores[str(trial.number)] = {
+                "score": score_result.total_score if score_result.gates_passed else 0.0,
+                "separability": score_result.separability.normalized,
+                "coherence": score_result.coherence.normalized,
+                "fidelity": score_result.fidelity.normalized,
+                "boundary": score_result.boundary.normalized,
+                "coverage": score_result.coverage.normalized,
+            }
+        self._study.set_user_attr("exact_scores", exact_scores)
+        logger.info(f"Re-scored top {len(missing)} trials in exact mode")
+
+    def _ranked_trials(self) -> list[optuna.trial.FrozenTrial]:
+        """Finished trials sorted by score, best first.
+
+        Exactly re-scored trials rank ahead of the remaining trials (by exact
+        score), since the approximate values are not comparable to them.
+        """
+        if self._study is None:
+            return []
+        exact_scores = self._study.user_attrs.get("exact_scores", {})
+
+        def sort_key(trial: optuna.trial.FrozenTrial) -> tuple[bool, float]:
+            exact = exact_scores.get(str(trial.number))
+            if exact is not None:
+                return True, exact["score"]
+            return False, trial.value or 0.0
+
+        trials = [t for t in self._study.trials if t.value is not None]
+        return sorted(trials, key=sort_key, reverse=True)
+
+    def _params_from_trial(self, trial: optuna.trial.FrozenTrial) -> RegimeParams:
+        """Build RegimeParams from the stored params of a finished trial."""
+        params_kwargs = {"adx_period": trial.params["adx_period"], "rsi_period": trial.params["rsi_period"]}
+
+        # Simple mode keys (present in tests)
+        if "adx_threshold" in trial.params:
+            params_kwargs["adx_threshold"] = trial.params["adx_threshold"]
+        if "sma_fast_period" in trial.params:
+            params_kwargs["sma_fast_period"] = trial.params["sma_fast_period"]
+        if "sma_slow_period" in trial.params:
+            params_kwargs["sma_slow_period"] = trial.params["sma_slow_period"]
+        if "rsi_sideways_low" in trial.params:
+            params_kwargs["rsi_sideways_low"] = trial.params["rsi_sideways_low"]
+        if "rsi_sideways_high" in trial.params:
+            params_kwargs["rsi_sideways_high"] = trial.params["rsi_sideways_high"]
+        if "bb_period" in trial.params:
+            params_kwargs["bb_period"] = trial.params["bb_period"]
+        if "bb_std_dev" in trial.params:
+            params_kwargs["bb_std_dev"] = trial.params["bb_std_dev"]
+        if "bb_width_percentile" in trial.params:
+            params_kwargs["bb_width_percentile"] = trial.params["bb_width_percentile"]
+
+        # Legacy ADX/DI keys
+        if "adx_trending_threshold" in trial.params:
+            params_kwargs["adx_trending_threshold"] = trial.params["adx_trending_threshold"]
+        if "adx_weak_threshold" in trial.params:
+            params_kwargs["adx_weak_threshold"] = trial.params["adx_weak_threshold"]
+        if "di_diff_threshold" in trial.params:
+            params_kwargs["di_diff_threshold"] = trial.params["di_diff_threshold"]
+        if "rsi_strong_bull" in trial.params:
+            params_kwargs["rsi_strong_bull"] = trial.params["rsi_strong_bull"]
+        if "rsi_strong_bear" in trial.params:
+            params_kwargs["rsi_strong_bear"] = trial.params["rsi_strong_bear"]
+        if "atr_period" in trial.params:
+            params_kwargs["atr_period"] = trial.params["atr_period"]
+        if "strong_move_pct" in trial.params:
+            params_kwargs["strong_move_pct"] = trial.params["strong_move_pct"]
+        if "extreme_move_pct" in trial.params:
+            params_kwargs["extreme_move_pct"] = trial.params["extreme_move_pct"]
+
+        return RegimeParams(**params_kwargs)
+
     def _extract_results(self) -> list[OptimizationResult]:
         """Extract results from study.
 
@@ -1916,70 +2078,24 @@ class RegimeOptimizer:
             return []
 
         results = []
+        exact_scores = self._study.user_attrs.get("exact_scores", {})
 
-        for rank, trial in enumerate(
-            sorted(self._study.trials, key=lambda t: t.value or 0.0, reverse=True), start=1
-        ):
-            if trial.value is None:
-                continue
-            params_kwargs = {"adx_period": trial.params["adx_period"], "rsi_period": trial.params["rsi_period"]}
-
-            # Simple mode keys (present in tests)
-            if "adx_threshold" in trial.params:
-                params_kwargs["adx_threshold"] = trial.params["adx_threshold"]
-            if "sma_fast_period" in trial.params:
-                params_kwargs["sma_fast_period"] = trial.params["sma_fast_period"]
-            if "sma_slow_period" in trial.params:
-                params_kwargs["sma_slow_period"] = trial.params["sma_slow_period"]
-            if "rsi_sideways_low" in trial.params:
-                params_kwargs["rsi_sideways_low"] = trial.params["rsi_sideways_low"]
-            if "rsi_sideways_high" in trial.params:
-                params_kwargs["rsi_sideways_high"] = trial.params["rsi_sideways_high"]
-            if "bb_period" in trial.params:
-                params_kwargs["bb_period"] = trial.params["bb_period"]
-            if "bb_std_dev" in trial.params:
-                params_kwargs["bb_std_dev"] = trial.params["bb_std_dev"]
-            if "bb_width_percentile" in trial.params:
-                params_kwargs["bb_width_percentile"] = trial.params["bb_width_percentile"]
-
-            # Legacy ADX/DI keys
-            if "adx_trending_threshold" in trial.params:
-                params_kwargs["adx_trending_threshold"] = trial.params["adx_trending_threshold"]
-            if "adx_weak_threshold" in trial.params:
-                params_kwargs["adx_weak_threshold"] = trial.params["adx_weak_threshold"]
-            if "di_diff_threshold" in trial.params:
-                params_kwargs["di_diff_threshold"] = trial.params["di_diff_threshold"]
-            if "rsi_strong_bull" in trial.params:
-                params_kwargs["rsi_strong_bull"] = trial.params["rsi_strong_bull"]
-            if "rsi_strong_bear" in trial.params:
-                params_kwargs["rsi_strong_bear"] = trial.params["rsi_strong_bear"]
-            if "atr_period" in trial.params:
-                params_kwargs["atr_period"] = trial.params["atr_period"]
-            if "strong_move_pct" in trial.params:
-                params_kwargs["strong_move_pct"] = trial.params["strong_move_pct"]
-            if "extreme_move_pct" in trial.params:
-                params_kwargs["extreme_move_pct"] = trial.params["extreme_move_pct"]
-
-            params = RegimeParams(**params_kwargs)
+        for rank, trial in enumerate(self._ranked_trials(), start=1):
+            exact = exact_scores.get(str(trial.number))
+            params = self._params_from_trial(trial)
 
             # Recalculate metrics for this trial
-            if self.json_config is not None:
-                # JSON mode: Reload trial's JSON params
-                self._load_trial_params(trial)
-                indicators = self._calculate_json_indicators(params)
-                regimes = self._classify_regimes_json(params, indicators)
-            else:
-                # Legacy mode
-                indicators = self._calculate_indicators(params)
-                regimes = self._classify_regimes(params, indicators)
+            regimes = self._classify_trial(trial, params)
             metrics = self._calculate_metrics(regimes, params)
 
-            # Extract score components from user_attrs (saved during optimization)
-            separability = trial.user_attrs.get("separability", 0.0)
-            coherence = trial.user_attrs.get("coherence", 0.0)
-            fidelity = trial.user_attrs.get("fidelity", 0.0)
-            boundary = trial.user_attrs.get("boundary", 0.0)
-            coverage_comp = trial.user_attrs.get("coverage", 0.0)
+            # Score components: exact re-score if available, else from user_attrs
+            # (saved during optimization)
+            components = exact if exact is not None else trial.user_attrs
+            separability = components.get("separability", 0.0)
+            coherence = components.get("coherence", 0.0)
+            fidelity = components.get("fidelity", 0.0)
+            boundary = components.get("boundary", 0.0)
+            coverage_comp = components.get("coverage", 0.0)
 
             # Create new metrics dict with score components
             metrics_dict = metrics.model_dump()
@@ -2002,7 +2118,7 @@ class RegimeOptimizer:
             results.append(
                 OptimizationResult(
                     rank=rank,
-                    score=trial.value,
+                    score=exact["score"] if exact is not None else trial.value,
                     params=params,
                     metrics=metrics,
                     timestamp=trial.datetime_complete or datetime.utcnow(),
@@ -188,6 +188,10 @@ class OptimizationConfig(BaseModel):
     n_jobs: int = -1
     storage: str | None = None
     seed: int = 42
+    # Approximate RegimeScore per trial (see src.core.scoring fast mode)
+    fast_scoring: bool = True
+    # Best fast-scored trials re-scored in exact mode before ranking
+    exact_rescore_top_n: int = Field(default=10, ge=0)
 
     model_config = ConfigDict(frozen=True)
 
@@ -369,6 +373,8 @@ class RegimeOptimizer:
     _indicator_name_to_type: dict[str, str] = field(default_factory=dict, init=False, repr=False)
     # Trial-suggested parameter values for JSON mode (filled by _suggest_json_params)
     _trial_params: dict[str, float | int] = field(default_factory=dict, init=False, repr=False)
+    # Default scoring features (identical for every trial, built once)
+    _score_features: pd.DataFrame | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         """Validate data and setup storage."""
@@ -462,17 +468,13 @@ class RegimeOptimizer:
         """
         # Import calculation functions here to avoid circular imports
         from .regime_optimizer_calculations import (
+            classify_trial,
             create_objective_function,
             extract_results,
-            _calculate_indicators as calculate_indicators,
-            _classify_regimes as classify_regimes,
-            _calculate_json_indicators as calculate_json_indicators,
-            _classify_regimes_json as classify_regimes_json,
-        )
-        from .regime_optimizer_utils import (
-            extract_regime_periods,
-            load_trial_params,
+            ranked_trials,
+            rescore_top_trials,
         )
+        from .regime_optimizer_utils import extract_regime_periods
 
         logger.info("Starting regime optimization")
 
@@ -502,21 +504,13 @@ class RegimeOptimizer:
         logger.info(f"Optimization completed in {duration:.2f}s")
 
         # Extract results
+        rescore_top_trials(self)
         results = extract_results(self)
 
         # Store best regime periods
         if results:
-            best_params = results[0].params
-            if self.json_config is not None:
-                # JSON mode: Reload best trial's JSON params
-                if self._study and self._study.best_trial:
-                    load_trial_params(self, self._study.best_trial)
-                indicators = calculate_json_indicators(self, best_params)
-                regimes = classify_regimes_json(self, best_params, indicators)
-            else:
-                # Legacy mode
-                indicators = calculate_indicators(self, best_params)
-                regimes = classify_regimes(self, best_params, indicators)
+            best_trial = ranked_trials(self)[0]
+            regimes = classify_trial(self, best_trial, results[0].params)
             self._best_regime_periods = extract_regime_periods(self, regimes)
 
         logger.info(f"Best score: {results[0].score:.2f}" if results else "No results")
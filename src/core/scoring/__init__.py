@@ -9,6 +9,7 @@ from .regime_score import (
     FidelityScore,
     BoundaryScore,
     CoverageScore,
+    build_default_features,
     calculate_regime_score,
 )
 
@@ -20,5 +21,6 @@ __all__ = [
     "FidelityScore",
     "BoundaryScore",
     "CoverageScore",
+    "build_default_features",
     "calculate_regime_score",
 ]
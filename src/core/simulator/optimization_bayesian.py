@@ -6,7 +6,6 @@ Also provides Grid Search for exhaustive parameter exploration.
 
 from __future__ import annotations
 
-import asyncio
 import itertools
 import logging
 import time
@@ -16,8 +15,9 @@ from typing import Any, Callable
 
 import pandas as pd
 
+from .optimization_executor import CANCELLED, TrialExecutor, resolve_n_workers
 from .result_types import OptimizationRun, OptimizationTrial, SimulationResult
-from .simulation_engine import StrategySimulator
+from .simulation_features import sweep_param_sets
 from .strategy_params import StrategyName, get_strategy_parameters, ParameterDefinition
 
 logger = logging.getLogger(__name__)
@@ -31,8 +31,14 @@ class OptimizationConfig:
     objective_metric: str = "total_pnl_pct"  # Optimize for P&L% (maps to Score)
     direction: str = "maximize"  # or "minimize"
     n_trials: int = 50  # For Bayesian
-    n_jobs: int = 1  # Parallel jobs (1 = sequential)
+    n_jobs: int = 1  # Worker processes (1 = in-process, -1 = all CPUs)
     timeout_seconds: float | None = None
+    # Optuna storage (e.g. "sqlite:///...") + study name: an existing study
+    # with that name is continued, its trials count towards n_trials.
+    # Processes sharing a study need different seeds.
+    storage: str | None = None
+    study_name: str | None = None
+    seed: int = 42
 
     # Simulation settings - 1000€ per trade
     initial_capital: float = 1000.0  # 1000€ Startkapital
@@ -80,14 +86,12 @@ class BayesianOptimizer:
         self.symbol = symbol
         self.config = config
         self._study = None
-        self._all_results: list[SimulationResult] = []
+        self._results: dict[int, SimulationResult] = {}  # trial number -> result
         self._cancelled = False
 
     def cancel(self) -> None:
         """Cancel running optimization."""
         self._cancelled = True
-        if self._study:
-            self._study.stop()
 
     def optimize(
         self,
@@ -103,62 +107,77 @@ class BayesianOptimizer:
         """
         optuna, TPESampler = self._load_optuna()
         self._cancelled = False
-        self._all_results = []
+        self._results = {}
         start_time = time.time()
 
         param_config = get_strategy_parameters(self.config.strategy_name)
-        simulator = StrategySimulator(self.data, self.symbol)
-
-        loop = self._create_thread_event_loop()
         self._trial_errors = []
 
-        # Create objective function
-        def objective(trial: optuna.Trial) -> float:
-            if self._cancelled:
-                raise optuna.TrialPruned()
-
-            try:
-                params = self._build_trial_params(trial, param_config.parameters)
-                result = self._run_simulation(loop, simulator, params)
-                self._all_results.append(result)
-
-                # Get objective value
-                score = self._get_metric(result, self.config.objective_metric)
-
-                # Report progress
-                self._report_progress(progress_callback, trial.number, score)
-
-                return score
-
-            except Exception as e:
-                error_msg = f"Trial {trial.number} failed: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                self._trial_errors.append(error_msg)
-                raise optuna.TrialPruned()
-
-        # Create study
-        direction = self.config.direction
+        n_workers = resolve_n_workers(self.config.n_jobs)
+        # Batches of n_workers trials (or trials of other processes sharing
+        # the storage) run before they are told; the constant liar keeps TPE
+        # from suggesting one point n times
         self._study = optuna.create_study(
-            direction=direction,
-            sampler=TPESampler(seed=42),
+            study_name=self.config.study_name,
+            storage=self.config.storage,
+            load_if_exists=True,
+            direction=self.config.direction,
+            sampler=TPESampler(
+                seed=self.config.seed,
+                constant_liar=n_workers > 1 or self.config.storage is not None,
+            ),
         )
+        if self._finished_trials():
+            logger.info(
+                f"Resuming study {self.config.study_name}: "
+                f"{self._finished_trials()}/{self.config.n_trials} trials done"
+            )
 
-        # Run optimization
+        # Ask/tell loop: trials of a batch run on the executor in parallel
         try:
-            self._study.optimize(
-                objective,
-                n_trials=self.config.n_trials,
-                timeout=self.config.timeout_seconds,
-                n_jobs=self.config.n_jobs,
-                show_progress_bar=False,
-            )
+            with TrialExecutor(
+                self.data, self.symbol, self.config, n_workers,
+                param_sets=sweep_param_sets(param_config.parameters),
+            ) as executor:
+                while not self._cancelled and self._finished_trials() < self.config.n_trials:
+                    timeout = self.config.timeout_seconds
+                    if timeout is not None and time.time() - start_time >= timeout:
+                        break
+                    batch_size = min(
+                        executor.n_workers, self.config.n_trials - self._finished_trials()
+                    )
+                    batch = [self._study.ask() for _ in range(batch_size)]
+                    params_list = [
+                        self._build_trial_params(trial, param_config.parameters)
+                        for trial in batch
+                    ]
+                    outcomes = executor.run_batch(params_list, should_stop=lambda: self._cancelled)
+                    for trial, (result, error) in zip(batch, outcomes):
+                        self._tell_trial(optuna, trial, result, error, progress_callback)
         except KeyboardInterrupt:
             logger.info("Optimization cancelled by user")
-        finally:
-            loop.close()
 
-        elapsed = time.time() - start_time
+        return self._build_run(optuna, time.time() - start_time)
 
+    def load_results(self, elapsed_seconds: float = 0.0) -> OptimizationRun:
+        """Build the OptimizationRun of a stored study without running trials.
+
+        Loads the study config.study_name from config.storage (e.g. filled
+        by several processes); the best result is re-simulated.
+
+        Raises:
+            KeyError: If the study does not exist
+        """
+        optuna, _ = self._load_optuna()
+        self._results = {}
+        self._trial_errors = []
+        self._study = optuna.load_study(
+            study_name=self.config.study_name, storage=self.config.storage
+        )
+        return self._build_run(optuna, elapsed_seconds)
+
+    def _build_run(self, optuna, elapsed: float) -> OptimizationRun:
+        """Build the OptimizationRun of the study."""
         trials = self._build_trials(optuna)
         best_params, best_score, best_result = self._select_best_result(optuna)
 
@@ -175,6 +194,10 @@ class BayesianOptimizer:
             errors=self._trial_errors if self._trial_errors else None,
         )
 
+    def _finished_trials(self) -> int:
+        """Trials of the study that are done (stale running ones of a killed run not)."""
+        return sum(1 for t in self._study.get_trials(deepcopy=False) if t.state.is_finished())
+
     def _get_metric(self, result: SimulationResult, metric_name: str) -> float:
         """Extract metric value from simulation result."""
         if metric_name == "sharpe_ratio":
@@ -206,12 +229,6 @@ class BayesianOptimizer:
             )
         return optuna, TPESampler
 
-    def _create_thread_event_loop(self):
-        """Create a new event loop for this thread."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        return loop
-
     def _build_trial_params(self, trial, parameters) -> dict[str, Any]:
         """Build parameter dict from optuna trial suggestions."""
         params = {}
@@ -236,27 +253,38 @@ class BayesianOptimizer:
                 )
         return params
 
-    def _run_simulation(self, loop, simulator, params: dict[str, Any]) -> SimulationResult:
-        """Run simulation with given parameters."""
-        return loop.run_until_complete(
-            simulator.run_simulation(
-                strategy_name=self.config.strategy_name,
-                parameters=params,
-                initial_capital=self.config.initial_capital,
-                position_size_pct=self.config.position_size_pct,
-                slippage_pct=self.config.slippage_pct,
-                commission_pct=self.config.commission_pct,
-                stop_loss_pct=self.config.stop_loss_pct,
-                take_profit_pct=self.config.take_profit_pct,
-                # ATR-based SL/TP from Bot-Tab settings
-                sl_atr_multiplier=self.config.sl_atr_multiplier,
-                tp_atr_multiplier=self.config.tp_atr_multiplier,
-                atr_period=self.config.atr_period,
-                # Trailing Stop from Bot-Tab settings
-                trailing_stop_enabled=self.config.trailing_stop_enabled,
-                trailing_stop_atr_multiplier=self.config.trailing_stop_atr_multiplier,
-            )
-        )
+    def _tell_trial(
+        self,
+        optuna,
+        trial,
+        result: SimulationResult | None,
+        error: str | None,
+        progress_callback: Callable[[int, int, float], None] | None,
+    ) -> None:
+        """Report a finished trial to the study (failed/cancelled = pruned)."""
+        if result is None:
+            if error != CANCELLED:
+                error_msg = f"Trial {trial.number} failed: {error}"
+                logger.error(error_msg)
+                self._trial_errors.append(error_msg)
+            self._study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+            return
+
+        # Get objective value; metrics are stored with the trial for resumed runs
+        score = self._get_metric(result, self.config.objective_metric)
+        trial.set_user_attr("metrics", {
+            "total_trades": int(result.total_trades),
+            "win_rate": float(result.win_rate),
+            "profit_factor": float(result.profit_factor),
+            "total_pnl_pct": float(result.total_pnl_pct),
+            "max_drawdown_pct": float(result.max_drawdown_pct),
+            "sharpe_ratio": float(result.sharpe_ratio or 0.0),
+        })
+        self._study.tell(trial, score)
+        self._results[trial.number] = result
+
+        # Report progress
+        self._report_progress(progress_callback, trial.number, score)
 
     def _report_progress(
         self,
@@ -276,28 +304,15 @@ class BayesianOptimizer:
     def _build_trials(self, optuna) -> list[OptimizationTrial]:
         """Build list of OptimizationTrial from study trials."""
         trials: list[OptimizationTrial] = []
-        result_idx = 0
         for i, trial in enumerate(self._study.trials):
             if trial.state != optuna.trial.TrialState.COMPLETE:
                 continue
-            result = self._all_results[result_idx] if result_idx < len(self._all_results) else None
-            result_idx += 1
-            metrics = {}
-            if result:
-                metrics = {
-                    "total_trades": result.total_trades,
-                    "win_rate": result.win_rate,
-                    "profit_factor": result.profit_factor,
-                    "total_pnl_pct": result.total_pnl_pct,
-                    "max_drawdown_pct": result.max_drawdown_pct,
-                    "sharpe_ratio": result.sharpe_ratio or 0.0,
-                }
             trials.append(
                 OptimizationTrial(
                     trial_number=i + 1,
                     parameters=trial.params,
                     score=trial.value,
-                    metrics=metrics,
+                    metrics=dict(trial.user_attrs.get("metrics", {})),
                 )
             )
         return trials
@@ -312,24 +327,15 @@ class BayesianOptimizer:
         ]
         if completed_trials:
             best_trial = self._study.best_trial
-            if best_trial:
-                best_params = best_trial.params
-                best_score = best_trial.value
-                completed_indices = [
-                    i for i, t in enumerate(self._study.trials)
-                    if t.state == optuna.trial.TrialState.COMPLETE
-                ]
-                if best_trial.number in [
-                    self._study.trials[i].number for i in completed_indices
-                ]:
-                    best_trial_result_idx = completed_indices.index(
-                        next(
-                            i for i in completed_indices
-                            if self._study.trials[i].number == best_trial.number
-                        )
-                    )
-                    if best_trial_result_idx < len(self._all_results):
-                        best_result = self._all_results[best_trial_result_idx]
+            best_params = best_trial.params
+            best_score = best_trial.value
+            best_result = self._results.get(best_trial.number)
+            if best_result is None:
+                # Best trial of a resumed run: results are not stored, re-simulate
+                with TrialExecutor(self.data, self.symbol, self.config, 1) as executor:
+                    best_result, error = executor.run_batch([best_params])[0]
+                if error:
+                    logger.error(f"Re-simulating best trial {best_trial.number} failed: {error}")
         else:
             error_summary = (
                 "; ".join(self._trial_errors[:5]) if self._trial_errors else "Unknown error"
@@ -347,6 +353,9 @@ class GridSearchOptimizer:
     Tests all combinations of parameter values from their ranges.
     """
 
+    # Combinations per pool worker and batch (cancel is checked per batch)
+    BATCH_PER_WORKER = 4
+
     def __init__(
         self,
         data: pd.DataFrame,
@@ -388,9 +397,6 @@ class GridSearchOptimizer:
         start_time = time.time()
 
         param_config = get_strategy_parameters(self.config.strategy_name)
-        simulator = StrategySimulator(self.data, self.symbol)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
 
         param_names, all_combinations = self._build_param_combinations(
             param_config, max_combinations
@@ -402,27 +408,38 @@ class GridSearchOptimizer:
         best_params: dict[str, Any] = {}
         best_result = None
 
-        try:
-            for i, values in enumerate(all_combinations):
-                if self._cancelled:
-                    break
-                params = dict(zip(param_names, values))
-                result, error_msg = self._run_single_grid_trial(loop, simulator, params, i + 1)
-                if result is None:
-                    self._record_trial_error(error_msg)
-                else:
-                    self._all_results.append(result)
-                    score = self._get_metric(result, self.config.objective_metric)
-                    if self._is_better(score, best_score):
-                        best_score = score
-                        best_params = params.copy()
-                        best_result = result
-                    trials.append(self._build_trial(i + 1, params, score, result))
-
-                if progress_callback:
-                    progress_callback(i + 1, total, best_score if trials else 0.0)
-        finally:
-            loop.close()
+        n_workers = resolve_n_workers(self.config.n_jobs)
+        param_sets = [dict(zip(param_names, values)) for values in all_combinations]
+        with TrialExecutor(
+            self.data, self.symbol, self.config, n_workers, param_sets=param_sets
+        ) as executor:
+            i = 0
+            while i < total and not self._cancelled:
+                # In-process: one trial per batch keeps progress per trial
+                batch_size = (
+                    executor.n_workers * self.BATCH_PER_WORKER if executor.n_workers > 1 else 1
+                )
+                batch = param_sets[i:i + batch_size]
+                outcomes = executor.run_batch(batch, should_stop=lambda: self._cancelled)
+                for params, (result, error) in zip(batch, outcomes):
+                    if error == CANCELLED:
+                        break
+                    i += 1
+                    if result is None:
+                        error_msg = f"Grid trial {i} failed: {error}"
+                        logger.error(error_msg)
+                        self._record_trial_error(error_msg)
+                    else:
+                        self._all_results.append(result)
+                        score = self._get_metric(result, self.config.objective_metric)
+                        if self._is_better(score, best_score):
+                            best_score = score
+                            best_params = params.copy()
+                            best_result = result
+                        trials.append(self._build_trial(i, params, score, result))
+
+                    if progress_callback:
+                        progress_callback(i, total, best_score if trials else 0.0)
 
         elapsed = time.time() - start_time
         self._log_trial_failures(trials)
@@ -453,11 +470,6 @@ class GridSearchOptimizer:
             )
         return optuna, TPESampler
 
-    def _create_thread_event_loop(self):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        return loop
-
     def _build_trial_params(self, trial, parameters):
         params = {}
         for param_def in parameters:
@@ -481,27 +493,6 @@ class GridSearchOptimizer:
                 )
         return params
 
-    def _run_simulation(self, loop, simulator, params: dict[str, Any]) -> SimulationResult:
-        return loop.run_until_complete(
-            simulator.run_simulation(
-                strategy_name=self.config.strategy_name,
-                parameters=params,
-                initial_capital=self.config.initial_capital,
-                position_size_pct=self.config.position_size_pct,
-                slippage_pct=self.config.slippage_pct,
-                commission_pct=self.config.commission_pct,
-                stop_loss_pct=self.config.stop_loss_pct,
-                take_profit_pct=self.config.take_profit_pct,
-                # ATR-based SL/TP from Bot-Tab settings
-                sl_atr_multiplier=self.config.sl_atr_multiplier,
-                tp_atr_multiplier=self.config.tp_atr_multiplier,
-                atr_period=self.config.atr_period,
-                # Trailing Stop from Bot-Tab settings
-                trailing_stop_enabled=self.config.trailing_stop_enabled,
-                trailing_stop_atr_multiplier=self.config.trailing_stop_atr_multiplier,
-            )
-        )
-
     def _report_progress(
         self,
         progress_callback: Callable[[int, int, float], None] | None,
@@ -608,32 +599,6 @@ class GridSearchOptimizer:
             )
         return param_names, all_combinations
 
-    def _run_single_grid_trial(self, loop, simulator, params: dict[str, Any], trial_number: int):
-        try:
-            return loop.run_until_complete(
-                simulator.run_simulation(
-                    strategy_name=self.config.strategy_name,
-                    parameters=params,
-                    initial_capital=self.config.initial_capital,
-                    position_size_pct=self.config.position_size_pct,
-                    slippage_pct=self.config.slippage_pct,
-                    commission_pct=self.config.commission_pct,
-                    stop_loss_pct=self.config.stop_loss_pct,
-                    take_profit_pct=self.config.take_profit_pct,
-                    # ATR-based SL/TP from Bot-Tab settings
-                    sl_atr_multiplier=self.config.sl_atr_multiplier,
-                    tp_atr_multiplier=self.config.tp_atr_multiplier,
-                    atr_period=self.config.atr_period,
-                    # Trailing Stop from Bot-Tab settings
-                    trailing_stop_enabled=self.config.trailing_stop_enabled,
-                    trailing_stop_atr_multiplier=self.config.trailing_stop_atr_multiplier,
-                )
-            ), None
-        except Exception as e:
-            error_msg = f"Grid trial {trial_number} failed: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return None, error_msg
-
     def _record_trial_error(self, error_msg: str) -> None:
         self._trial_errors.append(error_msg)
 
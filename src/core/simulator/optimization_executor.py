@@ -0,0 +1,226 @@
+"""Trial Executor for Strategy Parameter Optimization.
+
+Runs simulator trials for GridSearchOptimizer and BayesianOptimizer:
+
+- n_workers == 1: in-process, one StrategySimulator + event loop
+- n_workers > 1: shared-nothing process pool; every worker builds its own
+  StrategySimulator (prepared DataFrame, indicator columns) once in the
+  pool initializer and only receives parameter dicts per trial
+
+The indicator columns of the search space are precomputed once in the
+parent (FeatureMatrix.precompute) and shipped to the workers.
+
+Trials are dispatched in batches; results come back in submission order.
+Cancellation is checked while waiting, pending trials of the batch are
+dropped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing as mp
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+import pandas as pd
+
+from .result_types import SimulationResult
+from .simulation_engine import StrategySimulator
+from .simulation_features import FeatureMatrix
+
+if TYPE_CHECKING:
+    from .optimization_bayesian import OptimizationConfig
+
+logger = logging.getLogger(__name__)
+
+# (result, None) on success, (None, error message) on failure/cancel
+TrialOutcome = tuple[SimulationResult | None, str | None]
+
+CANCELLED = "cancelled"
+
+
+def resolve_n_workers(n_jobs: int | None) -> int:
+    """Worker count for OptimizationConfig.n_jobs (None/<1 = all CPUs)."""
+    cpus = os.cpu_count() or 1
+    if n_jobs is None or n_jobs < 1:
+        return cpus
+    return min(n_jobs, cpus)
+
+
+def simulation_kwargs(config: OptimizationConfig) -> dict[str, Any]:
+    """run_simulation() keyword arguments of an optimization config."""
+    return {
+        "strategy_name": config.strategy_name,
+        "initial_capital": config.initial_capital,
+        "position_size_pct": config.position_size_pct,
+        "slippage_pct": config.slippage_pct,
+        "commission_pct": config.commission_pct,
+        "stop_loss_pct": config.stop_loss_pct,
+        "take_profit_pct": config.take_profit_pct,
+        # ATR-based SL/TP from Bot-Tab settings
+        "sl_atr_multiplier": config.sl_atr_multiplier,
+        "tp_atr_multiplier": config.tp_atr_multiplier,
+        "atr_period": config.atr_period,
+        # Trailing Stop from Bot-Tab settings
+        "trailing_stop_enabled": config.trailing_stop_enabled,
+        "trailing_stop_atr_multiplier": config.trailing_stop_atr_multiplier,
+    }
+
+
+class _TrialRunner:
+    """Simulator + event loop that runs trials of one config."""
+
+    def __init__(self, simulator: StrategySimulator, config: OptimizationConfig):
+        self.simulator = simulator
+        self.kwargs = simulation_kwargs(config)
+        self.loop = asyncio.new_event_loop()
+
+    def run(self, params: dict[str, Any]) -> TrialOutcome:
+        try:
+            result = self.loop.run_until_complete(
+                self.simulator.run_simulation(parameters=params, **self.kwargs)
+            )
+            return result, None
+        except Exception as e:
+            logger.debug("Trial failed: %s", e, exc_info=True)
+            return None, str(e)
+
+    def close(self) -> None:
+        self.loop.close()
+
+
+# Per-process runner of pool workers (set by _init_worker)
+_worker_runner: _TrialRunner | None = None
+
+
+def _init_worker(features: FeatureMatrix, symbol: str, config: OptimizationConfig) -> None:
+    global _worker_runner
+    simulator = StrategySimulator(features.data, symbol, features=features)
+    _worker_runner = _TrialRunner(simulator, config)
+
+
+def _run_worker_trial(params: dict[str, Any]) -> TrialOutcome:
+    return _worker_runner.run(params)
+
+
+class TrialExecutor:
+    """Runs batches of simulator trials, in-process or on a process pool.
+
+    Usage:
+        with TrialExecutor(data, symbol, config, n_workers=4) as executor:
+            outcomes = executor.run_batch(params_list, should_stop=lambda: cancelled)
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        symbol: str,
+        config: OptimizationConfig,
+        n_workers: int = 1,
+        param_sets: Iterable[dict[str, Any]] | None = None,
+    ):
+        """Initialize executor.
+
+        Args:
+            data: OHLCV DataFrame (sent to each worker once)
+            symbol: Trading symbol
+            config: Optimization configuration (simulation settings)
+            n_workers: Worker processes (1 = in-process)
+            param_sets: Search space whose indicator columns are precomputed
+        """
+        self._symbol = symbol
+        self._config = config
+        self.n_workers = max(1, n_workers)
+        self._simulator = StrategySimulator(data, symbol)
+        if param_sets is not None:
+            self.features.precompute(config.strategy_name, param_sets)
+        self._runner: _TrialRunner | None = None
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def features(self) -> FeatureMatrix:
+        """Indicator columns shared by all trials."""
+        return self._simulator.features
+
+    def __enter__(self) -> TrialExecutor:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def run_batch(
+        self,
+        params_list: list[dict[str, Any]],
+        should_stop: Callable[[], bool] | None = None,
+    ) -> list[TrialOutcome]:
+        """Run trials and return their outcomes in order of ``params_list``.
+
+        Trials not started when ``should_stop()`` turns true get
+        ``(None, CANCELLED)``.
+        """
+        should_stop = should_stop or (lambda: False)
+        if self.n_workers == 1:
+            return self._run_serial(params_list, should_stop)
+        try:
+            return self._run_pool(params_list, should_stop)
+        except BrokenProcessPool as e:
+            logger.warning("Optimization process pool failed (%s), continuing in-process", e)
+            self._shutdown_pool()
+            self.n_workers = 1
+            return self._run_serial(params_list, should_stop)
+
+    def close(self) -> None:
+        """Stop the pool (pending trials are cancelled) and the event loop."""
+        self._shutdown_pool()
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+
+    def _run_serial(
+        self, params_list: list[dict[str, Any]], should_stop: Callable[[], bool]
+    ) -> list[TrialOutcome]:
+        if self._runner is None:
+            self._runner = _TrialRunner(self._simulator, self._config)
+        outcomes: list[TrialOutcome] = []
+        for params in params_list:
+            outcomes.append((None, CANCELLED) if should_stop() else self._runner.run(params))
+        return outcomes
+
+    def _run_pool(
+        self, params_list: list[dict[str, Any]], should_stop: Callable[[], bool]
+    ) -> list[TrialOutcome]:
+        pool = self._get_pool()
+        futures = [pool.submit(_run_worker_trial, params) for params in params_list]
+        pending: set[Future] = set(futures)
+        while pending:
+            if should_stop():
+                for future in pending:
+                    future.cancel()
+                break
+            _, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+
+        outcomes: list[TrialOutcome] = []
+        for future in futures:
+            if future.cancelled() or not future.done():
+                outcomes.append((None, CANCELLED))
+            else:
+                outcomes.append(future.result())
+        return outcomes
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                mp_context=mp.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.features, self._symbol, self._config),
+            )
+        return self._pool
+
+    def _shutdown_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -14,6 +14,8 @@ import numpy as np
 import pandas as pd
 
 from .strategy_params import StrategyName
+from .simulation_features import FeatureMatrix
+from .simulation_signal_utils import calculate_adx, calculate_atr, calculate_bollinger_bands
 from .simulation_signals import StrategySignalGenerator
 from .result_types import SimulationResult, TradeRecord
 
@@ -75,17 +77,25 @@ class StrategySimulator:
     - Calculates comprehensive performance metrics
     """
 
-    def __init__(self, data: pd.DataFrame, symbol: str):
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        symbol: str,
+        features: FeatureMatrix | None = None,
+    ):
         """Initialize simulator with chart data.
 
         Args:
             data: OHLCV DataFrame with columns: open, high, low, close, volume
                   Index should be DatetimeIndex or have a 'timestamp' column
             symbol: Trading symbol
+            features: Precomputed indicator columns of the prepared data
+                  (e.g. from an optimizer); a new cache is created if None
         """
         self.data = self._prepare_data(data)
         self.symbol = symbol
-        self._signal_generator = StrategySignalGenerator(self.data)
+        self.features = features if features is not None else FeatureMatrix(self.data)
+        self._signal_generator = StrategySignalGenerator(self.data, self.features)
         self._trades: list[TradeRecord] = []
         self._equity_curve: list[tuple[datetime, float]] = []
 
@@ -442,17 +452,17 @@ class StrategySimulator:
         # Calculate ATR for the entire dataset if ATR-based SL/TP is enabled
         atr_series = None
         if config.sl_atr_multiplier > 0 or config.tp_atr_multiplier > 0 or config.trailing_stop_enabled:
-            atr_series = self._calculate_atr(signals_df, config.atr_period)
+            atr_series = self.features.atr_wilder(config.atr_period)
 
         # Calculate Bollinger Bands for SWING mode
         bb_lower, bb_upper = None, None
         if config.trailing_stop_mode == "SWING" and config.trailing_stop_enabled:
-            bb_lower, bb_upper = self._calculate_bollinger_bands(signals_df)
+            bb_lower, bb_upper = self.features.bollinger_bands()
 
         # Calculate ADX for regime detection (regime-adaptive trailing)
         adx_series = None
         if config.regime_adaptive and config.trailing_stop_enabled:
-            adx_series = self._calculate_adx(signals_df)
+            adx_series = self.features.adx_wilder(14)
 
         for i, (timestamp, row) in enumerate(signals_df.iterrows()):
             signal = row["signal"]
@@ -530,76 +540,15 @@ class StrategySimulator:
         Returns:
             Tuple of (lower_band, upper_band)
         """
-        close = df["close"]
-        sma = close.rolling(window=period).mean()
-        std = close.rolling(window=period).std()
-
-        lower_band = sma - (std * std_mult)
-        upper_band = sma + (std * std_mult)
-
-        # Backfill NaN values
-        lower_band = lower_band.bfill()
-        upper_band = upper_band.bfill()
-
-        return lower_band, upper_band
+        return calculate_bollinger_bands(df, period, std_mult)
 
     def _calculate_adx(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
-        """Calculate ADX (Average Directional Index) for regime detection.
-
-        ADX > 25 = Trending market
-        ADX < 20 = Ranging market
-        """
-        high = df["high"]
-        low = df["low"]
-        close = df["close"]
-
-        # True Range
-        tr1 = high - low
-        tr2 = np.abs(high - close.shift())
-        tr3 = np.abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        # Directional Movement
-        plus_dm = high.diff()
-        minus_dm = -low.diff()
-        plus_dm[plus_dm < 0] = 0
-        minus_dm[minus_dm < 0] = 0
-        plus_dm[(plus_dm < minus_dm) | (plus_dm < 0)] = 0
-        minus_dm[(minus_dm < plus_dm) | (minus_dm < 0)] = 0
-
-        # Wilder's smoothing
-        alpha = 1.0 / period
-        atr = tr.ewm(alpha=alpha, min_periods=period, adjust=False).mean()
-        plus_di = 100 * (plus_dm.ewm(alpha=alpha, min_periods=period, adjust=False).mean() / atr)
-        minus_di = 100 * (minus_dm.ewm(alpha=alpha, min_periods=period, adjust=False).mean() / atr)
-
-        # ADX calculation
-        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di + 1e-10)
-        adx = dx.ewm(alpha=alpha, min_periods=period, adjust=False).mean()
-
-        # Backfill NaN values
-        adx = adx.bfill().fillna(25.0)
-
-        return adx
+        """Calculate ADX (Average Directional Index) for regime detection."""
+        return calculate_adx(df, period)
 
     def _calculate_atr(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
-        """Calculate Average True Range using Wilder's Smoothing Method.
-
-        Reference: https://chartschool.stockcharts.com/table-of-contents/technical-indicators-and-overlays/technical-indicators/average-true-range-atr
-        """
-        high_low = df['high'] - df['low']
-        high_close = np.abs(df['high'] - df['close'].shift())
-        low_close = np.abs(df['low'] - df['close'].shift())
-
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-
-        # Use Wilder's smoothing (EMA with alpha = 1/period)
-        alpha = 1.0 / period
-        atr = true_range.ewm(alpha=alpha, min_periods=period, adjust=False).mean()
-
-        # Fill NaN values with the first valid ATR (backfill)
-        atr = atr.bfill()
-        return atr
+        """Calculate Average True Range using Wilder's Smoothing Method."""
+        return calculate_atr(df, period)
 
     def _update_trailing_stop(
         self,
@@ -0,0 +1,200 @@
+"""Feature matrix for strategy simulation.
+
+Columnar indicator cache shared by the signal generators and the trade
+simulation. Every indicator column is computed once per (name, params)
+and reused by all later trials; ``precompute`` fills the cache with the
+union of columns an optimization search space needs, so optimizer
+workers receive ready-made columns instead of recomputing them.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .simulation_signal_utils import (
+    calculate_adx,
+    calculate_adx_ema,
+    calculate_atr,
+    calculate_bollinger_bands,
+    calculate_obv,
+    calculate_rsi,
+    true_range,
+)
+
+if TYPE_CHECKING:
+    from .strategy_params import ParameterDefinition, StrategyName
+
+logger = logging.getLogger(__name__)
+
+
+class FeatureMatrix:
+    """Lazily computed, cached indicator columns of one OHLCV frame.
+
+    Returned Series are shared between callers and must not be modified
+    in place.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self._columns: dict[str, pd.Series] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._columns)
+
+    def cached(self, name: str, compute: Callable[[], pd.Series]) -> pd.Series:
+        """Return column ``name``, computing it on first use."""
+        column = self._columns.get(name)
+        if column is None:
+            column = compute()
+            self._columns[name] = column
+            self.misses += 1
+        else:
+            self.hits += 1
+        return column
+
+    # ==================== Price Indicators ====================
+
+    def sma(self, period: int, column: str = "close", min_periods: int | None = None) -> pd.Series:
+        return self.cached(
+            f"sma_{column}_{period}_{min_periods}",
+            lambda: self.data[column].rolling(period, min_periods=min_periods).mean(),
+        )
+
+    def rolling_std(self, period: int, column: str = "close") -> pd.Series:
+        return self.cached(
+            f"std_{column}_{period}", lambda: self.data[column].rolling(period).std()
+        )
+
+    def rolling_max(self, window: int, column: str = "high") -> pd.Series:
+        return self.cached(
+            f"max_{column}_{window}", lambda: self.data[column].rolling(window).max()
+        )
+
+    def rolling_min(self, window: int, column: str = "low") -> pd.Series:
+        return self.cached(
+            f"min_{column}_{window}", lambda: self.data[column].rolling(window).min()
+        )
+
+    def rolling_quantile(self, window: int, q: float, column: str) -> pd.Series:
+        return self.cached(
+            f"quantile_{column}_{window}_{q}",
+            lambda: self.data[column].rolling(window).quantile(q),
+        )
+
+    def ema(self, span: int) -> pd.Series:
+        return self.cached(
+            f"ema_{span}", lambda: self.data["close"].ewm(span=span, adjust=False).mean()
+        )
+
+    def rsi(self, period: int) -> pd.Series:
+        return self.cached(f"rsi_{period}", lambda: calculate_rsi(self.data["close"], period))
+
+    def obv(self) -> pd.Series:
+        return self.cached("obv", lambda: calculate_obv(self.data))
+
+    # ==================== Volatility / Trend ====================
+
+    def true_range(self) -> pd.Series:
+        return self.cached("true_range", lambda: true_range(self.data))
+
+    def atr_sma(self, period: int) -> pd.Series:
+        """ATR as simple moving average of the True Range."""
+        return self.cached(f"atr_sma_{period}", lambda: self.true_range().rolling(period).mean())
+
+    def adx_sma(self, adx_period: int, atr_period: int) -> pd.Series:
+        """Simplified ADX (rolling means) on top of ``atr_sma(atr_period)``."""
+        return self.cached(
+            f"adx_sma_{adx_period}_{atr_period}",
+            lambda: self._adx_sma(adx_period, atr_period),
+        )
+
+    def _adx_sma(self, adx_period: int, atr_period: int) -> pd.Series:
+        atr = self.atr_sma(atr_period)
+        dm_plus = (self.data["high"].diff()).clip(lower=0)
+        dm_minus = (-self.data["low"].diff()).clip(lower=0)
+        di_plus = 100 * (dm_plus.rolling(adx_period).mean() / atr.replace(0, np.nan))
+        di_minus = 100 * (dm_minus.rolling(adx_period).mean() / atr.replace(0, np.nan))
+        di_sum = di_plus + di_minus
+        dx = 100 * abs(di_plus - di_minus) / di_sum.replace(0, np.nan)
+        return dx.rolling(adx_period).mean().fillna(0)
+
+    def adx_ema(self, period: int) -> pd.Series:
+        return self.cached(f"adx_ema_{period}", lambda: calculate_adx_ema(self.data, period))
+
+    def atr_wilder(self, period: int) -> pd.Series:
+        return self.cached(f"atr_wilder_{period}", lambda: calculate_atr(self.data, period))
+
+    def adx_wilder(self, period: int) -> pd.Series:
+        return self.cached(f"adx_wilder_{period}", lambda: calculate_adx(self.data, period))
+
+    def bollinger_bands(
+        self, period: int = 20, std_mult: float = 2.0
+    ) -> tuple[pd.Series, pd.Series]:
+        """Backfilled (lower, upper) Bollinger Bands."""
+        lower_key = f"bb_lower_{period}_{std_mult}"
+        upper_key = f"bb_upper_{period}_{std_mult}"
+        if lower_key not in self._columns:
+            lower, upper = calculate_bollinger_bands(self.data, period, std_mult)
+            self._columns[lower_key] = lower
+            self._columns[upper_key] = upper
+            self.misses += 1
+        else:
+            self.hits += 1
+        return self._columns[lower_key], self._columns[upper_key]
+
+    # ==================== Precompute ====================
+
+    def precompute(
+        self,
+        strategy_name: StrategyName,
+        param_sets: Iterable[dict[str, Any]],
+    ) -> int:
+        """Compute the indicator columns of all parameter sets.
+
+        Args:
+            strategy_name: Strategy whose feature function is used
+            param_sets: Parameter dicts of the search space
+
+        Returns:
+            Number of newly computed columns
+        """
+        from .simulation_signals import STRATEGY_FEATURES
+
+        features_fn = STRATEGY_FEATURES.get(strategy_name)
+        if features_fn is None:
+            return 0
+        before = len(self._columns)
+        for params in param_sets:
+            features_fn(self, params)
+        computed = len(self._columns) - before
+        logger.debug(
+            "Precomputed %d feature columns for %s (%d cached)",
+            computed, strategy_name, len(self._columns),
+        )
+        return computed
+
+
+def sweep_param_sets(parameters: list[ParameterDefinition]) -> list[dict[str, Any]]:
+    """Parameter sets that vary one parameter at a time over its full range.
+
+    Covers every single-parameter indicator of a Bayesian search space
+    without enumerating the full product; columns depending on several
+    parameters at once are computed on first use.
+    """
+    param_sets: list[dict[str, Any]] = [{}]
+    for param_def in parameters:
+        if param_def.param_type != "int":
+            continue
+        if param_def.min_value is None or param_def.max_value is None:
+            continue
+        step = int(param_def.step or 1)
+        for value in range(int(param_def.min_value), int(param_def.max_value) + 1, step):
+            param_sets.append({param_def.name: value})
+    return param_sets
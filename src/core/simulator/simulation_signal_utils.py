@@ -52,3 +52,115 @@ def calculate_obv(df: pd.DataFrame) -> pd.Series:
         else:
             obv.iloc[i] = obv.iloc[i - 1]
     return obv
+
+def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
+    """Calculate Average True Range using Wilder's Smoothing Method.
+
+    Reference: https://chartschool.stockcharts.com/table-of-contents/technical-indicators-and-overlays/technical-indicators/average-true-range-atr
+    """
+    high_low = df['high'] - df['low']
+    high_close = np.abs(df['high'] - df['close'].shift())
+    low_close = np.abs(df['low'] - df['close'].shift())
+
+    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+
+    # Use Wilder's smoothing (EMA with alpha = 1/period)
+    alpha = 1.0 / period
+    atr = true_range.ewm(alpha=alpha, min_periods=period, adjust=False).mean()
+
+    # Fill NaN values with the first valid ATR (backfill)
+    atr = atr.bfill()
+    return atr
+
+def calculate_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
+    """Calculate ADX (Average Directional Index) with Wilder's smoothing.
+
+    ADX > 25 = Trending market
+    ADX < 20 = Ranging market
+    """
+    high = df["high"]
+    low = df["low"]
+    close = df["close"]
+
+    # True Range
+    tr1 = high - low
+    tr2 = np.abs(high - close.shift())
+    tr3 = np.abs(low - close.shift())
+    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+    # Directional Movement
+    plus_dm = high.diff()
+    minus_dm = -low.diff()
+    plus_dm[plus_dm < 0] = 0
+    minus_dm[minus_dm < 0] = 0
+    plus_dm[(plus_dm < minus_dm) | (plus_dm < 0)] = 0
+    minus_dm[(minus_dm < plus_dm) | (minus_dm < 0)] = 0
+
+    # Wilder's smoothing
+    alpha = 1.0 / period
+    atr = tr.ewm(alpha=alpha, min_periods=period, adjust=False).mean()
+    plus_di = 100 * (plus_dm.ewm(alpha=alpha, min_periods=period, adjust=False).mean() / atr)
+    minus_di = 100 * (minus_dm.ewm(alpha=alpha, min_periods=period, adjust=False).mean() / atr)
+
+    # ADX calculation
+    dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di + 1e-10)
+    adx = dx.ewm(alpha=alpha, min_periods=period, adjust=False).mean()
+
+    # Backfill NaN values
+    adx = adx.bfill().fillna(25.0)
+
+    return adx
+
+def calculate_adx_ema(df: pd.DataFrame, period: int = 14) -> pd.Series:
+    """Calculate ADX with EMA (span) smoothing."""
+    high = df["high"]
+    low = df["low"]
+    close = df["close"]
+
+    # True Range
+    tr1 = high - low
+    tr2 = abs(high - close.shift(1))
+    tr3 = abs(low - close.shift(1))
+    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+    # Directional Movement
+    up_move = high - high.shift(1)
+    down_move = low.shift(1) - low
+
+    plus_dm = pd.Series(0.0, index=df.index)
+    minus_dm = pd.Series(0.0, index=df.index)
+
+    plus_dm[(up_move > down_move) & (up_move > 0)] = up_move
+    minus_dm[(down_move > up_move) & (down_move > 0)] = down_move
+
+    # Smoothed values
+    atr = tr.ewm(span=period, adjust=False).mean()
+    plus_di = 100 * (plus_dm.ewm(span=period, adjust=False).mean() / atr.replace(0, np.nan))
+    minus_di = 100 * (minus_dm.ewm(span=period, adjust=False).mean() / atr.replace(0, np.nan))
+
+    # ADX
+    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di).replace(0, np.nan)
+    adx = dx.ewm(span=period, adjust=False).mean()
+
+    return adx.fillna(0)
+
+def calculate_bollinger_bands(
+    df: pd.DataFrame, period: int = 20, std_mult: float = 2.0
+) -> tuple[pd.Series, pd.Series]:
+    """Calculate backfilled Bollinger Bands (SWING trailing mode).
+
+    Returns:
+        Tuple of (lower_band, upper_band)
+    """
+    close = df["close"]
+    sma = close.rolling(window=period).mean()
+    std = close.rolling(window=period).std()
+
+    lower_band = sma - (std * std_mult)
+    upper_band = sma + (std * std_mult)
+
+    # Backfill NaN values
+    lower_band = lower_band.bfill()
+    upper_band = upper_band.bfill()
+
+    return lower_band, upper_band
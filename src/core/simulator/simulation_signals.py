@@ -8,26 +8,52 @@ from typing import Any
 import pandas as pd
 
 from .strategy_params import StrategyName
+from .simulation_features import FeatureMatrix
 from .simulation_signal_utils import calculate_obv, calculate_rsi, true_range
-from .simulation_signals_bollinger_squeeze import bollinger_squeeze_signals
-from .simulation_signals_breakout import breakout_signals
-from .simulation_signals_mean_reversion import mean_reversion_signals
-from .simulation_signals_momentum import momentum_signals
-from .simulation_signals_opening_range import opening_range_signals
-from .simulation_signals_regime_hybrid import regime_hybrid_signals
-from .simulation_signals_scalping import scalping_signals
-from .simulation_signals_sideways_range import sideways_range_signals
-from .simulation_signals_trend_following import trend_following_signals
-from .simulation_signals_trend_pullback import trend_pullback_signals
+from .simulation_signals_bollinger_squeeze import (
+    bollinger_squeeze_features,
+    bollinger_squeeze_signals,
+)
+from .simulation_signals_breakout import breakout_features, breakout_signals
+from .simulation_signals_mean_reversion import mean_reversion_features, mean_reversion_signals
+from .simulation_signals_momentum import momentum_features, momentum_signals
+from .simulation_signals_opening_range import opening_range_features, opening_range_signals
+from .simulation_signals_regime_hybrid import regime_hybrid_features, regime_hybrid_signals
+from .simulation_signals_scalping import scalping_features, scalping_signals
+from .simulation_signals_sideways_range import sideways_range_features, sideways_range_signals
+from .simulation_signals_trend_following import (
+    trend_following_features,
+    trend_following_signals,
+)
+from .simulation_signals_trend_pullback import trend_pullback_features, trend_pullback_signals
 
 logger = logging.getLogger(__name__)
 
+# Indicator columns per strategy (used by FeatureMatrix.precompute)
+STRATEGY_FEATURES = {
+    StrategyName.BREAKOUT: breakout_features,
+    StrategyName.MOMENTUM: momentum_features,
+    StrategyName.MEAN_REVERSION: mean_reversion_features,
+    StrategyName.TREND_FOLLOWING: trend_following_features,
+    StrategyName.SCALPING: scalping_features,
+    StrategyName.BOLLINGER_SQUEEZE: bollinger_squeeze_features,
+    StrategyName.TREND_PULLBACK: trend_pullback_features,
+    StrategyName.OPENING_RANGE: opening_range_features,
+    StrategyName.REGIME_HYBRID: regime_hybrid_features,
+    StrategyName.SIDEWAYS_RANGE: sideways_range_features,
+}
+
 
 class StrategySignalGenerator:
-    """Generates trading signals for supported strategies."""
+    """Generates trading signals for supported strategies.
+
+    Indicators are read from a shared FeatureMatrix, so repeated runs with
+    different parameters only compute indicator columns not seen before.
+    """
 
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, features: FeatureMatrix | None = None):
         self.data = data
+        self.features = features if features is not None else FeatureMatrix(data)
 
     def generate(
         self,
@@ -70,40 +96,34 @@ class StrategySignalGenerator:
         return handler(df, parameters)
 
     def _breakout_signals(self, df: pd.DataFrame, params: dict[str, Any]) -> pd.Series:
-        return breakout_signals(df, params, true_range=true_range)
+        return breakout_signals(df, params, self.features)
 
     def _momentum_signals(self, df: pd.DataFrame, params: dict[str, Any]) -> pd.Series:
-        return momentum_signals(df, params, calculate_rsi=calculate_rsi, calculate_obv=calculate_obv)
+        return momentum_signals(df, params, self.features)
 
     def _mean_reversion_signals(self, df: pd.DataFrame, params: dict[str, Any]) -> pd.Series:
-        return mean_reversion_signals(df, params, calculate_rsi=calculate_rsi)
+        return mean_reversion_signals(df, params, self.features)
 
     def _trend_following_signals(self, df: pd.DataFrame, params: dict[str, Any]) -> pd.Series:
-        return trend_following_signals(df, params, calculate_rsi=calculate_rsi)
+        return trend_following_signals(df, params, self.features)
 
     def _scalping_signals(self, df: pd.DataFrame, params: dict[str, Any]) -> pd.Series:
-        return scalping_signals(df, params, calculate_rsi=calculate_rsi)
+        return scalping_signals(df, params, self.features)
 
     def _bollinger_squeeze_signals(self, df: pd.DataFrame, params: dict[str, Any]) -> pd.Series:
-        return bollinger_squeeze_signals(df, params, true_range=true_range)
+        return bollinger_squeeze_signals(df, params, self.features)
 
     def _trend_pullback_signals(self, df: pd.DataFrame, params: dict[str, Any]) -> pd.Series:
-        return trend_pullback_signals(df, params, calculate_rsi=calculate_rsi)
+        return trend_pullback_signals(df, params, self.features)
 
     def _opening_range_signals(self, df: pd.DataFrame, params: dict[str, Any]) -> pd.Series:
-        return opening_range_signals(df, params)
+        return opening_range_signals(df, params, self.features)
 
     def _regime_hybrid_signals(self, df: pd.DataFrame, params: dict[str, Any]) -> pd.Series:
-        return regime_hybrid_signals(
-            df,
-            params,
-            calculate_rsi=calculate_rsi,
-            calculate_obv=calculate_obv,
-            true_range=true_range,
-        )
+        return regime_hybrid_signals(df, params, self.features)
 
     def _sideways_range_signals(self, df: pd.DataFrame, params: dict[str, Any]) -> pd.Series:
-        return sideways_range_signals(df, params, calculate_rsi=calculate_rsi)
+        return sideways_range_signals(df, params, self.features)
 
     def _true_range(self, df: pd.DataFrame) -> pd.Series:
         return true_range(df)
@@ -5,11 +5,26 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from .simulation_signal_utils import true_range
+from .simulation_features import FeatureMatrix
+
+
+def bollinger_squeeze_features(
+    features: FeatureMatrix, params: dict[str, Any]
+) -> dict[str, pd.Series]:
+    """Indicator columns used by the Bollinger squeeze strategy."""
+    bb_period = params.get("bb_period", 20)
+    kc_atr_period = params.get("kc_atr_period", 10)
+    return {
+        "bb_middle": features.sma(bb_period),
+        "bb_std": features.rolling_std(bb_period),
+        "atr": features.atr_sma(kc_atr_period),
+        "kc_middle": features.sma(kc_atr_period),
+        "avg_volume": features.sma(params.get("vol_period", 20), "volume"),
+    }
 
 
 def bollinger_squeeze_signals(
-    df: pd.DataFrame, params: dict[str, Any], true_range=true_range
+    df: pd.DataFrame, params: dict[str, Any], features: FeatureMatrix | None = None
 ) -> pd.Series:
     """Generate Bollinger Squeeze Breakout signals.
 
@@ -17,23 +32,21 @@ def bollinger_squeeze_signals(
     indicating low volatility. A breakout from the squeeze often leads to
     explosive moves.
     """
-    bb_period = params.get("bb_period", 20)
     bb_std = params.get("bb_std", 2.0)
-    kc_atr_period = params.get("kc_atr_period", 10)
     kc_multiplier = params.get("kc_multiplier", 1.5)
-    vol_period = params.get("vol_period", 20)
     vol_factor = params.get("vol_factor", 1.5)
 
+    indicators = bollinger_squeeze_features(features or FeatureMatrix(df), params)
+
     # Bollinger Bands
-    bb_middle = df["close"].rolling(bb_period).mean()
-    bb_std_val = df["close"].rolling(bb_period).std().fillna(0)
+    bb_middle = indicators["bb_middle"]
+    bb_std_val = indicators["bb_std"].fillna(0)
     bb_upper = bb_middle + bb_std * bb_std_val
     bb_lower = bb_middle - bb_std * bb_std_val
 
     # Keltner Channels (using ATR)
-    tr = true_range(df)
-    atr = tr.rolling(kc_atr_period).mean()
-    kc_middle = df["close"].rolling(kc_atr_period).mean()
+    atr = indicators["atr"]
+    kc_middle = indicators["kc_middle"]
     kc_upper = kc_middle + kc_multiplier * atr
     kc_lower = kc_middle - kc_multiplier * atr
 
@@ -45,7 +58,7 @@ def bollinger_squeeze_signals(
     momentum = df["close"] - bb_middle
 
     # Volume confirmation
-    avg_volume = df["volume"].rolling(vol_period).mean()
+    avg_volume = indicators["avg_volume"]
     has_volume_data = avg_volume.iloc[-1] > 0 if len(avg_volume) > 0 else False
     if has_volume_data:
         volume_spike = df["volume"] > avg_volume * vol_factor
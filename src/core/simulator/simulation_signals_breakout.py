@@ -5,30 +5,43 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from .simulation_signal_utils import true_range
+from .simulation_features import FeatureMatrix
+
+
+def breakout_features(features: FeatureMatrix, params: dict[str, Any]) -> dict[str, pd.Series]:
+    """Indicator columns used by the breakout strategy."""
+    sr_window = params.get("sr_window", 20)
+    atr_period = params.get("atr_period", 14)
+    adx_period = params.get("adx_period", 14)
+    return {
+        # ATR for dynamic thresholds
+        "atr": features.atr_sma(atr_period),
+        # Percentile-based levels instead of absolute max/min for better sensitivity
+        "resistance": features.rolling_quantile(sr_window, 0.95, "high"),
+        "support": features.rolling_quantile(sr_window, 0.05, "low"),
+        "avg_volume": features.sma(20, "volume"),
+        # ADX approximation (simplified)
+        "adx": features.adx_sma(adx_period, atr_period),
+    }
 
 
 def breakout_signals(
-    df: pd.DataFrame, params: dict[str, Any], true_range=true_range
+    df: pd.DataFrame, params: dict[str, Any], features: FeatureMatrix | None = None
 ) -> pd.Series:
     """Generate breakout strategy signals."""
-    sr_window = params.get("sr_window", 20)
     volume_ratio = params.get("volume_ratio", 1.5)
     adx_threshold = params.get("adx_threshold", 25)
     price_change_pct = params.get("price_change_pct", 0.01)
 
-    # Calculate ATR for dynamic thresholds
-    tr = true_range(df)
-    atr_period = params.get("atr_period", 14)
-    atr = tr.rolling(atr_period).mean()
+    indicators = breakout_features(features or FeatureMatrix(df), params)
+    atr = indicators["atr"]
 
     # Calculate resistance/support with ATR buffer for more realistic breakouts
-    # Use percentile-based levels instead of absolute max/min for better sensitivity
-    resistance = df["high"].rolling(sr_window).quantile(0.95).shift(1)
-    support = df["low"].rolling(sr_window).quantile(0.05).shift(1)
+    resistance = indicators["resistance"].shift(1)
+    support = indicators["support"].shift(1)
 
     # Volume analysis - handle missing volume data
-    avg_volume = df["volume"].rolling(20).mean()
+    avg_volume = indicators["avg_volume"]
     # If volume is all zeros or missing, don't use volume filter
     has_volume_data = avg_volume.iloc[-1] > 0 if len(avg_volume) > 0 else False
     if has_volume_data:
@@ -40,15 +53,7 @@ def breakout_signals(
     price_change_1 = df["close"].pct_change().fillna(0)
     price_change_3 = df["close"].pct_change(3).fillna(0)  # 3-bar momentum
 
-    # ADX approximation (simplified)
-    adx_period = params.get("adx_period", 14)
-    dm_plus = (df["high"].diff()).clip(lower=0)
-    dm_minus = (-df["low"].diff()).clip(lower=0)
-    di_plus = 100 * (dm_plus.rolling(adx_period).mean() / atr.replace(0, np.nan))
-    di_minus = 100 * (dm_minus.rolling(adx_period).mean() / atr.replace(0, np.nan))
-    di_sum = di_plus + di_minus
-    dx = 100 * abs(di_plus - di_minus) / di_sum.replace(0, np.nan)
-    adx = dx.rolling(adx_period).mean().fillna(0)
+    adx = indicators["adx"]
 
     # Generate signals
     signals = pd.Series(0, index=df.index)
@@ -5,24 +5,36 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from .simulation_signal_utils import calculate_rsi
+from .simulation_features import FeatureMatrix
+
+
+def mean_reversion_features(
+    features: FeatureMatrix, params: dict[str, Any]
+) -> dict[str, pd.Series]:
+    """Indicator columns used by the mean reversion strategy."""
+    bb_period = params.get("bb_period", 20)
+    return {
+        "bb_middle": features.sma(bb_period),
+        "bb_std": features.rolling_std(bb_period),
+        "rsi": features.rsi(params.get("rsi_period", 14)),
+    }
 
 
 def mean_reversion_signals(
-    df: pd.DataFrame, params: dict[str, Any], calculate_rsi=calculate_rsi
+    df: pd.DataFrame, params: dict[str, Any], features: FeatureMatrix | None = None
 ) -> pd.Series:
     """Generate mean reversion strategy signals."""
-    bb_period = params.get("bb_period", 20)
     bb_std = params.get("bb_std", 2.0)
-    rsi_period = params.get("rsi_period", 14)
     rsi_oversold = params.get("rsi_oversold", 30)
     rsi_overbought = params.get("rsi_overbought", 70)
     bb_pct_entry = params.get("bb_percent_entry", 0.1)
     bb_pct_exit = params.get("bb_percent_exit", 0.9)
 
+    indicators = mean_reversion_features(features or FeatureMatrix(df), params)
+
     # Bollinger Bands
-    middle = df["close"].rolling(bb_period).mean()
-    std = df["close"].rolling(bb_period).std().fillna(0)
+    middle = indicators["bb_middle"]
+    std = indicators["bb_std"].fillna(0)
     upper = middle + bb_std * std
     lower = middle - bb_std * std
 
@@ -32,7 +44,7 @@ def mean_reversion_signals(
     bb_pct = bb_pct.fillna(0.5)  # Default to middle if no range
 
     # RSI
-    rsi = calculate_rsi(df["close"], rsi_period)
+    rsi = indicators["rsi"]
 
     signals = pd.Series(0, index=df.index)
 
@@ -5,19 +5,23 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from .simulation_signal_utils import calculate_obv, calculate_rsi
+from .simulation_features import FeatureMatrix
+
+
+def momentum_features(features: FeatureMatrix, params: dict[str, Any]) -> dict[str, pd.Series]:
+    """Indicator columns used by the momentum strategy."""
+    return {
+        "rsi": features.rsi(params.get("rsi_period", 14)),
+        "obv": features.obv(),
+    }
 
 
 def momentum_signals(
-    df: pd.DataFrame,
-    params: dict[str, Any],
-    calculate_rsi=calculate_rsi,
-    calculate_obv=calculate_obv,
+    df: pd.DataFrame, params: dict[str, Any], features: FeatureMatrix | None = None
 ) -> pd.Series:
     """Generate momentum strategy signals."""
     roc_period = params.get("roc_period", 10)
     mom_period = params.get("mom_period", 10)
-    rsi_period = params.get("rsi_period", 14)
     roc_threshold = params.get("roc_threshold", 5.0)
     rsi_lower = params.get("rsi_lower", 50)
     rsi_upper = params.get("rsi_upper", 80)
@@ -30,11 +34,13 @@ def momentum_signals(
     # Momentum
     mom = (df["close"] - df["close"].shift(mom_period)).fillna(0)
 
+    indicators = momentum_features(features or FeatureMatrix(df), params)
+
     # RSI
-    rsi = calculate_rsi(df["close"], rsi_period)
+    rsi = indicators["rsi"]
 
     # OBV
-    obv = calculate_obv(df)
+    obv = indicators["obv"]
     obv_change = (obv.pct_change(10) * 100).fillna(0)
 
     signals = pd.Series(0, index=df.index)
@@ -5,40 +5,50 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from .simulation_signal_utils import true_range
+from .simulation_features import FeatureMatrix
+
+
+def _range_bars(params: dict[str, Any]) -> int:
+    # For daily/longer timeframes, use rolling high/low as "range"
+    return max(1, params.get("range_minutes", 15) // 5)  # Assume 5-min bars
+
+
+def opening_range_features(
+    features: FeatureMatrix, params: dict[str, Any]
+) -> dict[str, pd.Series]:
+    """Indicator columns used by the opening range strategy."""
+    range_bars = _range_bars(params)
+    return {
+        "avg_volume": features.sma(20, "volume"),
+        # Opening range: rolling high/low over range_bars
+        "range_high": features.rolling_max(range_bars, "high"),
+        "range_low": features.rolling_min(range_bars, "low"),
+    }
 
 
 def opening_range_signals(
-    df: pd.DataFrame, params: dict[str, Any], true_range=true_range
+    df: pd.DataFrame, params: dict[str, Any], features: FeatureMatrix | None = None
 ) -> pd.Series:
     """Generate Opening Range Breakout signals.
 
     Trades breakouts from the high/low range established in the first
     N minutes of the trading session.
     """
-    range_minutes = params.get("range_minutes", 15)
     vol_factor = params.get("vol_factor", 1.5)
-    atr_period = params.get("atr_period", 14)
 
-    # Calculate ATR for dynamic thresholds
-    tr = true_range(df)
-    atr = tr.rolling(atr_period).mean()
+    indicators = opening_range_features(features or FeatureMatrix(df), params)
 
     # Volume analysis
-    avg_volume = df["volume"].rolling(20).mean()
+    avg_volume = indicators["avg_volume"]
     has_volume_data = avg_volume.iloc[-1] > 0 if len(avg_volume) > 0 else False
     if has_volume_data:
         volume_spike = df["volume"] > avg_volume * vol_factor
     else:
         volume_spike = pd.Series(True, index=df.index)
 
-    # For intraday data, detect session opens
-    # For daily/longer timeframes, use rolling high/low as "range"
-    range_bars = max(1, range_minutes // 5)  # Assume 5-min bars
-
-    # Opening range: rolling high/low over range_bars
-    range_high = df["high"].rolling(range_bars).max().shift(1)
-    range_low = df["low"].rolling(range_bars).min().shift(1)
+    # Opening range of the previous range_bars
+    range_high = indicators["range_high"].shift(1)
+    range_low = indicators["range_low"].shift(1)
 
     # Breakout detection
     breakout_up = (df["close"] > range_high) & (df["close"].shift(1) <= range_high.shift(1))
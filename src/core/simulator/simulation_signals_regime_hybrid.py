@@ -5,15 +5,32 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from .simulation_signal_utils import calculate_obv, calculate_rsi, true_range
+from .simulation_features import FeatureMatrix
+
+
+def regime_hybrid_features(
+    features: FeatureMatrix, params: dict[str, Any]
+) -> dict[str, pd.Series]:
+    """Indicator columns used by the regime hybrid strategy."""
+    adx_period = params.get("adx_period", 14)
+    bb_period = params.get("bb_period", 20)
+    atr = features.atr_sma(adx_period)
+    return {
+        "atr": atr,
+        "atr_mean": features.cached(
+            f"atr_sma_{adx_period}_mean_20", lambda: atr.rolling(20).mean()
+        ),
+        "adx": features.adx_sma(adx_period, adx_period),
+        "bb_middle": features.sma(bb_period),
+        "bb_std": features.rolling_std(bb_period),
+        "rsi": features.rsi(14),
+        "ema_fast": features.ema(12),
+        "ema_slow": features.ema(26),
+    }
 
 
 def regime_hybrid_signals(
-    df: pd.DataFrame,
-    params: dict[str, Any],
-    calculate_rsi=calculate_rsi,
-    calculate_obv=calculate_obv,
-    true_range=true_range,
+    df: pd.DataFrame, params: dict[str, Any], features: FeatureMatrix | None = None
 ) -> pd.Series:
     """Generate Regime Switching Hybrid signals.
 
@@ -23,43 +40,36 @@ def regime_hybrid_signals(
     - Ranging: Mean reversion (buy oversold, sell overbought)
     - High Vol: Reduced position sizing / stay out
     """
-    adx_period = params.get("adx_period", 14)
     trend_threshold = params.get("trend_threshold", 25)
     range_threshold = params.get("range_threshold", 20)
-    bb_period = params.get("bb_period", 20)
     bb_std = params.get("bb_std", 2.0)
 
-    # Calculate ADX for regime detection
-    tr = true_range(df)
-    atr = tr.rolling(adx_period).mean()
-    dm_plus = (df["high"].diff()).clip(lower=0)
-    dm_minus = (-df["low"].diff()).clip(lower=0)
-    di_plus = 100 * (dm_plus.rolling(adx_period).mean() / atr.replace(0, np.nan))
-    di_minus = 100 * (dm_minus.rolling(adx_period).mean() / atr.replace(0, np.nan))
-    di_sum = di_plus + di_minus
-    dx = 100 * abs(di_plus - di_minus) / di_sum.replace(0, np.nan)
-    adx = dx.rolling(adx_period).mean().fillna(0)
+    indicators = regime_hybrid_features(features or FeatureMatrix(df), params)
+
+    # ADX for regime detection
+    atr = indicators["atr"]
+    adx = indicators["adx"]
 
     # Regime detection
     trending = adx > trend_threshold
     ranging = adx < range_threshold
     # High volatility: ATR expanding
-    atr_expanding = atr > atr.rolling(20).mean() * 1.5
+    atr_expanding = atr > indicators["atr_mean"] * 1.5
 
     # Bollinger Bands for mean reversion in ranging markets
-    bb_middle = df["close"].rolling(bb_period).mean()
-    bb_std_val = df["close"].rolling(bb_period).std().fillna(0)
+    bb_middle = indicators["bb_middle"]
+    bb_std_val = indicators["bb_std"].fillna(0)
     bb_upper = bb_middle + bb_std * bb_std_val
     bb_lower = bb_middle - bb_std * bb_std_val
     bb_pct = (df["close"] - bb_lower) / (bb_upper - bb_lower).replace(0, np.nan)
     bb_pct = bb_pct.fillna(0.5)
 
     # RSI
-    rsi = calculate_rsi(df["close"], 14)
+    rsi = indicators["rsi"]
 
     # Trend direction
-    ema_fast = df["close"].ewm(span=12, adjust=False).mean()
-    ema_slow = df["close"].ewm(span=26, adjust=False).mean()
+    ema_fast = indicators["ema_fast"]
+    ema_slow = indicators["ema_slow"]
     uptrend = ema_fast > ema_slow
 
     signals = pd.Series(0, index=df.index)
@@ -5,39 +5,55 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from .simulation_signal_utils import calculate_rsi
+from .simulation_features import FeatureMatrix
+
+
+def _rolling_vwap(df: pd.DataFrame, window: int = 20) -> pd.Series:
+    """VWAP (simplified - use rolling calculation)."""
+    typical_price = (df["high"] + df["low"] + df["close"]) / 3
+    volume_sum = df["volume"].rolling(window).sum()
+    vwap = (typical_price * df["volume"]).rolling(window).sum() / volume_sum.replace(0, np.nan)
+    return vwap.fillna(df["close"])  # Use close price as fallback
+
+
+def scalping_features(features: FeatureMatrix, params: dict[str, Any]) -> dict[str, pd.Series]:
+    """Indicator columns used by the scalping strategy."""
+    stoch_k = params.get("stoch_k", 5)
+    return {
+        "ema_fast": features.ema(params.get("ema_fast", 5)),
+        "ema_slow": features.ema(params.get("ema_slow", 9)),
+        "vwap": features.cached("vwap_20", lambda: _rolling_vwap(features.data, 20)),
+        "lowest_low": features.rolling_min(stoch_k, "low"),
+        "highest_high": features.rolling_max(stoch_k, "high"),
+    }
 
 
 def scalping_signals(
-    df: pd.DataFrame, params: dict[str, Any], calculate_rsi=calculate_rsi
+    df: pd.DataFrame, params: dict[str, Any], features: FeatureMatrix | None = None
 ) -> pd.Series:
     """Generate scalping strategy signals."""
-    ema_fast = params.get("ema_fast", 5)
-    ema_slow = params.get("ema_slow", 9)
-    stoch_k = params.get("stoch_k", 5)
     stoch_d = params.get("stoch_d", 3)
     stoch_upper = params.get("stoch_upper", 80)
     stoch_lower = params.get("stoch_lower", 20)
 
+    indicators = scalping_features(features or FeatureMatrix(df), params)
+
     # EMAs
-    ema_fast_vals = df["close"].ewm(span=ema_fast, adjust=False).mean()
-    ema_slow_vals = df["close"].ewm(span=ema_slow, adjust=False).mean()
+    ema_fast_vals = indicators["ema_fast"]
+    ema_slow_vals = indicators["ema_slow"]
 
     # EMA crossover detection
     ema_cross_up = (ema_fast_vals > ema_slow_vals) & (ema_fast_vals.shift(1) <= ema_slow_vals.shift(1))
     ema_cross_down = (ema_fast_vals < ema_slow_vals) & (ema_fast_vals.shift(1) >= ema_slow_vals.shift(1))
     ema_bullish = ema_fast_vals > ema_slow_vals
 
-    # VWAP (simplified - use rolling calculation)
-    typical_price = (df["high"] + df["low"] + df["close"]) / 3
-    volume_sum = df["volume"].rolling(20).sum()
-    vwap = (typical_price * df["volume"]).rolling(20).sum() / volume_sum.replace(0, np.nan)
-    vwap = vwap.fillna(df["close"])  # Use close price as fallback
+    # VWAP
+    vwap = indicators["vwap"]
     above_vwap = df["close"] > vwap
 
     # Stochastic
-    lowest_low = df["low"].rolling(stoch_k).min()
-    highest_high = df["high"].rolling(stoch_k).max()
+    lowest_low = indicators["lowest_low"]
+    highest_high = indicators["highest_high"]
     stoch_range = highest_high - lowest_low
     stoch_k_val = 100 * (df["close"] - lowest_low) / stoch_range.replace(0, np.nan)
     stoch_k_val = stoch_k_val.fillna(50)  # Default to middle if no range
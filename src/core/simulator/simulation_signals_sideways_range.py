@@ -6,16 +6,42 @@ Uses: SMA 20/50, RSI 14, Bollinger Bands, Stochastic, Volume, MACD, ADX.
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from .simulation_features import FeatureMatrix
+
+
+def sideways_range_features(
+    features: FeatureMatrix, params: dict[str, Any]
+) -> dict[str, pd.Series]:
+    """Indicator columns used by the sideways range strategy."""
+    bb_period = params.get("bb_period", 20)
+    stoch_k = params.get("stoch_k", 14)
+    return {
+        "sma_short": features.sma(params.get("sma_short", 20)),
+        "sma_long": features.sma(params.get("sma_long", 50)),
+        "rsi": features.rsi(params.get("rsi_period", 14)),
+        "bb_middle": features.sma(bb_period),
+        "bb_std": features.rolling_std(bb_period),
+        "lowest_low": features.rolling_min(stoch_k, "low"),
+        "highest_high": features.rolling_max(stoch_k, "high"),
+        "adx": features.adx_ema(params.get("adx_period", 14)),
+        "ema_fast": features.ema(params.get("macd_fast", 12)),
+        "ema_slow": features.ema(params.get("macd_slow", 26)),
+        # Price range lookback = bb_period
+        "rolling_high": features.rolling_max(bb_period, "high"),
+        "rolling_low": features.rolling_min(bb_period, "low"),
+        "volume_sma": features.sma(20, "volume"),
+    }
+
 
 def sideways_range_signals(
     df: pd.DataFrame,
     params: dict[str, Any],
-    calculate_rsi: Callable[[pd.Series, int], pd.Series],
+    features: FeatureMatrix | None = None,
 ) -> pd.Series:
     """Generate sideways range market strategy signals.
 
@@ -33,45 +59,36 @@ def sideways_range_signals(
     Args:
         df: OHLCV DataFrame
         params: Strategy parameters
-        calculate_rsi: RSI calculation function
+        features: Cached indicator columns of df (computed on demand if None)
 
     Returns:
         Signal series: 1=buy, -1=sell, 0=hold
     """
     # Extract parameters with defaults
-    sma_short = params.get("sma_short", 20)
-    sma_long = params.get("sma_long", 50)
-    rsi_period = params.get("rsi_period", 14)
     rsi_oversold = params.get("rsi_oversold", 30)
     rsi_overbought = params.get("rsi_overbought", 70)
-    bb_period = params.get("bb_period", 20)
     bb_std = params.get("bb_std", 2.0)
-    stoch_k = params.get("stoch_k", 14)
     stoch_d = params.get("stoch_d", 3)
     stoch_oversold = params.get("stoch_oversold", 20)
     stoch_overbought = params.get("stoch_overbought", 80)
-    adx_period = params.get("adx_period", 14)
     adx_threshold = params.get("adx_threshold", 20)
-    macd_fast = params.get("macd_fast", 12)
-    macd_slow = params.get("macd_slow", 26)
     macd_signal = params.get("macd_signal", 9)
     max_range_pct = params.get("max_range_pct", 0.6)
 
     # Calculate indicators
     close = df["close"]
-    high = df["high"]
-    low = df["low"]
+    indicators = sideways_range_features(features or FeatureMatrix(df), params)
 
     # SMA
-    sma_20 = close.rolling(sma_short).mean()
-    sma_50 = close.rolling(sma_long).mean()
+    sma_20 = indicators["sma_short"]
+    sma_50 = indicators["sma_long"]
 
     # RSI
-    rsi = calculate_rsi(close, rsi_period)
+    rsi = indicators["rsi"]
 
     # Bollinger Bands
-    bb_middle = close.rolling(bb_period).mean()
-    bb_std_val = close.rolling(bb_period).std().fillna(0)
+    bb_middle = indicators["bb_middle"]
+    bb_std_val = indicators["bb_std"].fillna(0)
     bb_upper = bb_middle + bb_std * bb_std_val
     bb_lower = bb_middle - bb_std * bb_std_val
     bb_width = bb_upper - bb_lower
@@ -79,31 +96,30 @@ def sideways_range_signals(
     bb_pct = bb_pct.fillna(0.5)
 
     # Stochastic Oscillator
-    lowest_low = low.rolling(stoch_k).min()
-    highest_high = high.rolling(stoch_k).max()
+    lowest_low = indicators["lowest_low"]
+    highest_high = indicators["highest_high"]
     stoch_range = highest_high - lowest_low
     stoch_k_val = ((close - lowest_low) / stoch_range.replace(0, np.nan)) * 100
     stoch_k_val = stoch_k_val.fillna(50)
     stoch_d_val = stoch_k_val.rolling(stoch_d).mean()
 
     # ADX for sideways confirmation
-    adx = _calculate_adx(df, adx_period)
+    adx = indicators["adx"]
 
     # MACD
-    ema_fast = close.ewm(span=macd_fast, adjust=False).mean()
-    ema_slow = close.ewm(span=macd_slow, adjust=False).mean()
+    ema_fast = indicators["ema_fast"]
+    ema_slow = indicators["ema_slow"]
     macd_line = ema_fast - ema_slow
     macd_signal_line = macd_line.ewm(span=macd_signal, adjust=False).mean()
     macd_hist = macd_line - macd_signal_line
 
     # Price Range Check (for sideways market confirmation)
-    lookback = bb_period
-    rolling_high = high.rolling(lookback).max()
-    rolling_low = low.rolling(lookback).min()
+    rolling_high = indicators["rolling_high"]
+    rolling_low = indicators["rolling_low"]
     price_range_pct = ((rolling_high - rolling_low) / rolling_low * 100).fillna(0)
 
     # Volume relative to average
-    volume_sma = df["volume"].rolling(20).mean()
+    volume_sma = indicators["volume_sma"]
     volume_ratio = (df["volume"] / volume_sma.replace(0, 1)).fillna(1)
 
     # Initialize signals
@@ -160,36 +176,3 @@ def sideways_range_signals(
 
     return signals
 
-
-def _calculate_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    """Calculate Average Directional Index (ADX)."""
-    high = df["high"]
-    low = df["low"]
-    close = df["close"]
-
-    # True Range
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-    # Directional Movement
-    up_move = high - high.shift(1)
-    down_move = low.shift(1) - low
-
-    plus_dm = pd.Series(0.0, index=df.index)
-    minus_dm = pd.Series(0.0, index=df.index)
-
-    plus_dm[(up_move > down_move) & (up_move > 0)] = up_move
-    minus_dm[(down_move > up_move) & (down_move > 0)] = down_move
-
-    # Smoothed values
-    atr = tr.ewm(span=period, adjust=False).mean()
-    plus_di = 100 * (plus_dm.ewm(span=period, adjust=False).mean() / atr.replace(0, np.nan))
-    minus_di = 100 * (minus_dm.ewm(span=period, adjust=False).mean() / atr.replace(0, np.nan))
-
-    # ADX
-    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di).replace(0, np.nan)
-    adx = dx.ewm(span=period, adjust=False).mean()
-
-    return adx.fillna(0)
@@ -5,36 +5,50 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from .simulation_signal_utils import calculate_rsi
+from .simulation_features import FeatureMatrix
 
 
-def trend_following_signals(
-    df: pd.DataFrame, params: dict[str, Any], calculate_rsi=calculate_rsi
-) -> pd.Series:
-    """Generate trend following strategy signals."""
+def trend_following_features(
+    features: FeatureMatrix, params: dict[str, Any]
+) -> dict[str, pd.Series]:
+    """Indicator columns used by the trend following strategy."""
     sma_fast = params.get("sma_fast", 50)
     sma_slow = params.get("sma_slow", 200)
-    rsi_period = params.get("rsi_period", 14)
-    rsi_upper_limit = params.get("rsi_upper_limit", 70)
-    rsi_lower_limit = params.get("rsi_lower_limit", 30)
-    macd_fast = params.get("macd_fast", 12)
-    macd_slow = params.get("macd_slow", 26)
 
     # Use smaller SMA periods if data is limited
-    data_len = len(df)
+    data_len = len(features.data)
     effective_sma_fast = min(sma_fast, max(5, data_len // 10))
     effective_sma_slow = min(sma_slow, max(20, data_len // 4))
 
-    # SMAs with fillna to handle NaN at start
-    sma_fast_vals = df["close"].rolling(effective_sma_fast, min_periods=1).mean()
-    sma_slow_vals = df["close"].rolling(effective_sma_slow, min_periods=1).mean()
+    return {
+        # SMAs with min_periods=1 to handle NaN at start
+        "sma_fast": features.sma(effective_sma_fast, min_periods=1),
+        "sma_slow": features.sma(effective_sma_slow, min_periods=1),
+        "rsi": features.rsi(params.get("rsi_period", 14)),
+        "ema_fast": features.ema(params.get("macd_fast", 12)),
+        "ema_slow": features.ema(params.get("macd_slow", 26)),
+    }
+
+
+def trend_following_signals(
+    df: pd.DataFrame, params: dict[str, Any], features: FeatureMatrix | None = None
+) -> pd.Series:
+    """Generate trend following strategy signals."""
+    rsi_upper_limit = params.get("rsi_upper_limit", 70)
+    rsi_lower_limit = params.get("rsi_lower_limit", 30)
+
+    indicators = trend_following_features(features or FeatureMatrix(df), params)
+
+    # SMAs
+    sma_fast_vals = indicators["sma_fast"]
+    sma_slow_vals = indicators["sma_slow"]
 
     # RSI
-    rsi = calculate_rsi(df["close"], rsi_period)
+    rsi = indicators["rsi"]
 
     # MACD
-    ema_fast = df["close"].ewm(span=macd_fast, adjust=False).mean()
-    ema_slow = df["close"].ewm(span=macd_slow, adjust=False).mean()
+    ema_fast = indicators["ema_fast"]
+    ema_slow = indicators["ema_slow"]
     macd = ema_fast - ema_slow
     macd_signal = macd.ewm(span=9, adjust=False).mean()
 
@@ -5,31 +5,43 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from .simulation_signal_utils import calculate_rsi
+from .simulation_features import FeatureMatrix
+
+
+def trend_pullback_features(
+    features: FeatureMatrix, params: dict[str, Any]
+) -> dict[str, pd.Series]:
+    """Indicator columns used by the trend pullback strategy."""
+    ema_trend = params.get("ema_trend", 200)
+
+    # Adjust EMA period for short data
+    data_len = len(features.data)
+    effective_ema = min(ema_trend, max(20, data_len // 4))
+
+    return {
+        "ema": features.ema(effective_ema),
+        "rsi": features.rsi(params.get("rsi_period", 14)),
+    }
 
 
 def trend_pullback_signals(
-    df: pd.DataFrame, params: dict[str, Any], calculate_rsi=calculate_rsi
+    df: pd.DataFrame, params: dict[str, Any], features: FeatureMatrix | None = None
 ) -> pd.Series:
     """Generate Trend Pullback signals.
 
     Classic trend following: Buy dips in uptrends when RSI shows oversold
     conditions while price remains above the trend EMA.
     """
-    ema_trend = params.get("ema_trend", 200)
-    rsi_period = params.get("rsi_period", 14)
     rsi_pullback = params.get("rsi_pullback", 40)
     rsi_exit = params.get("rsi_exit", 70)
 
-    # Adjust EMA period for short data
-    data_len = len(df)
-    effective_ema = min(ema_trend, max(20, data_len // 4))
+    indicators = trend_pullback_features(features or FeatureMatrix(df), params)
 
     # Trend EMA
-    ema_vals = df["close"].ewm(span=effective_ema, adjust=False).mean()
+    ema_vals = indicators["ema"]
 
     # RSI
-    rsi = calculate_rsi(df["close"], rsi_period)
+    rsi = indicators["rsi"]
 
     # Trend detection
     uptrend = df["close"] > ema_vals
@@ -6,7 +6,8 @@ Module 5/5 of ai_validator.py split (Main Orchestrator).
 
 Features:
 - Multi-Provider Support (OpenAI, Anthropic, Gemini)
-- Hierarchische Validierung (Quick -> Deep)
+- Hierarchische Validierung (Quick -> Deep, parallel mit Latenz-Budget)
+- Antwort-Cache pro Markt-Fingerprint
 - Confidence Score (0-100)
 - Setup-Typ Erkennung
 - Reasoning für Nachvollziehbarkeit
@@ -37,6 +38,7 @@ from .ai_validator_config import (
 from .ai_validator_prompts import AIValidatorPrompts
 from .ai_validator_providers import AIValidatorProviders
 from .ai_validator_validation import AIValidatorValidation
+from .llm_validation_runner import LLMResponseCache
 
 if TYPE_CHECKING:
     from .signal_generator import TradeSignal
@@ -72,6 +74,8 @@ class AISignalValidator:
         deep_analysis_enabled: bool = True,
         fallback_to_technical: bool = True,
         timeout_seconds: int = 30,
+        latency_budget_seconds: float = 8.0,
+        cache_ttl_seconds: int = 120,
     ):
         """
         Args:
@@ -81,6 +85,10 @@ class AISignalValidator:
             deep_analysis_enabled: Deep Analysis bei unsicheren Signalen
             fallback_to_technical: Bei API-Fehler technisches Signal verwenden
             timeout_seconds: API Timeout
+            latency_budget_seconds: Max. Wartezeit für die gesamte Quick/Deep-
+                Entscheidung; danach greift fallback_to_technical
+            cache_ttl_seconds: Wiederverwendung von Antworten für denselben
+                Markt-Fingerprint (0 = kein Cache)
 
         HINWEIS: Provider und Model werden aus QSettings geladen!
                  Einstellbar über: File -> Settings -> AI
@@ -92,6 +100,8 @@ class AISignalValidator:
         self.deep_analysis_enabled = deep_analysis_enabled
         self.fallback_to_technical = fallback_to_technical
         self.timeout_seconds = timeout_seconds
+        self.latency_budget_seconds = latency_budget_seconds
+        self._response_cache = LLMResponseCache(ttl_seconds=cache_ttl_seconds)
 
         # Helper modules (composition pattern)
         self._prompts_helper = AIValidatorPrompts(parent=self)
@@ -194,6 +204,7 @@ class AISignalValidator:
 
         # Reset clients wenn Settings geändert wurden
         self._providers_helper.reset_clients()
+        self._response_cache.clear()
 
         logger.info(
             f"AI validator config updated: "
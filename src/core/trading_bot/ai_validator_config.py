@@ -46,6 +46,7 @@ def get_model_from_settings(provider: str) -> str:
             "openai": "openai_model",
             "anthropic": "anthropic_model",
             "gemini": "gemini_model",
+            "local": "local_model",
         }
 
         # Defaults müssen mit model_constants.py übereinstimmen!
@@ -54,6 +55,7 @@ def get_model_from_settings(provider: str) -> str:
             "openai": "gpt-4.1-mini",      # Schnell und günstig
             "anthropic": "claude-sonnet-4-5",  # Aktuelles Modell
             "gemini": "gemini-1.5-flash",  # Schnelles Modell
+            "local": "local",  # Lokaler OpenAI-kompatibler Server
         }
 
         provider_lower = provider.lower()
@@ -80,6 +82,7 @@ def get_model_from_settings(provider: str) -> str:
             "openai": "gpt-4.1-mini",
             "anthropic": "claude-sonnet-4-5",
             "gemini": "gemini-1.5-flash",
+            "local": "local",
         }
         return defaults.get(provider.lower(), "gpt-4.1-mini")
 
@@ -89,7 +92,7 @@ def get_provider_from_settings() -> str:
     Holt den konfigurierten AI Provider aus den QSettings.
 
     Returns:
-        Provider name ("openai", "anthropic", "gemini")
+        Provider name ("openai", "anthropic", "gemini", "local")
     """
     try:
         from PyQt6.QtCore import QSettings
@@ -9,6 +9,7 @@ Contains:
 - _call_openai(): OpenAI API Integration (GPT-5.x, GPT-4.1)
 - _call_anthropic(): Anthropic API Integration (Claude Sonnet 4.5)
 - _call_gemini(): Google Gemini API Integration (Gemini 2.0, 1.5)
+- _call_local(): OpenAI-kompatibler lokaler Server (Ollama, llama.cpp, Test-Stub)
 """
 
 from __future__ import annotations
@@ -18,6 +19,10 @@ import logging
 import os
 from typing import TYPE_CHECKING, Any
 
+import aiohttp
+
+from src.common.http_pool import get_http_pool
+
 if TYPE_CHECKING:
     pass
 
@@ -48,6 +53,8 @@ class AIValidatorProviders:
             return await self.call_anthropic(prompt)
         elif provider == "gemini":
             return await self.call_gemini(prompt)
+        elif provider == "local":
+            return await self.call_local(prompt)
         else:
             raise ValueError(f"Unknown provider: {provider}")
 
@@ -209,6 +216,50 @@ class AIValidatorProviders:
                 "Run: pip install google-generativeai"
             )
 
+    async def call_local(self, prompt: str) -> dict[str, Any]:
+        """Lokaler OpenAI-kompatibler Server (Chat Completions).
+
+        Base-URL aus LOCAL_LLM_BASE_URL (Default: Ollama auf localhost).
+        """
+        base_url = os.environ.get("LOCAL_LLM_BASE_URL", "http://127.0.0.1:11434/v1")
+        model = self.parent.model
+        payload = {
+            "model": model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a professional crypto trading analyst. Always respond with valid JSON only.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": 500,
+            "temperature": 0.3,
+        }
+        timeout = aiohttp.ClientTimeout(total=self.parent.timeout_seconds)
+
+        # Shared keep-alive session: no new connection per validation
+        session = get_http_pool().session("local_llm")
+        async with session.post(f"{base_url.rstrip('/')}/chat/completions", json=payload, timeout=timeout) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise ValueError(f"Local LLM error ({response.status}): {error_text[:200]}")
+            data = await response.json()
+
+        content = data["choices"][0]["message"]["content"]
+        if not content:
+            raise ValueError(f"Local LLM returned empty response for model '{model}'")
+
+        # JSON aus Response extrahieren (falls Markdown-Wrapping)
+        if "```json" in content:
+            content = content.split("```json")[1].split("```")[0]
+        elif "```" in content:
+            content = content.split("```")[1].split("```")[0]
+
+        try:
+            return json.loads(content.strip())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Could not parse local LLM response as JSON: {e}")
+
     def reset_clients(self) -> None:
         """Reset all API clients (called when config changes)."""
         self._openai_client = None
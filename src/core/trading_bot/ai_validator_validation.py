@@ -6,11 +6,12 @@ Module 4/5 of ai_validator.py split.
 
 Contains:
 - validate_signal(): Quick Validation Flow
-- validate_signal_hierarchical(): Hierarchische Validierung (Quick -> Deep)
+- validate_signal_hierarchical(): Hierarchische Validierung (Quick || Deep, mit Latenz-Budget)
 - _run_deep_analysis(): Deep Analysis Execution
 - _parse_response(): Parse LLM JSON Response
 - _create_bypass_validation(): Bypass-Validation
 - _create_fallback_validation(): Fallback-Validation
+- _create_deadline_validation(): Entscheidung bei überschrittenem Latenz-Budget
 """
 
 from __future__ import annotations
@@ -22,6 +23,7 @@ from typing import TYPE_CHECKING, Any
 import pandas as pd
 
 from .ai_validator_config import AIValidation, ValidationLevel
+from .llm_validation_runner import market_fingerprint, price_bucket, run_tiers
 
 if TYPE_CHECKING:
     from .signal_generator import TradeSignal
@@ -81,21 +83,7 @@ class AIValidatorValidation:
 
         except Exception as e:
             logger.error(f"AI validation failed: {e}")
-
-            if self.parent.fallback_to_technical:
-                logger.info("Falling back to technical signal (AI error)")
-                return self.create_fallback_validation(str(e))
-            else:
-                return AIValidation(
-                    approved=False,
-                    confidence_score=0,
-                    setup_type=None,
-                    reasoning="AI validation failed",
-                    provider=self.parent.provider,
-                    model=self.parent.model,
-                    timestamp=datetime.now(timezone.utc),
-                    error=str(e),
-                )
+            return self.create_error_validation(str(e))
 
     async def validate_signal_hierarchical(
         self,
@@ -125,26 +113,83 @@ class AIValidatorValidation:
         if not self.parent.enabled:
             return self.create_bypass_validation("AI validation disabled")
 
-        # Step 1: Quick Validation
+        # Step 1: Quick Validation (Deep startet parallel, spekulativ)
         logger.info(
             f"[Hierarchical] Step 1: Quick validation for {signal.direction.value} "
             f"(Confluence: {signal.confluence_score})"
         )
 
-        quick_result = await self.validate_signal(signal, indicators, market_context)
-        quick_result.validation_level = ValidationLevel.QUICK
+        try:
+            prompt = self.parent._prompts_helper.build_prompt(signal, indicators, market_context)
+            fingerprint = self.fingerprint(signal, market_context)
+        except Exception as e:
+            logger.error(f"AI validation failed: {e}")
+            return self.create_error_validation(str(e))
+
+        cache = self.parent._response_cache
+        call_llm = self.parent._providers_helper.call_llm
+
+        def quick():
+            return cache.fetch((fingerprint, "quick"), lambda: call_llm(prompt))
+
+        def deep():
+            return cache.fetch(
+                (fingerprint, "deep"),
+                lambda: call_llm(
+                    self.parent._prompts_helper.build_deep_prompt(
+                        signal, indicators, market_context, ohlcv_data
+                    )
+                ),
+            )
 
-        # Step 2: Evaluate Quick Result
-        if quick_result.confidence_score >= self.parent.confidence_threshold_trade:
-            # High confidence -> Trade
+        outcome = await run_tiers(
+            quick=quick,
+            deep=deep if self.parent.deep_analysis_enabled else None,
+            budget_seconds=self.parent.latency_budget_seconds,
+            needs_deep=self._needs_deep,
+        )
+
+        if outcome.quick is None:
+            if outcome.deep is None:
+                if outcome.timed_out:
+                    return self.create_deadline_validation(outcome.latency_ms)
+                logger.error(f"AI validation failed: {outcome.quick_error}")
+                return self.create_error_validation(outcome.quick_error or "no response")
+            logger.info("[Hierarchical] Quick validation unavailable -> Deep result decides")
+        else:
+            quick_result = self.parse_response(outcome.quick)
+            quick_result.validation_level = ValidationLevel.QUICK
             logger.info(
-                f"[Hierarchical] Quick confidence {quick_result.confidence_score}% "
-                f">= {self.parent.confidence_threshold_trade}% -> TRADE APPROVED"
+                f"AI validation complete: "
+                f"Approved={quick_result.approved}, "
+                f"Confidence={quick_result.confidence_score}%, "
+                f"Setup={quick_result.setup_type}"
             )
-            quick_result.approved = True
-            return quick_result
 
-        elif quick_result.confidence_score >= self.parent.confidence_threshold_deep:
+            # Step 2: Evaluate Quick Result
+            if quick_result.confidence_score >= self.parent.confidence_threshold_trade:
+                # High confidence -> Trade
+                logger.info(
+                    f"[Hierarchical] Quick confidence {quick_result.confidence_score}% "
+                    f">= {self.parent.confidence_threshold_trade}% -> TRADE APPROVED"
+                )
+                quick_result.approved = True
+                return quick_result
+
+            if quick_result.confidence_score < self.parent.confidence_threshold_deep:
+                # Low confidence -> Skip
+                logger.info(
+                    f"[Hierarchical] Quick confidence {quick_result.confidence_score}% "
+                    f"< {self.parent.confidence_threshold_deep}% -> SIGNAL SKIPPED"
+                )
+                quick_result.approved = False
+                quick_result.reasoning = (
+                    f"Signal skipped: Confidence {quick_result.confidence_score}% "
+                    f"below threshold {self.parent.confidence_threshold_deep}%. "
+                    f"Original: {quick_result.reasoning}"
+                )
+                return quick_result
+
             # Medium confidence -> Deep Analysis
             if not self.parent.deep_analysis_enabled:
                 logger.info(
@@ -156,47 +201,62 @@ class AIValidatorValidation:
                 return quick_result
 
             logger.info(
-                f"[Hierarchical] Step 2: Deep Analysis triggered "
+                f"[Hierarchical] Step 2: Deep Analysis "
                 f"(Confidence {quick_result.confidence_score}% in range "
                 f"[{self.parent.confidence_threshold_deep}-{self.parent.confidence_threshold_trade}])"
             )
 
-            # Deep Analysis durchführen
-            deep_result = await self.run_deep_analysis(
-                signal, indicators, market_context, ohlcv_data
-            )
-            deep_result.deep_analysis_triggered = True
-            deep_result.validation_level = ValidationLevel.DEEP
+        if outcome.deep is None:
+            if outcome.timed_out:
+                return self.create_deadline_validation(outcome.latency_ms)
+            logger.error(f"Deep analysis failed: {outcome.deep_error}")
+            return self.create_deep_failure_validation(outcome.deep_error or "no response")
 
-            # Deep Result entscheidet
-            if deep_result.confidence_score >= self.parent.confidence_threshold_trade:
-                logger.info(
-                    f"[Hierarchical] Deep confidence {deep_result.confidence_score}% "
-                    f">= {self.parent.confidence_threshold_trade}% -> TRADE APPROVED"
-                )
-                deep_result.approved = True
-            else:
-                logger.info(
-                    f"[Hierarchical] Deep confidence {deep_result.confidence_score}% "
-                    f"< {self.parent.confidence_threshold_trade}% -> TRADE REJECTED"
-                )
-                deep_result.approved = False
-
-            return deep_result
+        # Deep Result entscheidet
+        deep_result = self.parse_response(outcome.deep)
+        deep_result.deep_analysis_triggered = True
+        deep_result.validation_level = ValidationLevel.DEEP
 
-        else:
-            # Low confidence -> Skip
+        if deep_result.confidence_score >= self.parent.confidence_threshold_trade:
             logger.info(
-                f"[Hierarchical] Quick confidence {quick_result.confidence_score}% "
-                f"< {self.parent.confidence_threshold_deep}% -> SIGNAL SKIPPED"
+                f"[Hierarchical] Deep confidence {deep_result.confidence_score}% "
+                f">= {self.parent.confidence_threshold_trade}% -> TRADE APPROVED"
             )
-            quick_result.approved = False
-            quick_result.reasoning = (
-                f"Signal skipped: Confidence {quick_result.confidence_score}% "
-                f"below threshold {self.parent.confidence_threshold_deep}%. "
-                f"Original: {quick_result.reasoning}"
+            deep_result.approved = True
+        else:
+            logger.info(
+                f"[Hierarchical] Deep confidence {deep_result.confidence_score}% "
+                f"< {self.parent.confidence_threshold_trade}% -> TRADE REJECTED"
             )
-            return quick_result
+            deep_result.approved = False
+
+        return deep_result
+
+    def _needs_deep(self, response: dict[str, Any]) -> bool:
+        """Quick-Antwort im Unsicherheitsbereich -> Deep Analysis entscheidet."""
+        confidence = int(response.get("confidence_score", 0))
+        return (
+            self.parent.confidence_threshold_deep
+            <= confidence
+            < self.parent.confidence_threshold_trade
+        )
+
+    @staticmethod
+    def fingerprint(
+        signal: "TradeSignal", market_context: "MarketContext | None" = None
+    ) -> str:
+        """Cache-Key: Richtung, Confluence, Regime, Trends und Preis-Bucket."""
+        return market_fingerprint(
+            direction=signal.direction.value,
+            confluence=signal.confluence_score,
+            regime=signal.regime,
+            price=price_bucket(signal.current_price),
+            context_regime=getattr(market_context, "regime", None),
+            trends=[
+                getattr(market_context, name, None)
+                for name in ("trend_1d", "trend_4h", "trend_1h", "trend_5m")
+            ],
+        )
 
     async def run_deep_analysis(
         self,
@@ -213,7 +273,6 @@ class AIValidatorValidation:
         """
         # Model aus Settings holen (gleiche wie Quick, Settings entscheiden)
         current_model = self.parent.model
-        current_provider = self.parent.provider
 
         try:
             # Detaillierterer Prompt für Deep Analysis
@@ -232,18 +291,7 @@ class AIValidatorValidation:
 
         except Exception as e:
             logger.error(f"Deep analysis failed: {e}")
-            # Fallback: Signal abgelehnt
-            return AIValidation(
-                approved=False,
-                confidence_score=40,
-                setup_type=None,
-                reasoning=f"Deep analysis failed: {e}. Signal rejected for safety.",
-                provider=current_provider,
-                model=current_model,
-                timestamp=datetime.now(timezone.utc),
-                validation_level=ValidationLevel.DEEP,
-                error=str(e),
-            )
+            return self.create_deep_failure_validation(str(e))
 
     def parse_response(self, response: dict[str, Any]) -> AIValidation:
         """Parst die LLM-Antwort."""
@@ -296,3 +344,47 @@ class AIValidatorValidation:
             validation_level=ValidationLevel.TECHNICAL,
             error=error,
         )
+
+    def create_error_validation(self, error: str) -> AIValidation:
+        """Erstellt Validation bei Quick-Fehler (Fallback oder Ablehnung)."""
+        if self.parent.fallback_to_technical:
+            logger.info("Falling back to technical signal (AI error)")
+            return self.create_fallback_validation(error)
+        return AIValidation(
+            approved=False,
+            confidence_score=0,
+            setup_type=None,
+            reasoning="AI validation failed",
+            provider=self.parent.provider,
+            model=self.parent.model,
+            timestamp=datetime.now(timezone.utc),
+            error=error,
+        )
+
+    def create_deep_failure_validation(self, error: str) -> AIValidation:
+        """Erstellt Validation bei Deep-Fehler (Signal aus Sicherheitsgründen abgelehnt)."""
+        return AIValidation(
+            approved=False,
+            confidence_score=40,
+            setup_type=None,
+            reasoning=f"Deep analysis failed: {error}. Signal rejected for safety.",
+            provider=self.parent.provider,
+            model=self.parent.model,
+            timestamp=datetime.now(timezone.utc),
+            validation_level=ValidationLevel.DEEP,
+            error=error,
+        )
+
+    def create_deadline_validation(self, latency_ms: int) -> AIValidation:
+        """Erstellt Validation wenn das Latenz-Budget überschritten wurde.
+
+        Entscheidung wie bei API-Fehlern: fallback_to_technical genehmigt
+        das technische Signal, sonst wird es abgelehnt. Späte Antworten
+        landen trotzdem im Cache.
+        """
+        error = (
+            f"AI validation exceeded latency budget "
+            f"({self.parent.latency_budget_seconds:.1f}s, waited {latency_ms} ms)"
+        )
+        logger.warning(f"[Hierarchical] {error}")
+        return self.create_error_validation(error)
@@ -0,0 +1,243 @@
+"""Bot Analysis Stage - CPU-lastige Analyse im Worker-Thread.
+
+Indikator-Berechnung (pandas_ta), Regime-Erkennung und Signal-Generierung
+liefen bisher direkt auf dem asyncio Event-Loop, der auch den WebSocket
+und PositionMonitor.on_price_update bedient. Ein langsamer Zyklus hat
+damit Stop-Loss-Checks verzögert.
+
+Die Analyse-Stage:
+- arbeitet auf einem unveränderlichen AnalysisSnapshot (eigene DataFrame-
+  Kopie + eingefrorene Parameter) - der Worker teilt keinen Zustand mit
+  dem Event-Loop
+- läuft in einem dedizierten Single-Thread-Executor, der Event-Loop bleibt
+  frei für Preis-Updates und den Exit-Pfad
+- prüft zwischen den Schritten, ob der Zyklus veraltet ist (neue Bar,
+  Stop, Position eröffnet) und bricht dann ab; veraltete Ergebnisse
+  werden verworfen
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Hashable
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from .bot_market_analyzer import BotMarketAnalyzer
+    from .signal_generator import SignalGenerator, TradeSignal
+    from .trade_logger import IndicatorSnapshot, MarketContext
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisCancelled(Exception):
+    """Analyse-Zyklus ist veraltet und wurde abgebrochen."""
+
+
+@dataclass(frozen=True)
+class AnalysisSnapshot:
+    """Unveränderliche Eingabe eines Analyse-Zyklus.
+
+    Attributes:
+        df: OHLCV-Daten (Kopie, gehört exklusiv dem Worker)
+        require_regime_alignment: Config-Wert zum Zeitpunkt des Snapshots
+        input_key: Identität der Input-Bar (siehe bar_key_and_close_time)
+        bar_close_time: Bar-Close, auf den sich die Analyse bezieht
+        generation: Zyklus-Nummer der Stage (für Stale-Erkennung)
+    """
+
+    df: pd.DataFrame
+    require_regime_alignment: bool
+    input_key: Hashable | None = None
+    bar_close_time: datetime | None = None
+    generation: int = 0
+
+
+@dataclass(frozen=True)
+class AnalysisResult:
+    """Ergebnis eines Analyse-Zyklus."""
+
+    snapshot: AnalysisSnapshot
+    df: pd.DataFrame  # Mit Indikatoren
+    regime: str
+    signal: "TradeSignal"
+    indicators: "IndicatorSnapshot | None" = None
+    market_context: "MarketContext | None" = None
+    duration_ms: float = 0.0
+
+
+class BotAnalysisStage:
+    """Führt die Analyse in einem Worker-Thread aus.
+
+    Usage:
+        snapshot = stage.snapshot(df, require_regime_alignment=True)
+        result = await stage.run(snapshot, is_stale=lambda: new_bar_pending)
+        if result is None:
+            return  # Veraltet/abgebrochen
+    """
+
+    def __init__(
+        self,
+        market_analyzer: "BotMarketAnalyzer",
+        signal_generator: "SignalGenerator",
+    ):
+        self.market_analyzer = market_analyzer
+        self.signal_generator = signal_generator
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        # Statistiken
+        self.cycles_completed = 0
+        self.cycles_cancelled = 0
+        self.last_duration_ms: float | None = None
+
+    # =========================================================================
+    # SNAPSHOT
+    # =========================================================================
+
+    def snapshot(
+        self,
+        df: pd.DataFrame,
+        require_regime_alignment: bool,
+        input_key: Hashable | None = None,
+        bar_close_time: datetime | None = None,
+        copy: bool = False,
+    ) -> AnalysisSnapshot:
+        """Erstellt den Snapshot für einen neuen Zyklus.
+
+        Jeder neue Snapshot macht laufende Zyklen veraltet.
+
+        Args:
+            df: OHLCV-Daten
+            require_regime_alignment: Config-Wert
+            input_key: Identität der Input-Bar
+            bar_close_time: Bar-Close der Input-Bar
+            copy: True wenn df noch vom Aufrufer geteilt wird
+                (fetch_market_data liefert bereits eine Kopie)
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        return AnalysisSnapshot(
+            df=df.copy() if copy else df,
+            require_regime_alignment=require_regime_alignment,
+            input_key=input_key,
+            bar_close_time=bar_close_time,
+            generation=generation,
+        )
+
+    def cancel(self) -> None:
+        """Markiert alle laufenden Zyklen als veraltet (z.B. bei Stop)."""
+        with self._lock:
+            self._generation += 1
+
+    def is_current(self, snapshot: AnalysisSnapshot) -> bool:
+        """True solange kein neuerer Snapshot/cancel() existiert."""
+        return snapshot.generation == self._generation
+
+    # =========================================================================
+    # EXECUTION
+    # =========================================================================
+
+    async def run(
+        self,
+        snapshot: AnalysisSnapshot,
+        is_stale: Callable[[], bool] | None = None,
+    ) -> AnalysisResult | None:
+        """Analysiert den Snapshot im Worker-Thread.
+
+        Args:
+            snapshot: Eingabe (von snapshot())
+            is_stale: Zusätzliche, thread-sichere Abbruchbedingung
+                (z.B. neue Bar wartet bereits)
+
+        Returns:
+            AnalysisResult oder None wenn der Zyklus veraltet ist
+        """
+        def checkpoint() -> None:
+            if not self.is_current(snapshot) or (is_stale is not None and is_stale()):
+                raise AnalysisCancelled()
+            # GIL abgeben, damit der Event-Loop Preis-Updates sofort bedient
+            time.sleep(0)
+
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(
+                self._get_executor(), self._analyze, snapshot, checkpoint
+            )
+            checkpoint()
+        except AnalysisCancelled:
+            self.cycles_cancelled += 1
+            logger.debug(f"Analysis cycle {snapshot.generation} cancelled (stale)")
+            return None
+
+        self.cycles_completed += 1
+        self.last_duration_ms = result.duration_ms
+        return result
+
+    def _analyze(
+        self, snapshot: AnalysisSnapshot, checkpoint: Callable[[], None]
+    ) -> AnalysisResult:
+        """Worker: Indikatoren -> Regime -> Signal -> Logging-Kontext."""
+        started = time.perf_counter()
+        checkpoint()
+
+        df = snapshot.df
+        if "ema_20" not in df.columns:
+            df = self.market_analyzer.calculate_indicators(df)
+        checkpoint()
+
+        regime = self.market_analyzer.detect_regime(df)
+        signal = self.signal_generator.generate_signal(
+            df=df,
+            regime=regime,
+            require_regime_alignment=snapshot.require_regime_alignment,
+        )
+
+        indicators = None
+        market_context = None
+        if signal.is_valid:
+            checkpoint()
+            indicators = self.signal_generator.extract_indicator_snapshot(df)
+            market_context = self.market_analyzer.extract_market_context(df, regime)
+
+        return AnalysisResult(
+            snapshot=snapshot,
+            df=df,
+            regime=regime,
+            signal=signal,
+            indicators=indicators,
+            market_context=market_context,
+            duration_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    def get_stats(self) -> dict:
+        """Statistiken für den Bot-Status."""
+        return {
+            "cycles_completed": self.cycles_completed,
+            "cycles_cancelled": self.cycles_cancelled,
+            "last_duration_ms": self.last_duration_ms,
+        }
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="bot-analysis"
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Bricht laufende Zyklen ab und beendet den Worker-Thread."""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -113,7 +113,9 @@ class BotConfig:
     require_regime_alignment: bool = True  # Regime muss zum Signal passen
 
     # === TIMING ===
-    analysis_interval_seconds: int = 60  # Hauptanalyse alle 60 Sekunden
+    analysis_interval_seconds: int = 60  # Fallback: Hauptanalyse spätestens alle 60 Sekunden
+    event_coalesce_ms: int = 250  # Bar-Close/Tick-Bursts innerhalb 250ms = ein Zyklus
+    tick_trigger_move_percent: float = 0.3  # Tick weckt Analyse ab 0.3% Bewegung (0 = aus)
     position_check_interval_ms: int = 1000  # SL/TP Check jede Sekunde
     macro_update_interval_minutes: int = 60  # 1D/4h Daten alle 60 Min
     trend_update_interval_minutes: int = 15  # 4h/1h Daten alle 15 Min
@@ -0,0 +1,308 @@
+"""Bot Cycle Scheduler - Event-getriebener Analyse-Takt.
+
+Ersetzt das feste Polling (sleep(analysis_interval_seconds)) der
+Analyse-Loop:
+
+- Bar-Close und relevante Ticks (Preisbewegung >= tick_move_percent seit
+  dem letzten Zyklus) wecken die Loop sofort
+- Event-Bursts (mehrere Ticks/Chart-Updates kurz hintereinander) werden
+  innerhalb von coalesce_seconds zu einem Zyklus zusammengefasst
+- analysis_interval_seconds bleibt als Fallback-Timeout, falls keine
+  Events kommen
+- Zyklen, deren Input-Bar sich nicht geändert hat, werden übersprungen
+- Pro Entscheidung wird die Verzögerung zum Bar-Close gemessen
+
+notify_*() darf aus beliebigen Threads aufgerufen werden (z.B. Qt/Stream).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import numbers
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Hashable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WakeEvent:
+    """Grund für einen Analyse-Zyklus."""
+
+    reason: str  # "start" | "bar_close" | "tick" | "interval"
+    bar_close_time: datetime | None = None
+    coalesced: int = 0  # Zusätzliche Events, die in diesem Zyklus aufgehen
+
+
+@dataclass
+class SchedulerStats:
+    """Statistiken des Schedulers."""
+
+    wakeups: int = 0
+    coalesced_events: int = 0
+    ignored_ticks: int = 0
+    cycles_run: int = 0
+    cycles_skipped: int = 0
+    decisions: int = 0
+    last_latency_ms: float | None = None
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+    @property
+    def avg_latency_ms(self) -> float | None:
+        if not self.decisions:
+            return None
+        return self.total_latency_ms / self.decisions
+
+    def to_dict(self) -> dict:
+        return {
+            "wakeups": self.wakeups,
+            "coalesced_events": self.coalesced_events,
+            "ignored_ticks": self.ignored_ticks,
+            "cycles_run": self.cycles_run,
+            "cycles_skipped": self.cycles_skipped,
+            "decisions": self.decisions,
+            "last_latency_ms": self.last_latency_ms,
+            "avg_latency_ms": self.avg_latency_ms,
+            "max_latency_ms": self.max_latency_ms,
+        }
+
+
+class BarCloseScheduler:
+    """Weckt die Analyse-Loop bei Bar-Close und relevanten Ticks.
+
+    Usage:
+        scheduler = BarCloseScheduler(fallback_interval=60)
+        while running:
+            event = await scheduler.wait_for_trigger()
+            if not scheduler.should_run(input_key):
+                continue
+            ...  # Analyse
+            scheduler.record_decision(event.bar_close_time)
+    """
+
+    # Priorität beim Zusammenfassen: Bar-Close schlägt Tick schlägt Timeout
+    _PRIORITY = {"interval": 0, "tick": 1, "bar_close": 2, "start": 3}
+
+    def __init__(
+        self,
+        fallback_interval: float = 60.0,
+        coalesce_seconds: float = 0.25,
+        tick_move_percent: float = 0.0,
+    ):
+        """
+        Args:
+            fallback_interval: Max. Wartezeit ohne Events (Sekunden)
+            coalesce_seconds: Fenster zum Zusammenfassen von Event-Bursts
+            tick_move_percent: Preisbewegung seit letztem Zyklus, ab der ein
+                Tick die Analyse weckt (0 = Ticks wecken nicht)
+        """
+        self.fallback_interval = fallback_interval
+        self.coalesce_seconds = coalesce_seconds
+        self.tick_move_percent = tick_move_percent
+        self.stats = SchedulerStats()
+
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._event: asyncio.Event | None = None
+        self._pending: WakeEvent | None = WakeEvent("start")
+        self._reference_price: float | None = None
+        self._last_input_key: Hashable | None = None
+
+    # =========================================================================
+    # EVENTS (thread-safe)
+    # =========================================================================
+
+    def notify_bar_close(self, bar_close_time: datetime | None = None) -> None:
+        """Eine Bar wurde geschlossen (neue Bar im Chart/Stream)."""
+        self._notify(WakeEvent("bar_close", bar_close_time))
+
+    def notify_tick(self, price: float) -> bool:
+        """Preis-Tick; weckt nur bei relevanter Bewegung.
+
+        Returns:
+            True wenn der Tick einen Zyklus auslöst
+        """
+        price = float(price)
+        with self._lock:
+            reference = self._reference_price
+            if reference is None:
+                self._reference_price = price
+            relevant = (
+                self.tick_move_percent > 0
+                and reference is not None
+                and reference > 0
+                and abs(price / reference - 1.0) * 100 >= self.tick_move_percent
+            )
+            if relevant:
+                self._reference_price = price
+            else:
+                self.stats.ignored_ticks += 1
+        if relevant:
+            self._notify(WakeEvent("tick"))
+        return relevant
+
+    def _notify(self, event: WakeEvent) -> None:
+        with self._lock:
+            pending = self._pending
+            if pending is None:
+                self._pending = event
+            else:
+                self.stats.coalesced_events += 1
+                if self._PRIORITY[event.reason] > self._PRIORITY[pending.reason]:
+                    event.coalesced = pending.coalesced + 1
+                    self._pending = event
+                else:
+                    pending.coalesced += 1
+            loop, wake = self._loop, self._event
+        if loop is None or wake is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wake.set()
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(wake.set)
+
+    # =========================================================================
+    # LOOP
+    # =========================================================================
+
+    async def wait_for_trigger(self) -> WakeEvent:
+        """Wartet auf das nächste Event (oder den Fallback-Timeout).
+
+        Nach dem ersten Event wird coalesce_seconds gewartet, damit ein
+        Burst in genau einem Zyklus landet.
+        """
+        if self._event is None or self._loop is not asyncio.get_running_loop():
+            self._loop = asyncio.get_running_loop()
+            self._event = asyncio.Event()
+
+        # Events während des letzten Zyklus: sofort weiter, ohne Coalescing
+        loop = self._loop
+        deadline = loop.time() + self.fallback_interval
+        waited = False
+        while True:
+            self._event.clear()
+            if self._has_pending():
+                break
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            waited = True
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+        if waited and self._has_pending() and self.coalesce_seconds > 0:
+            await asyncio.sleep(self.coalesce_seconds)
+
+        with self._lock:
+            event = self._pending or WakeEvent("interval")
+            self._pending = None
+        self.stats.wakeups += 1
+        return event
+
+    def _has_pending(self) -> bool:
+        with self._lock:
+            return self._pending is not None
+
+    @property
+    def pending_reason(self) -> str | None:
+        """Grund des wartenden Events (thread-safe), None wenn keins wartet."""
+        with self._lock:
+            return self._pending.reason if self._pending is not None else None
+
+    def should_run(self, input_key: Hashable | None) -> bool:
+        """Prüft ob sich die Input-Bar seit dem letzten Zyklus geändert hat.
+
+        Args:
+            input_key: Identität der Input-Daten (z.B. letzte Bar + Close);
+                None = unbekannt, Zyklus läuft immer
+        """
+        if input_key is not None and input_key == self._last_input_key:
+            self.stats.cycles_skipped += 1
+            return False
+        self._last_input_key = input_key
+        self.stats.cycles_run += 1
+        return True
+
+    def record_decision(
+        self, bar_close_time: datetime | None, price: float | None = None
+    ) -> float | None:
+        """Misst die Verzögerung der Entscheidung zum Bar-Close.
+
+        Args:
+            bar_close_time: Schlusszeit der Bar, auf der entschieden wurde
+            price: Preis der Entscheidung (Referenz für Tick-Relevanz)
+
+        Returns:
+            Latenz in ms oder None wenn die Bar-Zeit unbekannt ist
+        """
+        if price is not None:
+            with self._lock:
+                self._reference_price = float(price)
+        if bar_close_time is None:
+            return None
+        if bar_close_time.tzinfo is None:
+            bar_close_time = bar_close_time.replace(tzinfo=timezone.utc)
+        latency_ms = max(
+            0.0, (datetime.now(timezone.utc) - bar_close_time).total_seconds() * 1000
+        )
+        stats = self.stats
+        stats.decisions += 1
+        stats.last_latency_ms = latency_ms
+        stats.total_latency_ms += latency_ms
+        stats.max_latency_ms = max(stats.max_latency_ms, latency_ms)
+        logger.debug(f"Decision latency after bar close: {latency_ms:.0f} ms")
+        return latency_ms
+
+    def reset(self) -> None:
+        """Setzt den Zustand für einen Neustart zurück (erster Zyklus sofort)."""
+        with self._lock:
+            self._pending = WakeEvent("start")
+            self._reference_price = None
+        self._last_input_key = None
+        self._loop = None
+        self._event = None
+
+
+def bar_key_and_close_time(data) -> tuple[Hashable | None, datetime | None]:
+    """Input-Key und jüngste Bar-Grenze eines OHLCV DataFrames.
+
+    Args:
+        data: OHLCV DataFrame (DatetimeIndex oder 'timestamp'/'time' Spalte)
+
+    Returns:
+        (key, bar_close_time) - key ändert sich mit jeder neuen Bar und jedem
+        geänderten Close; bar_close_time ist der Beginn der jüngsten Bar
+        (= Close der vorherigen), None wenn keine Zeitangabe vorhanden ist
+    """
+    if data is None or len(data) == 0:
+        return None, None
+    last_index = data.index[-1]
+    close = data["close"].iat[-1] if "close" in data.columns else None
+    key = (len(data), last_index, close)
+
+    bar_start = _to_datetime(last_index)
+    if bar_start is None:
+        for column in ("timestamp", "time"):
+            if column in data.columns:
+                bar_start = _to_datetime(data[column].iat[-1])
+                break
+    return key, bar_start
+
+
+def _to_datetime(value) -> datetime | None:
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, numbers.Real) and not isinstance(value, bool) and value > 0:
+        # Sekunden oder Millisekunden seit Epoch
+        seconds = float(value) / 1000 if value > 1e11 else float(value)
+        return datetime.fromtimestamp(seconds, timezone.utc)
+    return None
@@ -10,7 +10,7 @@ Die Haupt-Engine des Trading Bots. Koordiniert:
 - Trade Logging
 
 Nutzt Composition Pattern mit 5 Helper-Klassen:
-- BotEngineLifecycle: start/stop + analysis loop
+- BotEngineLifecycle: start/stop + analysis loop (event-getrieben via BarCloseScheduler)
 - BotEngineCallbacks: callback management + state/log
 - BotEngineStatistics: daily reset + trade statistics
 - BotEnginePersistence: save/load position to JSON
@@ -37,7 +37,9 @@ if TYPE_CHECKING:
     from src.core.broker.broker_types import OrderRequest, OrderResponse, Position
 
 from .ai_validator import AISignalValidator, AIValidation
+from .bot_analysis_stage import BotAnalysisStage
 from .bot_config import BotConfig
+from .bot_cycle_scheduler import BarCloseScheduler
 from .bot_engine_callbacks import BotEngineCallbacks
 from .bot_engine_lifecycle import BotEngineLifecycle
 from .bot_engine_persistence import BotEnginePersistence
@@ -130,6 +132,8 @@ class TradingBotEngine:
         # Helper-Klassen initialisieren
         self.market_analyzer = BotMarketAnalyzer(self)
         self.trade_handler = BotTradeHandler(self)
+        # CPU-lastige Analyse im Worker-Thread (Event-Loop bleibt frei)
+        self.analysis_stage = BotAnalysisStage(self.market_analyzer, self.signal_generator)
 
         # State
         self._state = BotState.IDLE
@@ -154,6 +158,12 @@ class TradingBotEngine:
 
         # Timer/Task
         self._analysis_task: asyncio.Task | None = None
+        # Weckt die Analyse-Loop bei Bar-Close/relevanten Ticks
+        self.cycle_scheduler = BarCloseScheduler(
+            fallback_interval=self.config.analysis_interval_seconds,
+            coalesce_seconds=self.config.event_coalesce_ms / 1000,
+            tick_move_percent=self.config.tick_trigger_move_percent,
+        )
 
         # Composition Pattern: Create helper instances
         self._lifecycle = BotEngineLifecycle(self)
@@ -296,6 +306,9 @@ class TradingBotEngine:
         """
         self.config = config
         self.risk_manager.update_config(config)
+        self.cycle_scheduler.fallback_interval = config.analysis_interval_seconds
+        self.cycle_scheduler.coalesce_seconds = config.event_coalesce_ms / 1000
+        self.cycle_scheduler.tick_move_percent = config.tick_trigger_move_percent
         self.ai_validator.update_config(
             enabled=config.ai.enabled,
             confidence_threshold=config.ai.confidence_threshold,
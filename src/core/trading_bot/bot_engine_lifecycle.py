@@ -5,8 +5,9 @@ Refactored from bot_engine.py.
 Contains:
 - start: Start bot lifecycle (connect adapter, load position or start analysis)
 - stop: Stop bot (cancel tasks, handle open positions)
-- _run_analysis_loop: Main analysis loop with interval timing
-- _run_analysis_cycle: Single analysis cycle (market data, indicators, regime, signal generation, AI validation, trade execution)
+- _run_analysis_loop: Main analysis loop, woken by bar close/tick events (interval as fallback)
+- _run_analysis_cycle: Single analysis cycle (market data, indicators, regime, signal generation, AI validation, trade execution);
+  indicators/regime/signal run in the BotAnalysisStage worker thread
 - _check_exit_signal: Check for exit signals when in position
 - _get_balance: Get current account balance
 """
@@ -19,6 +20,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from .bot_cycle_scheduler import WakeEvent, bar_key_and_close_time
 from .bot_types import BotState
 from .position_monitor import ExitResult, ExitTrigger
 
@@ -58,6 +60,7 @@ class BotEngineLifecycle:
                 # State ist bereits IN_POSITION durch load_position()
             else:
                 # Analysis-Loop starten (nur wenn keine Position)
+                self.parent.cycle_scheduler.reset()
                 self.parent._analysis_task = asyncio.create_task(self._run_analysis_loop())
                 self.parent._callbacks._set_state(BotState.ANALYZING)
 
@@ -84,6 +87,7 @@ class BotEngineLifecycle:
         self.parent._running = False
 
         # Analysis-Task stoppen
+        self.parent.analysis_stage.shutdown()
         if self.parent._analysis_task:
             self.parent._analysis_task.cancel()
             try:
@@ -111,23 +115,31 @@ class BotEngineLifecycle:
         self.parent._callbacks._log("Bot stopped")
 
     async def _run_analysis_loop(self) -> None:
-        """Haupt-Analyse-Loop."""
-        interval = self.parent.config.analysis_interval_seconds
+        """Haupt-Analyse-Loop.
+
+        Läuft bei Bar-Close/relevanten Ticks (BarCloseScheduler), spätestens
+        nach analysis_interval_seconds.
+        """
+        scheduler = self.parent.cycle_scheduler
 
         while self.parent._running:
             try:
-                await self._run_analysis_cycle()
-                await asyncio.sleep(interval)
+                event = await scheduler.wait_for_trigger()
+                await self._run_analysis_cycle(event)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.parent._callbacks._log(f"Analysis error: {e}")
                 logger.exception("Analysis cycle error")
-                await asyncio.sleep(interval)
+                await asyncio.sleep(scheduler.coalesce_seconds)
+
+    async def _run_analysis_cycle(self, event: WakeEvent | None = None) -> None:
+        """Ein Analyse-Zyklus.
 
-    async def _run_analysis_cycle(self) -> None:
-        """Ein Analyse-Zyklus."""
+        Args:
+            event: Auslöser (None = manueller Zyklus)
+        """
         if not self.parent._running:
             return
 
@@ -145,22 +157,34 @@ class BotEngineLifecycle:
             self.parent._callbacks._log("No market data available")
             return
 
-        # Indikatoren berechnen (falls noch nicht vorhanden)
-        if "ema_20" not in df.columns:
-            df = self.parent.market_analyzer.calculate_indicators(df)
-
-        # Regime erkennen
-        regime = self.parent.market_analyzer.detect_regime(df)
+        # Gleiche Bar + gleicher Close wie im letzten Zyklus -> nichts zu tun
+        scheduler = self.parent.cycle_scheduler
+        input_key, bar_close_time = bar_key_and_close_time(df)
+        if not scheduler.should_run(input_key):
+            return
 
-        # Signal generieren
-        signal = self.parent.signal_generator.generate_signal(
-            df=df,
-            regime=regime,
+        # Indikatoren, Regime und Signal im Worker-Thread - der Event-Loop
+        # bleibt frei für Preis-Updates des PositionMonitors
+        stage = self.parent.analysis_stage
+        if event is not None and event.bar_close_time is not None:
+            bar_close_time = event.bar_close_time
+        snapshot = stage.snapshot(
+            df,
             require_regime_alignment=self.parent.config.require_regime_alignment,
+            input_key=input_key,
+            bar_close_time=bar_close_time,
         )
+        result = await stage.run(snapshot, is_stale=self._is_cycle_stale)
+        if result is None:
+            # Neue Bar/Position/Stop während der Analyse - Ergebnis verwerfen
+            return
+
+        df = result.df
+        signal = result.signal
 
         self.parent._last_signal = signal
         self.parent._last_analysis_time = datetime.now(timezone.utc)
+        scheduler.record_decision(bar_close_time, float(df["close"].iat[-1]))
         self.parent._stats.signals_generated += 1
 
         if self.parent._on_signal_generated:
@@ -177,31 +201,41 @@ class BotEngineLifecycle:
             f"(Confluence: {signal.confluence_score}/5)"
         )
 
-        # Immer Indikatoren und Kontext extrahieren (für Logging)
-        indicators = self.parent.signal_generator.extract_indicator_snapshot(df)
-        market_context = self.parent.market_analyzer.extract_market_context(df, regime)
+        # Indikatoren und Kontext (für Logging) wurden im Worker extrahiert
+        indicators = result.indicators
+        market_context = result.market_context
 
         # AI Validation - IMMER wenn aktiviert!
         if self.parent.ai_validator.enabled:
             self.parent._callbacks._set_state(BotState.VALIDATING)
 
-            ai_result = await self.parent.ai_validator.validate_signal_async(
+            # Quick/Deep parallel, begrenzt durch das Latenz-Budget des Validators
+            ai_result = await self.parent.ai_validator.validate_signal_hierarchical(
                 signal=signal,
-                market_data=df,
+                indicators=indicators,
                 market_context=market_context,
+                ohlcv_data=df,
             )
 
             if not ai_result.approved:
-                self.parent._callbacks._log(f"AI rejected: {ai_result.reason}")
+                self.parent._callbacks._log(f"AI rejected: {ai_result.reasoning}")
                 self.parent._stats.signals_rejected_ai += 1
                 self.parent._callbacks._set_state(BotState.WAITING_SIGNAL)
                 return
 
-            self.parent._callbacks._log(f"AI approved: {ai_result.confidence:.2%}")
+            self.parent._callbacks._log(f"AI approved: {ai_result.confidence_score}%")
 
         # Signal approved - Trade ausführen
         await self.parent.trade_handler.execute_trade(signal, indicators, market_context)
 
+    def _is_cycle_stale(self) -> bool:
+        """Abbruchbedingung für die Analyse-Stage (aus dem Worker-Thread)."""
+        return (
+            not self.parent._running
+            or self.parent._state == BotState.IN_POSITION
+            or self.parent.cycle_scheduler.pending_reason == "bar_close"
+        )
+
     async def _check_exit_signal(self) -> None:
         """Prüft auf Exit-Signal."""
         # Position Monitor checkt automatisch SL/TP
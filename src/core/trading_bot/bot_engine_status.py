@@ -65,5 +65,7 @@ class BotEngineStatus:
             if self.parent._last_analysis_time
             else None,
             "statistics": self.parent._stats.to_dict(),
+            "scheduler": self.parent.cycle_scheduler.stats.to_dict(),
+            "analysis_stage": self.parent.analysis_stage.get_stats(),
             "last_error": self.parent._last_error,
         }
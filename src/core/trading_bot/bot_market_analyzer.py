@@ -19,6 +19,8 @@ from typing import TYPE_CHECKING
 import pandas as pd
 import pandas_ta as ta  # type: ignore
 
+from .bot_cycle_scheduler import bar_key_and_close_time
+
 if TYPE_CHECKING:
     from .trade_logger import MarketContext
     from .bot_engine import TradingBotEngine
@@ -45,6 +47,7 @@ class BotMarketAnalyzer:
         self._chart_data: pd.DataFrame | None = None
         self._chart_symbol: str | None = None
         self._chart_timeframe: str | None = None
+        self._chart_bar_key = None  # (Bars, letzter Index, Close) der Chart-Daten
 
     # =========================================================================
     # CHART DATA INTERFACE
@@ -71,9 +74,18 @@ class BotMarketAnalyzer:
             logger.warning("set_chart_data: Empty data received, ignoring")
             return
 
+        previous_key = self._chart_bar_key
         self._chart_data = data.copy()  # Kopie um Änderungen zu vermeiden
         self._chart_symbol = symbol
         self._chart_timeframe = timeframe
+        self._chart_bar_key, bar_start = bar_key_and_close_time(self._chart_data)
+
+        # Analyse-Loop wecken: neue Bar = Bar-Close der vorherigen
+        key = self._chart_bar_key
+        if previous_key is None or key[1] != previous_key[1]:
+            self.engine.cycle_scheduler.notify_bar_close(bar_start)
+        elif key[2] is not None and key[2] != previous_key[2]:
+            self.engine.cycle_scheduler.notify_tick(float(key[2]))
 
         self.engine._log(
             f"Chart-Daten erhalten: {symbol} {timeframe}, "
@@ -89,6 +101,7 @@ class BotMarketAnalyzer:
         self._chart_data = None
         self._chart_symbol = None
         self._chart_timeframe = None
+        self._chart_bar_key = None
         logger.debug("BotMarketAnalyzer: Chart data cleared")
 
     @property
@@ -274,6 +274,9 @@ class BotTradeHandler:
         """
         if self.engine._state == BotState.IN_POSITION:
             await self.engine.position_monitor.on_price_update(price)
+        else:
+            # Relevante Bewegung weckt die Analyse-Loop (siehe BarCloseScheduler)
+            self.engine.cycle_scheduler.notify_tick(float(price))
 
     # =========================================================================
     # MANUAL CONTROLS
@@ -7,6 +7,7 @@ Module 3/4 of llm_validation_service.py split.
 Contains:
 - _run_quick_validation(): Fast validation with quick model
 - _run_deep_validation(): Thorough analysis with slower model
+- _create_deadline_fallback(): Configured decision when the latency budget is exceeded
 - _build_result(): Construct LLMValidationResult from LLM response
 - _create_bypass_result(): Bypass result when LLM disabled
 - _create_technical_fallback(): Fallback using technical analysis
@@ -42,12 +43,7 @@ class LLMValidationRouter:
     async def run_quick_validation(self, prompt: str) -> Dict[str, Any]:
         """Run quick validation."""
         validator = self.parent._get_ai_validator()
-
-        # Use existing AI validator
-        from .ai_validator import AIValidation
-
-        # Create a minimal signal for the validator
-        response = await validator._call_llm(prompt)
+        response = await validator._providers_helper.call_llm(prompt)
 
         # Ensure required fields
         return {
@@ -60,12 +56,10 @@ class LLMValidationRouter:
             "invalidation_level": response.get("invalidation_level"),
         }
 
-    async def run_deep_validation(
-        self, prompt: str, context: "MarketContext"
-    ) -> Dict[str, Any]:
-        """Run deep validation with more thorough analysis."""
-        # Add deep analysis instructions
-        deep_prompt = prompt + """
+    @staticmethod
+    def build_deep_prompt(prompt: str) -> str:
+        """Add deep analysis instructions to the quick prompt."""
+        return prompt + """
 
 ## DEEP ANALYSIS MODE
 This is a secondary validation after quick analysis was uncertain.
@@ -76,8 +70,14 @@ Please be MORE THOROUGH:
 4. Only APPROVE if you have HIGH conviction (>=70% confidence)
 5. Default to VETO if uncertain"""
 
+    async def run_deep_validation(
+        self, prompt: str, context: "MarketContext"
+    ) -> Dict[str, Any]:
+        """Run deep validation with more thorough analysis."""
+        deep_prompt = self.build_deep_prompt(prompt)
+
         validator = self.parent._get_ai_validator()
-        response = await validator._call_llm(deep_prompt)
+        response = await validator._providers_helper.call_llm(deep_prompt)
 
         return {
             "confidence": int(response.get("confidence", 40)),
@@ -180,6 +180,35 @@ Please be MORE THOROUGH:
             error=error,
         )
 
+    def create_deadline_fallback(
+        self,
+        entry_score: Optional["EntryScoreResult"],
+        latency_ms: int,
+        prompt_hash: str = "",
+    ) -> LLMValidationResult:
+        """Create the configured result when the latency budget is exceeded."""
+        config = self.parent.config
+        reason = f"LLM validation exceeded latency budget ({config.latency_budget_ms} ms)"
+
+        if config.deadline_fallback == "technical":
+            result = self.create_technical_fallback(reason, entry_score)
+        else:
+            result = LLMValidationResult(
+                action=LLMAction(config.deadline_fallback),
+                confidence=0,
+                tier=ValidationTier.TIMEOUT,
+                score_modifier=0.0,
+                modified_score=entry_score.final_score if entry_score else None,
+                reasoning=reason,
+                provider="deadline",
+                model="fallback",
+                error=reason,
+            )
+        result.tier = ValidationTier.TIMEOUT
+        result.prompt_hash = prompt_hash
+        result.latency_ms = latency_ms
+        return result
+
     def create_error_result(self, error: str) -> LLMValidationResult:
         """Create error result when LLM fails and no fallback."""
         return LLMValidationResult(
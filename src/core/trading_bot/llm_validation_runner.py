@@ -0,0 +1,256 @@
+"""LLM Validation Runner - Speculative, deadline-bounded tier execution.
+
+Shared by LLMValidationService and AISignalValidator.
+
+Contains:
+- market_fingerprint(): Coarse hash of the market state a validation is about
+- LLMResponseCache: TTL cache of LLM responses per (fingerprint, tier); also
+  shares in-flight requests, so a speculative prefetch and the later
+  validation issue only one remote call
+- run_tiers(): Runs quick and deep validation concurrently under a hard
+  latency budget instead of two serial round-trips
+
+Example:
+    cache = LLMResponseCache(ttl_seconds=120)
+    fingerprint = market_fingerprint(symbol="BTCUSDT", direction="long", price=price_bucket(p))
+    outcome = await run_tiers(
+        quick=lambda: cache.fetch((fingerprint, "quick"), lambda: call(prompt)),
+        deep=lambda: cache.fetch((fingerprint, "deep"), lambda: call(deep_prompt)),
+        budget_seconds=8.0,
+        needs_deep=lambda quick: 50 <= quick["confidence"] < 75,
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+LLMResponse = Dict[str, Any]
+
+
+def price_bucket(price: Optional[float], digits: int = 4) -> Optional[float]:
+    """Round a price to ``digits`` significant digits (~0.01-0.1% buckets)."""
+    if not price:
+        return None
+    return float(f"{float(price):.{digits}g}")
+
+
+def market_fingerprint(**parts: Any) -> str:
+    """Hash of the market-state parts a validation depends on.
+
+    The fingerprint deliberately leaves out the bar timestamp: the same
+    setup (symbol, direction, regime, price bucket, ...) seen again within
+    the cache TTL reuses the LLM verdict.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+@dataclass
+class _CacheEntry:
+    response: LLMResponse
+    expires_at: float
+
+
+class LLMResponseCache:
+    """TTL/LRU cache of LLM responses with in-flight request sharing."""
+
+    def __init__(self, ttl_seconds: float = 120.0, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.joined = 0  # Requests served by an already running call
+
+    def get(self, key: Hashable) -> Optional[LLMResponse]:
+        """Cached response (copy) or None if absent/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry.response)
+
+    def put(self, key: Hashable, response: LLMResponse) -> None:
+        """Store a response for ``ttl_seconds``."""
+        if self.ttl_seconds <= 0:
+            return
+        self._entries[key] = _CacheEntry(
+            copy.deepcopy(response), time.monotonic() + self.ttl_seconds
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def fetch(
+        self, key: Hashable, call: Callable[[], Awaitable[LLMResponse]]
+    ) -> asyncio.Task:
+        """Task resolving to the response for ``key``.
+
+        Returns a finished task on a cache hit, the running task if the same
+        key is already being requested, otherwise starts ``call()``.
+        Successful responses are cached when the call completes, even if
+        nobody awaits the task anymore (late results after a deadline).
+        """
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return asyncio.ensure_future(_resolved(cached))
+
+        task = self._inflight.get(key)
+        if task is not None and not task.cancelled():
+            self.joined += 1
+            return task
+
+        self.misses += 1
+        task = asyncio.ensure_future(call())
+        self._inflight[key] = task
+        task.add_done_callback(lambda t, key=key: self._on_done(key, t))
+        return task
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            self.put(key, task.result())
+
+    def is_inflight(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def clear(self) -> None:
+        """Drop cached responses and cancel running requests."""
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "joined": self.joined,
+        }
+
+
+async def _resolved(value: LLMResponse) -> LLMResponse:
+    return value
+
+
+@dataclass
+class TierOutcome:
+    """Responses available when run_tiers() returned.
+
+    Attributes:
+        quick: Quick response (None if failed or not in time)
+        deep: Deep response (None if not needed, failed or not in time)
+        timed_out: Budget exhausted before a decision was possible
+        quick_error / deep_error: Exception text of failed tiers
+        latency_ms: Wall time spent waiting
+    """
+
+    quick: Optional[LLMResponse] = None
+    deep: Optional[LLMResponse] = None
+    timed_out: bool = False
+    quick_error: Optional[str] = None
+    deep_error: Optional[str] = None
+    latency_ms: int = 0
+
+
+async def run_tiers(
+    quick: Callable[[], asyncio.Task],
+    deep: Optional[Callable[[], asyncio.Task]],
+    budget_seconds: float,
+    needs_deep: Callable[[LLMResponse], bool],
+    speculative_deep: bool = True,
+) -> TierOutcome:
+    """Run quick and deep validation within ``budget_seconds``.
+
+    With ``speculative_deep`` the deep request starts together with the
+    quick one, so the uncertain quick→deep path costs one round-trip
+    instead of two. The deep task is cancelled once the quick response
+    decides on its own; tasks still running at the deadline keep going
+    and land in the cache for the next validation of the same setup.
+
+    Args:
+        quick: Starts (or joins) the quick request
+        deep: Starts (or joins) the deep request, None = no deep tier
+        budget_seconds: Hard latency budget for the whole decision
+        needs_deep: Whether a quick response requires the deep tier
+        speculative_deep: Start deep concurrently instead of on demand
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + budget_seconds
+    outcome = TierOutcome()
+
+    quick_task = quick()
+    deep_task = deep() if deep is not None and speculative_deep else None
+
+    # Wait for quick; a deep response arriving first is authoritative
+    pending = {quick_task} | ({deep_task} if deep_task is not None else set())
+    while quick_task in pending:
+        done, pending = await asyncio.wait(
+            pending, timeout=max(0.0, deadline - loop.time()),
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if not done:
+            break
+        if deep_task in done and quick_task in pending:
+            outcome.deep, outcome.deep_error = _result(deep_task)
+            if outcome.deep is not None:
+                outcome.latency_ms = int((loop.time() - started) * 1000)
+                return outcome
+
+    if quick_task.done():
+        outcome.quick, outcome.quick_error = _result(quick_task)
+    else:
+        outcome.timed_out = True
+        outcome.latency_ms = int((loop.time() - started) * 1000)
+        return outcome
+
+    if outcome.quick is not None and not needs_deep(outcome.quick):
+        if deep_task is not None and not deep_task.done():
+            deep_task.cancel()
+        outcome.latency_ms = int((loop.time() - started) * 1000)
+        return outcome
+
+    # Deep tier needed (uncertain quick response or quick failed)
+    if deep is not None:
+        if deep_task is None:
+            deep_task = deep()
+        if not deep_task.done():
+            await asyncio.wait({deep_task}, timeout=max(0.0, deadline - loop.time()))
+        if deep_task.done():
+            outcome.deep, outcome.deep_error = _result(deep_task)
+        else:
+            outcome.timed_out = True
+
+    outcome.latency_ms = int((loop.time() - started) * 1000)
+    return outcome
+
+
+def _result(task: asyncio.Task) -> tuple[Optional[LLMResponse], Optional[str]]:
+    if task.cancelled():
+        return None, "cancelled"
+    error = task.exception()
+    if error is not None:
+        return None, str(error) or type(error).__name__
+    return task.result(), None
@@ -8,6 +8,8 @@ Delegates to 3 specialized helper modules:
 - LLMValidationPrompt: Prompt building from MarketContext
 - LLMValidationRouter: Quick→Deep routing and result building
 - LLMValidationState: Enums and dataclasses (imported from state module)
+- llm_validation_runner: Concurrent quick/deep tiers under a latency budget,
+  response cache keyed by market fingerprint, speculative prefetch
 
 Provides:
 - LLMValidationService: Main orchestration class with delegation
@@ -22,12 +24,17 @@ import hashlib
 import json
 import logging
 import threading
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
 from src.core.trading_bot.llm_validation_prompt import LLMValidationPrompt
 from src.core.trading_bot.llm_validation_router import LLMValidationRouter
+from src.core.trading_bot.llm_validation_runner import (
+    LLMResponseCache,
+    market_fingerprint,
+    price_bucket,
+    run_tiers,
+)
 from src.core.trading_bot.llm_validation_state import (
     LLMAction,
     LLMValidationConfig,
@@ -53,6 +60,8 @@ class LLMValidationService:
     3. Acts ONLY as veto/boost - never executes trades
     4. Supports Quick→Deep routing for efficiency
     5. Full audit trail for every validation
+    6. Bounded latency: quick/deep run concurrently within
+       config.latency_budget_ms, otherwise config.deadline_fallback applies
 
     Usage:
         service = LLMValidationService()
@@ -62,6 +71,9 @@ class LLMValidationService:
             # Don't trade
         elif result.is_boost:
             # Increase confidence/position
+
+        # Speculative: start the LLM calls while the score is still rising
+        service.prefetch(market_context, entry_score)
     """
 
     def __init__(self, config: Optional[LLMValidationConfig] = None):
@@ -75,6 +87,9 @@ class LLMValidationService:
         self._prompt = LLMValidationPrompt(parent=self)
         self._router = LLMValidationRouter(parent=self)
 
+        # LLM responses per (market fingerprint, tier), shared with prefetches
+        self._cache = LLMResponseCache(ttl_seconds=self.config.cache_ttl_seconds)
+
         logger.info(
             f"LLMValidationService initialized. "
             f"Enabled: {self.config.enabled}, "
@@ -99,8 +114,6 @@ class LLMValidationService:
         Returns:
             LLMValidationResult with action and modifiers
         """
-        start_time = datetime.now(timezone.utc)
-
         if not self.config.enabled:
             return self._router.create_bypass_result("LLM validation disabled")
 
@@ -108,19 +121,29 @@ class LLMValidationService:
             # Build prompt from context (delegates to _prompt)
             prompt = self._prompt.build_context_prompt(context, entry_score, levels_result)
             prompt_hash = hashlib.md5(prompt.encode()).hexdigest()
-
-            # Get AI validator
-            validator = self._get_ai_validator()
-
-            # Quick validation first (delegates to _router)
-            quick_result = await self._router.run_quick_validation(prompt)
-
-            latency = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
-
-            # Route based on confidence
-            if quick_result["confidence"] >= self.config.quick_approve_threshold:
-                # High confidence -> Approve or Boost
-                action = LLMAction.BOOST if quick_result["confidence"] >= 85 else LLMAction.APPROVE
+            fingerprint = self.fingerprint(context, entry_score)
+
+            # Quick and deep concurrently within the latency budget
+            outcome = await run_tiers(
+                quick=lambda: self._fetch(fingerprint, "quick", prompt, context),
+                deep=lambda: self._fetch(fingerprint, "deep", prompt, context),
+                budget_seconds=self.config.latency_budget_ms / 1000,
+                needs_deep=self._needs_deep,
+                speculative_deep=self.config.concurrent_deep,
+            )
+            latency = outcome.latency_ms
+            quick_result = outcome.quick
+
+            # Route based on quick confidence
+            if quick_result is not None and not self._needs_deep(quick_result):
+                if quick_result["confidence"] >= self.config.quick_approve_threshold:
+                    # High confidence -> Approve or Boost
+                    action = (
+                        LLMAction.BOOST if quick_result["confidence"] >= 85 else LLMAction.APPROVE
+                    )
+                else:
+                    # Low confidence -> Veto
+                    action = LLMAction.VETO
                 return self._router.build_result(
                     action=action,
                     llm_response=quick_result,
@@ -130,14 +153,9 @@ class LLMValidationService:
                     entry_score=entry_score,
                 )
 
-            elif quick_result["confidence"] >= self.config.quick_deep_threshold:
-                # Medium confidence -> Deep analysis
-                logger.info(f"Quick confidence {quick_result['confidence']}% -> triggering deep analysis")
-
-                deep_start = datetime.now(timezone.utc)
-                deep_result = await self._router.run_deep_validation(prompt, context)
-                deep_latency = int((datetime.now(timezone.utc) - deep_start).total_seconds() * 1000)
-
+            # Medium confidence (or quick failed) -> Deep analysis decides
+            deep_result = outcome.deep
+            if deep_result is not None:
                 if deep_result["confidence"] >= self.config.deep_approve_threshold:
                     action = LLMAction.APPROVE
                 elif deep_result["confidence"] >= self.config.deep_veto_threshold:
@@ -150,21 +168,19 @@ class LLMValidationService:
                     llm_response=deep_result,
                     tier=ValidationTier.DEEP,
                     prompt_hash=prompt_hash,
-                    latency_ms=latency + deep_latency,
+                    latency_ms=latency,
                     entry_score=entry_score,
                     deep_triggered=True,
                 )
 
-            else:
-                # Low confidence -> Veto
-                return self._router.build_result(
-                    action=LLMAction.VETO,
-                    llm_response=quick_result,
-                    tier=ValidationTier.QUICK,
-                    prompt_hash=prompt_hash,
-                    latency_ms=latency,
-                    entry_score=entry_score,
+            if outcome.timed_out:
+                logger.warning(
+                    f"LLM validation exceeded {self.config.latency_budget_ms} ms "
+                    f"-> {self.config.deadline_fallback} fallback"
                 )
+                return self._router.create_deadline_fallback(entry_score, latency, prompt_hash)
+
+            raise RuntimeError(outcome.deep_error or outcome.quick_error or "no LLM response")
 
         except Exception as e:
             logger.error(f"LLM validation failed: {e}", exc_info=True)
@@ -174,6 +190,68 @@ class LLMValidationService:
             else:
                 return self._router.create_error_result(str(e))
 
+    def prefetch(
+        self,
+        context: "MarketContext",
+        entry_score: Optional["EntryScoreResult"],
+        levels_result: Optional["LevelsResult"] = None,
+    ) -> bool:
+        """Speculatively start the LLM calls for a promising setup.
+
+        Starts quick (and deep, if concurrent) requests without waiting once
+        the entry score reaches config.prefetch_score_threshold. A later
+        validate() for the same market fingerprint joins the running calls
+        or hits the cache. Must be called from a running event loop.
+
+        Returns:
+            True if requests were started or already running/cached
+        """
+        if not self.config.enabled or entry_score is None:
+            return False
+        if entry_score.final_score < self.config.prefetch_score_threshold:
+            return False
+
+        try:
+            prompt = self._prompt.build_context_prompt(context, entry_score, levels_result)
+            fingerprint = self.fingerprint(context, entry_score)
+            self._fetch(fingerprint, "quick", prompt, context)
+            if self.config.concurrent_deep:
+                self._fetch(fingerprint, "deep", prompt, context)
+        except Exception as e:
+            logger.debug(f"LLM prefetch skipped: {e}")
+            return False
+
+        logger.debug(f"LLM prefetch started (score={entry_score.final_score:.3f})")
+        return True
+
+    @staticmethod
+    def fingerprint(
+        context: "MarketContext", entry_score: Optional["EntryScoreResult"] = None
+    ) -> str:
+        """Market fingerprint used as cache key (symbol, regime, direction, price bucket)."""
+        regime = getattr(context, "regime", None)
+        direction = getattr(entry_score, "direction", None)
+        return market_fingerprint(
+            symbol=getattr(context, "symbol", None),
+            timeframe=getattr(context, "timeframe", None),
+            regime=getattr(regime, "value", regime),
+            direction=getattr(direction, "value", direction),
+            price=price_bucket(getattr(context, "current_price", None)),
+        )
+
+    def _needs_deep(self, quick_result: dict) -> bool:
+        confidence = quick_result["confidence"]
+        return self.config.quick_deep_threshold <= confidence < self.config.quick_approve_threshold
+
+    def _fetch(self, fingerprint: str, tier: str, prompt: str, context: "MarketContext"):
+        """Cached/in-flight LLM call for one tier."""
+        self._cache.ttl_seconds = self.config.cache_ttl_seconds
+        if tier == "quick":
+            call = lambda: self._router.run_quick_validation(prompt)
+        else:
+            call = lambda: self._router.run_deep_validation(prompt, context)
+        return self._cache.fetch((fingerprint, tier), call)
+
     def _get_ai_validator(self):
         """Get or create AI validator instance."""
         if self._ai_validator is None:
@@ -192,6 +270,7 @@ class LLMValidationService:
         """Update service configuration."""
         self.config = config
         self._ai_validator = None  # Reset validator
+        self._cache.clear()
         logger.info("LLMValidationService config updated")
 
 
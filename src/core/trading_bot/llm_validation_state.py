@@ -6,7 +6,7 @@ Module 1/4 of llm_validation_service.py split.
 
 Contains:
 - LLMAction enum (APPROVE, BOOST, VETO, CAUTION, DEFER)
-- ValidationTier enum (QUICK, DEEP, TECHNICAL, BYPASS, ERROR)
+- ValidationTier enum (QUICK, DEEP, TECHNICAL, BYPASS, ERROR, TIMEOUT)
 - LLMValidationConfig dataclass (thresholds, modifiers, prompt settings)
 - LLMValidationResult dataclass (validation result with analysis)
 """
@@ -35,6 +35,7 @@ class ValidationTier(str, Enum):
     TECHNICAL = "technical"  # Technical only (no LLM)
     BYPASS = "bypass"        # LLM bypassed (disabled)
     ERROR = "error"          # LLM error occurred
+    TIMEOUT = "timeout"      # Latency budget exceeded (configured fallback)
 
 
 @dataclass
@@ -68,6 +69,13 @@ class LLMValidationConfig:
     # Timeout
     timeout_seconds: int = 30
 
+    # Latency budget (entry path)
+    latency_budget_ms: int = 8000         # Hard budget for the whole quick/deep decision
+    deadline_fallback: str = "technical"  # On budget overrun: "technical" or an LLMAction value
+    concurrent_deep: bool = True          # Start deep together with quick (one round-trip)
+    prefetch_score_threshold: float = 0.40  # Entry score that triggers a speculative prefetch
+    cache_ttl_seconds: int = 120          # Reuse verdicts for the same market fingerprint
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "enabled": self.enabled,
@@ -91,6 +99,13 @@ class LLMValidationConfig:
                 "max_tokens": self.max_prompt_tokens,
             },
             "timeout_seconds": self.timeout_seconds,
+            "latency": {
+                "budget_ms": self.latency_budget_ms,
+                "deadline_fallback": self.deadline_fallback,
+                "concurrent_deep": self.concurrent_deep,
+                "prefetch_score_threshold": self.prefetch_score_threshold,
+                "cache_ttl_seconds": self.cache_ttl_seconds,
+            },
         }
 
     @classmethod
@@ -123,6 +138,16 @@ class LLMValidationConfig:
 
         config.timeout_seconds = data.get("timeout_seconds", config.timeout_seconds)
 
+        if "latency" in data:
+            lat = data["latency"]
+            config.latency_budget_ms = lat.get("budget_ms", config.latency_budget_ms)
+            config.deadline_fallback = lat.get("deadline_fallback", config.deadline_fallback)
+            config.concurrent_deep = lat.get("concurrent_deep", config.concurrent_deep)
+            config.prefetch_score_threshold = lat.get(
+                "prefetch_score_threshold", config.prefetch_score_threshold
+            )
+            config.cache_ttl_seconds = lat.get("cache_ttl_seconds", config.cache_ttl_seconds)
+
         return config
 
 
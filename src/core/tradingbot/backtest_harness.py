@@ -116,11 +116,25 @@ class BacktestHarness:
         self._regime_engine = RegimeEngine()
         self._entry_scorer = EntryScorer()
         self._exit_checker = ExitSignalChecker()
+        risk = self.bot_config.risk
         self._trailing_manager = TrailingStopManager(
-            activation_pct=self.bot_config.risk.trailing_activation_pct
+            min_step_pct=risk.trailing_min_step_pct,
+            update_cooldown_bars=risk.trailing_cooldown_bars,
+            activation_pct=risk.trailing_activation_pct
+        )
+        self._no_trade_filter = NoTradeFilter(
+            self.bot_config.bot.market_type,
+            account_value=self.backtest_config.initial_capital,
+            config={
+                'max_daily_trades': risk.max_trades_per_day,
+                'daily_loss_limit_pct': risk.max_daily_loss_pct,
+            }
+        )
+        # Same selection policy as BotController (re-evaluated every bar)
+        self._strategy_selector = StrategySelector(
+            allow_intraday_switch=True,
+            require_regime_flip_for_switch=False
         )
-        self._no_trade_filter = NoTradeFilter(self.bot_config.risk)
-        self._strategy_selector = StrategySelector()
 
     # === Data Loading (Delegiert) ===
 
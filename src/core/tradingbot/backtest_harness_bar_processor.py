@@ -4,6 +4,8 @@ Refactored from backtest_harness.py.
 
 Contains:
 - process_bar: Process single bar with feature calculation and regime detection
+- evaluate_bar: Strategy selection, no-trade filter and entry scores of a bar
+- process_features: State machine step for precomputed bar evaluation
 - _process_flat_state: Look for entry signals when no position
 - _process_signal_state: Confirm or expire pending signals
 - _process_manage_state: Manage open position (trailing stop, exit signals)
@@ -12,12 +14,15 @@ Contains:
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import TYPE_CHECKING
 
+from .backtest_types import BarEvaluation
 from .models import FeatureVector, RegimeState, Signal, TradeSide
 
 if TYPE_CHECKING:
     from .backtest_harness import BacktestHarness
+    from .entry_scorer import EntryScoreResult
 
 logger = logging.getLogger(__name__)
 
@@ -45,42 +50,100 @@ class BacktestHarnessBarProcessor:
         if features is None:
             return
 
-        self.parent._state.features = features
-
         # Classify regime
         regime = self.parent._regime_engine.classify(features)
-        self.parent._state.regime = regime
 
-        # Check no-trade filter
-        filter_result = self.parent._no_trade_filter.check(
-            features, regime, self.parent._state.current_time
-        )
+        evaluation = self.evaluate_bar(features, regime, self.parent._state.current_time)
+        self.process_features(features, regime, evaluation)
+
+    def evaluate_bar(
+        self,
+        features: FeatureVector,
+        regime: RegimeState,
+        timestamp: datetime,
+        score_entries: bool = False
+    ) -> BarEvaluation:
+        """Evaluate the position-independent parts of a bar.
+
+        Args:
+            features: Feature vector of the bar
+            regime: Regime classified from ``features``
+            timestamp: Bar timestamp
+            score_entries: Score both entry sides up front (two-phase mode);
+                otherwise the state machine scores on demand
+
+        Returns:
+            BarEvaluation of the bar
+        """
+        # Re-select on every bar: the selector's day lock runs on wall-clock time
+        symbol = self.parent.backtest_config.symbol
+        self.parent._strategy_selector.select_strategy(regime, symbol, force=True)
+        strategy = self.parent._strategy_selector.get_current_strategy()
+
+        filter_result = self.parent._no_trade_filter.check(features, regime, timestamp)
+
+        evaluation = BarEvaluation(strategy=strategy, can_trade=filter_result.allowed)
+        if score_entries and strategy:
+            for side in (TradeSide.LONG, TradeSide.SHORT):
+                evaluation.entry_scores[side] = self.parent._entry_scorer.calculate_score(
+                    features, side, regime, strategy
+                )
+        return evaluation
+
+    def process_features(
+        self,
+        features: FeatureVector,
+        regime: RegimeState,
+        evaluation: BarEvaluation
+    ) -> None:
+        """Run the state machine for the current bar.
+
+        Args:
+            features: Feature vector of the current bar
+            regime: Regime classified from ``features``
+            evaluation: Strategy, filter and entry scores of the bar
+        """
+        previous_regime = self.parent._state.regime
+        self.parent._state.features = features
+        self.parent._state.regime = regime
 
         # State-dependent processing
-        if self.parent._state.position and self.parent._state.position.is_open:
-            self._process_manage_state(features, regime)
+        if self.parent._state.position is not None:
+            self._process_manage_state(features, regime, previous_regime, evaluation)
         elif self.parent._state.pending_signal:
-            self._process_signal_state(features, regime, filter_result.can_trade)
+            self._process_signal_state(features, regime, evaluation)
         else:
-            if filter_result.can_trade:
-                self._process_flat_state(features, regime)
+            if evaluation.can_trade:
+                self._process_flat_state(features, regime, evaluation)
+
+    def _entry_score(
+        self,
+        features: FeatureVector,
+        side: TradeSide,
+        regime: RegimeState,
+        evaluation: BarEvaluation
+    ) -> "EntryScoreResult":
+        """Entry score of a side (precomputed if available)."""
+        score_result = evaluation.entry_scores.get(side)
+        if score_result is None:
+            score_result = self.parent._entry_scorer.calculate_score(
+                features, side, regime, evaluation.strategy
+            )
+        return score_result
 
     def _process_flat_state(
         self,
         features: FeatureVector,
-        regime: RegimeState
+        regime: RegimeState,
+        evaluation: BarEvaluation
     ) -> None:
         """Process bar in FLAT state (look for entries)."""
-        # Get current strategy
-        strategy = self.parent._strategy_selector.get_current_strategy(regime)
-        if not strategy:
+        if not evaluation.strategy:
             return
 
         # Score entry for both sides
         for side in [TradeSide.LONG, TradeSide.SHORT]:
-            score_result = self.parent._entry_scorer.calculate_score(
-                features, side, regime, strategy
-            )
+            score_result = self._entry_score(features, side, regime, evaluation)
 
             if score_result.meets_threshold:
                 # Create signal
@@ -91,8 +154,12 @@ class BacktestHarnessBarProcessor:
                     stop_loss_price=self.parent._helpers.calculate_initial_stop(
                         features, side, regime
                     ),
+                    stop_loss_pct=self.parent.bot_config.risk.initial_stop_loss_pct,
                     score=score_result.score,
-                    timestamp=self.parent._state.current_time
+                    timestamp=self.parent._state.current_time,
+                    regime=regime.regime,
+                    strategy_name=evaluation.strategy.profile.name,
+                    reason_codes=score_result.reason_codes
                 )
                 self.parent._state.pending_signal = signal
                 self.parent._state.signals_generated += 1
@@ -102,7 +169,7 @@ class BacktestHarnessBarProcessor:
         self,
         features: FeatureVector,
         regime: RegimeState,
-        can_trade: bool
+        evaluation: BarEvaluation
     ) -> None:
         """Process bar in SIGNAL state (confirm or expire)."""
         signal = self.parent._state.pending_signal
@@ -110,11 +177,8 @@ class BacktestHarnessBarProcessor:
             return
 
         # Simple confirmation: next bar also favorable
-        strategy = self.parent._strategy_selector.get_current_strategy(regime)
-        if strategy and can_trade:
-            score_result = self.parent._entry_scorer.calculate_score(
-                features, signal.side, regime, strategy
-            )
+        if evaluation.strategy and evaluation.can_trade:
+            score_result = self._entry_score(features, signal.side, regime, evaluation)
 
             if score_result.meets_threshold:
                 # Confirmed - execute entry
@@ -127,7 +191,9 @@ class BacktestHarnessBarProcessor:
     def _process_manage_state(
         self,
         features: FeatureVector,
-        regime: RegimeState
+        regime: RegimeState,
+        previous_regime: RegimeState | None,
+        evaluation: BarEvaluation
     ) -> None:
         """Process bar in MANAGE state (trailing stop, exit signals)."""
         position = self.parent._state.position
@@ -139,6 +205,7 @@ class BacktestHarnessBarProcessor:
         # Update position tracking
         position.bars_held += 1
         current_price = features.close
+        position.current_price = current_price
 
         # Check stop hit
         if position.side == TradeSide.LONG:
@@ -168,9 +235,8 @@ class BacktestHarnessBarProcessor:
             )
 
         # Check exit signals
-        strategy = self.parent._strategy_selector.get_current_strategy(regime)
         exit_result = self.parent._exit_checker.check_exit(
-            features, position, regime, self.parent._state.regime, strategy
+            features, position, regime, previous_regime, evaluation.strategy
         )
 
         if exit_result.should_exit:
@@ -179,13 +245,13 @@ class BacktestHarnessBarProcessor:
 
         # Update trailing stop
         trailing_result = self.parent._trailing_manager.calculate_trailing_stop(
-            features, position, regime, bar
+            features, position, regime, self.parent._state.bar_index
         )
 
-        if trailing_result.should_update:
+        if trailing_result.new_stop is not None:
             position.trailing.update_stop(
                 trailing_result.new_stop,
-                self.parent._state.bar_count,
+                self.parent._state.bar_index,
                 self.parent._state.current_time,
                 is_long=position.side == TradeSide.LONG
             )
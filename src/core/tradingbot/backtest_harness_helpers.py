@@ -57,7 +57,7 @@ class BacktestHarnessHelpers:
         """
         equity = self.parent._state.capital
 
-        if self.parent._state.position and self.parent._state.position.is_open:
+        if self.parent._state.position is not None:
             position = self.parent._state.position
             current_price = self.parent._state.current_bar["close"]
 
@@ -4,6 +4,7 @@ Refactored from backtest_harness.py.
 
 Contains:
 - run: Main backtest loop with bar-by-bar simulation, metrics calculation, and result saving
+- Two-phase (precomputed bar evaluations) simulation for BacktestMode.FAST
 """
 
 from __future__ import annotations
@@ -12,7 +13,9 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from .backtest_types import BacktestResult, BacktestState
+import numpy as np
+
+from .backtest_types import BacktestMode, BacktestResult, BacktestState
 
 if TYPE_CHECKING:
     from .backtest_harness import BacktestHarness
@@ -46,31 +49,13 @@ class BacktestHarnessRunner:
         total_bars = len(self.parent._data)
         logger.info(f"Starting backtest: {total_bars} bars")
 
-        for bar_idx, (timestamp, row) in enumerate(self.parent._data.iterrows()):
-            self.parent._state.bar_index = bar_idx
-            self.parent._state.current_time = timestamp
-            self.parent._state.current_bar = {
-                "timestamp": timestamp,
-                "open": row["open"],
-                "high": row["high"],
-                "low": row["low"],
-                "close": row["close"],
-                "volume": row.get("volume", 0),
-            }
-
-            # Skip warmup period
-            if bar_idx < self.parent.backtest_config.warmup_bars:
-                continue
-
-            # Process bar
-            self.parent._bar_processor.process_bar(bar_idx)
-
-            # Record equity
-            equity = self.parent._helpers.calculate_equity()
-            self.parent._state.equity_curve.append((timestamp, equity))
+        if self.parent.backtest_config.mode == BacktestMode.FAST:
+            self._run_precomputed()
+        else:
+            self._run_bar_by_bar()
 
         # Close any open position at end
-        if self.parent._state.position and self.parent._state.position.is_open:
+        if self.parent._state.position is not None:
             self.parent._execution.close_position("END_OF_BACKTEST")
 
         # Calculate metrics
@@ -110,3 +95,93 @@ class BacktestHarnessRunner:
             result.save(output_path)
 
         return result
+
+    def _run_bar_by_bar(self) -> None:
+        """Simulate bar by bar, recalculating features on every bar."""
+        for bar_idx, (timestamp, row) in enumerate(self.parent._data.iterrows()):
+            self.parent._state.bar_index = bar_idx
+            self.parent._state.current_time = timestamp
+            self.parent._state.current_bar = {
+                "timestamp": timestamp,
+                "open": row["open"],
+                "high": row["high"],
+                "low": row["low"],
+                "close": row["close"],
+                "volume": row.get("volume", 0),
+            }
+
+            # Skip warmup period
+            if bar_idx < self.parent.backtest_config.warmup_bars:
+                continue
+
+            # Process bar
+            self.parent._bar_processor.process_bar(bar_idx)
+
+            # Record equity
+            equity = self.parent._helpers.calculate_equity()
+            self.parent._state.equity_curve.append((timestamp, equity))
+
+    def _run_precomputed(self) -> None:
+        """Two-phase simulation (BacktestMode.FAST).
+
+        Phase 1 calculates features, regimes, strategy selection, no-trade
+        filter and entry scores for all bars in one pass (none of them
+        depends on the position state), phase 2 runs only the position
+        state machine over plain arrays. Produces the same trades as
+        ``_run_bar_by_bar``.
+        """
+        data = self.parent._data
+        warmup_bars = self.parent.backtest_config.warmup_bars
+        timestamps = data.index
+
+        # Phase 1: features, regimes and bar evaluations for all bars
+        features = self.parent._feature_engine.calculate_features_batch(
+            data, self.parent.backtest_config.symbol
+        )
+        regimes = [None] * len(data)
+        evaluations = [None] * len(data)
+        for bar_idx in range(warmup_bars, len(data)):
+            vector = features[bar_idx]
+            if vector is None:
+                continue
+            regimes[bar_idx] = self.parent._regime_engine.classify(vector)
+            evaluations[bar_idx] = self.parent._bar_processor.evaluate_bar(
+                vector, regimes[bar_idx], timestamps[bar_idx], score_entries=True
+            )
+
+        # Phase 2: state machine
+        opens = data["open"].to_numpy(dtype=float)
+        highs = data["high"].to_numpy(dtype=float)
+        lows = data["low"].to_numpy(dtype=float)
+        closes = data["close"].to_numpy(dtype=float)
+        volumes = (
+            data["volume"].to_numpy(dtype=float) if "volume" in data.columns
+            else np.zeros(len(data))
+        )
+
+        for bar_idx in range(len(data)):
+            timestamp = timestamps[bar_idx]
+            self.parent._state.bar_index = bar_idx
+            self.parent._state.current_time = timestamp
+            self.parent._state.current_bar = {
+                "timestamp": timestamp,
+                "open": opens[bar_idx],
+                "high": highs[bar_idx],
+                "low": lows[bar_idx],
+                "close": closes[bar_idx],
+                "volume": volumes[bar_idx],
+            }
+
+            # Skip warmup period
+            if bar_idx < warmup_bars:
+                continue
+
+            # Process bar
+            if evaluations[bar_idx] is not None:
+                self.parent._bar_processor.process_features(
+                    features[bar_idx], regimes[bar_idx], evaluations[bar_idx]
+                )
+
+            # Record equity
+            equity = self.parent._helpers.calculate_equity()
+            self.parent._state.equity_curve.append((timestamp, equity))
@@ -5,6 +5,7 @@ Contains dataclasses and enums for backtesting:
 - BacktestConfig: Configuration settings
 - BacktestTrade: Individual trade record
 - BacktestState: Backtest state tracking
+- BarEvaluation: Position-independent evaluation of one bar
 - BacktestResult: Complete backtest results
 """
 
@@ -26,11 +27,13 @@ logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from .models import BotDecision, FeatureVector, PositionState, RegimeState, Signal
+    from .entry_scorer import EntryScoreResult
     from .evaluator_types import PerformanceMetrics
+    from .strategy_catalog import StrategyDefinition
 
 class BacktestMode(str, Enum):
     """Backtest execution modes."""
-    FAST = "fast"  # Skip some calculations for speed
+    FAST = "fast"  # Two-phase: precomputed bar evaluations + state machine
     FULL = "full"  # Full simulation with all features
     DEBUG = "debug"  # Extra logging and validation
 
@@ -111,6 +114,19 @@ class BacktestTrade:
         }
 
 
+@dataclass
+class BarEvaluation:
+    """Position-independent evaluation of one bar.
+
+    Strategy selection, no-trade filter and entry scores only depend on the
+    bar's features and regime, never on the position state, so FAST mode
+    computes them for all bars before running the state machine.
+    """
+    strategy: StrategyDefinition | None
+    can_trade: bool
+    entry_scores: dict[TradeSide, EntryScoreResult] = field(default_factory=dict)
+
+
 @dataclass
 class BacktestState:
     """State tracking during backtest."""
@@ -100,6 +100,10 @@ class BotController(
             f"L:{bar.get('low', 0):.2f} C:{bar.get('close', 0):.2f} V:{bar.get('volume', 0):,.0f}"
         )
 
+        # Shared portfolio feed: nothing to do for this symbol on this bar
+        if self._portfolio_feed is not None and self._skip_portfolio_bar(bar):
+            return None
+
         try:
             # 1. Calculate features
             features = await self._calculate_features(bar)
@@ -148,6 +152,8 @@ class BotController(
             # 4. Process based on state
             state_before = self._state_machine.state
             decision = await self._process_state(features, bar)
+            if self._portfolio_feed is not None:
+                self._sync_portfolio_slot()
 
             # Log state and decision
             strategy_name = self._active_strategy.name if self._active_strategy else "None"
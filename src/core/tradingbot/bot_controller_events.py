@@ -8,15 +8,21 @@ This module contains:
 - Lifecycle methods (start, stop, pause, resume, reset)
 - Warmup functionality (warmup_from_history)
 - KI mode setting (set_ki_mode)
+- Shared multi-symbol feed (attach_portfolio_feed)
 """
 
 from __future__ import annotations
 
 import logging
 from datetime import datetime
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from .config import KIMode
+from .state_machine import BotState
+
+if TYPE_CHECKING:
+    from .portfolio_features import PortfolioFeatureFeed
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +42,8 @@ class BotControllerEvents:
         reset: Reset bot to initial state
         warmup_from_history: Pre-fill bar buffer with historical data
         set_ki_mode: Set KI mode dynamically
+        attach_portfolio_feed: Share a multi-symbol feed and its state machines
+        detach_portfolio_feed: Back to evaluating every bar
     """
 
     # ==================== Activity Logging ====================
@@ -94,11 +102,15 @@ class BotControllerEvents:
     def pause(self, reason: str = "manual") -> None:
         """Pause the bot."""
         self._state_machine.pause(reason)
+        if self._portfolio_feed is not None:
+            self._portfolio_feed.pause(self.symbol)
         logger.info(f"Bot paused: {reason}")
 
     def resume(self) -> None:
         """Resume the bot."""
         self._state_machine.resume()
+        if self._portfolio_feed is not None:
+            self._portfolio_feed.resume(self.symbol)
         logger.info("Bot resumed")
 
     def reset(self) -> None:
@@ -173,3 +185,61 @@ class BotControllerEvents:
             logger.info(f"KI mode changed to: {mode}")
         except ValueError:
             logger.warning(f"Invalid KI mode: {mode}")
+
+    # ==================== Portfolio Feed ====================
+
+    def attach_portfolio_feed(self, feed: "PortfolioFeatureFeed") -> None:
+        """Share the bar store and state machines of a multi-symbol feed.
+
+        The controller feeds its bars into the shared store. While it is
+        flat without signal and the feed's state machine has no candidate
+        or position for its symbol (FLAT/EXITED/PAUSED), bars only go into
+        the bar buffer: FeatureEngine, regime, strategy selection and CEL
+        rules run for the symbols that need them.
+
+        Args:
+            feed: Feed shared by the controllers of all watched symbols
+        """
+        feed.add_symbol(self.symbol)
+        if self._state_machine.is_paused():
+            feed.pause(self.symbol)
+        self._portfolio_feed = feed
+        self._log_activity("CONFIG", f"Portfolio-Feed aktiv ({len(feed.symbols)} Symbole)")
+
+    def detach_portfolio_feed(self) -> None:
+        """Evaluate every bar again (feed state of the symbol is kept)."""
+        self._portfolio_feed = None
+
+    def _skip_portfolio_bar(self, bar: dict[str, Any]) -> bool:
+        """Feed the bar into the shared feed; True if the full pipeline can be skipped."""
+        feed = self._portfolio_feed
+        try:
+            feed.on_bar(
+                self.symbol,
+                bar.get('timestamp', datetime.utcnow()),
+                float(bar.get('open', 0)),
+                float(bar.get('high', 0)),
+                float(bar.get('low', 0)),
+                float(bar.get('close', 0)),
+                float(bar.get('volume') or 0),
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Portfolio feed rejected bar of {self.symbol}: {e}")
+            return False
+
+        if self._position is not None or self._current_signal is not None:
+            return False
+        if self._state_machine.state != BotState.FLAT:
+            return False
+        if feed.slot(self.symbol).state in (BotState.SIGNAL, BotState.MANAGE):
+            return False
+
+        self._append_bar(bar)
+        return True
+
+    def _sync_portfolio_slot(self) -> None:
+        """Release the feed's position if the controller did not enter."""
+        feed = self._portfolio_feed
+        if self._position is None and self._state_machine.state == BotState.FLAT:
+            if feed.slot(self.symbol).state == BotState.MANAGE:
+                feed.reject(self.symbol)
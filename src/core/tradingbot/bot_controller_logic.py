@@ -549,14 +549,16 @@ class BotControllerLogic:
             from .cel import RulePackExecutor
             from .cel.loader import RulePackLoader
 
-            # Load RulePack
+            # Load RulePack (precompiled, cached while the file is unchanged)
             loader = RulePackLoader()
-            self._rulepack = loader.load(rulepack_path)
+            compiled = loader.load_compiled(rulepack_path)
+            self._rulepack = compiled.rulepack
             self._rulepack_path = rulepack_path
 
             # Initialize executor if not exists
             if self._rule_executor is None:
                 self._rule_executor = RulePackExecutor()
+            self._rule_executor.engine.add_compiled(compiled.expressions.values())
 
             logger.info(
                 f"✅ RulePack loaded: {rulepack_path} | "
@@ -610,8 +612,8 @@ class BotControllerLogic:
             # No rules loaded - allow by default
             return True, "", None
 
-        # Build CEL context
-        context = RuleContextBuilder.build(
+        # Build CEL context (lazy: rules only resolve the variables they read)
+        context = RuleContextBuilder.build_lazy(
             features=features,
             trade=self._position,
             config={
@@ -115,6 +115,9 @@ class BotControllerState:
         self._bar_buffer: list[dict] = []  # Rolling buffer of recent bars
         self._max_buffer_size: int = 120  # Keep 2 hours of 1-min bars
 
+        # Shared multi-symbol feed (optional, see attach_portfolio_feed)
+        self._portfolio_feed = None  # PortfolioFeatureFeed instance
+
         # Multi-timeframe support (optional)
         self._multi_tf_enabled: bool = False
         self._multi_tf_manager = None  # TimeframeDataManager instance
@@ -1,7 +1,7 @@
 """Helper Methods Mixin for BotController.
 
 Provides utility methods:
-- Feature calculation (_calculate_features)
+- Feature calculation (_calculate_features, _append_bar)
 - Regime update (_update_regime)
 - Order intent creation (_create_entry_order)
 - Decision creation (_create_decision)
@@ -65,19 +65,8 @@ class BotHelpersMixin:
 
     # ==================== Helper Methods ====================
 
-    async def _calculate_features(self, bar: dict[str, Any]) -> FeatureVector:
-        """Calculate feature vector from bar data using FeatureEngine.
-
-        Maintains a rolling buffer of bars and uses FeatureEngine to
-        calculate all technical indicators.
-
-        Args:
-            bar: Bar data with OHLCV
-
-        Returns:
-            FeatureVector with calculated indicators
-        """
-        # Add bar to buffer
+    def _append_bar(self, bar: dict[str, Any]) -> None:
+        """Add a bar to the rolling buffer (trimmed to _max_buffer_size)."""
         self._bar_buffer.append({
             'timestamp': bar.get('timestamp', datetime.utcnow()),
             'open': bar.get('open', 0),
@@ -91,6 +80,20 @@ class BotHelpersMixin:
         if len(self._bar_buffer) > self._max_buffer_size:
             self._bar_buffer = self._bar_buffer[-self._max_buffer_size:]
 
+    async def _calculate_features(self, bar: dict[str, Any]) -> FeatureVector:
+        """Calculate feature vector from bar data using FeatureEngine.
+
+        Maintains a rolling buffer of bars and uses FeatureEngine to
+        calculate all technical indicators.
+
+        Args:
+            bar: Bar data with OHLCV
+
+        Returns:
+            FeatureVector with calculated indicators
+        """
+        self._append_bar(bar)
+
         # Need minimum bars for indicator calculation
         min_bars = self._feature_engine.MIN_BARS
         if len(self._bar_buffer) < min_bars:
@@ -6,6 +6,7 @@ Supports custom trading functions and context building from market data.
 Key Components:
 - CELEngine: CEL expression compiler and evaluator
 - RuleContextBuilder: Converts FeatureVector to CEL context
+- LazyContext: Context resolving variables on demand, memoized per bar
 - RulePack: Pydantic models for rule packs
 - Custom Functions: pctl, isnull, nz, coalesce
 
@@ -19,6 +20,7 @@ Example:
 
 from .engine import CELEngine
 from .context import RuleContextBuilder
+from .lazy_context import LazyContext
 from .models import RulePack, Pack, Rule
 from .executor import (
     RulePackExecutor,
@@ -30,6 +32,7 @@ from .executor import (
 __all__ = [
     "CELEngine",
     "RuleContextBuilder",
+    "LazyContext",
     "RulePack",
     "Pack",
     "Rule",
@@ -0,0 +1,268 @@
+"""Precompiled CEL Expressions and RulePacks.
+
+Parsing a CEL expression is by far the most expensive step of compiling
+it; the resulting AST is a plain, picklable tree. This module provides:
+
+- CompiledExpression: AST + the context paths the expression reads
+- compile_ast(): process-wide AST cache shared by all CELEngine instances
+- CompiledRulePack: validated RulePack + compiled rules, persisted in a
+  content-addressed cache directory so bot starts and reloads of an
+  unchanged RulePack skip validation and parsing entirely
+- snapshot_inputs(): values of a rule's dependencies for change detection
+
+Example:
+    compiled = RulePackLoader().load_compiled("03_JSON/RulePacks/default_rules.json")
+    engine.add_compiled(compiled.expressions.values())
+"""
+
+import copy
+import datetime
+import hashlib
+import logging
+import pickle
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from .models import RulePack
+
+try:
+    import celpy
+    from lark import Tree
+    CELPY_VERSION = getattr(celpy, "__version__", "unknown")
+except ImportError:
+    celpy = None
+    Tree = None
+    CELPY_VERSION = None
+
+logger = logging.getLogger(__name__)
+
+# Bump when CompiledRulePack/CompiledExpression layout changes
+FORMAT_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path.home() / ".orderpilot" / "cel_cache"
+
+# Sentinel for dependency paths missing from the context
+MISSING = object()
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    """Parsed CEL expression with its context dependencies.
+
+    Attributes:
+        expression: CEL source
+        ast: celpy (lark) AST, input for Environment.program()
+        dependencies: Dotted context paths read by the expression,
+            e.g. {"rsi14.value", "trade.side"}
+    """
+
+    expression: str
+    ast: Any
+    dependencies: frozenset[str]
+
+
+def extract_dependencies(ast: Any) -> frozenset[str]:
+    """Collect the context paths an expression reads.
+
+    Member chains are reported as far as they are static
+    (``a.b.c`` -> "a.b.c", ``a["k"].c`` -> "a"). Comprehension variables
+    show up as paths too; they are never in the context, so they cannot
+    cause spurious re-evaluations.
+    """
+    deps: set[str] = set()
+    _collect_paths(ast, deps)
+    return frozenset(deps)
+
+
+def _collect_paths(tree: Any, deps: set[str]) -> None:
+    if tree.data == "member":
+        path = _member_path(tree)
+        if path is not None:
+            deps.add(path)
+            return
+    for child in tree.children:
+        if isinstance(child, Tree):
+            _collect_paths(child, deps)
+
+
+def _member_path(member: Any) -> Optional[str]:
+    child = member.children[0]
+    if not isinstance(child, Tree):
+        return None
+    if child.data == "member_dot":
+        base = _member_path(child.children[0])
+        return f"{base}.{child.children[1]}" if base is not None else None
+    if child.data == "primary":
+        ident = child.children[0]
+        if isinstance(ident, Tree) and ident.data in ("ident", "dot_ident"):
+            return str(ident.children[-1])
+    return None
+
+
+# Leaf types whose values can be snapshotted and compared
+_VALUE_TYPES = (
+    type(None), bool, int, float, str, bytes, tuple, frozenset,
+    datetime.date, datetime.time, datetime.timedelta,
+)
+
+
+def resolve_path(context: Mapping[str, Any], path: str) -> Any:
+    """Resolve a dotted dependency path in a (nested dict) context.
+
+    Flat dotted keys ("chart.price": 1.0) are matched as well.
+    """
+    parts = path.split(".")
+    value: Any = context
+    i = 0
+    while i < len(parts):
+        if not isinstance(value, Mapping):
+            # Non-dict container: compare the container itself
+            return value
+        for j in range(i + 1, len(parts) + 1):
+            key = ".".join(parts[i:j])
+            if key in value:
+                value = value[key]
+                i = j
+                break
+        else:
+            return MISSING
+    return value
+
+
+def snapshot_inputs(
+    context: Mapping[str, Any], dependencies: Iterable[str]
+) -> Optional[tuple]:
+    """Values of all dependencies, None if one cannot be snapshotted.
+
+    dicts/lists/sets are deep-copied; other objects may change in place
+    without notice, so expressions reading them are never skipped.
+    """
+    values = []
+    for path in dependencies:
+        value = resolve_path(context, path)
+        if isinstance(value, (dict, list, set)):
+            value = copy.deepcopy(value)
+        elif value is not MISSING and not isinstance(value, _VALUE_TYPES):
+            return None
+        values.append(value)
+    return tuple(values)
+
+
+# ==================== Process-wide AST cache ====================
+
+_ast_cache: dict[str, CompiledExpression] = {}
+_ast_cache_lock = Lock()
+_AST_CACHE_MAX = 4096
+
+
+def compile_ast(
+    expression: str,
+    parse: Callable[[str], Any],
+) -> CompiledExpression:
+    """Parse ``expression`` once per process.
+
+    Args:
+        expression: CEL source
+        parse: Parser (``Environment.compile``); only called on cache miss
+
+    Raises:
+        Whatever ``parse`` raises for invalid expressions (not cached)
+    """
+    compiled = _ast_cache.get(expression)
+    if compiled is None:
+        ast = parse(expression)
+        compiled = CompiledExpression(expression, ast, extract_dependencies(ast))
+        with _ast_cache_lock:
+            if len(_ast_cache) >= _AST_CACHE_MAX:
+                _ast_cache.clear()
+            _ast_cache[expression] = compiled
+    return compiled
+
+
+def register_compiled(expressions: Iterable[CompiledExpression]) -> None:
+    """Seed the process-wide AST cache with precompiled expressions."""
+    with _ast_cache_lock:
+        for compiled in expressions:
+            _ast_cache.setdefault(compiled.expression, compiled)
+
+
+def clear_ast_cache() -> None:
+    """Drop all process-wide cached ASTs."""
+    with _ast_cache_lock:
+        _ast_cache.clear()
+
+
+# ==================== Precompiled RulePacks ====================
+
+@dataclass
+class CompiledRulePack:
+    """RulePack with all rule expressions compiled ahead of time.
+
+    Attributes:
+        rulepack: Validated RulePack model
+        expressions: Compiled expression per rule ID
+        source_hash: Content hash of the RulePack JSON (cache key)
+    """
+
+    rulepack: RulePack
+    expressions: dict[str, CompiledExpression]
+    source_hash: str = ""
+
+    @classmethod
+    def compile(cls, rulepack: RulePack, source_hash: str = "") -> "CompiledRulePack":
+        """Compile all rules of a RulePack (invalid rules are left out).
+
+        Invalid expressions are logged and skipped; the executor compiles
+        (and reports) them again when they are evaluated.
+        """
+        if celpy is None:
+            raise ImportError(
+                "celpy library is required for CEL engine. "
+                "Install with: pip install celpy"
+            )
+        env = celpy.Environment()
+        expressions: dict[str, CompiledExpression] = {}
+        for pack in rulepack.packs:
+            for rule in pack.rules:
+                try:
+                    expressions[rule.id] = compile_ast(rule.expression, env.compile)
+                except Exception as e:
+                    logger.warning(f"Rule {rule.id} not precompiled: {e}")
+        return cls(rulepack=rulepack, expressions=expressions, source_hash=source_hash)
+
+    @staticmethod
+    def hash_source(data: bytes) -> str:
+        """Cache key of RulePack JSON bytes (includes format/celpy version)."""
+        digest = hashlib.sha256(data)
+        digest.update(f"|{FORMAT_VERSION}|{CELPY_VERSION}".encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def load_cached(cls, source_hash: str, cache_dir: Path) -> Optional["CompiledRulePack"]:
+        """Load a previously saved compiled RulePack, None if absent/unreadable."""
+        path = Path(cache_dir) / f"{source_hash}.celc"
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                compiled = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable compiled RulePack {path.name}: {e}")
+            return None
+        if not isinstance(compiled, cls) or compiled.source_hash != source_hash:
+            return None
+        return compiled
+
+    def save(self, cache_dir: Path) -> Path:
+        """Write the compiled RulePack to ``cache_dir/<source_hash>.celc``."""
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_dir / f"{self.source_hash}.celc"
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+        return path
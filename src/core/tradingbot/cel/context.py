@@ -1,10 +1,13 @@
 """RuleContext Builder for CEL Evaluation.
 
-Converts FeatureVector and Trade state into CEL-compatible context.
+Converts FeatureVector and Trade state into CEL-compatible context,
+either as dict (build) or as LazyContext (build_lazy).
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+from .lazy_context import LazyContext
 
 logger = logging.getLogger(__name__)
 
@@ -56,39 +59,78 @@ class RuleContextBuilder:
                 config={"capital": 10000.0}
             )
         """
-        context: dict[str, Any] = {}
+        context = RuleContextBuilder.build_lazy(
+            features=features,
+            trade=trade,
+            config=config,
+            timeframe=timeframe,
+            additional_context=additional_context,
+        ).to_dict()
+
+        logger.debug(
+            f"Built RuleContext with {len(context)} top-level keys: "
+            f"{list(context.keys())}"
+        )
+
+        return context
+
+    @staticmethod
+    def build_lazy(
+        features: Any,  # FeatureVector
+        trade: Optional[Any] = None,  # Trade
+        config: Optional[dict[str, Any]] = None,
+        timeframe: str = "5m",
+        additional_context: Optional[dict[str, Any]] = None,
+    ) -> LazyContext:
+        """Build lazy CEL context: same variables as build(), computed on access.
+
+        Each variable is converted from the FeatureVector/Trade only when an
+        evaluated expression references it, and at most once per context.
+        Use one context for all rules of a bar.
+
+        Args:
+            features: FeatureVector with market data and indicators
+            trade: Optional current Trade object
+            config: Optional bot configuration
+            timeframe: Timeframe string (e.g., "5m", "1h")
+            additional_context: Optional additional context variables
+
+        Returns:
+            LazyContext (bar key: features.timestamp)
+
+        Example:
+            context = RuleContextBuilder.build_lazy(features, trade=current_trade)
+            summary = executor.execute(rulepack, context)
+        """
+        context = LazyContext(bar_key=getattr(features, "timestamp", None))
 
         # 1. Timeframe
-        context["tf"] = timeframe
+        context.set("tf", timeframe)
 
         # 2. Market Data (from FeatureVector)
         if features:
-            context["regime"] = getattr(features, "regime", "UNKNOWN")
-            context["direction"] = getattr(features, "direction", "NONE")
-            context["open"] = float(getattr(features, "open", 0.0))
-            context["high"] = float(getattr(features, "high", 0.0))
-            context["low"] = float(getattr(features, "low", 0.0))
-            context["close"] = float(getattr(features, "close", 0.0))
-            context["volume"] = float(getattr(features, "volume", 0.0))
-            context["atrp"] = float(getattr(features, "atrp", 0.0))
+            context.define("regime", lambda: getattr(features, "regime", "UNKNOWN"))
+            context.define("direction", lambda: getattr(features, "direction", "NONE"))
+            for name in ("open", "high", "low", "close", "volume", "atrp"):
+                context.define(name, _float_attr(features, name))
 
             # 3. Indicators (extracted from FeatureVector)
             # Format: indicator_id → {value: X, signal: Y, ...}
-            context.update(
-                RuleContextBuilder._extract_indicators(features)
-            )
+            for indicator_id, attr, convert in _INDICATORS:
+                if getattr(features, attr, None) is not None:
+                    context.define(indicator_id, _bind(convert, features))
 
             # 4. Derived Values
-            context["prev_close"] = float(
+            context.define("prev_close", lambda: float(
                 getattr(features, "prev_close", context["close"])
-            )
-            context["bars_since_open"] = int(
+            ))
+            context.define("bars_since_open", lambda: int(
                 getattr(features, "bars_since_open", 0)
-            )
+            ))
 
         # 5. Trade State (if trade exists)
         if trade:
-            context["trade"] = {
+            context.define("trade", lambda: {
                 "direction": getattr(trade, "direction", "NONE"),
                 "entry": float(getattr(trade, "entry_price", 0.0)),
                 "stop_loss": float(getattr(trade, "stop_loss", 0.0)),
@@ -96,33 +138,28 @@ class RuleContextBuilder:
                 "position_value": float(getattr(trade, "position_value", 0.0)),
                 "profit_pct": float(getattr(trade, "profit_pct", 0.0)),
                 "bars_held": int(getattr(trade, "bars_held", 0)),
-            }
+            })
         else:
-            context["trade"] = None
+            context.set("trade", None)
 
         # 6. Config (bot configuration)
         if config:
-            context["cfg"] = {
+            context.define("cfg", lambda: {
                 "capital": float(config.get("capital", 10000.0)),
                 "max_position_size": float(config.get("max_position_size", 0.2)),
                 "max_risk_per_trade": float(config.get("max_risk_per_trade", 0.01)),
-            }
+            })
         else:
-            context["cfg"] = {
+            context.define("cfg", lambda: {
                 "capital": 10000.0,
                 "max_position_size": 0.2,
                 "max_risk_per_trade": 0.01,
-            }
+            })
 
         # 7. Additional Context (user-provided)
         if additional_context:
             context.update(additional_context)
 
-        logger.debug(
-            f"Built RuleContext with {len(context)} top-level keys: "
-            f"{list(context.keys())}"
-        )
-
         return context
 
     @staticmethod
@@ -139,69 +176,11 @@ class RuleContextBuilder:
             indicators = _extract_indicators(features)
             # {"rsi14": {"value": 28.5}, "macd_12_26_9": {"value": 0.5, "signal": 0.3, "histogram": 0.2}}
         """
-        indicators = {}
-
-        # RSI
-        if hasattr(features, "rsi") and features.rsi is not None:
-            indicators["rsi14"] = {"value": float(features.rsi)}
-
-        # MACD
-        if hasattr(features, "macd") and features.macd is not None:
-            indicators["macd_12_26_9"] = {
-                "value": float(features.macd),
-                "signal": float(getattr(features, "macd_signal", 0.0)),
-                "histogram": float(getattr(features, "macd_histogram", 0.0)),
-            }
-
-        # ADX
-        if hasattr(features, "adx") and features.adx is not None:
-            indicators["adx14"] = {"value": float(features.adx)}
-
-        # ATR
-        if hasattr(features, "atr") and features.atr is not None:
-            indicators["atr14"] = {"value": float(features.atr)}
-
-        # EMAs
-        if hasattr(features, "ema_34") and features.ema_34 is not None:
-            indicators["ema34"] = {"value": float(features.ema_34)}
-
-        if hasattr(features, "ema_89") and features.ema_89 is not None:
-            indicators["ema89"] = {"value": float(features.ema_89)}
-
-        # SMAs
-        if hasattr(features, "sma_50") and features.sma_50 is not None:
-            indicators["sma50"] = {"value": float(features.sma_50)}
-
-        if hasattr(features, "sma_200") and features.sma_200 is not None:
-            indicators["sma200"] = {"value": float(features.sma_200)}
-
-        # Volume SMA
-        if hasattr(features, "volume_sma") and features.volume_sma is not None:
-            indicators["volume_sma_20"] = {"value": float(features.volume_sma)}
-
-        # Bollinger Bands
-        if hasattr(features, "bb_upper") and features.bb_upper is not None:
-            indicators["bb_20_2"] = {
-                "upper": float(features.bb_upper),
-                "middle": float(getattr(features, "bb_middle", 0.0)),
-                "lower": float(getattr(features, "bb_lower", 0.0)),
-                "width": float(getattr(features, "bb_width", 0.0)),
-            }
-
-        # Stochastic
-        if hasattr(features, "stoch_k") and features.stoch_k is not None:
-            indicators["stoch_14_3_3"] = {
-                "k": float(features.stoch_k),
-                "d": float(getattr(features, "stoch_d", 0.0)),
-            }
-
-        # CCI
-        if hasattr(features, "cci") and features.cci is not None:
-            indicators["cci20"] = {"value": float(features.cci)}
-
-        # MFI
-        if hasattr(features, "mfi") and features.mfi is not None:
-            indicators["mfi14"] = {"value": float(features.mfi)}
+        indicators = {
+            indicator_id: convert(features)
+            for indicator_id, attr, convert in _INDICATORS
+            if getattr(features, attr, None) is not None
+        }
 
         logger.debug(f"Extracted {len(indicators)} indicators from FeatureVector")
 
@@ -249,3 +228,46 @@ class RuleContextBuilder:
             context.update(indicators)
 
         return context
+
+
+def _float_attr(obj: Any, name: str) -> Callable[[], float]:
+    return lambda: float(getattr(obj, name, 0.0))
+
+
+def _bind(convert: Callable[[Any], Any], features: Any) -> Callable[[], Any]:
+    return lambda: convert(features)
+
+
+# (context indicator_id, FeatureVector attribute that must be set, converter)
+_INDICATORS: list[tuple[str, str, Callable[[Any], dict[str, float]]]] = [
+    ("rsi14", "rsi", lambda f: {"value": float(f.rsi)}),
+    ("macd_12_26_9", "macd", lambda f: {
+        "value": float(f.macd),
+        "signal": float(getattr(f, "macd_signal", 0.0)),
+        "histogram": float(getattr(f, "macd_histogram", 0.0)),
+    }),
+    ("adx14", "adx", lambda f: {"value": float(f.adx)}),
+    ("atr14", "atr", lambda f: {"value": float(f.atr)}),
+    # EMAs
+    ("ema34", "ema_34", lambda f: {"value": float(f.ema_34)}),
+    ("ema89", "ema_89", lambda f: {"value": float(f.ema_89)}),
+    # SMAs
+    ("sma50", "sma_50", lambda f: {"value": float(f.sma_50)}),
+    ("sma200", "sma_200", lambda f: {"value": float(f.sma_200)}),
+    # Volume SMA
+    ("volume_sma_20", "volume_sma", lambda f: {"value": float(f.volume_sma)}),
+    # Bollinger Bands
+    ("bb_20_2", "bb_upper", lambda f: {
+        "upper": float(f.bb_upper),
+        "middle": float(getattr(f, "bb_middle", 0.0)),
+        "lower": float(getattr(f, "bb_lower", 0.0)),
+        "width": float(getattr(f, "bb_width", 0.0)),
+    }),
+    # Stochastic
+    ("stoch_14_3_3", "stoch_k", lambda f: {
+        "k": float(f.stoch_k),
+        "d": float(getattr(f, "stoch_d", 0.0)),
+    }),
+    ("cci20", "cci", lambda f: {"value": float(f.cci)}),
+    ("mfi14", "mfi", lambda f: {"value": float(f.mfi)}),
+]
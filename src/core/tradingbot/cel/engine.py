@@ -4,6 +4,7 @@ Provides CEL expression compilation, evaluation, and custom trading functions.
 """
 
 import logging
+from collections.abc import Iterable
 from functools import lru_cache
 from typing import Any
 
@@ -16,6 +17,9 @@ except ImportError:
     Environment = None
     Runner = None
 
+from .compiled import CompiledExpression, compile_ast, register_compiled
+from .lazy_context import LazyContext, resolve_for
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +27,8 @@ class CELEngine:
     """CEL Expression Engine with custom trading functions.
 
     Features:
-    - Expression compilation with caching
+    - Expression compilation with caching (per-instance programs,
+      process-wide ASTs, precompiled RulePacks via add_compiled)
     - Custom trading functions (pctl, isnull, nz, coalesce)
     - Error handling with detailed messages
     - Performance optimization via LRU cache
@@ -48,6 +53,8 @@ class CELEngine:
         self.env = Environment()
         self._cache_size = cache_size
         self._compiled_cache: dict[str, Any] = {}
+        # Per instance: lru_cache on the method would be shared by all engines
+        self.compile = lru_cache(maxsize=cache_size)(self._create_program)
 
         # Register custom trading functions
         self._register_custom_functions()
@@ -69,9 +76,8 @@ class CELEngine:
 
         logger.debug("Custom trading functions registered")
 
-    @lru_cache(maxsize=256)
-    def compile(self, expression: str) -> Any:
-        """Compile CEL expression with caching.
+    def _create_program(self, expression: str) -> Any:
+        """Compile CEL expression (cached per instance as ``compile``).
 
         Args:
             expression: CEL expression string
@@ -83,24 +89,61 @@ class CELEngine:
             ValueError: If expression is invalid
         """
         try:
-            ast = self.env.compile(expression)
-            program = self.env.program(ast)
+            program = self.env.program(self.compile_expression(expression).ast)
             logger.debug(f"Compiled expression: {expression[:50]}...")
             return program
         except Exception as e:
             logger.error(f"Failed to compile expression: {expression}")
             raise ValueError(f"Invalid CEL expression: {e}") from e
 
+    def compile_expression(self, expression: str) -> CompiledExpression:
+        """Parse CEL expression into AST + context dependencies.
+
+        Args:
+            expression: CEL expression string
+
+        Returns:
+            CompiledExpression (shared, precompiled ASTs are reused)
+
+        Raises:
+            Exception: celpy parse error if expression is invalid
+        """
+        return compile_ast(expression, self.env.compile)
+
+    def add_compiled(self, expressions: Iterable[CompiledExpression]) -> None:
+        """Register precompiled expressions (e.g. from a CompiledRulePack).
+
+        Subsequent compile() calls only build the program from the AST.
+        """
+        register_compiled(expressions)
+
+    def dependencies(self, expression: str) -> frozenset[str]:
+        """Get the context paths an expression reads.
+
+        Args:
+            expression: CEL expression string
+
+        Returns:
+            Dotted context paths, e.g. frozenset({"rsi14.value"})
+
+        Raises:
+            ValueError: If expression is invalid
+        """
+        try:
+            return self.compile_expression(expression).dependencies
+        except Exception as e:
+            raise ValueError(f"Invalid CEL expression: {e}") from e
+
     def evaluate(
         self,
         expression: str,
-        context: dict[str, Any],
+        context: dict[str, Any] | LazyContext,
     ) -> Any:
         """Evaluate CEL expression with given context.
 
         Args:
             expression: CEL expression string
-            context: Context variables for evaluation
+            context: Context variables for evaluation (dict or LazyContext)
 
         Returns:
             Evaluation result (typically bool for rule evaluation)
@@ -119,8 +162,10 @@ class CELEngine:
             # Compile (uses cache if already compiled)
             program = self.compile(expression)
 
-            # Evaluate
-            result = program.evaluate(context)
+            # Evaluate (LazyContext: only the referenced variables)
+            result = program.evaluate(
+                resolve_for(context, self.compile_expression(expression).dependencies)
+            )
 
             logger.debug(
                 f"Evaluated: {expression[:50]}... → {result}"
@@ -134,7 +179,7 @@ class CELEngine:
         except Exception as e:
             logger.error(
                 f"Evaluation failed for expression: {expression}\n"
-                f"Context keys: {list(context.keys())}\n"
+                f"Context keys: {_context_keys(context)}\n"
                 f"Error: {e}"
             )
             raise RuntimeError(f"CEL evaluation failed: {e}") from e
@@ -211,6 +256,13 @@ class CELEngine:
         }
 
 
+def _context_keys(context: Any) -> list[str]:
+    """Context keys for logging (LazyContext values are not resolved)."""
+    if isinstance(context, LazyContext):
+        return context.names()
+    return list(context.keys())
+
+
 # Custom trading functions (to be integrated in context)
 
 def pctl(array: list[float], percentile: float) -> float:
@@ -12,6 +12,10 @@ Execution Order:
 Monotonic Stop Enforcement:
     - LONG positions: new_stop = max(current_stop, calculated_stop)
     - SHORT positions: new_stop = min(current_stop, calculated_stop)
+
+Incremental Evaluation:
+    CEL expressions are pure, so a rule whose context dependencies have
+    the same values as in its last evaluation reuses that result.
 """
 
 import logging
@@ -19,6 +23,7 @@ from typing import Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from .compiled import snapshot_inputs
 from .engine import CELEngine
 from .models import RulePack, Pack, Rule
 
@@ -43,10 +48,15 @@ class RuleResult:
     severity: str
     message: str
     execution_time_ms: float
+    cached: bool = False  # Inputs unchanged, result of last evaluation reused
 
     def __str__(self) -> str:
         status = "✅ TRIGGERED" if self.triggered else "⏭️  SKIPPED"
-        return f"{status} [{self.severity}] {self.rule_name} ({self.execution_time_ms:.2f}ms)"
+        cached = ", cached" if self.cached else ""
+        return (
+            f"{status} [{self.severity}] {self.rule_name} "
+            f"({self.execution_time_ms:.2f}ms{cached})"
+        )
 
 
 @dataclass
@@ -102,6 +112,7 @@ class RulePackExecutor:
     - Monotonic stop enforcement (Long: max(), Short: min())
     - Priority-based rule sorting (high priority first)
     - Early termination on block severity
+    - Skips rules whose inputs did not change since the last evaluation
     - Rule profiling and statistics
 
     Example:
@@ -119,14 +130,18 @@ class RulePackExecutor:
     # Correct execution order
     EXECUTION_ORDER = ["exit", "update_stop", "risk", "entry"]
 
-    def __init__(self, engine: Optional[CELEngine] = None):
+    def __init__(self, engine: Optional[CELEngine] = None, skip_unchanged: bool = True):
         """Initialize RulePack executor.
 
         Args:
             engine: Optional CEL engine (creates new if None)
+            skip_unchanged: Reuse rule results while their inputs are unchanged
         """
         self.engine = engine or CELEngine()
+        self.skip_unchanged = skip_unchanged
         self.rule_stats: dict[str, dict[str, Any]] = {}  # Rule profiling
+        # rule_id -> (expression, input snapshot, triggered)
+        self._last_results: dict[str, tuple[str, tuple, bool]] = {}
         logger.info("RulePackExecutor initialized")
 
     def execute(
@@ -303,22 +318,37 @@ class RulePackExecutor:
 
         start_time = time.perf_counter()
 
-        # Evaluate expression
-        triggered = self.engine.evaluate_safe(
-            rule.expression,
-            context,
-            default=False
+        inputs = self._snapshot_inputs(rule.expression, context)
+        last = self._last_results.get(rule.id)
+        cached = (
+            inputs is not None
+            and last is not None
+            and last[0] == rule.expression
+            and _same_inputs(last[1], inputs)
         )
 
+        if cached:
+            triggered = last[2]
+        else:
+            # Evaluate expression
+            triggered = bool(self.engine.evaluate_safe(
+                rule.expression,
+                context,
+                default=False
+            ))
+            if inputs is not None:
+                self._last_results[rule.id] = (rule.expression, inputs, triggered)
+
         exec_time = (time.perf_counter() - start_time) * 1000
 
         result = RuleResult(
             rule_id=rule.id,
             rule_name=rule.name,
-            triggered=bool(triggered),
+            triggered=triggered,
             severity=rule.severity,
             message=rule.message or "",
             execution_time_ms=exec_time,
+            cached=cached,
         )
 
         if triggered:
@@ -326,6 +356,23 @@ class RulePackExecutor:
 
         return result
 
+    def _snapshot_inputs(self, expression: str, context: dict[str, Any]) -> Optional[tuple]:
+        """Values of the expression's dependencies (None = always evaluate)."""
+        if not self.skip_unchanged:
+            return None
+        try:
+            dependencies = self.engine.dependencies(expression)
+        except ValueError:
+            return None
+        return snapshot_inputs(context, sorted(dependencies))
+
+    def reset_results(self) -> None:
+        """Forget last rule results, forcing full evaluation on next execute.
+
+        Call after changing CEL functions or engine state that rules depend on.
+        """
+        self._last_results.clear()
+
     def _update_rule_stats(self, rule_id: str, result: RuleResult) -> None:
         """Update rule profiling statistics.
 
@@ -336,6 +383,7 @@ class RulePackExecutor:
         if rule_id not in self.rule_stats:
             self.rule_stats[rule_id] = {
                 "evaluations": 0,
+                "cached": 0,
                 "triggers": 0,
                 "total_time_ms": 0.0,
                 "avg_time_ms": 0.0,
@@ -343,6 +391,8 @@ class RulePackExecutor:
 
         stats = self.rule_stats[rule_id]
         stats["evaluations"] += 1
+        if result.cached:
+            stats["cached"] += 1
 
         if result.triggered:
             stats["triggers"] += 1
@@ -405,6 +455,23 @@ class RulePackExecutor:
         logger.info("Rule statistics cleared")
 
 
+def _same_inputs(previous: tuple, current: tuple) -> bool:
+    """Compare input snapshots (NaN equals NaN, type changes count)."""
+    if len(previous) != len(current):
+        return False
+    for old, new in zip(previous, current):
+        if old is new:
+            continue
+        if type(old) is not type(new):
+            return False
+        try:
+            if old != new and not (old != old and new != new):
+                return False
+        except Exception:
+            return False
+    return True
+
+
 def enforce_monotonic_stop(
     direction: str,
     current_stop: float,
@@ -0,0 +1,211 @@
+"""Lazy CEL Evaluation Context.
+
+Context builders used to produce one large dict per evaluation (all
+indicators, chart variables, bot config, project variables), even when an
+expression reads two names. LazyContext registers resolvers instead:
+
+- define(name, resolver): single variable, computed on first access
+- define_namespace(root, resolver): group of flat dotted variables
+  ("chart.price", "chart.open", ...) produced together by one provider call
+
+Values are memoized until start_bar() is called with a new bar key, so all
+expressions evaluated on the same bar share them. The CEL engines only
+materialize the identifiers an expression references (resolve()), because
+celpy copies every context entry into its activation.
+
+Example:
+    context = LazyContext(bar_key=features.timestamp)
+    context.define("rsi14", lambda: {"value": float(features.rsi)})
+    context.define_namespace("chart", lambda: chart_provider.get_context(chart_window))
+    engine.evaluate("rsi14.value < 30 && chart.price > 100", context)
+"""
+
+import logging
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+
+
+class LazyContext(Mapping):
+    """Mapping of CEL variables resolved on demand and memoized per bar.
+
+    Plain names map to one resolver each; namespace roots map to a resolver
+    returning all ``root.*`` variables at once. Namespaced variables take
+    precedence over plain names with the same dotted key.
+    """
+
+    def __init__(self, bar_key: Optional[Hashable] = None):
+        """Initialize empty context.
+
+        Args:
+            bar_key: Identifies the bar the memoized values belong to
+        """
+        self._bar_key = bar_key
+        self._resolvers: dict[str, Callable[[], Any]] = {}
+        self._dotted: dict[str, list[str]] = {}  # root -> plain names "root.x"
+        self._namespaces: dict[str, Callable[[], Mapping[str, Any]]] = {}
+        self._values: dict[str, Any] = {}
+        self._namespace_values: dict[str, Mapping[str, Any]] = {}
+        self.resolved = 0  # Resolver calls (for profiling/tests)
+
+    # ==================== Definition ====================
+
+    def define(self, name: str, resolver: Callable[[], Any]) -> None:
+        """Register a variable computed on first access."""
+        self._register(name, resolver)
+        self._values.pop(name, None)
+
+    def set(self, name: str, value: Any) -> None:
+        """Register a variable with a known value."""
+        self._register(name, _constant(value))
+        self._values[name] = value
+
+    def _register(self, name: str, resolver: Callable[[], Any]) -> None:
+        if name not in self._resolvers and "." in name:
+            self._dotted.setdefault(name.split(".", 1)[0], []).append(name)
+        self._resolvers[name] = resolver
+
+    def update(self, values: Mapping[str, Any]) -> None:
+        """Register known values (dotted keys are plain names)."""
+        for name, value in values.items():
+            self.set(name, value)
+
+    def define_namespace(
+        self, root: str, resolver: Callable[[], Mapping[str, Any]]
+    ) -> None:
+        """Register a provider for all ``root.*`` variables.
+
+        Args:
+            root: Namespace root, e.g. "chart"
+            resolver: Returns flat dotted keys ("chart.price": 1.0, ...)
+        """
+        self._namespaces[root] = resolver
+        self._namespace_values.pop(root, None)
+
+    def start_bar(self, bar_key: Hashable) -> bool:
+        """Drop memoized values if ``bar_key`` differs from the current bar.
+
+        Returns:
+            True if a new bar started (values will be recomputed)
+        """
+        if bar_key == self._bar_key:
+            return False
+        self._bar_key = bar_key
+        self._values.clear()
+        self._namespace_values.clear()
+        return True
+
+    @property
+    def bar_key(self) -> Optional[Hashable]:
+        return self._bar_key
+
+    # ==================== Resolution ====================
+
+    def resolve(self, dependencies: Iterable[str]) -> dict[str, Any]:
+        """Materialize the variables needed for the given dependency paths.
+
+        Args:
+            dependencies: Dotted paths read by an expression
+                (CompiledExpression.dependencies)
+
+        Returns:
+            Plain dict with only the referenced top-level variables and
+            namespaces, ready for celpy
+        """
+        context: dict[str, Any] = {}
+        for path in dependencies:
+            root = path.split(".", 1)[0]
+            if root in context:
+                continue
+            if root in self._resolvers:
+                context[root] = self[root]
+            for name in self._dotted.get(root, ()):
+                context[name] = self[name]
+            if root in self._namespaces:
+                context.update(self._namespace(root))
+        return context
+
+    def to_dict(self) -> dict[str, Any]:
+        """Materialize all variables (eager context of the old builders)."""
+        return {name: self[name] for name in self}
+
+    def names(self) -> list[str]:
+        """Registered plain names and namespace roots (nothing is resolved)."""
+        return list(self._resolvers) + [f"{root}.*" for root in self._namespaces]
+
+    def _namespace(self, root: str) -> Mapping[str, Any]:
+        values = self._namespace_values.get(root)
+        if values is None:
+            try:
+                values = self._namespaces[root]() or {}
+            except Exception as e:
+                logger.warning(f"Could not resolve CEL namespace '{root}': {e}")
+                values = {}
+            self.resolved += 1
+            self._namespace_values[root] = values
+        return values
+
+    # ==================== Mapping ====================
+
+    def __getitem__(self, name: str) -> Any:
+        root = name.split(".", 1)[0]
+        if root in self._namespaces and "." in name:
+            values = self._namespace(root)
+            if name in values:
+                return values[name]
+        value = self._values.get(name, _UNSET)
+        if value is _UNSET:
+            resolver = self._resolvers.get(name)
+            if resolver is None:
+                raise KeyError(name)
+            value = resolver()
+            self.resolved += 1
+            self._values[name] = value
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        if name in self._resolvers:
+            return True
+        root = name.split(".", 1)[0]
+        return root in self._namespaces and name in self._namespace(root)
+
+    def __iter__(self) -> Iterator[str]:
+        seen = set()
+        for name in self._resolvers:
+            seen.add(name)
+            yield name
+        for root in self._namespaces:
+            for name in self._namespace(root):
+                if name not in seen:
+                    yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        return bool(self._resolvers or self._namespaces)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyContext(bar={self._bar_key!r}, names={len(self._resolvers)}, "
+            f"namespaces={list(self._namespaces)}, resolved={self.resolved})"
+        )
+
+
+def _constant(value: Any) -> Callable[[], Any]:
+    return lambda: value
+
+
+def resolve_for(context: Mapping[str, Any], dependencies: Iterable[str]) -> Mapping[str, Any]:
+    """Context for one expression: referenced subset of a LazyContext.
+
+    Plain dicts are returned unchanged.
+    """
+    if isinstance(context, LazyContext):
+        return context.resolve(dependencies)
+    return context
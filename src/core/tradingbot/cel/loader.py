@@ -1,6 +1,8 @@
 """RulePack Loader with Schema Validation.
 
 Loads and validates RulePack JSON files using SchemaValidator and Pydantic models.
+load_compiled() additionally caches the validated, precompiled RulePack on disk,
+keyed by the file content, so unchanged RulePacks load without re-validation.
 """
 
 import json
@@ -9,6 +11,7 @@ from pathlib import Path
 from typing import Optional
 
 from src.core.tradingbot.config.validator import SchemaValidator, ValidationError
+from .compiled import DEFAULT_CACHE_DIR, CompiledRulePack
 from .models import RulePack
 
 logger = logging.getLogger(__name__)
@@ -25,15 +28,28 @@ class RulePackLoader:
         rulepack = loader.load("03_JSON/RulePacks/default_rules.json")
     """
 
-    def __init__(self, validator: Optional[SchemaValidator] = None):
+    def __init__(
+        self,
+        validator: Optional[SchemaValidator] = None,
+        cache_dir: Optional[str | Path] = None,
+    ):
         """Initialize RulePack loader.
 
         Args:
             validator: Optional SchemaValidator instance (creates new if None)
+            cache_dir: Directory for compiled RulePacks (default: ~/.orderpilot/cel_cache)
         """
-        self.validator = validator or SchemaValidator()
+        self._validator = validator
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
         logger.info("RulePackLoader initialized")
 
+    @property
+    def validator(self) -> SchemaValidator:
+        """Schema validator (created on first use, cache hits don't need it)."""
+        if self._validator is None:
+            self._validator = SchemaValidator()
+        return self._validator
+
     def load(self, json_path: str | Path) -> RulePack:
         """Load and validate RulePack from JSON file.
 
@@ -73,6 +89,45 @@ class RulePackLoader:
 
         return rulepack
 
+    def load_compiled(self, json_path: str | Path) -> CompiledRulePack:
+        """Load RulePack with precompiled rule expressions.
+
+        The compiled RulePack is cached in ``cache_dir`` under the hash of
+        the file content; as long as the file is unchanged, loading skips
+        schema validation, model validation and CEL parsing.
+
+        Args:
+            json_path: Path to RulePack JSON file
+
+        Returns:
+            CompiledRulePack (RulePack + compiled expressions per rule ID)
+
+        Raises:
+            FileNotFoundError: If file not found
+            ValidationError: If JSON Schema validation fails
+            ValueError: If Pydantic validation fails
+
+        Example:
+            compiled = loader.load_compiled("03_JSON/RulePacks/default_rules.json")
+            executor.engine.add_compiled(compiled.expressions.values())
+        """
+        json_path = Path(json_path)
+        if not json_path.exists():
+            raise FileNotFoundError(f"RulePack not found: {json_path}")
+
+        source_hash = CompiledRulePack.hash_source(json_path.read_bytes())
+        compiled = CompiledRulePack.load_cached(source_hash, self.cache_dir)
+        if compiled is not None:
+            logger.info(f"✅ RulePack loaded from compile cache: {json_path}")
+            return compiled
+
+        compiled = CompiledRulePack.compile(self.load(json_path), source_hash=source_hash)
+        try:
+            compiled.save(self.cache_dir)
+        except OSError as e:
+            logger.warning(f"Could not write RulePack compile cache: {e}")
+        return compiled
+
     def load_from_dict(self, data: dict) -> RulePack:
         """Load RulePack from dict (already validated).
 
@@ -24,6 +24,8 @@ except ImportError:
     celpy = None
     Environment = None
 
+from .cel.compiled import compile_ast
+from .cel.lazy_context import LazyContext, resolve_for
 from .cel_engine_functions import CELFunctions
 
 logger = logging.getLogger(__name__)
@@ -229,8 +231,8 @@ class CELEngine:
             ValueError: If expression syntax is invalid
         """
         try:
-            # Compile expression to AST
-            ast = self.env.compile(expression)
+            # Compile expression to AST (parsed once per process)
+            ast = compile_ast(expression, self.env.compile).ast
             # Create program with custom functions
             program = self.env.program(ast, functions=self.custom_functions)
             return program
@@ -240,14 +242,15 @@ class CELEngine:
     def evaluate(
         self,
         expression: str,
-        context: dict[str, Any],
+        context: dict[str, Any] | LazyContext,
         default: Any = None
     ) -> Any:
         """Evaluate CEL expression with context.
 
         Args:
             expression: CEL expression to evaluate
-            context: Variable context (must be JSON-serializable types)
+            context: Variable context (must be JSON-serializable types), dict or
+                LazyContext
             default: Default value if evaluation fails
 
         Returns:
@@ -261,17 +264,20 @@ class CELEngine:
             # Store last context for context-aware helper functions
             self._last_context = context or {}
 
-            # Debug: Log context keys
-            print(f"[CEL] evaluate() called, context keys: {list(context.keys())}", flush=True)
-            print(f"[CEL] chart_window in context: {'chart_window' in context}", flush=True)
-            if 'chart_window' in context:
-                print(f"[CEL] chart_window type: {type(context['chart_window']).__name__}", flush=True)
+            # Debug: Log context keys (LazyContext: without resolving values)
+            if logger.isEnabledFor(logging.DEBUG):
+                keys = context.names() if isinstance(context, LazyContext) else list(context.keys())
+                logger.debug(f"[CEL] evaluate() called, context keys: {keys}")
+                logger.debug(f"[CEL] chart_window in context: {'chart_window' in context}")
+                if 'chart_window' in context:
+                    logger.debug(f"[CEL] chart_window type: {type(context['chart_window']).__name__}")
 
             # Get compiled program (cached if enabled)
             program = self._get_program(expression)
 
             # Convert context to celpy types for proper operator support
-            cel_context = self._to_cel_types(context)
+            # (LazyContext: only the variables the expression references)
+            cel_context = self._to_cel_types(resolve_for(context, self.dependencies(expression)))
 
             # Evaluate with context
             result = program.evaluate(cel_context)
@@ -287,6 +293,24 @@ class CELEngine:
             if default is not None:
                 return default
             raise RuntimeError(f"CEL evaluation failed: {e}") from e
+
+    def dependencies(self, expression: str) -> frozenset[str]:
+        """Get the context paths an expression references (parsed once).
+
+        Args:
+            expression: CEL expression
+
+        Returns:
+            Dotted paths, e.g. frozenset({"chart.price", "rsi"})
+
+        Raises:
+            ValueError: If expression syntax is invalid
+        """
+        try:
+            return compile_ast(expression, self.env.compile).dependencies
+        except Exception as e:
+            raise ValueError(f"CEL compilation failed: {e}") from e
+
     def evaluate_with_sources(
         self,
         expression: str,
@@ -350,15 +374,16 @@ class CELEngine:
 
         Note:
             This method uses lazy imports to avoid circular dependencies.
-            CELContextBuilder is imported only when needed.
+            CELContextBuilder is imported only when needed. The context is
+            built lazily, so only sources the expression references are read.
         """
         # Lazy import to avoid circular dependency
         if context_builder is None:
             from src.core.variables import CELContextBuilder
             context_builder = CELContextBuilder()
 
-        # Build context from all sources
-        context = context_builder.build(
+        # Build context from all sources (lazy: only referenced variables are resolved)
+        context = context_builder.build_lazy(
             chart_window=chart_window,
             bot_config=bot_config,
             project_vars_path=project_vars_path,
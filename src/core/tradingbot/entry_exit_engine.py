@@ -26,12 +26,12 @@ from .models import (
     Signal,
     TradeSide,
     TrailingState,
+    VolatilityLevel,
 )
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from .models import VolatilityLevel
     from .config.models import StrategyDefinition
 
 
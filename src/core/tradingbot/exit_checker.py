@@ -17,12 +17,12 @@ from .models import (
     RegimeState,
     RegimeType,
     TradeSide,
+    VolatilityLevel,
 )
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from .models import VolatilityLevel
     from .config.models import StrategyDefinition
 
 
@@ -11,6 +11,7 @@ REFACTORED: Preprocessing methods extracted to candle_preprocessing.py
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from datetime import datetime
 
 import numpy as np
@@ -57,6 +58,10 @@ class FeatureEngine:
     # Minimum bars needed for valid features
     MIN_BARS = 60  # Need enough for slowest indicator (SMA 50 + warmup)
 
+    # Indicator outputs shifted into the past (look-ahead). At the evaluated
+    # bar they are never known, so batch calculation must not read them.
+    LOOKAHEAD_COLUMNS = ('chikou', 'chikou_span')
+
     def __init__(
         self,
         indicator_engine: IndicatorEngine | None = None,
@@ -243,6 +248,76 @@ class FeatureEngine:
             logger.error(f"Error building FeatureVector: {e}")
             return None
 
+    def calculate_features_batch(
+        self,
+        data: pd.DataFrame,
+        symbol: str
+    ) -> list[FeatureVector | None]:
+        """Calculate feature vectors for every bar of ``data`` in one pass.
+
+        Equivalent to calling ``calculate_features(data.iloc[:i + 1], symbol)``
+        for each bar ``i``, but every indicator is calculated only once over
+        the full frame (all configured indicators are causal).
+
+        Args:
+            data: DataFrame with columns: open, high, low, close, volume
+            symbol: Trading symbol
+
+        Returns:
+            One entry per bar; None for bars with insufficient history.
+        """
+        vectors: list[FeatureVector | None] = [None] * len(data)
+        if len(data) < self.MIN_BARS:
+            return vectors
+
+        data = self._normalize_columns(data)
+        results = self._results_to_arrays(self._calculate_all_indicators(data))
+        columns = {
+            name: data[name].to_numpy(dtype=float)
+            for name in ('open', 'high', 'low', 'close', 'volume')
+        }
+
+        for pos in range(self.MIN_BARS - 1, len(data)):
+            label = data.index[pos]
+            feature_dict = self._extract_feature_values(results, data, pos)
+            feature_dict.update(self._calculate_derived_features(feature_dict, columns, pos))
+
+            try:
+                vectors[pos] = FeatureVector(
+                    timestamp=label if isinstance(label, datetime) else datetime.utcnow(),
+                    symbol=symbol,
+                    open=float(columns['open'][pos]),
+                    high=float(columns['high'][pos]),
+                    low=float(columns['low'][pos]),
+                    close=float(columns['close'][pos]),
+                    volume=float(columns['volume'][pos]),
+                    **feature_dict
+                )
+            except Exception as e:
+                logger.error(f"Error building FeatureVector: {e}")
+
+        return vectors
+
+    def _results_to_arrays(
+        self,
+        results: dict[str, IndicatorResult]
+    ) -> dict[str, IndicatorResult]:
+        """Convert indicator outputs to numpy arrays for positional access."""
+        converted = {}
+        for key, result in results.items():
+            values = result.values
+            if isinstance(values, pd.Series):
+                values = values.to_numpy()
+            elif isinstance(values, (pd.DataFrame, dict)):
+                values = {
+                    name: None if name in self.LOOKAHEAD_COLUMNS
+                    else column.to_numpy() if isinstance(column, pd.Series)
+                    else column
+                    for name, column in values.items()
+                }
+            converted[key] = replace(result, values=values)
+        return converted
+
     def _normalize_columns(self, data: pd.DataFrame) -> pd.DataFrame:
         """Normalize column names to lowercase."""
         data = data.copy()
@@ -293,61 +368,62 @@ class FeatureEngine:
     def _extract_feature_values(
         self,
         results: dict[str, IndicatorResult],
-        data: pd.DataFrame
+        data: pd.DataFrame,
+        pos: int = -1,
     ) -> dict[str, float | None]:
-        """Extract latest values from indicator results."""
+        """Extract values at bar ``pos`` (default: latest) from indicator results."""
         features: dict[str, float | None] = {}
 
         # SMA values
         sma_fast_key = f"sma_period{self.periods['sma_fast']}"
         sma_slow_key = f"sma_period{self.periods['sma_slow']}"
-        self._set_feature_from_result(results, sma_fast_key, 'sma_20', features)
-        self._set_feature_from_result(results, sma_slow_key, 'sma_50', features)
+        self._set_feature_from_result(results, sma_fast_key, 'sma_20', features, pos)
+        self._set_feature_from_result(results, sma_slow_key, 'sma_50', features, pos)
 
         # EMA values
         ema_fast_key = f"ema_period{self.periods['ema_fast']}"
         ema_slow_key = f"ema_period{self.periods['ema_slow']}"
-        self._set_feature_from_result(results, ema_fast_key, 'ema_12', features)
-        self._set_feature_from_result(results, ema_slow_key, 'ema_26', features)
+        self._set_feature_from_result(results, ema_fast_key, 'ema_12', features, pos)
+        self._set_feature_from_result(results, ema_slow_key, 'ema_26', features, pos)
 
         # MACD (multi-column result)
         macd_key = (
             f"macd_fast{self.periods['macd_fast']}_signal{self.periods['macd_signal']}"
             f"_slow{self.periods['macd_slow']}"
         )
-        self._extract_macd(results, macd_key, features)
+        self._extract_macd(results, macd_key, features, pos)
 
         # ADX (multi-column result)
         adx_key = f"adx_period{self.periods['adx']}"
-        self._extract_adx(results, adx_key, features)
+        self._extract_adx(results, adx_key, features, pos)
 
         # RSI
         rsi_key = f"rsi_period{self.periods['rsi']}"
-        self._set_feature_from_result(results, rsi_key, 'rsi_14', features)
+        self._set_feature_from_result(results, rsi_key, 'rsi_14', features, pos)
 
         # Stochastic (multi-column result)
         stoch_key = f"stoch_d3_k{self.periods['stoch']}_smooth_k3"
-        self._extract_stoch(results, stoch_key, features)
+        self._extract_stoch(results, stoch_key, features, pos)
 
         # CCI
         cci_key = f"cci_period{self.periods['cci']}"
-        self._set_feature_from_result(results, cci_key, 'cci', features)
+        self._set_feature_from_result(results, cci_key, 'cci', features, pos)
 
         # MFI
         mfi_key = f"mfi_period{self.periods['mfi']}"
-        self._set_feature_from_result(results, mfi_key, 'mfi', features)
+        self._set_feature_from_result(results, mfi_key, 'mfi', features, pos)
 
         # Bollinger Bands (multi-column result)
         bb_key = f"bb_period{self.periods['bb']}_std2.0"
-        self._extract_bbands(results, bb_key, features)
+        self._extract_bbands(results, bb_key, features, pos)
 
         # ATR
         atr_key = f"atr_period{self.periods['atr']}"
-        self._set_feature_from_result(results, atr_key, 'atr_14', features)
+        self._set_feature_from_result(results, atr_key, 'atr_14', features, pos)
 
         # CHOP (Choppiness Index)
         chop_key = f"chop_period{self.periods['chop']}"
-        self._set_feature_from_result(results, chop_key, 'chop', features)
+        self._set_feature_from_result(results, chop_key, 'chop', features, pos)
 
         # Ichimoku Cloud (multi-column result)
         ichimoku_key = (
@@ -355,7 +431,7 @@ class FeatureEngine:
             f"senkou{self.periods['ichimoku_senkou']}_"
             f"tenkan{self.periods['ichimoku_tenkan']}"
         )
-        self._extract_ichimoku(results, ichimoku_key, features)
+        self._extract_ichimoku(results, ichimoku_key, features, pos)
 
         return features
 
@@ -365,59 +441,63 @@ class FeatureEngine:
         key: str,
         feature_name: str,
         features: dict[str, float | None],
+        pos: int = -1,
     ) -> None:
         if key in results:
-            features[feature_name] = self._get_last_value(results[key].values)
+            features[feature_name] = self._get_last_value(results[key].values, pos)
 
     def _extract_macd(
         self,
         results: dict[str, IndicatorResult],
         key: str,
         features: dict[str, float | None],
+        pos: int = -1,
     ) -> None:
         if key not in results:
             return
         macd_result = results[key].values
         if isinstance(macd_result, pd.DataFrame) or isinstance(macd_result, dict):
-            features['macd'] = self._get_last_value(macd_result.get('macd'))
-            features['macd_signal'] = self._get_last_value(macd_result.get('signal'))
-            features['macd_hist'] = self._get_last_value(macd_result.get('histogram'))
+            features['macd'] = self._get_last_value(macd_result.get('macd'), pos)
+            features['macd_signal'] = self._get_last_value(macd_result.get('signal'), pos)
+            features['macd_hist'] = self._get_last_value(macd_result.get('histogram'), pos)
 
     def _extract_adx(
         self,
         results: dict[str, IndicatorResult],
         key: str,
         features: dict[str, float | None],
+        pos: int = -1,
     ) -> None:
         if key not in results:
             return
         adx_result = results[key].values
         if isinstance(adx_result, pd.DataFrame) or isinstance(adx_result, dict):
-            features['adx'] = self._get_last_value(adx_result.get('adx'))
+            features['adx'] = self._get_last_value(adx_result.get('adx'), pos)
             features['plus_di'] = self._get_last_value(
-                adx_result.get('plus_di', adx_result.get('+di'))
+                adx_result.get('plus_di', adx_result.get('+di')), pos
             )
             features['minus_di'] = self._get_last_value(
-                adx_result.get('minus_di', adx_result.get('-di'))
+                adx_result.get('minus_di', adx_result.get('-di')), pos
             )
-        elif isinstance(adx_result, pd.Series):
-            features['adx'] = self._get_last_value(adx_result)
+        elif isinstance(adx_result, (pd.Series, np.ndarray)):
+            features['adx'] = self._get_last_value(adx_result, pos)
 
     def _extract_stoch(
         self,
         results: dict[str, IndicatorResult],
         key: str,
         features: dict[str, float | None],
+        pos: int = -1,
     ) -> None:
         if key not in results:
             return
         stoch_result = results[key].values
         if isinstance(stoch_result, pd.DataFrame) or isinstance(stoch_result, dict):
             features['stoch_k'] = self._get_last_value(
-                stoch_result.get('k', stoch_result.get('%k'))
+                stoch_result.get('k', stoch_result.get('%k')), pos
             )
             features['stoch_d'] = self._get_last_value(
-                stoch_result.get('d', stoch_result.get('%d'))
+                stoch_result.get('d', stoch_result.get('%d')), pos
             )
 
     def _extract_bbands(
@@ -425,20 +505,22 @@ class FeatureEngine:
         results: dict[str, IndicatorResult],
         key: str,
         features: dict[str, float | None],
+        pos: int = -1,
     ) -> None:
         if key not in results:
             return
         bb_result = results[key].values
         if isinstance(bb_result, pd.DataFrame) or isinstance(bb_result, dict):
-            features['bb_upper'] = self._get_last_value(bb_result.get('upper'))
-            features['bb_middle'] = self._get_last_value(bb_result.get('middle'))
-            features['bb_lower'] = self._get_last_value(bb_result.get('lower'))
+            features['bb_upper'] = self._get_last_value(bb_result.get('upper'), pos)
+            features['bb_middle'] = self._get_last_value(bb_result.get('middle'), pos)
+            features['bb_lower'] = self._get_last_value(bb_result.get('lower'), pos)
 
     def _extract_ichimoku(
         self,
         results: dict[str, IndicatorResult],
         key: str,
         features: dict[str, float | None],
+        pos: int = -1,
     ) -> None:
         """Extract Ichimoku Cloud indicator values."""
         if key not in results:
@@ -446,33 +528,33 @@ class FeatureEngine:
         ichimoku_result = results[key].values
         if isinstance(ichimoku_result, pd.DataFrame) or isinstance(ichimoku_result, dict):
             features['ichimoku_tenkan'] = self._get_last_value(
-                ichimoku_result.get('tenkan_sen', ichimoku_result.get('tenkan'))
+                ichimoku_result.get('tenkan_sen', ichimoku_result.get('tenkan')), pos
             )
             features['ichimoku_kijun'] = self._get_last_value(
-                ichimoku_result.get('kijun_sen', ichimoku_result.get('kijun'))
+                ichimoku_result.get('kijun_sen', ichimoku_result.get('kijun')), pos
             )
             features['ichimoku_senkou_a'] = self._get_last_value(
-                ichimoku_result.get('senkou_span_a', ichimoku_result.get('senkou_a'))
+                ichimoku_result.get('senkou_span_a', ichimoku_result.get('senkou_a')), pos
             )
             features['ichimoku_senkou_b'] = self._get_last_value(
-                ichimoku_result.get('senkou_span_b', ichimoku_result.get('senkou_b'))
+                ichimoku_result.get('senkou_span_b', ichimoku_result.get('senkou_b')), pos
             )
             features['ichimoku_chikou'] = self._get_last_value(
-                ichimoku_result.get('chikou_span', ichimoku_result.get('chikou'))
+                ichimoku_result.get('chikou_span', ichimoku_result.get('chikou')), pos
             )
 
-    def _get_last_value(self, values) -> float | None:
-        """Safely extract last value from Series, array, or scalar."""
+    def _get_last_value(self, values, pos: int = -1) -> float | None:
+        """Safely extract value at ``pos`` (default: last) from Series, array, or scalar."""
         if values is None:
             return None
 
         try:
             if isinstance(values, pd.Series):
-                val = values.iloc[-1]
+                val = values.iloc[pos]
             elif isinstance(values, (list, tuple)):
-                val = values[-1]
+                val = values[pos]
             elif hasattr(values, '__getitem__'):
-                val = values[-1]
+                val = values[pos]
             else:
                 val = values
 
@@ -485,16 +567,20 @@ class FeatureEngine:
     def _calculate_derived_features(
         self,
         features: dict[str, float | None],
-        data: pd.DataFrame
+        data: pd.DataFrame | dict[str, np.ndarray],
+        pos: int = -1,
     ) -> dict[str, float | None]:
-        """Calculate derived features from base indicators."""
+        """Calculate derived features from base indicators at bar ``pos``."""
         derived: dict[str, float | None] = {}
 
-        close = float(data['close'].iloc[-1])
+        closes = np.asarray(data['close'], dtype=float)
+        volumes = np.asarray(data['volume'], dtype=float)
+        end = len(closes) if pos == -1 else pos + 1
+        close = float(closes[end - 1])
 
         # MA slope (normalized, using last 5 bars)
         if features.get('sma_20') is not None:
-            sma_5_ago = self._get_sma_at_index(data, self.periods['sma_fast'], -5)
+            sma_5_ago = self._get_sma_at_index(closes, self.periods['sma_fast'], end - 5)
             sma_now = features['sma_20']
             if sma_5_ago is not None and sma_now is not None and sma_5_ago != 0:
                 # Percent change over 5 bars, normalized
@@ -509,9 +595,9 @@ class FeatureEngine:
             derived['price_vs_sma20'] = None
 
         # Volume ratio (current vs 20-bar average)
-        if len(data) >= 20:
-            avg_volume = data['volume'].iloc[-20:].mean()
-            current_volume = float(data['volume'].iloc[-1])
+        if end >= 20:
+            avg_volume = np.nanmean(volumes[end - 20:end])
+            current_volume = float(volumes[end - 1])
             if avg_volume > 0:
                 derived['volume_ratio'] = current_volume / avg_volume
             else:
@@ -539,19 +625,14 @@ class FeatureEngine:
 
     def _get_sma_at_index(
         self,
-        data: pd.DataFrame,
+        closes: np.ndarray,
         period: int,
-        index: int
+        end_idx: int
     ) -> float | None:
-        """Calculate SMA at a specific index."""
-        try:
-            end_idx = len(data) + index
-            if end_idx < period:
-                return None
-            start_idx = end_idx - period
-            return float(data['close'].iloc[start_idx:end_idx].mean())
-        except (IndexError, ValueError):
+        """Calculate SMA of the ``period`` closes before ``end_idx`` (exclusive)."""
+        if end_idx < period:
             return None
+        return float(np.nanmean(closes[end_idx - period:end_idx]))
 
     def get_required_bars(self) -> int:
         """Get minimum bars required for feature calculation."""
@@ -10,8 +10,11 @@ Date: 2026-01-28
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
+from .cel.lazy_context import LazyContext
+
 if TYPE_CHECKING:
     from src.core.tradingbot.cel_engine import CELEngine
     from .json_entry_loader import JsonEntryConfig
@@ -60,6 +63,7 @@ class JsonEntryScorer:
         """
         self.config = json_config
         self.cel = cel_engine
+        self._context: LazyContext | None = None  # Context des letzten Bars
 
         # Validate expression (do a test evaluation) if entry is enabled
         if getattr(self.config, "entry_enabled", True):
@@ -229,9 +233,13 @@ class JsonEntryScorer:
         regime: "RegimeState",
         chart_window: Any | None = None,
         prev_regime: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> LazyContext:
         """Baut CEL Context aus Features + Regime + Chart + Prev Regime.
 
+        Der Context ist lazy: Variablen werden erst berechnet, wenn die
+        Expression sie referenziert, und pro Bar (gleiche Features/Regime)
+        zwischen Long- und Short-Evaluation wiederverwendet.
+
         Context-Struktur:
         {
             "side": "long" | "short",
@@ -258,81 +266,14 @@ class JsonEntryScorer:
             prev_regime: Previous/last closed regime string (für last_closed_regime())
 
         Returns:
-            Dict mit CEL Context
+            LazyContext mit CEL Context
         """
-        # Helper: Safe get mit fallback auf None
-        def get_safe(value: Any, default: Any = None) -> Any:
-            return value if value is not None else default
-
-        context = {
-            # Meta
-            "side": side,
-
-            # Price (flat)
-            "close": features.close,
-            "open": get_safe(features.open, features.close),
-            "high": get_safe(features.high, features.close),
-            "low": get_safe(features.low, features.close),
-            "volume": get_safe(features.volume, 0.0),
-
-            # Trend Indicators (flat)
-            "sma_20": get_safe(features.sma_20),
-            "sma_50": get_safe(features.sma_50),
-            "ema_12": get_safe(features.ema_12),
-            "ema_26": get_safe(features.ema_26),
-
-            # Momentum Indicators (flat)
-            "rsi": get_safe(features.rsi_14, 50.0),  # Fallback auf neutral
-            "macd": get_safe(features.macd, 0.0),
-            "macd_signal": get_safe(features.macd_signal, 0.0),
-            "macd_hist": get_safe(features.macd_hist, 0.0),
-            "stoch_k": get_safe(features.stoch_k),
-            "stoch_d": get_safe(features.stoch_d),
-            "cci": get_safe(features.cci),
-            "mfi": get_safe(features.mfi),
-
-            # Momentum Indicators (nested für Kompatibilität mit CEL Docs)
-            "rsi14": {"value": get_safe(features.rsi_14, 50.0)},
-            "adx14": {"value": get_safe(features.adx, 0.0)},
-            "macd_obj": {
-                "value": get_safe(features.macd, 0.0),
-                "signal": get_safe(features.macd_signal, 0.0),
-                "histogram": get_safe(features.macd_hist, 0.0),
-            },
-
-            # Trend Strength (flat)
-            "adx": get_safe(features.adx, 0.0),
-
-            # Volatility (flat)
-            "atr": get_safe(features.atr_14, 0.0),
-            "bb_pct": get_safe(features.bb_pct, 0.5),
-            "bb_width": get_safe(features.bb_width, 0.0),
-            "bb_upper": get_safe(features.bb_upper),
-            "bb_middle": get_safe(features.bb_middle),
-            "bb_lower": get_safe(features.bb_lower),
-            "chop": get_safe(features.chop, 50.0),
-
-            # Volume (flat)
-            "volume_ratio": get_safe(features.volume_ratio, 1.0),
-
-            # Regime (flat + nested)
-            "regime": regime.regime.value,  # "TREND_UP", "RANGE", "TREND_DOWN", etc.
-            "regime_obj": {
-                "regime": regime.regime.value,
-                "confidence": regime.regime_confidence,
-                "strength": getattr(regime, "regime_strength", 0.0),
-                "volatility": regime.volatility.value,
-            },
-
-            # Volatility (flat aus Regime)
-            "volatility": regime.volatility.value,
-
-            # Chart Window Reference (für CEL trigger_regime_analysis())
-            "chart_window": chart_window,
-
-            # Last Closed Candle mit Regime (für CEL last_closed_regime())
-            "last_closed_candle": {"regime": prev_regime} if prev_regime else None,
-        }
+        bar_key = (id(features), id(regime), prev_regime, id(chart_window))
+        context = self._context
+        if context is None or context.bar_key != bar_key:
+            context = self._create_context(bar_key, features, regime, chart_window, prev_regime)
+            self._context = context
+        context.set("side", side)
 
         # Debug: Log context chart_window
         logger.info(f"Context built: chart_window={type(chart_window).__name__ if chart_window else 'None'}")
@@ -353,8 +294,89 @@ class JsonEntryScorer:
 
         return context
 
+    @staticmethod
+    def _create_context(
+        bar_key: tuple,
+        features: "FeatureVector",
+        regime: "RegimeState",
+        chart_window: Any | None,
+        prev_regime: str | None,
+    ) -> LazyContext:
+        """Registriert alle Context-Variablen als lazy Resolver (siehe _build_context)."""
+        # Helper: Safe get mit fallback auf None
+        def get_safe(value: Any, default: Any = None) -> Any:
+            return value if value is not None else default
+
+        def feature(attr: str, default: Any = None):
+            return lambda: get_safe(getattr(features, attr), default)
+
+        context = LazyContext(bar_key=bar_key)
+        define = context.define
+
+        # Price (flat)
+        define("close", lambda: features.close)
+        define("open", feature("open", features.close))
+        define("high", feature("high", features.close))
+        define("low", feature("low", features.close))
+        define("volume", feature("volume", 0.0))
+
+        # Trend Indicators (flat)
+        for name in ("sma_20", "sma_50", "ema_12", "ema_26"):
+            define(name, feature(name))
+
+        # Momentum Indicators (flat)
+        define("rsi", feature("rsi_14", 50.0))  # Fallback auf neutral
+        define("macd", feature("macd", 0.0))
+        define("macd_signal", feature("macd_signal", 0.0))
+        define("macd_hist", feature("macd_hist", 0.0))
+        for name in ("stoch_k", "stoch_d", "cci", "mfi"):
+            define(name, feature(name))
+
+        # Momentum Indicators (nested für Kompatibilität mit CEL Docs)
+        define("rsi14", lambda: {"value": get_safe(features.rsi_14, 50.0)})
+        define("adx14", lambda: {"value": get_safe(features.adx, 0.0)})
+        define("macd_obj", lambda: {
+            "value": get_safe(features.macd, 0.0),
+            "signal": get_safe(features.macd_signal, 0.0),
+            "histogram": get_safe(features.macd_hist, 0.0),
+        })
+
+        # Trend Strength (flat)
+        define("adx", feature("adx", 0.0))
+
+        # Volatility (flat)
+        define("atr", feature("atr_14", 0.0))
+        define("bb_pct", feature("bb_pct", 0.5))
+        define("bb_width", feature("bb_width", 0.0))
+        for name in ("bb_upper", "bb_middle", "bb_lower"):
+            define(name, feature(name))
+        define("chop", feature("chop", 50.0))
+
+        # Volume (flat)
+        define("volume_ratio", feature("volume_ratio", 1.0))
+
+        # Regime (flat + nested)
+        define("regime", lambda: regime.regime.value)  # "TREND_UP", "RANGE", etc.
+        define("regime_obj", lambda: {
+            "regime": regime.regime.value,
+            "confidence": regime.regime_confidence,
+            "strength": getattr(regime, "regime_strength", 0.0),
+            "volatility": regime.volatility.value,
+        })
+
+        # Volatility (flat aus Regime)
+        define("volatility", lambda: regime.volatility.value)
+
+        # Chart Window Reference (für CEL trigger_regime_analysis())
+        context.set("chart_window", chart_window)
+
+        # Last Closed Candle mit Regime (für CEL last_closed_regime())
+        context.set("last_closed_candle", {"regime": prev_regime} if prev_regime else None)
+
+        return context
+
     def _generate_reasons(
-        self, should_enter: bool, side: str, context: dict
+        self, should_enter: bool, side: str, context: Mapping[str, Any]
     ) -> list[str]:
         """Generiere Reason-Codes basierend auf Context.
 
@@ -0,0 +1,860 @@
+"""Portfolio Features - One market data and feature pipeline for many symbols.
+
+TradingBotEngine/BotController are built around a single symbol: watching
+30 perpetuals means 30 engines, each with its own indicator engine,
+context cache and copy of the chart data. This module shares the market
+data and feature work between symbols:
+
+- PortfolioBarStore: Columnar symbols × bars matrices on a common time
+  axis (one ring buffer for all symbols, zero-copy views)
+- BatchFeatureState: Recursive indicators (EMA, Wilder RSI/ATR) advanced
+  for all symbols at once with vectorized operations per closed bar
+- PortfolioStateMachines: Per-symbol FLAT → SIGNAL → MANAGE → EXITED
+  (plus PAUSED) state kept in arrays; transitions are masks over all
+  symbols computed from the batched features
+- PortfolioFeatureFeed: One MARKET_BAR subscription, batched feature and
+  state step on every portfolio bar close, result handed to a callback
+
+BotControllers attached to a feed (``attach_portfolio_feed()``) share its
+pause/resume state and only run their full pipeline (FeatureEngine,
+regime, strategy selection, CEL rules) for symbols the state machines
+flag or that hold a position; Python code per bar is O(active symbols).
+
+Example:
+    >>> feed = PortfolioFeatureFeed(["BTCUSDT", "ETHUSDT"], on_bar_close=log_decisions)
+    >>> feed.load_history({"BTCUSDT": btc_df, "ETHUSDT": eth_df})
+    >>> feed.attach(event_bus)  # Single MARKET_BAR subscription
+    >>> controller.attach_portfolio_feed(feed)
+    >>> feed.slot("BTCUSDT").state
+    <BotState.FLAT: 'flat'>
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .models import BotAction, BotDecision, RegimeType, TradeSide
+from .state_machine import BotState
+from .timeframe_data_manager import OHLCV_COLUMNS
+
+if TYPE_CHECKING:
+    from src.common.event_bus import Event, EventBus
+
+logger = logging.getLogger(__name__)
+
+_OPEN, _HIGH, _LOW, _CLOSE, _VOLUME = range(len(OHLCV_COLUMNS))
+
+# Array codes of the per-symbol states (subset of BotState)
+_FLAT, _SIGNAL, _MANAGE, _EXITED, _PAUSED = range(5)
+_STATE_CODES = (BotState.FLAT, BotState.SIGNAL, BotState.MANAGE, BotState.EXITED, BotState.PAUSED)
+
+_BULL, _BEAR, _SIDEWAYS, _UNKNOWN = range(4)
+_REGIME_CODES = (RegimeType.BULL, RegimeType.BEAR, RegimeType.SIDEWAYS, RegimeType.UNKNOWN)
+
+
+def _to_ns(timestamp: Any) -> int:
+    """UTC epoch nanoseconds of a datetime/ISO string/epoch value."""
+    if isinstance(timestamp, (int, np.integer)) and not isinstance(timestamp, bool):
+        # Epoch seconds/milliseconds/nanoseconds
+        value = int(timestamp)
+        if value < 10**11:
+            return value * 10**9
+        if value < 10**14:
+            return value * 10**6
+        return value
+    ts = pd.Timestamp(timestamp)
+    if ts.tz is not None:
+        ts = ts.tz_convert("UTC")
+    return ts.value
+
+
+class PortfolioBarStore:
+    """Columnar OHLCV store for many symbols on a common time axis.
+
+    Bars are stored field-major in one ``(5, symbols, 2 * maxlen)`` array.
+    Like TimeframeBarBuffer, columns are written at the tail and the live
+    window is moved back to the front once the tail reaches the end, so the
+    last N bars of all symbols are a contiguous ``(symbols, N)`` view.
+
+    A new column opens when the first bar of a newer timestamp arrives for
+    any symbol; the previous column is closed at that point. Symbols that
+    have not printed a bar for the new timestamp yet are forward-filled
+    from their last close (volume 0) until their update arrives. Updates
+    for older columns still in the window are written in place.
+
+    Views are only stable until the next column opens or a symbol is added.
+    """
+
+    def __init__(self, symbols: Iterable[str] = (), maxlen: int = 500):
+        self.maxlen = max(2, int(maxlen))
+        self._capacity = self.maxlen * 2
+        self._symbols: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._timestamps = np.zeros(self._capacity, dtype=np.int64)
+        self._ohlcv = np.full((len(OHLCV_COLUMNS), 0, self._capacity), np.nan)
+        self._fresh = np.zeros((0, self._capacity), dtype=bool)
+        self._start = 0
+        self._end = 0
+        self.version = 0  # Incremented on every mutation (cache key)
+        self.late_updates = 0  # Updates older than the window (dropped)
+
+        for symbol in symbols:
+            self.add_symbol(symbol)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._symbols)
+
+    @property
+    def n_symbols(self) -> int:
+        return len(self._symbols)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the bar arrays."""
+        return self._timestamps.nbytes + self._ohlcv.nbytes + self._fresh.nbytes
+
+    def row(self, symbol: str) -> int | None:
+        """Matrix row of ``symbol`` (None if unknown)."""
+        return self._rows.get(symbol)
+
+    def add_symbol(self, symbol: str) -> int:
+        """Register a symbol and return its row (existing symbols keep theirs)."""
+        row = self._rows.get(symbol)
+        if row is not None:
+            return row
+        row = len(self._symbols)
+        if row == self._ohlcv.shape[1]:
+            # Grow row allocation geometrically (amortized O(1) per symbol)
+            rows = max(4, row * 2)
+            ohlcv = np.full((len(OHLCV_COLUMNS), rows, self._capacity), np.nan)
+            ohlcv[:, :row] = self._ohlcv
+            fresh = np.zeros((rows, self._capacity), dtype=bool)
+            fresh[:row] = self._fresh
+            self._ohlcv, self._fresh = ohlcv, fresh
+        self._symbols.append(symbol)
+        self._rows[symbol] = row
+        self.version += 1
+        return row
+
+    # --- Updates ---
+
+    def update(
+        self,
+        symbol: str,
+        timestamp_ns: int,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> bool:
+        """Write a (complete or forming) bar of ``symbol``.
+
+        Returns:
+            True if the bar opened a new column, i.e. closed the previous one.
+        """
+        row = self.add_symbol(symbol)
+        opened = False
+        if self._end == self._start or timestamp_ns > self._timestamps[self._end - 1]:
+            self._open_column(timestamp_ns)
+            col = self._end - 1
+            opened = True
+        else:
+            live = self._timestamps[self._start:self._end]
+            pos = int(np.searchsorted(live, timestamp_ns))
+            if pos == len(live) or live[pos] != timestamp_ns:
+                self.late_updates += 1
+                return False
+            col = self._start + pos
+
+        bar = self._ohlcv[:, row, col]
+        bar[_OPEN], bar[_HIGH], bar[_LOW], bar[_CLOSE], bar[_VOLUME] = (
+            open_, high, low, close, volume,
+        )
+        self._fresh[row, col] = True
+        self.version += 1
+        return opened
+
+    def _open_column(self, timestamp_ns: int) -> None:
+        """Append a column, forward-filled from the previous close."""
+        if self._end == self._capacity:
+            self._compact()
+        col = self._end
+        n = self.n_symbols
+        self._timestamps[col] = timestamp_ns
+        if self._end > self._start:
+            prev_close = self._ohlcv[_CLOSE, :n, col - 1]
+            self._ohlcv[_OPEN:_VOLUME, :n, col] = prev_close
+            self._ohlcv[_VOLUME, :n, col] = 0.0
+        else:
+            self._ohlcv[:, :n, col] = np.nan
+        self._fresh[:n, col] = False
+        self._end += 1
+        if self._end - self._start > self.maxlen:
+            self._start += 1
+
+    def _compact(self) -> None:
+        """Move the live window back to the front of the arrays."""
+        size = len(self)
+        self._timestamps[:size] = self._timestamps[self._start:self._end]
+        self._ohlcv[:, :, :size] = self._ohlcv[:, :, self._start:self._end]
+        self._fresh[:, :size] = self._fresh[:, self._start:self._end]
+        self._start = 0
+        self._end = size
+
+    def load(self, frames: Mapping[str, pd.DataFrame]) -> int:
+        """Replace the window with historical OHLCV frames (one per symbol).
+
+        Frames are aligned on the union of their timestamps (last ``maxlen``
+        bars); gaps are forward-filled like live updates.
+
+        Returns:
+            Number of columns loaded.
+        """
+        for symbol in frames:
+            self.add_symbol(symbol)
+        indexes = [_utc_index(df) for df in frames.values() if len(df)]
+        if not indexes:
+            return 0
+        axis = indexes[0]
+        for index in indexes[1:]:
+            axis = axis.union(index)
+        axis = axis[-self.maxlen:]
+        size = len(axis)
+
+        self._start, self._end = 0, size
+        self._timestamps[:size] = axis.asi8
+        self._ohlcv[:, :, :size] = np.nan
+        self._fresh[:, :size] = False
+        for symbol, df in frames.items():
+            if not len(df):
+                continue
+            row = self._rows[symbol]
+            data = df[OHLCV_COLUMNS].set_axis(_utc_index(df))
+            data = data[~data.index.duplicated(keep="last")].reindex(axis)
+            present = data["close"].notna().to_numpy()
+            close = data["close"].ffill()
+            for name in ("open", "high", "low"):
+                data[name] = data[name].fillna(close)
+            data["close"] = close
+            data["volume"] = data["volume"].fillna(0.0)
+            self._ohlcv[:, row, :size] = data.to_numpy(dtype=np.float64).T
+            self._fresh[row, :size] = present
+        self.version += 1
+        return size
+
+    # --- Views ---
+
+    def _slice(self, n: int | None, closed: bool) -> slice:
+        end = self._end - 1 if closed and self._end > self._start else self._end
+        start = self._start if n is None else max(self._start, end - max(n, 0))
+        return slice(start, end)
+
+    def timestamp_view(self, n: int | None = None, closed: bool = False) -> np.ndarray:
+        """Zero-copy view of the last N column timestamps (UTC epoch ns)."""
+        return self._timestamps[self._slice(n, closed)]
+
+    def matrix(self, name: str, n: int | None = None, closed: bool = False) -> np.ndarray:
+        """Zero-copy ``(symbols, N)`` view of one OHLCV field.
+
+        Args:
+            name: open/high/low/close/volume
+            n: Last N bars (None = whole window)
+            closed: Exclude the newest (still forming) column
+        """
+        field = OHLCV_COLUMNS.index(name)
+        return self._ohlcv[field, : self.n_symbols, self._slice(n, closed)]
+
+    def column(self, offset: int = -1) -> np.ndarray:
+        """``(5, symbols)`` bars of one column (-1 = newest, -2 = last closed)."""
+        return self._ohlcv[:, : self.n_symbols, self._end + offset]
+
+    def fresh(self, offset: int = -1) -> np.ndarray:
+        """Symbols that printed a bar in a column (not forward-filled)."""
+        return self._fresh[: self.n_symbols, self._end + offset]
+
+    def to_dataframe(self, symbol: str, n: int | None = None) -> pd.DataFrame:
+        """DataFrame of one symbol (copy; for the single-symbol pipeline)."""
+        row = self._rows[symbol]
+        window = self._slice(n, closed=False)
+        index = pd.DatetimeIndex(
+            self._timestamps[window].view("M8[ns]"), name="timestamp"
+        ).tz_localize("UTC")
+        return pd.DataFrame(self._ohlcv[:, row, window].T, index=index, columns=OHLCV_COLUMNS)
+
+
+def _utc_index(df: pd.DataFrame) -> pd.DatetimeIndex:
+    """UTC DatetimeIndex from the frame index or its ``timestamp`` column."""
+    source = df.index if isinstance(df.index, pd.DatetimeIndex) else df["timestamp"]
+    index = pd.DatetimeIndex(pd.to_datetime(source, utc=True))
+    return index.as_unit("ns") if hasattr(index, "as_unit") else index
+
+
+@dataclass
+class PortfolioFeatureConfig:
+    """Parameters of the shared feature pipeline and the per-symbol state rules."""
+
+    maxlen: int = 500
+    ema_fast: int = 20
+    ema_slow: int = 50
+    rsi_period: int = 14
+    atr_period: int = 14
+    bb_period: int = 20
+
+    # Regime: EMA spread measured in ATRs
+    trend_threshold: float = 0.5
+
+    # Entry filters
+    rsi_long_range: tuple[float, float] = (50.0, 70.0)
+    rsi_short_range: tuple[float, float] = (30.0, 50.0)
+    confirm_bars: int = 1  # Bars a candidate must persist before entering
+
+    # Stops
+    stop_atr_mult: float = 2.0
+    trailing: bool = True
+
+    @property
+    def warmup_bars(self) -> int:
+        return max(self.ema_slow, self.rsi_period + 1, self.atr_period + 1, self.bb_period)
+
+
+class BatchFeatureState:
+    """Recursive indicators for all symbols, advanced one column at a time.
+
+    Every array has one entry per symbol. RSI and ATR use a running mean
+    for the first ``period`` bars and Wilder smoothing afterwards; symbols
+    without data stay NaN and are seeded by their first close.
+    """
+
+    def __init__(self, config: PortfolioFeatureConfig):
+        self.config = config
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop the state of all symbols."""
+        self.size = 0
+        self.close = np.empty(0)
+        self.ema_fast = np.empty(0)
+        self.ema_slow = np.empty(0)
+        self.avg_gain = np.empty(0)
+        self.avg_loss = np.empty(0)
+        self.atr = np.empty(0)
+        self.bars = np.empty(0, dtype=np.int64)
+
+    def resize(self, n_symbols: int) -> None:
+        """Add state rows for newly registered symbols."""
+        add = n_symbols - self.size
+        if add <= 0:
+            return
+        for name in ("close", "ema_fast", "ema_slow", "atr"):
+            setattr(self, name, np.concatenate([getattr(self, name), np.full(add, np.nan)]))
+        for name in ("avg_gain", "avg_loss"):
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(add)]))
+        self.bars = np.concatenate([self.bars, np.zeros(add, dtype=np.int64)])
+        self.size = n_symbols
+
+    def rebuild(self, store: PortfolioBarStore) -> None:
+        """Recompute the state from all closed columns of ``store``."""
+        self.reset()
+        self.resize(store.n_symbols)
+        high = store.matrix("high", closed=True)
+        low = store.matrix("low", closed=True)
+        close = store.matrix("close", closed=True)
+        for col in range(close.shape[1]):
+            self._advance(high[:, col], low[:, col], close[:, col])
+
+    def step(self, bars: np.ndarray) -> None:
+        """Advance by one closed ``(5, symbols)`` column."""
+        self.resize(bars.shape[1])
+        self._advance(bars[_HIGH], bars[_LOW], bars[_CLOSE])
+
+    def _advance(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        cfg = self.config
+        prev = self.close
+        has_bar = ~np.isnan(close)
+        has_prev = has_bar & ~np.isnan(prev)
+
+        for name, period in (("ema_fast", cfg.ema_fast), ("ema_slow", cfg.ema_slow)):
+            ema = getattr(self, name)
+            alpha = 2.0 / (period + 1.0)
+            seeded = np.where(np.isnan(ema), close, ema + alpha * (close - ema))
+            setattr(self, name, np.where(has_bar, seeded, ema))
+
+        # Running mean over the first `period` changes, Wilder afterwards
+        n = self.bars + 1
+        change = np.where(has_prev, close - prev, 0.0)
+        k = np.minimum(n - 1, cfg.rsi_period).clip(min=1)
+        self.avg_gain = np.where(
+            has_prev, self.avg_gain + (np.maximum(change, 0.0) - self.avg_gain) / k, self.avg_gain
+        )
+        self.avg_loss = np.where(
+            has_prev, self.avg_loss + (np.maximum(-change, 0.0) - self.avg_loss) / k, self.avg_loss
+        )
+
+        prev_close = np.where(has_prev, prev, close)
+        tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+        k = np.minimum(n, cfg.atr_period)
+        atr = np.where(np.isnan(self.atr), tr, self.atr + (tr - np.nan_to_num(self.atr)) / k)
+        self.atr = np.where(has_bar, atr, self.atr)
+
+        self.bars = np.where(has_bar, n, self.bars)
+        self.close = np.where(has_bar, close, prev)
+
+    @property
+    def rsi(self) -> np.ndarray:
+        total = self.avg_gain + self.avg_loss
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100.0 * self.avg_gain / total
+        return np.where(total > 0, rsi, 50.0)
+
+    def snapshot(self, store: PortfolioBarStore) -> dict[str, np.ndarray]:
+        """Current features of all symbols (one value per symbol).
+
+        Window features (Bollinger width, return) are computed over the
+        trailing ``bb_period`` closed bars of the store matrix.
+        """
+        cfg = self.config
+        window = store.matrix("close", n=cfg.bb_period, closed=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if window.shape[1]:
+                mean = window.mean(axis=1)
+                bb_width = 4.0 * window.std(axis=1) / mean
+                ret = window[:, -1] / window[:, 0] - 1.0
+            else:
+                bb_width = ret = np.full(self.size, np.nan)
+            atr_pct = self.atr / self.close
+            trend = (self.ema_fast - self.ema_slow) / self.atr
+        return {
+            "close": self.close,
+            "ema_fast": self.ema_fast,
+            "ema_slow": self.ema_slow,
+            "rsi": self.rsi,
+            "atr": self.atr,
+            "atr_pct": atr_pct,
+            "trend": trend,
+            "bb_width": bb_width,
+            "return": ret,
+            "ready": self.bars >= cfg.warmup_bars,
+        }
+
+
+@dataclass(frozen=True)
+class SymbolSlot:
+    """Read-only view of one symbol's state in the state machines."""
+
+    symbol: str
+    state: BotState
+    side: TradeSide
+    entry_price: float | None
+    stop_price: float | None
+    regime: RegimeType
+
+
+class PortfolioStateMachines:
+    """Per-symbol bot state of many symbols, kept in arrays.
+
+    FLAT → SIGNAL (candidate) → MANAGE (after ``confirm_bars``) → EXITED
+    (stop hit or regime flip) → FLAT, plus PAUSED. ``step()`` computes the
+    transitions of all symbols as masks from one batched feature snapshot;
+    BotDecisions are only built for the rows that changed. Entries are
+    assumed filled at the signal bar's close, the consumer reports a
+    position it did not open via ``reject()``.
+    """
+
+    def __init__(self, config: PortfolioFeatureConfig):
+        self.config = config
+        self.state = np.zeros(0, dtype=np.int8)
+        self.side = np.zeros(0, dtype=np.int8)
+        self.signal_bars = np.zeros(0, dtype=np.int64)
+        self.entry = np.empty(0)
+        self.stop = np.empty(0)
+        self.regime = np.zeros(0, dtype=np.int8)
+
+    def resize(self, n_symbols: int) -> None:
+        """Add FLAT rows for newly registered symbols."""
+        add = n_symbols - len(self.state)
+        if add <= 0:
+            return
+        self.state = np.concatenate([self.state, np.zeros(add, dtype=np.int8)])
+        self.side = np.concatenate([self.side, np.zeros(add, dtype=np.int8)])
+        self.signal_bars = np.concatenate([self.signal_bars, np.zeros(add, dtype=np.int64)])
+        self.entry = np.concatenate([self.entry, np.full(add, np.nan)])
+        self.stop = np.concatenate([self.stop, np.full(add, np.nan)])
+        self.regime = np.concatenate([self.regime, np.full(add, _UNKNOWN, dtype=np.int8)])
+
+    def slot(self, row: int, symbol: str) -> SymbolSlot:
+        side = int(self.side[row])
+        return SymbolSlot(
+            symbol=symbol,
+            state=_STATE_CODES[self.state[row]],
+            side=TradeSide.LONG if side > 0 else TradeSide.SHORT if side < 0 else TradeSide.NONE,
+            entry_price=_opt(self.entry[row]),
+            stop_price=_opt(self.stop[row]),
+            regime=_REGIME_CODES[self.regime[row]],
+        )
+
+    def pause(self, row: int) -> None:
+        """No new entries for the row; a managed position keeps its exits."""
+        if self.state[row] in (_FLAT, _SIGNAL, _EXITED):
+            self.state[row] = _PAUSED
+            self.side[row] = 0
+
+    def resume(self, row: int) -> None:
+        if self.state[row] == _PAUSED:
+            self.state[row] = _FLAT
+
+    def reject(self, row: int) -> None:
+        """The consumer did not open/keep the position: back to FLAT."""
+        if self.state[row] == _MANAGE:
+            self.state[row] = _FLAT
+            self.side[row] = 0
+            self.entry[row] = self.stop[row] = np.nan
+
+    def counts(self) -> dict[str, int]:
+        counts = np.bincount(self.state, minlength=len(_STATE_CODES))
+        return {s.value: int(c) for s, c in zip(_STATE_CODES, counts)}
+
+    def step(
+        self,
+        bars: np.ndarray,
+        feats: dict[str, np.ndarray],
+        timestamp: datetime,
+        symbols: list[str],
+    ) -> list[BotDecision]:
+        """Transitions of all symbols for one closed ``(5, symbols)`` column."""
+        cfg = self.config
+        self.resize(bars.shape[1])
+        close, high, low = bars[_CLOSE], bars[_HIGH], bars[_LOW]
+        ready = feats["ready"] & ~np.isnan(close)
+        trend = np.nan_to_num(feats["trend"])
+        regime = np.full(len(close), _SIDEWAYS, dtype=np.int8)
+        regime[trend >= cfg.trend_threshold] = _BULL
+        regime[trend <= -cfg.trend_threshold] = _BEAR
+        regime[~ready] = _UNKNOWN
+        self.regime = regime
+
+        rsi = feats["rsi"]
+        direction = np.zeros(len(close), dtype=np.int8)
+        lo, hi = cfg.rsi_long_range
+        direction[ready & (regime == _BULL) & (rsi > lo) & (rsi < hi) & (close > feats["ema_fast"])] = 1
+        lo, hi = cfg.rsi_short_range
+        direction[ready & (regime == _BEAR) & (rsi > lo) & (rsi < hi) & (close < feats["ema_fast"])] = -1
+
+        state, side = self.state, self.side
+        stop_before = self.stop.copy()
+
+        # Exits: stop hit inside the bar or regime flipped against the position
+        in_pos = state == _MANAGE
+        long_pos, short_pos = in_pos & (side > 0), in_pos & (side < 0)
+        stop_hit = (long_pos & (low <= self.stop)) | (short_pos & (high >= self.stop))
+        flipped = ~stop_hit & ((long_pos & (regime == _BEAR)) | (short_pos & (regime == _BULL)))
+        exits = stop_hit | flipped
+
+        # Trailing stop (ratchets only in the trade direction)
+        trailed = np.zeros(len(close), dtype=bool)
+        if cfg.trailing:
+            trail = close - side * cfg.stop_atr_mult * feats["atr"]
+            trailed = (in_pos & ~exits) & (
+                ((side > 0) & (trail > self.stop)) | ((side < 0) & (trail < self.stop))
+            )
+            self.stop = np.where(trailed, trail, self.stop)
+
+        state[state == _EXITED] = _FLAT
+        exit_price = np.where(stop_hit, self.stop, close)
+        state[exits] = _EXITED
+
+        # Signals: candidates from FLAT, confirmation/expiry in SIGNAL
+        pending = state == _SIGNAL
+        expired = pending & (direction != side)
+        state[expired] = _FLAT
+        self.signal_bars[pending & ~expired] += 1
+
+        candidates = (state == _FLAT) & (direction != 0) & ~exits
+        state[candidates] = _SIGNAL
+        side[candidates] = direction[candidates]
+        self.signal_bars[candidates] = 1
+
+        entries = (state == _SIGNAL) & (self.signal_bars > cfg.confirm_bars)
+        state[entries] = _MANAGE
+        self.entry = np.where(entries, close, self.entry)
+        self.stop = np.where(entries, close - side * cfg.stop_atr_mult * feats["atr"], self.stop)
+        side[exits | expired] = 0
+
+        decisions = self._build_decisions(
+            feats, timestamp, symbols, entries, exits, stop_hit, trailed, exit_price, stop_before
+        )
+        self.entry = np.where(exits, np.nan, self.entry)
+        self.stop = np.where(exits, np.nan, self.stop)
+        return decisions
+
+    def _build_decisions(
+        self,
+        feats: dict[str, np.ndarray],
+        timestamp: datetime,
+        symbols: list[str],
+        entries: np.ndarray,
+        exits: np.ndarray,
+        stop_hit: np.ndarray,
+        trailed: np.ndarray,
+        exit_price: np.ndarray,
+        stop_before: np.ndarray,
+    ) -> list[BotDecision]:
+        """BotDecisions for the rows that changed (Python work is O(changes))."""
+        decisions = []
+        for row in np.flatnonzero(entries | exits | trailed):
+            row = int(row)
+            if entries[row]:
+                action = BotAction.ENTER
+                side = TradeSide.LONG if self.side[row] > 0 else TradeSide.SHORT
+                reasons = ["portfolio_entry", f"trend={feats['trend'][row]:.2f}"]
+                notes = f"entry @ {self.entry[row]:.6g}"
+            elif exits[row]:
+                action = BotAction.EXIT
+                side = TradeSide.NONE
+                reasons = ["stop_hit" if stop_hit[row] else "regime_flip"]
+                notes = f"exit @ {exit_price[row]:.6g}"
+            else:
+                action = BotAction.ADJUST_STOP
+                side = TradeSide.LONG if self.side[row] > 0 else TradeSide.SHORT
+                reasons = ["trailing_stop"]
+                notes = ""
+            decisions.append(BotDecision(
+                timestamp=timestamp,
+                symbol=symbols[row],
+                action=action,
+                side=side,
+                features_hash=_features_hash(feats, row),
+                regime=_REGIME_CODES[self.regime[row]],
+                strategy_name="portfolio_trend",
+                stop_price_before=_opt(stop_before[row]),
+                stop_price_after=_opt(self.stop[row]),
+                reason_codes=reasons,
+                notes=notes,
+            ))
+        return decisions
+
+
+@dataclass(frozen=True)
+class PortfolioBarClose:
+    """Closed portfolio column with the features and state changes of all symbols."""
+
+    timestamp: datetime
+    symbols: list[str]
+    bars: np.ndarray  # (5, symbols) OHLCV of the closed column
+    features: dict[str, np.ndarray]  # One value per symbol (see snapshot())
+    decisions: list[BotDecision]  # Entries/exits/stop moves of the changed symbols
+
+
+class PortfolioFeatureFeed:
+    """Shared bar store, features and state machines fed by one MARKET_BAR subscription.
+
+    Every time a bar opens a new portfolio column, the previous column is
+    closed, the features and states of all symbols are advanced in one
+    vectorized step and ``on_bar_close`` receives a PortfolioBarClose.
+    """
+
+    def __init__(
+        self,
+        symbols: Iterable[str] = (),
+        config: PortfolioFeatureConfig | None = None,
+        on_bar_close: Callable[[PortfolioBarClose], None] | None = None,
+    ):
+        self.config = config or PortfolioFeatureConfig()
+        self.on_bar_close = on_bar_close
+        self.store = PortfolioBarStore(maxlen=self.config.maxlen)
+        self.features = BatchFeatureState(self.config)
+        self.states = PortfolioStateMachines(self.config)
+
+        self._event_bus: EventBus | None = None
+        self._lock = Lock()
+
+        # Stats
+        self.bar_closes = 0
+        self.decisions_emitted = 0
+        self.last_step_ms: float | None = None
+
+        for symbol in symbols:
+            self.add_symbol(symbol)
+
+    # --- Symbols ---
+
+    @property
+    def symbols(self) -> list[str]:
+        return self.store.symbols
+
+    def add_symbol(self, symbol: str) -> None:
+        """Start watching ``symbol`` (no-op if already watched)."""
+        with self._lock:
+            self._add_symbol(symbol)
+
+    def _add_symbol(self, symbol: str) -> int:
+        row = self.store.add_symbol(symbol)
+        self.features.resize(self.store.n_symbols)
+        self.states.resize(self.store.n_symbols)
+        return row
+
+    def _row(self, symbol: str) -> int:
+        row = self.store.row(symbol)
+        if row is None:
+            raise KeyError(symbol)
+        return row
+
+    # --- Per-symbol state ---
+
+    def slot(self, symbol: str) -> SymbolSlot:
+        """Current state of one symbol (as of the last closed column)."""
+        with self._lock:
+            return self.states.slot(self._row(symbol), symbol)
+
+    def pause(self, symbol: str) -> None:
+        """Stop entering new trades for ``symbol`` (a managed position keeps its exits)."""
+        with self._lock:
+            self.states.pause(self._row(symbol))
+
+    def resume(self, symbol: str) -> None:
+        with self._lock:
+            self.states.resume(self._row(symbol))
+
+    def reject(self, symbol: str) -> None:
+        """The consumer did not open/keep the position of ``symbol``: back to FLAT."""
+        with self._lock:
+            self.states.reject(self._row(symbol))
+
+    # --- Market data ---
+
+    def load_history(self, frames: Mapping[str, pd.DataFrame]) -> None:
+        """Warm up store and features from historical OHLCV frames."""
+        with self._lock:
+            for symbol in frames:
+                self._add_symbol(symbol)
+            self.store.load(frames)
+            self.features.rebuild(self.store)
+
+    def attach(self, event_bus: "EventBus") -> None:
+        """Subscribe once to MARKET_BAR for all symbols."""
+        from src.common.event_bus import EventType
+
+        self.detach()
+        event_bus.subscribe(EventType.MARKET_BAR, self._on_market_bar)
+        self._event_bus = event_bus
+
+    def detach(self) -> None:
+        if self._event_bus is None:
+            return
+        from src.common.event_bus import EventType
+
+        self._event_bus.unsubscribe(EventType.MARKET_BAR, self._on_market_bar)
+        self._event_bus = None
+
+    def _on_market_bar(self, event: "Event") -> None:
+        data = event.data or {}
+        symbol = data.get("symbol")
+        if symbol is None or self.store.row(symbol) is None:
+            return
+        bar = data.get("bar") or data
+        try:
+            self.on_bar(
+                symbol,
+                bar.get("timestamp") or event.timestamp,
+                float(bar["open"]),
+                float(bar["high"]),
+                float(bar["low"]),
+                float(bar["close"]),
+                float(bar.get("volume") or 0.0),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed MARKET_BAR for {symbol}: {e}")
+
+    def on_bar(
+        self,
+        symbol: str,
+        timestamp: datetime | str | int,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float = 0.0,
+    ) -> PortfolioBarClose | None:
+        """Feed a (forming or complete) bar of one symbol.
+
+        When the bar opens a new portfolio column, the previous column is
+        closed and the features of all symbols are advanced at once.
+
+        Returns:
+            The closed column (None if no column was closed).
+        """
+        with self._lock:
+            self._add_symbol(symbol)
+            opened = self.store.update(symbol, _to_ns(timestamp), open_, high, low, close, volume)
+            closed = self._on_bar_close() if opened and len(self.store) >= 2 else None
+
+        if closed is not None and self.on_bar_close is not None:
+            try:
+                self.on_bar_close(closed)
+            except Exception as e:
+                logger.error(f"Bar close handler failed: {e}")
+        return closed
+
+    def _on_bar_close(self) -> PortfolioBarClose:
+        """Batched feature and state step for the closed column."""
+        started = time.perf_counter()
+        bars = self.store.column(-2).copy()
+        self.features.step(bars)
+        feats = {name: np.array(values) for name, values in self.features.snapshot(self.store).items()}
+        timestamp = pd.Timestamp(int(self.store.timestamp_view()[-2]), tz="UTC").to_pydatetime()
+        decisions = self.states.step(bars, feats, timestamp, self.store.symbols)
+
+        self.bar_closes += 1
+        self.decisions_emitted += len(decisions)
+        self.last_step_ms = (time.perf_counter() - started) * 1000
+        return PortfolioBarClose(timestamp, self.store.symbols, bars, feats, decisions)
+
+    # --- Features ---
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Current features per symbol (for consumers outside the bar close)."""
+        with self._lock:
+            feats = self.features.snapshot(self.store)
+            return {
+                symbol: {name: _scalar(values[row]) for name, values in feats.items()}
+                for row, symbol in enumerate(self.store.symbols)
+            }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Feed statistics (store size, step latency, state counts)."""
+        return {
+            "symbols": self.store.n_symbols,
+            "bars": len(self.store),
+            "store_bytes": self.store.nbytes,
+            "bar_closes": self.bar_closes,
+            "decisions": self.decisions_emitted,
+            "last_step_ms": self.last_step_ms,
+            "late_updates": self.store.late_updates,
+            "states": self.states.counts(),
+        }
+
+
+def _scalar(value: Any) -> Any:
+    return bool(value) if isinstance(value, np.bool_) else float(value)
+
+
+def _opt(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+def _features_hash(feats: dict[str, np.ndarray], row: int) -> str:
+    payload = ",".join(f"{k}={float(v[row]):.8g}" for k, v in sorted(feats.items()))
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
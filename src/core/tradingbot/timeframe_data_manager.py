@@ -8,6 +8,7 @@ Key Features:
 - Automatic data alignment and synchronization
 - Bar resampling from lower to higher timeframes
 - Efficient caching to minimize recomputation
+- Array-backed ring buffers with zero-copy DataFrame/NumPy views
 - Thread-safe operations for concurrent access
 
 Example:
@@ -26,7 +27,6 @@ Example:
 from __future__ import annotations
 
 import logging
-from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from threading import Lock
@@ -87,19 +87,162 @@ class TimeframeBar:
         }
 
 
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+class TimeframeBarBuffer:
+    """Array-backed ring buffer of completed OHLCV bars.
+
+    Bars are stored column-wise in NumPy arrays with twice the logical
+    capacity. New bars are written at the tail; once the tail reaches the
+    end of the arrays, the most recent ``maxlen`` rows are moved back to the
+    front (amortized O(1) per append). The last N bars are therefore always
+    a contiguous slice and can be returned as zero-copy views.
+
+    Views returned by ``ohlcv_view``/``timestamp_view`` are only guaranteed
+    to be stable until the next ``append``; copy them if they must outlive
+    the next bar.
+
+    The buffer keeps the ``deque`` surface used by older callers
+    (``append``, ``clear``, ``len``, iteration yielding ``TimeframeBar``).
+    """
+
+    def __init__(self, maxlen: int = 1000, timeframe: str = ""):
+        self.maxlen = max(1, int(maxlen))
+        self.timeframe = timeframe
+        self._capacity = self.maxlen * 2
+        self._timestamps = np.zeros(self._capacity, dtype=np.int64)
+        self._ohlcv = np.zeros((self._capacity, len(OHLCV_COLUMNS)), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+        self._tz: Any = None
+        self.version = 0  # Incremented on every mutation (cache key)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self):
+        for i in range(self._start, self._end):
+            yield self._bar_at(i)
+
+    def __getitem__(self, index: int) -> TimeframeBar:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("TimeframeBarBuffer index out of range")
+        return self._bar_at(self._start + index)
+
+    def append(self, bar: TimeframeBar) -> None:
+        """Append a completed bar (drops the oldest bar when full)."""
+        ts = pd.Timestamp(bar.timestamp)
+        if len(self) == 0:
+            self._tz = ts.tz
+        self.append_values(ts.value, bar.open, bar.high, bar.low, bar.close, bar.volume)
+
+    def append_values(
+        self,
+        timestamp_ns: int,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> None:
+        """Append a completed bar from raw values (UTC epoch nanoseconds)."""
+        if self._end == self._capacity:
+            self._compact()
+        row = self._end
+        self._timestamps[row] = timestamp_ns
+        self._ohlcv[row, 0] = open_
+        self._ohlcv[row, 1] = high
+        self._ohlcv[row, 2] = low
+        self._ohlcv[row, 3] = close
+        self._ohlcv[row, 4] = volume
+        self._end += 1
+        if self._end - self._start > self.maxlen:
+            self._start += 1
+        self.version += 1
+
+    def clear(self) -> None:
+        """Remove all bars."""
+        self._start = 0
+        self._end = 0
+        self._tz = None
+        self.version += 1
+
+    def _compact(self) -> None:
+        """Move the live window back to the front of the arrays."""
+        size = len(self)
+        self._timestamps[:size] = self._timestamps[self._start:self._end]
+        self._ohlcv[:size] = self._ohlcv[self._start:self._end]
+        self._start = 0
+        self._end = size
+
+    def _slice(self, n: int | None) -> slice:
+        if n is None or n >= len(self):
+            return slice(self._start, self._end)
+        return slice(self._end - max(n, 0), self._end)
+
+    def _bar_at(self, row: int) -> TimeframeBar:
+        o, h, l, c, v = self._ohlcv[row]
+        return TimeframeBar(
+            timestamp=pd.Timestamp(int(self._timestamps[row]), tz=self._tz).to_pydatetime(),
+            open=float(o),
+            high=float(h),
+            low=float(l),
+            close=float(c),
+            volume=float(v),
+            timeframe=self.timeframe,
+            complete=True,
+        )
+
+    def timestamp_view(self, n: int | None = None) -> np.ndarray:
+        """Zero-copy view of the last N timestamps (UTC epoch ns)."""
+        return self._timestamps[self._slice(n)]
+
+    def ohlcv_view(self, n: int | None = None) -> np.ndarray:
+        """Zero-copy ``(N, 5)`` view of the last N bars (open..volume)."""
+        return self._ohlcv[self._slice(n)]
+
+    def column(self, name: str, n: int | None = None) -> np.ndarray:
+        """Zero-copy view of one OHLCV column for the last N bars."""
+        return self._ohlcv[self._slice(n), OHLCV_COLUMNS.index(name)]
+
+    def index(self, n: int | None = None) -> pd.DatetimeIndex:
+        """DatetimeIndex for the last N bars (in the timezone of the input)."""
+        idx = pd.DatetimeIndex(self.timestamp_view(n).view("M8[ns]"), name="timestamp")
+        if self._tz is not None:
+            idx = idx.tz_localize("UTC").tz_convert(self._tz)
+        return idx
+
+    def to_dataframe(self, n: int | None = None) -> pd.DataFrame:
+        """DataFrame over the last N bars backed by the buffer arrays."""
+        return pd.DataFrame(
+            self.ohlcv_view(n),
+            index=self.index(n),
+            columns=OHLCV_COLUMNS,
+            copy=False,
+        )
+
+
 @dataclass
 class TimeframeData:
     """Data container for a single timeframe."""
     timeframe: str
-    bars: deque[TimeframeBar] = field(default_factory=lambda: deque(maxlen=1000))
     max_bars: int = 1000
+    bars: TimeframeBarBuffer = field(init=False)
 
     # Current incomplete bar (being built from base bars)
     current_bar: TimeframeBar | None = None
 
-    # Cache for resampled data
+    # Cache for DataFrame views, keyed by (buffer version, n)
     cache_valid: bool = False
     cached_df: pd.DataFrame | None = None
+    _cache_key: tuple[int, int | None] | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        self.bars = TimeframeBarBuffer(maxlen=self.max_bars, timeframe=self.timeframe)
 
     def add_bar(self, bar: TimeframeBar) -> None:
         """Add completed bar to history."""
@@ -108,29 +251,35 @@ class TimeframeData:
 
     def get_last_n_bars(self, n: int) -> list[TimeframeBar]:
         """Get last N bars."""
+        if n <= 0:
+            return []
         return list(self.bars)[-n:] if n <= len(self.bars) else list(self.bars)
 
-    def get_dataframe(self, use_cache: bool = True) -> pd.DataFrame:
-        """Convert bars to DataFrame.
+    def get_dataframe(self, use_cache: bool = True, n: int | None = None) -> pd.DataFrame:
+        """Return bars as a DataFrame view.
+
+        The DataFrame shares memory with the underlying buffer, so it is
+        built without per-bar dict allocation. Treat it as read-only.
 
         Args:
             use_cache: Use cached DataFrame if valid
+            n: Only the last N bars (None = all)
 
         Returns:
             DataFrame with OHLCV columns indexed by timestamp
         """
-        if use_cache and self.cache_valid and self.cached_df is not None:
+        key = (self.bars.version, n)
+        if use_cache and self.cache_valid and self.cached_df is not None and self._cache_key == key:
             return self.cached_df
 
-        if not self.bars:
+        if len(self.bars) == 0:
             return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
 
-        data = [bar.to_dict() for bar in self.bars]
-        df = pd.DataFrame(data)
-        df.set_index("timestamp", inplace=True)
+        df = self.bars.to_dataframe(n)
 
         # Cache result
         self.cached_df = df
+        self._cache_key = key
         self.cache_valid = True
 
         return df
@@ -166,6 +315,9 @@ class TimeframeDataManager:
         # Timeframe hierarchy (ordered from smallest to largest)
         self._timeframes: list[str] = []
 
+        # Period length per timeframe in nanoseconds (for integer alignment)
+        self._period_ns: dict[str, int] = {}
+
         # Thread safety
         self._lock = Lock()
 
@@ -206,6 +358,7 @@ class TimeframeDataManager:
                     timeframe=tf,
                     max_bars=self.max_bars_per_tf
                 )
+                self._period_ns[tf] = pd.Timedelta(tf).value
 
                 # Insert in sorted order (smallest to largest)
                 self._timeframes.append(tf)
@@ -250,25 +403,40 @@ class TimeframeDataManager:
     def _resample_higher_timeframes(self, base_bar: TimeframeBar) -> None:
         """Resample higher timeframes from base timeframe.
 
+        The base timestamp is parsed once; higher-TF period starts are then
+        derived with integer arithmetic instead of a pandas floor per TF.
+
         Args:
             base_bar: Latest base timeframe bar
         """
         base_idx = self._timeframes.index(self.base_timeframe)
+        base_ts = pd.Timestamp(base_bar.timestamp)
 
         for higher_tf in self._timeframes[base_idx + 1:]:
-            self._resample_bar(higher_tf, base_bar)
+            self._resample_bar(higher_tf, base_bar, base_ts)
 
-    def _resample_bar(self, target_tf: str, base_bar: TimeframeBar) -> None:
+    def _resample_bar(
+        self,
+        target_tf: str,
+        base_bar: TimeframeBar,
+        base_ts: pd.Timestamp | None = None
+    ) -> None:
         """Resample a single bar from base to target timeframe.
 
+        The forming higher-TF bar is updated in place; it is only written to
+        the bar buffer once the next period starts.
+
         Args:
             target_tf: Target timeframe to resample to
             base_bar: Base timeframe bar
+            base_ts: Pre-parsed base bar timestamp (optional)
         """
         tf_data = self._data[target_tf]
 
         # Calculate target bar timestamp (align to period boundary)
-        target_timestamp = self._align_timestamp(base_bar.timestamp, target_tf)
+        target_timestamp = self._align_timestamp(
+            base_ts if base_ts is not None else base_bar.timestamp, target_tf
+        )
 
         # Check if we have an incomplete bar for this period
         if tf_data.current_bar is None or tf_data.current_bar.timestamp != target_timestamp:
@@ -310,12 +478,18 @@ class TimeframeDataManager:
         Returns:
             Aligned timestamp at period start
         """
-        # Use pandas for alignment
         ts = pd.Timestamp(timestamp)
-        freq = pd.Timedelta(timeframe)
-
-        # Floor to period boundary
-        aligned = ts.floor(freq)
+        period_ns = self._period_ns.get(timeframe)
+        if period_ns is None:
+            period_ns = pd.Timedelta(timeframe).value
+
+        # Floor to period boundary. Naive and UTC timestamps are floored on the
+        # epoch value directly; other timezones floor on wall time via pandas.
+        if ts.tz is None or ts.utcoffset() == timedelta(0):
+            value = ts.value
+            aligned = pd.Timestamp(value - value % period_ns, tz=ts.tz)
+        else:
+            aligned = ts.floor(pd.Timedelta(period_ns))
 
         return aligned.to_pydatetime()
 
@@ -343,15 +517,42 @@ class TimeframeDataManager:
 
         with self._lock:
             if as_dataframe:
-                df = self._data[tf].get_dataframe(use_cache=True)
-                if n is not None:
-                    return df.tail(n)
-                return df
+                return self._data[tf].get_dataframe(use_cache=True, n=n)
             else:
                 if n is None:
                     return list(self._data[tf].bars)
                 return self._data[tf].get_last_n_bars(n)
 
+    def get_arrays(
+        self,
+        timeframe: str,
+        n: int | None = None
+    ) -> dict[str, np.ndarray]:
+        """Get zero-copy NumPy views of the last N bars of a timeframe.
+
+        The views share memory with the bar buffer and are only stable until
+        the next bar is added; copy them if they must be kept.
+
+        Args:
+            timeframe: Target timeframe
+            n: Number of bars (None = all)
+
+        Returns:
+            Dict with 'timestamp' (epoch ns) and OHLCV column arrays
+        """
+        tf = self._normalize_timeframe(timeframe)
+
+        if tf not in self._data:
+            logger.warning(f"Timeframe {tf} not found")
+            return {}
+
+        with self._lock:
+            buffer = self._data[tf].bars
+            arrays = {"timestamp": buffer.timestamp_view(n)}
+            for name in OHLCV_COLUMNS:
+                arrays[name] = buffer.column(name, n)
+            return arrays
+
     def get_aligned_data(
         self,
         timeframes: list[str] | None = None,
@@ -373,36 +574,40 @@ class TimeframeDataManager:
         tfs = [self._normalize_timeframe(tf) for tf in tfs]
 
         with self._lock:
-            # Get DataFrames for each timeframe
-            dfs = {}
-            for tf in tfs:
-                if tf in self._data:
-                    dfs[tf] = self._data[tf].get_dataframe(use_cache=True)
+            buffers = {tf: self._data[tf].bars for tf in tfs if tf in self._data}
 
-            if not dfs:
+            if not buffers:
                 return {}
 
             # Find common timestamp range
             # Use the largest timeframe's timestamps as reference
             largest_tf = tfs[-1]
-            ref_timestamps = dfs[largest_tf].index
+            ref_buffer = buffers[largest_tf]
+            if len(ref_buffer) == 0:
+                return {
+                    tf: self._data[tf].get_dataframe(use_cache=True).iloc[:0]
+                    for tf in buffers
+                }
 
             # Limit to n most recent
-            if n is not None:
-                ref_timestamps = ref_timestamps[-n:]
+            ref_ns = ref_buffer.timestamp_view(n)
+            ref_index = ref_buffer.index(n)
 
             # Align all timeframes to reference timestamps
             aligned = {}
-            for tf, df in dfs.items():
+            for tf, buffer in buffers.items():
                 if tf == largest_tf:
-                    aligned[tf] = df.loc[ref_timestamps]
-                else:
-                    # For smaller timeframes, get bars within each ref period
-                    # Use forward-fill to get latest bar <= ref timestamp
-                    aligned[tf] = df.reindex(
-                        df.index.union(ref_timestamps),
-                        method='ffill'
-                    ).loc[ref_timestamps]
+                    aligned[tf] = self._data[tf].get_dataframe(use_cache=True, n=n)
+                    continue
+
+                # For smaller timeframes take the latest bar <= ref timestamp
+                # (forward-fill), located by binary search on the timestamps.
+                rows = np.searchsorted(buffer.timestamp_view(), ref_ns, side="right") - 1
+                values = np.full((len(rows), len(OHLCV_COLUMNS)), np.nan)
+                valid = rows >= 0
+                if valid.any():
+                    values[valid] = buffer.ohlcv_view()[rows[valid]]
+                aligned[tf] = pd.DataFrame(values, index=ref_index, columns=OHLCV_COLUMNS)
 
             return aligned
 
@@ -32,6 +32,7 @@ from .variable_storage import VariableStorage
 
 if TYPE_CHECKING:
     from src.core.trading_bot.bot_config import BotConfig
+    from src.core.tradingbot.cel.lazy_context import LazyContext
     from src.ui.widgets.chart_window import ChartWindow
 
 logger = logging.getLogger(__name__)
@@ -229,6 +230,97 @@ class CELContextBuilder:
             logger.error(f"Error building CEL context: {e}", exc_info=True)
             return {}
 
+    def build_lazy(
+        self,
+        chart_window: Optional[ChartWindow] = None,
+        bot_config: Optional[BotConfig] = None,
+        project_vars_path: Optional[str | Path] = None,
+        indicators: Optional[Dict[str, Any]] = None,
+        regime: Optional[Dict[str, Any]] = None,
+        include_empty_namespaces: bool = True,
+        bar_key: Any = None,
+    ) -> LazyContext:
+        """
+        Build lazy CEL context: same variables as build(), resolved on demand.
+
+        Project variables are converted individually when referenced; the
+        chart.* and bot.* providers run once, on first access of their
+        namespace. Values stay memoized for the lifetime of the context.
+
+        Args:
+            chart_window: ChartWindow instance (optional)
+            bot_config: BotConfig instance (optional)
+            project_vars_path: Path to .cel_variables.json (optional)
+            indicators: Indicator values dict (optional)
+            regime: Regime detection values dict (optional)
+            include_empty_namespaces: Include None values when source unavailable
+            bar_key: Bar the context belongs to (see LazyContext.start_bar)
+
+        Returns:
+            LazyContext for CELEngine.evaluate()
+
+        Examples:
+            >>> context = builder.build_lazy(chart_window=chart, bot_config=bot)
+            >>> cel.evaluate("chart.price > 100 && bot.paper_mode", context)
+            # Only chart.* and bot.* providers run, project variables untouched
+        """
+        # Lazy import to avoid circular dependency
+        from src.core.tradingbot.cel.lazy_context import LazyContext
+
+        self._build_count += 1
+        context = LazyContext(bar_key=bar_key)
+
+        # 1. Project Variables (converted per variable on access)
+        if project_vars_path:
+            try:
+                project_vars = self.storage.load(
+                    project_vars_path,
+                    use_cache=self.enable_cache,
+                    create_if_missing=False
+                )
+                for name, var in project_vars.variables.items():
+                    context.define(name, var.get_cel_value)
+            except Exception as e:
+                logger.warning(
+                    f"Could not load project variables from {project_vars_path}: {e}"
+                )
+
+        # 2. Chart Data / 3. Bot Configuration (one provider call per namespace)
+        for provider, source in (
+            (self.chart_provider, chart_window),
+            (self.bot_provider, bot_config),
+        ):
+            if source:
+                context.define_namespace(
+                    provider.namespace,
+                    self._namespace_resolver(provider, source, include_empty_namespaces),
+                )
+            elif include_empty_namespaces:
+                context.define_namespace(provider.namespace, provider._get_empty_context)
+
+        # 4. Indicators / 5. Regime (values already computed by the caller)
+        if indicators:
+            context.update(self._build_indicators_context(indicators))
+        if regime:
+            context.update(self._build_regime_context(regime))
+
+        return context
+
+    @staticmethod
+    def _namespace_resolver(
+        provider: ChartDataProvider | BotConfigProvider,
+        source: Any,
+        include_empty_namespaces: bool,
+    ):
+        """Provider call with the error handling of build()."""
+        def resolve() -> Dict[str, Any]:
+            try:
+                return provider.get_context(source)
+            except Exception as e:
+                logger.warning(f"Could not get {provider.namespace} context: {e}")
+                return provider._get_empty_context() if include_empty_namespaces else {}
+        return resolve
+
     def _build_indicators_context(self, indicators: Dict[str, Any]) -> Dict[str, Any]:
         """
         Build indicators.* namespace from indicator values.
@@ -11,6 +11,7 @@ import qasync
 from PyQt6.QtCore import QSettings, Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget
 
+from src.common.http_pool import get_http_pool
 from src.common.logging_setup import configure_logging
 from src.core.broker import BrokerAdapter
 from src.core.market_data.history_provider import HistoryManager
@@ -251,6 +252,8 @@ async def main(app: QApplication | None = None, splash: QWidget | None = None):
 
     with loop:
         loop.run_forever()
+        # Close pooled HTTP sessions (broker, providers, LLM) before the loop shuts down
+        loop.run_until_complete(get_http_pool().close())
 
 
 if __name__ == "__main__":
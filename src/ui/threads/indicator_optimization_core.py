@@ -5,6 +5,8 @@ Runs indicator parameter optimization in the background with:
 - Long/Short side selection
 - Chart data support
 - Regime-based scoring (0-100)
+- Runs in the out-of-process job server by default (parallel workers,
+  checkpointed combinations that are skipped after a stop)
 
 REFACTORED (Phase 3.2.3):
 - Split into 3 modules for maintainability
@@ -13,11 +15,14 @@ REFACTORED (Phase 3.2.3):
 """
 
 import logging
+import queue
 import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from src.core.jobs import JobEvent, JobEventType, JobKind, get_job_client
+
 # Import signal generator registry
 from src.strategies.signal_generators import SignalGeneratorRegistry
 
@@ -27,6 +32,8 @@ from .indicator_optimization_results import OptimizationResultsProcessor
 
 logger = logging.getLogger(__name__)
 
+JOB_EVENT_POLL_S = 1.0  # Seconds between job server liveness checks while waiting for events
+
 
 class IndicatorOptimizationThread(QThread):
     """Background thread for indicator parameter optimization.
@@ -63,6 +70,9 @@ class IndicatorOptimizationThread(QThread):
         trade_side: str = "long",  # "long" or "short"
         chart_data: Optional[pd.DataFrame] = None,
         data_timeframe: Optional[str] = None,
+        use_job_server: bool = True,
+        n_workers: Optional[int] = None,
+        resume: bool = True,
         parent=None
     ):
         """Initialize optimization thread.
@@ -79,6 +89,10 @@ class IndicatorOptimizationThread(QThread):
             trade_side: "long" or "short" - which trade direction
             chart_data: Pre-loaded chart data (optional)
             data_timeframe: Timeframe of chart data (e.g. "15m")
+            use_job_server: Run the optimization in the job server process
+                (all CPU cores). False = in this thread.
+            n_workers: Job server worker processes (None = all)
+            resume: Skip combinations already tested by an identical run
             parent: Parent QObject
         """
         super().__init__(parent)
@@ -93,9 +107,13 @@ class IndicatorOptimizationThread(QThread):
         self.trade_side = trade_side
         self.chart_data = chart_data
         self.data_timeframe = data_timeframe
+        self.use_job_server = use_job_server
+        self.n_workers = n_workers
+        self.resume = resume
 
         self.results: List[Dict[str, Any]] = []
         self._stop_requested = False
+        self._job_id: Optional[str] = None
 
         # Initialize signal generator registry (Strategy Pattern)
         self._signal_registry = SignalGeneratorRegistry()
@@ -107,6 +125,8 @@ class IndicatorOptimizationThread(QThread):
     def stop(self):
         """Request thread to stop."""
         self._stop_requested = True
+        if self._job_id is not None:
+            get_job_client().cancel(self._job_id)
         logger.info("Optimization stop requested")
 
     def run(self):
@@ -114,13 +134,15 @@ class IndicatorOptimizationThread(QThread):
 
         Orchestrates optimization phases:
         1. Load/use chart data
-        2. Detect regimes (delegates to phase_handler)
-        3. Build regime history (delegates to phase_handler)
-        4. Generate parameter combinations (delegates to phase_handler)
-        5. Loop over indicators/params/regimes:
+        2. Run the optimization in the job server or in this thread:
+           (steps 3-6 in _optimize_in_process)
+        3. Detect regimes (delegates to phase_handler)
+        4. Build regime history (delegates to phase_handler)
+        5. Generate parameter combinations (delegates to phase_handler)
+        6. Loop over indicators/params/regimes:
            - Calculate indicator (delegates to phase_handler)
            - Score indicator (delegates to results_processor)
-        6. Emit results via signals
+        7. Emit results via signals
 
         All signal emissions happen in this method (not in helper classes).
         """
@@ -151,99 +173,164 @@ class IndicatorOptimizationThread(QThread):
                 self.error.emit("No data available for optimization")
                 return
 
-            # Detect regimes across the data (JSON-based) - DELEGATES
+            # Detect regimes across the data (JSON-based)
             self.progress.emit(5, "Detecting market regimes...")
             if not self.json_config_path:
                 raise RuntimeError(
                     "No regime config provided. Load a JSON regime config before optimization."
                 )
-            regime_labels = self.phase_handler.detect_regimes(df)
 
-            # Build regime history (track regime changes for visualization) - DELEGATES
-            regime_history = self.phase_handler.build_regime_history(df, regime_labels)
-            logger.info(f"Detected {len(regime_history)} regime changes")
+            if self.use_job_server:
+                all_results = self._optimize_in_job_server(df)
+            else:
+                all_results = self._optimize_in_process(df)
+            if all_results is None:
+                return  # Stopped or error already emitted
 
-            # Emit regime history for visualization - SIGNAL EMISSION
-            self.regime_history_ready.emit(regime_history)
+            self.results = all_results
+            logger.info(f"Optimization completed: {len(self.results)} results")
 
-            # Get unique regimes
-            unique_regimes = sorted(set(regime_labels))
-            logger.info(f"Found {len(unique_regimes)} unique regimes: {unique_regimes}")
+            # Emit results - SIGNAL EMISSION
+            self.finished.emit(self.results)
 
-            # Generate parameter combinations - DELEGATES
-            param_combinations = self.phase_handler.generate_parameter_combinations()
+        except Exception as e:
+            error_msg = f"Optimization error: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            # Emit error - SIGNAL EMISSION
+            self.error.emit(error_msg)
 
-            # Calculate REAL total: sum of all parameter lists across all indicators × regimes
-            total_param_count = sum(len(params) for params in param_combinations.values())
-            total_combinations = total_param_count * len(unique_regimes)
+    def _optimize_in_job_server(self, df: pd.DataFrame) -> Optional[List[Dict[str, Any]]]:
+        """Run the optimization as job in the job server process.
 
-            logger.info(
-                f"Testing {total_param_count} parameter combinations "
-                f"({len(param_combinations)} indicators) across {len(unique_regimes)} regimes = "
-                f"{total_combinations} total tests"
-            )
+        Regime detection and scoring run in the server; this thread only
+        relays streamed events, so the GUI process stays responsive.
 
-            all_results = []
-            completed = 0
+        Returns:
+            Results sorted by score (partial on stop), or None if the job failed
+        """
+        events: queue.Queue[JobEvent] = queue.Queue()
+        payload = {
+            "data": df,
+            "selected_indicators": self.selected_indicators,
+            "param_ranges": self.param_ranges,
+            "json_config_path": self.json_config_path,
+            "test_type": self.test_type,
+            "trade_side": self.trade_side,
+            "n_workers": self.n_workers,
+            "resume": self.resume,
+        }
+        client = get_job_client()
+        self._job_id = client.submit(JobKind.INDICATOR_OPTIMIZATION, payload, events.put)
+        if self._stop_requested:
+            client.cancel(self._job_id)
+
+        completed = total = 0
+        try:
+            for event in client.iter_events(self._job_id, events, poll_s=JOB_EVENT_POLL_S):
+                if event.type == JobEventType.PROGRESS:
+                    if "regime_history" in event.data:
+                        regime_history = event.data["regime_history"]
+                        logger.info(f"Detected {len(regime_history)} regime changes")
+                        self.regime_history_ready.emit(regime_history)
+                    elif "total" in event.data:
+                        completed, total = event.data["completed"], event.data["total"]
+                    elif "combination" in event.data:
+                        completed += 1
+                        self.progress.emit(
+                            int(completed / max(total, 1) * 100),
+                            f"Tested {event.data['combination']} ({completed}/{total})"
+                        )
+                elif event.type in (JobEventType.COMPLETED, JobEventType.CANCELLED):
+                    return event.data["result"]
+                elif event.type == JobEventType.FAILED:
+                    logger.error(f"Indicator optimization job failed:\n{event.data['traceback']}")
+                    self.error.emit(f"Optimization error: {event.data['error']}")
+                    return None
+        finally:
+            self._job_id = None
+
+    def _optimize_in_process(self, df: pd.DataFrame) -> Optional[List[Dict[str, Any]]]:
+        """Run the optimization in this thread (fallback without job server).
+
+        Returns:
+            Results sorted by score, or None if stopped
+        """
+        regime_labels = self.phase_handler.detect_regimes(df)
 
-            # Test each parameter combination in each regime
-            for indicator_type in self.selected_indicators:
-                if self._stop_requested:
-                    return
+        # Build regime history (track regime changes for visualization) - DELEGATES
+        regime_history = self.phase_handler.build_regime_history(df, regime_labels)
+        logger.info(f"Detected {len(regime_history)} regime changes")
 
-                for params in param_combinations.get(indicator_type, []):
-                    if self._stop_requested:
-                        return
+        # Emit regime history for visualization - SIGNAL EMISSION
+        self.regime_history_ready.emit(regime_history)
 
-                    # Calculate indicator - DELEGATES
-                    indicator_df = self.phase_handler.calculate_indicator(
-                        df, indicator_type, params
-                    )
+        # Get unique regimes
+        unique_regimes = sorted(set(regime_labels))
+        logger.info(f"Found {len(unique_regimes)} unique regimes: {unique_regimes}")
 
-                    # Test in each regime
-                    for regime in unique_regimes:
-                        if self._stop_requested:
-                            return
+        # Generate parameter combinations - DELEGATES
+        param_combinations = self.phase_handler.generate_parameter_combinations()
 
-                        completed += 1
-                        progress_pct = int(completed / total_combinations * 100)
+        # Calculate REAL total: sum of all parameter lists across all indicators × regimes
+        total_param_count = sum(len(params) for params in param_combinations.values())
+        total_combinations = total_param_count * len(unique_regimes)
 
-                        # Emit progress - SIGNAL EMISSION
-                        self.progress.emit(
-                            progress_pct,
-                            f"Testing {indicator_type}{params} in {regime} "
-                            f"({completed}/{total_combinations})"
-                        )
+        logger.info(
+            f"Testing {total_param_count} parameter combinations "
+            f"({len(param_combinations)} indicators) across {len(unique_regimes)} regimes = "
+            f"{total_combinations} total tests"
+        )
 
-                        # Filter data for this regime (align indices after dropna)
-                        aligned_mask = regime_labels.loc[indicator_df.index] == regime
-                        regime_df = indicator_df[aligned_mask]
+        all_results = []
+        completed = 0
 
-                        if len(regime_df) < 10:  # Skip if too few bars
-                            continue
+        # Test each parameter combination in each regime
+        for indicator_type in self.selected_indicators:
+            if self._stop_requested:
+                return None
 
-                        # Score this indicator for this regime - DELEGATES
-                        score_data = self.results_processor.score_indicator(
-                            regime_df,
-                            indicator_type,
-                            params,
-                            regime
-                        )
+            for params in param_combinations.get(indicator_type, []):
+                if self._stop_requested:
+                    return None
 
-                        if score_data:
-                            all_results.append(score_data)
+                # Calculate indicator - DELEGATES
+                indicator_df = self.phase_handler.calculate_indicator(
+                    df, indicator_type, params
+                )
 
-            # Sort by score (descending)
-            all_results.sort(key=lambda x: x['score'], reverse=True)
+                # Test in each regime
+                for regime in unique_regimes:
+                    if self._stop_requested:
+                        return None
 
-            self.results = all_results
-            logger.info(f"Optimization completed: {len(self.results)} results")
+                    completed += 1
+                    progress_pct = int(completed / total_combinations * 100)
 
-            # Emit results - SIGNAL EMISSION
-            self.finished.emit(self.results)
+                    # Emit progress - SIGNAL EMISSION
+                    self.progress.emit(
+                        progress_pct,
+                        f"Testing {indicator_type}{params} in {regime} "
+                        f"({completed}/{total_combinations})"
+                    )
 
-        except Exception as e:
-            error_msg = f"Optimization error: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            # Emit error - SIGNAL EMISSION
-            self.error.emit(error_msg)
+                    # Filter data for this regime (align indices after dropna)
+                    aligned_mask = regime_labels.loc[indicator_df.index] == regime
+                    regime_df = indicator_df[aligned_mask]
+
+                    if len(regime_df) < 10:  # Skip if too few bars
+                        continue
+
+                    # Score this indicator for this regime - DELEGATES
+                    score_data = self.results_processor.score_indicator(
+                        regime_df,
+                        indicator_type,
+                        params,
+                        regime
+                    )
+
+                    if score_data:
+                        all_results.append(score_data)
+
+        # Sort by score (descending)
+        all_results.sort(key=lambda x: x['score'], reverse=True)
+        return all_results
@@ -9,6 +9,8 @@ Features:
 - ADX/DI-based regime detection (matching original regime_engine.py)
 - JSON v2 format support with intelligent parameter mapping
 - Progress reporting with ETA
+- Runs in the out-of-process job server by default (parallel workers,
+  checkpointed study that resumes after a stop)
 - Result ranking and storage
 
 JSON v2 Parameter Mapping (ADX/DI-based):
@@ -28,6 +30,7 @@ JSON v2 Parameter Mapping (ADX/DI-based):
 from __future__ import annotations
 
 import logging
+import queue
 import time
 from datetime import datetime
 from typing import Dict, List, Any
@@ -35,9 +38,12 @@ import pandas as pd
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from src.core import RegimeOptimizer, RegimeOptimizationConfig, RegimeResultsManager
+from src.core.jobs import JobEvent, JobEventType, JobKind, get_job_client
 
 logger = logging.getLogger(__name__)
 
+JOB_EVENT_POLL_S = 1.0  # Seconds between job server liveness checks while waiting for events
+
 
 class RegimeOptimizationThread(QThread):
     """Background thread for Optuna TPE regime optimization.
@@ -61,7 +67,10 @@ class RegimeOptimizationThread(QThread):
         param_grid: Dict[str, List[Any]],
         scope: str = "entry",
         max_trials: int = 150,
-        json_config: Dict[str, Any] | None = None
+        json_config: Dict[str, Any] | None = None,
+        use_job_server: bool = True,
+        n_workers: int | None = None,
+        resume: bool = True,
     ):
         """Initialize regime optimization thread.
 
@@ -78,6 +87,10 @@ class RegimeOptimizationThread(QThread):
             json_config: Optional v2.0 JSON config for per-regime threshold evaluation.
                 If provided, uses JSON-based regime classification with per-regime
                 thresholds instead of simplified 3-regime global threshold model.
+            use_job_server: Run the study in the job server process (all CPU
+                cores, survives closing the dialog). False = in this thread.
+            n_workers: Job server worker processes (None = all)
+            resume: Continue a checkpointed study of an identical run
         """
         super().__init__()
         self.df = df.copy()
@@ -86,7 +99,11 @@ class RegimeOptimizationThread(QThread):
         self.scope = scope
         self.max_trials = max_trials
         self.json_config = json_config
+        self.use_job_server = use_job_server
+        self.n_workers = n_workers
+        self.resume = resume
         self._stop_requested = False
+        self._job_id: str | None = None
 
         # Calculate total combinations (for progress bar)
         self.total_combinations = 1
@@ -96,21 +113,23 @@ class RegimeOptimizationThread(QThread):
     def request_stop(self):
         """Request graceful stop of optimization."""
         self._stop_requested = True
+        if self._job_id is not None:
+            get_job_client().cancel(self._job_id)
         logger.info("Regime optimization stop requested")
 
     def run(self):
         """Execute Optuna TPE regime optimization."""
         try:
             total_start = time.perf_counter()
+            max_trials = min(self.total_combinations, self.max_trials)
             logger.info(
-                f"Starting Optuna regime optimization: max_trials={min(self.total_combinations, self.max_trials)}, "
-                f"scope={self.scope}"
+                f"Starting Optuna regime optimization: max_trials={max_trials}, "
+                f"scope={self.scope}, job_server={self.use_job_server}"
             )
 
             # Import required types (ADX/DI-based)
             from src.core.regime_optimizer import (
-                AllParamRanges, ADXParamRanges, RSIParamRanges,
-                ATRParamRanges, ParamRange, OptimizationConfig
+                ADXParamRanges, RSIParamRanges, ATRParamRanges, ParamRange
             )
 
             # Convert param_grid to structured param_ranges
@@ -121,20 +140,6 @@ class RegimeOptimizationThread(QThread):
                 ranges_dict, ADXParamRanges, RSIParamRanges, ATRParamRanges, ParamRange
             )
 
-            # Create Optuna config
-            config = OptimizationConfig(
-                max_trials=min(self.total_combinations, self.max_trials),
-                n_jobs=1,  # Single-threaded for Qt compatibility
-            )
-
-            # Create optimizer with optional JSON config for per-regime thresholds
-            optimizer = RegimeOptimizer(
-                data=self.df.copy(),
-                param_ranges=param_ranges,
-                config=config,
-                json_config=self.json_config
-            )
-
             if self.json_config:
                 logger.info(
                     f"Using JSON-based regime evaluation with v2.0 config "
@@ -143,72 +148,19 @@ class RegimeOptimizationThread(QThread):
             else:
                 logger.info("Using legacy 3-regime model with global thresholds")
 
-            # Create results manager
-            results_manager = RegimeResultsManager()
-
-            # Register progress callback
-            def on_trial_complete(study, trial):
-                current = len(study.trials)
-                total = config.max_trials
-                best_score = study.best_value if study.best_trial else 0
-
-                # Emit progress every 5 trials to reduce UI overhead
-                if current % 5 == 0 or current == total or current <= 3:
-                    self.progress.emit(
-                        current,
-                        total,
-                        f"Trial {current}/{total} | Best: {best_score:.1f}"
-                    )
-
-                return self._stop_requested  # Return True to stop optimization
-
-            # Run optimization
-            optimization_results = optimizer.optimize(callbacks=[on_trial_complete])
-
-            # Add all results to RegimeResultsManager
-            # For JSON mode, merge json_params into params for display
-            for result in optimization_results:
-                params_dict = result.params.model_dump()
-                # Merge JSON params (e.g., "DIRECTION_CHANDELIER.lookback") for dynamic columns
-                if result.json_params:
-                    params_dict.update(result.json_params)
-                results_manager.add_result(
-                    score=result.score,
-                    params=params_dict,
-                    metrics=result.metrics.model_dump(),
-                    timestamp=result.timestamp.isoformat()
-                )
-
-            # Rank results
-            results_manager.rank_results()
-
-            # Convert to UI-compatible format
-            results = []
-            for regime_result in results_manager.results:
-                # Ensure params and metrics are dicts (not Pydantic models)
-                params_dict = regime_result.params if isinstance(regime_result.params, dict) else {}
-                metrics_dict = regime_result.metrics if isinstance(regime_result.metrics, dict) else {}
-
-                ui_result = {
-                    'score': int(regime_result.score),
-                    'params': params_dict,
-                    'metrics': metrics_dict,
-                    'timestamp': datetime.fromisoformat(regime_result.timestamp),
-                    'rank': regime_result.rank,
-                    'trial_number': regime_result.rank,  # Use rank as trial number
-                    'config': None,  # Not needed for Optuna results
-                    'regime_history': None,
-                }
-                results.append(ui_result)
+            if self.use_job_server:
+                rows = self._optimize_in_job_server(param_ranges, max_trials)
+            else:
+                rows = self._optimize_in_process(param_ranges, max_trials)
+            if rows is None:
+                return  # Error already emitted
 
-                # NOTE: Don't emit individual results here - causes 150x table rebuilds!
-                # Progress updates come from on_trial_complete callback during optimization
-                # Final results are emitted via finished_with_results below
+            results = self._to_ui_results(rows)
 
             total_elapsed = time.perf_counter() - total_start
             logger.info(
                 f"Regime optimization complete: {len(results)} results in {total_elapsed:.1f}s "
-                f"({total_elapsed/len(results):.2f}s per trial)"
+                f"({total_elapsed/max(len(results), 1):.2f}s per trial)"
             )
 
             # Emit all results
@@ -219,6 +171,129 @@ class RegimeOptimizationThread(QThread):
             logger.error(error_msg, exc_info=True)
             self.error.emit(error_msg)
 
+    def _emit_trial_progress(self, current: int, total: int, best_score: float) -> None:
+        # Emit progress every 5 trials to reduce UI overhead
+        if current % 5 == 0 or current == total or current <= 3:
+            self.progress.emit(
+                current,
+                total,
+                f"Trial {current}/{total} | Best: {best_score:.1f}"
+            )
+
+    def _optimize_in_job_server(self, param_ranges, max_trials: int) -> List[Dict[str, Any]] | None:
+        """Run the optimization as job in the job server process.
+
+        This thread only relays streamed events, so the GUI process stays
+        responsive while all CPU cores work on the shared study.
+
+        Returns:
+            Result rows (partial on stop), or None if the job failed
+        """
+        events: queue.Queue[JobEvent] = queue.Queue()
+        payload = {
+            "data": self.df,
+            "param_ranges": param_ranges.model_dump(),
+            "max_trials": max_trials,
+            "json_config": self.json_config,
+            "n_workers": self.n_workers,
+            "resume": self.resume,
+        }
+        client = get_job_client()
+        self._job_id = client.submit(JobKind.REGIME_OPTIMIZATION, payload, events.put)
+        if self._stop_requested:
+            client.cancel(self._job_id)
+
+        try:
+            for event in client.iter_events(self._job_id, events, poll_s=JOB_EVENT_POLL_S):
+                if event.type == JobEventType.PROGRESS:
+                    if "trial" in event.data:
+                        self._emit_trial_progress(
+                            event.data["completed"], event.data["total"], event.data["best_score"]
+                        )
+                elif event.type in (JobEventType.COMPLETED, JobEventType.CANCELLED):
+                    return event.data["result"]
+                elif event.type == JobEventType.FAILED:
+                    logger.error(f"Regime optimization job failed:\n{event.data['traceback']}")
+                    self.error.emit(f"Regime optimization failed: {event.data['error']}")
+                    return None
+        finally:
+            self._job_id = None
+
+    def _optimize_in_process(self, param_ranges, max_trials: int) -> List[Dict[str, Any]]:
+        """Run the optimization in this thread (fallback without job server)."""
+        from src.core.regime_optimizer import OptimizationConfig
+
+        # Create Optuna config
+        config = OptimizationConfig(
+            max_trials=max_trials,
+            n_jobs=1,  # Single-threaded for Qt compatibility
+        )
+
+        # Create optimizer with optional JSON config for per-regime thresholds
+        optimizer = RegimeOptimizer(
+            data=self.df.copy(),
+            param_ranges=param_ranges,
+            config=config,
+            json_config=self.json_config
+        )
+
+        # Register progress callback
+        def on_trial_complete(study, trial):
+            best_score = study.best_value if study.best_trial else 0
+            self._emit_trial_progress(len(study.trials), config.max_trials, best_score)
+            return self._stop_requested  # Return True to stop optimization
+
+        # Run optimization
+        optimization_results = optimizer.optimize(callbacks=[on_trial_complete])
+
+        rows = []
+        for result in optimization_results:
+            params_dict = result.params.model_dump()
+            # Merge JSON params (e.g., "DIRECTION_CHANDELIER.lookback") for dynamic columns
+            if result.json_params:
+                params_dict.update(result.json_params)
+            rows.append({
+                "score": result.score,
+                "params": params_dict,
+                "metrics": result.metrics.model_dump(),
+                "timestamp": result.timestamp.isoformat(),
+            })
+        return rows
+
+    def _to_ui_results(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Rank result rows and convert them to the UI format."""
+        # Create results manager
+        results_manager = RegimeResultsManager()
+        for row in rows:
+            results_manager.add_result(**row)
+
+        # Rank results
+        results_manager.rank_results()
+
+        # Convert to UI-compatible format
+        results = []
+        for regime_result in results_manager.results:
+            # Ensure params and metrics are dicts (not Pydantic models)
+            params_dict = regime_result.params if isinstance(regime_result.params, dict) else {}
+            metrics_dict = regime_result.metrics if isinstance(regime_result.metrics, dict) else {}
+
+            ui_result = {
+                'score': int(regime_result.score),
+                'params': params_dict,
+                'metrics': metrics_dict,
+                'timestamp': datetime.fromisoformat(regime_result.timestamp),
+                'rank': regime_result.rank,
+                'trial_number': regime_result.rank,  # Use rank as trial number
+                'config': None,  # Not needed for Optuna results
+                'regime_history': None,
+            }
+            results.append(ui_result)
+
+            # NOTE: Don't emit individual results here - causes 150x table rebuilds!
+            # Progress updates are emitted per trial during optimization
+            # Final results are emitted via finished_with_results
+        return results
+
     def _convert_param_grid_to_ranges_v2(self) -> Dict[str, Dict[str, Any]]:
         """Convert JSON v2 param_grid to ADX/DI-based optimizer format.
 
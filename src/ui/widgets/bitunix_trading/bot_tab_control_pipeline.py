@@ -43,7 +43,7 @@ class BotTabControlPipeline:
         1. DataFrame von HistoryManager holen
         2. MarketContext bauen (via MarketContextBuilder)
         3. EntryScore berechnen
-        4. LLM Validation (Quick→Deep)
+        4. LLM Validation (Quick‖Deep; unter Entry-Schwelle nur Prefetch)
         5. Trigger prüfen
         6. Leverage berechnen
         7. Ergebnisse speichern für Status Panel
@@ -95,15 +95,21 @@ class BotTabControlPipeline:
                     self.parent.parent._last_entry_score = entry_result
                     logger.debug(f"Entry Score: {entry_result.final_score:.3f} ({entry_result.quality.value})")
 
-            # 4. LLM Validation (Quick→Deep)
-            if self.parent.parent._llm_validation and self.parent.parent._last_entry_score:
-                llm_result = await self.parent.parent._llm_validation.validate(
-                    context=context,
-                    entry_score=self.parent.parent._last_entry_score.final_score,
-                    direction="long" if self.parent.parent._last_entry_score.direction.value == "long" else "short",
-                )
-                self.parent.parent._last_llm_result = llm_result
-                logger.debug(f"LLM Validation: {llm_result.action.value} (tier={llm_result.tier.value})")
+            # 4. LLM Validation (Quick‖Deep, Latenz-Budget)
+            entry_score = self.parent.parent._last_entry_score
+            if self.parent.parent._llm_validation and entry_score:
+                if entry_score.is_valid_for_entry:
+                    # Nutzt laufende/gecachte Prefetch-Anfragen für dasselbe Setup
+                    llm_result = await self.parent.parent._llm_validation.validate(
+                        context=context,
+                        entry_score=entry_score,
+                    )
+                    self.parent.parent._last_llm_result = llm_result
+                    logger.debug(f"LLM Validation: {llm_result.action.value} (tier={llm_result.tier.value})")
+                else:
+                    # Score unter Entry-Schwelle: nur spekulativ vorladen, nicht warten
+                    self.parent.parent._llm_validation.prefetch(context, entry_score)
+                    self.parent.parent._last_llm_result = None
 
             # 5. Trigger prüfen
             if self.parent.parent._trigger_exit_engine and self.parent.parent._last_entry_score:
@@ -5,7 +5,6 @@ NO Bitunix code allowed here!
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime, timezone
 
@@ -13,6 +12,7 @@ import pandas as pd
 from PyQt6.QtCore import pyqtSlot
 
 from src.common.event_bus import Event
+from .chart_render_scheduler import get_render_scheduler
 from .data_loading_mixin import get_local_timezone_offset_seconds
 
 logger = logging.getLogger(__name__)
@@ -108,7 +108,7 @@ class AlpacaStreamingMixin:
             volume_bar = self._build_volume_payload(price)
 
             self._execute_chart_updates(candle, volume_bar)
-            self._update_indicators_realtime(candle)
+            get_render_scheduler(self).request_indicators(candle)
             self._emit_tick_price_updated(price)
 
         except Exception as e:
@@ -264,10 +264,10 @@ class AlpacaStreamingMixin:
         }
 
     def _execute_chart_updates(self, candle: dict, volume_bar: dict) -> None:
-        candle_json = json.dumps(candle)
-        volume_json = json.dumps(volume_bar)
-        self._execute_js(f"window.chartAPI.updateCandle({candle_json});")
-        self._execute_js(f"window.chartAPI.updatePanelData('volume', {volume_json});")
+        # Coalesced per frame: superseded ticks of the same candle are dropped
+        scheduler = get_render_scheduler(self)
+        scheduler.update_candle(candle)
+        scheduler.update_volume(volume_bar)
 
     def _emit_tick_price_updated(self, price: float) -> None:
         if hasattr(self, 'tick_price_updated'):
@@ -324,12 +324,8 @@ class AlpacaStreamingMixin:
                     'color': '#26a69a' if candle['close'] >= candle['open'] else '#ef5350'
                 }
 
-                # Update chart
-                candle_json = json.dumps(candle)
-                volume_json = json.dumps(volume)
-
-                self._execute_js(f"window.chartAPI.updateCandle({candle_json});")
-                self._execute_js(f"window.chartAPI.updatePanelData('volume', {volume_json});")
+                # Update chart (with the next render frame)
+                self._execute_chart_updates(candle, volume)
 
         except Exception as e:
             logger.error(f"Error processing Alpaca updates: {e}", exc_info=True)
@@ -0,0 +1,385 @@
+"""Chart Data Buffer - Memory-bounded candle series for chart widgets.
+
+A 1-second chart left open for days used to grow its ``data`` DataFrame
+and the JavaScript candle series without bound.
+
+Contains:
+- ChartBufferPolicy: Capacity settings (full-resolution ``data`` budget,
+  recent horizon, history budget, aggregation factor, on-demand detail budget)
+- ChartDataBuffer: Series shown in the chart. Preallocated numpy columns
+  with amortized append. The most recent bars stay at full resolution,
+  older bars are OHLC aggregated in blocks of ``history_factor`` bars.
+  When the user scrolls back, one window of full-resolution detail can be
+  swapped into the aggregated history.
+
+The widget's ``data`` DataFrame is not aggregated: strategies, backtests
+and indicators need a uniform bar series. It is only capped to
+``policy.data_bars`` rows by evicting the oldest bars (``trim_frame``).
+
+The display series stays below ``policy.max_bars`` rows (48 bytes per row
+plus capacity headroom), no matter how long the chart runs.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass
+class ChartBufferPolicy:
+    """Capacity settings of a ChartDataBuffer."""
+
+    data_bars: int = 120_000  # Full-resolution bars kept in the widget's data
+    recent_bars: int = 20_000  # Full-resolution horizon of the display series
+    history_bars: int = 10_000  # Aggregated bars kept before the horizon
+    history_factor: int = 10  # Source bars per aggregated history bar
+    detail_bars: int = 5_000  # Full-resolution bars loaded while scrolling back
+    compact_chunk: int = 1_000  # Recent bars moved to history at once
+
+    def __post_init__(self) -> None:
+        if self.history_factor < 1:
+            raise ValueError("history_factor must be >= 1")
+        # Keep compaction aligned to whole aggregation blocks
+        self.compact_chunk = max(self.history_factor, self.compact_chunk)
+
+    @property
+    def max_bars(self) -> int:
+        return self.recent_bars + self.compact_chunk + self.history_bars + self.detail_bars
+
+
+def aggregate_ohlcv(ts: np.ndarray, values: np.ndarray, factor: int) -> tuple[np.ndarray, np.ndarray]:
+    """Aggregate consecutive blocks of ``factor`` bars into one OHLC bar.
+
+    Args:
+        ts: Bar timestamps (int64 ns)
+        values: Field-major array (open, high, low, close, volume) x bars
+        factor: Bars per block (the last block may be shorter)
+
+    Returns:
+        Tuple of (block start timestamps, aggregated values)
+    """
+    if len(ts) == 0 or factor <= 1:
+        return ts.copy(), values.copy()
+    starts = np.arange(0, len(ts), factor)
+    ends = np.minimum(starts + factor, len(ts)) - 1
+    out = np.empty((len(OHLCV_COLUMNS), len(starts)))
+    out[0] = values[0, starts]
+    out[1] = np.maximum.reduceat(values[1], starts)
+    out[2] = np.minimum.reduceat(values[2], starts)
+    out[3] = values[3, ends]
+    out[4] = np.add.reduceat(values[4], starts)
+    return ts[starts], out
+
+
+def _ohlcv_values(data: pd.DataFrame) -> np.ndarray:
+    """Field-major OHLCV values of a DataFrame (missing columns as zeros)."""
+    return np.vstack([
+        data[col].to_numpy(dtype=float) if col in data.columns else np.zeros(len(data))
+        for col in OHLCV_COLUMNS
+    ])
+
+
+class _BarArrays:
+    """Growable column store; appends and front drops are amortized O(1)."""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.ts = np.empty(capacity, dtype=np.int64)
+        self.values = np.empty((len(OHLCV_COLUMNS), capacity))
+        self.start = 0
+        self.end = 0
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def ts_view(self) -> np.ndarray:
+        return self.ts[self.start:self.end]
+
+    def values_view(self) -> np.ndarray:
+        return self.values[:, self.start:self.end]
+
+    def nbytes(self) -> int:
+        return self.ts.nbytes + self.values.nbytes
+
+    def _reserve(self, extra: int) -> None:
+        if self.end + extra <= len(self.ts):
+            return
+        size = len(self)
+        capacity = len(self.ts)
+        # Reuse the dropped front before growing
+        if size + extra > capacity // 2:
+            capacity = max(capacity * 2, size + extra)
+        ts = np.empty(capacity, dtype=np.int64)
+        values = np.empty((len(OHLCV_COLUMNS), capacity))
+        ts[:size] = self.ts_view()
+        values[:, :size] = self.values_view()
+        self.ts, self.values = ts, values
+        self.start, self.end = 0, size
+
+    def extend(self, ts: np.ndarray, values: np.ndarray) -> None:
+        self._reserve(len(ts))
+        self.ts[self.end:self.end + len(ts)] = ts
+        self.values[:, self.end:self.end + len(ts)] = values
+        self.end += len(ts)
+
+    def append(self, ts: int, row) -> None:
+        self._reserve(1)
+        self.ts[self.end] = ts
+        self.values[:, self.end] = row
+        self.end += 1
+
+    def drop_front(self, count: int) -> None:
+        self.start += min(count, len(self))
+
+    def replace(self, ts: np.ndarray, values: np.ndarray) -> None:
+        self.start = self.end = 0
+        self.extend(ts, values)
+
+
+class ChartDataBuffer:
+    """Bounded display series: full-resolution recent bars + aggregated history."""
+
+    def __init__(self, policy: ChartBufferPolicy | None = None) -> None:
+        self.policy = policy or ChartBufferPolicy()
+        self._history = _BarArrays()
+        self._recent = _BarArrays()
+        self._tz = "UTC"
+        # (start_ns, end_ns) of the full-resolution window inside history
+        self.detail_range: tuple[int, int] | None = None
+        self._frame: pd.DataFrame | None = None
+
+        # Stats
+        self.version = 0
+        self.compactions = 0
+        self.evicted_bars = 0
+        self.late_updates = 0
+
+    # =========================================================================
+    # LOADING / UPDATING
+    # =========================================================================
+
+    def trim_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Evict the oldest bars of a full-resolution frame beyond ``policy.data_bars``."""
+        excess = len(data) - self.policy.data_bars
+        return data.iloc[excess:] if excess > 0 else data
+
+    def load(self, data: pd.DataFrame) -> None:
+        """Replace the content with ``data`` (OHLCV DataFrame with DatetimeIndex).
+
+        Bars beyond the recent horizon are aggregated right away.
+        """
+        index = pd.DatetimeIndex(data.index)
+        self._tz = index.tz
+        ts = index.asi8
+        values = _ohlcv_values(data)
+        split = max(0, len(ts) - self.policy.recent_bars)
+        split -= split % self.policy.history_factor
+        self._history.replace(*aggregate_ohlcv(ts[:split], values[:, :split], self.policy.history_factor))
+        self._recent.replace(ts[split:], values[:, split:])
+        self.detail_range = None
+        self._evict_history()
+        self._touch()
+        if split:
+            logger.info(
+                f"Chart buffer: {len(ts)} bars loaded → {len(self._recent)} full resolution "
+                f"+ {len(self._history)} aggregated (1:{self.policy.history_factor})"
+            )
+
+    def upsert(
+        self, timestamp, open_: float, high: float, low: float, close: float, volume: float | None = None
+    ) -> bool:
+        """Update the newest bar or append a new one.
+
+        Args:
+            timestamp: Bar start (datetime, pd.Timestamp or int ns)
+            volume: Bar volume; None keeps the current volume (0 for a new bar)
+
+        Returns:
+            True if a new bar was appended
+        """
+        ts = timestamp if isinstance(timestamp, (int, np.integer)) else pd.Timestamp(timestamp).value
+        recent = self._recent
+        if len(recent) and ts == recent.ts[recent.end - 1]:
+            if volume is None:
+                volume = recent.values[4, recent.end - 1]
+            recent.values[:, recent.end - 1] = (open_, high, low, close, volume)
+            # Forming candle: patch the cached frame instead of rebuilding it
+            if self._frame is not None:
+                self._frame.iloc[-1] = recent.values[:, recent.end - 1]
+            self.version += 1
+            return False
+        if len(recent) and ts < recent.ts[recent.end - 1]:
+            self.late_updates += 1
+            return False
+
+        recent.append(ts, (open_, high, low, close, volume or 0.0))
+        if len(recent) > self.policy.recent_bars + self.policy.compact_chunk:
+            self._compact()
+        self._touch()
+        return True
+
+    def _compact(self) -> None:
+        """Move the oldest full-resolution bars into the aggregated history."""
+        factor = self.policy.history_factor
+        count = len(self._recent) - self.policy.recent_bars
+        count -= count % factor
+        start = self._recent.start
+        ts, values = aggregate_ohlcv(
+            self._recent.ts[start:start + count],
+            self._recent.values[:, start:start + count],
+            factor,
+        )
+        self._history.extend(ts, values)
+        self._recent.drop_front(count)
+        self.compactions += 1
+        self._evict_history()
+
+    def _evict_history(self) -> None:
+        budget = self.policy.history_bars + (self.policy.detail_bars if self.detail_range else 0)
+        excess = len(self._history) - budget
+        if excess <= 0:
+            return
+        self._history.drop_front(excess)
+        self.evicted_bars += excess
+        first = self._history.ts[self._history.start] if len(self._history) else None
+        if self.detail_range and (first is None or self.detail_range[1] <= first):
+            self.detail_range = None
+
+    # =========================================================================
+    # ON-DEMAND DETAIL
+    # =========================================================================
+
+    def aggregated_range(self) -> tuple[int, int] | None:
+        """(start_ns, end_ns) of the aggregated history, None if there is none."""
+        if not len(self._history):
+            return None
+        end = self._recent.ts[self._recent.start] if len(self._recent) else self._history.ts[self._history.end - 1] + 1
+        return int(self._history.ts[self._history.start]), int(end)
+
+    def detail_window(self, visible_from, visible_to) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        """Range to load at full resolution for the visible range, if any.
+
+        The range is widened to whole aggregated bars; its end is exclusive.
+
+        Args:
+            visible_from: First visible time (datetime or pd.Timestamp)
+            visible_to: Last visible time
+
+        Returns:
+            (start, end) as UTC timestamps, or None when the visible range shows
+            no aggregated history or is already covered by the detail window
+        """
+        aggregated = self.aggregated_range()
+        if aggregated is None:
+            return None
+        start = max(pd.Timestamp(visible_from).value, aggregated[0])
+        end = min(pd.Timestamp(visible_to).value, aggregated[1] - 1)
+        if start > end:
+            return None
+        if self.detail_range and self.detail_range[0] <= start and end < self.detail_range[1]:
+            return None
+
+        hist_ts = self._history.ts_view()
+        start = int(hist_ts[np.searchsorted(hist_ts, start, side="right") - 1])
+        i_end = int(np.searchsorted(hist_ts, end, side="right"))
+        end = int(hist_ts[i_end]) if i_end < len(hist_ts) else aggregated[1]
+        return pd.Timestamp(start, tz="UTC"), pd.Timestamp(end, tz="UTC")
+
+    def merge_detail(self, data: pd.DataFrame) -> int:
+        """Swap full-resolution ``data`` into the aggregated history.
+
+        A previous detail window is aggregated again first, so only one
+        window (at most ``policy.detail_bars`` bars) is held at a time.
+
+        Returns:
+            Number of full-resolution bars merged
+        """
+        if data.empty or not len(self._history):
+            return 0
+        self._collapse_detail()
+
+        hist_ts = self._history.ts_view()
+        detail_ts = pd.DatetimeIndex(data.index).asi8
+        detail_values = _ohlcv_values(data)
+        keep = slice(max(0, len(detail_ts) - self.policy.detail_bars), None)
+        detail_ts, detail_values = detail_ts[keep], detail_values[:, keep]
+
+        # Replace whole aggregated bars: from the first bar starting inside the
+        # detail up to (excluding) the bar the last detail row falls on
+        i0 = int(np.searchsorted(hist_ts, detail_ts[0], side="left"))
+        i1 = int(np.searchsorted(hist_ts, detail_ts[-1], side="left"))
+        if i0 >= i1:
+            return 0
+        span_start = int(hist_ts[i0])
+        span_end = int(hist_ts[i1]) if i1 < len(hist_ts) else self.aggregated_range()[1]
+        inside = (detail_ts >= span_start) & (detail_ts < span_end)
+        detail_ts, detail_values = detail_ts[inside], detail_values[:, inside]
+
+        hist_values = self._history.values_view()
+        self._history.replace(
+            np.concatenate([hist_ts[:i0], detail_ts, hist_ts[i1:]]),
+            np.hstack([hist_values[:, :i0], detail_values, hist_values[:, i1:]]),
+        )
+        self.detail_range = (span_start, span_end)
+        self._evict_history()
+        self._touch()
+        return len(detail_ts)
+
+    def _collapse_detail(self) -> None:
+        if self.detail_range is None:
+            return
+        ts, values = self._history.ts_view(), self._history.values_view()
+        i0, i1 = np.searchsorted(ts, self.detail_range, side="left")
+        agg_ts, agg_values = aggregate_ohlcv(ts[i0:i1], values[:, i0:i1], self.policy.history_factor)
+        self._history.replace(
+            np.concatenate([ts[:i0], agg_ts, ts[i1:]]),
+            np.hstack([values[:, :i0], agg_values, values[:, i1:]]),
+        )
+        self.detail_range = None
+
+    # =========================================================================
+    # ACCESS
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self._history) + len(self._recent)
+
+    def _touch(self) -> None:
+        self.version += 1
+        self._frame = None
+
+    def to_frame(self) -> pd.DataFrame:
+        """Display series as OHLCV DataFrame.
+
+        Cached; rebuilt only after bars were appended, compacted or swapped.
+        """
+        if self._frame is None:
+            ts = np.concatenate([self._history.ts_view(), self._recent.ts_view()])
+            values = np.hstack([self._history.values_view(), self._recent.values_view()])
+            index = pd.DatetimeIndex(ts.astype("datetime64[ns]")).tz_localize("UTC")
+            if self._tz is None:
+                index = index.tz_localize(None)
+            elif str(self._tz) != "UTC":
+                index = index.tz_convert(self._tz)
+            self._frame = pd.DataFrame(dict(zip(OHLCV_COLUMNS, values)), index=index)
+        return self._frame
+
+    def nbytes(self) -> int:
+        return self._history.nbytes() + self._recent.nbytes()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "recent_bars": len(self._recent),
+            "history_bars": len(self._history),
+            "compactions": self.compactions,
+            "evicted_bars": self.evicted_bars,
+            "late_updates": self.late_updates,
+            "nbytes": self.nbytes(),
+        }
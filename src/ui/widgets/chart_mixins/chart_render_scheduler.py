@@ -0,0 +1,214 @@
+"""Chart Render Scheduler - Frame-coalesced live chart updates.
+
+Every streaming tick used to push the current candle and volume bar with
+two separate runJavaScript calls, followed by one call per indicator
+series (and a full indicator recalculation). At hundreds of ticks per
+second that saturates the Qt-JS bridge and the GUI thread.
+
+Contains:
+- ChartRenderScheduler: Keeps only the latest point per series and time,
+  recalculates indicators once per frame and flushes everything as one
+  ``chartAPI.applyRenderFrame()`` call at a capped frame rate
+
+Frame format (JSON):
+    {
+        "candles": [{"time": ..., "open": ..., ...}],
+        "panels": {"volume": [{"time": ..., "value": ...}], "rsi_1": [...]},
+        "indicators": {"SMA(20)": [{"time": ..., "value": ...}]},
+        "panelSeries": {"macd_1": {"macd": [...], "signal": [...]}}
+    }
+
+Points are sent in time order. Within one frame a later tick for the same
+series and candle time supersedes the earlier one; when a candle closes
+inside a frame, its final state is still sent before the new candle.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import Any, Callable
+
+from PyQt6.QtCore import QCoreApplication, QTimer
+
+logger = logging.getLogger(__name__)
+
+# Live chart frame cap (~30 fps)
+FRAME_INTERVAL_MS = 33
+
+_CANDLE_KEY = ("candle",)
+
+
+class ChartRenderScheduler:
+    """Coalesces live candle, volume and indicator updates into frames.
+
+    Must be used from the GUI thread (ticks are already marshalled there).
+    Without a running Qt application (tests, headless use) updates are
+    flushed synchronously.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str], None],
+        compute_indicators: Callable[[dict], None] | None = None,
+        interval_ms: int = FRAME_INTERVAL_MS,
+    ) -> None:
+        """
+        Args:
+            send: Executes JavaScript in the chart
+            compute_indicators: Recalculates indicators for a candle and
+                queues their points (called once per candle time per frame)
+            interval_ms: Minimum time between two frames
+        """
+        self._send = send
+        self._compute_indicators = compute_indicators
+        self.interval_ms = interval_ms
+
+        # series key -> {time: point}; dicts keep time order of arrival
+        self._pending: dict[tuple, dict[Any, dict]] = {}
+        # candle time -> latest candle awaiting indicator recalculation
+        self._indicator_candles: dict[Any, dict] = {}
+        self._timer: QTimer | None = None
+        self._last_flush = 0.0
+        self._flushing = False
+
+        # Stats
+        self.updates_received = 0
+        self.updates_dropped = 0
+        self.frames_sent = 0
+        self.indicator_runs = 0
+
+    # =========================================================================
+    # QUEUEING
+    # =========================================================================
+
+    def update_candle(self, candle: dict) -> None:
+        """Queue the forming candle (``chartAPI.updateCandle``)."""
+        self._queue(_CANDLE_KEY, candle)
+
+    def update_volume(self, bar: dict) -> None:
+        """Queue the forming volume bar."""
+        self.update_panel("volume", bar)
+
+    def update_panel(self, panel_id: str, point: dict) -> None:
+        """Queue a point of a panel's main series (``chartAPI.updatePanelData``)."""
+        self._queue(("panel", panel_id), point)
+
+    def update_indicator(self, name: str, point: dict) -> None:
+        """Queue a point of an overlay indicator (``chartAPI.updateIndicator``)."""
+        self._queue(("indicator", name), point)
+
+    def update_panel_series(self, panel_id: str, series_key: str, point: dict) -> None:
+        """Queue a point of a panel's extra series (``chartAPI.updatePanelSeriesData``)."""
+        self._queue(("panelSeries", panel_id, series_key), point)
+
+    def request_indicators(self, candle: dict) -> None:
+        """Recalculate indicators for ``candle`` with the next frame."""
+        if self._compute_indicators is None:
+            return
+        self._indicator_candles.pop(candle["time"], None)
+        self._indicator_candles[candle["time"]] = candle
+        self._schedule()
+
+    def clear(self) -> None:
+        """Drop everything pending (e.g. the chart was reloaded with new data)."""
+        self._pending.clear()
+        self._indicator_candles.clear()
+        if self._timer is not None:
+            self._timer.stop()
+
+    def has_pending(self) -> bool:
+        return bool(self._pending or self._indicator_candles)
+
+    def _queue(self, key: tuple, point: dict) -> None:
+        self.updates_received += 1
+        points = self._pending.setdefault(key, {})
+        if points.pop(point["time"], None) is not None:
+            self.updates_dropped += 1
+        points[point["time"]] = point
+        self._schedule()
+
+    # =========================================================================
+    # FRAMES
+    # =========================================================================
+
+    def _schedule(self) -> None:
+        if self._flushing:
+            return  # Queued from compute_indicators; goes out with this frame
+        if QCoreApplication.instance() is None:
+            self.flush()
+            return
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        if self._timer.isActive():
+            return
+        # First update after a quiet period goes out right away, bursts are capped
+        elapsed_ms = (time.monotonic() - self._last_flush) * 1000
+        self._timer.start(max(0, int(self.interval_ms - elapsed_ms)))
+
+    def flush(self) -> None:
+        """Send all pending updates as one frame."""
+        if self._indicator_candles:
+            self._run_indicators()
+        if not self._pending:
+            return
+
+        frame = self._build_frame()
+        self._pending.clear()
+        self._last_flush = time.monotonic()
+        self.frames_sent += 1
+        self._send(f"window.chartAPI?.applyRenderFrame({json.dumps(frame)});")
+
+    def _run_indicators(self) -> None:
+        candles = sorted(self._indicator_candles.values(), key=lambda c: c["time"])
+        self._indicator_candles.clear()
+        self._flushing = True
+        try:
+            for candle in candles:
+                self.indicator_runs += 1
+                self._compute_indicators(candle)
+        except Exception as e:
+            logger.error(f"Error updating indicators for render frame: {e}", exc_info=True)
+        finally:
+            self._flushing = False
+
+    def _build_frame(self) -> dict[str, Any]:
+        frame: dict[str, Any] = {}
+        for key, points in self._pending.items():
+            ordered = sorted(points.values(), key=lambda p: p["time"])
+            kind = key[0]
+            if kind == "candle":
+                frame["candles"] = ordered
+            elif kind == "panelSeries":
+                frame.setdefault(kind, {}).setdefault(key[1], {})[key[2]] = ordered
+            else:
+                frame.setdefault(f"{kind}s", {})[key[1]] = ordered
+        return frame
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "updates_received": self.updates_received,
+            "updates_dropped": self.updates_dropped,
+            "frames_sent": self.frames_sent,
+            "indicator_runs": self.indicator_runs,
+        }
+
+
+def get_render_scheduler(chart) -> ChartRenderScheduler:
+    """Return the chart's render scheduler, creating it on first use.
+
+    Args:
+        chart: Chart widget providing ``_execute_js`` (and optionally
+            ``_update_indicators_realtime``)
+    """
+    scheduler = getattr(chart, "_render_scheduler", None)
+    if scheduler is None:
+        scheduler = ChartRenderScheduler(
+            send=chart._execute_js,
+            compute_indicators=getattr(chart, "_update_indicators_realtime", None),
+        )
+        chart._render_scheduler = scheduler
+    return scheduler
@@ -7,6 +7,7 @@ REFACTORED: Split into 5 helper modules using composition pattern:
 - data_loading_series.py: Chart series building
 - data_loading_resolution.py: Resolution helpers (asset class, timeframe, provider, date range)
 - data_loading_symbol.py: Main load_symbol orchestration
+- chart_data_buffer.py: Memory-bounded candle series shown in the chart
 - data_loading_mixin.py: Orchestrator + event handlers
 
 NOTE: Bad tick cleaning removed from chart display - data must be clean in database!
@@ -16,11 +17,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional, TYPE_CHECKING
+from typing import Optional
 
-if TYPE_CHECKING:
-    import pandas as pd
+import pandas as pd
 
+from .chart_data_buffer import ChartDataBuffer
 from .data_loading_series import DataLoadingSeries
 from .data_loading_resolution import DataLoadingResolution
 from .data_loading_symbol import DataLoadingSymbol
@@ -41,6 +42,8 @@ class DataLoadingMixin:
         self._series = DataLoadingSeries(parent=self)
         self._resolution = DataLoadingResolution(parent=self)
         self._symbol_loader = DataLoadingSymbol(parent=self)
+        # Bounded chart series (full-resolution recent bars + aggregated history)
+        self._data_buffer = ChartDataBuffer()
 
     # =============================================================================
     # PUBLIC API - DELEGATES TO HELPERS
@@ -60,7 +63,7 @@ class DataLoadingMixin:
 
         try:
             data = self._series.prepare_chart_data(data)
-            candle_data, volume_data = self._series.build_chart_series(data)
+            candle_data, volume_data = self._series.build_chart_series(self._series.display_frame(data))
             # Issue #5: Pass volume_data to create volume panel
             self._series.update_chart_series(candle_data, volume_data)
             self.volume_data = volume_data
@@ -125,6 +128,26 @@ class DataLoadingMixin:
         except Exception as e:
             logger.error(f"Failed to load chart: {e}")
 
+    def _on_visible_range_changed(self, start: float, end: float):
+        """Load full-resolution history when the user scrolls into aggregated bars.
+
+        Args:
+            start: First visible time (Unix seconds, UTC)
+            end: Last visible time (Unix seconds, UTC)
+        """
+        buffer = getattr(self, '_data_buffer', None)
+        if buffer is None or self._symbol_loader.detail_loading:
+            return
+        window = buffer.detail_window(
+            pd.Timestamp(start, unit='s', tz='UTC'), pd.Timestamp(end, unit='s', tz='UTC')
+        )
+        if window is None:
+            return
+        try:
+            asyncio.ensure_future(self._symbol_loader.load_history_detail(*window))
+        except Exception as e:
+            logger.error(f"Failed to schedule history detail load: {e}")
+
     def _on_refresh(self):
         """Refresh current chart and all active indicators."""
         if self.data is not None:
@@ -6,9 +6,11 @@ Module 3/6 of data_loading_mixin.py split.
 
 Contains:
 - prepare_chart_data(): Clean and store data
+- display_frame(): Bounded candle series shown in the chart
 - build_chart_series(): Convert DataFrame to candles + volume
 - update_chart_series(): Send data to JavaScript chart
 - finalize_chart_load(): Update UI after load
+- resend_chart_series(): Replace chart series after buffer changes
 """
 
 from __future__ import annotations
@@ -70,6 +72,12 @@ class DataLoadingSeries:
                 hours = hours_map.get(period, 1)
                 data = self._filter_to_last_hours(data, hours)
 
+        # data stays at full resolution (capped); only the chart series is aggregated
+        buffer = getattr(self.parent, '_data_buffer', None)
+        if buffer is not None and not data.empty:
+            data = buffer.trim_frame(data)
+            buffer.load(data)
+
         self.parent.data = data
         if len(data) > 0 and 'close' in data.columns:
             # Only set _last_price if not already streaming (prevents overwriting live price)
@@ -154,6 +162,13 @@ class DataLoadingSeries:
             logger.error(f"Failed to filter to last {hours}h: {exc}")
             return data  # Return original data on error
 
+    def display_frame(self, data: "pd.DataFrame") -> "pd.DataFrame":
+        """Series to send to the chart: older bars OHLC-aggregated by the data buffer."""
+        buffer = getattr(self.parent, '_data_buffer', None)
+        if buffer is None or not len(buffer):
+            return data
+        return buffer.to_frame()
+
     def build_chart_series(self, data: "pd.DataFrame") -> tuple[list[dict], list[dict]]:
         """Convert DataFrame to candle + volume series.
 
@@ -206,6 +221,11 @@ class DataLoadingSeries:
         """
         skip_fit = getattr(self.parent, '_skip_fit_content', False)
 
+        # Drop live updates still queued for the previous data set
+        scheduler = getattr(self.parent, '_render_scheduler', None)
+        if scheduler is not None:
+            scheduler.clear()
+
         if skip_fit:
             logger.info("📌 Setting suppressFitContent=true in JavaScript")
             self.parent._execute_js("window.chartAPI.setSuppressFitContent(true);")
@@ -259,3 +279,18 @@ class DataLoadingSeries:
                 self.parent.update_all_stats_labels(data)
             except Exception as e:
                 logger.warning(f"Failed to update stats labels: {e}")
+
+    def resend_chart_series(self) -> None:
+        """Replace candles, volume and indicators after the data buffer changed.
+
+        Keeps the visible time range (no fitContent).
+        """
+        data = self.parent.data
+        if data is None or data.empty:
+            return
+        candle_data, volume_data = self.build_chart_series(self.display_frame(data))
+        self.parent._execute_js(f"window.chartAPI.replaceData({json.dumps(candle_data)});")
+        if volume_data:
+            self.parent._execute_js(f"window.chartAPI.setPanelData('volume', {json.dumps(volume_data)});")
+        self.parent.volume_data = volume_data
+        self.parent._update_indicators()
@@ -9,6 +9,7 @@ Contains:
 - log_request_details(): Log data request details
 - set_loaded_status(): Update status label
 - restart_live_stream(): Restart streaming after symbol change
+- load_history_detail(): Load full-resolution bars for scrolled-back history
 """
 
 from __future__ import annotations
@@ -17,6 +18,8 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Optional
 
+import pandas as pd
+
 if TYPE_CHECKING:
     from src.core.market_data.types import AssetClass
 
@@ -32,6 +35,7 @@ class DataLoadingSymbol:
             parent: DataLoadingMixin Instanz
         """
         self.parent = parent
+        self.detail_loading = False
 
     async def load_symbol(self, symbol: str, data_provider: Optional[str] = None):
         """Load symbol data and display chart.
@@ -195,3 +199,61 @@ class DataLoadingSymbol:
         await self.parent._stop_live_stream()
         await asyncio.sleep(0.5)
         await self.parent._start_live_stream()
+
+    async def load_history_detail(self, start, end) -> None:
+        """Load full-resolution bars for a range of aggregated history.
+
+        Taken from the widget's data when it still covers the range,
+        otherwise fetched from the history manager.
+
+        Args:
+            start: Range start (UTC pd.Timestamp)
+            end: Range end (UTC pd.Timestamp, exclusive)
+        """
+        symbol = self.parent.current_symbol
+        if not symbol:
+            return
+        self.detail_loading = True
+        try:
+            detail = self._detail_from_data(start, end)
+            source_used = "chart data"
+            if detail is None:
+                if not self.parent.history_manager:
+                    return
+                from src.core.market_data.history_provider import DataRequest
+
+                request = DataRequest(
+                    symbol=symbol,
+                    start_date=start.to_pydatetime(),
+                    end_date=end.to_pydatetime(),
+                    timeframe=self.parent._resolution.resolve_timeframe(),
+                    asset_class=self.parent.current_asset_class,
+                    source=self.parent.current_data_source,
+                )
+                bars, source_used = await self.parent.history_manager.fetch_data(request)
+                if not bars or symbol != self.parent.current_symbol:
+                    return
+                detail = self.parent._resolution.bars_to_dataframe(bars)
+
+            merged = self.parent._data_buffer.merge_detail(detail)
+            if merged:
+                logger.info(f"Loaded {merged} full-resolution bars for {symbol} history from {source_used}")
+                self.parent._series.resend_chart_series()
+        except Exception as e:
+            logger.error(f"Error loading history detail: {e}", exc_info=True)
+        finally:
+            self.detail_loading = False
+
+    def _detail_from_data(self, start, end):
+        """Slice [start, end) from the widget's data; None if data starts later."""
+        data = self.parent.data
+        if data is None or data.empty:
+            return None
+        index = pd.DatetimeIndex(data.index)
+        if index.tz is None:
+            start, end = start.tz_localize(None), end.tz_localize(None)
+        else:
+            start, end = start.tz_convert(index.tz), end.tz_convert(index.tz)
+        if index[0] > start:
+            return None
+        return data[(index >= start) & (index < end)]
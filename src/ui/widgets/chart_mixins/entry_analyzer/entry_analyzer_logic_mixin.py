@@ -65,6 +65,7 @@ class EntryAnalyzerLogicMixin:
 
         if data is not None and hasattr(data, "iterrows"):
             try:
+                from src.analysis.candle_frame import CandleFrame
                 from src.ui.widgets.chart_mixins.data_loading_utils import (
                     get_local_timezone_offset_seconds,
                 )
@@ -72,25 +73,8 @@ class EntryAnalyzerLogicMixin:
                 local_offset = get_local_timezone_offset_seconds()
                 has_time_column = "time" in data.columns
 
-                for idx, row in data.iterrows():
-                    if has_time_column:
-                        timestamp = int(row.get("time", 0))
-                    else:
-                        timestamp = 0
-                        if hasattr(idx, "timestamp"):
-                            timestamp = int(idx.timestamp()) + local_offset
-                        elif isinstance(idx, (int, float)):
-                            timestamp = int(idx)
-
-                    candle = {
-                        "timestamp": timestamp,
-                        "open": float(row.get("open", 0)),
-                        "high": float(row.get("high", 0)),
-                        "low": float(row.get("low", 0)),
-                        "close": float(row.get("close", 0)),
-                        "volume": float(row.get("volume", 0)),
-                    }
-                    candles.append(candle)
+                # Columnar conversion (no per-row iteration over the DataFrame)
+                candles = CandleFrame.from_dataframe(data, local_offset).to_candles()
                 debug_logger.info(
                     "EntryAnalyzer: extracted %d candles (has_time_column=%s, local_offset=%s)",
                     len(candles),
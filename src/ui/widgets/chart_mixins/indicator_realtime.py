@@ -13,11 +13,13 @@ Contains:
 - update_macd_realtime(): MACD realtime update
 - update_multi_series_realtime(): Multi-series realtime update
 - update_single_series_realtime(): Single-series realtime update
+
+Points are queued on the chart's ChartRenderScheduler and sent with the
+next render frame.
 """
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING
 
@@ -27,6 +29,7 @@ if TYPE_CHECKING:
     from .indicator_utils import IndicatorInstance
 
 from src.core.indicators.engine import IndicatorConfig
+from .chart_render_scheduler import get_render_scheduler
 from .data_loading_utils import get_local_timezone_offset_seconds
 from .indicator_utils import _ts_to_local_unix
 
@@ -100,13 +103,33 @@ class IndicatorRealtime:
     def update_realtime_row(self, new_row: pd.DataFrame) -> None:
         """Update data with new row (update or append).
 
+        The chart's display series (data buffer) is updated alongside;
+        data itself stays at full resolution, capped by evicting the
+        oldest bars.
+
         Args:
             new_row: DataFrame with single row to add/update
         """
-        if new_row.index[0] in self.parent.data.index:
-            self.parent.data.loc[new_row.index[0]] = new_row.iloc[0]
+        buffer = getattr(self.parent, '_data_buffer', None)
+        compacted = False
+        if buffer is not None and len(buffer):
+            row = new_row.iloc[0]
+            compactions = buffer.compactions
+            buffer.upsert(new_row.index[0], row['open'], row['high'], row['low'], row['close'])
+            compacted = buffer.compactions != compactions
+
+        data = self.parent.data
+        if new_row.index[0] in data.index:
+            # Only the OHLC columns: keeps any extra columns of the row
+            data.loc[new_row.index[0], new_row.columns] = new_row.iloc[0].to_numpy()
         else:
-            self.parent.data = pd.concat([self.parent.data, new_row])
+            new_row.index.name = data.index.name
+            data = pd.concat([data, new_row])
+            self.parent.data = buffer.trim_frame(data) if buffer is not None else data
+
+        if compacted:
+            # Oldest bars were aggregated: shrink the chart series as well
+            self.parent._series.resend_chart_series()
 
     def update_indicator_realtime(self, inst: "IndicatorInstance") -> None:
         """Update single indicator in realtime.
@@ -135,6 +158,7 @@ class IndicatorRealtime:
         last_idx = result.values.index[-1]
         time_unix = _ts_to_local_unix(last_idx)
         panel_id = instance_id.lower()
+        scheduler = get_render_scheduler(self.parent)
 
         col_names = result.values.columns.tolist()
         macd_col = signal_col = hist_col = None
@@ -149,26 +173,19 @@ class IndicatorRealtime:
 
         if hist_col:
             hist_val = float(result.values.loc[last_idx, hist_col])
-            hist_point = json.dumps({
+            scheduler.update_panel(panel_id, {
                 'time': time_unix,
                 'value': hist_val,
                 'color': '#26a69a' if hist_val >= 0 else '#ef5350'
             })
-            self.parent._execute_js(f"window.chartAPI.updatePanelData('{panel_id}', {hist_point});")
 
         if macd_col:
             macd_val = float(result.values.loc[last_idx, macd_col])
-            macd_point = json.dumps({'time': time_unix, 'value': macd_val})
-            self.parent._execute_js(
-                f"window.chartAPI.updatePanelSeriesData('{panel_id}', 'macd', {macd_point});"
-            )
+            scheduler.update_panel_series(panel_id, 'macd', {'time': time_unix, 'value': macd_val})
 
         if signal_col:
             signal_val = float(result.values.loc[last_idx, signal_col])
-            signal_point = json.dumps({'time': time_unix, 'value': signal_val})
-            self.parent._execute_js(
-                f"window.chartAPI.updatePanelSeriesData('{panel_id}', 'signal', {signal_point});"
-            )
+            scheduler.update_panel_series(panel_id, 'signal', {'time': time_unix, 'value': signal_val})
 
     def update_multi_series_realtime(
         self, instance_id: str, is_overlay: bool, display_name: str, result
@@ -184,13 +201,8 @@ class IndicatorRealtime:
         last_idx = result.values.index[-1]
         time_unix = _ts_to_local_unix(last_idx)
         main_val = float(result.values.iloc[-1, 0])
-        point = json.dumps({'time': time_unix, 'value': main_val})
-
-        if is_overlay:
-            self.parent._execute_js(f"window.chartAPI.updateIndicator('{display_name}', {point});")
-        else:
-            panel_id = instance_id.lower()
-            self.parent._execute_js(f"window.chartAPI.updatePanelData('{panel_id}', {point});")
+        point = {'time': time_unix, 'value': main_val}
+        self._queue_series_point(instance_id, is_overlay, display_name, point)
 
     def update_single_series_realtime(
         self, instance_id: str, is_overlay: bool, display_name: str, result
@@ -206,10 +218,22 @@ class IndicatorRealtime:
         last_idx = result.values.index[-1]
         value = float(result.values.iloc[-1])
         time_unix = _ts_to_local_unix(last_idx)
-        point = json.dumps({'time': time_unix, 'value': value})
+        point = {'time': time_unix, 'value': value}
+        self._queue_series_point(instance_id, is_overlay, display_name, point)
 
+    def _queue_series_point(
+        self, instance_id: str, is_overlay: bool, display_name: str, point: dict
+    ) -> None:
+        """Queue the latest point of an indicator for the next render frame.
+
+        Args:
+            instance_id: Instance ID
+            is_overlay: True if overlay, False if oscillator
+            display_name: Display name
+            point: Point dict with time and value
+        """
+        scheduler = get_render_scheduler(self.parent)
         if is_overlay:
-            self.parent._execute_js(f"window.chartAPI.updateIndicator('{display_name}', {point});")
+            scheduler.update_indicator(display_name, point)
         else:
-            panel_id = instance_id.lower()
-            self.parent._execute_js(f"window.chartAPI.updatePanelData('{panel_id}', {point});")
+            scheduler.update_panel(instance_id.lower(), point)
@@ -4,7 +4,6 @@ Contains live streaming and market event handling methods.
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime, timezone
 
@@ -12,6 +11,7 @@ import pandas as pd
 from PyQt6.QtCore import pyqtSlot
 
 from src.common.event_bus import Event
+from .chart_render_scheduler import get_render_scheduler
 from .data_loading_mixin import get_local_timezone_offset_seconds
 
 logger = logging.getLogger(__name__)
@@ -116,7 +116,7 @@ class StreamingMixin:
             volume_bar = self._build_volume_payload(price)
 
             self._execute_chart_updates(candle, volume_bar)
-            self._update_indicators_realtime(candle)
+            get_render_scheduler(self).request_indicators(candle)
             self._emit_tick_price_updated(price)
 
             # Issue #26: Update price labels on tick
@@ -311,10 +311,10 @@ class StreamingMixin:
         }
 
     def _execute_chart_updates(self, candle: dict, volume_bar: dict) -> None:
-        candle_json = json.dumps(candle)
-        volume_json = json.dumps(volume_bar)
-        self._execute_js(f"window.chartAPI.updateCandle({candle_json});")
-        self._execute_js(f"window.chartAPI.updatePanelData('volume', {volume_json});")
+        # Coalesced per frame: superseded ticks of the same candle are dropped
+        scheduler = get_render_scheduler(self)
+        scheduler.update_candle(candle)
+        scheduler.update_volume(volume_bar)
 
     def _emit_tick_price_updated(self, price: float) -> None:
         if hasattr(self, 'tick_price_updated'):
@@ -378,12 +378,8 @@ class StreamingMixin:
                     'color': vol_colors['bullish'] if is_bullish else vol_colors['bearish']
                 }
 
-                # Update chart
-                candle_json = json.dumps(candle)
-                volume_json = json.dumps(volume)
-
-                self._execute_js(f"window.chartAPI.updateCandle({candle_json});")
-                self._execute_js(f"window.chartAPI.updatePanelData('volume', {volume_json});")
+                # Update chart (with the next render frame)
+                self._execute_chart_updates(candle, volume)
 
         except Exception as e:
             logger.error(f"Error processing updates: {e}", exc_info=True)
@@ -49,7 +49,7 @@ class EventBusMixin:
             event_bus.subscribe(EventType.STOP_LOSS_HIT, self._on_stop_loss_hit)
             event_bus.subscribe(EventType.TAKE_PROFIT_HIT, self._on_take_profit_hit)
             event_bus.subscribe(EventType.ORDER_FILLED, self._on_order_filled)
-            event_bus.subscribe(EventType.MARKET_BAR, self._on_market_bar)
+            event_bus.subscribe(EventType.MARKET_BAR, self._on_market_bar, symbol=self.symbol)
 
             # Connect to chart widget's symbol change signal
             if hasattr(self, 'chart_widget') and hasattr(self.chart_widget, 'signals'):
@@ -71,6 +71,9 @@ class EventBusMixin:
 
         # Update window title
         self.setWindowTitle(f"Chart - {new_symbol}")
+        event_bus.move_symbol_subscription(
+            EventType.MARKET_BAR, self._on_market_bar, self.symbol, new_symbol
+        )
         self.symbol = new_symbol
 
         # Update bot panel if available
@@ -275,7 +278,7 @@ class EventBusMixin:
             event_bus.unsubscribe(EventType.STOP_LOSS_HIT, self._on_stop_loss_hit)
             event_bus.unsubscribe(EventType.TAKE_PROFIT_HIT, self._on_take_profit_hit)
             event_bus.unsubscribe(EventType.ORDER_FILLED, self._on_order_filled)
-            event_bus.unsubscribe(EventType.MARKET_BAR, self._on_market_bar)
+            event_bus.unsubscribe(EventType.MARKET_BAR, self._on_market_bar, symbol=self.symbol)
 
             logger.info(f"Event bus unsubscribed for {self.symbol} chart")
 
@@ -2,17 +2,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import queue
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from src.core.jobs import JobEvent, JobEventType, JobKind, get_job_client
+
 if TYPE_CHECKING:
     from src.core.simulator import SimulationResult, OptimizationRun
 
 logger = logging.getLogger(__name__)
 
+JOB_EVENT_POLL_S = 1.0  # Seconds between job server liveness checks while waiting for events
+
 class SimulationWorker(QThread):
     """Worker thread for running simulations."""
 
@@ -58,6 +63,10 @@ class SimulationWorker(QThread):
         position_size_pct: float = 1.0,
         # Leverage
         leverage: float = 1.0,
+        # Optimization in the job server process (parallel, resumable studies)
+        use_job_server: bool = True,
+        n_workers: int | None = None,
+        resume: bool = True,
     ):
         super().__init__()
         self.data = data
@@ -94,12 +103,19 @@ class SimulationWorker(QThread):
         self.position_size_pct = position_size_pct
         # Leverage
         self.leverage = leverage
+        # Optimization in the job server process
+        self.use_job_server = use_job_server
+        self.n_workers = n_workers
+        self.resume = resume
         self._cancelled = False
         self._optimizer = None  # type: ignore[var-annotated]
+        self._job_id: str | None = None
 
     def cancel(self):
         """Cancel running simulation."""
         self._cancelled = True
+        if self._job_id is not None:
+            get_job_client().cancel(self._job_id)
         if self._optimizer and hasattr(self._optimizer, "cancel"):
             try:
                 self._optimizer.cancel()
@@ -291,6 +307,14 @@ class SimulationWorker(QThread):
         total_runs: int,
         is_all: bool,
     ) -> list[object]:
+        if self.use_job_server:
+            configs = [
+                self._optimization_config(OptimizationConfig, strategy, side)
+                for strategy in strategies
+                for side in sides
+            ]
+            return self._run_optimization_in_job_server(configs, is_all)
+
         results: list[object] = []
         run_index = 0
 
@@ -304,15 +328,7 @@ class SimulationWorker(QThread):
 
                 run_index += 1
                 self.strategy_started.emit(run_index, total_runs, strategy.value, side)
-                objective_metric = "entry_score" if self.entry_only else self.objective_metric
-                config = OptimizationConfig(
-                    strategy_name=strategy,
-                    objective_metric=objective_metric,
-                    direction="maximize",
-                    n_trials=self.opt_trials,
-                    entry_only=self.entry_only,
-                    entry_side=side,
-                )
+                config = self._optimization_config(OptimizationConfig, strategy, side)
 
                 optimizer = (
                     BayesianOptimizer(self.data, self.symbol, config)
@@ -335,3 +351,57 @@ class SimulationWorker(QThread):
             if self._cancelled:
                 break
         return results
+
+    def _optimization_config(self, OptimizationConfig, strategy, side: str):
+        objective_metric = "entry_score" if self.entry_only else self.objective_metric
+        return OptimizationConfig(
+            strategy_name=strategy,
+            objective_metric=objective_metric,
+            direction="maximize",
+            n_trials=self.opt_trials,
+            n_jobs=-1,  # Trials on a process pool (all CPUs)
+            entry_only=self.entry_only,
+            entry_side=side,
+        )
+
+    def _run_optimization_in_job_server(self, configs: list, is_all: bool) -> list[object]:
+        """Run the optimization runs as one job in the job server process.
+
+        Returns:
+            OptimizationRun per finished run (partial on cancel)
+        """
+        events: queue.Queue[JobEvent] = queue.Queue()
+        payload = {
+            "data": self.data,
+            "symbol": self.symbol,
+            "mode": self.mode,
+            "configs": configs,
+            "max_combinations": self.opt_trials,
+            "n_workers": self.n_workers,
+            "resume": self.resume,
+        }
+        client = get_job_client()
+        self._job_id = client.submit(JobKind.SIMULATOR_OPTIMIZATION, payload, events.put)
+        if self._cancelled:
+            client.cancel(self._job_id)
+
+        try:
+            for event in client.iter_events(self._job_id, events, poll_s=JOB_EVENT_POLL_S):
+                if event.type == JobEventType.PROGRESS:
+                    data = event.data
+                    if "run" in data:
+                        self.strategy_started.emit(
+                            data["run"], data["total_runs"], data["strategy"], data["side"]
+                        )
+                    elif "trial" in data:
+                        self.progress.emit(data["trial"], data["total"], data["best_score"])
+                    elif "run_result" in data and is_all:
+                        self.partial_result.emit(data["run_result"])
+                elif event.type in (JobEventType.COMPLETED, JobEventType.CANCELLED):
+                    return event.data["result"]
+                elif event.type == JobEventType.FAILED:
+                    logger.error("Simulator optimization job failed:\n%s", event.data["traceback"])
+                    raise RuntimeError(event.data["error"])
+        finally:
+            self._job_id = None
+        return []
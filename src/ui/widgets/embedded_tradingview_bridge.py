@@ -26,6 +26,8 @@ class ChartBridge(QObject):
     line_draw_requested = pyqtSignal(str, float, str, str)  # (line_id, price, color, line_type)
     # New: Signal for vertical line
     vline_draw_requested = pyqtSignal(str, float, str)  # (line_id, timestamp, color)
+    # Signal emitted when the visible time range settles (for on-demand history detail)
+    visible_range_changed = pyqtSignal(float, float)  # (from, to)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -115,6 +117,16 @@ class ChartBridge(QObject):
         logger.info(f"[ChartBridge] Vertical line draw request: {line_id} @ {timestamp}")
         self.vline_draw_requested.emit(line_id, timestamp, color)
 
+    @pyqtSlot(float, float)
+    def onVisibleRangeChanged(self, start: float, end: float):
+        """Called from JavaScript after the user scrolled or zoomed (debounced).
+
+        Args:
+            start: First visible Unix timestamp
+            end: Last visible Unix timestamp
+        """
+        self.visible_range_changed.emit(start, end)
+
     @pyqtSlot(str, result=str)
     def pickColor(self, current_color: str = "rgba(13,110,253,0.18)") -> str:
         """Open QColorDialog and return the chosen color in CSS rgba format.
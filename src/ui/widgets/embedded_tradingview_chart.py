@@ -19,7 +19,6 @@ except ImportError:
     logging.warning("PyQt6-WebEngine not installed. Chart widget will not work.")
 
 from src.chart_marking import ChartMarkingMixin
-from src.common.event_bus import EventType, event_bus
 from src.core.indicators.engine import IndicatorEngine
 from src.core.market_data.types import AssetClass, DataSource
 
@@ -175,10 +174,9 @@ class EmbeddedTradingViewChart(
         self._tick_received.connect(self._handle_tick_main_thread)
         self._bar_received.connect(self._handle_bar_main_thread)
 
-        # Subscribe to events - these emit signals for thread safety
-        event_bus.subscribe(EventType.MARKET_BAR, self._on_market_bar_event)
-        event_bus.subscribe(EventType.MARKET_TICK, self._on_market_tick_event)
-        event_bus.subscribe(EventType.MARKET_DATA_TICK, self._on_market_tick_event)
+        # Subscribe to the current symbol's topics - these emit signals for thread safety
+        # (subscriptions follow current_symbol, other symbols never reach this chart)
+        self._subscribe_market_topics()
 
         # Initialize Market Sessions Overlay
         self.market_overlay = MarketSessionsOverlay(self)
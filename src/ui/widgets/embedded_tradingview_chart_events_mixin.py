@@ -4,10 +4,40 @@ import logging
 
 from PyQt6.QtWidgets import QInputDialog
 
+from src.common.event_bus import EventType, event_bus
+
 logger = logging.getLogger(__name__)
 
+# Market data topics the chart consumes for its current symbol
+_MARKET_TOPICS = (
+    (EventType.MARKET_BAR, "_on_market_bar_event"),
+    (EventType.MARKET_TICK, "_on_market_tick_event"),
+    (EventType.MARKET_DATA_TICK, "_on_market_tick_event"),
+)
+
 class EmbeddedTradingViewChartEventsMixin:
     """EmbeddedTradingViewChartEventsMixin extracted from EmbeddedTradingViewChart."""
+    @property
+    def current_symbol(self):
+        return getattr(self, "_current_symbol", None)
+
+    @current_symbol.setter
+    def current_symbol(self, symbol):
+        """Set displayed symbol and move market data subscriptions to its topic."""
+        previous = getattr(self, "_current_symbol", None)
+        self._current_symbol = symbol
+        if getattr(self, "_market_topics_subscribed", False):
+            for event_type, handler in _MARKET_TOPICS:
+                event_bus.move_symbol_subscription(
+                    event_type, getattr(self, handler), previous, symbol
+                )
+
+    def _subscribe_market_topics(self):
+        """Subscribe to bar/tick events of the current symbol only."""
+        for event_type, handler in _MARKET_TOPICS:
+            event_bus.subscribe(event_type, getattr(self, handler), symbol=self.current_symbol)
+        self._market_topics_subscribed = True
+
     def _on_market_tick_event(self, event):
         """Event bus callback - emit signal for thread-safe handling."""
         # This may be called from background thread, so emit signal
@@ -13,6 +13,9 @@ class EmbeddedTradingViewChartLoadingMixin:
         if success:
             self.page_loaded = True
             logger.info("Chart page loaded successfully")
+            # A (re)loaded page has no markings: next marking batch is a full sync
+            if hasattr(self, "resync_markings"):
+                self.resync_markings()
             self._start_chart_ready_poll()
         else:
             logger.error("Chart page failed to load")
@@ -71,6 +71,9 @@ class EmbeddedTradingViewChartUIMixin:
             self._chart_bridge.line_draw_requested.connect(self._on_line_draw_requested)
         if hasattr(self._chart_bridge, "vline_draw_requested"):
             self._chart_bridge.vline_draw_requested.connect(self._on_vline_draw_requested)
+        # Load full-resolution history when scrolling back into aggregated bars
+        if hasattr(self, "_on_visible_range_changed"):
+            self._chart_bridge.visible_range_changed.connect(self._on_visible_range_changed)
         # Also expose as self.bridge for compatibility
         self.bridge = self._chart_bridge
         self._web_channel = QWebChannel(self.web_view.page())
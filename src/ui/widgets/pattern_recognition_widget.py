@@ -646,7 +646,13 @@ class PatternRecognitionWidget(QWidget):
         """Subscribe to event bus for auto-updates on new market data."""
         try:
             # Subscribe to MARKET_BAR for automatic pattern DB updates
-            event_bus.subscribe(EventType.MARKET_BAR, self._on_market_bar)
+            # (only the chart window's symbol topic if attached to a chart)
+            self._market_bar_symbol = self._chart_symbol()
+            event_bus.subscribe(EventType.MARKET_BAR, self._on_market_bar, symbol=self._market_bar_symbol)
+            if self._market_bar_symbol is not None:
+                signals = getattr(getattr(self.chart_window, 'chart_widget', None), 'signals', None)
+                if signals is not None and hasattr(signals, 'symbolChanged'):
+                    signals.symbolChanged.connect(self._on_chart_symbol_changed)
 
             # Subscribe to pattern DB update events for progress tracking
             event_bus.subscribe(EventType.PATTERN_DB_UPDATE_STARTED, self._on_db_update_started)
@@ -662,7 +668,10 @@ class PatternRecognitionWidget(QWidget):
     def _unsubscribe_events(self):
         """Unsubscribe from all event bus events."""
         try:
-            event_bus.unsubscribe(EventType.MARKET_BAR, self._on_market_bar)
+            event_bus.unsubscribe(
+                EventType.MARKET_BAR, self._on_market_bar,
+                symbol=getattr(self, '_market_bar_symbol', None)
+            )
             event_bus.unsubscribe(EventType.PATTERN_DB_UPDATE_STARTED, self._on_db_update_started)
             event_bus.unsubscribe(EventType.PATTERN_DB_UPDATE_PROGRESS, self._on_db_update_progress)
             event_bus.unsubscribe(EventType.PATTERN_DB_UPDATE_COMPLETE, self._on_db_update_complete)
@@ -673,6 +682,19 @@ class PatternRecognitionWidget(QWidget):
         except Exception as e:
             logger.error(f"Error unsubscribing from events: {e}", exc_info=True)
 
+    def _chart_symbol(self) -> Optional[str]:
+        """Symbol of the attached chart window (None = no chart, all symbols)."""
+        if self.chart_window and hasattr(self.chart_window, 'symbol'):
+            return self.chart_window.symbol
+        return None
+
+    def _on_chart_symbol_changed(self, new_symbol: str) -> None:
+        """Follow the chart window's symbol with the MARKET_BAR topic subscription."""
+        event_bus.move_symbol_subscription(
+            EventType.MARKET_BAR, self._on_market_bar, self._market_bar_symbol, new_symbol
+        )
+        self._market_bar_symbol = new_symbol
+
     def _on_market_bar(self, event: Event):
         """Handle MARKET_BAR event - trigger auto-update if conditions met.
 
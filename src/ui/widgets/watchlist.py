@@ -89,6 +89,14 @@ class WatchlistWidget(QWidget):
         """Setup event bus handlers (delegiert)."""
         return self._events.setup_event_handlers()
 
+    def subscribe_symbol(self, symbol: str):
+        """Subscribe to market data topics of a symbol (delegiert)."""
+        return self._events.subscribe_symbol(symbol)
+
+    def unsubscribe_symbol(self, symbol: str):
+        """Unsubscribe from market data topics of a symbol (delegiert)."""
+        return self._events.unsubscribe_symbol(symbol)
+
     # === Price Updates (Delegiert) ===
 
     def update_prices(self):
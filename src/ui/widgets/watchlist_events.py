@@ -4,6 +4,7 @@ Refactored from watchlist.py.
 
 Contains:
 - setup_event_handlers
+- subscribe_symbol / unsubscribe_symbol (per-symbol topics)
 - on_market_tick (async)
 - on_market_bar (async)
 """
@@ -28,9 +29,19 @@ class WatchlistEvents:
         self.parent = parent
 
     def setup_event_handlers(self):
-        """Setup event bus handlers."""
-        event_bus.subscribe(EventType.MARKET_TICK, self.on_market_tick)
-        event_bus.subscribe(EventType.MARKET_BAR, self.on_market_bar)
+        """Setup event bus handlers for all watched symbols."""
+        for symbol in self.parent.symbols:
+            self.subscribe_symbol(symbol)
+
+    def subscribe_symbol(self, symbol: str):
+        """Receive tick/bar events of a watched symbol."""
+        event_bus.subscribe(EventType.MARKET_TICK, self.on_market_tick, symbol=symbol)
+        event_bus.subscribe(EventType.MARKET_BAR, self.on_market_bar, symbol=symbol)
+
+    def unsubscribe_symbol(self, symbol: str):
+        """Stop receiving tick/bar events of a removed symbol."""
+        event_bus.unsubscribe(EventType.MARKET_TICK, self.on_market_tick, symbol=symbol)
+        event_bus.unsubscribe(EventType.MARKET_BAR, self.on_market_bar, symbol=symbol)
 
     async def on_market_tick(self, event: Event):
         """Handle market tick events."""
@@ -68,6 +68,7 @@ class WatchlistSymbolManager:
 
         # Add to list
         self.parent.symbols.append(symbol)
+        self.parent.subscribe_symbol(symbol)
         self.parent.symbol_data[symbol] = {
             "name": name,
             "wkn": wkn
@@ -126,6 +127,7 @@ class WatchlistSymbolManager:
 
         # Remove from list
         self.parent.symbols.remove(symbol)
+        self.parent.unsubscribe_symbol(symbol)
         if symbol in self.parent.symbol_data:
             del self.parent.symbol_data[symbol]
 
@@ -154,6 +156,8 @@ class WatchlistSymbolManager:
         )
 
         if reply == QMessageBox.StandardButton.Yes:
+            for symbol in self.parent.symbols:
+                self.parent.unsubscribe_symbol(symbol)
             self.parent.symbols.clear()
             self.parent.symbol_data.clear()
             self.parent.table.setRowCount(0)
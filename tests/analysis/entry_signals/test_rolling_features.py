@@ -0,0 +1,126 @@
+"""Tests for the incremental RollingFeatures state and live re-analysis."""
+
+import numpy as np
+import pytest
+
+from src.analysis.entry_signals.entry_signal_engine import (
+    OptimParams,
+    RegimeType,
+    RollingFeatures,
+    calculate_features,
+)
+from src.analysis.indicator_optimization.optimizer import FastOptimizer
+from src.analysis.visible_chart.analyzer import VisibleChartAnalyzer
+from src.analysis.visible_chart.cache import AnalyzerCache
+from src.analysis.visible_chart.types import VisibleRange
+
+
+@pytest.fixture
+def candles():
+    """Deterministic random-walk candles."""
+    rng = np.random.default_rng(11)
+    closes = 100.0 + np.cumsum(rng.normal(0, 0.3, 300))
+    return [
+        {
+            "timestamp": 1_700_000_000 + i * 60,
+            "open": float(closes[i - 1] if i else closes[0]),
+            "high": float(closes[i] + abs(rng.normal(0, 0.2))),
+            "low": float(closes[i] - abs(rng.normal(0, 0.2))),
+            "close": float(closes[i]),
+            "volume": float(1000 + rng.integers(0, 500)),
+        }
+        for i in range(len(closes))
+    ]
+
+
+def _assert_features_equal(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key in expected:
+        np.testing.assert_allclose(actual[key], expected[key], rtol=1e-9, atol=1e-12, err_msg=key)
+
+
+def test_append_matches_full_calculation(candles):
+    params = OptimParams()
+    rolling = RollingFeatures.build(candles[:150], params)
+
+    for i in range(150, 250):
+        assert rolling.append([candles[i]]) == 1
+    rolling.append(candles[250:])
+
+    assert len(rolling) == len(candles)
+    assert rolling.bar_count == len(candles)
+    _assert_features_equal(rolling.features, calculate_features(candles, params))
+
+
+def test_short_window_rebuilds_until_warm(candles):
+    params = OptimParams()
+    rolling = RollingFeatures.build(candles[:5], params)
+
+    for c in candles[5:120]:
+        rolling.append([c])
+
+    _assert_features_equal(rolling.features, calculate_features(candles[:120], params))
+
+
+def test_duplicate_and_old_bars_are_ignored(candles):
+    rolling = RollingFeatures.build(candles[:200], OptimParams())
+
+    assert rolling.append(candles[150:200]) == 0
+    assert rolling.append(candles[190:202]) == 2
+    assert rolling.last_timestamp == candles[201]["timestamp"]
+
+
+def test_head_drop_keeps_tail_values(candles):
+    params = OptimParams()
+    reference = RollingFeatures.build(candles[:100], params, max_bars=1000)
+    rolling = RollingFeatures.build(candles[:100], params, max_bars=100)
+
+    reference.append(candles[100:])
+    rolling.append(candles[100:])
+
+    assert len(rolling) == 100
+    assert rolling.bar_count == len(candles)
+    assert rolling.frame.timestamp[0] == candles[-100]["timestamp"]
+    _assert_features_equal(
+        rolling.features, {key: values[-100:] for key, values in reference.features.items()}
+    )
+
+
+def _visible(candles):
+    return VisibleRange(from_ts=candles[-100]["timestamp"], to_ts=candles[-1]["timestamp"])
+
+
+def test_analyze_incremental_appends_to_cached_state(candles):
+    cache = AnalyzerCache()
+    analyzer = VisibleChartAnalyzer(use_optimizer=False, cache=cache)
+
+    first = analyzer.analyze_incremental(_visible(candles[:250]), "BTCUSDT", "1m", candles[:250])
+    second = analyzer.analyze_incremental(_visible(candles[:251]), "BTCUSDT", "1m", candles[:251])
+
+    assert first.candle_count == 250
+    assert second.candle_count == 251
+    assert cache.get_stats().rolling_hits == 1
+    assert all(e.timestamp >= candles[151]["timestamp"] for e in second.entries)
+
+
+def test_analyze_incremental_reoptimizes_every_n_bars(candles, monkeypatch):
+    calls = []
+    optimize = FastOptimizer.optimize
+
+    def counting_optimize(self, *args, **kwargs):
+        calls.append(kwargs.get("warm_start"))
+        return optimize(self, *args, **kwargs)
+
+    monkeypatch.setattr(FastOptimizer, "optimize", counting_optimize)
+    analyzer = VisibleChartAnalyzer(use_optimizer=True, cache=AnalyzerCache())
+    monkeypatch.setattr(analyzer, "_detect_regime", lambda features: RegimeType.BULL)
+
+    for i in range(240, 260):
+        analyzer.analyze_incremental(
+            _visible(candles[: i + 1]), "BTCUSDT", "1m", candles[: i + 1],
+            reoptimize_every_bars=10, optimizer_budget_ms=20,
+        )
+
+    assert len(calls) == 2
+    assert calls[0] is None
+    assert calls[1] is not None
@@ -0,0 +1,140 @@
+"""Tests for the columnar CandleFrame and its vectorized consumers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.candle_frame import CandleFrame, first_true, forward_windows
+from src.analysis.entry_signals.entry_signal_engine import (
+    EntryEvent,
+    EntrySide,
+    OptimParams,
+    RegimeType,
+    calculate_features,
+)
+from src.analysis.indicator_optimization.optimizer import FastOptimizer
+
+
+@pytest.fixture
+def candles():
+    """Deterministic random-walk candles."""
+    rng = np.random.default_rng(7)
+    closes = 100.0 + np.cumsum(rng.normal(0, 0.3, 400))
+    return [
+        {
+            "timestamp": 1_700_000_000 + i * 60,
+            "open": float(closes[i - 1] if i else closes[0]),
+            "high": float(closes[i] + abs(rng.normal(0, 0.2))),
+            "low": float(closes[i] - abs(rng.normal(0, 0.2))),
+            "close": float(closes[i]),
+            "volume": float(1000 + rng.integers(0, 500)),
+        }
+        for i in range(len(closes))
+    ]
+
+
+def test_from_candles_roundtrip(candles):
+    frame = CandleFrame.from_candles(candles)
+
+    assert len(frame) == len(candles)
+    assert frame.timestamp.dtype == np.int64
+    assert frame.to_candles() == candles
+    assert frame[5] == candles[5]
+
+
+def test_from_dataframe_matches_candles(candles):
+    df = pd.DataFrame(candles)
+    df.index = pd.to_datetime(df.pop("timestamp"), unit="s")
+
+    frame = CandleFrame.from_dataframe(df, local_offset=3600)
+
+    np.testing.assert_array_equal(frame.timestamp, [c["timestamp"] + 3600 for c in candles])
+    np.testing.assert_array_equal(frame.close, [c["close"] for c in candles])
+
+
+def test_slices_are_zero_copy_views(candles):
+    frame = CandleFrame.from_candles(candles)
+
+    part = frame[100:200]
+    by_time = frame.slice_time(candles[100]["timestamp"], candles[199]["timestamp"])
+
+    assert len(part) == 100
+    assert np.shares_memory(part.close, frame.close)
+    np.testing.assert_array_equal(by_time.timestamp, part.timestamp)
+
+
+def test_indices_of(candles):
+    frame = CandleFrame.from_candles(candles)
+    wanted = [candles[0]["timestamp"], candles[42]["timestamp"], 123, candles[-1]["timestamp"]]
+
+    assert frame.indices_of(wanted).tolist() == [0, 42, -1, len(candles) - 1]
+    assert frame.index_of(123) is None
+
+
+def test_forward_windows_and_first_true():
+    values = np.arange(5, dtype=float)
+
+    windows = forward_windows(values, np.array([0, 3]), 3)
+
+    np.testing.assert_array_equal(windows[0], [1, 2, 3])
+    np.testing.assert_array_equal(windows[1], [4, np.nan, np.nan])
+    assert first_true(windows >= 3).tolist() == [2, 0]
+    assert first_true(windows > 9).tolist() == [3, 3]
+
+
+def test_calculate_features_same_for_list_and_frame(candles):
+    params = OptimParams()
+
+    from_list = calculate_features(candles, params)
+    from_frame = calculate_features(CandleFrame.from_candles(candles), params)
+
+    assert from_list.keys() == from_frame.keys()
+    for key in from_list:
+        np.testing.assert_allclose(from_frame[key], from_list[key], rtol=1e-12, err_msg=key)
+
+
+def _evaluate_reference(candles, features, entries, params):
+    """Bar-by-bar TP/SL resolution (pre-vectorization logic)."""
+    ts_to_idx = {c["timestamp"]: i for i, c in enumerate(candles)}
+    highs, lows, closes, atr = features["highs"], features["lows"], features["closes"], features["atr"]
+    wins = resolved = 0
+    for e in entries:
+        idx = ts_to_idx.get(e.timestamp)
+        if idx is None:
+            continue
+        a = max(1e-12, atr[idx])
+        tp, sl = params.eval_tp_atr * a, params.eval_sl_atr * a
+        entry = closes[idx]
+        for j in range(idx + 1, min(len(closes), idx + params.eval_horizon_bars + 1)):
+            if e.side == EntrySide.LONG:
+                stop, target = lows[j] <= entry - sl, highs[j] >= entry + tp
+            else:
+                stop, target = highs[j] >= entry + sl, lows[j] <= entry - tp
+            if stop or target:
+                resolved += 1
+                wins += int(target and not stop)
+                break
+    return wins, resolved
+
+
+def test_vectorized_evaluation_matches_bar_loop(candles):
+    params = OptimParams(min_trades_gate=0, target_trades_soft=10)
+    features = calculate_features(candles, params)
+    entries = [
+        EntryEvent(
+            timestamp=candles[i]["timestamp"],
+            side=EntrySide.LONG if i % 2 else EntrySide.SHORT,
+            confidence=0.6,
+            price=candles[i]["close"],
+            reason_tags=[],
+            regime=RegimeType.SIDEWAYS,
+        )
+        for i in range(20, len(candles), 7)
+    ]
+
+    score = FastOptimizer()._evaluate_entries(CandleFrame.from_candles(candles), features, entries, params)
+
+    wins, resolved = _evaluate_reference(candles, features, entries, params)
+    expected = (wins / max(1, resolved)) * 2.0 + 0.6 * 0.5 - abs(len(entries) - 10) / 10 * 0.7 + 0.05
+    assert resolved >= 3
+    assert score == pytest.approx(expected)
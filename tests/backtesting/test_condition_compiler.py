@@ -0,0 +1,186 @@
+"""Tests for the compiled (boolean mask) JSON condition evaluation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtesting.condition_compiler import ConditionCompiler
+from src.backtesting.phases.simulation_phase import SimulationPhase
+from src.backtesting.schema_types import (
+    Condition,
+    ConditionGroup,
+    ConditionLeftRight,
+    IndicatorDef,
+    RegimeDef,
+    RiskSettings,
+    RoutingMatch,
+    RoutingRule,
+    StrategyDef,
+    StrategyRef,
+    StrategySet,
+    TradingBotConfig,
+)
+
+
+def _cond(indicator_id, op, value=None, ref=None, low=None, high=None) -> Condition:
+    if op == "between":
+        right = ConditionLeftRight(min=low, max=high)
+    elif ref is not None:
+        right = ConditionLeftRight(indicator_id=ref, field="value")
+    else:
+        right = ConditionLeftRight(value=value)
+    return Condition(
+        left=ConditionLeftRight(indicator_id=indicator_id, field="value"), op=op, right=right
+    )
+
+
+INDICATORS = [
+    IndicatorDef(id="rsi", type="RSI", params={}),
+    IndicatorDef(id="ema", type="EMA", params={}),
+    IndicatorDef(id="sma", type="SMA", params={}, timeframe="5m"),
+]
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "rsi_value": [20.0, 50.0, np.nan, 80.0],
+        "ema_value": [1.0, 2.0, 3.0, 4.0],
+        "5m_sma_value": [2.0, 2.0, 2.0, 2.0],
+    })
+
+
+def _row_condition(cond, row, timeframes):
+    """Row-wise reference semantics (BacktestEngine._check_condition)."""
+    def operand(op):
+        if op.value is not None:
+            return op.value
+        tf = timeframes.get(op.indicator_id)
+        name = f"{op.indicator_id}_{op.field}"
+        val = row.get(f"{tf}_{name}" if tf and tf != "1m" else name)
+        return None if pd.isna(val) else float(val)
+
+    left = operand(cond.left)
+    if left is None:
+        return False
+    if cond.op == "between":
+        return cond.right.min <= left <= cond.right.max
+    right = operand(cond.right)
+    return {"gt": left > right, "lt": left < right, "eq": left == right}[cond.op]
+
+
+def _row_group(group, row, indicators):
+    if not group:
+        return False
+    timeframes = {ind.id: ind.timeframe for ind in reversed(indicators)}
+    if group.all and not all(_row_condition(c, row, timeframes) for c in group.all):
+        return False
+    if group.any and not any(_row_condition(c, row, timeframes) for c in group.any):
+        return False
+    return True
+
+
+def _row_regimes(regimes, row, indicators):
+    return [reg for reg in regimes if _row_group(reg.conditions, row, indicators)]
+
+
+class TestConditionCompiler:
+    """Mask semantics."""
+
+    def test_comparisons_treat_missing_values_as_false(self, frame):
+        compiler = ConditionCompiler(frame, INDICATORS)
+        assert compiler.condition_mask(_cond("rsi", "gt", 30)).tolist() == [False, True, False, True]
+        assert compiler.condition_mask(_cond("rsi", "between", low=10, high=60)).tolist() == [True, True, False, False]
+        assert compiler.condition_mask(_cond("ema", "eq", 3)).tolist() == [False, False, True, False]
+        assert not compiler.condition_mask(_cond("unknown", "gt", 0)).any()
+
+    def test_htf_columns_are_prefixed(self, frame):
+        compiler = ConditionCompiler(frame, INDICATORS)
+        assert compiler.column_name("sma", "value") == "5m_sma_value"
+        assert compiler.condition_mask(_cond("ema", "gt", ref="sma")).tolist() == [False, False, True, True]
+
+    def test_group_combines_all_and_any(self, frame):
+        compiler = ConditionCompiler(frame, INDICATORS)
+        group = ConditionGroup(
+            all=[_cond("ema", "gt", 1)],
+            any=[_cond("rsi", "lt", 60), _cond("ema", "eq", 4)],
+        )
+        assert compiler.group_mask(group).tolist() == [False, True, False, True]
+        assert not compiler.group_mask(None).any()
+
+    def test_routing_picks_first_matching_rule(self, frame):
+        compiler = ConditionCompiler(frame, INDICATORS)
+        id_masks = {
+            "bull": np.array([True, True, False, False]),
+            "trend": np.array([True, False, True, False]),
+        }
+        routing = [
+            RoutingRule(strategy_set_id="a", match=RoutingMatch(all_of=["bull", "trend"])),
+            RoutingRule(strategy_set_id="b", match=RoutingMatch(any_of=["bull", "trend"])),
+            RoutingRule(strategy_set_id="c", match=RoutingMatch(none_of=["bull", "unknown"])),
+        ]
+        assert compiler.routing_index(routing, id_masks).tolist() == [0, 1, 1, 2]
+
+
+def test_compiled_simulation_matches_row_wise():
+    rng = np.random.default_rng(3)
+    n = 600
+    index = pd.date_range("2024-01-01", periods=n, freq="1min")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, n)))
+    df_1m = pd.DataFrame({
+        "open": close, "high": close * 1.002, "low": close * 0.998, "close": close,
+        "volume": 1.0,
+        "rsi_value": 50 + 30 * np.sin(np.arange(n) / 25) + rng.normal(0, 5, n),
+        "ema_value": pd.Series(close, index=index).ewm(span=20).mean(),
+    }, index=index)
+    df_5m = pd.DataFrame({"sma_value": close[::5]}, index=index[::5])
+
+    config = TradingBotConfig(
+        schema_version="1",
+        indicators=INDICATORS,
+        regimes=[
+            RegimeDef(id="bull", name="Bull", conditions=ConditionGroup(all=[_cond("rsi", "gt", 55)])),
+            RegimeDef(id="bear", name="Bear", conditions=ConditionGroup(all=[_cond("rsi", "lt", 45)])),
+            RegimeDef(id="any", name="Any", conditions=ConditionGroup(all=[_cond("ema", "gt", 0)])),
+        ],
+        strategies=[
+            StrategyDef(
+                id="trend", name="Trend",
+                entry=ConditionGroup(all=[_cond("ema", "gt", ref="sma")]),
+                exit=ConditionGroup(any=[_cond("rsi", "lt", 50)]),
+                risk=RiskSettings(stop_loss_pct=0.3, take_profit_pct=0.6),
+            ),
+            StrategyDef(
+                id="dip", name="Dip",
+                entry=ConditionGroup(all=[_cond("rsi", "lt", 35)]),
+                exit=ConditionGroup(all=[_cond("rsi", "gt", 55)]),
+                risk=RiskSettings(risk_per_trade_pct=2.0),
+            ),
+        ],
+        strategy_sets=[
+            StrategySet(id="s1", name="S1", strategies=[StrategyRef(strategy_id="trend"), StrategyRef(strategy_id="dip")]),
+            StrategySet(id="s2", name="S2", strategies=[StrategyRef(strategy_id="dip")]),
+        ],
+        routing=[
+            RoutingRule(strategy_set_id="s1", match=RoutingMatch(all_of=["bull"])),
+            RoutingRule(strategy_set_id="s2", match=RoutingMatch(any_of=["bear"], none_of=["bull"])),
+        ],
+    )
+
+    def run(compile_conditions):
+        phase = SimulationPhase(_row_regimes, _row_group, compile_conditions=compile_conditions)
+        counters = {key: 0 for key in (
+            "regime_evaluations", "strategy_routings", "entry_evaluations",
+            "exit_evaluations", "trades_entered",
+        )}
+        result = phase.execute({"1m": df_1m, "5m": df_5m}, config, "BTCUSDT", 10_000.0, counters)
+        return result, counters
+
+    rows, row_counters = run(False)
+    compiled, compiled_counters = run(True)
+
+    assert rows["trades"]
+    assert [vars(t) for t in compiled["trades"]] == [vars(t) for t in rows["trades"]]
+    assert compiled["final_equity"] == rows["final_equity"]
+    assert compiled["regime_history"] == rows["regime_history"]
+    assert compiled_counters == row_counters
@@ -0,0 +1,82 @@
+"""Tests for the leak-free multi-timeframe alignment layer."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtesting.mtf_alignment import (
+    MTFAlignmentCache,
+    align_to_base,
+    closed_bar_indices,
+    resample_frame,
+)
+from src.backtesting.phases.simulation_phase import SimulationPhase
+
+
+@pytest.fixture
+def df_1m():
+    """Four hours of 1m candles starting at a full hour."""
+    rng = np.random.default_rng(5)
+    index = pd.date_range("2024-01-01 09:00", periods=240, freq="1min")
+    close = 100 + np.cumsum(rng.normal(0, 0.1, len(index)))
+    return pd.DataFrame(
+        {
+            "open": close - 0.05,
+            "high": close + 0.2,
+            "low": close - 0.2,
+            "close": close,
+            "volume": rng.random(len(index)),
+        },
+        index=index,
+    )
+
+
+def _resample(df, rule):
+    agg = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    return df.resample(rule).agg(agg).dropna()
+
+
+def test_resample_frame_matches_pandas(df_1m):
+    ms = df_1m.index.as_unit("ms").asi8
+    bars = resample_frame(df_1m.reset_index(drop=True).assign(timestamp=ms), "15m")
+    expected = _resample(df_1m, "15min")
+
+    np.testing.assert_array_equal(bars["bar_start"], expected.index.as_unit("ms").asi8)
+    np.testing.assert_array_equal(bars["bar_count"], 15)
+    for col in ("open", "high", "low", "close", "volume"):
+        np.testing.assert_allclose(bars[col], expected[col], err_msg=col)
+
+
+def test_closed_bar_indices():
+    bar_end = np.array([100, 200, 300])
+
+    assert closed_bar_indices(bar_end, np.array([50, 100, 199, 299, 900])).tolist() == [-1, 0, 0, 1, 2]
+
+
+def test_align_to_base_uses_last_closed_bar(df_1m):
+    hourly = _resample(df_1m, "1h")
+
+    aligned = align_to_base(df_1m.index, "1m", {"1h": hourly}, cache=MTFAlignmentCache())["1h"]
+
+    # 09:00-09:58 close before the 09:00 bar is complete
+    assert aligned.loc[:"2024-01-01 09:58", "close"].isna().all()
+    # The 09:59 row closes at 10:00 and sees the 09:00 bar until 10:59
+    assert (aligned.loc["2024-01-01 09:59":"2024-01-01 10:58", "close"] == hourly["close"].iloc[0]).all()
+    assert aligned.loc["2024-01-01 10:59", "close"] == hourly["close"].iloc[1]
+    assert aligned.index.equals(df_1m.index)
+
+
+def test_simulation_phase_alignment_is_cached(df_1m, monkeypatch):
+    cache = MTFAlignmentCache()
+    monkeypatch.setattr("src.backtesting.mtf_alignment._alignment_cache", cache)
+    datasets = {"1m": df_1m, "5m": _resample(df_1m, "5min")}
+    phase = SimulationPhase(None, None)
+
+    first = phase._align_timeframe_data(datasets, "BTCUSDT")
+    second = phase._align_timeframe_data(datasets, "BTCUSDT")
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    pd.testing.assert_frame_equal(first, second)
+    # 5m bar 09:00-09:05 becomes visible on the 09:04 row
+    assert np.isnan(first.loc["2024-01-01 09:03", "5m_close"])
+    assert first.loc["2024-01-01 09:04", "5m_close"] == df_1m.loc["2024-01-01 09:04", "close"]
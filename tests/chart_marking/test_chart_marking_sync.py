@@ -0,0 +1,114 @@
+"""Tests for the batched, diff-based chart marking sync."""
+
+import json
+
+import pytest
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from src.chart_marking import ChartMarkingMixin
+from src.chart_marking.mixin.chart_marking_sync import MarkingFrameScheduler
+
+
+class _JSSink:
+    """Stands in for the web view: records executed scripts."""
+
+    def _execute_js(self, js_code: str) -> None:
+        self.scripts.append(js_code)
+
+
+class _Chart(ChartMarkingMixin, _JSSink):
+    def __init__(self):
+        self.scripts = []
+        self._init_chart_marking()
+
+    def flush(self):
+        self._internal.marking_sync.flush()
+
+    def batches(self):
+        prefix = "window.chartAPI?.applyMarkingBatch("
+        assert all(s.startswith(prefix) for s in self.scripts)
+        return [json.loads(s[len(prefix):-2]) for s in self.scripts]
+
+
+@pytest.fixture(autouse=True)
+def qapp():
+    """Running Qt app: changes are deferred to the frame timer."""
+    return QApplication.instance() or QApplication([])
+
+
+def _add_zones(chart, count):
+    for i in range(count):
+        chart.add_support_zone(1000 + i, 2000 + i, 101.0 + i, 100.0 + i, zone_id=f"z{i}")
+
+
+def test_many_changes_are_sent_as_one_batch():
+    chart = _Chart()
+    _add_zones(chart, 200)
+    for i in range(50):
+        chart.add_long_entry(1000 + i, 100.0, marker_id=f"m{i}")
+    chart.add_stop_loss_line("sl", 95.0, entry_price=100.0)
+    chart.flush()
+
+    (batch,) = chart.batches()
+    assert batch["version"] == 1 and batch["reset"] is False
+    assert len(batch["zones"]["upsert"]) == 200
+    assert len(batch["markers"]["upsert"]) == 50
+    assert [line["id"] for line in batch["lines"]["upsert"]] == ["sl"]
+
+
+def test_only_changed_items_are_sent():
+    chart = _Chart()
+    _add_zones(chart, 20)
+    for i in range(10):
+        chart.add_long_entry(1000 + i, 100.0, marker_id=f"m{i}")
+    chart.flush()
+    chart.scripts.clear()
+
+    chart.update_zone("z3", top_price=150.0)
+    chart.remove_entry_marker("m7")
+    chart.flush()
+
+    (batch,) = chart.batches()
+    assert [z["id"] for z in batch["zones"]["upsert"]] == ["z3"]
+    assert batch["zones"]["remove"] == []
+    assert batch["markers"] == {"upsert": [], "remove": ["m7"]}
+    assert "lines" not in batch
+
+    # Nothing changed: no JS call at all
+    chart.scripts.clear()
+    chart._on_zones_changed()
+    chart.flush()
+    assert chart.scripts == []
+
+
+def test_resync_sends_full_state_with_reset():
+    chart = _Chart()
+    _add_zones(chart, 3)
+    chart.flush()
+    chart.scripts.clear()
+
+    chart.resync_markings()
+    chart.flush()
+
+    (batch,) = chart.batches()
+    assert batch["reset"] is True and batch["version"] == 2
+    assert {z["id"] for z in batch["zones"]["upsert"]} == {"z0", "z1", "z2"}
+
+
+def test_changes_within_a_frame_are_coalesced():
+    sent = []
+    items = {"zones": []}
+    scheduler = MarkingFrameScheduler(collect=lambda kind: items.get(kind, []), send=sent.append)
+
+    for i in range(100):
+        items["zones"] = items["zones"] + [{"id": f"z{i}", "topPrice": i}]
+        scheduler.mark_dirty("zones")
+    assert sent == []  # Deferred to the next frame
+
+    loop = QEventLoop()
+    QTimer.singleShot(60, loop.quit)
+    loop.exec()
+
+    assert len(sent) == 1
+    assert scheduler.get_stats() == {"version": 1, "batches_sent": 1, "changes_requested": 100}
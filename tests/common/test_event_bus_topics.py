@@ -0,0 +1,67 @@
+"""Tests for symbol-partitioned EventBus topics."""
+
+from datetime import datetime
+
+import pytest
+
+from src.common.event_bus import Event, EventBus, EventType
+
+
+def _tick(symbol: str) -> Event:
+    return Event(type=EventType.MARKET_TICK, timestamp=datetime.now(), data={"symbol": symbol, "price": 1.0})
+
+
+class Recorder:
+    """Handler with a bound method (the bus holds receivers weakly)."""
+
+    def __init__(self):
+        self.symbols = []
+
+    def handle(self, event: Event):
+        self.symbols.append(event.data["symbol"])
+
+
+@pytest.fixture
+def bus():
+    return EventBus()
+
+
+def test_topic_handler_only_receives_its_symbol(bus):
+    received, everything = Recorder(), Recorder()
+    bus.subscribe(EventType.MARKET_TICK, received.handle, symbol="BTCUSDT")
+    bus.subscribe(EventType.MARKET_TICK, everything.handle)
+
+    for symbol in ("BTCUSDT", "ETHUSDT", "BTCUSDT"):
+        bus.emit(_tick(symbol))
+
+    assert received.symbols == ["BTCUSDT", "BTCUSDT"]
+    assert len(everything.symbols) == 3
+
+
+def test_dispatch_does_not_scale_with_other_symbols(bus):
+    symbols = [f"SYM{i}" for i in range(20)]
+    calls = {symbol: Recorder() for symbol in symbols[:8]}
+    for symbol, received in calls.items():
+        bus.subscribe(EventType.MARKET_TICK, received.handle, symbol=symbol)
+
+    for _ in range(5):
+        for symbol in symbols:
+            bus.emit(_tick(symbol))
+
+    assert sum(len(received.symbols) for received in calls.values()) == 8 * 5
+    assert all(received.symbols == [symbol] * 5 for symbol, received in calls.items())
+
+
+def test_move_and_unsubscribe_symbol_topic(bus):
+    received = Recorder()
+    bus.subscribe(EventType.MARKET_TICK, received.handle, symbol="AAPL")
+    bus.move_symbol_subscription(EventType.MARKET_TICK, received.handle, "AAPL", "MSFT")
+
+    bus.emit(_tick("AAPL"))
+    bus.emit(_tick("MSFT"))
+    assert received.symbols == ["MSFT"]
+
+    bus.unsubscribe(EventType.MARKET_TICK, received.handle, symbol="MSFT")
+    bus.emit(_tick("MSFT"))
+    assert received.symbols == ["MSFT"]
+    assert (EventType.MARKET_TICK, "MSFT") not in bus._topic_signals
@@ -0,0 +1,133 @@
+"""Shared keep-alive HTTP session pool against a local stub exchange."""
+
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+
+from src.common import http_pool as http_pool_module
+from src.common.http_pool import HTTPSessionPool
+from src.core.broker.bitunix_adapter import BitunixAdapter
+
+
+class StubExchange:
+    """Bitunix-style account endpoints answering after a fixed delay."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = []
+        self._runner = None
+        self.base_url = ""
+
+    def _endpoint(self, payload):
+        async def handle(request):
+            self.requests.append(request.path)
+            await asyncio.sleep(self.delay)
+            return web.json_response({"code": 0, "data": payload, "msg": "Success"})
+        return handle
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/api/v1/futures/account", self._endpoint({"available": "100", "margin": "5"}))
+        app.router.add_get("/api/v1/futures/position/get_pending_positions", self._endpoint([
+            {"symbol": "BTCUSDT", "quantity": "0.5", "avgPrice": "40000", "markPrice": "41000", "leverage": "10"},
+        ]))
+        app.router.add_get("/api/v1/futures/trade/get_pending_orders", self._endpoint({
+            "orderList": [{"orderId": "1", "symbol": "BTCUSDT", "price": "39000"}],
+        }))
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = HTTPSessionPool()
+    monkeypatch.setattr(http_pool_module, "_http_pool", pool)
+    return pool
+
+
+def _run_with_stub(scenario, delay=0.0):
+    async def main():
+        stub = StubExchange(delay)
+        await stub.start()
+        try:
+            return await scenario(stub)
+        finally:
+            await http_pool_module.get_http_pool().close()
+            await stub.stop()
+
+    return asyncio.run(main())
+
+
+def test_sequential_requests_reuse_one_connection(pool):
+    async def scenario(stub):
+        for _ in range(20):
+            async with pool.borrow("test") as session:
+                async with session.get(f"{stub.base_url}/api/v1/futures/account") as response:
+                    assert response.status == 200
+                    await response.json()
+        assert pool.session("test") is pool.session("test")
+
+    _run_with_stub(scenario)
+
+    stats = pool.get_stats()
+    assert stats["connections_created"] == 1
+    assert stats["connections_reused"] == 19
+    endpoint = stats["endpoints"]["GET 127.0.0.1/api/v1/futures/account"]
+    assert endpoint["count"] == 20 and endpoint["errors"] == 0
+    assert endpoint["p95_ms"] >= endpoint["p50_ms"] > 0
+
+
+def test_refresh_account_fetches_concurrently(pool):
+    async def scenario(stub):
+        adapter = BitunixAdapter("key", "secret")
+        adapter.base_url = stub.base_url
+        await adapter.connect()
+        assert adapter._session is pool.session("bitunix")
+
+        snapshot = await adapter.refresh_account()
+        await adapter.disconnect()
+        assert not pool.session("bitunix").closed  # Owned by the pool
+        return snapshot
+
+    snapshot = _run_with_stub(scenario, delay=0.2)
+
+    assert snapshot.balance is not None
+    assert [p.symbol for p in snapshot.positions] == ["BTCUSDT"]
+    assert snapshot.open_orders[0]["orderId"] == "1"
+    # Three 200 ms requests in parallel instead of 600 ms back to back
+    assert snapshot.latency_ms < 450
+
+
+def test_sessions_of_short_lived_loops_are_closed_with_their_loop(pool):
+    sessions = []
+
+    async def worker(base_url):
+        session = pool.session("worker")
+        sessions.append((session, session.connector))
+        async with session.get(f"{base_url}/api/v1/futures/account") as response:
+            assert response.status == 200
+
+    async def scenario(stub):
+        # asyncio.run() in several threads at once, as sync callers do
+        threads = [
+            threading.Thread(target=asyncio.run, args=(worker(stub.base_url),))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        await asyncio.to_thread(lambda: [thread.join() for thread in threads])
+        assert pool.get_stats()["sessions"] == 0
+
+    _run_with_stub(scenario)
+
+    assert len(sessions) == 4
+    assert all(session.closed and connector.closed for session, connector in sessions)
@@ -0,0 +1,120 @@
+"""Walk-forward: shared fold data slices, process-pool folds and stop."""
+
+import asyncio
+import multiprocessing
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.backtesting import walk_forward_executor as executor_module
+from src.core.backtesting.config import BacktestConfig, BatchConfig, WalkForwardConfig
+from src.core.backtesting.walk_forward_data import WalkForwardDataCache
+from src.core.backtesting.walk_forward_runner import WalkForwardRunner
+
+START = datetime(2024, 1, 1)
+DAYS = 6
+
+
+def _bars(days=DAYS, as_datetime=False):
+    count = days * 24 * 60
+    close = 100 + np.cumsum(np.random.default_rng(7).normal(0, 0.2, count))
+    index = pd.date_range(START, periods=count, freq="1min")
+    timestamps = index if as_datetime else [int(ts.timestamp() * 1000) for ts in index.to_pydatetime()]
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "open": close, "high": close + 0.3, "low": close - 0.3, "close": close, "volume": 1.0,
+    })
+
+
+def _signal(candle, history, mtf_data):
+    if candle.bar_index % 120 == 0:
+        return {"action": "buy" if candle.bar_index % 240 == 0 else "sell", "sl_distance": 1.0}
+    return None
+
+
+def _slow_signal(candle, history, mtf_data):
+    time.sleep(0.002)
+    return None
+
+
+@pytest.fixture(autouse=True)
+def preloaded(monkeypatch):
+    async def load(self, start_date, end_date):
+        self.set_data(_bars())
+        return self.bar_count
+
+    monkeypatch.setattr(executor_module.WalkForwardDataCache, "load", load)
+
+
+def _runner(n_jobs, signal_callback=_signal):
+    base = BacktestConfig(
+        symbol="BTCUSDT", start_date=START, end_date=START + timedelta(days=DAYS), mtf_timeframes=[], seed=1
+    )
+    config = WalkForwardConfig(
+        base_config=base,
+        batch_config=BatchConfig(base_config=base, parameter_space={"risk_per_trade_pct": [0.5, 1.0]}),
+        train_window_days=2,
+        test_window_days=1,
+        step_size_days=1,
+        min_folds=1,
+        n_jobs=n_jobs,
+    )
+    return WalkForwardRunner(config, signal_callback=signal_callback)
+
+
+@pytest.mark.parametrize("as_datetime", [False, True])
+def test_slices_match_unsliced_data(as_datetime):
+    data = _bars(as_datetime=as_datetime)
+    cache = WalkForwardDataCache("BTCUSDT")
+    cache.set_data(data)
+
+    bounds = [
+        (START, START + timedelta(days=1)),  # Both bounds on a bar
+        (START + timedelta(hours=5, seconds=30), START + timedelta(hours=9, seconds=30)),  # Between bars
+        (START + timedelta(hours=2, microseconds=500), START + timedelta(days=2, microseconds=999)),  # ms truncation
+        (START - timedelta(days=1), START + timedelta(days=DAYS + 1)),  # Beyond the data
+    ]
+    for start, end in bounds:
+        # Same window as the DB query (millisecond bounds, both inclusive)
+        start_ms, end_ms = int(start.timestamp() * 1000), int(end.timestamp() * 1000)
+        keys = data["timestamp"].map(lambda ts: int(ts.timestamp() * 1000)) if as_datetime else data["timestamp"]
+        expected = data[(keys >= start_ms) & (keys <= end_ms)]
+
+        pd.testing.assert_frame_equal(cache.slice(start, end), expected)
+
+
+def test_parallel_folds_match_sequential():
+    sequential = asyncio.run(_runner(n_jobs=1).run())
+    parallel = asyncio.run(_runner(n_jobs=2).run())
+
+    assert parallel.total_folds == sequential.total_folds == 4
+    assert parallel.successful_folds == sequential.successful_folds == 4
+    for seq_fold, par_fold in zip(sequential.folds, parallel.folds):
+        assert par_fold.fold_index == seq_fold.fold_index
+        assert par_fold.best_params == seq_fold.best_params
+        assert par_fold.optimization_runs == seq_fold.optimization_runs
+        assert par_fold.train_metrics.model_dump() == seq_fold.train_metrics.model_dump()
+        assert par_fold.test_metrics.model_dump() == seq_fold.test_metrics.model_dump()
+    assert parallel.aggregated_metrics == sequential.aggregated_metrics
+
+
+def test_stop_terminates_running_fold_jobs():
+    runner = _runner(n_jobs=2, signal_callback=_slow_signal)
+    stopped_at = []
+
+    def on_progress(progress, message):
+        if message.startswith("Starte"):
+            def stop():
+                stopped_at.append(time.perf_counter())
+                runner.stop()
+            asyncio.get_running_loop().call_later(1.0, stop)
+
+    runner.set_progress_callback(on_progress)
+    summary = asyncio.run(runner.run())
+
+    assert time.perf_counter() - stopped_at[0] < 5  # Jobs take far longer
+    assert summary.successful_folds < summary.total_folds
+    assert multiprocessing.active_children() == []  # Worker processes exited
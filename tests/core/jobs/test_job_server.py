@@ -0,0 +1,120 @@
+"""Tests for the out-of-process job server."""
+
+import queue
+import time
+
+import pytest
+
+from src.core.jobs import JobClient, JobEventType
+
+HANDLER = "tests.core.jobs.test_job_server:_handler"
+
+
+def _worker(start, count, progress, cancel_event):
+    done = []
+    for i in range(start, start + count):
+        if cancel_event.is_set():
+            break
+        time.sleep(0.05)
+        progress.put({"run": i})
+        done.append(i)
+    return done
+
+
+def _handler(job):
+    n = job.payload["runs"]
+    chunks = job.run_workers(_worker, [(0, n // 2), (n // 2, n - n // 2)])
+    return sorted(i for chunk in chunks for i in chunk)
+
+
+def _failing_handler(job):
+    raise ValueError("boom")
+
+
+@pytest.fixture(scope="module")
+def client():
+    client = JobClient(max_workers=2, shutdown_timeout=10)
+    yield client
+    client.shutdown()
+
+
+def _collect(events: queue.Queue, timeout: float = 60) -> list:
+    collected = []
+    while True:
+        event = events.get(timeout=timeout)
+        collected.append(event)
+        if event.type.is_terminal:
+            return collected
+
+
+def test_job_streams_progress_and_result(client):
+    events = queue.Queue()
+    client.submit(HANDLER, {"runs": 6}, events.put)
+
+    collected = _collect(events)
+
+    assert collected[0].type == JobEventType.STARTED
+    progress = [e.data["run"] for e in collected if e.type == JobEventType.PROGRESS]
+    assert sorted(progress) == list(range(6))
+    assert collected[-1].type == JobEventType.COMPLETED
+    assert collected[-1].data["result"] == list(range(6))
+
+
+def test_cancel_returns_partial_result(client):
+    events = queue.Queue()
+    job_id = client.submit(HANDLER, {"runs": 400}, events.put)
+    assert events.get(timeout=60).type == JobEventType.STARTED
+    while events.get(timeout=60).type != JobEventType.PROGRESS:
+        pass
+    client.cancel(job_id)
+
+    final = _collect(events)[-1]
+
+    assert final.type == JobEventType.CANCELLED
+    assert 0 < len(final.data["result"]) < 400
+
+
+def test_iter_events_ends_after_terminal_event(client):
+    events = queue.Queue()
+    job_id = client.submit(HANDLER, {"runs": 4}, events.put)
+
+    collected = list(client.iter_events(job_id, events, poll_s=0.1))
+
+    assert [e.type for e in collected[:1]] == [JobEventType.STARTED]
+    assert collected[-1].type == JobEventType.COMPLETED
+    assert not any(e.type.is_terminal for e in collected[:-1])
+
+
+def test_failing_job_reports_error(client):
+    events = queue.Queue()
+    client.submit("tests.core.jobs.test_job_server:_failing_handler", {}, events.put)
+
+    final = _collect(events)[-1]
+
+    assert final.type == JobEventType.FAILED
+    assert final.data["error"] == "boom"
+    assert "ValueError" in final.data["traceback"]
+
+
+def test_killed_server_fails_pending_jobs_and_restarts():
+    client = JobClient(max_workers=2, shutdown_timeout=10)
+    try:
+        events = queue.Queue()
+        client.submit(HANDLER, {"runs": 400}, events.put)
+        while events.get(timeout=60).type != JobEventType.PROGRESS:
+            pass
+
+        client._process.kill()  # Crash / OOM kill
+        final = _collect(events, timeout=10)[-1]
+
+        assert final.type == JobEventType.FAILED
+        assert final.data["error"] == "job server terminated"
+        client._process.join(5)
+        assert not client.is_running
+
+        # The next submit starts a new server
+        events = queue.Queue()
+        client.submit(HANDLER, {"runs": 2}, events.put)
+        assert _collect(events)[-1].type == JobEventType.COMPLETED
+    finally:
+        client.shutdown()
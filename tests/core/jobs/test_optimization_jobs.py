@@ -0,0 +1,153 @@
+"""Tests for the resumable indicator/simulator optimization jobs."""
+
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.jobs import indicator_optimization_job
+
+
+class _Job:
+    """In-process JobContext: workers run sequentially in this process."""
+
+    job_id = "test-job"
+    max_workers = 2
+
+    def __init__(self, payload, cancel_after=None):
+        self.payload = payload
+        self.reports = []
+        self._cancel_after = cancel_after
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def report(self, **data):
+        self.reports.append(data)
+
+    def run_workers(self, fn, args_list):
+        results = []
+        for args in args_list:
+            results.append(fn(*args, _CancellingQueue(self), self._cancel_event))
+        return results
+
+    def progress(self, item):
+        self.report(**item)
+        trials = sum(1 for r in self.reports if "combination" in r or "trial" in r)
+        if self._cancel_after is not None and trials >= self._cancel_after:
+            self._cancel_event.set()
+
+
+class _CancellingQueue:
+    """Progress queue of _Job (reports directly, cancels after n trials)."""
+
+    def __init__(self, job):
+        self._job = job
+
+    def put(self, item):
+        self._job.progress(item)
+
+
+def _row_key(row):
+    return json.dumps(row, sort_keys=True)
+
+
+def _bars(n=600, seed=5):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    return pd.DataFrame({
+        "open": close,
+        "high": close * 1.002,
+        "low": close * 0.998,
+        "close": close,
+        "volume": rng.uniform(100, 1000, n),
+    }, index=pd.date_range("2024-01-01", periods=n, freq="5min"))
+
+
+@pytest.fixture
+def indicator_payload(tmp_path, monkeypatch):
+    pytest.importorskip("pandas_ta", reason="indicator calculators need pandas_ta")
+    from src.ui.threads.indicator_optimization_phases import OptimizationPhaseHandler
+
+    # Alternating regime blocks instead of a JSON regime config
+    def detect_regimes(self, df):
+        blocks = (np.arange(len(df)) // 100) % 2
+        return pd.Series(np.where(blocks == 0, "TREND", "RANGE"), index=df.index)
+
+    monkeypatch.setattr(OptimizationPhaseHandler, "detect_regimes", detect_regimes)
+    return {
+        "data": _bars(),
+        "selected_indicators": ["RSI"],
+        "param_ranges": {"RSI": {"period": {"min": 6, "max": 20, "step": 2}}},
+        "json_config_path": "regimes.json",
+        "test_type": "entry",
+        "trade_side": "long",
+        "n_workers": 2,
+        "resume": True,
+        "storage_path": str(tmp_path / "indicator.db"),
+    }
+
+
+def test_indicator_job_resumes_tested_combinations(indicator_payload):
+    first = _Job(indicator_payload, cancel_after=3)
+    partial = indicator_optimization_job.run_job(first)
+    tested_first = [r["combination"] for r in first.reports if "combination" in r]
+    assert 0 < len(tested_first) < 8
+
+    second = _Job(indicator_payload)
+    rows = indicator_optimization_job.run_job(second)
+
+    start = next(r for r in second.reports if "total" in r)
+    assert start["completed"] == len(tested_first)
+    assert start["total"] == 8
+    tested_second = [r["combination"] for r in second.reports if "combination" in r]
+    assert sorted(tested_first + tested_second) == sorted(
+        indicator_optimization_job.combination_key("RSI", {"period": p}) for p in range(6, 21, 2)
+    )
+
+    # Same rows as an uninterrupted run (ties in any order), best first
+    fresh = _Job({**indicator_payload, "resume": False})
+    expected = indicator_optimization_job.run_job(fresh)
+    assert rows
+    assert sorted(rows, key=_row_key) == sorted(expected, key=_row_key)
+    assert [r["score"] for r in rows] == sorted((r["score"] for r in rows), reverse=True)
+    assert len(partial) < len(rows)
+
+
+def test_simulator_job_resumes_bayesian_study(tmp_path):
+    from src.core.jobs import simulator_optimization_job
+    from src.core.simulator import OptimizationConfig, StrategyName
+
+    config = OptimizationConfig(strategy_name=StrategyName.BREAKOUT, n_trials=6)
+    payload = {
+        "data": _bars(),
+        "symbol": "BTCUSDT",
+        "mode": "bayesian",
+        "configs": [config],
+        "max_combinations": 6,
+        "n_workers": 1,
+        "resume": True,
+        "storage_path": str(tmp_path / "simulator.db"),
+    }
+
+    first = _Job(payload, cancel_after=2)
+    simulator_optimization_job.run_job(first)
+    trials_first = [r for r in first.reports if "trial" in r]
+    assert 0 < len(trials_first) < 6
+
+    second = _Job(payload)
+    [run] = simulator_optimization_job.run_job(second)
+
+    trials_second = [r for r in second.reports if "trial" in r]
+    assert len(trials_first) + len(trials_second) == 6
+    assert run.total_trials == 6
+    assert {t.trial_number for t in run.all_trials} == set(range(1, 7))
+    assert all(t.metrics for t in run.all_trials)
+    # Best result of a resumed study is re-simulated
+    assert run.best_score == max(t.score for t in run.all_trials)
+    assert run.best_result is not None
+    assert [r["run_result"] for r in second.reports if "run_result" in r] == [run]
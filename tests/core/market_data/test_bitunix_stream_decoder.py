@@ -0,0 +1,112 @@
+"""Bitunix stream frame decoding and batched dispatch."""
+
+import asyncio
+import json
+from decimal import Decimal
+
+import pytest
+
+from src.core.market_data import bitunix_stream_connection as connection_module
+from src.core.market_data import bitunix_stream_decoder as decoder_module
+from src.core.market_data.bitunix_stream import BitunixStreamClient
+from src.core.market_data.bitunix_stream_decoder import BitunixFrameDecoder, KlineFrame, TickerFrame
+
+BACKENDS = [
+    "json",
+    pytest.param("orjson", marks=pytest.mark.skipif(not decoder_module.ORJSON_AVAILABLE, reason="orjson not installed")),
+    pytest.param("msgspec", marks=pytest.mark.skipif(not decoder_module.MSGSPEC_AVAILABLE, reason="msgspec not installed")),
+]
+
+KLINE = json.dumps({
+    "ch": "market_kline_1min", "symbol": "BTCUSDT", "ts": 1732178884994,
+    "data": {"o": "50000.1", "h": "50010.5", "l": "49990.2", "c": "50005.3", "b": "12.5", "q": "625066.25"},
+})
+TICKER = json.dumps({
+    "ch": "ticker", "symbol": "BTCUSDT", "ts": 1732178884994,
+    "data": {"symbol": "BTCUSDT", "lastPrice": "50005.30", "baseVol": "1234.9"},
+})
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_channels_decode_to_typed_frames(backend):
+    decoder = BitunixFrameDecoder(backend)
+
+    assert decoder.decode(KLINE) == (
+        "kline", KlineFrame("BTCUSDT", 1732178884994, 50000.1, 50010.5, 49990.2, 50005.3, 12.5)
+    )
+    assert decoder.decode(TICKER) == ("ticker", TickerFrame("BTCUSDT", "50005.30", 1234.9))
+    assert decoder.decode('{"op": "ping", "ping": 1}') == ("control", {"op": "ping", "ping": 1})
+    assert decoder.decode('{"ch": "depth_book1", "data": {}}')[0] == "depth"
+
+    # Incomplete frames fall back to the dict for the handler's validation
+    assert decoder.decode('{"ch": "market_kline_1min", "data": {}}') == (
+        "kline", {"ch": "market_kline_1min", "data": {}}
+    )
+
+    with pytest.raises(ValueError):
+        decoder.decode("{not json")
+
+    stats = decoder.get_stats()
+    assert stats["kline"]["count"] == 2 and stats["ticker"]["count"] == 1
+    assert stats["kline"]["mean_us"] > 0
+
+
+def test_unavailable_backend_is_rejected(monkeypatch):
+    monkeypatch.setattr(decoder_module, "MSGSPEC_AVAILABLE", False)
+    with pytest.raises(ValueError):
+        BitunixFrameDecoder("msgspec")
+
+
+def test_batch_dispatches_frames_to_handlers(monkeypatch):
+    client = BitunixStreamClient()
+    klines, ticks = [], []
+
+    async def handle_kline(frame):
+        klines.append(frame)
+
+    monkeypatch.setattr(client._handlers, "handle_kline", handle_kline)
+    monkeypatch.setattr(client, "process_tick", ticks.append)
+
+    asyncio.run(client._messages.on_messages([KLINE, "{broken", TICKER, '{"op": "connect"}']))
+
+    assert [frame.close for frame in klines] == [50005.3]
+    assert [tick.last for tick in ticks] == [Decimal("50005.30")]
+    assert client.metrics.messages_dropped == 1
+    metrics = client.get_metrics()
+    assert set(metrics["parse_stats"]) == {"kline", "ticker", "control"}
+    assert metrics["json_backend"] == client._messages.decoder.backend
+
+
+@pytest.mark.parametrize("max_batch, expected", [
+    (500, [["0", "1", "2", "3", "4"]]),
+    (2, [["0", "1"], ["2", "3"], ["4"]]),
+])
+def test_supervisor_drains_buffered_frames_in_batches(monkeypatch, max_batch, expected):
+    monkeypatch.setattr(connection_module, "MAX_FRAME_BATCH", max_batch)
+    client = BitunixStreamClient()
+    connection = client._connection
+    batches = []
+
+    async def on_messages(messages):
+        batches.append(list(messages))
+
+    client._messages.on_messages = on_messages
+    client.connected = True
+
+    class _Socket:
+        async def send(self, message):
+            pass
+
+    async def scenario():
+        frames = asyncio.Queue()
+        for i in range(5):
+            frames.put_nowait(str(i))
+        frames.put_nowait(ConnectionError("closed by peer"))  # Queued by the reader on close
+        with pytest.raises(ConnectionError):
+            await connection._process_frames(_Socket(), frames)
+
+    asyncio.run(scenario())
+
+    assert batches == expected
+    assert connection.batches_processed == len(expected)
+    assert connection.max_batch_size == len(expected[0])
@@ -0,0 +1,48 @@
+"""Load test scenarios against the local mock exchange."""
+
+import asyncio
+
+import pytest
+
+from src.common import http_pool as http_pool_module
+from src.common.http_pool import HTTPSessionPool
+from src.core.mock_exchange import MockExchangeConfig
+from src.core.mock_exchange.load_test import run_order_load, run_stream_load
+
+
+@pytest.fixture(autouse=True)
+def pool(monkeypatch):
+    monkeypatch.setattr(http_pool_module, "_http_pool", HTTPSessionPool())
+
+
+def _run(scenario):
+    async def main():
+        try:
+            return await scenario
+        finally:
+            await http_pool_module.get_http_pool().close()
+
+    return asyncio.run(main())
+
+
+def test_stream_load_reports_throughput_and_survives_disconnects():
+    config = MockExchangeConfig(symbols=["BTCUSDT", "ETHUSDT"], message_rate=200, disconnect_every_s=1.0, seed=3)
+    report = _run(run_stream_load(config, duration_s=3.5))
+
+    assert report.details["disconnects_injected"] >= 1
+    assert report.details["reconnects"] >= 1  # Supervisor reconnected and resubscribed
+    assert report.operations > 1000
+    assert report.errors == 0
+    assert 0 < report.latency["p50_ms"] <= report.latency["p95_ms"]
+
+
+def test_order_load_retries_injected_errors():
+    config = MockExchangeConfig(error_rate=0.2, latency_ms=2, latency_jitter_ms=3, seed=5)
+    report = _run(run_order_load(config, orders=200, concurrency=25, max_retries=6))
+
+    assert report.errors == 0 and report.operations == 200
+    assert report.details["retries"] == report.details["errors_injected"] > 0
+    assert report.details["signature_errors"] == 0
+    assert report.details["open_orders"] == 20  # Every 10th order rests in the book
+    assert report.latency["p50_ms"] >= 2
+    assert "orders" in report.format()
@@ -0,0 +1,122 @@
+"""Mock exchange: order book matching and the Bitunix REST API served to BitunixAdapter."""
+
+import asyncio
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from src.common import http_pool as http_pool_module
+from src.common.http_pool import HTTPSessionPool
+from src.core.broker.bitunix_adapter import BitunixAdapter
+from src.core.broker.broker_types import BrokerError, OrderRequest
+from src.core.mock_exchange import MarketFeed, MockExchangeConfig, MockExchangeServer, SimulatedOrderBook
+from src.database.models import OrderSide, OrderStatus, OrderType
+
+
+@pytest.fixture(autouse=True)
+def pool(monkeypatch):
+    monkeypatch.setattr(http_pool_module, "_http_pool", HTTPSessionPool())
+
+
+def _run(scenario, config=None):
+    async def main():
+        server = MockExchangeServer(config or MockExchangeConfig(message_rate=50, seed=1))
+        await server.start()
+        adapter = BitunixAdapter("mock-key", "mock-secret")
+        adapter.base_url = server.base_url
+        try:
+            await adapter.connect()
+            return await scenario(server, adapter)
+        finally:
+            await adapter.disconnect()
+            await http_pool_module.get_http_pool().close()
+            await server.stop()
+
+    return asyncio.run(main())
+
+
+def test_market_order_walks_the_book():
+    book = SimulatedOrderBook(100.0, depth=3, tick_size=1.0, level_size=2.0)
+
+    fill = book.execute("a", "buy", 3.0)
+    assert fill.quantity == 3.0
+    assert fill.average_price == pytest.approx((2 * 101 + 1 * 102) / 3)
+
+    # Larger than the remaining depth: partial fill
+    fill = book.execute("b", "buy", 10.0)
+    assert fill.quantity == 3.0
+
+    # Liquidity is restored when the price moves
+    book.move(100.0)
+    assert book.execute("c", "sell", 2.0).average_price == 99.0
+
+
+def test_limit_order_rests_until_crossed():
+    book = SimulatedOrderBook(100.0, depth=5, tick_size=1.0, level_size=1.0)
+
+    assert book.execute("a", "buy", 1.0, limit_price=95.0) is None
+    assert "a" in book.resting_orders()
+    assert book.move(98.0) == []
+
+    (fill,) = book.move(94.0)  # Best ask 95 reaches the limit
+    assert (fill.order_id, fill.quantity, fill.average_price) == ("a", 1.0, 95.0)
+    assert book.resting_orders() == {}
+
+
+def test_replay_feed_cycles_recorded_klines():
+    df = pd.DataFrame({"open": [1.0, 2.0], "high": [1.5, 2.5], "low": [0.5, 1.5], "close": [1.2, 2.2], "volume": [10, 20]})
+    feed = MarketFeed.from_frames({"ETHUSDT": df})
+
+    closes = [feed.step("ETHUSDT", now_ms=0).close for _ in range(3)]
+    assert closes == [1.2, 2.2, 1.2]
+    assert feed.price("ETHUSDT") == 1.2
+
+
+def test_signed_orders_fill_and_update_the_account():
+    async def scenario(server, adapter):
+        buy = OrderRequest(symbol="BTCUSDT", side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=Decimal("0.5"))
+        response = await adapter.place_order(buy)
+        assert response.status == OrderStatus.SUBMITTED.value
+
+        detail = await adapter.get_order_status(response.broker_order_id)
+        assert detail.status == OrderStatus.FILLED.value
+        assert detail.side == OrderSide.BUY.value
+
+        limit = OrderRequest(symbol="BTCUSDT", side=OrderSide.SELL, order_type=OrderType.LIMIT,
+                             quantity=Decimal("0.1"), limit_price=Decimal("90000"))
+        resting = await adapter.place_order(limit)
+
+        snapshot = await adapter.refresh_account()
+        assert [p.quantity for p in snapshot.positions] == [Decimal("0.5")]
+        assert [o["orderId"] for o in snapshot.open_orders] == [resting.broker_order_id]
+        assert snapshot.open_orders[0]["side"] == "sell"
+        assert snapshot.balance is not None
+
+        assert await adapter.cancel_order(resting.broker_order_id) is True
+        assert await adapter.get_open_orders() == []
+        return server.get_stats()
+
+    stats = _run(scenario)
+    assert stats["signature_errors"] == 0
+    assert stats["orders_placed"] == 2
+
+
+def test_bad_signature_and_injected_errors_are_rejected():
+    async def scenario(server, adapter):
+        order = OrderRequest(symbol="BTCUSDT", side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=Decimal("0.1"))
+
+        adapter.signer.api_secret = "wrong"
+        with pytest.raises(BrokerError):
+            await adapter.place_order(order)
+        adapter.signer.api_secret = "mock-secret"
+
+        server.config.error_rate = 1.0
+        with pytest.raises(BrokerError):
+            await adapter.place_order(order)
+        return server.get_stats()
+
+    stats = _run(scenario)
+    assert stats["signature_errors"] == 1
+    assert stats["rest_errors_injected"] == 1
+    assert stats["orders_placed"] == 0
@@ -0,0 +1,69 @@
+"""Tests for the approximate (fast_mode) RegimeScore used by optimizer trials."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.scoring.regime_score import (
+    RegimeScoreConfig,
+    build_default_features,
+    _compute_hurst,
+    _compute_hurst_batch,
+    calculate_regime_score,
+)
+
+
+@pytest.fixture
+def regime_data():
+    """Synthetic 6000-bar series with alternating trend/range regimes."""
+    rng = np.random.default_rng(7)
+    names = ["BULL", "BEAR", "SIDEWAYS"]
+    labels = []
+    while len(labels) < 6000:
+        labels += [names[rng.integers(3)]] * int(rng.integers(5, 80))
+    labels = labels[:6000]
+    drift = {"BULL": 0.0005, "BEAR": -0.0005, "SIDEWAYS": 0.0}
+    returns = np.array([rng.normal(drift[label], 0.002) for label in labels])
+    close = 100 * np.exp(np.cumsum(returns))
+    index = pd.date_range("2024-01-01", periods=len(close), freq="1min")
+    data = pd.DataFrame({
+        "open": close,
+        "high": close * 1.001,
+        "low": close * 0.999,
+        "close": close,
+        "volume": rng.integers(100, 1000, len(close)).astype(float),
+    }, index=index)
+    return data, pd.Series(labels, index=index)
+
+
+def _config(**overrides) -> RegimeScoreConfig:
+    return RegimeScoreConfig(warmup_bars=200, max_feature_lookback=50, **overrides)
+
+
+def test_hurst_batch_matches_scalar():
+    rng = np.random.default_rng(0)
+    segments = [rng.normal(0, 1, n) for n in (15, 60, 250, 1000)]
+    batch = _compute_hurst_batch(segments)
+    for segment, value in zip(segments, batch):
+        assert value == pytest.approx(_compute_hurst(pd.Series(segment)), abs=1e-9)
+
+
+def test_fast_mode_within_documented_bound(regime_data):
+    data, regimes = regime_data
+    exact = calculate_regime_score(data, regimes, config=_config())
+    fast = calculate_regime_score(
+        data, regimes, features=build_default_features(data), config=_config(fast_mode=True)
+    )
+    assert exact.gates_passed and fast.gates_passed
+    assert fast.coherence == exact.coherence
+    assert abs(fast.total_score - exact.total_score) < 0.5
+
+
+def test_fast_mode_gate_failures_match_exact(regime_data):
+    data, regimes = regime_data
+    single = pd.Series("BULL", index=regimes.index)
+    exact = calculate_regime_score(data, single, config=_config())
+    fast = calculate_regime_score(data, single, config=_config(fast_mode=True))
+    assert not fast.gates_passed
+    assert fast.gate_failures == exact.gate_failures
+    assert fast.unique_labels == exact.unique_labels
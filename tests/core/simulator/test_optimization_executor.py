@@ -0,0 +1,85 @@
+"""Tests for the batched trial executor of the simulator optimizers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.simulator.optimization_bayesian import (
+    BayesianOptimizer,
+    GridSearchOptimizer,
+    OptimizationConfig,
+)
+from src.core.simulator.optimization_executor import CANCELLED, TrialExecutor
+from src.core.simulator.strategy_params import StrategyName
+
+
+@pytest.fixture
+def ohlcv():
+    """Deterministic random-walk 5m candles."""
+    rng = np.random.default_rng(3)
+    index = pd.date_range("2024-01-01", periods=600, freq="5min")
+    close = 100 + np.cumsum(rng.normal(0, 0.4, len(index)))
+    return pd.DataFrame(
+        {
+            "open": close - 0.1,
+            "high": close + rng.random(len(index)),
+            "low": close - rng.random(len(index)),
+            "close": close,
+            "volume": 1000 + rng.random(len(index)) * 100,
+        },
+        index=index,
+    )
+
+
+@pytest.fixture
+def config():
+    return OptimizationConfig(strategy_name=StrategyName.MOMENTUM, n_trials=6)
+
+
+def _pnl(outcomes):
+    return [result.total_pnl_pct for result, _ in outcomes]
+
+
+def test_pool_matches_in_process(ohlcv, config):
+    params = [{}, {"roc_period": 5}, {"roc_period": 20}]
+
+    with TrialExecutor(ohlcv, "BTCUSDT", config, n_workers=1) as serial:
+        expected = serial.run_batch(params)
+    with TrialExecutor(ohlcv, "BTCUSDT", config, n_workers=2) as pooled:
+        actual = pooled.run_batch(params)
+
+    assert all(error is None for _, error in expected + actual)
+    assert _pnl(actual) == _pnl(expected)
+
+
+def test_stopped_batch_marks_trials_cancelled(ohlcv, config):
+    with TrialExecutor(ohlcv, "BTCUSDT", config) as executor:
+        outcomes = executor.run_batch([{}, {}], should_stop=lambda: True)
+
+    assert outcomes == [(None, CANCELLED), (None, CANCELLED)]
+
+
+def test_bayesian_ask_tell_reports_every_trial(ohlcv, config):
+    progress = []
+
+    run = BayesianOptimizer(ohlcv, "BTCUSDT", config).optimize(
+        progress_callback=lambda current, total, best: progress.append((current, total))
+    )
+
+    assert run.total_trials == 6
+    assert progress == [(i, 6) for i in range(1, 7)]
+    assert run.best_score == max(trial.score for trial in run.all_trials)
+    assert run.best_result.total_pnl_pct == run.best_score
+
+
+def test_grid_cancel_stops_after_current_trial(ohlcv, config):
+    optimizer = GridSearchOptimizer(ohlcv, "BTCUSDT", config)
+
+    def progress_cb(current, total, best):
+        if current == 3:
+            optimizer.cancel()
+
+    run = optimizer.optimize(progress_callback=progress_cb, max_combinations=20)
+
+    assert run.total_trials == 3
+    assert [trial.trial_number for trial in run.all_trials] == [1, 2, 3]
@@ -0,0 +1,76 @@
+"""Tests for the cached simulator feature matrix."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.simulator.simulation_features import FeatureMatrix, sweep_param_sets
+from src.core.simulator.simulation_signals import StrategySignalGenerator
+from src.core.simulator.strategy_params import StrategyName, get_strategy_parameters
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(9)
+    index = pd.date_range("2024-01-01", periods=800, freq="5min")
+    close = 100 + np.cumsum(rng.normal(0, 0.3, len(index)))
+    return pd.DataFrame(
+        {
+            "open": close - 0.1,
+            "high": close + rng.random(len(index)),
+            "low": close - rng.random(len(index)),
+            "close": close,
+            "volume": 1000 + rng.random(len(index)) * 100,
+        },
+        index=index,
+    )
+
+
+PARAM_SETS = [{"rsi_period": p, "bb_period": b} for p in (7, 14, 21) for b in (10, 20)]
+
+
+@pytest.mark.parametrize("strategy", list(StrategyName))
+def test_cached_signals_match_fresh_computation(ohlcv, strategy):
+    shared = StrategySignalGenerator(ohlcv)
+
+    for params in PARAM_SETS:
+        cached = shared.generate(strategy, params)["signal"]
+        fresh = StrategySignalGenerator(ohlcv).generate(strategy, params)["signal"]
+        pd.testing.assert_series_equal(cached, fresh)
+
+
+def test_precompute_covers_search_space(ohlcv):
+    features = FeatureMatrix(ohlcv)
+
+    computed = features.precompute(StrategyName.MEAN_REVERSION, PARAM_SETS)
+    # sma + std per bb_period, rsi per rsi_period
+    assert computed == 2 * 2 + 3
+
+    misses = features.misses
+    generator = StrategySignalGenerator(ohlcv, features)
+    for params in PARAM_SETS:
+        generator.generate(StrategyName.MEAN_REVERSION, params)
+    assert features.misses == misses
+
+
+def test_sweep_param_sets_varies_one_int_parameter_at_a_time():
+    parameters = get_strategy_parameters(StrategyName.MOMENTUM).parameters
+    rsi = next(p for p in parameters if p.name == "rsi_period")
+
+    param_sets = sweep_param_sets(parameters)
+
+    assert param_sets[0] == {}
+    assert all(len(params) == 1 for params in param_sets[1:])
+    rsi_values = [params["rsi_period"] for params in param_sets if "rsi_period" in params]
+    assert rsi_values == list(range(int(rsi.min_value), int(rsi.max_value) + 1, int(rsi.step or 1)))
+
+
+def test_generator_reuses_columns_between_runs(ohlcv):
+    generator = StrategySignalGenerator(ohlcv)
+
+    generator.generate(StrategyName.MOMENTUM, {"roc_threshold": 2.0})
+    misses = generator.features.misses
+    generator.generate(StrategyName.MOMENTUM, {"roc_threshold": 4.0})
+
+    assert generator.features.misses == misses
+    assert set(generator.features.columns) == {"rsi_14", "obv"}
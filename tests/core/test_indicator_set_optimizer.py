@@ -0,0 +1,199 @@
+"""SignalBacktest: array backtests match the original bar-by-bar loops."""
+
+from dataclasses import astuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.indicator_set_optimizer import SignalBacktest, SignalMetrics
+
+SLIPPAGE_PCT = 0.1
+FEE_PCT = 0.04
+
+
+# --- Reference: loop implementation before vectorization ---
+
+
+def _loop_entries(df, signal, hold_bars, short=False):
+    slippage, fee = SLIPPAGE_PCT / 100, FEE_PCT / 100
+    side = -1 if short else 1
+    trades = []
+    i = 0
+    while i < len(df) - hold_bars:
+        if signal.iloc[i]:
+            entry_price = df["close"].iloc[i] * (1 + side * slippage)
+            entry_cost = entry_price * fee
+            exit_idx = min(i + hold_bars, len(df) - 1)
+            exit_price = df["close"].iloc[exit_idx] * (1 - side * slippage)
+            exit_cost = exit_price * fee
+            pnl_pct = side * (exit_price - entry_price) / entry_price - (
+                entry_cost + exit_cost
+            ) / entry_price
+            trades.append({"entry_idx": i, "exit_idx": exit_idx, "pnl_pct": pnl_pct})
+            i = exit_idx + 1
+        else:
+            i += 1
+    return trades
+
+
+def _loop_exit_timing(df, signal, direction):
+    look_ahead = 5
+    trades = []
+    for i in range(len(signal) - look_ahead):
+        if signal.iloc[i]:
+            future_prices = df["close"].iloc[i : i + look_ahead]
+            if direction == "long":
+                best_exit, worst_exit = future_prices.max(), future_prices.min()
+            else:
+                best_exit, worst_exit = future_prices.min(), future_prices.max()
+            current_price = df["close"].iloc[i]
+            if best_exit != worst_exit:
+                timing_score = abs(current_price - best_exit) / abs(best_exit - worst_exit)
+                pnl_pct = (1.0 - timing_score) * 0.02
+            else:
+                pnl_pct = 0.0
+            trades.append({"entry_idx": i, "exit_idx": i, "pnl_pct": pnl_pct})
+    return trades
+
+
+def _loop_metrics(trades, total_signals):
+    if not trades:
+        return SignalMetrics(0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, 0)
+    pnls = [t["pnl_pct"] for t in trades]
+    wins = [p for p in pnls if p > 0]
+    losses = [p for p in pnls if p < 0]
+    n_trades = len(trades)
+    win_rate = len(wins) / n_trades
+    avg_win = np.mean(wins) if wins else 0.0
+    avg_loss = abs(np.mean(losses)) if losses else 0.0
+    total_losses = abs(sum(losses)) if losses else 0.0
+    profit_factor = (sum(wins) if wins else 0.0) / total_losses if total_losses > 0 else float("inf")
+    cumulative = np.cumsum(pnls)
+    max_drawdown = np.max(np.maximum.accumulate(cumulative) - cumulative)
+    returns = np.array(pnls)
+    if len(returns) > 1 and np.std(returns) > 0:
+        sharpe = (np.mean(returns) / np.std(returns)) * np.sqrt(252 * 24 * 12)
+    else:
+        sharpe = 0.0
+    return SignalMetrics(
+        signals=total_signals,
+        trades=n_trades,
+        win_rate=win_rate,
+        profit_factor=profit_factor,
+        avg_win=avg_win,
+        avg_loss=avg_loss,
+        max_drawdown=max_drawdown,
+        sharpe_ratio=sharpe,
+        expectancy=(win_rate * avg_win) - ((1 - win_rate) * avg_loss),
+        total_return=sum(pnls),
+        wins=len(wins),
+        losses=len(losses),
+    )
+
+
+# --- Fixtures ---
+
+
+def _prices(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    index = pd.date_range("2024-01-01", periods=n, freq="5min")
+    return pd.DataFrame({"close": close}, index=index)
+
+
+def _signal(df, bars):
+    signal = pd.Series(False, index=df.index)
+    signal.iloc[list(bars)] = True
+    return signal
+
+
+def _assert_metrics_equal(actual, expected):
+    assert actual.trades == expected.trades
+    assert actual.signals == expected.signals
+    assert astuple(actual) == pytest.approx(astuple(expected), rel=1e-9, abs=1e-12)
+
+
+@pytest.fixture(params=[0, 1, 2])
+def seeded(request):
+    """Price frame plus a dense random signal (many overlapping entries)."""
+    df = _prices(seed=request.param)
+    rng = np.random.default_rng(100 + request.param)
+    signal = pd.Series(rng.random(len(df)) < 0.3, index=df.index)
+    return df, signal
+
+
+# --- Tests ---
+
+
+@pytest.mark.parametrize("hold_bars", [1, 5, 10])
+@pytest.mark.parametrize("short", [False, True])
+def test_entry_backtest_matches_loop(seeded, hold_bars, short):
+    df, signal = seeded
+    backtest = SignalBacktest(df, slippage_pct=SLIPPAGE_PCT, fee_pct=FEE_PCT)
+
+    trades = _loop_entries(df, signal, hold_bars, short=short)
+    run = backtest.backtest_entry_short if short else backtest.backtest_entry_long
+
+    entries = backtest._select_entries(signal, hold_bars)
+    assert entries.tolist() == [t["entry_idx"] for t in trades]
+    _assert_metrics_equal(run(signal, hold_bars), _loop_metrics(trades, signal.sum()))
+
+
+@pytest.mark.parametrize("direction", ["long", "short"])
+def test_exit_timing_matches_loop(seeded, direction):
+    df, signal = seeded
+    backtest = SignalBacktest(df, slippage_pct=SLIPPAGE_PCT, fee_pct=FEE_PCT)
+
+    trades = _loop_exit_timing(df, signal, direction)
+
+    _assert_metrics_equal(
+        backtest.backtest_exit_timing(signal, direction), _loop_metrics(trades, signal.sum())
+    )
+
+
+def test_overlapping_signals_are_skipped_while_in_position():
+    df = _prices(n=50)
+    signal = _signal(df, [3, 4, 5, 13, 14, 15, 30])
+    backtest = SignalBacktest(df, slippage_pct=SLIPPAGE_PCT, fee_pct=FEE_PCT)
+
+    # 3 holds until 13 (next free bar 14), 14 holds until 24, 30 is free again
+    assert backtest._select_entries(signal, hold_bars=10).tolist() == [3, 14, 30]
+    _assert_metrics_equal(
+        backtest.backtest_entry_long(signal, hold_bars=10),
+        _loop_metrics(_loop_entries(df, signal, 10), signal.sum()),
+    )
+
+
+@pytest.mark.parametrize("direction", ["long", "short"])
+def test_signals_in_last_bars_are_truncated(direction):
+    df = _prices(n=40)
+    signal = _signal(df, [20, 30, 34, 35, 38, 39])
+    backtest = SignalBacktest(df, slippage_pct=SLIPPAGE_PCT, fee_pct=FEE_PCT)
+
+    # Entries need hold_bars of room for the exit: 30 is the last that fits
+    assert backtest._select_entries(signal, hold_bars=8).tolist() == [20, 30]
+    _assert_metrics_equal(
+        backtest.backtest_entry_long(signal, hold_bars=8),
+        _loop_metrics(_loop_entries(df, signal, 8), signal.sum()),
+    )
+
+    # Exit timing evaluates bars with a full look-ahead window only (< 35)
+    metrics = backtest.backtest_exit_timing(signal, direction)
+    assert metrics.trades == 3
+    _assert_metrics_equal(metrics, _loop_metrics(_loop_exit_timing(df, signal, direction), 6))
+
+
+def test_no_trades():
+    df = _prices(n=30)
+    backtest = SignalBacktest(df, slippage_pct=SLIPPAGE_PCT, fee_pct=FEE_PCT)
+    empty = _loop_metrics([], 0)
+
+    no_signal = _signal(df, [])
+    _assert_metrics_equal(backtest.backtest_entry_long(no_signal, hold_bars=5), empty)
+    _assert_metrics_equal(backtest.backtest_exit_timing(no_signal), empty)
+
+    # Only signals too close to the end for an exit / shorter data than the hold
+    late = _signal(df, [27, 28, 29])
+    assert backtest.backtest_entry_short(late, hold_bars=5).trades == 0
+    assert backtest.backtest_entry_long(late, hold_bars=50).trades == 0
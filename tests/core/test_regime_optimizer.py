@@ -0,0 +1,90 @@
+"""RegimeOptimizer: fast-scored trials are re-scored exactly before ranking."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core import regime_optimizer
+from src.core.regime_optimizer import (
+    ADXParamRanges,
+    AllParamRanges,
+    EarlyStoppingConfig,
+    OptimizationConfig,
+    ParamRange,
+    RegimeOptimizer,
+    RSIParamRanges,
+)
+
+# Regime classification needs ADX from TA-Lib or pandas_ta
+pytestmark = pytest.mark.skipif(
+    not (regime_optimizer.TALIB_AVAILABLE or regime_optimizer.PANDAS_TA_AVAILABLE),
+    reason="no ADX backend (TA-Lib/pandas_ta) installed",
+)
+
+
+@pytest.fixture
+def optimizer(tmp_path):
+    rng = np.random.default_rng(7)
+    n = 2000
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, n) + 0.001 * np.sin(np.arange(n) / 60)))
+    data = pd.DataFrame({
+        "open": close,
+        "high": close * 1.001,
+        "low": close * 0.999,
+        "close": close,
+        "volume": rng.uniform(100, 1000, n),
+    }, index=pd.date_range("2024-01-01", periods=n, freq="1min"))
+    param_ranges = AllParamRanges(
+        adx=ADXParamRanges(period=ParamRange(min=10, max=20), threshold=ParamRange(min=15, max=30)),
+        rsi=RSIParamRanges(
+            period=ParamRange(min=10, max=20),
+            sideways_low=ParamRange(min=35, max=45),
+            sideways_high=ParamRange(min=55, max=65),
+        ),
+    )
+    config = OptimizationConfig(
+        max_trials=8,
+        n_jobs=1,
+        storage=f"sqlite:///{tmp_path / 'regime.db'}",
+        exact_rescore_top_n=3,
+        early_stopping=EarlyStoppingConfig(enabled=False),
+    )
+    return RegimeOptimizer(data=data, param_ranges=param_ranges, config=config)
+
+
+def test_top_trials_are_rescored_in_exact_mode(optimizer):
+    results = optimizer.optimize(study_name="rescore", n_trials=8)
+
+    study = optimizer._study
+    exact_scores = study.user_attrs["exact_scores"]
+    by_value = sorted(study.trials, key=lambda t: t.value, reverse=True)
+    assert sorted(exact_scores) == sorted(str(t.number) for t in by_value[:3])
+
+    # Rescored trials are ranked first, by exact score
+    ranked = optimizer._ranked_trials()
+    assert [r.score for r in results[:3]] == sorted(
+        (entry["score"] for entry in exact_scores.values()), reverse=True
+    )
+    assert [r.rank for r in results] == list(range(1, len(results) + 1))
+
+    for trial in ranked[:3]:
+        params = optimizer._params_from_trial(trial)
+        regimes = pd.Series(optimizer._classify_trial(trial, params), index=optimizer.data.index)
+        fast = optimizer._score_regimes(params, regimes, fast_mode=True)
+        exact = optimizer._score_regimes(params, regimes, fast_mode=False)
+        assert fast.total_score == pytest.approx(trial.value)
+        assert exact_scores[str(trial.number)]["score"] == pytest.approx(exact.total_score)
+
+    # Reloading the study reuses the stored exact scores
+    reloaded = optimizer.load_results("rescore")
+    assert [r.score for r in reloaded] == [r.score for r in results]
+
+
+def test_exact_rescore_disabled(optimizer):
+    optimizer.config = optimizer.config.model_copy(update={"exact_rescore_top_n": 0})
+    results = optimizer.optimize(study_name="fast_only", n_trials=6)
+
+    assert "exact_scores" not in optimizer._study.user_attrs
+    assert [r.score for r in results] == sorted(
+        (t.value for t in optimizer._study.trials), reverse=True
+    )
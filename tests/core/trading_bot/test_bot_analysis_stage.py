@@ -0,0 +1,121 @@
+"""Tests for the worker-thread analysis stage of the trading bot."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+
+from src.core.trading_bot.bot_analysis_stage import BotAnalysisStage
+
+
+class _SlowAnalyzer:
+    """Market analyzer stand-in with a slow indicator step."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.threads = []
+        self.started = threading.Event()
+
+    def calculate_indicators(self, df):
+        self.threads.append(threading.current_thread().name)
+        self.started.set()
+        time.sleep(self.delay)
+        return df.assign(ema_20=df["close"])
+
+    def detect_regime(self, df):
+        return "TRENDING_UP"
+
+    def extract_market_context(self, df, regime):
+        return {"regime": regime}
+
+
+class _SignalGenerator:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_signal(self, df, regime=None, require_regime_alignment=True):
+        self.calls += 1
+        return SimpleNamespace(is_valid=True, regime=regime)
+
+    def extract_indicator_snapshot(self, df):
+        return {"ema_20": float(df["ema_20"].iat[-1])}
+
+
+def _df():
+    return pd.DataFrame({"close": [1.0, 2.0, 3.0]})
+
+
+def test_analysis_runs_in_worker_thread():
+    analyzer = _SlowAnalyzer()
+    stage = BotAnalysisStage(analyzer, _SignalGenerator())
+
+    async def scenario():
+        return await stage.run(stage.snapshot(_df(), require_regime_alignment=True))
+
+    result = asyncio.run(scenario())
+    stage.shutdown()
+
+    assert analyzer.threads[0].startswith("bot-analysis")
+    assert result.regime == "TRENDING_UP"
+    assert result.indicators == {"ema_20": 3.0}
+    assert stage.get_stats()["cycles_completed"] == 1
+
+
+def test_event_loop_stays_responsive_during_analysis():
+    stage = BotAnalysisStage(_SlowAnalyzer(delay=0.3), _SignalGenerator())
+    price_updates = []
+
+    async def price_feed():
+        for _ in range(5):
+            price_updates.append(time.perf_counter())
+            await asyncio.sleep(0.02)
+
+    async def scenario():
+        started = time.perf_counter()
+        feed = asyncio.create_task(price_feed())
+        await stage.run(stage.snapshot(_df(), require_regime_alignment=True))
+        await feed
+        return started
+
+    started = asyncio.run(scenario())
+    stage.shutdown()
+
+    # All price updates were served while the analysis was still running
+    assert price_updates[-1] - started < 0.25
+
+
+def test_newer_snapshot_cancels_running_cycle():
+    analyzer = _SlowAnalyzer(delay=0.1)
+    generator = _SignalGenerator()
+    stage = BotAnalysisStage(analyzer, generator)
+
+    async def scenario():
+        first = asyncio.create_task(
+            stage.run(stage.snapshot(_df(), require_regime_alignment=True))
+        )
+        await asyncio.to_thread(analyzer.started.wait, 1.0)
+        second = stage.snapshot(_df(), require_regime_alignment=False)
+        return await first, await stage.run(second)
+
+    stale, fresh = asyncio.run(scenario())
+    stage.shutdown()
+
+    assert stale is None
+    assert fresh is not None and fresh.snapshot.require_regime_alignment is False
+    assert generator.calls == 1
+    assert stage.cycles_cancelled == 1
+
+
+def test_stale_condition_discards_result():
+    stage = BotAnalysisStage(_SlowAnalyzer(), _SignalGenerator())
+    stale = {"value": False}
+
+    async def scenario():
+        snapshot = stage.snapshot(_df(), require_regime_alignment=True)
+        stale["value"] = True
+        return await stage.run(snapshot, is_stale=lambda: stale["value"])
+
+    assert asyncio.run(scenario()) is None
+    stage.shutdown()
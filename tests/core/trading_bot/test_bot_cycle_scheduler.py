@@ -0,0 +1,94 @@
+"""Tests for the event-driven analysis cycle scheduler."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from src.core.trading_bot.bot_cycle_scheduler import BarCloseScheduler, bar_key_and_close_time
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_first_trigger_is_immediate():
+    scheduler = BarCloseScheduler(fallback_interval=10.0)
+
+    event = _run(asyncio.wait_for(scheduler.wait_for_trigger(), timeout=1.0))
+
+    assert event.reason == "start"
+
+
+def test_falls_back_to_interval_without_events():
+    async def scenario():
+        scheduler = BarCloseScheduler(fallback_interval=0.05)
+        await scheduler.wait_for_trigger()
+        return await scheduler.wait_for_trigger()
+
+    assert _run(scenario()).reason == "interval"
+
+
+def test_event_burst_is_coalesced_into_one_cycle():
+    async def scenario():
+        scheduler = BarCloseScheduler(
+            fallback_interval=10.0, coalesce_seconds=0.05, tick_move_percent=0.1
+        )
+        await scheduler.wait_for_trigger()
+        scheduler.record_decision(None, price=100.0)
+
+        async def burst():
+            await asyncio.sleep(0.01)
+            scheduler.notify_tick(100.5)
+            bar_close = datetime.now(timezone.utc)
+            scheduler.notify_bar_close(bar_close)
+            scheduler.notify_tick(101.0)
+
+        asyncio.get_running_loop().create_task(burst())
+        event = await asyncio.wait_for(scheduler.wait_for_trigger(), timeout=1.0)
+        return scheduler, event
+
+    scheduler, event = _run(scenario())
+
+    assert event.reason == "bar_close"
+    assert event.coalesced == 2
+    assert scheduler.stats.wakeups == 2
+
+
+def test_small_ticks_do_not_wake_the_loop():
+    scheduler = BarCloseScheduler(tick_move_percent=0.5)
+    scheduler.record_decision(None, price=100.0)
+
+    assert scheduler.notify_tick(100.2) is False
+    assert scheduler.notify_tick(100.6) is True
+    assert scheduler.notify_tick(100.7) is False
+    assert scheduler.stats.ignored_ticks == 2
+
+
+def test_notify_from_other_thread_wakes_loop():
+    async def scenario():
+        scheduler = BarCloseScheduler(fallback_interval=10.0, coalesce_seconds=0.0)
+        await scheduler.wait_for_trigger()
+        threading.Timer(0.02, scheduler.notify_bar_close).start()
+        return await asyncio.wait_for(scheduler.wait_for_trigger(), timeout=1.0)
+
+    assert _run(scenario()).reason == "bar_close"
+
+
+def test_unchanged_input_is_skipped_and_latency_recorded():
+    index = pd.date_range("2024-01-02 10:00", periods=3, freq="5min", tz="UTC")
+    df = pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=index)
+    scheduler = BarCloseScheduler()
+
+    key, bar_close = bar_key_and_close_time(df)
+    assert bar_close == index[-1]
+    assert scheduler.should_run(key) is True
+    assert scheduler.should_run(bar_key_and_close_time(df.copy())[0]) is False
+
+    df.loc[index[-1], "close"] = 3.5
+    assert scheduler.should_run(bar_key_and_close_time(df)[0]) is True
+
+    latency = scheduler.record_decision(datetime.now(timezone.utc) - timedelta(seconds=2))
+    assert 2000 <= latency < 3000
+    assert scheduler.stats.to_dict()["cycles_skipped"] == 1
@@ -0,0 +1,194 @@
+"""Deadline-bounded, concurrent LLM validation against a local stub LLM server."""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+
+from src.common import http_pool as http_pool_module
+from src.common.http_pool import HTTPSessionPool
+from src.core.trading_bot import ai_validator as ai_validator_module
+from src.core.trading_bot.ai_validator import AISignalValidator
+from src.core.trading_bot.entry_score_engine import EntryScoreResult
+from src.core.trading_bot.entry_score_types import ScoreDirection, ScoreQuality
+from src.core.trading_bot.llm_validation_service import LLMValidationService
+from src.core.trading_bot.llm_validation_state import (
+    LLMAction,
+    LLMValidationConfig,
+    ValidationTier,
+)
+
+
+class StubLLMServer:
+    """OpenAI-compatible chat completions endpoint with per-tier delays."""
+
+    def __init__(self):
+        self.tiers = {
+            "quick": {"delay": 0.0, "response": {"confidence": 80}},
+            "deep": {"delay": 0.0, "response": {"confidence": 80}},
+        }
+        self.requests = []  # (tier, received_at)
+        self._runner = None
+        self.base_url = ""
+
+    async def _handle(self, request):
+        body = await request.json()
+        prompt = body["messages"][-1]["content"]
+        tier = "deep" if "DEEP ANALYSIS" in prompt else "quick"
+        self.requests.append((tier, time.perf_counter()))
+        await asyncio.sleep(self.tiers[tier]["delay"])
+        content = json.dumps(self.tiers[tier]["response"])
+        return web.json_response({"choices": [{"message": {"content": content}}]})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}/v1"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+    def count(self, tier):
+        return sum(1 for t, _ in self.requests if t == tier)
+
+
+@pytest.fixture(autouse=True)
+def local_provider(monkeypatch):
+    monkeypatch.setattr(ai_validator_module, "get_provider_from_settings", lambda: "local")
+    monkeypatch.setattr(ai_validator_module, "get_model_from_settings", lambda provider: "stub")
+    monkeypatch.setattr(http_pool_module, "_http_pool", HTTPSessionPool())
+
+
+def _run_with_stub(scenario, monkeypatch):
+    async def main():
+        stub = StubLLMServer()
+        await stub.start()
+        monkeypatch.setenv("LOCAL_LLM_BASE_URL", stub.base_url)
+        try:
+            return await scenario(stub)
+        finally:
+            await http_pool_module.get_http_pool().close()
+            await stub.stop()
+
+    return asyncio.run(main())
+
+
+def _context(price=100.0):
+    return SimpleNamespace(
+        symbol="BTCUSDT",
+        timeframe="5m",
+        current_price=price,
+        timestamp=datetime(2024, 1, 2, 10, 0, tzinfo=timezone.utc),
+        regime="STRONG_TREND_BULL",
+        trend_direction="UP",
+        indicators=None,
+        candles=[],
+    )
+
+
+def _entry_score(final_score=0.6):
+    return EntryScoreResult(
+        raw_score=final_score,
+        final_score=final_score,
+        direction=ScoreDirection.LONG,
+        quality=ScoreQuality.MODERATE,
+    )
+
+
+def _service(**overrides):
+    config = LLMValidationConfig(include_levels=False, **overrides)
+    return LLMValidationService(config)
+
+
+def test_quick_and_deep_run_concurrently(monkeypatch):
+    async def scenario(stub):
+        stub.tiers["quick"] = {"delay": 0.3, "response": {"confidence": 60}}
+        stub.tiers["deep"] = {"delay": 0.3, "response": {"confidence": 75}}
+        service = _service()
+        started = time.perf_counter()
+        result = await service.validate(_context(), _entry_score())
+        return stub, result, time.perf_counter() - started
+
+    stub, result, elapsed = _run_with_stub(scenario, monkeypatch)
+
+    assert result.tier == ValidationTier.DEEP
+    assert result.action == LLMAction.APPROVE
+    assert result.deep_triggered
+    # One round-trip instead of two serial ones
+    assert elapsed < 0.55
+    (_, quick_at), (_, deep_at) = sorted(stub.requests, key=lambda r: r[0] != "quick")
+    assert abs(deep_at - quick_at) < 0.1
+
+
+def test_latency_budget_returns_configured_fallback(monkeypatch):
+    async def scenario(stub):
+        stub.tiers["quick"]["delay"] = 1.0
+        stub.tiers["deep"]["delay"] = 1.0
+        service = _service(latency_budget_ms=200, deadline_fallback="veto")
+        started = time.perf_counter()
+        result = await service.validate(_context(), _entry_score())
+        return result, time.perf_counter() - started
+
+    result, elapsed = _run_with_stub(scenario, monkeypatch)
+
+    assert result.tier == ValidationTier.TIMEOUT
+    assert result.action == LLMAction.VETO
+    assert elapsed < 0.5
+
+
+def test_prefetch_is_reused_by_validation(monkeypatch):
+    async def scenario(stub):
+        stub.tiers["quick"] = {"delay": 0.2, "response": {"confidence": 90}}
+        service = _service(concurrent_deep=False)
+
+        assert not service.prefetch(_context(), _entry_score(0.2))
+        assert service.prefetch(_context(), _entry_score(0.45))
+        await asyncio.sleep(0.1)  # Score keeps rising while the request runs
+        first = await service.validate(_context(price=100.01), _entry_score(0.6))
+        second = await service.validate(_context(), _entry_score(0.7))
+        return stub, service, first, second
+
+    stub, service, first, second = _run_with_stub(scenario, monkeypatch)
+
+    assert first.action == second.action == LLMAction.BOOST
+    assert stub.count("quick") == 1
+    assert service._cache.get_stats()["joined"] == 1
+    assert service._cache.get_stats()["hits"] == 1
+
+
+def test_hierarchical_validator_decides_on_quick_without_waiting_for_deep(monkeypatch):
+    async def scenario(stub):
+        stub.tiers["quick"] = {"delay": 0.05, "response": {"confidence_score": 90}}
+        stub.tiers["deep"] = {"delay": 2.0, "response": {"confidence_score": 90}}
+        validator = AISignalValidator(latency_budget_seconds=1.0)
+        signal = SimpleNamespace(
+            direction=SimpleNamespace(value="LONG"),
+            confluence_score=4,
+            current_price=100.0,
+            regime="TRENDING_UP",
+            conditions_met=[],
+            conditions_failed=[],
+        )
+        started = time.perf_counter()
+        approved = await validator.validate_signal_hierarchical(signal)
+
+        stub.tiers["quick"]["delay"] = 2.0
+        validator.latency_budget_seconds = 0.1
+        signal.current_price = 120.0  # New fingerprint: no cache hit
+        timed_out = await validator.validate_signal_hierarchical(signal)
+        return approved, timed_out, time.perf_counter() - started
+
+    approved, timed_out, elapsed = _run_with_stub(scenario, monkeypatch)
+
+    assert approved.approved and approved.validation_level.value == "quick"
+    assert timed_out.provider == "fallback" and "latency budget" in timed_out.error
+    assert elapsed < 1.0
@@ -0,0 +1,63 @@
+"""BacktestHarness: two-phase FAST mode reproduces the bar-by-bar FULL mode."""
+
+from dataclasses import asdict
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.indicators import base as indicator_base
+from src.core.tradingbot.backtest_harness import BacktestHarness
+from src.core.tradingbot.backtest_types import BacktestConfig, BacktestMode
+from src.core.tradingbot.config import FullBotConfig
+
+# Regimes (and thus strategies/entries) need ADX from TA-Lib or pandas_ta
+pytestmark = pytest.mark.skipif(
+    not (indicator_base.TALIB_AVAILABLE or indicator_base.PANDAS_TA_AVAILABLE),
+    reason="no ADX backend (TA-Lib/pandas_ta) installed",
+)
+
+
+def _bars(n: int, seed: int) -> pd.DataFrame:
+    """Random-walk 1m bars with slow trend swings."""
+    rng = np.random.default_rng(seed)
+    drift = 0.0004 * np.sin(np.arange(n) / 40)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.003, n) + drift))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) * 1.002,
+        "low": np.minimum(open_, close) * 0.998,
+        "close": close,
+        "volume": rng.uniform(50, 150, n),
+    }, index=pd.date_range("2024-01-02 14:00", periods=n, freq="1min"))
+
+
+def _run(data: pd.DataFrame, mode: BacktestMode):
+    config = BacktestConfig(
+        start_date=datetime(2024, 1, 2),
+        end_date=datetime(2024, 1, 3),
+        symbol="BTCUSDT",
+        mode=mode,
+        seed=1,
+    )
+    harness = BacktestHarness(
+        FullBotConfig.create_default("BTCUSDT"), config, data_provider=lambda *args: data
+    )
+    return harness.run(), harness
+
+
+@pytest.mark.parametrize("seed", [3, 8])
+def test_fast_mode_produces_identical_trades_and_equity(seed):
+    data = _bars(400, seed)
+
+    full, full_harness = _run(data, BacktestMode.FULL)
+    fast, fast_harness = _run(data, BacktestMode.FAST)
+
+    assert full.total_trades > 0
+    assert [asdict(t) for t in fast.trades] == [asdict(t) for t in full.trades]
+    assert fast.equity_curve == full.equity_curve
+    assert fast.final_capital == full.final_capital
+    assert fast_harness._state.signals_generated == full_harness._state.signals_generated
+    assert fast_harness._state.signals_confirmed == full_harness._state.signals_confirmed
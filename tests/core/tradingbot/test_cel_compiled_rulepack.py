@@ -0,0 +1,140 @@
+"""Tests for precompiled CEL RulePacks and incremental rule evaluation."""
+
+import json
+
+import celpy
+import pytest
+
+from src.core.tradingbot.cel import CELEngine, RulePack, RulePackExecutor
+from src.core.tradingbot.cel import compiled as compiled_module
+from src.core.tradingbot.cel.loader import RulePackLoader
+
+RULEPACK = {
+    "rules_version": "1.0.0",
+    "engine": "CEL",
+    "packs": [
+        {
+            "pack_type": "entry",
+            "rules": [
+                {
+                    "id": "rsi_oversold",
+                    "name": "RSI oversold",
+                    "expression": "rsi14.value < 30 && direction == 'UP'",
+                    "severity": "warn",
+                },
+                {
+                    "id": "macd_cross",
+                    "name": "MACD cross",
+                    "expression": "macd.value > macd.signal",
+                    "severity": "warn",
+                },
+            ],
+        }
+    ],
+}
+
+
+class _JsonValidator:
+    """Schema validator stand-in that records how often it ran."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def validate_file(self, json_path, schema_name):
+        self.calls += 1
+        with open(json_path, encoding="utf-8") as f:
+            return json.load(f)
+
+
+@pytest.fixture
+def rulepack_file(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(RULEPACK), encoding="utf-8")
+    return path
+
+
+def _context(rsi=25.0, macd=1.0, close=100.0):
+    return celpy.json_to_cel({
+        "rsi14": {"value": rsi},
+        "direction": "UP",
+        "macd": {"value": macd, "signal": 0.5},
+        "close": close,
+    })
+
+
+def test_dependencies_are_dotted_context_paths():
+    engine = CELEngine()
+
+    deps = engine.dependencies("rsi14.value < 30 && size(levels) > 0 && trade.side == 'L'")
+
+    assert deps == {"rsi14.value", "levels", "trade.side"}
+
+
+def test_load_compiled_reuses_cached_artifact(rulepack_file, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    validator = _JsonValidator()
+    first = RulePackLoader(validator, cache_dir=cache_dir).load_compiled(rulepack_file)
+
+    compiled_module.clear_ast_cache()
+    monkeypatch.setattr(
+        compiled_module.CompiledRulePack, "compile",
+        classmethod(lambda cls, *a, **k: pytest.fail("recompiled unchanged RulePack")),
+    )
+    second = RulePackLoader(validator, cache_dir=cache_dir).load_compiled(rulepack_file)
+
+    assert validator.calls == 1
+    assert second.source_hash == first.source_hash
+    assert set(second.expressions) == {"rsi_oversold", "macd_cross"}
+    assert second.expressions["macd_cross"].dependencies == {"macd.value", "macd.signal"}
+
+
+def test_changed_rulepack_is_recompiled(rulepack_file, tmp_path):
+    validator = _JsonValidator()
+    loader = RulePackLoader(validator, cache_dir=tmp_path / "cache")
+    first = loader.load_compiled(rulepack_file)
+
+    data = json.loads(rulepack_file.read_text(encoding="utf-8"))
+    data["packs"][0]["rules"][1]["expression"] = "macd.value < macd.signal"
+    rulepack_file.write_text(json.dumps(data), encoding="utf-8")
+    second = loader.load_compiled(rulepack_file)
+
+    assert validator.calls == 2
+    assert second.source_hash != first.source_hash
+    assert second.expressions["macd_cross"].expression == "macd.value < macd.signal"
+
+
+def test_executor_skips_rules_with_unchanged_inputs():
+    executor = RulePackExecutor(CELEngine())
+    rulepack = RulePack(**RULEPACK)
+
+    executor.execute(rulepack, _context())
+    # Only close changed: no rule reads it
+    summary = executor.execute(rulepack, _context(close=101.0))
+    cached = {r.rule_id: r.cached for r in summary.pack_results[0].rule_results}
+    assert cached == {"rsi_oversold": True, "macd_cross": True}
+    assert summary.total_rules_triggered == 2
+
+    summary = executor.execute(rulepack, _context(rsi=45.0))
+    results = {r.rule_id: r for r in summary.pack_results[0].rule_results}
+    assert not results["rsi_oversold"].cached and not results["rsi_oversold"].triggered
+    assert results["macd_cross"].cached and results["macd_cross"].triggered
+    assert executor.get_rule_stats("macd_cross")["cached"] == 2
+
+
+def test_executor_without_skipping_always_evaluates():
+    executor = RulePackExecutor(CELEngine(), skip_unchanged=False)
+    rulepack = RulePack(**RULEPACK)
+
+    executor.execute(rulepack, _context())
+    summary = executor.execute(rulepack, _context())
+
+    assert not any(r.cached for r in summary.pack_results[0].rule_results)
+
+
+def test_compile_cache_is_per_instance():
+    first, second = CELEngine(cache_size=4), CELEngine(cache_size=4)
+
+    first.compile("close > 1.0")
+
+    assert first.get_cache_info()["size"] == 1
+    assert second.get_cache_info()["size"] == 0
@@ -0,0 +1,106 @@
+"""Tests for the lazy CEL context and its builders."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.tradingbot.cel import LazyContext, RuleContextBuilder
+from src.core.tradingbot.cel_engine_core import CELEngine
+from src.core.tradingbot.json_entry_scorer import JsonEntryScorer
+from src.core.tradingbot.models import FeatureVector, RegimeState
+from src.core.variables import CELContextBuilder
+
+
+class _CountingProvider:
+    """Chart/bot provider stand-in that counts get_context() calls."""
+
+    def __init__(self, namespace, values):
+        self.namespace = namespace
+        self.values = values
+        self.calls = 0
+
+    def get_context(self, source):
+        self.calls += 1
+        return {f"{self.namespace}.{k}": v for k, v in self.values.items()}
+
+    def _get_empty_context(self):
+        return {f"{self.namespace}.{k}": None for k in self.values}
+
+
+@pytest.fixture
+def features():
+    return FeatureVector(
+        timestamp=datetime(2024, 1, 2, 10, 0),
+        symbol="BTCUSDT",
+        open=99.0, high=101.0, low=98.5, close=100.0, volume=12.0,
+        rsi_14=25.0, adx=30.0, macd=0.4, macd_signal=0.1, macd_hist=0.3,
+    )
+
+
+def test_only_referenced_variables_are_resolved():
+    calls = []
+    context = LazyContext()
+    for name, value in {"rsi": 25.0, "adx": 30.0, "volume": 5.0}.items():
+        context.define(name, lambda name=name, value=value: calls.append(name) or value)
+
+    assert CELEngine().evaluate("rsi < 30", context) is True
+    assert calls == ["rsi"]
+
+
+def test_values_are_memoized_per_bar():
+    bar = {"close": 100.0}
+    context = LazyContext(bar_key=1)
+    context.define("close", lambda: bar["close"])
+
+    assert context["close"] == 100.0
+    bar["close"] = 101.0
+    assert context["close"] == 100.0
+    assert context.start_bar(1) is False
+    assert context.start_bar(2) is True
+    assert context["close"] == 101.0
+    assert context.resolved == 2
+
+
+def test_rule_context_lazy_matches_eager_build(features):
+    trade = SimpleNamespace(direction="LONG", entry_price=95.0, stop_loss=90.0)
+
+    eager = RuleContextBuilder.build(features, trade=trade, additional_context={"x": 1})
+    lazy = RuleContextBuilder.build_lazy(features, trade=trade, additional_context={"x": 1})
+
+    assert lazy.to_dict() == eager
+    assert lazy.bar_key == features.timestamp
+
+
+def test_context_builder_runs_only_referenced_providers():
+    chart = _CountingProvider("chart", {"price": 100.0})
+    bot = _CountingProvider("bot", {"leverage": 10})
+    builder = CELContextBuilder(chart_provider=chart, bot_provider=bot)
+
+    context = builder.build_lazy(chart_window=object(), bot_config=object())
+    result = CELEngine().evaluate("chart.price > 50.0", context)
+
+    assert result is True
+    assert (chart.calls, bot.calls) == (1, 0)
+    assert dict(context) == {"chart.price": 100.0, "bot.leverage": 10}
+
+
+def test_entry_scorer_reuses_context_between_sides(features):
+    config = SimpleNamespace(
+        entry_expression="side == 'long' && rsi < 30.0",
+        entry_enabled=True,
+        regime_json_path=None,
+    )
+    scorer = JsonEntryScorer(config, CELEngine())
+    regime = RegimeState()
+
+    long_entry, _, _ = scorer.should_enter_long(features, regime)
+    context = scorer._context
+    resolved = context.resolved
+    short_entry, _, _ = scorer.should_enter_short(features, regime)
+
+    assert (long_entry, short_entry) == (True, False)
+    assert scorer._context is context
+    # Same bar: nothing recomputed; only expression + reason code inputs resolved
+    assert context.resolved == resolved
+    assert resolved < len(context.names()) / 2
@@ -0,0 +1,42 @@
+"""Tests for FeatureEngine.calculate_features_batch (two-phase backtest input)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.tradingbot.feature_engine import FeatureEngine
+
+
+@pytest.fixture
+def ohlcv():
+    """150 one-minute bars of random-walk OHLCV data."""
+    rng = np.random.default_rng(11)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, 150)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) * 1.001,
+        "low": np.minimum(open_, close) * 0.999,
+        "close": close,
+        "volume": rng.uniform(50, 150, 150),
+    }, index=pd.date_range("2024-01-02", periods=150, freq="1min"))
+
+
+def test_batch_matches_per_bar_calculation(ohlcv):
+    batch = FeatureEngine().calculate_features_batch(ohlcv, "BTCUSDT")
+    assert len(batch) == len(ohlcv)
+
+    for i in range(FeatureEngine.MIN_BARS - 1, len(ohlcv), 7):
+        expected = FeatureEngine().calculate_features(ohlcv.iloc[:i + 1], "BTCUSDT")
+        assert batch[i].model_dump() == expected.model_dump()
+
+
+def test_batch_skips_bars_without_history(ohlcv):
+    batch = FeatureEngine().calculate_features_batch(ohlcv, "BTCUSDT")
+    assert all(vector is None for vector in batch[:FeatureEngine.MIN_BARS - 1])
+    assert batch[FeatureEngine.MIN_BARS - 1] is not None
+
+
+def test_batch_never_reads_lookahead_columns(ohlcv):
+    batch = FeatureEngine().calculate_features_batch(ohlcv, "BTCUSDT")
+    assert all(vector.ichimoku_chikou is None for vector in batch if vector is not None)
@@ -0,0 +1,292 @@
+"""Unit tests for the shared multi-symbol bar store, features and state machines."""
+
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.entry_signals.entry_signal_engine_indicators import _atr, _ema, _rsi
+from src.common.event_bus import Event, EventBus, EventType
+from src.core.tradingbot.models import BotAction, TradeSide
+from src.core.tradingbot.portfolio_features import (
+    PortfolioBarStore,
+    PortfolioFeatureConfig,
+    PortfolioFeatureFeed,
+)
+from src.core.tradingbot.state_machine import BotState
+
+INDEX = pd.date_range("2024-01-01", periods=80, freq="5min", tz="UTC")
+
+
+def _frame(closes, index=INDEX) -> pd.DataFrame:
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame(
+        {"open": closes, "high": closes + 0.2, "low": closes - 0.2, "close": closes, "volume": 1.0},
+        index=index,
+    )
+
+
+def _trend_frames() -> dict[str, pd.DataFrame]:
+    t = np.arange(len(INDEX))
+    wiggle = np.sin(t) * 0.6
+    return {
+        "UP": _frame(100 + 0.5 * t + wiggle),
+        "DOWN": _frame(200 - 0.5 * t + wiggle),
+        "FLAT": _frame(50 + np.sin(t)),
+    }
+
+
+def _emit_bar(bus: EventBus, symbol: str, ts: pd.Timestamp, price: float) -> None:
+    bus.emit(Event(
+        type=EventType.MARKET_BAR,
+        timestamp=datetime.utcnow(),
+        data={
+            "symbol": symbol,
+            "open": price,
+            "high": price + 0.2,
+            "low": price - 0.2,
+            "close": price,
+            "volume": 1.0,
+            "timestamp": ts.isoformat(),
+        },
+    ))
+
+
+class TestPortfolioBarStore:
+    def test_new_timestamp_closes_column_and_forward_fills(self):
+        store = PortfolioBarStore(["A", "B"], maxlen=4)
+        t0, t1 = INDEX[0].value, INDEX[1].value
+
+        assert store.update("A", t0, 1, 2, 0.5, 1.5, 10) is True
+        assert store.update("B", t0, 5, 6, 4.5, 5.5, 20) is False
+        assert store.update("A", t1, 1.5, 3, 1, 2.5, 5) is True
+
+        # B has not printed t1 yet: forward-filled from its close
+        np.testing.assert_array_equal(store.column(-1)[:, 1], [5.5, 5.5, 5.5, 5.5, 0.0])
+        assert store.fresh(-1).tolist() == [True, False]
+        np.testing.assert_array_equal(store.matrix("close", closed=True), [[1.5], [5.5]])
+
+        # Late update for the forming column is written in place
+        assert store.update("B", t1, 5.5, 7, 5, 6.5, 8) is False
+        assert store.matrix("close")[1, -1] == 6.5
+
+    def test_window_is_contiguous_view_after_compaction(self):
+        store = PortfolioBarStore(["A"], maxlen=3)
+        for i in range(10):
+            store.update("A", INDEX[i].value, i, i, i, float(i), 1.0)
+
+        close = store.matrix("close")
+        assert close.base is not None  # View into the store arrays
+        np.testing.assert_array_equal(close, [[7.0, 8.0, 9.0]])
+        np.testing.assert_array_equal(store.timestamp_view(), INDEX[7:10].asi8)
+
+        assert store.update("A", INDEX[0].value, 0, 0, 0, 0, 0) is False
+        assert store.late_updates == 1
+
+    def test_load_aligns_frames_on_union_of_timestamps(self):
+        store = PortfolioBarStore(maxlen=100)
+        frames = {"A": _frame(np.arange(10.0), INDEX[:10]), "B": _frame([1.0, 2.0], INDEX[[2, 5]])}
+
+        assert store.load(frames) == 10
+
+        close_b = store.matrix("close")[store.row("B")]
+        assert np.isnan(close_b[:2]).all()
+        np.testing.assert_array_equal(close_b[2:], [1, 1, 1, 2, 2, 2, 2, 2])
+        assert store.to_dataframe("A")["close"].tolist() == list(np.arange(10.0))
+
+
+class TestBatchFeatures:
+    def test_matches_single_symbol_indicators(self):
+        rng = np.random.default_rng(0)
+        closes = 100 + np.cumsum(rng.normal(0, 1, (3, 120)), axis=1)
+        index = pd.date_range("2024-01-01", periods=120, freq="5min", tz="UTC")
+        frames = {name: _frame(c, index) for name, c in zip("ABC", closes)}
+        frames["C"] = frames["C"].iloc[30:]  # Listed later than the others
+
+        feed = PortfolioFeatureFeed(config=PortfolioFeatureConfig(maxlen=200))
+        feed.load_history(frames)
+        features = feed.features
+
+        for row, (symbol, df) in enumerate(frames.items()):
+            closed = df.iloc[:-1]  # Newest bar is still forming
+            c, h, l = closed["close"].values, closed["high"].values, closed["low"].values
+            assert features.ema_fast[row] == pytest.approx(_ema(c, 20)[-1])
+            assert features.ema_slow[row] == pytest.approx(_ema(c, 50)[-1])
+            assert features.atr[row] == pytest.approx(_atr(h, l, c, 14)[-1])
+            # Textbook Wilder seed vs. the entry engine's seed: converges
+            assert features.rsi[row] == pytest.approx(_rsi(c, 14)[-1], abs=0.1)
+
+
+class TestPortfolioFeatureFeed:
+    def test_single_subscription_steps_features_on_bar_close(self):
+        closes = []
+        feed = PortfolioFeatureFeed(on_bar_close=closes.append)
+        feed.load_history(_trend_frames())
+        bus = EventBus()
+        feed.attach(bus)
+
+        def portfolio_bar(k, prices):
+            ts = INDEX[-1] + pd.Timedelta(minutes=5 * k)
+            for symbol, price in prices.items():
+                _emit_bar(bus, symbol, ts, price)
+
+        portfolio_bar(1, {"UP": 140.5, "DOWN": 159.5, "FLAT": 50.0})
+        assert len(closes) == 1  # History's forming bar closed by the first new column
+        assert closes[0].timestamp == INDEX[-1].to_pydatetime()
+
+        portfolio_bar(2, {"UP": 141.0, "DOWN": 159.0, "FLAT": 50.0})
+        closed = closes[-1]
+        assert closed.symbols == ["UP", "DOWN", "FLAT"]
+        np.testing.assert_array_equal(closed.bars[3], [140.5, 159.5, 50.0])
+        assert closed.features["ready"].all()
+        assert closed.features["trend"][0] > 0 > closed.features["trend"][1]
+
+        snapshot = feed.snapshot()
+        assert snapshot["UP"]["close"] == 140.5
+        assert snapshot["UP"]["ready"] is True
+
+        stats = feed.get_stats()
+        assert stats["bar_closes"] == 2
+        feed.detach()
+        portfolio_bar(3, {"UP": 120.0})
+        assert feed.get_stats()["bars"] == stats["bars"]
+
+    def test_failing_handler_does_not_break_the_feed(self):
+        def fail(closed):
+            raise RuntimeError("boom")
+
+        feed = PortfolioFeatureFeed(on_bar_close=fail)
+        feed.load_history(_trend_frames())
+
+        ts = INDEX[-1] + pd.Timedelta(minutes=5)
+        closed = feed.on_bar("UP", ts, 140.5, 140.7, 140.3, 140.5)
+
+        assert closed is not None
+        assert feed.on_bar("UP", ts, 140.5, 141.0, 140.3, 140.8) is None  # Same column
+
+
+class TestPortfolioStateMachines:
+    def test_single_subscription_drives_per_symbol_state(self):
+        decisions = []
+        feed = PortfolioFeatureFeed(
+            config=PortfolioFeatureConfig(rsi_long_range=(50, 100), rsi_short_range=(0, 50)),
+            on_bar_close=lambda closed: decisions.extend(closed.decisions),
+        )
+        feed.load_history(_trend_frames())
+        bus = EventBus()
+        feed.attach(bus)
+
+        def portfolio_bar(k, prices):
+            ts = INDEX[-1] + pd.Timedelta(minutes=5 * k)
+            for symbol, price in prices.items():
+                _emit_bar(bus, symbol, ts, price)
+
+        portfolio_bar(1, {"UP": 140.5, "DOWN": 159.5, "FLAT": 50.0})
+        assert decisions == []  # Candidates need one confirmation bar
+        assert feed.slot("UP").state == BotState.SIGNAL
+
+        portfolio_bar(2, {"UP": 141.0, "DOWN": 159.0, "FLAT": 50.0})
+        entered = {d.symbol: d for d in decisions}
+        assert set(entered) == {"UP", "DOWN"}
+        assert entered["UP"].action == BotAction.ENTER and entered["UP"].side == TradeSide.LONG
+        assert entered["DOWN"].side == TradeSide.SHORT
+        assert entered["UP"].stop_price_after < 140.5 < entered["DOWN"].stop_price_after
+
+        # UP crashes through its stop; DOWN trails its stop lower
+        decisions.clear()
+        portfolio_bar(3, {"UP": 120.0, "DOWN": 158.0, "FLAT": 50.0})
+        portfolio_bar(4, {"UP": 120.0, "DOWN": 158.0, "FLAT": 50.0})
+        by_symbol = {d.symbol: d for d in decisions}
+        assert by_symbol["UP"].action == BotAction.EXIT
+        assert by_symbol["UP"].reason_codes == ["stop_hit"]
+        assert by_symbol["DOWN"].action == BotAction.ADJUST_STOP
+        assert "FLAT" not in by_symbol
+
+        assert feed.slot("UP").state == BotState.EXITED
+        assert feed.slot("DOWN").state == BotState.MANAGE
+        assert feed.slot("FLAT").state == BotState.FLAT
+        stats = feed.get_stats()
+        assert stats["states"]["manage"] == 1
+        assert stats["decisions"] == len(entered) + len(decisions)
+
+        feed.reject("DOWN")
+        assert feed.slot("DOWN").state == BotState.FLAT
+
+    def test_paused_symbol_does_not_enter(self):
+        feed = PortfolioFeatureFeed(
+            config=PortfolioFeatureConfig(confirm_bars=0, rsi_long_range=(50, 100))
+        )
+        feed.load_history(_trend_frames())
+        feed.pause("UP")
+
+        ts = INDEX[-1] + pd.Timedelta(minutes=5)
+        closed = feed.on_bar("UP", ts, 140.5, 140.7, 140.3, 140.5)
+
+        assert all(d.symbol != "UP" for d in closed.decisions)
+        assert feed.slot("UP").state == BotState.PAUSED
+        feed.resume("UP")
+        assert feed.slot("UP").state == BotState.FLAT
+        with pytest.raises(KeyError):
+            feed.slot("MISSING")
+
+
+class TestBotControllerPortfolioFeed:
+    @pytest.fixture
+    def make_controller(self, monkeypatch):
+        from src.core.tradingbot.bot_controller import BotController
+        from src.core.tradingbot.config import FullBotConfig
+
+        def make(symbol):
+            controller = BotController(FullBotConfig.create_default(symbol))
+            controller.evaluated = 0
+            calculate_features = controller._calculate_features
+
+            async def counting(bar):
+                controller.evaluated += 1
+                return await calculate_features(bar)
+
+            monkeypatch.setattr(controller, "_calculate_features", counting)
+            controller.start()
+            return controller
+
+        return make
+
+    @staticmethod
+    def _bar(k, price):
+        ts = INDEX[-1] + pd.Timedelta(minutes=5 * k)
+        return {
+            "timestamp": ts.isoformat(), "open": price, "high": price + 0.2,
+            "low": price - 0.2, "close": price, "volume": 1.0,
+        }
+
+    def test_only_candidates_run_the_full_pipeline(self, make_controller):
+        feed = PortfolioFeatureFeed(
+            config=PortfolioFeatureConfig(rsi_long_range=(50, 100), rsi_short_range=(0, 50))
+        )
+        frames = _trend_frames()
+        feed.load_history({"FLAT": frames["FLAT"], "UP": frames["UP"]})
+        flat, up = make_controller("FLAT"), make_controller("UP")
+        flat.attach_portfolio_feed(feed)
+        up.attach_portfolio_feed(feed)
+
+        # First bar closes the history column: UP becomes a candidate
+        asyncio.run(flat.on_bar(self._bar(1, 50.0)))
+        asyncio.run(up.on_bar(self._bar(1, 140.5)))
+        assert feed.slot("FLAT").state == BotState.FLAT
+        assert feed.slot("UP").state == BotState.SIGNAL
+
+        # FLAT only buffers the bar, UP runs FeatureEngine, regime, strategies
+        assert flat.evaluated == 0
+        assert len(flat._bar_buffer) == 1
+        assert up.evaluated == 1
+
+        flat.pause("test")
+        assert feed.slot("FLAT").state == BotState.PAUSED
+        flat.resume()
+        assert feed.slot("FLAT").state == BotState.FLAT
+
+        flat.detach_portfolio_feed()
+        asyncio.run(flat.on_bar(self._bar(2, 50.0)))
+        assert flat.evaluated == 1
@@ -0,0 +1,99 @@
+"""Unit tests for the array-backed TimeframeDataManager storage."""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.tradingbot.timeframe_data_manager import (
+    TimeframeBarBuffer,
+    TimeframeDataManager,
+)
+
+
+def _bar(ts: pd.Timestamp, price: float) -> dict:
+    return {
+        "timestamp": ts.to_pydatetime(),
+        "open": price,
+        "high": price + 1.0,
+        "low": price - 1.0,
+        "close": price + 0.5,
+        "volume": 10.0,
+    }
+
+
+@pytest.fixture
+def manager():
+    """Manager with 1m base and 5m/15m resampled timeframes."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        mgr = TimeframeDataManager(base_timeframe="1T", max_bars_per_tf=20)
+        mgr.add_timeframe("5T")
+        mgr.add_timeframe("15T")
+    start = pd.Timestamp("2024-01-01 00:00")
+    for i in range(61):
+        mgr.add_bar("1T", _bar(start + pd.Timedelta(minutes=i), 100.0 + i))
+    return mgr
+
+
+class TestTimeframeBarBuffer:
+    """Ring buffer behaviour."""
+
+    def test_keeps_only_maxlen_bars_across_compaction(self):
+        buffer = TimeframeBarBuffer(maxlen=3)
+        for i in range(10):
+            buffer.append_values(i, i, i, i, i, i)
+        assert len(buffer) == 3
+        assert buffer.timestamp_view().tolist() == [7, 8, 9]
+        assert buffer.column("close").tolist() == [7.0, 8.0, 9.0]
+
+    def test_views_share_memory(self):
+        buffer = TimeframeBarBuffer(maxlen=5)
+        for i in range(4):
+            buffer.append_values(i, 1.0, 2.0, 0.5, 1.5, 100.0)
+        view = buffer.ohlcv_view(2)
+        assert np.shares_memory(view, buffer._ohlcv)
+        assert np.shares_memory(buffer.to_dataframe(2).to_numpy(), buffer._ohlcv)
+
+    def test_iteration_yields_bars(self):
+        buffer = TimeframeBarBuffer(maxlen=5, timeframe="1T")
+        buffer.append_values(pd.Timestamp("2024-01-01").value, 1.0, 2.0, 0.5, 1.5, 100.0)
+        bars = list(buffer)
+        assert bars[0].close == 1.5
+        assert bars[0].timestamp == pd.Timestamp("2024-01-01").to_pydatetime()
+
+
+class TestTimeframeDataManager:
+    """Resampling and alignment."""
+
+    def test_max_bars_per_timeframe_is_enforced(self, manager):
+        assert len(manager.get_bars("1T")) == 20
+
+    def test_higher_timeframes_resampled_in_place(self, manager):
+        df = manager.get_bars("5T", as_dataframe=True)
+        # 12 completed 5m bars; the 13th (01:00) is still forming
+        assert len(df) == 12
+        first = df.iloc[0]
+        assert first["open"] == 100.0
+        assert first["high"] == 105.0
+        assert first["close"] == 104.5
+        assert first["volume"] == 50.0
+
+    def test_get_dataframe_last_n(self, manager):
+        df = manager.get_bars("5T", n=3, as_dataframe=True)
+        assert list(df.index) == list(pd.date_range("2024-01-01 00:45", periods=3, freq="5min"))
+
+    def test_aligned_data_forward_fills_lower_timeframes(self, manager):
+        aligned = manager.get_aligned_data(n=2)
+        ref = aligned["15T"].index
+        assert list(ref) == [pd.Timestamp("2024-01-01 00:30"), pd.Timestamp("2024-01-01 00:45")]
+        # 1m history only reaches back 20 bars (00:41) -> first row unavailable
+        assert np.isnan(aligned["1T"]["close"].iloc[0])
+        assert aligned["1T"]["close"].iloc[1] == 145.5
+        assert aligned["5T"]["close"].tolist() == [134.5, 149.5]
+
+    def test_get_arrays(self, manager):
+        arrays = manager.get_arrays("15T", n=2)
+        assert arrays["close"].tolist() == [144.5, 159.5]
+        assert arrays["timestamp"].dtype == np.int64
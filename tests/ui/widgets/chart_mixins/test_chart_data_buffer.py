@@ -0,0 +1,249 @@
+"""Tests for the memory-bounded chart data buffer."""
+
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ui.widgets.chart_mixins.chart_data_buffer import (
+    ChartBufferPolicy,
+    ChartDataBuffer,
+    aggregate_ohlcv,
+)
+from src.ui.widgets.chart_mixins.data_loading_mixin import DataLoadingMixin
+from src.ui.widgets.chart_mixins.indicator_realtime import IndicatorRealtime
+
+
+def _frame(count, start="2024-01-01", freq="1s", tz="UTC"):
+    index = pd.date_range(start, periods=count, freq=freq, tz=tz)
+    close = 100 + np.arange(count, dtype=float)
+    return pd.DataFrame(
+        {"open": close - 0.5, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0},
+        index=index,
+    )
+
+
+def _policy(**overrides):
+    settings = dict(recent_bars=100, history_bars=50, history_factor=10, detail_bars=40, compact_chunk=20)
+    settings.update(overrides)
+    return ChartBufferPolicy(**settings)
+
+
+def test_aggregate_ohlcv_blocks():
+    df = _frame(25)
+    values = df[["open", "high", "low", "close", "volume"]].to_numpy().T
+    ts, out = aggregate_ohlcv(df.index.asi8, values, 10)
+
+    assert ts.tolist() == df.index.asi8[[0, 10, 20]].tolist()
+    np.testing.assert_array_equal(out[0], [99.5, 109.5, 119.5])  # first open
+    np.testing.assert_array_equal(out[1], [110, 120, 125])  # max high
+    np.testing.assert_array_equal(out[2], [99, 109, 119])  # min low
+    np.testing.assert_array_equal(out[3], [109, 119, 124])  # last close
+    np.testing.assert_array_equal(out[4], [10, 10, 5])  # summed volume
+
+
+def test_load_keeps_recent_horizon_at_full_resolution():
+    buffer = ChartDataBuffer(_policy())
+    df = _frame(300)
+    buffer.load(df)
+
+    frame = buffer.to_frame()
+    pd.testing.assert_frame_equal(frame.iloc[-100:], df.iloc[-100:], check_freq=False)
+    assert buffer.get_stats()["history_bars"] == 20
+    assert frame.index.is_monotonic_increasing
+
+
+def test_forming_candle_patches_cached_frame():
+    buffer = ChartDataBuffer(_policy())
+    buffer.load(_frame(150))
+    frame = buffer.to_frame()
+    last = frame.index[-1]
+
+    buffer.upsert(last, 1, 3, 0.5, 2.5)
+    assert buffer.to_frame() is frame  # No rebuild per tick
+    assert frame.iloc[-1].tolist() == [1, 3, 0.5, 2.5, 1.0]
+
+    buffer.upsert(last + pd.Timedelta(seconds=1), 2.5, 3, 2, 2.8)
+    rebuilt = buffer.to_frame()
+    assert rebuilt is not frame and len(rebuilt) == len(frame) + 1
+
+
+def test_streaming_week_stays_within_budget():
+    policy = _policy()
+    buffer = ChartDataBuffer(policy)
+    buffer.load(_frame(10))
+    start = buffer.to_frame().index[-1]
+
+    sizes = []
+    for i in range(1, 7 * 24 * 60):  # A week of 1-minute candles on the 1s policy
+        ts = start + pd.Timedelta(seconds=i)
+        buffer.upsert(ts, 1.0, 2.0, 0.5, 1.5)
+        buffer.upsert(ts, 1.0, 2.5, 0.5, 2.0)  # Forming candle is updated in place
+        sizes.append(len(buffer))
+
+    assert max(sizes) <= policy.max_bars
+    stats = buffer.get_stats()
+    assert stats["recent_bars"] <= policy.recent_bars + policy.compact_chunk
+    assert stats["evicted_bars"] > 0
+    assert buffer.nbytes() < 64 * policy.max_bars * 8
+
+    frame = buffer.to_frame()
+    assert frame["close"].iloc[-1] == 2.0 and frame["high"].iloc[-1] == 2.5
+    assert frame.index[-1] == start + pd.Timedelta(seconds=7 * 24 * 60 - 1)
+
+    assert buffer.upsert(start, 1, 1, 1, 1) is False
+    assert buffer.late_updates == 1
+
+
+def test_upsert_keeps_volume_when_not_given():
+    buffer = ChartDataBuffer(_policy())
+    buffer.load(_frame(5))
+    last = buffer.to_frame().index[-1]
+
+    assert buffer.upsert(last, 1, 2, 0.5, 1.5) is False
+    assert buffer.to_frame()["volume"].iloc[-1] == 1.0
+    assert buffer.upsert(last + pd.Timedelta(seconds=1), 1, 2, 0.5, 1.5) is True
+    assert buffer.to_frame()["volume"].iloc[-1] == 0.0
+
+
+def test_scrolling_back_swaps_in_one_detail_window():
+    buffer = ChartDataBuffer(_policy())
+    df = _frame(400)
+    buffer.load(df)
+    aggregated = buffer.to_frame().iloc[:-100]
+    assert len(aggregated) == 30
+
+    # Visible range inside the recent horizon: nothing to load
+    assert buffer.detail_window(df.index[-50], df.index[-1]) is None
+
+    # Widened to whole aggregated bars, end exclusive
+    start, end = buffer.detail_window(df.index[105], df.index[125])
+    assert (start, end) == (df.index[100], df.index[130])
+    assert buffer.merge_detail(df.loc[start:end]) == 30
+
+    frame = buffer.to_frame()
+    assert frame.index.is_monotonic_increasing and frame.index.is_unique
+    pd.testing.assert_frame_equal(frame.loc[df.index[100]:df.index[129]], df.iloc[100:130], check_freq=False)
+    assert frame.index[frame.index.get_loc(df.index[129]) + 1] == df.index[130]  # Still aggregated
+    assert buffer.detail_window(df.index[105], df.index[125]) is None
+
+    # Next window: the previous detail is aggregated again
+    buffer.merge_detail(df.iloc[200:220])
+    frame = buffer.to_frame()
+    assert len(frame.loc[df.index[100]:df.index[139]]) == 4
+    assert len(frame) == 100 + 30 - 2 + 20
+    assert frame.index.is_monotonic_increasing
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+def test_frame_keeps_index_timezone(tz):
+    buffer = ChartDataBuffer(_policy())
+    df = _frame(150, tz=tz)
+    buffer.load(df)
+    assert buffer.to_frame().index.tz == df.index.tz
+    assert buffer.to_frame().index[-1] == df.index[-1]
+
+
+class _Label:
+    def setText(self, text):
+        pass
+
+    def setStyleSheet(self, style):
+        pass
+
+
+class _Timer:
+    def isActive(self):
+        return True
+
+
+class _Signal:
+    def emit(self, *args):
+        pass
+
+
+class _Chart(DataLoadingMixin):
+    """Data loading without web view: records executed scripts."""
+
+    def __init__(self, policy):
+        self.scripts = []
+        self.page_loaded = self.chart_initialized = True
+        self.current_timeframe = "1T"
+        self.current_period = "1M"
+        self.info_label = self.market_status_label = _Label()
+        self.update_timer = _Timer()
+        self.data_loaded = _Signal()
+        self._setup_data_loading()
+        self._data_buffer = ChartDataBuffer(policy)
+
+    def _execute_js(self, script):
+        self.scripts.append(script)
+
+    def _update_indicators(self):
+        pass
+
+    def candles(self, prefix):
+        script = [s for s in self.scripts if s.startswith(prefix)][-1]
+        return json.loads(script[len(prefix):script.rindex("]") + 1])
+
+
+def test_load_data_keeps_uniform_full_resolution_data():
+    chart = _Chart(_policy(data_bars=250))
+    df = _frame(300, freq="1min")
+    df.index.name = "timestamp"
+    df["signal"] = np.arange(300) % 3
+
+    chart.load_data(df)
+
+    # data: oldest bars evicted, otherwise untouched
+    pd.testing.assert_frame_equal(chart.data, df.iloc[-250:])
+    assert chart.data.index.name == "timestamp"
+    assert (chart.data.index.to_series().diff().dropna() == pd.Timedelta("1min")).all()
+
+    # Only the chart series is aggregated: 100 recent bars + 150 bars at 1:10
+    candles = chart.candles("window.chartAPI.setData(")
+    assert len(candles) == 100 + 15
+    assert candles[1]["time"] - candles[0]["time"] == 600
+    assert candles[-1]["time"] - candles[-2]["time"] == 60
+
+
+def test_live_rows_keep_data_uniform_and_bounded():
+    chart = _Chart(_policy(data_bars=250))
+    df = _frame(250, freq="1min")
+    df.index.name = "timestamp"
+    df["signal"] = 1
+    chart.load_data(df)
+    realtime = IndicatorRealtime(parent=chart)
+    display = chart._data_buffer.to_frame()
+
+    def row(ts, close):
+        return pd.DataFrame([{"open": close, "high": close + 1, "low": close - 1, "close": close}],
+                            index=pd.DatetimeIndex([ts], name="time"))
+
+    last = df.index[-1]
+    realtime.update_realtime_row(row(last, 500.0))
+    assert chart.data["close"].iloc[-1] == 500.0 and chart.data["signal"].iloc[-1] == 1
+    assert chart._data_buffer.to_frame() is display  # Forming candle: patched in place
+
+    realtime.update_realtime_row(row(last + pd.Timedelta(minutes=1), 501.0))
+    data = chart.data
+    assert len(data) == 250 and data.index[-1] == last + pd.Timedelta(minutes=1)
+    assert data.index.name == "timestamp"
+    assert (data.index.to_series().diff().dropna() == pd.Timedelta("1min")).all()
+    assert chart._data_buffer.to_frame()["close"].iloc[-1] == 501.0
+
+
+def test_history_detail_is_taken_from_data():
+    chart = _Chart(_policy())
+    df = _frame(300, freq="1min")
+    chart.current_symbol = "BTCUSDT"
+    chart.load_data(df)
+
+    window = chart._data_buffer.detail_window(df.index[105], df.index[125])
+    asyncio.run(chart._symbol_loader.load_history_detail(*window))
+
+    candles = chart.candles("window.chartAPI.replaceData(")
+    assert len(candles) == 100 + 20 - 3 + 30
+    pd.testing.assert_frame_equal(chart.data, df)
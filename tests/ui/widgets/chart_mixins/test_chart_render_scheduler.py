@@ -0,0 +1,134 @@
+"""Tests for frame-coalesced live chart rendering (ChartRenderScheduler)."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from src.common.event_bus import Event, EventType
+from src.ui.widgets.chart_mixins.bitunix_streaming_mixin import BitunixStreamingMixin
+from src.ui.widgets.chart_mixins.chart_render_scheduler import ChartRenderScheduler
+
+FRAME_PREFIX = "window.chartAPI?.applyRenderFrame("
+
+
+class _Label:
+    def setText(self, text):
+        pass
+
+
+class _Chart(BitunixStreamingMixin):
+    """Bitunix streaming chart without web view: records executed scripts."""
+
+    def __init__(self):
+        self.scripts = []
+        self.indicator_candles = []
+        self.current_symbol = "BTCUSDT"
+        self.current_timeframe = "1T"
+        self.live_streaming_enabled = True
+        self.info_label = _Label()
+        self.data = None
+
+    def parent(self):
+        return None
+
+    def _execute_js(self, script):
+        self.scripts.append(script)
+
+    def _update_indicators_realtime(self, candle):
+        self.indicator_candles.append(candle["time"])
+        self._render_scheduler.update_indicator("SMA(2)", {"time": candle["time"], "value": candle["close"]})
+
+    def tick(self, price, ts, volume=1.0):
+        self._on_market_tick(Event(
+            type=EventType.MARKET_TICK,
+            timestamp=ts,
+            data={"symbol": "BTCUSDT", "price": price, "volume": volume, "timestamp": ts},
+        ))
+
+    def frames(self):
+        assert all(s.startswith(FRAME_PREFIX) for s in self.scripts)
+        return [json.loads(s[len(FRAME_PREFIX):-2]) for s in self.scripts]
+
+
+@pytest.fixture(autouse=True)
+def qapp():
+    """Running Qt app: updates are deferred to the frame timer."""
+    return QApplication.instance() or QApplication([])
+
+
+def _wait(ms=80):
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def _ts(minute, second):
+    return datetime(2024, 1, 2, 10, minute, second, tzinfo=timezone.utc)
+
+
+def test_ticks_within_a_frame_become_one_call():
+    chart = _Chart()
+    for i in range(200):
+        chart.tick(100.0 + i * 0.01, _ts(0, i % 60))
+    assert chart.scripts == []  # Deferred to the next frame
+
+    _wait()
+
+    (frame,) = chart.frames()
+    (candle,) = frame["candles"]
+    assert candle["close"] == pytest.approx(101.99)
+    assert candle["high"] == pytest.approx(101.99) and candle["low"] == 100.0
+    assert frame["panels"]["volume"][0]["value"] == 200.0
+    assert frame["indicators"]["SMA(2)"] == [{"time": candle["time"], "value": candle["close"]}]
+    # Indicators recalculated once per frame instead of once per tick
+    assert len(chart.indicator_candles) == 1
+
+    stats = chart._render_scheduler.get_stats()
+    assert stats["frames_sent"] == 1
+    assert stats["updates_dropped"] == stats["updates_received"] - 3
+
+
+def test_candle_closing_inside_a_frame_keeps_its_final_state():
+    chart = _Chart()
+    chart.tick(100.0, _ts(0, 10))
+    chart.tick(101.0, _ts(0, 59))
+    chart.tick(102.0, _ts(1, 0))
+    _wait()
+
+    (frame,) = chart.frames()
+    first, second = frame["candles"]
+    assert first["time"] < second["time"]
+    assert first["close"] == 101.0 and second["open"] == 102.0
+    assert [p["value"] for p in frame["indicators"]["SMA(2)"]] == [101.0, 102.0]
+    assert chart.indicator_candles == [first["time"], second["time"]]
+
+
+def test_frame_rate_is_capped():
+    sent = []
+    scheduler = ChartRenderScheduler(send=sent.append, interval_ms=50)
+
+    scheduler.update_candle({"time": 1, "close": 1.0})
+    _wait(20)
+    assert len(sent) == 1  # First update after a quiet period goes out right away
+
+    scheduler.update_candle({"time": 1, "close": 2.0})
+    _wait(10)
+    assert len(sent) == 1  # Within the frame interval: held back
+    scheduler.update_candle({"time": 1, "close": 3.0})
+    _wait(80)
+    assert len(sent) == 2
+    assert json.loads(sent[1][len(FRAME_PREFIX):-2]) == {"candles": [{"time": 1, "close": 3.0}]}
+
+
+def test_clear_drops_pending_updates():
+    sent = []
+    scheduler = ChartRenderScheduler(send=sent.append, compute_indicators=lambda candle: None)
+    scheduler.update_panel("volume", {"time": 1, "value": 5.0})
+    scheduler.request_indicators({"time": 1, "close": 1.0})
+    scheduler.clear()
+    _wait()
+
+    assert sent == [] and not scheduler.has_pending()